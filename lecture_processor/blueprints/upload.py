@@ -18,6 +18,36 @@ def release_audio_import():
     return upload_api_service.release_imported_audio(runtime, request)
 
 
+@upload_bp.route('/api/uploads', methods=['POST'])
+def create_upload_session():
+    runtime = get_runtime()
+    return upload_api_service.create_upload_session(runtime, request)
+
+
+@upload_bp.route('/api/uploads/<upload_id>', methods=['GET'])
+def get_upload_session(upload_id):
+    runtime = get_runtime()
+    return upload_api_service.get_upload_session(runtime, request, upload_id)
+
+
+@upload_bp.route('/api/uploads/<upload_id>', methods=['PATCH'])
+def append_upload_chunk(upload_id):
+    runtime = get_runtime()
+    return upload_api_service.append_upload_chunk(runtime, request, upload_id)
+
+
+@upload_bp.route('/api/uploads/<upload_id>/complete', methods=['POST'])
+def complete_upload_session(upload_id):
+    runtime = get_runtime()
+    return upload_api_service.complete_upload_session(runtime, request, upload_id)
+
+
+@upload_bp.route('/api/uploads/<upload_id>', methods=['DELETE'])
+def abort_upload_session(upload_id):
+    runtime = get_runtime()
+    return upload_api_service.abort_upload_session(runtime, request, upload_id)
+
+
 @upload_bp.route('/upload', methods=['POST'])
 def upload_file():
     runtime = get_runtime()
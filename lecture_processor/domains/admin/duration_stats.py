@@ -0,0 +1,227 @@
+"""Incrementally maintained processing-duration histograms for estimates and averages."""
+
+from __future__ import annotations
+
+import math
+import threading
+from datetime import datetime, timedelta, timezone
+
+from lecture_processor.runtime.container import get_runtime
+
+COLLECTION = 'processing_duration_stats'
+WINDOW_DAYS = 30
+KNOWN_MODES = ('lecture-notes', 'slides-only', 'interview')
+KNOWN_STUDY_FEATURES = ('none', 'flashcards', 'test', 'both')
+MAX_INTERVIEW_FEATURES = 4
+# Log-spaced bins: bin i covers [BIN_RATIO**i, BIN_RATIO**(i+1)) seconds, so a
+# percentile read back from a bin is within ~4% of the true duration.
+BIN_RATIO = 1.08
+DEFAULT_CACHE_SECONDS = 300
+
+_CACHE_LOCK = threading.Lock()
+_WINDOW_CACHE = {'key': None, 'loaded_at': 0.0, 'window': None}
+
+
+def _resolve_runtime(runtime=None):
+    if runtime is not None:
+        return runtime
+    return get_runtime()
+
+
+def size_bucket(total_mb):
+    try:
+        value = float(total_mb or 0.0)
+    except Exception:
+        value = 0.0
+    if value <= 0:
+        return 'unknown'
+    if value < 25:
+        return 's'
+    if value < 100:
+        return 'm'
+    if value < 300:
+        return 'l'
+    return 'xl'
+
+
+def group_key(mode, study_features, bucket, interview_features_count):
+    return f'{mode}|{study_features}|{bucket}|{int(interview_features_count)}'
+
+
+def _split_group_key(key):
+    parts = str(key or '').split('|')
+    if len(parts) != 4:
+        return None
+    try:
+        return (parts[0], parts[1], parts[2], int(parts[3]))
+    except ValueError:
+        return None
+
+
+def bin_index(duration_seconds):
+    return max(0, int(math.floor(math.log(max(1.0, float(duration_seconds))) / math.log(BIN_RATIO))))
+
+
+def bin_bounds(index):
+    return (BIN_RATIO ** int(index), BIN_RATIO ** (int(index) + 1))
+
+
+def day_key_for_timestamp(timestamp):
+    return datetime.fromtimestamp(float(timestamp or 0), tz=timezone.utc).strftime('%Y-%m-%d')
+
+
+def window_day_keys(now_ts, days=WINDOW_DAYS):
+    today = datetime.fromtimestamp(float(now_ts or 0), tz=timezone.utc).replace(hour=0, minute=0, second=0, microsecond=0)
+    return [(today - timedelta(days=offset)).strftime('%Y-%m-%d') for offset in range(max(1, int(days)))]
+
+
+def _group_for_payload(payload):
+    mode = str(payload.get('mode', '') or '').strip().lower()
+    if mode not in KNOWN_MODES:
+        return None
+    study_features = str(payload.get('study_features', 'none') or 'none').strip().lower()
+    if study_features not in KNOWN_STUDY_FEATURES:
+        study_features = 'none'
+    try:
+        extras = int(payload.get('interview_features_count', 0) or 0)
+    except (TypeError, ValueError):
+        extras = 0
+    extras = max(0, min(MAX_INTERVIEW_FEATURES, extras))
+    return group_key(mode, study_features, size_bucket(payload.get('file_size_mb', 0)), extras)
+
+
+def record_job_duration(job_payload, runtime=None):
+    """Fold one finished job into its day's histogram; only completed jobs with a duration count."""
+    resolved_runtime = _resolve_runtime(runtime)
+    payload = job_payload if isinstance(job_payload, dict) else {}
+    if str(payload.get('status', '') or '').strip().lower() != 'complete':
+        return False
+    duration = payload.get('duration_seconds')
+    if not isinstance(duration, (int, float)) or duration <= 0:
+        return False
+    key = _group_for_payload(payload)
+    db = getattr(resolved_runtime, 'db', None)
+    firestore_module = getattr(resolved_runtime, 'firestore', None)
+    if key is None or db is None or firestore_module is None:
+        return False
+    now_ts = float(resolved_runtime.time.time())
+    finished_at = float(payload.get('finished_at', now_ts) or now_ts)
+    day_key = day_key_for_timestamp(finished_at)
+    increment = firestore_module.Increment
+    db.collection(COLLECTION).document(day_key).set({
+        'day': day_key,
+        'updated_at': now_ts,
+        'groups': {
+            key: {
+                'count': increment(1),
+                'sum_seconds': increment(float(duration)),
+                'bins': {str(bin_index(duration)): increment(1)},
+            }
+        },
+    }, merge=True)
+    return True
+
+
+def _empty_group():
+    return {'count': 0, 'sum_seconds': 0.0, 'bins': {}}
+
+
+def _merge_group(target, source):
+    if not isinstance(source, dict):
+        return
+    target['count'] += int(source.get('count', 0) or 0)
+    target['sum_seconds'] += float(source.get('sum_seconds', 0.0) or 0.0)
+    bins = source.get('bins') if isinstance(source.get('bins'), dict) else {}
+    for index, count in bins.items():
+        try:
+            safe_index = int(index)
+        except (TypeError, ValueError):
+            continue
+        target['bins'][safe_index] = target['bins'].get(safe_index, 0) + int(count or 0)
+
+
+def merge_day_docs(day_payloads):
+    """Merge daily stats docs into one window aggregate keyed by group tuple."""
+    groups = {}
+    for payload in day_payloads:
+        day_groups = payload.get('groups') if isinstance(payload, dict) else None
+        if not isinstance(day_groups, dict):
+            continue
+        for key, group in day_groups.items():
+            parsed = _split_group_key(key)
+            if parsed is None:
+                continue
+            _merge_group(groups.setdefault(parsed, _empty_group()), group)
+    return groups
+
+
+def _read_day_docs(db, day_keys):
+    refs = [db.collection(COLLECTION).document(day_key) for day_key in day_keys]
+    get_all = getattr(db, 'get_all', None)
+    snapshots = get_all(refs) if callable(get_all) else [ref.get() for ref in refs]
+    return [snapshot.to_dict() or {} for snapshot in snapshots if getattr(snapshot, 'exists', False)]
+
+
+def load_window_stats(runtime=None):
+    """Return the merged 30-day window, or None when the store is unavailable or still empty.
+
+    The window is read with one batched ``get_all`` and cached in-process for
+    ``PROCESSING_STATS_CACHE_SECONDS``; read errors propagate to the caller.
+    """
+    resolved_runtime = _resolve_runtime(runtime)
+    db = getattr(resolved_runtime, 'db', None)
+    if db is None:
+        return None
+    now_ts = float(resolved_runtime.time.time())
+    ttl = float(getattr(resolved_runtime, 'PROCESSING_STATS_CACHE_SECONDS', DEFAULT_CACHE_SECONDS))
+    day_keys = window_day_keys(now_ts)
+    cache_key = (id(db), day_keys[0])
+    with _CACHE_LOCK:
+        if _WINDOW_CACHE['key'] == cache_key and now_ts - _WINDOW_CACHE['loaded_at'] < ttl:
+            return _WINDOW_CACHE['window']
+    day_payloads = _read_day_docs(db, day_keys)
+    window = merge_day_docs(day_payloads) if day_payloads else None
+    with _CACHE_LOCK:
+        _WINDOW_CACHE.update({'key': cache_key, 'loaded_at': now_ts, 'window': window})
+    return window
+
+
+def clear_cache():
+    with _CACHE_LOCK:
+        _WINDOW_CACHE.update({'key': None, 'loaded_at': 0.0, 'window': None})
+
+
+def combine_groups(window, predicate):
+    combined = _empty_group()
+    for key, group in (window or {}).items():
+        if predicate(*key):
+            _merge_group(combined, group)
+    return combined
+
+
+def histogram_percentile(group, percentile):
+    """Percentile from a log-binned group, interpolated geometrically inside the bin."""
+    total = int(group.get('count', 0) or 0)
+    bins = group.get('bins') or {}
+    if total <= 0 or not bins:
+        return 0.0
+    rank = max(0.0, min(1.0, float(percentile))) * total
+    seen = 0
+    ordered = sorted(bins.items())
+    for index, count in ordered:
+        if count <= 0:
+            continue
+        if seen + count >= rank:
+            lower, upper = bin_bounds(index)
+            fraction = (rank - seen) / float(count)
+            return lower * (upper / lower) ** fraction
+        seen += count
+    return bin_bounds(ordered[-1][0])[1]
+
+
+def histogram_bounds(group):
+    """Approximate (min, max) from the first and last occupied bins."""
+    occupied = sorted(index for index, count in (group.get('bins') or {}).items() if count > 0)
+    if not occupied:
+        return (0.0, 0.0)
+    return (bin_bounds(occupied[0])[0], bin_bounds(occupied[-1])[1])
@@ -4,6 +4,7 @@ from datetime import datetime, timedelta, timezone
 from flask import g
 
 from lecture_processor.domains.analytics import events as analytics_events
+from lecture_processor.domains.physio import knowledge as physio_knowledge
 from lecture_processor.runtime.container import get_runtime
 from lecture_processor.runtime import environment as runtime_environment
 
@@ -79,6 +80,11 @@ def build_admin_runtime_checks(runtime=None):
     soffice_available = bool(resolved_runtime.get_soffice_binary())
     ffmpeg_available = bool(resolved_runtime.get_ffmpeg_binary())
     ytdlp_available = bool(resolved_runtime.shutil.which('yt-dlp'))
+    query_embedding_cache = physio_knowledge.query_embedding_cache_stats()
+    snapshot_writes = resolved_runtime.RUNTIME_JOB_SNAPSHOTS.stats()
+    provider_polls = resolved_runtime.PROVIDER_POLLER.stats()
+    job_queue = resolved_runtime.get_background_queue_stats()
+    auth_tokens = resolved_runtime.AUTH_TOKEN_CACHE.stats()
     return {
         'firebase_ready': bool(resolved_runtime.db),
         'gemini_ready': bool(resolved_runtime.client),
@@ -90,6 +96,24 @@ def build_admin_runtime_checks(runtime=None):
         'video_import_available': ffmpeg_available and ytdlp_available,
         'ffmpeg_available': ffmpeg_available,
         'yt_dlp_available': ytdlp_available,
+        'physio_query_cache_hits': query_embedding_cache['hits'],
+        'physio_query_cache_shared_hits': query_embedding_cache['shared_hits'],
+        'physio_query_cache_misses': query_embedding_cache['misses'],
+        'physio_query_cache_entries': query_embedding_cache['entries'],
+        'physio_query_cache_shared': bool(getattr(resolved_runtime, 'PHYSIO_QUERY_EMBED_SHARED_CACHE', False)),
+        'runtime_job_snapshot_writes': snapshot_writes['writes'],
+        'runtime_job_snapshot_writes_saved': snapshot_writes['writes_saved'],
+        'runtime_job_snapshot_bytes_saved': snapshot_writes['bytes_saved'],
+        'provider_poll_files_in_flight': provider_polls['in_flight'].get('file', 0),
+        'provider_poll_batches_in_flight': provider_polls['in_flight'].get('batch', 0),
+        'provider_poll_calls_last_minute': provider_polls['poll_calls_last_minute'],
+        'provider_poll_errors': provider_polls['poll_errors'],
+        'job_queue_running': job_queue['running'],
+        'job_queue_queued': job_queue['queued'],
+        'job_queue_wait_p95_ms': max([entry['wait_p95_ms'] for entry in job_queue.get('classes', {}).values()] or [0]),
+        'auth_token_cache_hits': auth_tokens['hits'],
+        'auth_token_cache_misses': auth_tokens['misses'],
+        'auth_token_cache_entries': auth_tokens['entries'],
     }
 
 
@@ -711,6 +735,7 @@ def compute_job_stage_costs(job_payload, config_payload, runtime=None):
                 'cost_output_usd': output_cost,
                 'cost_usd': stage_cost,
                 'matched_pricing': bool(pricing.get('matched', False)),
+                'cache_hit': bool(safe_usage.get('cache_hit', False)),
             }
         )
         input_total += input_tokens
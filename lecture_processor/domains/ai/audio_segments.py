@@ -0,0 +1,119 @@
+"""Split long recordings into overlapping segments and stitch their transcripts.
+
+Segments overlap by a few seconds so no word is cut at a boundary. Each segment
+keeps only the lines whose timestamps fall inside its *keep window* (the middle
+of the overlap on either side), so the stitched transcript has no duplicates and
+its timestamps refer to the whole recording.
+"""
+
+import re
+from concurrent.futures import ThreadPoolExecutor
+
+_TIMECODE_LINE_RE = re.compile(r'^(\s*[\[(]?)(?:(\d{1,2}):)?(\d{1,3}):(\d{2})([\])]?)')
+
+
+def plan_segments(duration_seconds, segment_seconds, overlap_seconds):
+    """Return ``[{'start', 'end', 'keep_start', 'keep_end'}, ...]`` in seconds.
+
+    Segment ``i`` is cut from ``i * segment_seconds`` to ``overlap_seconds`` past
+    the next boundary; a remainder shorter than a quarter segment is folded into
+    the previous one. A single segment means splitting is not worthwhile.
+    """
+    duration = max(0.0, float(duration_seconds or 0))
+    length = max(1.0, float(segment_seconds or 0))
+    overlap = max(0.0, min(float(overlap_seconds or 0), length / 2.0))
+    count = max(1, int(duration // length))
+    if duration - count * length >= length / 4.0:
+        count += 1
+    segments = []
+    for index in range(count):
+        start = index * length
+        last = index == count - 1
+        segments.append({
+            'start': start,
+            'end': duration if last else min(duration, (index + 1) * length + overlap),
+            'keep_start': 0.0 if index == 0 else start + overlap / 2.0,
+            'keep_end': duration if last else (index + 1) * length + overlap / 2.0,
+        })
+    return segments
+
+
+def run_segments_in_parallel(func, segments, max_workers):
+    """Call ``func(index, segment)`` for every segment; results keep segment order.
+
+    The first failure is re-raised after all in-flight calls have finished, so
+    the caller never cleans up files a segment is still uploading.
+    """
+    segments = list(segments)
+    if len(segments) <= 1 or int(max_workers or 1) <= 1:
+        return [func(index, segment) for index, segment in enumerate(segments)]
+    with ThreadPoolExecutor(max_workers=min(len(segments), int(max_workers)), thread_name_prefix='lp-segment') as executor:
+        futures = [executor.submit(func, index, segment) for index, segment in enumerate(segments)]
+        errors = [future.exception() for future in futures]
+    for error in errors:
+        if error is not None:
+            raise error
+    return [future.result() for future in futures]
+
+
+def stitch_transcript_segments(results):
+    """Merge per-segment ``(segment, transcript, transcript_segments)`` results.
+
+    Timed segments are shifted by the segment start and kept when their midpoint
+    falls in the keep window. A segment that came back without timing (the
+    plain-text fallback) contributes one entry spanning its keep window.
+    Returns ``(transcript, transcript_segments)``.
+    """
+    stitched = []
+    for index, (segment, transcript, transcript_segments) in enumerate(results):
+        last = index == len(results) - 1
+        offset_ms = int(round(float(segment['start']) * 1000))
+        keep_start_ms = int(round(float(segment['keep_start']) * 1000))
+        keep_end_ms = int(round(float(segment['keep_end']) * 1000))
+        if not transcript_segments:
+            text = str(transcript or '').strip()
+            if text:
+                stitched.append({'start_ms': keep_start_ms, 'end_ms': keep_end_ms, 'text': text})
+            continue
+        for item in transcript_segments:
+            start_ms = int(item.get('start_ms', 0) or 0) + offset_ms
+            end_ms = max(start_ms, int(item.get('end_ms', 0) or 0) + offset_ms)
+            midpoint_ms = (start_ms + end_ms) // 2
+            if keep_start_ms <= midpoint_ms and (last or midpoint_ms < keep_end_ms):
+                stitched.append({'start_ms': start_ms, 'end_ms': end_ms, 'text': item.get('text', '')})
+    stitched.sort(key=lambda item: item['start_ms'])
+    return '\n'.join(item['text'] for item in stitched).strip(), stitched
+
+
+def _format_timecode(total_seconds):
+    hours, remainder = divmod(max(0, int(total_seconds)), 3600)
+    minutes, seconds = divmod(remainder, 60)
+    if hours:
+        return f'{hours}:{minutes:02d}:{seconds:02d}'
+    return f'{minutes:02d}:{seconds:02d}'
+
+
+def stitch_timecoded_text(results):
+    """Merge per-segment ``(segment, text)`` interview transcripts.
+
+    Lines start with a ``mm:ss`` (or ``h:mm:ss``) timecode relative to their
+    segment; they are rebased onto the whole recording and dropped outside the
+    keep window. Untimed lines follow the fate of the line before them.
+    """
+    lines = []
+    for index, (segment, text) in enumerate(results):
+        last = index == len(results) - 1
+        offset = float(segment['start'])
+        keep = True
+        for raw_line in str(text or '').splitlines():
+            match = _TIMECODE_LINE_RE.match(raw_line)
+            if match is None:
+                if keep and raw_line.strip():
+                    lines.append(raw_line)
+                continue
+            prefix, hours, minutes, seconds, suffix = match.groups()
+            absolute = offset + int(hours or 0) * 3600 + int(minutes) * 60 + int(seconds)
+            keep = float(segment['keep_start']) <= absolute and (last or absolute < float(segment['keep_end']))
+            if keep:
+                lines.append(f'{prefix}{_format_timecode(absolute)}{suffix}{raw_line[match.end():]}')
+    return '\n'.join(lines).strip()
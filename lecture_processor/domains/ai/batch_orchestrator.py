@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import json
 import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from datetime import datetime, timezone
 
 from lecture_processor.domains.ai import provider as ai_provider
@@ -12,6 +13,7 @@ from lecture_processor.domains.billing import receipts as billing_receipts
 from lecture_processor.domains.notifications import send_batch_completion_email
 from lecture_processor.domains.study import audio as study_audio
 from lecture_processor.runtime.container import get_runtime
+from lecture_processor.runtime.provider_poller import PollSchedule
 
 
 TERMINAL_BATCH_STATES = {
@@ -28,6 +30,7 @@ STAGE_LABELS = {
     'queued': 'Queued',
     'validation': 'Validating batch',
     'file_upload': 'Uploading source files',
+    'files_ready': 'Source files uploaded',
     'slide_extraction': 'Extracting slide text',
     'audio_transcription': 'Transcribing audio',
     'notes_merge': 'Merging notes',
@@ -234,9 +237,7 @@ def _batch_recovery_stale_seconds(runtime=None):
     if safe_configured > 0:
         return max(120, safe_configured)
 
-    pending_poll = max(5, int(getattr(resolved_runtime, 'BATCH_PENDING_POLL_SECONDS', 20) or 20))
-    running_poll = max(5, int(getattr(resolved_runtime, 'BATCH_RUNNING_POLL_SECONDS', pending_poll) or pending_poll))
-    return max(180, (max(pending_poll, running_poll) * 3) + 60)
+    return max(180, (_batch_poll_max_seconds(runtime=resolved_runtime) * 2) + 60)
 
 
 def _batch_is_stale(batch, runtime=None, now_ts=None):
@@ -261,10 +262,42 @@ def _first_row_error(rows):
     return ''
 
 
+def _row_aggregates(rows):
+    """Row counts and flags kept on the batch document so listings need no row reads."""
+    completed_rows = 0
+    failed_rows = 0
+    active_rows = 0
+    last_row_error = ''
+    last_error_at = -1.0
+    for row in rows or []:
+        status = str((row or {}).get('status', '') or '').strip().lower() or 'queued'
+        if status == 'complete':
+            completed_rows += 1
+        elif status == 'error':
+            failed_rows += 1
+            message = str(row.get('error', '') or '').strip()
+            try:
+                error_at = float(row.get('last_stage_update_at', 0) or 0)
+            except Exception:
+                error_at = 0.0
+            if message and error_at >= last_error_at:
+                last_row_error = message
+                last_error_at = error_at
+        elif status in ACTIVE_ROW_STATUSES:
+            active_rows += 1
+    return {
+        'completed_rows': completed_rows,
+        'failed_rows': failed_rows,
+        'active_rows': active_rows,
+        'can_download_zip': completed_rows > 0,
+        'last_row_error': last_row_error[:1500],
+    }
+
+
 def _public_error_message(batch, rows, runtime=None):
     resolved_runtime = _resolve_runtime(runtime)
     batch_summary = str((batch or {}).get('error_summary', '') or '').strip()
-    row_error = _first_row_error(rows)
+    row_error = _first_row_error(rows) or str((batch or {}).get('last_row_error', '') or '').strip()
     combined = batch_summary or row_error
     lowered = combined.lower()
 
@@ -460,6 +493,63 @@ def _upsert_row(batch_id, row_id, payload, runtime=None, merge=True):
         rows_store[batch_id][row_id] = dict(safe_payload)
 
 
+def _upsert_rows(batch_id, writes, runtime=None):
+    """Apply ``[(row_id, payload, merge), ...]`` as a few bulk commits instead of one write each."""
+    resolved_runtime = _resolve_runtime(runtime)
+    safe_writes = [
+        (row_id, _sanitize_row_payload(payload), merge)
+        for row_id, payload, merge in writes
+        if str(row_id or '').strip()
+    ]
+    if not safe_writes:
+        return
+    db = getattr(resolved_runtime, 'db', None)
+    if db is not None:
+        if getattr(db, 'batch', None):
+            resolved_runtime.batch_repo.set_batch_rows(db, batch_id, safe_writes)
+        else:
+            for row_id, safe_payload, merge in safe_writes:
+                resolved_runtime.batch_repo.set_batch_row(db, batch_id, row_id, safe_payload, merge=merge)
+        return
+    _jobs, rows_store = _memory_store(resolved_runtime)
+    batch_rows = dict(rows_store.get(batch_id, {}))
+    for row_id, safe_payload, merge in safe_writes:
+        if merge:
+            batch_rows[row_id] = {**batch_rows.get(row_id, {}), **safe_payload}
+        else:
+            batch_rows[row_id] = dict(safe_payload)
+    rows_store[batch_id] = batch_rows
+
+
+class _RowStateWriter:
+    """Collects one stage's row-state writes and commits them with ``_upsert_rows``.
+
+    Repeated writes to the same row collapse into one: merges are folded into
+    the pending payload, and a full (non-merge) write replaces it.
+    """
+
+    def __init__(self, batch_id, runtime):
+        self.batch_id = batch_id
+        self._runtime = runtime
+        self._pending = {}
+
+    def upsert(self, row_id, payload, merge=True):
+        safe_row_id = str(row_id or '').strip()
+        if not safe_row_id:
+            return
+        pending = self._pending.get(safe_row_id)
+        if pending is not None and merge:
+            self._pending[safe_row_id] = ({**pending[0], **payload}, pending[1])
+        else:
+            self._pending[safe_row_id] = (dict(payload), merge)
+
+    def flush(self):
+        writes = [(row_id, payload, merge) for row_id, (payload, merge) in self._pending.items()]
+        # Pending writes survive a failed commit so the failure path can retry them.
+        _upsert_rows(self.batch_id, writes, runtime=self._runtime)
+        self._pending = {}
+
+
 def _get_row(batch_id, row_id, runtime=None):
     resolved_runtime = _resolve_runtime(runtime)
     db = getattr(resolved_runtime, 'db', None)
@@ -515,6 +605,14 @@ def create_batch_job(batch_payload, row_payloads, runtime=None):
             },
         }
     )
+    row_aggregates = _row_aggregates(row_payloads)
+    payload.update(
+        {
+            'active_rows': row_aggregates['active_rows'],
+            'can_download_zip': row_aggregates['can_download_zip'],
+            'last_row_error': row_aggregates['last_row_error'],
+        }
+    )
     _upsert_batch(batch_id, payload, runtime=resolved_runtime, merge=False)
     for row in row_payloads:
         row_id = str(row.get('row_id', '') or resolved_runtime.uuid.uuid4())
@@ -632,8 +730,64 @@ def _response_text(response, runtime=None):
     return ''
 
 
+def _batch_poll_max_seconds(runtime=None):
+    resolved_runtime = _resolve_runtime(runtime)
+    poll_seconds = max(5, int(getattr(resolved_runtime, 'BATCH_POLL_SECONDS', 20) or 20))
+    pending_poll = max(5, int(getattr(resolved_runtime, 'BATCH_PENDING_POLL_SECONDS', poll_seconds) or poll_seconds))
+    running_poll = max(5, int(getattr(resolved_runtime, 'BATCH_RUNNING_POLL_SECONDS', pending_poll) or pending_poll))
+    configured = int(getattr(resolved_runtime, 'BATCH_POLL_MAX_SECONDS', 0) or 0)
+    return max(pending_poll, running_poll, configured or 3 * max(pending_poll, running_poll))
+
+
+def _wait_for_batch_on_poller(batch_name, poller, runtime=None, on_poll=None):
+    resolved_runtime = _resolve_runtime(runtime)
+    poll_seconds = max(5, int(getattr(resolved_runtime, 'BATCH_POLL_SECONDS', 20) or 20))
+    pending_poll_seconds = max(5, int(getattr(resolved_runtime, 'BATCH_PENDING_POLL_SECONDS', poll_seconds) or poll_seconds))
+    running_poll_seconds = max(5, int(getattr(resolved_runtime, 'BATCH_RUNNING_POLL_SECONDS', poll_seconds) or poll_seconds))
+    max_poll_seconds = _batch_poll_max_seconds(runtime=resolved_runtime)
+    max_wait_seconds = max(300, int(getattr(resolved_runtime, 'BATCH_MAX_WAIT_SECONDS', 24 * 60 * 60) or (24 * 60 * 60)))
+    retry_attempts = max(1, int(getattr(resolved_runtime, 'PROVIDER_RETRY_MAX_ATTEMPTS', 3) or 3))
+
+    def _evaluate(batch_job):
+        state_name = _batch_state_name(batch_job)
+        return state_name, state_name in TERMINAL_BATCH_STATES
+
+    watch = poller.watch(
+        'batch',
+        batch_name,
+        lambda: resolved_runtime.client.batches.get(name=batch_name),
+        _evaluate,
+        schedules={
+            'JOB_STATE_RUNNING': PollSchedule(running_poll_seconds, max_poll_seconds),
+            None: PollSchedule(pending_poll_seconds, max_poll_seconds),
+        },
+        timeout_seconds=max_wait_seconds,
+        max_consecutive_errors=retry_attempts,
+        timeout_error=lambda: TimeoutError(f'Batch job {batch_name} timed out.'),
+    )
+    seen_polls = 0
+    while True:
+        polls = watch.wait_update(seen_polls)
+        if polls > seen_polls and callable(on_poll):
+            try:
+                on_poll(watch.state)
+            except Exception:
+                pass
+        seen_polls = polls
+        if watch.done():
+            return watch.result()
+
+
 def _wait_for_batch(batch_name, runtime=None, on_poll=None):
+    """Wait for a provider batch job to reach a terminal state.
+
+    With a shared provider poller on the runtime the stage thread only waits on the
+    poller's updates (heartbeating through ``on_poll``); otherwise it polls itself.
+    """
     resolved_runtime = _resolve_runtime(runtime)
+    poller = getattr(resolved_runtime, 'PROVIDER_POLLER', None)
+    if poller is not None:
+        return _wait_for_batch_on_poller(batch_name, poller, runtime=resolved_runtime, on_poll=on_poll)
     poll_seconds = max(5, int(getattr(resolved_runtime, 'BATCH_POLL_SECONDS', 20) or 20))
     pending_poll_seconds = max(5, int(getattr(resolved_runtime, 'BATCH_PENDING_POLL_SECONDS', poll_seconds) or poll_seconds))
     running_poll_seconds = max(5, int(getattr(resolved_runtime, 'BATCH_RUNNING_POLL_SECONDS', poll_seconds) or poll_seconds))
@@ -901,6 +1055,7 @@ def _run_stage_with_builder(batch_id, rows, stage_name, builder, handler, runtim
         runtime=resolved_runtime,
         merge=True,
     )
+    row_writer = _RowStateWriter(batch_id, resolved_runtime)
     for row in rows:
         if str(row.get('status', '') or '') == 'error':
             continue
@@ -908,8 +1063,7 @@ def _run_stage_with_builder(batch_id, rows, stage_name, builder, handler, runtim
         row['current_stage'] = str(stage_name or '')
         row['last_stage_update_at'] = now_ts
         row['updated_at'] = now_ts
-        _upsert_row(
-            batch_id,
+        row_writer.upsert(
             row.get('row_id', ''),
             {
                 'status': row['status'],
@@ -917,7 +1071,6 @@ def _run_stage_with_builder(batch_id, rows, stage_name, builder, handler, runtim
                 'last_stage_update_at': row['last_stage_update_at'],
                 'updated_at': row['updated_at'],
             },
-            runtime=resolved_runtime,
             merge=True,
         )
 
@@ -925,8 +1078,7 @@ def _run_stage_with_builder(batch_id, rows, stage_name, builder, handler, runtim
     for row in rows:
         if row in request_rows:
             continue
-        _upsert_row(
-            batch_id,
+        row_writer.upsert(
             row.get('row_id', ''),
             {
                 'status': row.get('status', 'queued'),
@@ -936,9 +1088,9 @@ def _run_stage_with_builder(batch_id, rows, stage_name, builder, handler, runtim
                 'last_stage_update_at': row.get('last_stage_update_at', now_ts),
                 'updated_at': resolved_runtime.time.time(),
             },
-            runtime=resolved_runtime,
             merge=True,
         )
+    row_writer.flush()
     if not requests:
         _upsert_batch(
             batch_id,
@@ -974,8 +1126,7 @@ def _run_stage_with_builder(batch_id, rows, stage_name, builder, handler, runtim
             row['failed_stage'] = stage_name
             row['error'] = str(error)
             row['last_stage_update_at'] = resolved_runtime.time.time()
-            _upsert_row(
-                batch_id,
+            row_writer.upsert(
                 row.get('row_id', ''),
                 {
                     'status': row.get('status', 'error'),
@@ -985,7 +1136,6 @@ def _run_stage_with_builder(batch_id, rows, stage_name, builder, handler, runtim
                     'last_stage_update_at': row.get('last_stage_update_at', 0),
                     'updated_at': resolved_runtime.time.time(),
                 },
-                runtime=resolved_runtime,
                 merge=True,
             )
             continue
@@ -995,8 +1145,7 @@ def _run_stage_with_builder(batch_id, rows, stage_name, builder, handler, runtim
         handler(row, response)
         row['current_stage'] = str(stage_name or '')
         row['last_stage_update_at'] = resolved_runtime.time.time()
-        _upsert_row(
-            batch_id,
+        row_writer.upsert(
             row.get('row_id', ''),
             {
                 'status': row.get('status', 'processing'),
@@ -1010,9 +1159,18 @@ def _run_stage_with_builder(batch_id, rows, stage_name, builder, handler, runtim
                 'token_total': int(row.get('token_total', 0) or 0),
                 'updated_at': resolved_runtime.time.time(),
             },
-            runtime=resolved_runtime,
             merge=True,
         )
+    row_writer.flush()
+    _upsert_batch(
+        batch_id,
+        {
+            **_row_aggregates(rows),
+            'updated_at': resolved_runtime.time.time(),
+        },
+        runtime=resolved_runtime,
+        merge=True,
+    )
 
 
 def _upload_row_files(row, runtime=None):
@@ -1058,6 +1216,65 @@ def _upload_row_files(row, runtime=None):
         row['audio_storage_key'] = study_audio.persist_audio_for_study_pack(row.get('row_job_id', ''), upload_path, runtime=resolved_runtime)
 
 
+def _upload_rows_concurrently(batch_id, rows, row_writer, runtime=None):
+    """Run ``_upload_row_files`` for all rows on a bounded thread pool.
+
+    Conversion, upload and the processing wait overlap across rows. A row whose
+    upload fails is marked as failed at ``file_upload`` and the other rows keep
+    going. Rows that finish in the same round share one flush, and every flush
+    also refreshes the batch heartbeat.
+    """
+    resolved_runtime = _resolve_runtime(runtime)
+    pending_rows = [row for row in rows if str(row.get('status', '') or '') != 'error']
+    if not pending_rows:
+        return
+    max_workers = max(1, min(len(pending_rows), int(getattr(resolved_runtime, 'BATCH_UPLOAD_MAX_PARALLEL', 1) or 1)))
+    with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='lp-batch-upload') as executor:
+        futures = {executor.submit(_upload_row_files, row, runtime=resolved_runtime): row for row in pending_rows}
+        while futures:
+            done, _not_done = wait(list(futures), return_when=FIRST_COMPLETED)
+            for future in done:
+                row = futures.pop(future)
+                error = future.exception()
+                now_ts = resolved_runtime.time.time()
+                if error is not None:
+                    resolved_runtime.logger.warning(
+                        'Batch file upload failed for batch_id=%s row_id=%s: %s',
+                        batch_id,
+                        row.get('row_id', ''),
+                        error,
+                    )
+                    row['status'] = 'error'
+                    row['failed_stage'] = 'file_upload'
+                    row['error'] = str(error or 'File upload failed.').strip()[:1500]
+                else:
+                    row['current_stage'] = 'files_ready'
+                row['last_stage_update_at'] = now_ts
+                row_writer.upsert(
+                    row.get('row_id', ''),
+                    {
+                        'status': row.get('status', 'processing'),
+                        'failed_stage': row.get('failed_stage', ''),
+                        'error': row.get('error', ''),
+                        'current_stage': row.get('current_stage', 'file_upload'),
+                        'last_stage_update_at': now_ts,
+                        'updated_at': now_ts,
+                    },
+                    merge=True,
+                )
+            row_writer.flush()
+            _upsert_batch(
+                batch_id,
+                {
+                    **_row_aggregates(rows),
+                    'last_heartbeat_at': resolved_runtime.time.time(),
+                    'updated_at': resolved_runtime.time.time(),
+                },
+                runtime=resolved_runtime,
+                merge=True,
+            )
+
+
 def _finalize_row_job_log(batch, row, runtime=None):
     resolved_runtime = _resolve_runtime(runtime)
     row_job_id = str(row.get('row_job_id', '') or resolved_runtime.uuid.uuid4())
@@ -1218,8 +1435,6 @@ def _finalize_batch_record(
     runtime=None,
 ):
     resolved_runtime = _resolve_runtime(runtime)
-    completed_rows = 0
-    failed_rows = 0
     token_input_total = 0
     token_output_total = 0
     token_total = 0
@@ -1228,12 +1443,11 @@ def _finalize_batch_record(
     expected_refund_total = 0
 
     current_rows = _list_rows(batch_id, runtime=resolved_runtime)
+    row_aggregates = _row_aggregates(current_rows)
+    completed_rows = row_aggregates['completed_rows']
+    failed_rows = row_aggregates['failed_rows']
     for row in current_rows:
         status = str(row.get('status', '') or '')
-        if status == 'complete':
-            completed_rows += 1
-        elif status == 'error':
-            failed_rows += 1
         token_input_total += int(row.get('token_input_total', 0) or 0)
         token_output_total += int(row.get('token_output_total', 0) or 0)
         token_total += int(row.get('token_total', 0) or 0)
@@ -1282,9 +1496,8 @@ def _finalize_batch_record(
     _upsert_batch(
         batch_id,
         {
+            **row_aggregates,
             'status': final_status,
-            'completed_rows': completed_rows,
-            'failed_rows': failed_rows,
             'token_input_total': token_input_total,
             'token_output_total': token_output_total,
             'token_total': token_total,
@@ -1573,6 +1786,7 @@ def process_batch_job(batch_id, runtime=None):
         merge=True,
     )
     stage_error = ''
+    row_writer = _RowStateWriter(batch_id, resolved_runtime)
     try:
         for row in rows:
             row.setdefault('status', 'processing')
@@ -1587,8 +1801,7 @@ def process_batch_job(batch_id, runtime=None):
             row['status'] = 'processing'
             row['current_stage'] = 'file_upload'
             row['last_stage_update_at'] = resolved_runtime.time.time()
-            _upsert_row(
-                batch_id,
+            row_writer.upsert(
                 row.get('row_id', ''),
                 {
                     'status': row['status'],
@@ -1596,23 +1809,10 @@ def process_batch_job(batch_id, runtime=None):
                     'last_stage_update_at': row['last_stage_update_at'],
                     'updated_at': resolved_runtime.time.time(),
                 },
-                runtime=resolved_runtime,
-                merge=True,
-            )
-            _upload_row_files(row, runtime=resolved_runtime)
-            row['last_stage_update_at'] = resolved_runtime.time.time()
-            _upsert_row(
-                batch_id,
-                row.get('row_id', ''),
-                {
-                    'status': row.get('status', 'processing'),
-                    'current_stage': row.get('current_stage', 'file_upload'),
-                    'last_stage_update_at': row.get('last_stage_update_at', 0),
-                    'updated_at': resolved_runtime.time.time(),
-                },
-                runtime=resolved_runtime,
                 merge=True,
             )
+        row_writer.flush()
+        _upload_rows_concurrently(batch_id, rows, row_writer, runtime=resolved_runtime)
 
         mode = str(batch.get('mode', '') or '')
         if mode in {'lecture-notes', 'slides-only'}:
@@ -1951,16 +2151,15 @@ def process_batch_job(batch_id, runtime=None):
             if row.get('status') == 'error':
                 _refund_failed_row(batch, row, runtime=resolved_runtime)
             _finalize_row_job_log(batch, row, runtime=resolved_runtime)
-            _upsert_row(
-                batch_id,
+            row_writer.upsert(
                 row.get('row_id', ''),
                 {
                     **row,
                     'updated_at': resolved_runtime.time.time(),
                 },
-                runtime=resolved_runtime,
                 merge=False,
             )
+        row_writer.flush()
     except Exception as error:
         stage_error = str(error)
         resolved_runtime.logger.exception('Batch processing failed for batch_id=%s', batch_id)
@@ -1973,7 +2172,8 @@ def process_batch_job(batch_id, runtime=None):
                 row['failed_stage'] = 'batch_pipeline'
             _refund_failed_row(batch, row, runtime=resolved_runtime)
             _finalize_row_job_log(batch, row, runtime=resolved_runtime)
-            _upsert_row(batch_id, row.get('row_id', ''), row, runtime=resolved_runtime, merge=False)
+            row_writer.upsert(row.get('row_id', ''), row, merge=False)
+        row_writer.flush()
     finally:
         _finalize_batch_record(
             batch_id,
@@ -2110,6 +2310,37 @@ def find_batch_by_submission_id(uid, client_submission_id, runtime=None):
     return candidates[0]
 
 
+def _batch_needs_row_scan(batch, runtime=None, now_ts=None):
+    if _batch_is_stale(batch, runtime=runtime, now_ts=now_ts):
+        return True
+    if 'can_download_zip' not in batch:
+        # Written before row aggregates were kept on the batch document.
+        return True
+    return _is_terminal_status(batch.get('status', '')) and int(batch.get('active_rows', 0) or 0) > 0
+
+
+def _batch_list_state(batch_id, batch, runtime=None):
+    """Return ``(batch, rows, can_download_zip)`` for a listing entry.
+
+    Listings trust the aggregates on the batch document. Rows are only read
+    (and the batch repaired) when its heartbeat is stale, a terminal batch
+    still counts active rows, or the document predates the aggregates, in
+    which case they are backfilled.
+    """
+    resolved_runtime = _resolve_runtime(runtime)
+    if not batch_id:
+        return batch, [], False
+    if not _batch_needs_row_scan(batch, runtime=resolved_runtime, now_ts=resolved_runtime.time.time()):
+        return batch, [], bool(batch.get('can_download_zip', False))
+    batch, batch_rows = _repair_batch_state_if_needed(batch_id, batch=batch, rows=None, runtime=resolved_runtime)
+    if isinstance(batch, dict) and 'can_download_zip' not in batch:
+        row_aggregates = _row_aggregates(batch_rows)
+        _upsert_batch(batch_id, row_aggregates, runtime=resolved_runtime, merge=True)
+        batch = {**batch, **row_aggregates}
+    can_download_zip = any(str(row.get('status', '') or '') == 'complete' for row in batch_rows)
+    return batch, batch_rows, can_download_zip
+
+
 def list_batches_for_uid(uid, statuses=None, limit=100, runtime=None):
     resolved_runtime = _resolve_runtime(runtime)
     safe_uid = str(uid or '').strip()
@@ -2152,13 +2383,9 @@ def list_batches_for_uid(uid, statuses=None, limit=100, runtime=None):
     results = []
     for batch in rows:
         batch_id = str(batch.get('batch_id', '') or '').strip()
-        if batch_id:
-            batch, batch_rows = _repair_batch_state_if_needed(batch_id, batch=batch, rows=None, runtime=resolved_runtime)
-        else:
-            batch_rows = []
+        batch, batch_rows, can_download_zip = _batch_list_state(batch_id, batch, runtime=resolved_runtime)
         if not isinstance(batch, dict):
             continue
-        can_download_zip = any(str(row.get('status', '') or '') == 'complete' for row in batch_rows)
         payload = {
             'batch_id': batch_id,
             'mode': str(batch.get('mode', '') or ''),
@@ -2222,13 +2449,9 @@ def list_batches_for_admin(statuses=None, limit=200, runtime=None):
     results = []
     for batch in rows:
         batch_id = str(batch.get('batch_id', '') or '').strip()
-        if batch_id:
-            batch, batch_rows = _repair_batch_state_if_needed(batch_id, batch=batch, rows=None, runtime=resolved_runtime)
-        else:
-            batch_rows = []
+        batch, batch_rows, can_download_zip = _batch_list_state(batch_id, batch, runtime=resolved_runtime)
         if not isinstance(batch, dict):
             continue
-        can_download_zip = any(str(row.get('status', '') or '') == 'complete' for row in batch_rows)
         payload = {
             'batch_id': batch_id,
             'uid': str(batch.get('uid', '') or ''),
@@ -1,7 +1,11 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 
 from lecture_processor.domains.account import lifecycle as account_lifecycle
+from lecture_processor.domains.ai import audio_segments
 from lecture_processor.domains.ai import provider as ai_provider
+from lecture_processor.domains.ai import result_cache
 from lecture_processor.domains.ai import study_generation
 from lecture_processor.domains.billing import credits as billing_credits
 from lecture_processor.domains.billing import receipts as billing_receipts
@@ -145,6 +149,171 @@ def save_study_pack(job_id, job_data, runtime=None):
         return False
 
 
+class PipelineBranchCancelled(Exception):
+    """Raised at a stage boundary once a sibling branch has failed."""
+
+
+class ParallelStageRunner:
+    """Runs independent pipeline branches concurrently until they rejoin.
+
+    Each branch is called with ``enter_stage(stage, description=None)`` and must call
+    it before every stage: that records the stage for ``failed_stage``, publishes the
+    combined progress text and stops the branch once a sibling has failed. Stages
+    already in flight are not interrupted, so ``run`` waits for every branch before
+    re-raising the first hard failure; nothing is still uploading when the caller
+    cleans up.
+    """
+
+    def __init__(self, set_fields):
+        self._set_fields = set_fields
+        self._lock = threading.Lock()
+        self._cancelled = threading.Event()
+        self._stages = {}
+        self._descriptions = {}
+        self._completed = 0
+        self._errors = []
+        self.failed_stage = ''
+
+    def _progress_text(self):
+        return ' '.join(text for text in self._descriptions.values() if text)
+
+    def enter_stage(self, branch, stage, description=None):
+        if self._cancelled.is_set():
+            raise PipelineBranchCancelled(branch)
+        with self._lock:
+            self._stages[branch] = stage
+            if description:
+                self._descriptions[branch] = description
+                self._set_fields(step_description=self._progress_text())
+
+    def _run_branch(self, branch, func):
+        try:
+            result = func(lambda stage, description=None: self.enter_stage(branch, stage, description))
+        except PipelineBranchCancelled:
+            return None
+        except Exception as error:
+            with self._lock:
+                if not self._errors:
+                    self.failed_stage = self._stages.get(branch, branch)
+                self._errors.append(error)
+            self._cancelled.set()
+            return None
+        with self._lock:
+            self._completed += 1
+            self._descriptions.pop(branch, None)
+            if self._descriptions and not self._cancelled.is_set():
+                self._set_fields(step=1 + self._completed, step_description=self._progress_text())
+        return result
+
+    def run(self, branches):
+        """Run ``[(name, func), ...]`` and return ``{name: result}``."""
+        branches = list(branches)
+        with self._lock:
+            self._descriptions = {name: '' for name, _func in branches}
+        results = {}
+        if len(branches) > 1:
+            with ThreadPoolExecutor(max_workers=len(branches) - 1, thread_name_prefix='lp-stage') as executor:
+                futures = {name: executor.submit(self._run_branch, name, func) for name, func in branches[1:]}
+                results[branches[0][0]] = self._run_branch(*branches[0])
+                for name, future in futures.items():
+                    results[name] = future.result()
+        elif branches:
+            results[branches[0][0]] = self._run_branch(*branches[0])
+        if self._errors:
+            raise self._errors[0]
+        return results
+
+
+def _split_long_audio(audio_path, local_paths, runtime):
+    """Cut a long recording into overlapping segments; ``[]`` means transcribe it whole."""
+    duration = runtime.probe_audio_duration_seconds(audio_path)
+    if duration < runtime.AUDIO_SEGMENT_MIN_DURATION_SECONDS:
+        return []
+    segments = audio_segments.plan_segments(duration, runtime.AUDIO_SEGMENT_SECONDS, runtime.AUDIO_SEGMENT_OVERLAP_SECONDS)
+    if len(segments) < 2:
+        return []
+    segment_paths = runtime.split_audio_segments(audio_path, [(segment['start'], segment['end']) for segment in segments])
+    if len(segment_paths) != len(segments):
+        return []
+    local_paths.extend(segment_paths)
+    return [dict(segment, path=segment_path) for segment, segment_path in zip(segments, segment_paths)]
+
+
+def _prepare_audio(audio_path, local_paths, runtime):
+    """Return ``(transcription_path, playback_path)`` for an uploaded recording.
+
+    Study packs play back the plain MP3 conversion; the speech-preprocessed
+    copy is only sent to the provider. With silence trimming the transcript
+    timestamps refer to the trimmed file, so that one is played back instead.
+    """
+    playback_path, playback_converted = runtime.convert_audio_to_mp3_with_ytdlp(audio_path)
+    if playback_converted and playback_path not in local_paths:
+        local_paths.append(playback_path)
+    transcription_path, converted = runtime.preprocess_audio_for_transcription(playback_path)
+    if converted and transcription_path not in local_paths:
+        local_paths.append(transcription_path)
+    if converted and runtime.AUDIO_TRIM_SILENCE:
+        playback_path = transcription_path
+    return transcription_path, playback_path
+
+
+def _upload_audio_segments(segments, audio_mime_type, gemini_files, retry_tracker, runtime):
+    """Upload every segment in parallel and wait until the provider has processed each one."""
+    files_lock = threading.Lock()
+
+    def upload_segment(_index, segment):
+        uploaded = ai_provider.run_with_provider_retry(
+            'audio_upload',
+            lambda: runtime.client.files.upload(file=segment['path'], config={'mime_type': audio_mime_type}),
+            retry_tracker=retry_tracker,
+            runtime=runtime,
+        )
+        with files_lock:
+            gemini_files.append(uploaded)
+        ai_provider.run_with_provider_retry(
+            'audio_file_processing',
+            lambda: runtime.wait_for_file_processing(uploaded),
+            retry_tracker=retry_tracker,
+            runtime=runtime,
+        )
+        return uploaded
+
+    return audio_segments.run_segments_in_parallel(upload_segment, segments, runtime.AUDIO_SEGMENT_MAX_PARALLEL)
+
+
+def _sum_token_usage(usages):
+    return {
+        key: sum(int((usage or {}).get(key, 0) or 0) for usage in usages)
+        for key in ('input_tokens', 'output_tokens', 'total_tokens')
+    }
+
+
+def _audio_cache_options(runtime):
+    return {
+        'bitrate_kbps': runtime.AUDIO_PREPROCESS_BITRATE_KBPS if runtime.AUDIO_PREPROCESS_ENABLED else 0,
+        'trim_silence': bool(runtime.AUDIO_TRIM_SILENCE),
+        'segment_seconds': runtime.AUDIO_SEGMENT_SECONDS,
+        'segment_overlap_seconds': runtime.AUDIO_SEGMENT_OVERLAP_SECONDS,
+        'segment_min_duration_seconds': runtime.AUDIO_SEGMENT_MIN_DURATION_SECONDS,
+    }
+
+
+def _cached_slide_text(pdf_path, tokens, runtime):
+    """Return ``(cache_key, slide_text)``; the text is '' unless the deck was extracted before."""
+    cache_key = result_cache.build_cache_key(
+        pdf_path,
+        model=runtime.MODEL_SLIDES,
+        prompt_id='slide_extraction',
+        prompt_template=runtime.PROMPT_SLIDE_EXTRACTION,
+        runtime=runtime,
+    )
+    cached = result_cache.get_cached_result(cache_key, runtime=runtime) or {}
+    slide_text = str(cached.get('slide_text', '') or '')
+    if slide_text:
+        tokens.record_usage('slide_extraction', {}, model=runtime.MODEL_SLIDES, billing_mode='standard', input_modality='text', cache_hit=True)
+    return cache_key, slide_text
+
+
 def process_lecture_notes(job_id, pdf_path, audio_path, runtime=None):
     resolved_runtime = _resolve_runtime(runtime)
     gemini_files = []
@@ -157,103 +326,200 @@ def process_lecture_notes(job_id, pdf_path, audio_path, runtime=None):
 
     try:
         set_fields(status='processing', step=1, step_description='Extracting text from slides...')
-        failed_stage = 'slide_upload'
-        pdf_file = ai_provider.run_with_provider_retry(
-            'slide_upload',
-            lambda: resolved_runtime.client.files.upload(file=pdf_path, config={'mime_type': 'application/pdf'}),
-            retry_tracker=retry_tracker,
-            runtime=resolved_runtime,
-        )
-        gemini_files.append(pdf_file)
-
-        failed_stage = 'slide_file_processing'
-        ai_provider.run_with_provider_retry(
-            'slide_file_processing',
-            lambda: resolved_runtime.wait_for_file_processing(pdf_file),
-            retry_tracker=retry_tracker,
-            runtime=resolved_runtime,
-        )
-
-        failed_stage = 'slide_extraction'
-        response = ai_provider.generate_with_policy(
-            resolved_runtime.MODEL_SLIDES,
-            [
-                resolved_runtime.types.Content(
-                    role='user',
-                    parts=[
-                        resolved_runtime.types.Part.from_uri(file_uri=pdf_file.uri, mime_type='application/pdf'),
-                        resolved_runtime.types.Part.from_text(text=resolved_runtime.PROMPT_SLIDE_EXTRACTION),
-                    ],
-                )
-            ],
-            retry_tracker=retry_tracker,
-            operation_name='slide_extraction',
-            runtime=resolved_runtime,
-        )
-        tokens.record('slide_extraction', response, model=resolved_runtime.MODEL_SLIDES, billing_mode='standard', input_modality='text')
-        slide_text = response.text
-        set_fields(slide_text=slide_text, step=2, step_description='Transcribing audio...')
-
         output_language = get_fields().get('output_language', 'English')
-        converted_audio_path, converted = resolved_runtime.convert_audio_to_mp3_with_ytdlp(audio_path)
-        if converted and converted_audio_path not in local_paths:
-            local_paths.append(converted_audio_path)
 
-        set_fields(step_description='Optimizing audio for faster processing...')
-        audio_mime_type = resolved_runtime.get_mime_type(converted_audio_path)
+        def slide_branch(enter_stage):
+            enter_stage('slide_upload', 'Extracting text from slides...')
+            slide_cache_key, cached_slide_text = _cached_slide_text(pdf_path, tokens, resolved_runtime)
+            if cached_slide_text:
+                set_fields(slide_text=cached_slide_text)
+                return cached_slide_text
+            pdf_file = ai_provider.run_with_provider_retry(
+                'slide_upload',
+                lambda: resolved_runtime.client.files.upload(file=pdf_path, config={'mime_type': 'application/pdf'}),
+                retry_tracker=retry_tracker,
+                runtime=resolved_runtime,
+            )
+            gemini_files.append(pdf_file)
 
-        failed_stage = 'audio_upload'
-        audio_file = ai_provider.run_with_provider_retry(
-            'audio_upload',
-            lambda: resolved_runtime.client.files.upload(file=converted_audio_path, config={'mime_type': audio_mime_type}),
-            retry_tracker=retry_tracker,
-            runtime=resolved_runtime,
-        )
-        gemini_files.append(audio_file)
+            enter_stage('slide_file_processing')
+            ai_provider.run_with_provider_retry(
+                'slide_file_processing',
+                lambda: resolved_runtime.wait_for_file_processing(pdf_file),
+                retry_tracker=retry_tracker,
+                runtime=resolved_runtime,
+            )
 
-        set_fields(step_description='Processing audio file (this may take a few minutes)...')
-        failed_stage = 'audio_file_processing'
-        ai_provider.run_with_provider_retry(
-            'audio_file_processing',
-            lambda: resolved_runtime.wait_for_file_processing(audio_file),
-            retry_tracker=retry_tracker,
-            runtime=resolved_runtime,
-        )
+            enter_stage('slide_extraction')
+            response = ai_provider.generate_with_policy(
+                resolved_runtime.MODEL_SLIDES,
+                [
+                    resolved_runtime.types.Content(
+                        role='user',
+                        parts=[
+                            resolved_runtime.types.Part.from_uri(file_uri=pdf_file.uri, mime_type='application/pdf'),
+                            resolved_runtime.types.Part.from_text(text=resolved_runtime.PROMPT_SLIDE_EXTRACTION),
+                        ],
+                    )
+                ],
+                retry_tracker=retry_tracker,
+                operation_name='slide_extraction',
+                runtime=resolved_runtime,
+            )
+            tokens.record('slide_extraction', response, model=resolved_runtime.MODEL_SLIDES, billing_mode='standard', input_modality='text')
+            if response.text:
+                result_cache.store_cached_result(slide_cache_key, {'slide_text': response.text}, runtime=resolved_runtime)
+            set_fields(slide_text=response.text)
+            return response.text
+
+        def audio_branch(enter_stage):
+            enter_stage('audio_conversion', 'Optimizing audio for faster processing...')
+            audio_prompt_id = 'audio_transcription_timestamped' if resolved_runtime.FEATURE_AUDIO_SECTION_SYNC else 'audio_transcription'
+            audio_cache_key = result_cache.build_cache_key(
+                audio_path,
+                model=resolved_runtime.MODEL_AUDIO,
+                prompt_id=audio_prompt_id,
+                prompt_template=(
+                    resolved_runtime.PROMPT_AUDIO_TRANSCRIPTION_TIMESTAMPED
+                    if resolved_runtime.FEATURE_AUDIO_SECTION_SYNC
+                    else resolved_runtime.PROMPT_AUDIO_TRANSCRIPTION
+                ),
+                output_language=output_language,
+                options=_audio_cache_options(resolved_runtime),
+                runtime=resolved_runtime,
+            )
+            cached_audio = result_cache.get_cached_result(audio_cache_key, runtime=resolved_runtime) or {}
+            converted_audio_path, playback_audio_path = _prepare_audio(audio_path, local_paths, resolved_runtime)
+            audio_mime_type = resolved_runtime.get_mime_type(converted_audio_path)
 
-        set_fields(step_description='Generating transcript...')
-        failed_stage = 'audio_transcription'
-        if resolved_runtime.FEATURE_AUDIO_SECTION_SYNC:
-            transcript, transcript_segments, transcription_usage = resolved_runtime.transcribe_audio_with_timestamps(
-                audio_file,
-                audio_mime_type,
-                output_language,
+            if cached_audio.get('transcript'):
+                transcript = str(cached_audio['transcript'])
+                transcript_segments = list(cached_audio.get('transcript_segments') or [])
+                tokens.record_usage(
+                    'audio_transcription',
+                    {},
+                    model=resolved_runtime.MODEL_AUDIO,
+                    billing_mode='standard',
+                    input_modality='audio',
+                    cache_hit=True,
+                )
+                set_fields(
+                    transcript=transcript,
+                    transcript_segments=transcript_segments,
+                    audio_storage_key=study_audio.persist_audio_for_study_pack(job_id, playback_audio_path, runtime=resolved_runtime),
+                )
+                return transcript, transcript_segments
+
+            segments = _split_long_audio(converted_audio_path, local_paths, resolved_runtime)
+            if segments:
+                enter_stage('audio_upload', f'Uploading {len(segments)} audio segments...')
+                segment_files = _upload_audio_segments(segments, audio_mime_type, gemini_files, retry_tracker, resolved_runtime)
+
+                enter_stage('audio_transcription', f'Transcribing {len(segments)} audio segments in parallel...')
+
+                def transcribe_segment(index, segment):
+                    # Timestamps are needed to drop the lines each overlap repeats.
+                    return (segment,) + tuple(resolved_runtime.transcribe_audio_with_timestamps(
+                        segment_files[index],
+                        audio_mime_type,
+                        output_language,
+                        retry_tracker=retry_tracker,
+                        include_usage=True,
+                    ))
+
+                segment_results = audio_segments.run_segments_in_parallel(
+                    transcribe_segment,
+                    segments,
+                    resolved_runtime.AUDIO_SEGMENT_MAX_PARALLEL,
+                )
+                transcript, transcript_segments = audio_segments.stitch_transcript_segments(
+                    [result[:3] for result in segment_results]
+                )
+                tokens.record_usage(
+                    'audio_transcription',
+                    _sum_token_usage([result[3] for result in segment_results]),
+                    model=resolved_runtime.MODEL_AUDIO,
+                    billing_mode='standard',
+                    input_modality='audio',
+                )
+                if transcript:
+                    result_cache.store_cached_result(
+                        audio_cache_key,
+                        {'transcript': transcript, 'transcript_segments': transcript_segments},
+                        runtime=resolved_runtime,
+                    )
+                set_fields(
+                    transcript=transcript,
+                    transcript_segments=transcript_segments,
+                    audio_storage_key=study_audio.persist_audio_for_study_pack(job_id, playback_audio_path, runtime=resolved_runtime),
+                )
+                return transcript, transcript_segments
+
+            enter_stage('audio_upload')
+            audio_file = ai_provider.run_with_provider_retry(
+                'audio_upload',
+                lambda: resolved_runtime.client.files.upload(file=converted_audio_path, config={'mime_type': audio_mime_type}),
                 retry_tracker=retry_tracker,
-                include_usage=True,
+                runtime=resolved_runtime,
             )
-        else:
-            transcript, transcription_usage = resolved_runtime.transcribe_audio_plain(
-                audio_file,
-                audio_mime_type,
-                output_language,
+            gemini_files.append(audio_file)
+
+            enter_stage('audio_file_processing', 'Processing audio file (this may take a few minutes)...')
+            ai_provider.run_with_provider_retry(
+                'audio_file_processing',
+                lambda: resolved_runtime.wait_for_file_processing(audio_file),
                 retry_tracker=retry_tracker,
-                include_usage=True,
+                runtime=resolved_runtime,
             )
-            transcript_segments = []
-        tokens.record_usage(
-            'audio_transcription',
-            transcription_usage,
-            model=resolved_runtime.MODEL_AUDIO,
-            billing_mode='standard',
-            input_modality='audio',
-        )
 
-        set_fields(
-            transcript=transcript,
-            transcript_segments=transcript_segments,
-            audio_storage_key=study_audio.persist_audio_for_study_pack(job_id, converted_audio_path, runtime=resolved_runtime),
-            step=3,
-            step_description='Creating complete lecture notes...',
-        )
+            enter_stage('audio_transcription', 'Generating transcript...')
+            if resolved_runtime.FEATURE_AUDIO_SECTION_SYNC:
+                transcript, transcript_segments, transcription_usage = resolved_runtime.transcribe_audio_with_timestamps(
+                    audio_file,
+                    audio_mime_type,
+                    output_language,
+                    retry_tracker=retry_tracker,
+                    include_usage=True,
+                )
+            else:
+                transcript, transcription_usage = resolved_runtime.transcribe_audio_plain(
+                    audio_file,
+                    audio_mime_type,
+                    output_language,
+                    retry_tracker=retry_tracker,
+                    include_usage=True,
+                )
+                transcript_segments = []
+            tokens.record_usage(
+                'audio_transcription',
+                transcription_usage,
+                model=resolved_runtime.MODEL_AUDIO,
+                billing_mode='standard',
+                input_modality='audio',
+            )
+            # A timestamped run that fell back to plain text is not worth remembering.
+            if transcript and (transcript_segments or not resolved_runtime.FEATURE_AUDIO_SECTION_SYNC):
+                result_cache.store_cached_result(
+                    audio_cache_key,
+                    {'transcript': transcript, 'transcript_segments': transcript_segments},
+                    runtime=resolved_runtime,
+                )
+            set_fields(
+                transcript=transcript,
+                transcript_segments=transcript_segments,
+                audio_storage_key=study_audio.persist_audio_for_study_pack(job_id, playback_audio_path, runtime=resolved_runtime),
+            )
+            return transcript, transcript_segments
+
+        branches = ParallelStageRunner(set_fields)
+        try:
+            branch_results = branches.run([('slides', slide_branch), ('audio', audio_branch)])
+        except Exception:
+            failed_stage = branches.failed_stage or failed_stage
+            raise
+        slide_text = branch_results['slides']
+        transcript, transcript_segments = branch_results['audio']
+        set_fields(step=3, step_description='Creating complete lecture notes...')
 
         merge_transcript = (
             study_audio.format_transcript_with_timestamps(transcript_segments, runtime=resolved_runtime)
@@ -369,42 +635,46 @@ def process_slides_only(job_id, pdf_path, runtime=None):
     try:
         set_fields(status='processing', step=1, step_description='Extracting text from slides...')
 
-        failed_stage = 'slide_upload'
-        pdf_file = ai_provider.run_with_provider_retry(
-            'slide_upload',
-            lambda: resolved_runtime.client.files.upload(file=pdf_path, config={'mime_type': 'application/pdf'}),
-            retry_tracker=retry_tracker,
-            runtime=resolved_runtime,
-        )
-        gemini_files.append(pdf_file)
+        slide_cache_key, extracted_text = _cached_slide_text(pdf_path, tokens, resolved_runtime)
+        if not extracted_text:
+            failed_stage = 'slide_upload'
+            pdf_file = ai_provider.run_with_provider_retry(
+                'slide_upload',
+                lambda: resolved_runtime.client.files.upload(file=pdf_path, config={'mime_type': 'application/pdf'}),
+                retry_tracker=retry_tracker,
+                runtime=resolved_runtime,
+            )
+            gemini_files.append(pdf_file)
 
-        failed_stage = 'slide_file_processing'
-        ai_provider.run_with_provider_retry(
-            'slide_file_processing',
-            lambda: resolved_runtime.wait_for_file_processing(pdf_file),
-            retry_tracker=retry_tracker,
-            runtime=resolved_runtime,
-        )
+            failed_stage = 'slide_file_processing'
+            ai_provider.run_with_provider_retry(
+                'slide_file_processing',
+                lambda: resolved_runtime.wait_for_file_processing(pdf_file),
+                retry_tracker=retry_tracker,
+                runtime=resolved_runtime,
+            )
 
-        failed_stage = 'slide_extraction'
-        response = ai_provider.generate_with_policy(
-            resolved_runtime.MODEL_SLIDES,
-            [
-                resolved_runtime.types.Content(
-                    role='user',
-                    parts=[
-                        resolved_runtime.types.Part.from_uri(file_uri=pdf_file.uri, mime_type='application/pdf'),
-                        resolved_runtime.types.Part.from_text(text=resolved_runtime.PROMPT_SLIDE_EXTRACTION),
-                    ],
-                )
-            ],
-            retry_tracker=retry_tracker,
-            operation_name='slide_extraction',
-            runtime=resolved_runtime,
-        )
-        tokens.record('slide_extraction', response, model=resolved_runtime.MODEL_SLIDES, billing_mode='standard', input_modality='text')
+            failed_stage = 'slide_extraction'
+            response = ai_provider.generate_with_policy(
+                resolved_runtime.MODEL_SLIDES,
+                [
+                    resolved_runtime.types.Content(
+                        role='user',
+                        parts=[
+                            resolved_runtime.types.Part.from_uri(file_uri=pdf_file.uri, mime_type='application/pdf'),
+                            resolved_runtime.types.Part.from_text(text=resolved_runtime.PROMPT_SLIDE_EXTRACTION),
+                        ],
+                    )
+                ],
+                retry_tracker=retry_tracker,
+                operation_name='slide_extraction',
+                runtime=resolved_runtime,
+            )
+            tokens.record('slide_extraction', response, model=resolved_runtime.MODEL_SLIDES, billing_mode='standard', input_modality='text')
 
-        extracted_text = response.text
+            extracted_text = response.text
+            if extracted_text:
+                result_cache.store_cached_result(slide_cache_key, {'slide_text': extracted_text}, runtime=resolved_runtime)
         set_fields(result=extracted_text)
 
         job_data = get_fields()
@@ -484,52 +754,114 @@ def process_interview_transcription(job_id, audio_path, runtime=None):
         set_fields(status='processing', step=1, step_description='Optimizing audio for faster processing...')
 
         output_language = get_fields().get('output_language', 'English')
-        converted_audio_path, converted = resolved_runtime.convert_audio_to_mp3_with_ytdlp(audio_path)
-        if converted and converted_audio_path not in local_paths:
-            local_paths.append(converted_audio_path)
+        converted_audio_path, playback_audio_path = _prepare_audio(audio_path, local_paths, resolved_runtime)
 
-        set_fields(audio_storage_key=study_audio.persist_audio_for_study_pack(job_id, converted_audio_path, runtime=resolved_runtime))
+        set_fields(audio_storage_key=study_audio.persist_audio_for_study_pack(job_id, playback_audio_path, runtime=resolved_runtime))
         audio_mime_type = resolved_runtime.get_mime_type(converted_audio_path)
-
-        failed_stage = 'audio_upload'
-        audio_file = ai_provider.run_with_provider_retry(
-            'audio_upload',
-            lambda: resolved_runtime.client.files.upload(file=converted_audio_path, config={'mime_type': audio_mime_type}),
-            retry_tracker=retry_tracker,
-            runtime=resolved_runtime,
-        )
-        gemini_files.append(audio_file)
-
-        set_fields(step_description='Processing audio file (this may take a few minutes)...')
-        failed_stage = 'audio_file_processing'
-        ai_provider.run_with_provider_retry(
-            'audio_file_processing',
-            lambda: resolved_runtime.wait_for_file_processing(audio_file),
-            retry_tracker=retry_tracker,
+        interview_prompt = resolved_runtime.PROMPT_INTERVIEW_TRANSCRIPTION.format(output_language=output_language)
+        interview_cache_key = result_cache.build_cache_key(
+            audio_path,
+            model=resolved_runtime.MODEL_INTERVIEW,
+            prompt_id='interview_transcription',
+            prompt_template=resolved_runtime.PROMPT_INTERVIEW_TRANSCRIPTION,
+            output_language=output_language,
+            options=_audio_cache_options(resolved_runtime),
             runtime=resolved_runtime,
         )
-
-        set_fields(step_description='Generating transcript with timestamps...')
-        interview_prompt = resolved_runtime.PROMPT_INTERVIEW_TRANSCRIPTION.format(output_language=output_language)
-        failed_stage = 'interview_transcription'
-        response = ai_provider.generate_with_policy(
-            resolved_runtime.MODEL_INTERVIEW,
-            [
-                resolved_runtime.types.Content(
-                    role='user',
-                    parts=[
-                        resolved_runtime.types.Part.from_uri(file_uri=audio_file.uri, mime_type=audio_mime_type),
-                        resolved_runtime.types.Part.from_text(text=interview_prompt),
+        cached_transcript = str((result_cache.get_cached_result(interview_cache_key, runtime=resolved_runtime) or {}).get('transcript', '') or '')
+
+        segments = [] if cached_transcript else _split_long_audio(converted_audio_path, local_paths, resolved_runtime)
+        if cached_transcript:
+            transcript_text = cached_transcript
+            tokens.record_usage(
+                'interview_transcription',
+                {},
+                model=resolved_runtime.MODEL_INTERVIEW,
+                billing_mode='standard',
+                input_modality='audio',
+                cache_hit=True,
+            )
+        elif segments:
+            set_fields(step_description=f'Uploading {len(segments)} audio segments...')
+            failed_stage = 'audio_upload'
+            segment_files = _upload_audio_segments(segments, audio_mime_type, gemini_files, retry_tracker, resolved_runtime)
+
+            set_fields(step_description=f'Transcribing {len(segments)} audio segments in parallel...')
+            failed_stage = 'interview_transcription'
+
+            def transcribe_segment(index, segment):
+                segment_file = segment_files[index]
+                segment_response = ai_provider.generate_with_policy(
+                    resolved_runtime.MODEL_INTERVIEW,
+                    [
+                        resolved_runtime.types.Content(
+                            role='user',
+                            parts=[
+                                resolved_runtime.types.Part.from_uri(file_uri=segment_file.uri, mime_type=audio_mime_type),
+                                resolved_runtime.types.Part.from_text(text=interview_prompt),
+                            ],
+                        )
                     ],
+                    retry_tracker=retry_tracker,
+                    operation_name='interview_transcription',
+                    runtime=resolved_runtime,
                 )
-            ],
-            retry_tracker=retry_tracker,
-            operation_name='interview_transcription',
-            runtime=resolved_runtime,
-        )
-        tokens.record('interview_transcription', response, model=resolved_runtime.MODEL_INTERVIEW, billing_mode='standard', input_modality='audio')
+                return segment, segment_response.text or '', ai_provider.extract_token_usage(segment_response, runtime=resolved_runtime)
+
+            segment_results = audio_segments.run_segments_in_parallel(
+                transcribe_segment,
+                segments,
+                resolved_runtime.AUDIO_SEGMENT_MAX_PARALLEL,
+            )
+            tokens.record_usage(
+                'interview_transcription',
+                _sum_token_usage([result[2] for result in segment_results]),
+                model=resolved_runtime.MODEL_INTERVIEW,
+                billing_mode='standard',
+                input_modality='audio',
+            )
+            transcript_text = audio_segments.stitch_timecoded_text([result[:2] for result in segment_results])
+        else:
+            failed_stage = 'audio_upload'
+            audio_file = ai_provider.run_with_provider_retry(
+                'audio_upload',
+                lambda: resolved_runtime.client.files.upload(file=converted_audio_path, config={'mime_type': audio_mime_type}),
+                retry_tracker=retry_tracker,
+                runtime=resolved_runtime,
+            )
+            gemini_files.append(audio_file)
+
+            set_fields(step_description='Processing audio file (this may take a few minutes)...')
+            failed_stage = 'audio_file_processing'
+            ai_provider.run_with_provider_retry(
+                'audio_file_processing',
+                lambda: resolved_runtime.wait_for_file_processing(audio_file),
+                retry_tracker=retry_tracker,
+                runtime=resolved_runtime,
+            )
+
+            set_fields(step_description='Generating transcript with timestamps...')
+            failed_stage = 'interview_transcription'
+            response = ai_provider.generate_with_policy(
+                resolved_runtime.MODEL_INTERVIEW,
+                [
+                    resolved_runtime.types.Content(
+                        role='user',
+                        parts=[
+                            resolved_runtime.types.Part.from_uri(file_uri=audio_file.uri, mime_type=audio_mime_type),
+                            resolved_runtime.types.Part.from_text(text=interview_prompt),
+                        ],
+                    )
+                ],
+                retry_tracker=retry_tracker,
+                operation_name='interview_transcription',
+                runtime=resolved_runtime,
+            )
+            tokens.record('interview_transcription', response, model=resolved_runtime.MODEL_INTERVIEW, billing_mode='standard', input_modality='audio')
 
-        transcript_text = response.text or ''
+            transcript_text = response.text or ''
+        if transcript_text and not cached_transcript:
+            result_cache.store_cached_result(interview_cache_key, {'transcript': transcript_text}, runtime=resolved_runtime)
         set_fields(transcript=transcript_text, result=transcript_text)
 
         job_data = get_fields()
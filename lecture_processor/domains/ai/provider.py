@@ -1,5 +1,6 @@
 import os
 import random
+import threading
 import time
 
 from lecture_processor.runtime.container import get_runtime
@@ -168,10 +169,11 @@ def extract_token_usage(response, runtime=None):
 
 
 class TokenAccumulator:
-    """Accumulates token usage across multiple AI calls in a processing job."""
+    """Accumulates token usage across multiple AI calls in a processing job (thread-safe)."""
 
     def __init__(self, runtime=None):
         self._runtime = _resolve_runtime(runtime)
+        self._lock = threading.Lock()
         self.stages = {}
         self.input_total = 0
         self.output_total = 0
@@ -187,7 +189,7 @@ class TokenAccumulator:
             input_modality=input_modality,
         )
 
-    def record_usage(self, stage_name, usage, model=None, billing_mode='standard', input_modality='text'):
+    def record_usage(self, stage_name, usage, model=None, billing_mode='standard', input_modality='text', cache_hit=False):
         normalized = {
             'input_tokens': int((usage or {}).get('input_tokens', 0) or 0),
             'output_tokens': int((usage or {}).get('output_tokens', 0) or 0),
@@ -196,19 +198,24 @@ class TokenAccumulator:
             'billing_mode': str(billing_mode or 'standard').strip() or 'standard',
             'input_modality': str(input_modality or 'text').strip() or 'text',
         }
-        self.stages[stage_name] = normalized
-        self.input_total += normalized['input_tokens']
-        self.output_total += normalized['output_tokens']
-        self.total += normalized['total_tokens']
+        if cache_hit:
+            # Served from the result cache: the stage is kept in the breakdown at zero tokens.
+            normalized.update(input_tokens=0, output_tokens=0, total_tokens=0, cache_hit=True)
+        with self._lock:
+            self.stages[stage_name] = normalized
+            self.input_total += normalized['input_tokens']
+            self.output_total += normalized['output_tokens']
+            self.total += normalized['total_tokens']
         return normalized
 
     def as_dict(self):
-        return {
-            'token_usage_by_stage': self.stages,
-            'token_input_total': self.input_total,
-            'token_output_total': self.output_total,
-            'token_total': self.total,
-        }
+        with self._lock:
+            return {
+                'token_usage_by_stage': self.stages,
+                'token_input_total': self.input_total,
+                'token_output_total': self.output_total,
+                'token_total': self.total,
+            }
 
 
 def generate_with_policy(model, contents, max_output_tokens=65536, retry_tracker=None, operation_name=None, runtime=None):
@@ -0,0 +1,171 @@
+"""Content-addressed cache for slide extraction and transcription results.
+
+Students in one course often upload the same deck or recording. Results are
+keyed by the SHA-256 of the uploaded file together with the model, the prompt
+(registry version and template) and the output language, so a change to any
+of them misses the cache. Entries live in Firestore when it is configured and
+in a local directory otherwise; both expire after AI_RESULT_CACHE_TTL_SECONDS
+and the local store also evicts its least recently used entries.
+"""
+
+import hashlib
+import json
+import os
+import uuid
+
+from lecture_processor.runtime.container import get_runtime
+
+HASH_READ_BYTES = 1024 * 1024
+MAX_FIRESTORE_PAYLOAD_BYTES = 900 * 1024
+
+
+def _resolve_runtime(runtime=None):
+    if runtime is not None:
+        return runtime
+    return get_runtime()
+
+
+def _cache_mode(resolved_runtime):
+    mode = str(getattr(resolved_runtime, 'AI_RESULT_CACHE_MODE', 'auto') or 'auto').strip().lower()
+    if mode == 'auto':
+        return 'firestore' if getattr(resolved_runtime, 'db', None) is not None else 'local'
+    if mode == 'firestore' and getattr(resolved_runtime, 'db', None) is None:
+        return 'off'
+    return mode if mode in {'firestore', 'local'} else 'off'
+
+
+def file_sha256(path):
+    digest = hashlib.sha256()
+    with open(path, 'rb') as handle:
+        for block in iter(lambda: handle.read(HASH_READ_BYTES), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def build_cache_key(path, *, model, prompt_id, prompt_template, output_language='', options=None, runtime=None):
+    """Key for the result of running ``prompt_id`` on the file at ``path``; '' disables caching."""
+    resolved_runtime = _resolve_runtime(runtime)
+    if _cache_mode(resolved_runtime) == 'off' or not path:
+        return ''
+    try:
+        content_sha256 = file_sha256(path)
+    except Exception:
+        resolved_runtime.logger.warning('Result cache key unavailable for %s', prompt_id, exc_info=True)
+        return ''
+    parts = {
+        'content_sha256': content_sha256,
+        'model': str(model or ''),
+        'prompt_id': str(prompt_id),
+        'prompt_version': str(getattr(resolved_runtime, 'PROMPT_REGISTRY_VERSION', '') or ''),
+        'prompt_sha256': hashlib.sha256(str(prompt_template or '').encode('utf-8')).hexdigest(),
+        'output_language': str(output_language or '').strip().lower(),
+        'options': options or {},
+    }
+    return hashlib.sha256(json.dumps(parts, sort_keys=True).encode('utf-8')).hexdigest()
+
+
+def _local_entry_path(resolved_runtime, cache_key):
+    return os.path.join(resolved_runtime.AI_RESULT_CACHE_DIR, f'{cache_key}.json')
+
+
+def _evict_local_entries(resolved_runtime):
+    cache_dir = resolved_runtime.AI_RESULT_CACHE_DIR
+    try:
+        entries = [os.path.join(cache_dir, name) for name in os.listdir(cache_dir) if name.endswith('.json')]
+    except OSError:
+        return 0
+    now_ts = resolved_runtime.time.time()
+    ttl_seconds = float(resolved_runtime.AI_RESULT_CACHE_TTL_SECONDS)
+    stamped = []
+    for path in entries:
+        try:
+            stamped.append((os.path.getmtime(path), path))
+        except OSError:
+            continue
+    stamped.sort()
+    overflow = max(0, len(stamped) - int(resolved_runtime.AI_RESULT_CACHE_MAX_ENTRIES))
+    removed = 0
+    for index, (mtime, path) in enumerate(stamped):
+        if index >= overflow and now_ts - mtime <= ttl_seconds:
+            break
+        try:
+            os.remove(path)
+            removed += 1
+        except OSError:
+            continue
+    return removed
+
+
+def get_cached_result(cache_key, runtime=None):
+    """Return the cached payload dict for ``cache_key`` or None; lookups never raise."""
+    resolved_runtime = _resolve_runtime(runtime)
+    if not cache_key:
+        return None
+    mode = _cache_mode(resolved_runtime)
+    now_ts = resolved_runtime.time.time()
+    try:
+        if mode == 'firestore':
+            doc = resolved_runtime.result_cache_repo.get_doc(resolved_runtime.db, resolved_runtime.AI_RESULT_CACHE_COLLECTION, cache_key)
+            if not doc.exists:
+                return None
+            entry = doc.to_dict() or {}
+            if float(entry.get('expires_at', 0) or 0) <= now_ts:
+                resolved_runtime.result_cache_repo.delete_doc(resolved_runtime.db, resolved_runtime.AI_RESULT_CACHE_COLLECTION, cache_key)
+                return None
+            payload = entry.get('payload')
+            return payload if isinstance(payload, dict) else None
+        if mode == 'local':
+            path = _local_entry_path(resolved_runtime, cache_key)
+            if not os.path.exists(path):
+                return None
+            if now_ts - os.path.getmtime(path) > float(resolved_runtime.AI_RESULT_CACHE_TTL_SECONDS):
+                os.remove(path)
+                return None
+            with open(path, 'r', encoding='utf-8') as handle:
+                payload = json.load(handle)
+            # Touch on hit so eviction drops the least recently used entries first.
+            os.utime(path, (now_ts, now_ts))
+            return payload if isinstance(payload, dict) else None
+    except Exception:
+        resolved_runtime.logger.warning('Result cache lookup failed for %s', cache_key, exc_info=True)
+    return None
+
+
+def store_cached_result(cache_key, payload, runtime=None):
+    """Best-effort write of ``payload``; returns True when it was stored."""
+    resolved_runtime = _resolve_runtime(runtime)
+    if not cache_key or not isinstance(payload, dict):
+        return False
+    mode = _cache_mode(resolved_runtime)
+    try:
+        encoded = json.dumps(payload, ensure_ascii=False)
+        if mode == 'firestore':
+            if len(encoded.encode('utf-8')) > MAX_FIRESTORE_PAYLOAD_BYTES:
+                return False
+            now_ts = resolved_runtime.time.time()
+            resolved_runtime.result_cache_repo.set_doc(
+                resolved_runtime.db,
+                resolved_runtime.AI_RESULT_CACHE_COLLECTION,
+                cache_key,
+                {
+                    'payload': payload,
+                    'created_at': now_ts,
+                    # A Firestore TTL policy on this field purges entries nobody reads again.
+                    'expires_at': now_ts + float(resolved_runtime.AI_RESULT_CACHE_TTL_SECONDS),
+                },
+            )
+            return True
+        if mode == 'local':
+            os.makedirs(resolved_runtime.AI_RESULT_CACHE_DIR, exist_ok=True)
+            path = _local_entry_path(resolved_runtime, cache_key)
+            temp_path = f'{path}.{uuid.uuid4().hex}.tmp'
+            with open(temp_path, 'w', encoding='utf-8') as handle:
+                handle.write(encoded)
+            os.replace(temp_path, path)
+            now_ts = resolved_runtime.time.time()
+            os.utime(path, (now_ts, now_ts))
+            _evict_local_entries(resolved_runtime)
+            return True
+    except Exception:
+        resolved_runtime.logger.warning('Result cache write failed for %s', cache_key, exc_info=True)
+    return False
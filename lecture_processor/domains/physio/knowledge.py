@@ -3,15 +3,29 @@
 from __future__ import annotations
 
 import gzip
+import hashlib
 import heapq
 import json
 import math
+import mmap
+import operator
 import os
 import re
+import sys
+import threading
+import time
 import unicodedata
+from array import array
+from collections import OrderedDict
 from pathlib import Path
 
+try:
+    import numpy as np
+except Exception:
+    np = None
+
 from lecture_processor.domains.ai import provider as ai_provider
+from lecture_processor.repositories import physio_repo
 from lecture_processor.runtime.container import get_runtime
 
 from . import prompts as physio_prompts
@@ -27,7 +41,30 @@ DEFAULT_CHUNK_SIZE = 1100
 DEFAULT_CHUNK_OVERLAP = 180
 SUPPORTED_SOURCE_SUFFIXES = {".pdf", ".docx", ".pptx", ".txt", ".md"}
 SHARDED_INDEX_FORMAT = "sharded-gzip-v1"
+VECTOR_STORE_FORMAT = "mmap-f32-v1"
+VECTOR_STORE_FILE_KEYS = ("vectors", "records", "offsets", "lexical", "lexical_offsets")
 _INDEX_CACHE = {"path": "", "mtime": 0.0, "signature": "", "payload": None}
+_VECTOR_STORE_CACHE = {"signature": "", "store": None}
+_VECTOR_STORE_LOCK = threading.Lock()
+SCORING_TERM_CACHE_SIZE = 512
+ANN_INDEX_FORMAT = "ivf-flat-v1"
+ANN_INDEX_FILE_KEYS = ("centroids", "lists", "list_offsets")
+ANN_MIN_RECORDS = 50000
+ANN_BUILD_BLOCK_ROWS = 8192
+DEFAULT_ANN_NPROBE = 8
+BM25_INDEX_FORMAT = "bm25-v1"
+BM25_INDEX_FILE_KEYS = ("vocabulary", "postings", "lengths")
+BM25_K1 = 1.2
+BM25_B = 0.75
+RRF_K = 60
+MATCH_STOPWORDS = frozenset({"een", "het", "van", "met", "naar", "voor", "bij", "and", "the"})
+QUERY_EMBEDDING_CACHE_SIZE = 512
+QUERY_EMBEDDING_CACHE_TTL_SECONDS = 24 * 60 * 60
+_QUERY_EMBEDDING_CACHE = {"signature": "", "entries": OrderedDict()}
+_QUERY_EMBEDDING_STATS = {"hits": 0, "shared_hits": 0, "misses": 0, "invalidations": 0}
+_QUERY_EMBEDDING_LOCK = threading.Lock()
+_SOURCE_HASH_CACHE = {}
+_SOURCE_HASH_LOCK = threading.Lock()
 BODY_REGION_TERMS = {
     "algemeen": ["algemeen"],
     "nek": ["nek", "cervicaal", "cwk"],
@@ -65,18 +102,21 @@ def _normalize_match_text(value):
 
 
 def _tokenize_terms(value):
-    normalized = _normalize_match_text(value)
-    if not normalized:
-        return []
     seen = []
-    for token in normalized.split(" "):
-        if len(token) < 3 or token in {"een", "het", "van", "met", "naar", "voor", "bij", "and", "the"}:
-            continue
+    for token in _match_tokens(value):
         if token not in seen:
             seen.append(token)
     return seen
 
 
+def _match_tokens(value):
+    """Return every indexable token of ``value`` in order, duplicates included."""
+    normalized = _normalize_match_text(value)
+    if not normalized:
+        return []
+    return [token for token in normalized.split(" ") if len(token) >= 3 and token not in MATCH_STOPWORDS]
+
+
 def _body_region_terms(value):
     safe = str(value or "").strip().lower()
     terms = list(BODY_REGION_TERMS.get(safe, []))
@@ -159,8 +199,11 @@ def score_index_record(query_vector, record, *, query_context=None):
     base_score = cosine_similarity(query_vector, payload.get("embedding", []))
     if not query_context:
         return float(base_score)
+    return float(base_score) + _score_record_bonus(payload, query_context)
 
-    title_blob = " ".join(
+
+def _record_title_blob(payload):
+    return " ".join(
         [
             str(payload.get("source_title", "") or ""),
             str(payload.get("source_name", "") or ""),
@@ -168,18 +211,31 @@ def score_index_record(query_vector, record, *, query_context=None):
             str(payload.get("page_label", "") or ""),
         ]
     )
+
+
+def _record_source_kind(payload):
+    return str(payload.get("source_kind", "") or "").strip().lower()
+
+
+def _score_record_bonus(record, query_context):
+    payload = record if isinstance(record, dict) else {}
+    if not query_context:
+        return 0.0
+    title_blob = _record_title_blob(payload)
     text_blob = str(payload.get("text", "") or "")
-    source_kind = str(payload.get("source_kind", "") or "").strip().lower()
+    return _bonus_from_hits(
+        is_guideline=_record_source_kind(payload) == "guidelines",
+        title_body_hits=_count_term_hits(title_blob, query_context.get("body_terms")),
+        title_focus_hits=_count_term_hits(title_blob, query_context.get("focus_terms")),
+        text_body_hits=_count_term_hits(text_blob, query_context.get("body_terms")),
+        text_complaint_hits=_count_term_hits(text_blob, query_context.get("complaint_terms")),
+    )
+
 
+def _bonus_from_hits(*, is_guideline, title_body_hits, title_focus_hits, text_body_hits, text_complaint_hits):
     bonus = 0.0
-    if source_kind == "guidelines":
+    if is_guideline:
         bonus += 0.08
-
-    title_body_hits = _count_term_hits(title_blob, query_context.get("body_terms"))
-    title_focus_hits = _count_term_hits(title_blob, query_context.get("focus_terms"))
-    text_body_hits = _count_term_hits(text_blob, query_context.get("body_terms"))
-    text_complaint_hits = _count_term_hits(text_blob, query_context.get("complaint_terms"))
-
     if title_body_hits:
         bonus += min(0.08, 0.05 + 0.015 * max(title_body_hits - 1, 0))
     if title_focus_hits:
@@ -188,7 +244,7 @@ def score_index_record(query_vector, record, *, query_context=None):
         bonus += min(0.04, 0.015 * text_body_hits)
     if text_complaint_hits:
         bonus += min(0.04, 0.012 * text_complaint_hits)
-    return float(base_score) + float(bonus)
+    return float(bonus)
 
 
 def _diversify_ranked_records(records, *, limit=5):
@@ -228,6 +284,18 @@ def resolve_embed_dimension(*, runtime=None, output_dimensionality=None):
     return DEFAULT_EMBED_DIMENSION
 
 
+def resolve_ann_nprobe(*, runtime=None):
+    """Return the configured IVF lists to probe, ``None`` for the index default, ``0`` for exact search."""
+    raw_value = getattr(runtime, "PHYSIO_ANN_NPROBE", None) if runtime is not None else None
+    if raw_value is None:
+        env = getattr(runtime, "os", os) if runtime is not None else os
+        raw_value = getattr(env, "getenv", os.getenv)("PHYSIO_ANN_NPROBE", "")
+    try:
+        return max(0, int(str(raw_value).strip()))
+    except (TypeError, ValueError):
+        return None
+
+
 def chunk_text(text, *, chunk_size=DEFAULT_CHUNK_SIZE, chunk_overlap=DEFAULT_CHUNK_OVERLAP):
     safe_text = str(text or "").strip()
     if not safe_text:
@@ -272,6 +340,65 @@ def list_supported_source_paths(*, source_root=None):
     return paths
 
 
+def source_content_hash(path: Path):
+    """Return the SHA-256 of a source file, cached per path, mtime and size."""
+    candidate = Path(path)
+    stat = candidate.stat()
+    cache_key = str(candidate.resolve())
+    marker = (stat.st_mtime_ns, stat.st_size)
+    with _SOURCE_HASH_LOCK:
+        cached = _SOURCE_HASH_CACHE.get(cache_key)
+        if cached is not None and cached[0] == marker:
+            return cached[1]
+    digest = hashlib.sha256()
+    with open(candidate, "rb") as handle:
+        for block in iter(lambda: handle.read(1024 * 1024), b""):
+            digest.update(block)
+    content_hash = digest.hexdigest()
+    with _SOURCE_HASH_LOCK:
+        _SOURCE_HASH_CACHE[cache_key] = (marker, content_hash)
+    return content_hash
+
+
+def source_fingerprint(content_hash, *, chunk_size, chunk_overlap, embed_model, embed_dimension):
+    """Fingerprint everything that determines a source's indexed chunks and embeddings."""
+    payload = json.dumps(
+        [str(content_hash or ""), int(chunk_size), int(chunk_overlap), str(embed_model or ""), int(embed_dimension)],
+        separators=(",", ":"),
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def _fingerprint_staleness(meta, on_disk_sources):
+    fingerprints = meta.get("source_fingerprints") or {}
+    chunk_size = _coerce_positive_int(meta.get("chunk_size")) or DEFAULT_CHUNK_SIZE
+    chunk_overlap = int(meta.get("chunk_overlap", DEFAULT_CHUNK_OVERLAP) or 0)
+    embed_model = str(meta.get("embedding_model", "") or DEFAULT_EMBED_MODEL)
+    embed_dimension = _coerce_positive_int(meta.get("embedding_dimension")) or DEFAULT_EMBED_DIMENSION
+    changed = []
+    new = []
+    for relative_path in on_disk_sources:
+        expected = fingerprints.get(relative_path)
+        if not expected:
+            new.append(relative_path)
+            continue
+        try:
+            actual = source_fingerprint(
+                source_content_hash(PROJECT_ROOT / relative_path),
+                chunk_size=chunk_size,
+                chunk_overlap=chunk_overlap,
+                embed_model=embed_model,
+                embed_dimension=embed_dimension,
+            )
+        except Exception:
+            actual = ""
+        if actual != expected:
+            changed.append(relative_path)
+    on_disk = set(on_disk_sources)
+    deleted = sorted(path for path in fingerprints if path not in on_disk)
+    return changed, new, deleted
+
+
 def build_chunk_records(text, *, source_name, source_path, source_kind="", page_label="", title="", chunk_size=DEFAULT_CHUNK_SIZE, chunk_overlap=DEFAULT_CHUNK_OVERLAP):
     records = []
     for index, chunk in enumerate(chunk_text(text, chunk_size=chunk_size, chunk_overlap=chunk_overlap)):
@@ -332,6 +459,10 @@ def _embed_config(types_module, task_type, *, output_dimensionality=None):
     return None
 
 
+def resolve_embed_model(*, runtime=None):
+    return str(getattr(runtime, "PHYSIO_EMBED_MODEL", DEFAULT_EMBED_MODEL) or DEFAULT_EMBED_MODEL)
+
+
 def embed_texts(texts, *, task_type="RETRIEVAL_DOCUMENT", runtime=None, output_dimensionality=None):
     resolved_runtime = _resolve_runtime(runtime)
     client = getattr(resolved_runtime, "client", None)
@@ -349,7 +480,7 @@ def embed_texts(texts, *, task_type="RETRIEVAL_DOCUMENT", runtime=None, output_d
         ),
     )
     response = client.models.embed_content(
-        model=str(getattr(resolved_runtime, "PHYSIO_EMBED_MODEL", DEFAULT_EMBED_MODEL) or DEFAULT_EMBED_MODEL),
+        model=resolve_embed_model(runtime=resolved_runtime),
         contents=safe_texts,
         config=config,
     )
@@ -371,6 +502,113 @@ def embed_text(text, *, task_type="RETRIEVAL_DOCUMENT", runtime=None, output_dim
     return vectors[0]
 
 
+def _query_embedding_cache_key(retrieval_query, *, model, dimension):
+    normalized = _normalize_match_text(retrieval_query)
+    return hashlib.sha256(f"{model}\n{dimension}\n{normalized}".encode("utf-8")).hexdigest()
+
+
+def _reset_query_embeddings_for_signature_locked(signature):
+    if _QUERY_EMBEDDING_CACHE["signature"] == signature:
+        return
+    if _QUERY_EMBEDDING_CACHE["entries"]:
+        _QUERY_EMBEDDING_STATS["invalidations"] += 1
+    _QUERY_EMBEDDING_CACHE["entries"].clear()
+    _QUERY_EMBEDDING_CACHE["signature"] = signature
+
+
+def _read_shared_query_embedding(db, cache_key, *, index_version, dimension, now):
+    try:
+        doc = physio_repo.get_physio_query_embedding_doc(db, cache_key)
+        payload = (doc.to_dict() or {}) if getattr(doc, "exists", False) else {}
+    except Exception:
+        return None
+    embedding = payload.get("embedding")
+    if not isinstance(embedding, list) or len(embedding) != dimension:
+        return None
+    if str(payload.get("index_version", "") or "") != index_version:
+        return None
+    if float(payload.get("expires_at", 0) or 0) <= now:
+        return None
+    return [float(item or 0.0) for item in embedding]
+
+
+def _write_shared_query_embedding(db, cache_key, vector, *, model, dimension, index_version, now):
+    try:
+        physio_repo.set_physio_query_embedding(
+            db,
+            cache_key,
+            {
+                "embedding": list(vector),
+                "model": model,
+                "dimension": dimension,
+                "index_version": index_version,
+                "created_at": now,
+                "expires_at": now + QUERY_EMBEDDING_CACHE_TTL_SECONDS,
+            },
+        )
+    except Exception:
+        # The shared tier is an optimization; a failed write only costs a later miss.
+        pass
+
+
+def embed_query_cached(retrieval_query, *, runtime=None, output_dimensionality=None, index_signature="", index_version=""):
+    """Embed a retrieval query through the in-process LRU and optional Firestore tier.
+
+    Keys combine the match-normalized query, the embedding model and the
+    dimension. The process tier is dropped whenever ``index_signature``
+    changes; shared entries only match the same ``index_version``. Both tiers
+    expire after ``QUERY_EMBEDDING_CACHE_TTL_SECONDS``.
+    """
+    resolved_runtime = _resolve_runtime(runtime)
+    model = resolve_embed_model(runtime=resolved_runtime)
+    dimension = resolve_embed_dimension(runtime=resolved_runtime, output_dimensionality=output_dimensionality)
+    cache_key = _query_embedding_cache_key(retrieval_query, model=model, dimension=dimension)
+    safe_signature = str(index_signature or "")
+    now = time.time()
+    entries = _QUERY_EMBEDDING_CACHE["entries"]
+    with _QUERY_EMBEDDING_LOCK:
+        _reset_query_embeddings_for_signature_locked(safe_signature)
+        cached = entries.get(cache_key)
+        if cached is not None and cached[0] > now:
+            entries.move_to_end(cache_key)
+            _QUERY_EMBEDDING_STATS["hits"] += 1
+            return list(cached[1])
+        entries.pop(cache_key, None)
+
+    db = getattr(resolved_runtime, "db", None)
+    shared_enabled = bool(getattr(resolved_runtime, "PHYSIO_QUERY_EMBED_SHARED_CACHE", False)) and db is not None
+    safe_version = str(index_version or "")
+    vector = None
+    if shared_enabled:
+        vector = _read_shared_query_embedding(db, cache_key, index_version=safe_version, dimension=dimension, now=now)
+    if vector is None:
+        vector = embed_text(
+            retrieval_query,
+            task_type="RETRIEVAL_QUERY",
+            runtime=resolved_runtime,
+            output_dimensionality=output_dimensionality,
+        )
+        if shared_enabled:
+            _write_shared_query_embedding(db, cache_key, vector, model=model, dimension=dimension, index_version=safe_version, now=now)
+        stat_key = "misses"
+    else:
+        stat_key = "shared_hits"
+
+    with _QUERY_EMBEDDING_LOCK:
+        _QUERY_EMBEDDING_STATS[stat_key] += 1
+        if _QUERY_EMBEDDING_CACHE["signature"] == safe_signature:
+            entries[cache_key] = (now + QUERY_EMBEDDING_CACHE_TTL_SECONDS, tuple(vector))
+            entries.move_to_end(cache_key)
+            while len(entries) > QUERY_EMBEDDING_CACHE_SIZE:
+                entries.popitem(last=False)
+    return list(vector)
+
+
+def query_embedding_cache_stats():
+    with _QUERY_EMBEDDING_LOCK:
+        return {**_QUERY_EMBEDDING_STATS, "entries": len(_QUERY_EMBEDDING_CACHE["entries"])}
+
+
 def load_knowledge_manifest(*, index_path=None):
     candidate = Path(index_path or PHYSIO_LIBRARY_INDEX_PATH)
     cache_key = str(candidate.resolve()) if candidate.exists() else str(candidate)
@@ -395,7 +633,7 @@ def _index_cache_signature(candidate: Path, payload: dict):
     except Exception:
         parts.append(str(candidate))
     shard_names = ((payload.get("meta", {}) or {}).get("document_shards") or [])
-    for name in shard_names:
+    for name in [*shard_names, *_vector_store_file_names(payload)]:
         shard_path = candidate.parent / str(name)
         try:
             stat = shard_path.stat()
@@ -430,6 +668,736 @@ def _load_sharded_documents(candidate: Path, payload: dict):
     return documents, errors
 
 
+def _vector_store_meta(payload):
+    store_meta = ((payload.get("meta", {}) or {}).get("vector_store") or {}) if isinstance(payload, dict) else {}
+    if not isinstance(store_meta, dict) or store_meta.get("format") != VECTOR_STORE_FORMAT:
+        return {}
+    return store_meta
+
+
+def _ann_index_meta(payload):
+    ann_meta = ((payload.get("meta", {}) or {}).get("ann_index") or {}) if isinstance(payload, dict) else {}
+    if not isinstance(ann_meta, dict) or ann_meta.get("format") != ANN_INDEX_FORMAT:
+        return {}
+    return ann_meta
+
+
+def _bm25_index_meta(payload):
+    bm25_meta = ((payload.get("meta", {}) or {}).get("bm25_index") or {}) if isinstance(payload, dict) else {}
+    if not isinstance(bm25_meta, dict) or bm25_meta.get("format") != BM25_INDEX_FORMAT:
+        return {}
+    return bm25_meta
+
+
+def _vector_store_file_names(payload):
+    store_meta = _vector_store_meta(payload)
+    ann_meta = _ann_index_meta(payload) if store_meta else {}
+    bm25_meta = _bm25_index_meta(payload) if store_meta else {}
+    names = [str(store_meta.get(key, "") or "").strip() for key in VECTOR_STORE_FILE_KEYS]
+    names.extend(str(ann_meta.get(key, "") or "").strip() for key in ANN_INDEX_FILE_KEYS)
+    names.extend(str(bm25_meta.get(key, "") or "").strip() for key in BM25_INDEX_FILE_KEYS)
+    return [name for name in names if name]
+
+
+def _map_readonly_file(path: Path):
+    with open(path, "rb") as handle:
+        return mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+
+
+def _fixed_length_vector(values, dimension):
+    safe_values = [float(item or 0.0) for item in (values or [])]
+    return (safe_values + [0.0] * dimension)[:dimension]
+
+
+def _ascii_terms(terms):
+    encoded = []
+    for term in terms or []:
+        try:
+            value = str(term or "").encode("ascii")
+        except UnicodeEncodeError:
+            # Match text is ASCII-folded, so a non-ASCII term can never hit.
+            continue
+        if value:
+            encoded.append(value)
+    return encoded
+
+
+def _count_segment_hits(find, terms, start, end):
+    count = 0
+    for term in terms:
+        if find(term, start, end) != -1:
+            count += 1
+    return count
+
+
+class KnowledgeVectorStore:
+    """Read-only view over the memory-mapped embedding matrix and record store.
+
+    Embeddings are contiguous float32 rows; their norms are computed once per
+    process so scoring is a single dot product per row. Record metadata and
+    text live in a separate file addressed by a uint64 offset table and are
+    decoded only for the rows a caller asks for. A lexical sidecar keeps each
+    record's match-normalized source kind, title and text so keyword bonuses
+    can be counted with ``mmap.find`` without decoding JSON.
+    """
+
+    def __init__(self, *, vectors_path, records_path, offsets_path, lexical_path, lexical_offsets_path, count, dimension):
+        self.count = int(count)
+        self.dimension = int(dimension)
+        self._vector_map = _map_readonly_file(vectors_path)
+        self._record_map = _map_readonly_file(records_path)
+        self._offset_map = _map_readonly_file(offsets_path)
+        self._lexical_map = _map_readonly_file(lexical_path)
+        self._lexical_offset_map = _map_readonly_file(lexical_offsets_path)
+        self.vectors = memoryview(self._vector_map).cast("f")
+        self.offsets = memoryview(self._offset_map).cast("Q")
+        self.lexical_offsets = memoryview(self._lexical_offset_map).cast("Q")
+        if len(self.vectors) != self.count * self.dimension:
+            raise RuntimeError("Vector file size does not match the manifest.")
+        if len(self.offsets) != self.count + 1 or self.offsets[-1] != len(self._record_map):
+            raise RuntimeError("Record offset table does not match the record store.")
+        if len(self.lexical_offsets) != 3 * self.count + 1 or self.lexical_offsets[-1] != len(self._lexical_map):
+            raise RuntimeError("Lexical offset table does not match the lexical store.")
+        self._norms = None
+        self._engine = None
+        self._engine_lock = threading.Lock()
+        self.ann_index = None
+        self.bm25_index = None
+
+    def __len__(self):
+        return self.count
+
+    def _rows(self):
+        dimension = self.dimension
+        for start in range(0, self.count * dimension, dimension):
+            yield self.vectors[start:start + dimension]
+
+    def vector(self, index):
+        start = int(index) * self.dimension
+        return self.vectors[start:start + self.dimension]
+
+    def record(self, index):
+        safe_index = int(index)
+        raw = self._record_map[self.offsets[safe_index]:self.offsets[safe_index + 1]]
+        payload = json.loads(raw.decode("utf-8"))
+        return payload if isinstance(payload, dict) else {}
+
+    @property
+    def norms(self):
+        if self._norms is None:
+            self._norms = [math.sqrt(sum(map(operator.mul, row, row))) for row in self._rows()]
+        return self._norms
+
+    def scoring_engine(self):
+        """Return the shared NumPy engine for this store, or None without NumPy."""
+        if np is None:
+            return None
+        with self._engine_lock:
+            if self._engine is None:
+                self._engine = KnowledgeScoringEngine(self)
+            return self._engine
+
+    def similarities(self, query_vector):
+        query = _fixed_length_vector(query_vector, self.dimension)
+        query_norm = math.sqrt(sum(item * item for item in query))
+        if query_norm <= 0:
+            return [0.0] * self.count
+        multiply = operator.mul
+        return [
+            sum(map(multiply, query, row)) / (query_norm * norm) if norm > 0 else 0.0
+            for row, norm in zip(self._rows(), self.norms)
+        ]
+
+    def bonuses(self, query_context):
+        """Return the ``_score_record_bonus`` value for every row."""
+        if not query_context:
+            return [0.0] * self.count
+        body_terms = _ascii_terms(query_context.get("body_terms"))
+        focus_terms = _ascii_terms(query_context.get("focus_terms"))
+        complaint_terms = _ascii_terms(query_context.get("complaint_terms"))
+        lexical = self._lexical_map
+        find = lexical.find
+        offsets = self.lexical_offsets.tolist()
+        bonuses = []
+        for base in range(0, 3 * self.count, 3):
+            kind_start, title_start, text_start, end = offsets[base:base + 4]
+            bonuses.append(
+                _bonus_from_hits(
+                    is_guideline=lexical[kind_start:title_start] == b"guidelines",
+                    title_body_hits=_count_segment_hits(find, body_terms, title_start, text_start),
+                    title_focus_hits=_count_segment_hits(find, focus_terms, title_start, text_start),
+                    text_body_hits=_count_segment_hits(find, body_terms, text_start, end),
+                    text_complaint_hits=_count_segment_hits(find, complaint_terms, text_start, end),
+                )
+            )
+        return bonuses
+
+
+class KnowledgeScoringEngine:
+    """Batched NumPy scoring over a ``KnowledgeVectorStore``.
+
+    Holds the L2-normalized embedding matrix, so the cosine similarity for
+    every chunk is one matrix-vector product. The guideline bonus is a
+    precomputed per-record array; body-region and complaint term hits are
+    per-record arrays computed once per term from the lexical sidecar and kept
+    in a bounded LRU, so repeated regions and complaints cost no text scans.
+    """
+
+    def __init__(self, store):
+        self.store = store
+        matrix = np.frombuffer(store._vector_map, dtype="<f4").reshape(store.count, store.dimension)
+        norms = np.linalg.norm(matrix, axis=1)
+        self.matrix = matrix / np.where(norms > 0, norms, 1.0).astype(np.float32)[:, None]
+        bounds = np.frombuffer(store._lexical_offset_map, dtype="<u8")
+        self._segment_bounds = {
+            "kind": (bounds[0:-1:3], bounds[1::3]),
+            "title": (bounds[1::3], bounds[2::3]),
+            "text": (bounds[2::3], bounds[3::3]),
+        }
+        kind_starts, kind_ends = self._segment_bounds["kind"]
+        lexical = store._lexical_map
+        self.guideline_bonus = np.array(
+            [0.08 if lexical[start:end] == b"guidelines" else 0.0 for start, end in zip(kind_starts.tolist(), kind_ends.tolist())],
+            dtype=np.float64,
+        )
+        self._term_hits = OrderedDict()
+        self._term_lock = threading.Lock()
+
+    def _hits_for_term(self, field, term):
+        key = (field, term)
+        with self._term_lock:
+            cached = self._term_hits.get(key)
+            if cached is not None:
+                self._term_hits.move_to_end(key)
+                return cached
+        find = self.store._lexical_map.find
+        starts, ends = self._segment_bounds[field]
+        hits = np.fromiter(
+            (find(term, start, end) != -1 for start, end in zip(starts.tolist(), ends.tolist())),
+            dtype=np.bool_,
+            count=self.store.count,
+        )
+        with self._term_lock:
+            self._term_hits[key] = hits
+            while len(self._term_hits) > SCORING_TERM_CACHE_SIZE:
+                self._term_hits.popitem(last=False)
+        return hits
+
+    def _hit_counts(self, field, terms, rows=None):
+        counts = np.zeros(self.store.count if rows is None else len(rows), dtype=np.int32)
+        for term in _ascii_terms(terms):
+            hits = self._hits_for_term(field, term)
+            counts += hits if rows is None else hits[rows]
+        return counts
+
+    def unit_query(self, query_vector):
+        query = np.asarray(_fixed_length_vector(query_vector, self.store.dimension), dtype=np.float32)
+        query_norm = float(np.linalg.norm(query))
+        if query_norm <= 0:
+            return None
+        return query / query_norm
+
+    def similarities(self, query_vector, rows=None):
+        query = self.unit_query(query_vector)
+        if query is None:
+            return np.zeros(self.store.count if rows is None else len(rows), dtype=np.float64)
+        matrix = self.matrix if rows is None else self.matrix[rows]
+        return (matrix @ query).astype(np.float64)
+
+    def bonuses(self, query_context, rows=None):
+        """Vectorized ``_bonus_from_hits`` for every row, or only for ``rows``."""
+        if not query_context:
+            return np.zeros(self.store.count if rows is None else len(rows), dtype=np.float64)
+        title_body_hits = self._hit_counts("title", query_context.get("body_terms"), rows)
+        title_focus_hits = self._hit_counts("title", query_context.get("focus_terms"), rows)
+        text_body_hits = self._hit_counts("text", query_context.get("body_terms"), rows)
+        text_complaint_hits = self._hit_counts("text", query_context.get("complaint_terms"), rows)
+        bonus = self.guideline_bonus.copy() if rows is None else self.guideline_bonus[rows]
+        bonus += np.where(title_body_hits > 0, np.minimum(0.08, 0.05 + 0.015 * np.maximum(title_body_hits - 1, 0)), 0.0)
+        bonus += np.where(title_focus_hits > 0, np.minimum(0.06, 0.02 + 0.01 * np.maximum(title_focus_hits - 1, 0)), 0.0)
+        bonus += np.where(text_body_hits > 0, np.minimum(0.04, 0.015 * text_body_hits), 0.0)
+        bonus += np.where(text_complaint_hits > 0, np.minimum(0.04, 0.012 * text_complaint_hits), 0.0)
+        return bonus
+
+    def ann_candidate_rows(self, query_vector, *, nprobe=None, min_rows=1):
+        """Return the sorted rows of the probed IVF lists, or None for exact search."""
+        ann_index = self.store.ann_index
+        if ann_index is None:
+            return None
+        safe_nprobe = ann_index.default_nprobe if nprobe is None else int(nprobe)
+        if safe_nprobe <= 0 or safe_nprobe >= ann_index.nlist:
+            return None
+        query = self.unit_query(query_vector)
+        if query is None:
+            return None
+        rows = ann_index.candidate_rows(query, nprobe=safe_nprobe)
+        # Too few candidates would starve source diversification; scan everything.
+        return rows if len(rows) >= min_rows else None
+
+    def top_matches(self, query_vector, *, limit, query_context=None, rows=None):
+        """Return ``(score, index)`` pairs for the best rows, ties broken by index.
+
+        ``rows`` restricts scoring to a sorted subset, e.g. IVF candidates.
+        """
+        scores = self.similarities(query_vector, rows) + self.bonuses(query_context, rows)
+        row_ids = np.arange(self.store.count) if rows is None else rows
+        size = len(row_ids)
+        if not size:
+            return []
+        safe_limit = min(max(1, int(limit)), size)
+        if safe_limit < size:
+            partition = np.argpartition(-scores, safe_limit - 1)[:safe_limit]
+            threshold = scores[partition].min()
+            above = np.flatnonzero(scores > threshold)
+            ties = np.flatnonzero(scores == threshold)[: safe_limit - len(above)]
+            chosen = np.concatenate([above, ties])
+        else:
+            chosen = np.arange(size)
+        ordered = chosen[np.lexsort((chosen, -scores[chosen]))]
+        return [(float(scores[index]), int(row_ids[index])) for index in ordered]
+
+
+class KnowledgeAnnIndex:
+    """Memory-mapped IVF-flat index over a ``KnowledgeVectorStore``.
+
+    Rows are grouped into inverted lists by their nearest spherical k-means
+    centroid. A query is compared with the centroids only and then scored
+    exactly against the rows of its ``nprobe`` closest lists, so per-query work
+    grows with ``nprobe * count / nlist`` instead of ``count``. Raising
+    ``nprobe`` trades latency for recall; probing every list is exact search.
+    """
+
+    def __init__(self, *, centroids_path, lists_path, list_offsets_path, nlist, count, dimension, nprobe=DEFAULT_ANN_NPROBE):
+        self.nlist = int(nlist)
+        self.default_nprobe = max(1, int(nprobe or DEFAULT_ANN_NPROBE))
+        self._centroid_map = _map_readonly_file(centroids_path)
+        self._list_map = _map_readonly_file(lists_path)
+        self._list_offset_map = _map_readonly_file(list_offsets_path)
+        self.centroids = np.frombuffer(self._centroid_map, dtype="<f4")
+        self.lists = np.frombuffer(self._list_map, dtype="<u4")
+        self.list_offsets = np.frombuffer(self._list_offset_map, dtype="<u8")
+        if len(self.centroids) != self.nlist * int(dimension):
+            raise RuntimeError("Centroid file size does not match the manifest.")
+        if len(self.lists) != int(count) or len(self.list_offsets) != self.nlist + 1 or int(self.list_offsets[-1]) != len(self.lists):
+            raise RuntimeError("Inverted list tables do not match the vector store.")
+        self.centroids = self.centroids.reshape(self.nlist, int(dimension))
+
+    def candidate_rows(self, unit_query, *, nprobe):
+        safe_nprobe = min(self.nlist, max(1, int(nprobe)))
+        closeness = self.centroids @ unit_query
+        if safe_nprobe < self.nlist:
+            probed = np.argpartition(-closeness, safe_nprobe - 1)[:safe_nprobe]
+        else:
+            probed = np.arange(self.nlist)
+        offsets = self.list_offsets
+        rows = np.concatenate([self.lists[int(offsets[index]):int(offsets[index + 1])] for index in probed.tolist()])
+        rows.sort()
+        return rows.astype(np.intp)
+
+
+class KnowledgeBm25Index:
+    """Memory-mapped BM25 inverted index over the rows of a ``KnowledgeVectorStore``.
+
+    The vocabulary maps every ``_match_tokens`` term to its slice of the
+    postings file and its document frequency; postings are ``(row, term
+    frequency)`` uint32 pairs sorted by row. A query reads only the postings of
+    its own terms, so keyword scoring grows with how common those terms are
+    rather than with the size of the corpus.
+    """
+
+    def __init__(self, *, vocabulary_path, postings_path, lengths_path, count, average_length, k1=BM25_K1, b=BM25_B):
+        self.count = int(count)
+        self.average_length = float(average_length or 0.0) or 1.0
+        self.k1 = float(BM25_K1 if k1 is None else k1)
+        self.b = float(BM25_B if b is None else b)
+        with open(vocabulary_path, "r", encoding="utf-8") as handle:
+            vocabulary = json.load(handle)
+        if not isinstance(vocabulary, dict):
+            raise RuntimeError("BM25 vocabulary is not a term table.")
+        self.vocabulary = vocabulary
+        self._postings_map = _map_readonly_file(postings_path)
+        self._lengths_map = _map_readonly_file(lengths_path)
+        self.postings = memoryview(self._postings_map).cast("I")
+        self.lengths = memoryview(self._lengths_map).cast("I")
+        if len(self.lengths) != self.count:
+            raise RuntimeError("Document length table does not match the vector store.")
+        if len(self.postings) != 2 * sum(int(entry[1]) for entry in vocabulary.values()):
+            raise RuntimeError("Postings file size does not match the vocabulary.")
+        self._length_norms = None
+
+    def length_norms(self):
+        """Per-row ``k1 * (1 - b + b * length / average_length)``, computed once."""
+        if self._length_norms is None:
+            base = self.k1 * (1.0 - self.b)
+            scale = self.k1 * self.b / self.average_length
+            if np is not None:
+                self._length_norms = base + scale * np.frombuffer(self._lengths_map, dtype="<u4").astype(np.float64)
+            else:
+                self._length_norms = [base + scale * length for length in self.lengths]
+        return self._length_norms
+
+    def idf(self, document_frequency):
+        return math.log(1.0 + (self.count - document_frequency + 0.5) / (document_frequency + 0.5))
+
+    def top_matches(self, query_text, *, limit):
+        """Return ``(bm25, row)`` pairs for the best rows, ties broken by row."""
+        terms = [term for term in _tokenize_terms(query_text) if term in self.vocabulary]
+        if not terms:
+            return []
+        safe_limit = max(1, int(limit))
+        norms = self.length_norms()
+        if np is not None:
+            postings = np.frombuffer(self._postings_map, dtype="<u4")
+            scores = np.zeros(self.count, dtype=np.float64)
+            for term in terms:
+                offset, frequency = self.vocabulary[term]
+                block = postings[2 * offset:2 * (offset + frequency)]
+                rows = block[0::2].astype(np.intp)
+                term_frequencies = block[1::2].astype(np.float64)
+                weight = self.idf(frequency) * (self.k1 + 1.0)
+                scores[rows] += weight * term_frequencies / (term_frequencies + norms[rows])
+            matched = np.flatnonzero(scores > 0)
+            ordered = matched[np.lexsort((matched, -scores[matched]))][:safe_limit]
+            return [(float(scores[row]), int(row)) for row in ordered]
+        postings = self.postings
+        scores = {}
+        for term in terms:
+            offset, frequency = self.vocabulary[term]
+            weight = self.idf(frequency) * (self.k1 + 1.0)
+            for position in range(2 * offset, 2 * (offset + frequency), 2):
+                row = postings[position]
+                term_frequency = postings[position + 1]
+                scores[row] = scores.get(row, 0.0) + weight * term_frequency / (term_frequency + norms[row])
+        return [
+            (score, -neg_row)
+            for score, neg_row in heapq.nlargest(safe_limit, ((score, -row) for row, score in scores.items()))
+        ]
+
+
+def _assign_ivf_lists(matrix, centroids):
+    assignments = np.empty(matrix.shape[0], dtype=np.int64)
+    closeness = np.empty(matrix.shape[0], dtype=np.float32)
+    for start in range(0, matrix.shape[0], ANN_BUILD_BLOCK_ROWS):
+        block = matrix[start:start + ANN_BUILD_BLOCK_ROWS] @ centroids.T
+        assignments[start:start + len(block)] = block.argmax(axis=1)
+        closeness[start:start + len(block)] = block.max(axis=1)
+    return assignments, closeness
+
+
+def build_ivf_lists(matrix, *, nlist, iterations=20, seed=0):
+    """Cluster L2-normalized rows with spherical k-means.
+
+    Returns ``(centroids, assignments)``; assignments always refer to the
+    returned centroids.
+    """
+    count = int(matrix.shape[0])
+    safe_nlist = min(max(1, int(nlist)), count)
+    rng = np.random.default_rng(seed)
+    centroids = matrix[np.sort(rng.choice(count, size=safe_nlist, replace=False))].astype(np.float32)
+    assignments, closeness = _assign_ivf_lists(matrix, centroids)
+    for _ in range(max(0, int(iterations))):
+        sums = np.zeros_like(centroids)
+        np.add.at(sums, assignments, matrix)
+        empty = np.flatnonzero(np.bincount(assignments, minlength=safe_nlist) == 0)
+        if len(empty):
+            # Reseed empty lists with the rows their centroids fit worst.
+            sums[empty] = matrix[np.argsort(closeness, kind="stable")[: len(empty)]]
+        norms = np.linalg.norm(sums, axis=1)
+        centroids = (sums / np.where(norms > 0, norms, 1.0)[:, None]).astype(np.float32)
+        next_assignments, closeness = _assign_ivf_lists(matrix, centroids)
+        converged = np.array_equal(next_assignments, assignments)
+        assignments = next_assignments
+        if converged:
+            break
+    return centroids, assignments
+
+
+def write_ann_index(index_path: Path, store_meta: dict, *, nlist=None, nprobe=DEFAULT_ANN_NPROBE, iterations=20, seed=0):
+    """Build the IVF-flat sidecar for a written vector store and return its manifest meta.
+
+    ``nlist=None`` sizes the index automatically and skips corpora smaller
+    than ``ANN_MIN_RECORDS``, where exact NumPy scoring is already fast.
+    Returns None when NumPy is unavailable or no index was written.
+    """
+    count = _coerce_positive_int((store_meta or {}).get("count"))
+    dimension = _coerce_positive_int((store_meta or {}).get("dimension"))
+    if np is None or count is None or dimension is None:
+        return None
+    if nlist is None:
+        if count < ANN_MIN_RECORDS:
+            return None
+        nlist = round(math.sqrt(count))
+    safe_nlist = min(max(1, int(nlist)), count)
+    matrix = np.fromfile(index_path.parent / str(store_meta.get("vectors", "")), dtype="<f4").reshape(count, dimension)
+    norms = np.linalg.norm(matrix, axis=1)
+    matrix = matrix / np.where(norms > 0, norms, 1.0).astype(np.float32)[:, None]
+    centroids, assignments = build_ivf_lists(matrix, nlist=safe_nlist, iterations=iterations, seed=seed)
+    list_offsets = np.concatenate([[0], np.cumsum(np.bincount(assignments, minlength=len(centroids)))])
+    names = {
+        "centroids": f"{index_path.stem}.ivf.centroids.f32",
+        "lists": f"{index_path.stem}.ivf.lists.u32",
+        "list_offsets": f"{index_path.stem}.ivf.lists.idx",
+    }
+    temp_paths = {key: index_path.parent / f".{name}.tmp" for key, name in names.items()}
+    temp_paths["centroids"].write_bytes(centroids.astype("<f4").tobytes())
+    temp_paths["lists"].write_bytes(np.argsort(assignments, kind="stable").astype("<u4").tobytes())
+    temp_paths["list_offsets"].write_bytes(list_offsets.astype("<u8").tobytes())
+    for key, name in names.items():
+        os.replace(temp_paths[key], index_path.parent / name)
+    return {
+        "format": ANN_INDEX_FORMAT,
+        **names,
+        "nlist": int(len(centroids)),
+        "nprobe": max(1, min(int(nprobe or DEFAULT_ANN_NPROBE), int(len(centroids)))),
+        "count": count,
+        "dimension": dimension,
+    }
+
+
+def measure_ann_recall(store, *, nprobe_values, k=10, sample_size=200, seed=0):
+    """Report IVF recall@k and latency against exact search for each ``nprobe``.
+
+    Queries blend two random stored vectors (70/30), so they fall between
+    topics rather than exactly on an indexed chunk.
+    """
+    engine = store.scoring_engine()
+    if engine is None or store.ann_index is None:
+        return {"k": int(k), "sample_size": 0, "exact_mean_ms": 0.0, "results": []}
+    rng = np.random.default_rng(seed)
+    safe_k = max(1, int(k))
+    sample = max(1, int(sample_size))
+    queries = (
+        0.7 * engine.matrix[rng.integers(0, store.count, sample)]
+        + 0.3 * engine.matrix[rng.integers(0, store.count, sample)]
+    ).tolist()
+    exact_ms = []
+    exact_ids = []
+    for query in queries:
+        started = time.perf_counter()
+        exact_ids.append({index for _score, index in engine.top_matches(query, limit=safe_k)})
+        exact_ms.append((time.perf_counter() - started) * 1000.0)
+    results = []
+    for nprobe in nprobe_values:
+        hits = 0
+        candidate_counts = []
+        latencies = []
+        for query, expected in zip(queries, exact_ids):
+            started = time.perf_counter()
+            rows = engine.ann_candidate_rows(query, nprobe=nprobe, min_rows=safe_k)
+            found = engine.top_matches(query, limit=safe_k, rows=rows)
+            latencies.append((time.perf_counter() - started) * 1000.0)
+            candidate_counts.append(store.count if rows is None else len(rows))
+            hits += len(expected.intersection(index for _score, index in found))
+        results.append(
+            {
+                "nprobe": int(nprobe),
+                "recall_at_k": round(hits / float(safe_k * sample), 4),
+                "mean_candidates": round(sum(candidate_counts) / float(sample), 1),
+                "mean_ms": round(sum(latencies) / float(sample), 3),
+            }
+        )
+    return {
+        "k": safe_k,
+        "sample_size": sample,
+        "exact_mean_ms": round(sum(exact_ms) / float(sample), 3),
+        "results": results,
+    }
+
+
+def _write_uint64_table(path: Path, values):
+    table = array("Q", values)
+    if sys.byteorder != "little":
+        table.byteswap()
+    path.write_bytes(table.tobytes())
+
+
+def write_vector_store(documents, index_path: Path, *, dimension):
+    """Write the mmap vector store next to ``index_path`` and return its manifest meta."""
+    safe_dimension = _coerce_positive_int(dimension) or DEFAULT_EMBED_DIMENSION
+    names = {
+        "vectors": f"{index_path.stem}.vectors.f32",
+        "records": f"{index_path.stem}.records.bin",
+        "offsets": f"{index_path.stem}.records.idx",
+        "lexical": f"{index_path.stem}.lexical.bin",
+        "lexical_offsets": f"{index_path.stem}.lexical.idx",
+    }
+    temp_paths = {key: index_path.parent / f".{name}.tmp" for key, name in names.items()}
+    offsets = [0]
+    lexical_offsets = [0]
+    count = 0
+    with (
+        open(temp_paths["vectors"], "wb") as vector_handle,
+        open(temp_paths["records"], "wb") as record_handle,
+        open(temp_paths["lexical"], "wb") as lexical_handle,
+    ):
+        for record in documents or []:
+            if not isinstance(record, dict):
+                continue
+            vector = array("f", _fixed_length_vector(record.get("embedding", []), safe_dimension))
+            if sys.byteorder != "little":
+                vector.byteswap()
+            vector_handle.write(vector.tobytes())
+            metadata = {key: value for key, value in record.items() if key != "embedding"}
+            record_handle.write(json.dumps(metadata, ensure_ascii=False, separators=(",", ":")).encode("utf-8"))
+            offsets.append(record_handle.tell())
+            for segment in (
+                _record_source_kind(record),
+                _normalize_match_text(_record_title_blob(record)),
+                _normalize_match_text(record.get("text", "")),
+            ):
+                lexical_handle.write(segment.encode("utf-8"))
+                lexical_offsets.append(lexical_handle.tell())
+            count += 1
+    _write_uint64_table(temp_paths["offsets"], offsets)
+    _write_uint64_table(temp_paths["lexical_offsets"], lexical_offsets)
+    for key, name in names.items():
+        # Replace instead of rewriting in place: running workers keep their
+        # existing mappings of the previous files.
+        os.replace(temp_paths[key], index_path.parent / name)
+    return {
+        "format": VECTOR_STORE_FORMAT,
+        **names,
+        "count": count,
+        "dimension": safe_dimension,
+    }
+
+
+def write_bm25_index(index_path: Path, store_meta: dict):
+    """Build the BM25 inverted index for a written vector store and return its manifest meta.
+
+    Terms are read back from the store's lexical sidecar, so postings always
+    point at the rows they were built from. Returns None for an empty store.
+    """
+    count = _coerce_positive_int((store_meta or {}).get("count"))
+    if count is None:
+        return None
+    index_dir = index_path.parent
+    lexical = (index_dir / str(store_meta.get("lexical", ""))).read_bytes()
+    bounds = array("Q")
+    bounds.frombytes((index_dir / str(store_meta.get("lexical_offsets", ""))).read_bytes())
+    if sys.byteorder != "little":
+        bounds.byteswap()
+    if len(bounds) != 3 * count + 1:
+        raise RuntimeError("Lexical offset table does not match the vector store.")
+    postings_by_term = {}
+    lengths = array("I")
+    for row in range(count):
+        title_start, text_start, end = bounds[3 * row + 1:3 * row + 4]
+        tokens = _match_tokens(lexical[title_start:text_start].decode("utf-8"))
+        tokens.extend(_match_tokens(lexical[text_start:end].decode("utf-8")))
+        lengths.append(len(tokens))
+        frequencies = {}
+        for token in tokens:
+            frequencies[token] = frequencies.get(token, 0) + 1
+        for token, frequency in frequencies.items():
+            postings_by_term.setdefault(token, []).extend((row, frequency))
+    if not postings_by_term:
+        return None
+    vocabulary = {}
+    postings = array("I")
+    for term in sorted(postings_by_term):
+        pairs = postings_by_term[term]
+        vocabulary[term] = [len(postings) // 2, len(pairs) // 2]
+        postings.extend(pairs)
+    if sys.byteorder != "little":
+        postings.byteswap()
+        lengths.byteswap()
+    names = {
+        "vocabulary": f"{index_path.stem}.bm25.terms.json",
+        "postings": f"{index_path.stem}.bm25.postings.u32",
+        "lengths": f"{index_path.stem}.bm25.lengths.u32",
+    }
+    temp_paths = {key: index_dir / f".{name}.tmp" for key, name in names.items()}
+    temp_paths["vocabulary"].write_text(json.dumps(vocabulary, ensure_ascii=False, separators=(",", ":")), encoding="utf-8")
+    temp_paths["postings"].write_bytes(postings.tobytes())
+    temp_paths["lengths"].write_bytes(lengths.tobytes())
+    for key, name in names.items():
+        os.replace(temp_paths[key], index_dir / name)
+    return {
+        "format": BM25_INDEX_FORMAT,
+        **names,
+        "count": count,
+        "terms": len(vocabulary),
+        "average_length": round(sum(lengths) / float(count), 4),
+        "k1": BM25_K1,
+        "b": BM25_B,
+    }
+
+
+def _open_ann_index(index_dir: Path, ann_meta, *, count, dimension):
+    if np is None or not ann_meta:
+        return None
+    nlist = _coerce_positive_int(ann_meta.get("nlist"))
+    if nlist is None or _coerce_positive_int(ann_meta.get("dimension")) != dimension:
+        return None
+    try:
+        return KnowledgeAnnIndex(
+            **{f"{key}_path": index_dir / str(ann_meta.get(key, "") or "") for key in ANN_INDEX_FILE_KEYS},
+            nlist=nlist,
+            count=count,
+            dimension=dimension,
+            nprobe=ann_meta.get("nprobe"),
+        )
+    except Exception:
+        # A damaged ANN sidecar only costs speed; exact search still works.
+        return None
+
+
+def _open_bm25_index(index_dir: Path, bm25_meta, *, count):
+    if not bm25_meta or _coerce_positive_int(bm25_meta.get("count")) != count:
+        return None
+    try:
+        return KnowledgeBm25Index(
+            **{f"{key}_path": index_dir / str(bm25_meta.get(key, "") or "") for key in BM25_INDEX_FILE_KEYS},
+            count=count,
+            average_length=bm25_meta.get("average_length"),
+            k1=bm25_meta.get("k1"),
+            b=bm25_meta.get("b"),
+        )
+    except Exception:
+        # Without postings retrieval falls back to vector scoring alone.
+        return None
+
+
+def open_vector_store(index_dir: Path, store_meta: dict, *, ann_meta=None, bm25_meta=None):
+    """Map a vector store (and optional IVF and BM25 sidecars) without touching the process cache."""
+    count = int(store_meta.get("count"))
+    dimension = int(store_meta.get("dimension"))
+    store = KnowledgeVectorStore(
+        **{f"{key}_path": index_dir / str(store_meta.get(key, "") or "") for key in VECTOR_STORE_FILE_KEYS},
+        count=count,
+        dimension=dimension,
+    )
+    store.ann_index = _open_ann_index(index_dir, ann_meta, count=count, dimension=dimension)
+    store.bm25_index = _open_bm25_index(index_dir, bm25_meta, count=count)
+    return store
+
+
+def load_vector_store(*, index_path=None, payload=None):
+    candidate = Path(index_path or PHYSIO_LIBRARY_INDEX_PATH)
+    manifest = payload if isinstance(payload, dict) else load_knowledge_manifest(index_path=candidate)
+    store_meta = _vector_store_meta(manifest)
+    count = _coerce_positive_int(store_meta.get("count"))
+    dimension = _coerce_positive_int(store_meta.get("dimension"))
+    if not store_meta or count is None or dimension is None or sys.byteorder != "little":
+        return None
+    signature = _index_cache_signature(candidate, manifest)
+    with _VECTOR_STORE_LOCK:
+        if _VECTOR_STORE_CACHE["store"] is not None and _VECTOR_STORE_CACHE["signature"] == signature:
+            return _VECTOR_STORE_CACHE["store"]
+        try:
+            store = open_vector_store(
+                candidate.parent,
+                store_meta,
+                ann_meta=_ann_index_meta(manifest),
+                bm25_meta=_bm25_index_meta(manifest),
+            )
+        except Exception:
+            return None
+        _VECTOR_STORE_CACHE.update({"signature": signature, "store": store})
+        return store
+
+
 def load_knowledge_index(*, index_path=None):
     candidate = Path(index_path or PHYSIO_LIBRARY_INDEX_PATH)
     cache_key = str(candidate.resolve()) if candidate.exists() else str(candidate)
@@ -441,7 +1409,15 @@ def load_knowledge_index(*, index_path=None):
     signature = _index_cache_signature(candidate, payload)
     if _INDEX_CACHE["payload"] is not None and _INDEX_CACHE["path"] == cache_key and _INDEX_CACHE.get("signature") == signature:
         return _INDEX_CACHE["payload"]
-    documents, shard_errors = _load_sharded_documents(candidate, payload)
+    store = load_vector_store(index_path=candidate, payload=payload)
+    if store is not None:
+        documents = [
+            {**store.record(index), "embedding": list(store.vector(index))}
+            for index in range(len(store))
+        ]
+        shard_errors = []
+    else:
+        documents, shard_errors = _load_sharded_documents(candidate, payload)
     payload["documents"] = documents
     payload.setdefault("errors", [])
     if shard_errors:
@@ -487,16 +1463,34 @@ def knowledge_index_status(*, index_path=None, source_root=None):
             continue
     latest_source_mtime = max(source_mtimes) if source_mtimes else 0.0
     missing_sources = [path for path in on_disk_sources if path not in indexed_sources]
+    ann_meta = _ann_index_meta(payload)
+    bm25_meta = _bm25_index_meta(payload)
+    if meta.get("source_fingerprints"):
+        changed_sources, new_sources, deleted_sources = _fingerprint_staleness(meta, on_disk_sources)
+        stale = bool(changed_sources or new_sources or deleted_sources)
+        staleness_basis = "fingerprint"
+    else:
+        changed_sources, new_sources, deleted_sources = [], [], []
+        stale = bool(manifest_mtime and latest_source_mtime and manifest_mtime < latest_source_mtime)
+        staleness_basis = "mtime"
     return {
         "index_path": str(candidate),
         "generated_at": float(meta.get("generated_at", 0) or 0),
         "manifest_mtime": manifest_mtime,
         "latest_source_mtime": latest_source_mtime,
-        "stale": bool(manifest_mtime and latest_source_mtime and manifest_mtime < latest_source_mtime),
+        "stale": stale,
+        "staleness_basis": staleness_basis,
+        "stale_source_count": len(changed_sources) + len(new_sources) + len(deleted_sources),
+        "changed_source_paths": changed_sources[:10],
+        "new_source_paths": new_sources[:10],
+        "deleted_source_paths": deleted_sources[:10],
         "source_count": int(meta.get("source_count", len(on_disk_sources)) or 0),
         "source_count_on_disk": len(on_disk_sources),
         "indexed_source_count": len(indexed_sources),
         "document_count": int(meta.get("document_count", len(payload.get("documents", []) or [])) or 0),
+        "vector_store_format": str(_vector_store_meta(payload).get("format", "") or ""),
+        "ann_index": {key: ann_meta[key] for key in ("format", "nlist", "nprobe", "recall_at_k") if key in ann_meta},
+        "bm25_index": {key: bm25_meta[key] for key in ("format", "terms", "average_length") if key in bm25_meta},
         "error_count": len(errors),
         "error_samples": errors[:5] if isinstance(errors, list) else [],
         "missing_source_paths": missing_sources[:10],
@@ -548,6 +1542,27 @@ def rank_index_documents(query_vector, documents, *, limit=5):
     return ranked[:safe_limit]
 
 
+def rank_scored_index_documents(query_vector, documents, *, limit=5, query_context=None):
+    candidate_limit = max(1, int(limit or 1)) * 6
+    top_matches = []
+    for index, record in enumerate(documents or []):
+        if not isinstance(record, dict):
+            continue
+        score = score_index_record(query_vector, record, query_context=query_context)
+        sortable = (float(score), -index, record)
+        if len(top_matches) < candidate_limit:
+            heapq.heappush(top_matches, sortable)
+            continue
+        if sortable > top_matches[0]:
+            heapq.heapreplace(top_matches, sortable)
+    ranked = []
+    for score, _neg_index, record in sorted(top_matches, reverse=True):
+        item = dict(record)
+        item["score"] = round(float(score), 6)
+        ranked.append(item)
+    return _diversify_ranked_records(ranked, limit=limit)
+
+
 def rank_sharded_index_documents(query_vector, payload, *, index_path=None, limit=5, query_context=None):
     candidate = Path(index_path or PHYSIO_LIBRARY_INDEX_PATH)
     safe_limit = max(1, int(limit or 1))
@@ -577,6 +1592,71 @@ def rank_sharded_index_documents(query_vector, payload, *, index_path=None, limi
     return _diversify_ranked_records(ranked, limit=safe_limit)
 
 
+def reciprocal_rank_fusion(rankings, *, k=RRF_K):
+    """Fuse ranked row lists into ``(score, row)`` pairs, ties broken by row."""
+    fused = {}
+    for ranking in rankings:
+        for rank, row in enumerate(ranking, start=1):
+            fused[row] = fused.get(row, 0.0) + 1.0 / (k + rank)
+    return sorted(((score, row) for row, score in fused.items()), key=lambda item: (-item[0], item[1]))
+
+
+def rank_vector_store_documents(query_vector, store, *, limit=5, query_context=None, nprobe=None, lexical_query=""):
+    """Rank store rows by vector score, fused with BM25 when the store has postings.
+
+    ``lexical_query`` is the text matched against the BM25 index; the vector
+    and keyword candidate lists are combined with reciprocal rank fusion.
+    Each item keeps its vector-plus-bonus ``score``.
+    """
+    safe_limit = max(1, int(limit or 1))
+    candidate_limit = max(safe_limit, safe_limit * 6)
+    engine = store.scoring_engine()
+    if engine is not None:
+        rows = engine.ann_candidate_rows(query_vector, nprobe=nprobe, min_rows=candidate_limit)
+        top_matches = engine.top_matches(query_vector, limit=candidate_limit, query_context=query_context, rows=rows)
+    else:
+        similarities = store.similarities(query_vector)
+        bonuses = store.bonuses(query_context)
+        top_matches = [
+            (score, -neg_index)
+            for score, neg_index in heapq.nlargest(
+                candidate_limit,
+                ((similarity + bonus, -index) for index, (similarity, bonus) in enumerate(zip(similarities, bonuses))),
+            )
+        ]
+    keyword_matches = []
+    if store.bm25_index is not None and lexical_query:
+        keyword_matches = store.bm25_index.top_matches(lexical_query, limit=candidate_limit)
+    if not keyword_matches:
+        ranked = []
+        for score, record_index in top_matches:
+            item = store.record(record_index)
+            item["score"] = round(float(score), 6)
+            ranked.append(item)
+        return _diversify_ranked_records(ranked, limit=safe_limit)
+
+    scores = {row: score for score, row in top_matches}
+    keyword_scores = {row: score for score, row in keyword_matches}
+    fused = reciprocal_rank_fusion(
+        [[row for _score, row in top_matches], [row for _score, row in keyword_matches]]
+    )[:candidate_limit]
+    missing = [row for _fused_score, row in fused if row not in scores]
+    if missing and engine is not None:
+        missing_rows = np.asarray(missing, dtype=np.intp)
+        missing_scores = engine.similarities(query_vector, missing_rows) + engine.bonuses(query_context, missing_rows)
+        scores.update(zip(missing, missing_scores.tolist()))
+    elif missing:
+        scores.update((row, similarities[row] + bonuses[row]) for row in missing)
+    ranked = []
+    for fused_score, record_index in fused:
+        item = store.record(record_index)
+        item["score"] = round(float(scores[record_index]), 6)
+        item["keyword_score"] = round(float(keyword_scores.get(record_index, 0.0)), 6)
+        item["fusion_score"] = round(float(fused_score), 6)
+        ranked.append(item)
+    return _diversify_ranked_records(ranked, limit=safe_limit)
+
+
 def query_knowledge_index(question, *, body_region="", context_text="", case_context=None, limit=5, runtime=None):
     resolved_runtime = _resolve_runtime(runtime)
     safe_question = str(question or "").strip()
@@ -609,33 +1689,27 @@ def query_knowledge_index(question, *, body_region="", context_text="", case_con
         context_text=context_text,
         case_context=case_context,
     )
-    query_vector = embed_text(
+    query_vector = embed_query_cached(
         retrieval_query,
-        task_type="RETRIEVAL_QUERY",
         runtime=resolved_runtime,
         output_dimensionality=embedding_dimension,
+        index_signature=_index_cache_signature(Path(PHYSIO_LIBRARY_INDEX_PATH), index_payload),
+        index_version=str(meta.get("generated_at", "") or ""),
     )
-    if shard_names:
+    vector_store = load_vector_store(payload=index_payload)
+    if vector_store is not None:
+        ranked = rank_vector_store_documents(
+            query_vector,
+            vector_store,
+            limit=limit,
+            query_context=query_context,
+            nprobe=resolve_ann_nprobe(runtime=resolved_runtime),
+            lexical_query=retrieval_query,
+        )
+    elif shard_names:
         ranked = rank_sharded_index_documents(query_vector, index_payload, limit=limit, query_context=query_context)
     else:
-        raw_ranked = []
-        candidate_limit = max(1, int(limit or 1)) * 6
-        top_matches = []
-        for index, record in enumerate(documents or []):
-            if not isinstance(record, dict):
-                continue
-            score = score_index_record(query_vector, record, query_context=query_context)
-            sortable = (float(score), -index, record)
-            if len(top_matches) < candidate_limit:
-                heapq.heappush(top_matches, sortable)
-                continue
-            if sortable > top_matches[0]:
-                heapq.heapreplace(top_matches, sortable)
-        for score, _neg_index, record in sorted(top_matches, reverse=True):
-            item = dict(record)
-            item["score"] = round(float(score), 6)
-            raw_ranked.append(item)
-        ranked = _diversify_ranked_records(raw_ranked, limit=limit)
+        ranked = rank_scored_index_documents(query_vector, documents, limit=limit, query_context=query_context)
     context_blocks = []
     citations = []
     for item in ranked:
@@ -22,6 +22,8 @@ def check_rate_limit(key, limit, window_seconds, runtime=None):
         in_memory_events=resolved_runtime.RATE_LIMIT_EVENTS,
         in_memory_lock=resolved_runtime.RATE_LIMIT_LOCK,
         time_module=resolved_runtime.time,
+        lease_percent=resolved_runtime.RATE_LIMIT_LEASE_PERCENT,
+        lease_state=resolved_runtime.RATE_LIMIT_LEASES,
     )
 
 
@@ -1,13 +1,15 @@
-from .store import delete_job, delete_runtime_job_snapshot, get_job_snapshot, load_runtime_job_snapshot, mutate_job, persist_runtime_job_snapshot, set_job, update_job_fields
+from .store import delete_job, delete_runtime_job_snapshot, flush_runtime_job_snapshot, get_job_snapshot, load_runtime_job_snapshot, mutate_job, persist_runtime_job_snapshot, queue_runtime_job_snapshot, set_job, update_job_fields
 from .recovery import acquire_runtime_job_recovery_lease, recover_stale_runtime_jobs, run_startup_recovery_once
 
 __all__ = [
     'delete_job',
     'delete_runtime_job_snapshot',
+    'flush_runtime_job_snapshot',
     'get_job_snapshot',
     'load_runtime_job_snapshot',
     'mutate_job',
     'persist_runtime_job_snapshot',
+    'queue_runtime_job_snapshot',
     'set_job',
     'update_job_fields',
     'acquire_runtime_job_recovery_lease',
@@ -10,6 +10,56 @@ def _resolve_runtime(runtime=None):
     return get_runtime()
 
 
+def _fail_interrupted_job(job_id, job_data, now_ts, *, message, runtime=None):
+    resolved_runtime = _resolve_runtime(runtime)
+    uid = str(job_data.get('user_id', '') or '').strip()
+    credit_type = str(job_data.get('credit_deducted', '') or '').strip()
+    # The receipt also records refunds whose flag never made it into the snapshot.
+    receipt_refunded = billing_receipts.get_billing_receipt_snapshot(job_data, runtime=resolved_runtime)['refunded']
+    main_refunded = min(1, int(receipt_refunded.get(credit_type, 0) or 0)) if credit_type else 0
+    already_refunded = bool(job_data.get('credit_refunded', False)) or main_refunded > 0
+    if uid and credit_type and (not already_refunded):
+        billing_credits.refund_credit(uid, credit_type, runtime=resolved_runtime)
+        billing_receipts.add_job_credit_refund(job_data, credit_type, 1, runtime=resolved_runtime)
+        job_data['credit_refunded'] = True
+
+    extra_spent = int(job_data.get('interview_features_cost', 0) or 0)
+    extra_refunded = max(
+        int(job_data.get('extra_slides_refunded', 0) or 0),
+        int(receipt_refunded.get('slides_credits', 0) or 0) - (main_refunded if credit_type == 'slides_credits' else 0),
+    )
+    extra_to_refund = max(0, extra_spent - extra_refunded)
+    if uid and extra_to_refund > 0:
+        billing_credits.refund_slides_credits(uid, extra_to_refund, runtime=resolved_runtime)
+        job_data['extra_slides_refunded'] = extra_refunded + extra_to_refund
+        billing_receipts.add_job_credit_refund(job_data, 'slides_credits', extra_to_refund, runtime=resolved_runtime)
+
+    billing_receipts.ensure_job_billing_receipt(
+        job_data,
+        {credit_type: 1} if credit_type else None,
+        runtime=resolved_runtime,
+    )
+    job_data['status'] = 'error'
+    job_data['step_description'] = 'Interrupted by server restart'
+    job_data['error'] = message
+    job_data['finished_at'] = now_ts
+    job_data['job_id'] = job_id
+    runtime_jobs_store.set_job(job_id, job_data, runtime=resolved_runtime)
+    resolved_runtime.save_job_log(job_id, job_data, now_ts)
+
+
+def fail_interrupted_runtime_job(job_id, *, message, runtime=None):
+    """Refund and fail one job whose worker died mid-run, unless it already finished."""
+    resolved_runtime = _resolve_runtime(runtime)
+    job_data = runtime_jobs_store.load_runtime_job_snapshot(job_id, runtime=resolved_runtime)
+    if not isinstance(job_data, dict):
+        return False
+    if str(job_data.get('status', '') or '').lower() not in {'starting', 'processing'}:
+        return False
+    _fail_interrupted_job(job_id, job_data, resolved_runtime.time.time(), message=message, runtime=resolved_runtime)
+    return True
+
+
 def recover_stale_runtime_jobs(runtime=None):
     resolved_runtime = _resolve_runtime(runtime)
     if resolved_runtime.db is None:
@@ -28,6 +78,7 @@ def recover_stale_runtime_jobs(runtime=None):
         resolved_runtime.logger.warning('Runtime-job recovery query failed', exc_info=True)
         return 0
 
+    durable_queue = getattr(resolved_runtime, 'DURABLE_JOB_QUEUE', None)
     for doc in stale_docs:
         job_id = doc.id
         job_data = doc.to_dict() or {}
@@ -36,34 +87,15 @@ def recover_stale_runtime_jobs(runtime=None):
         status = str(job_data.get('status', '') or '').lower()
         if status not in {'starting', 'processing'}:
             continue
-        uid = str(job_data.get('user_id', '') or '').strip()
-        credit_type = str(job_data.get('credit_deducted', '') or '').strip()
-        already_refunded = bool(job_data.get('credit_refunded', False))
-        if uid and credit_type and (not already_refunded):
-            billing_credits.refund_credit(uid, credit_type, runtime=resolved_runtime)
-            billing_receipts.add_job_credit_refund(job_data, credit_type, 1, runtime=resolved_runtime)
-            job_data['credit_refunded'] = True
-
-        extra_spent = int(job_data.get('interview_features_cost', 0) or 0)
-        extra_refunded = int(job_data.get('extra_slides_refunded', 0) or 0)
-        extra_to_refund = max(0, extra_spent - extra_refunded)
-        if uid and extra_to_refund > 0:
-            billing_credits.refund_slides_credits(uid, extra_to_refund, runtime=resolved_runtime)
-            job_data['extra_slides_refunded'] = extra_refunded + extra_to_refund
-            billing_receipts.add_job_credit_refund(job_data, 'slides_credits', extra_to_refund, runtime=resolved_runtime)
-
-        billing_receipts.ensure_job_billing_receipt(
+        if durable_queue is not None and durable_queue.is_pending(job_id):
+            continue
+        _fail_interrupted_job(
+            job_id,
             job_data,
-            {credit_type: 1} if credit_type else None,
+            now_ts,
+            message='Processing was interrupted by a server restart. Your credit has been refunded.',
             runtime=resolved_runtime,
         )
-        job_data['status'] = 'error'
-        job_data['step_description'] = 'Interrupted by server restart'
-        job_data['error'] = 'Processing was interrupted by a server restart. Your credit has been refunded.'
-        job_data['finished_at'] = now_ts
-        job_data['job_id'] = job_id
-        runtime_jobs_store.set_job(job_id, job_data, runtime=resolved_runtime)
-        resolved_runtime.save_job_log(job_id, job_data, now_ts)
         recovered += 1
 
     if recovered:
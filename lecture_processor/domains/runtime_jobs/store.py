@@ -1,3 +1,5 @@
+import threading
+
 from lecture_processor.runtime.container import get_runtime
 
 
@@ -26,15 +28,21 @@ def _runtime_job_sanitize_value(value, runtime=None):
     return value
 
 
-def _build_runtime_job_payload(job_id, job_data, runtime=None):
+def _build_runtime_job_fields(job_data, runtime=None):
     resolved_runtime = _resolve_runtime(runtime)
-    payload = {'job_id': job_id, 'updated_at': resolved_runtime.time.time()}
     if not isinstance(job_data, dict):
-        payload['status'] = 'unknown'
-        return payload
+        return {'status': 'unknown'}
+    fields = {}
     for field in resolved_runtime.RUNTIME_JOB_PERSISTED_FIELDS:
         if field in job_data:
-            payload[field] = _runtime_job_sanitize_value(job_data.get(field), runtime=resolved_runtime)
+            fields[field] = _runtime_job_sanitize_value(job_data.get(field), runtime=resolved_runtime)
+    return fields
+
+
+def _build_runtime_job_payload(job_id, job_data, runtime=None):
+    resolved_runtime = _resolve_runtime(runtime)
+    payload = {'job_id': job_id, 'updated_at': resolved_runtime.time.time()}
+    payload.update(_build_runtime_job_fields(job_data, runtime=resolved_runtime))
     return payload
 
 
@@ -54,6 +62,65 @@ def persist_runtime_job_snapshot(job_id, job_data, runtime=None):
         resolved_runtime.logger.warning('Failed to persist runtime job snapshot for %s', job_id, exc_info=True)
 
 
+def _write_runtime_job_fields(job_id, fields, runtime=None):
+    resolved_runtime = _resolve_runtime(runtime)
+    payload = {'job_id': job_id, 'updated_at': resolved_runtime.time.time()}
+    payload.update(fields)
+    try:
+        resolved_runtime.runtime_jobs_repo.set_doc(
+            resolved_runtime.db,
+            resolved_runtime.RUNTIME_JOBS_COLLECTION,
+            job_id,
+            payload,
+            merge=True,
+        )
+        return True
+    except Exception:
+        resolved_runtime.logger.warning('Failed to persist runtime job snapshot for %s', job_id, exc_info=True)
+        return False
+
+
+def _schedule_runtime_job_flush(job_id, delay, runtime):
+    timer = threading.Timer(delay, flush_runtime_job_snapshot, args=(job_id,), kwargs={'runtime': runtime})
+    timer.daemon = True
+    timer.start()
+
+
+def queue_runtime_job_snapshot(job_id, job_data, runtime=None):
+    """Write the fields that changed since the last write, coalescing bursts.
+
+    Changes inside the debounce window are held back and written together by a
+    deferred flush; terminal statuses are written immediately. Without a write-behind
+    buffer on the runtime this falls back to a full snapshot write.
+    """
+    resolved_runtime = _resolve_runtime(runtime)
+    if not _runtime_job_storage_enabled(runtime=resolved_runtime) or not job_id:
+        return
+    snapshots = getattr(resolved_runtime, 'RUNTIME_JOB_SNAPSHOTS', None)
+    if snapshots is None:
+        persist_runtime_job_snapshot(job_id, job_data, runtime=resolved_runtime)
+        return
+    fields = _build_runtime_job_fields(job_data, runtime=resolved_runtime)
+    with snapshots.write_lock(job_id):
+        changed, flush_delay = snapshots.stage(job_id, fields)
+        if changed and not _write_runtime_job_fields(job_id, changed, runtime=resolved_runtime):
+            snapshots.invalidate(job_id)
+    if flush_delay is not None:
+        _schedule_runtime_job_flush(job_id, flush_delay, resolved_runtime)
+
+
+def flush_runtime_job_snapshot(job_id, runtime=None):
+    """Write any fields still held back for ``job_id``."""
+    resolved_runtime = _resolve_runtime(runtime)
+    snapshots = getattr(resolved_runtime, 'RUNTIME_JOB_SNAPSHOTS', None)
+    if snapshots is None or not _runtime_job_storage_enabled(runtime=resolved_runtime) or not job_id:
+        return
+    with snapshots.write_lock(job_id):
+        pending = snapshots.take(job_id)
+        if pending and not _write_runtime_job_fields(job_id, pending, runtime=resolved_runtime):
+            snapshots.invalidate(job_id)
+
+
 def load_runtime_job_snapshot(job_id, runtime=None):
     resolved_runtime = _resolve_runtime(runtime)
     if not _runtime_job_storage_enabled(runtime=resolved_runtime) or not job_id:
@@ -90,6 +157,12 @@ def delete_runtime_job_snapshot(job_id, runtime=None):
         resolved_runtime.logger.warning('Failed to delete runtime job snapshot for %s', job_id, exc_info=True)
 
 
+def _notify_job_changed(job_id, runtime):
+    notifier = getattr(runtime, 'JOB_STATUS_NOTIFIER', None)
+    if notifier is not None:
+        notifier.notify(job_id)
+
+
 def update_job_fields(job_id, runtime=None, **fields):
     resolved_runtime = _resolve_runtime(runtime)
     if not fields:
@@ -111,6 +184,9 @@ def get_job_snapshot(job_id, runtime=None):
     if snapshot is not None:
         return snapshot
     runtime_snapshot = load_runtime_job_snapshot(job_id, runtime=resolved_runtime)
+    if runtime_snapshot is not None and getattr(resolved_runtime, 'RUNTIME_JOBS_REMOTE', False):
+        # A worker process owns this job; caching it here would freeze its status.
+        return runtime_snapshot
     if runtime_snapshot is not None:
         resolved_runtime.job_state_service.set_job(
             job_id,
@@ -131,7 +207,8 @@ def mutate_job(job_id, mutator_fn, runtime=None):
         lock=resolved_runtime.JOBS_LOCK,
     )
     if snapshot is not None:
-        persist_runtime_job_snapshot(job_id, snapshot, runtime=resolved_runtime)
+        _notify_job_changed(job_id, resolved_runtime)
+        queue_runtime_job_snapshot(job_id, snapshot, runtime=resolved_runtime)
     return snapshot
 
 
@@ -144,10 +221,25 @@ def set_job(job_id, value, runtime=None):
         lock=resolved_runtime.JOBS_LOCK,
     )
     if isinstance(snapshot, dict):
-        persist_runtime_job_snapshot(job_id, snapshot, runtime=resolved_runtime)
+        _notify_job_changed(job_id, resolved_runtime)
+        queue_runtime_job_snapshot(job_id, snapshot, runtime=resolved_runtime)
     return snapshot
 
 
+def release_job(job_id, runtime=None):
+    """Drop this process's copy of a job handed to a worker; its snapshot document stays."""
+    resolved_runtime = _resolve_runtime(runtime)
+    released = resolved_runtime.job_state_service.delete_job(
+        job_id,
+        jobs_store=resolved_runtime.jobs,
+        lock=resolved_runtime.JOBS_LOCK,
+    )
+    snapshots = getattr(resolved_runtime, 'RUNTIME_JOB_SNAPSHOTS', None)
+    if snapshots is not None:
+        snapshots.forget(job_id)
+    return released
+
+
 def delete_job(job_id, runtime=None):
     resolved_runtime = _resolve_runtime(runtime)
     deleted = resolved_runtime.job_state_service.delete_job(
@@ -155,5 +247,9 @@ def delete_job(job_id, runtime=None):
         jobs_store=resolved_runtime.jobs,
         lock=resolved_runtime.JOBS_LOCK,
     )
+    snapshots = getattr(resolved_runtime, 'RUNTIME_JOB_SNAPSHOTS', None)
+    if snapshots is not None:
+        snapshots.forget(job_id)
     delete_runtime_job_snapshot(job_id, runtime=resolved_runtime)
+    _notify_job_changed(job_id, resolved_runtime)
     return deleted
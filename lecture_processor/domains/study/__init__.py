@@ -1,6 +1,6 @@
 from .audio import ensure_pack_audio_storage_key, get_audio_storage_key_from_pack, get_audio_storage_path_from_pack, infer_audio_storage_key_from_path, normalize_audio_storage_key, persist_audio_for_study_pack, remove_pack_audio_file, resolve_audio_storage_path_from_key
 from .export import append_notes_markdown_to_story, build_annotated_notes_pdf, build_study_pack_pdf, markdown_inline_to_pdf_html, markdown_to_docx, normalize_exam_date
-from .progress import compute_study_progress_summary, count_due_cards_in_state, merge_card_state_maps, merge_streak_data, merge_timezone_value, sanitize_card_state_map, sanitize_daily_goal_value, sanitize_streak_data, sanitize_timezone_name
+from .progress import compute_study_progress_summary, count_due_cards_in_histogram, count_due_cards_in_state, due_histogram_updates, merge_card_state_maps, merge_streak_data, merge_timezone_value, sanitize_card_state_map, sanitize_daily_goal_value, sanitize_streak_data, sanitize_timezone_name
 
 __all__ = [
     'ensure_pack_audio_storage_key',
@@ -18,7 +18,9 @@ __all__ = [
     'markdown_to_docx',
     'normalize_exam_date',
     'compute_study_progress_summary',
+    'count_due_cards_in_histogram',
     'count_due_cards_in_state',
+    'due_histogram_updates',
     'merge_card_state_maps',
     'merge_streak_data',
     'merge_timezone_value',
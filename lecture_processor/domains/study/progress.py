@@ -599,7 +599,113 @@ def count_due_cards_in_state(state, today_local, runtime=None):
     return due
 
 
+def build_due_histogram_entry(pack_id, state, runtime=None):
+    resolved_runtime = _resolve_runtime(runtime)
+    undated = 0
+    dates = {}
+    for card_id, entry in (state or {}).items():
+        if not str(card_id).startswith('fc_'):
+            continue
+        if not card_entry_has_interaction(entry, runtime=resolved_runtime):
+            continue
+        next_date = str((entry or {}).get('next_review_date', '') or '').strip()
+        if next_date:
+            dates[next_date] = dates.get(next_date, 0) + 1
+        else:
+            undated += 1
+    return {'pack_id': pack_id, 'undated': undated, 'dates': dates}
+
+
+def _encode_due_histogram_entry(entry):
+    # Dates are a list so a merged ``set`` replaces them instead of deep-merging stale dates back in.
+    return {
+        'undated': entry['undated'],
+        'dates': [{'date': date_value, 'count': count} for date_value, count in sorted(entry['dates'].items())],
+    }
+
+
+def sanitize_due_histogram(payload, runtime=None):
+    """Return the stored per-pack due-date histogram as entries, or None when it was never built."""
+    resolved_runtime = _resolve_runtime(runtime)
+    if not isinstance(payload, dict):
+        return None
+    cleaned = []
+    for raw_pack_id, raw_entry in sorted(payload.items()):
+        pack_id = sanitize_pack_id(raw_pack_id, runtime=resolved_runtime)
+        if not pack_id or not isinstance(raw_entry, dict):
+            continue
+        dates = {}
+        raw_dates = raw_entry.get('dates', [])
+        for raw_date in (raw_dates if isinstance(raw_dates, list) else []):
+            if not isinstance(raw_date, dict):
+                continue
+            # Keep any non-empty date: count_due_cards_in_state compares raw dates too.
+            date_value = str(raw_date.get('date', '') or '').strip()
+            count = sanitize_int(raw_date.get('count', 0), default=0, min_value=0, max_value=100000, runtime=resolved_runtime)
+            if date_value and count:
+                dates[date_value] = dates.get(date_value, 0) + count
+        cleaned.append({
+            'pack_id': pack_id,
+            'undated': sanitize_int(raw_entry.get('undated', 0), default=0, min_value=0, max_value=100000, runtime=resolved_runtime),
+            'dates': dates,
+        })
+    return cleaned
+
+
+def encode_due_histogram(entries, runtime=None):
+    """Stored histogram (pack id -> entry) built from a full card-state scan."""
+    _ = runtime
+    return {
+        entry['pack_id']: _encode_due_histogram_entry(entry)
+        for entry in entries or ()
+        if entry['undated'] or entry['dates']
+    }
+
+
+def due_histogram_updates(updated_entries, removed_pack_ids=(), runtime=None):
+    """Per-pack changes to write with ``set({'due_histogram': ...}, merge=True)``.
+
+    The histogram is a map keyed by pack id, so a sync only writes the packs it
+    touched and overlapping syncs for other packs keep their entries. Removed
+    and emptied packs are deleted.
+    """
+    resolved_runtime = _resolve_runtime(runtime)
+    delete_field = resolved_runtime.firestore.DELETE_FIELD
+    updates = {pack_id: delete_field for pack_id in removed_pack_ids or ()}
+    for entry in updated_entries or ():
+        has_cards = entry['undated'] or entry['dates']
+        updates[entry['pack_id']] = _encode_due_histogram_entry(entry) if has_cards else delete_field
+    return updates
+
+
+def remove_pack_from_due_histogram(progress_ref, pack_id, runtime=None):
+    resolved_runtime = _resolve_runtime(runtime)
+    snapshot = progress_ref.get()
+    progress_data = (snapshot.to_dict() or {}) if snapshot.exists else {}
+    if not isinstance(progress_data.get('due_histogram'), dict):
+        return False
+    progress_ref.set(
+        {'due_histogram': due_histogram_updates([], [pack_id], runtime=resolved_runtime)},
+        merge=True,
+    )
+    return True
+
+
+def count_due_cards_in_histogram(histogram, today_local, runtime=None):
+    resolved_runtime = _resolve_runtime(runtime)
+    due = 0
+    for entry in sanitize_due_histogram(histogram, runtime=resolved_runtime) or []:
+        due += entry['undated']
+        due += sum(count for date_value, count in entry['dates'].items() if date_value <= today_local)
+    return due
+
+
 def compute_study_progress_summary(progress_data, card_state_maps, base_now=None, runtime=None):
+    """Summarize streak, goal and due cards for the user's local day.
+
+    Pass ``card_state_maps=None`` to count due cards from the progress doc's
+    ``due_histogram`` instead of scanning card states.
+    """
     resolved_runtime = _resolve_runtime(runtime)
     progress = progress_data or {}
     streak_data = sanitize_streak_data(progress.get('streak_data', {}), runtime=resolved_runtime)
@@ -621,9 +727,12 @@ def compute_study_progress_summary(progress_data, card_state_maps, base_now=None
     if streak_data.get('daily_progress_date') == today_local:
         today_progress = sanitize_int(streak_data.get('daily_progress_count', 0), default=0, min_value=0, max_value=100000, runtime=resolved_runtime)
 
-    due_today = 0
-    for raw_state in card_state_maps or []:
-        due_today += count_due_cards_in_state(sanitize_card_state_map(raw_state, runtime=resolved_runtime), today_local, runtime=resolved_runtime)
+    if card_state_maps is None:
+        due_today = count_due_cards_in_histogram(progress.get('due_histogram'), today_local, runtime=resolved_runtime)
+    else:
+        due_today = 0
+        for raw_state in card_state_maps:
+            due_today += count_due_cards_in_state(sanitize_card_state_map(raw_state, runtime=resolved_runtime), today_local, runtime=resolved_runtime)
 
     return {
         'daily_goal': daily_goal,
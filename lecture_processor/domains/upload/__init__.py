@@ -1,8 +1,16 @@
+from .chunked_upload import abort_upload_session, append_upload_chunk, cleanup_expired_upload_sessions, complete_upload_session, count_upload_sessions_for_user, create_upload_session, get_upload_session
 from .import_audio import cleanup_expired_audio_import_tokens, get_audio_import_token_path, register_audio_import_token, release_audio_import_token, validate_video_import_url
 
 __all__ = [
+    'abort_upload_session',
+    'append_upload_chunk',
     'cleanup_expired_audio_import_tokens',
+    'cleanup_expired_upload_sessions',
+    'complete_upload_session',
+    'count_upload_sessions_for_user',
+    'create_upload_session',
     'get_audio_import_token_path',
+    'get_upload_session',
     'register_audio_import_token',
     'release_audio_import_token',
     'validate_video_import_url',
@@ -0,0 +1,262 @@
+"""Resumable chunked audio uploads.
+
+A session reserves its total size up front; chunks are appended to a ``.part``
+file at the session's current offset while a running SHA-256 is kept, and the
+first bytes are checked for an audio signature before the rest is accepted.
+A completed session becomes an audio import token that ``/upload`` consumes.
+"""
+
+import hashlib
+import os
+import uuid
+
+from lecture_processor.domains.rate_limit import quotas as rate_limit_quotas
+from lecture_processor.domains.upload import import_audio as upload_import_audio
+from lecture_processor.runtime.container import get_runtime
+
+SIGNATURE_PROBE_BYTES = 16
+STREAM_READ_BYTES = 1024 * 1024
+
+
+def _resolve_runtime(runtime=None):
+    if runtime is not None:
+        return runtime
+    return get_runtime()
+
+
+def _public_session(session):
+    return {
+        'upload_id': session['upload_id'],
+        'file_name': session['file_name'],
+        'offset': int(session['offset']),
+        'total_bytes': int(session['total_bytes']),
+        'complete': int(session['offset']) >= int(session['total_bytes']),
+        'chunk_max_bytes': int(session['chunk_max_bytes']),
+        'expires_at': float(session['updated_at']) + float(session['ttl_seconds']),
+    }
+
+
+def _normalize_sha256(value):
+    digest = str(value or '').strip().lower()
+    if len(digest) != 64 or any(char not in '0123456789abcdef' for char in digest):
+        return ''
+    return digest
+
+
+def _discard_session(resolved_runtime, session):
+    path = session.get('path', '')
+    try:
+        if path and os.path.exists(path):
+            os.remove(path)
+    except Exception:
+        resolved_runtime.logger.warning('Could not remove partial upload %s', path, exc_info=True)
+    reserved = int(session.get('reserved_bytes', 0) or 0)
+    if reserved > 0:
+        rate_limit_quotas.release_daily_upload_bytes(session.get('uid', ''), reserved, runtime=resolved_runtime)
+
+
+def cleanup_expired_upload_sessions(runtime=None):
+    resolved_runtime = _resolve_runtime(runtime)
+    now_ts = resolved_runtime.time.time()
+    expired = []
+    with resolved_runtime.UPLOAD_SESSIONS_LOCK:
+        for upload_id, session in list(resolved_runtime.UPLOAD_SESSIONS.items()):
+            if session.get('busy'):
+                continue
+            if now_ts - float(session.get('updated_at', 0) or 0) > float(session.get('ttl_seconds', 0) or 0):
+                expired.append(resolved_runtime.UPLOAD_SESSIONS.pop(upload_id))
+    for session in expired:
+        _discard_session(resolved_runtime, session)
+    return len(expired)
+
+
+def count_upload_sessions_for_user(uid, runtime=None):
+    resolved_runtime = _resolve_runtime(runtime)
+    safe_uid = str(uid or '')
+    with resolved_runtime.UPLOAD_SESSIONS_LOCK:
+        return sum(1 for session in resolved_runtime.UPLOAD_SESSIONS.values() if session.get('uid') == safe_uid)
+
+
+def create_upload_session(uid, file_name, total_bytes, *, reserved_bytes=0, sha256='', runtime=None):
+    """Open an empty ``.part`` file for ``total_bytes`` and return the public session dict."""
+    resolved_runtime = _resolve_runtime(runtime)
+    upload_id = uuid.uuid4().hex
+    safe_name = resolved_runtime.secure_filename(str(file_name or '')) or 'audio'
+    path = os.path.join(resolved_runtime.UPLOAD_FOLDER, f'chunked_{upload_id}_{safe_name}.part')
+    with open(path, 'wb'):
+        pass
+    now_ts = resolved_runtime.time.time()
+    session = {
+        'upload_id': upload_id,
+        'uid': str(uid or ''),
+        'path': path,
+        'file_name': str(file_name or '')[:240],
+        'total_bytes': int(total_bytes),
+        'offset': 0,
+        'sha256_expected': _normalize_sha256(sha256),
+        'hasher': hashlib.sha256(),
+        'reserved_bytes': max(0, int(reserved_bytes or 0)),
+        'signature_checked': False,
+        'busy': False,
+        'chunk_max_bytes': int(resolved_runtime.UPLOAD_CHUNK_MAX_BYTES),
+        'ttl_seconds': int(resolved_runtime.UPLOAD_SESSION_TTL_SECONDS),
+        'created_at': now_ts,
+        'updated_at': now_ts,
+    }
+    with resolved_runtime.UPLOAD_SESSIONS_LOCK:
+        resolved_runtime.UPLOAD_SESSIONS[upload_id] = session
+    return _public_session(session)
+
+
+def _get_owned_session(resolved_runtime, uid, upload_id):
+    session = resolved_runtime.UPLOAD_SESSIONS.get(str(upload_id or '').strip())
+    if not session or session.get('uid') != str(uid or ''):
+        return None
+    return session
+
+
+def get_upload_session(uid, upload_id, runtime=None):
+    resolved_runtime = _resolve_runtime(runtime)
+    with resolved_runtime.UPLOAD_SESSIONS_LOCK:
+        session = _get_owned_session(resolved_runtime, uid, upload_id)
+        return _public_session(session) if session else None
+
+
+def abort_upload_session(uid, upload_id, runtime=None):
+    resolved_runtime = _resolve_runtime(runtime)
+    with resolved_runtime.UPLOAD_SESSIONS_LOCK:
+        session = _get_owned_session(resolved_runtime, uid, upload_id)
+        if session is None or session.get('busy'):
+            return False
+        resolved_runtime.UPLOAD_SESSIONS.pop(session['upload_id'], None)
+    _discard_session(resolved_runtime, session)
+    return True
+
+
+def _abort_claimed_session(resolved_runtime, session):
+    with resolved_runtime.UPLOAD_SESSIONS_LOCK:
+        resolved_runtime.UPLOAD_SESSIONS.pop(session['upload_id'], None)
+    _discard_session(resolved_runtime, session)
+
+
+def _release_claim(resolved_runtime, session, **updates):
+    with resolved_runtime.UPLOAD_SESSIONS_LOCK:
+        session.update(updates)
+        session['busy'] = False
+        session['updated_at'] = resolved_runtime.time.time()
+
+
+def append_upload_chunk(uid, upload_id, offset, stream, *, chunk_sha256='', runtime=None):
+    """Append one chunk read from ``stream`` at ``offset``.
+
+    Returns ``(session, error, status_code)``. A chunk at the wrong offset is
+    rejected with 409 and the current offset, and a chunk that fails (client
+    disconnect, size or checksum mismatch) is truncated away so the client can
+    resend it from the same offset.
+    """
+    resolved_runtime = _resolve_runtime(runtime)
+    try:
+        requested_offset = int(offset)
+    except (TypeError, ValueError):
+        return (None, 'Chunk offset is required.', 400)
+    with resolved_runtime.UPLOAD_SESSIONS_LOCK:
+        session = _get_owned_session(resolved_runtime, uid, upload_id)
+        if session is None:
+            return (None, 'Upload session expired or not found. Please start the upload again.', 404)
+        if session['busy']:
+            return (_public_session(session), 'Another chunk for this upload is still being written.', 409)
+        if requested_offset != session['offset']:
+            return (_public_session(session), 'Chunk offset does not match the uploaded size.', 409)
+        session['busy'] = True
+        start = session['offset']
+        remaining = session['total_bytes'] - start
+        limit = min(session['chunk_max_bytes'], remaining)
+        hasher = session['hasher'].copy()
+
+    chunk_hasher = hashlib.sha256()
+    written = 0
+    error = ''
+    status_code = 400
+    try:
+        with open(session['path'], 'r+b') as handle:
+            handle.seek(start)
+            while True:
+                block = stream.read(min(STREAM_READ_BYTES, limit - written + 1))
+                if not block:
+                    break
+                written += len(block)
+                if written > limit:
+                    error = 'Chunk exceeds the allowed size for this upload.'
+                    status_code = 413
+                    break
+                handle.write(block)
+                hasher.update(block)
+                chunk_hasher.update(block)
+            expected_chunk = _normalize_sha256(chunk_sha256)
+            if not error and written <= 0:
+                error = 'Upload chunk was empty.'
+            if not error and expected_chunk and chunk_hasher.hexdigest() != expected_chunk:
+                error = 'Chunk checksum mismatch. Please resend this chunk.'
+            if error:
+                handle.truncate(start)
+    except Exception:
+        resolved_runtime.logger.warning('Chunk write failed for upload %s', session['upload_id'], exc_info=True)
+        try:
+            with open(session['path'], 'r+b') as handle:
+                handle.truncate(start)
+        except Exception:
+            _abort_claimed_session(resolved_runtime, session)
+            return (None, 'Upload could not be stored. Please start the upload again.', 500)
+        _release_claim(resolved_runtime, session)
+        return (_public_session(session), 'Upload chunk was interrupted. Resume from the current offset.', 400)
+    if error:
+        _release_claim(resolved_runtime, session)
+        return (_public_session(session), error, status_code)
+
+    new_offset = start + written
+    signature_checked = session['signature_checked']
+    if not signature_checked and new_offset >= min(SIGNATURE_PROBE_BYTES, session['total_bytes']):
+        # Cheap magic-number check first; containers without one (e.g. WebM) fall back to ffprobe on the first chunk.
+        if not (resolved_runtime.file_has_audio_signature(session['path']) or resolved_runtime.file_looks_like_audio(session['path'])):
+            _abort_claimed_session(resolved_runtime, session)
+            return (None, 'Uploaded audio file is invalid or unsupported.', 400)
+        signature_checked = True
+    _release_claim(resolved_runtime, session, offset=new_offset, hasher=hasher, signature_checked=signature_checked)
+    return (_public_session(session), '', 200)
+
+
+def complete_upload_session(uid, upload_id, *, sha256='', runtime=None):
+    """Verify a fully uploaded session and turn it into an audio import token.
+
+    Returns ``(payload, error, status_code)``; the reserved quota stays consumed
+    because the bytes were uploaded.
+    """
+    resolved_runtime = _resolve_runtime(runtime)
+    with resolved_runtime.UPLOAD_SESSIONS_LOCK:
+        session = _get_owned_session(resolved_runtime, uid, upload_id)
+        if session is None:
+            return (None, 'Upload session expired or not found. Please start the upload again.', 404)
+        if session['busy'] or session['offset'] < session['total_bytes']:
+            return (_public_session(session), 'Upload is not complete yet.', 409)
+        resolved_runtime.UPLOAD_SESSIONS.pop(session['upload_id'], None)
+    digest = session['hasher'].hexdigest()
+    expected = _normalize_sha256(sha256) or session['sha256_expected']
+    if expected and digest != expected:
+        _discard_session(resolved_runtime, session)
+        return (None, 'Upload integrity check failed. Please upload the file again.', 400)
+    final_path = session['path'][:-len('.part')] if session['path'].endswith('.part') else session['path']
+    os.replace(session['path'], final_path)
+    token = upload_import_audio.register_audio_import_token(
+        session['uid'],
+        final_path,
+        original_name=session['file_name'],
+        runtime=resolved_runtime,
+    )
+    return ({
+        'ok': True,
+        'audio_import_token': token,
+        'file_name': session['file_name'],
+        'size_bytes': int(session['total_bytes']),
+        'sha256': digest,
+        'expires_in_seconds': resolved_runtime.AUDIO_IMPORT_TOKEN_TTL_SECONDS,
+    }, '', 200)
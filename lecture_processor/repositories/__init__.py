@@ -1,4 +1,4 @@
-from . import users_repo, purchases_repo, study_repo, admin_repo, analytics_repo, job_logs_repo, rate_limit_repo, runtime_jobs_repo, batch_repo, planner_repo, physio_repo
+from . import users_repo, purchases_repo, study_repo, admin_repo, analytics_repo, job_logs_repo, rate_limit_repo, runtime_jobs_repo, batch_repo, planner_repo, physio_repo, result_cache_repo
 
 __all__ = [
     'users_repo',
@@ -12,4 +12,5 @@ __all__ = [
     'batch_repo',
     'planner_repo',
     'physio_repo',
+    'result_cache_repo',
 ]
@@ -1,7 +1,13 @@
 """Firestore helpers for batch job persistence."""
 
+import json
+
 from .query_utils import apply_where
 
+FIRESTORE_MAX_BATCH_WRITES = 500
+# Firestore rejects commits over 10 MiB; stay well below it since this is only an estimate.
+FIRESTORE_MAX_BATCH_BYTES = 8 * 1024 * 1024
+
 
 def batch_jobs_collection(db):
     return db.collection('batch_jobs')
@@ -87,6 +93,43 @@ def set_batch_row(db, batch_id, row_id, payload, merge=True):
     return batch_row_doc_ref(db, batch_id, row_id).set(payload, merge=merge)
 
 
+def _estimated_write_bytes(payload):
+    return len(json.dumps(payload, ensure_ascii=False, default=str).encode('utf-8'))
+
+
+def _write_chunks(writes, max_ops, max_bytes):
+    chunk = []
+    chunk_bytes = 0
+    for write in writes:
+        write_bytes = _estimated_write_bytes(write[1])
+        if chunk and (len(chunk) >= max_ops or chunk_bytes + write_bytes > max_bytes):
+            yield chunk
+            chunk = []
+            chunk_bytes = 0
+        chunk.append(write)
+        chunk_bytes += write_bytes
+    if chunk:
+        yield chunk
+
+
+def set_batch_rows(db, batch_id, writes, max_ops=FIRESTORE_MAX_BATCH_WRITES, max_bytes=FIRESTORE_MAX_BATCH_BYTES):
+    """Apply ``[(row_id, payload, merge), ...]`` in WriteBatch commits.
+
+    A commit holds at most ``max_ops`` writes and roughly ``max_bytes`` of
+    payload, so full rows with long transcripts are spread over several commits.
+    """
+    safe_max_ops = max(1, min(int(max_ops or FIRESTORE_MAX_BATCH_WRITES), FIRESTORE_MAX_BATCH_WRITES))
+    safe_max_bytes = max(1, min(int(max_bytes or FIRESTORE_MAX_BATCH_BYTES), FIRESTORE_MAX_BATCH_BYTES))
+    commits = 0
+    for chunk in _write_chunks(list(writes or []), safe_max_ops, safe_max_bytes):
+        batch = db.batch()
+        for row_id, payload, merge in chunk:
+            batch.set(batch_row_doc_ref(db, batch_id, row_id), payload, merge=merge)
+        batch.commit()
+        commits += 1
+    return commits
+
+
 def update_batch_row_fields(db, batch_id, row_id, payload):
     return batch_row_doc_ref(db, batch_id, row_id).update(payload)
 
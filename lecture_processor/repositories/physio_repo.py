@@ -210,6 +210,19 @@ def list_physio_sessions_by_uid(db, uid, limit=300):
     return records
 
 
+def physio_query_embedding_doc_ref(db, cache_key):
+    return db.collection("physio_query_embeddings").document(cache_key)
+
+
+def get_physio_query_embedding_doc(db, cache_key):
+    return physio_query_embedding_doc_ref(db, cache_key).get()
+
+
+def set_physio_query_embedding(db, cache_key, payload):
+    return physio_query_embedding_doc_ref(db, cache_key).set(dict(payload or {}), merge=False)
+
+
 def clear_memory_state():
     _CASE_STORE.clear()
     _SESSION_STORE.clear()
+
@@ -0,0 +1,17 @@
+"""Firestore accessors for content-addressed AI result cache entries."""
+
+
+def doc_ref(db, collection_name, cache_key):
+    return db.collection(collection_name).document(cache_key)
+
+
+def get_doc(db, collection_name, cache_key):
+    return doc_ref(db, collection_name, cache_key).get()
+
+
+def set_doc(db, collection_name, cache_key, payload):
+    return doc_ref(db, collection_name, cache_key).set(payload)
+
+
+def delete_doc(db, collection_name, cache_key):
+    return doc_ref(db, collection_name, cache_key).delete()
@@ -83,14 +83,18 @@ from lecture_processor.domains.study import audio as study_audio
 from lecture_processor.domains.study import export as study_export
 from lecture_processor.domains.study import progress as study_progress
 from lecture_processor.domains.upload import import_audio as upload_import_audio
+from lecture_processor.domains.upload import chunked_upload as upload_chunked
 from lecture_processor.services import analytics_service, auth_service, file_service, job_state_service, prompt_registry, rate_limit_service, url_security
 
-from lecture_processor.repositories import admin_repo, batch_repo, job_logs_repo, planner_repo, purchases_repo, runtime_jobs_repo, study_repo, users_repo
+from lecture_processor.repositories import admin_repo, batch_repo, job_logs_repo, planner_repo, purchases_repo, result_cache_repo, runtime_jobs_repo, study_repo, users_repo
 from lecture_processor.runtime import bootstrap as runtime_bootstrap
 from lecture_processor.runtime import media_runtime
+from lecture_processor.runtime import durable_queue
+from lecture_processor.runtime import job_worker
+from lecture_processor.runtime import provider_poller
 from lecture_processor.runtime import environment as runtime_environment
 from lecture_processor.runtime.http_security import apply_security_headers as runtime_apply_security_headers
-from lecture_processor.runtime.job_dispatcher import BoundedJobDispatcher, JobQueueFullError
+from lecture_processor.runtime.job_dispatcher import FairJobScheduler, JobQueueFullError
 from lecture_processor.runtime.proxy import client_ip_from_request
 
 LEGACY_MODULE_DIR = os.path.dirname(os.path.abspath(__file__))
@@ -129,7 +133,18 @@ JOB_QUEUE_MAX_PENDING = int(os.getenv('JOB_QUEUE_MAX_PENDING', '8') or 8)
 
 TRUSTED_PROXY_HOPS = int(os.getenv('TRUSTED_PROXY_HOPS', '1') or 1)
 
-job_dispatcher = BoundedJobDispatcher(JOB_WORKERS, JOB_QUEUE_MAX_PENDING, logger=logger)
+JOB_PRIORITY_AGING_SECONDS = int(os.getenv('JOB_PRIORITY_AGING_SECONDS', '30') or 30)
+
+# 0 keeps the scheduler default of JOB_WORKERS - 1; the cap only applies while another user's job is queued.
+JOB_MAX_RUNNING_PER_OWNER = int(os.getenv('JOB_MAX_RUNNING_PER_OWNER', '0') or 0)
+
+job_dispatcher = FairJobScheduler(
+    JOB_WORKERS,
+    JOB_QUEUE_MAX_PENDING,
+    logger=logger,
+    aging_seconds=max(1, JOB_PRIORITY_AGING_SECONDS),
+    max_running_per_owner=JOB_MAX_RUNNING_PER_OWNER or None,
+)
 
 def log_event(level, event, **fields):
     payload = {'event': event}
@@ -280,6 +295,16 @@ UPLOAD_RATE_LIMIT_MAX_REQUESTS = safe_int_env('UPLOAD_RATE_LIMIT_MAX_REQUESTS',
 
 MAX_ACTIVE_JOBS_PER_USER = safe_int_env('MAX_ACTIVE_JOBS_PER_USER', 2, minimum=1, maximum=20)
 
+UPLOAD_CHUNK_MAX_BYTES = safe_int_env('UPLOAD_CHUNK_MAX_BYTES', 8 * 1024 * 1024, minimum=256 * 1024, maximum=64 * 1024 * 1024)
+
+UPLOAD_SESSION_TTL_SECONDS = safe_int_env('UPLOAD_SESSION_TTL_SECONDS', 6 * 60 * 60, minimum=5 * 60, maximum=7 * 24 * 60 * 60)
+
+UPLOAD_SESSIONS_MAX_PER_USER = safe_int_env('UPLOAD_SESSIONS_MAX_PER_USER', 3, minimum=1, maximum=20)
+
+UPLOAD_SESSIONS = {}
+
+UPLOAD_SESSIONS_LOCK = threading.Lock()
+
 CHECKOUT_RATE_LIMIT_WINDOW_SECONDS = safe_int_env('CHECKOUT_RATE_LIMIT_WINDOW_SECONDS', 600, minimum=10, maximum=86400)
 
 CHECKOUT_RATE_LIMIT_MAX_REQUESTS = safe_int_env('CHECKOUT_RATE_LIMIT_MAX_REQUESTS', 6, minimum=1, maximum=100)
@@ -314,7 +339,7 @@ ACCOUNT_EXPORT_ZIP_SPOOL_BYTES = safe_int_env('ACCOUNT_EXPORT_ZIP_SPOOL_BYTES',
 
 ACCOUNT_DELETE_MAX_DOCS_PER_COLLECTION = safe_int_env('ACCOUNT_DELETE_MAX_DOCS_PER_COLLECTION', 10000, minimum=100, maximum=50000)
 
-RATE_LIMIT_EVENTS = {}
+RATE_LIMIT_EVENTS = rate_limit_service.SlidingWindowCounters()
 
 RATE_LIMIT_LOCK = threading.Lock()
 
@@ -322,6 +347,88 @@ RATE_LIMIT_COUNTER_COLLECTION = 'rate_limit_counters'
 
 RATE_LIMIT_FIRESTORE_ENABLED = str(os.getenv('RATE_LIMIT_FIRESTORE_ENABLED', '1')).strip().lower() in {'1', 'true', 'yes', 'on'}
 
+RATE_LIMIT_LEASES = {}
+
+# Leasing cuts Firestore transactions per check, but tokens leased by one process are
+# unavailable to the others, so a caller can be rejected early; 0 keeps every check exact.
+RATE_LIMIT_LEASE_PERCENT = safe_int_env('RATE_LIMIT_LEASE_PERCENT', 0, minimum=0, maximum=100)
+
+RUNTIME_JOB_SNAPSHOT_DEBOUNCE_MS = safe_int_env('RUNTIME_JOB_SNAPSHOT_DEBOUNCE_MS', 2000, minimum=0, maximum=60000)
+
+RUNTIME_JOB_SNAPSHOTS = job_state_service.SnapshotWriteBehind(RUNTIME_JOB_SNAPSHOT_DEBOUNCE_MS / 1000.0)
+
+AUTH_TOKEN_CACHE_MAX_ENTRIES = safe_int_env('AUTH_TOKEN_CACHE_MAX_ENTRIES', 4096, minimum=0, maximum=100000)
+
+AUTH_TOKEN_REVALIDATE_SECONDS = safe_int_env('AUTH_TOKEN_REVALIDATE_SECONDS', 300, minimum=0, maximum=3600)
+
+AUTH_TOKEN_CHECK_REVOKED = os.getenv('AUTH_TOKEN_CHECK_REVOKED', '0').strip().lower() in {'1', 'true', 'yes', 'on'}
+
+AUTH_TOKEN_CACHE = auth_service.VerifiedTokenCache(AUTH_TOKEN_CACHE_MAX_ENTRIES, AUTH_TOKEN_REVALIDATE_SECONDS)
+
+JOB_STATUS_NOTIFIER = job_state_service.JobChangeNotifier()
+
+JOB_STATUS_LONG_POLL_SECONDS = safe_int_env('JOB_STATUS_LONG_POLL_SECONDS', 20, minimum=0, maximum=55)
+
+# Each held status request occupies a request thread (gunicorn runs 8); past this many, /status answers at once.
+JOB_STATUS_LONG_POLL_MAX_WAITERS = safe_int_env('JOB_STATUS_LONG_POLL_MAX_WAITERS', 4, minimum=1, maximum=256)
+
+PROCESSING_STATS_CACHE_SECONDS = safe_int_env('PROCESSING_STATS_CACHE_SECONDS', 300, minimum=0, maximum=3600)
+
+AUDIO_PREPROCESS_ENABLED = os.getenv('AUDIO_PREPROCESS_ENABLED', '1').strip().lower() in {'1', 'true', 'yes', 'on'}
+
+AUDIO_PREPROCESS_BITRATE_KBPS = safe_int_env('AUDIO_PREPROCESS_BITRATE_KBPS', 48, minimum=16, maximum=192)
+
+AUDIO_TRIM_SILENCE = os.getenv('AUDIO_TRIM_SILENCE', '0').strip().lower() in {'1', 'true', 'yes', 'on'}
+
+AUDIO_SEGMENT_SECONDS = safe_int_env('AUDIO_SEGMENT_SECONDS', 15 * 60, minimum=120, maximum=3600)
+
+AUDIO_SEGMENT_OVERLAP_SECONDS = safe_int_env('AUDIO_SEGMENT_OVERLAP_SECONDS', 10, minimum=0, maximum=120)
+
+AUDIO_SEGMENT_MIN_DURATION_SECONDS = safe_int_env('AUDIO_SEGMENT_MIN_DURATION_SECONDS', 45 * 60, minimum=300, maximum=6 * 60 * 60)
+
+AUDIO_SEGMENT_MAX_PARALLEL = safe_int_env('AUDIO_SEGMENT_MAX_PARALLEL', 4, minimum=1, maximum=16)
+
+BATCH_UPLOAD_MAX_PARALLEL = safe_int_env('BATCH_UPLOAD_MAX_PARALLEL', 4, minimum=1, maximum=16)
+
+AI_RESULT_CACHE_MODE = (os.getenv('AI_RESULT_CACHE_MODE', 'auto') or 'auto').strip().lower()
+
+AI_RESULT_CACHE_COLLECTION = 'ai_result_cache'
+
+AI_RESULT_CACHE_DIR = os.getenv('AI_RESULT_CACHE_DIR', '').strip() or os.path.join(PROJECT_ROOT_DIR, 'instance', 'result_cache')
+
+AI_RESULT_CACHE_TTL_SECONDS = safe_int_env('AI_RESULT_CACHE_TTL_SECONDS', 30 * 24 * 60 * 60, minimum=60 * 60, maximum=365 * 24 * 60 * 60)
+
+AI_RESULT_CACHE_MAX_ENTRIES = safe_int_env('AI_RESULT_CACHE_MAX_ENTRIES', 2000, minimum=10, maximum=100000)
+
+BATCH_ARTIFACT_CACHE_DIR = os.getenv('BATCH_ARTIFACT_CACHE_DIR', '').strip() or os.path.join(PROJECT_ROOT_DIR, 'instance', 'export_artifacts')
+
+BATCH_ARTIFACT_CACHE_TTL_SECONDS = safe_int_env('BATCH_ARTIFACT_CACHE_TTL_SECONDS', 7 * 24 * 60 * 60, minimum=60, maximum=90 * 24 * 60 * 60)
+
+BATCH_ARTIFACT_CACHE_MAX_ENTRIES = safe_int_env('BATCH_ARTIFACT_CACHE_MAX_ENTRIES', 5000, minimum=0, maximum=200000)
+
+JOB_QUEUE_MODE = (os.getenv('JOB_QUEUE_MODE', 'thread') or 'thread').strip().lower()
+
+JOB_QUEUE_DB_PATH = os.getenv('JOB_QUEUE_DB_PATH', '').strip() or os.path.join(PROJECT_ROOT_DIR, 'instance', 'job_queue.sqlite3')
+
+JOB_DURABLE_QUEUE_MAX_PENDING = safe_int_env('JOB_DURABLE_QUEUE_MAX_PENDING', 100, minimum=1, maximum=10000)
+
+JOB_WORKER_LEASE_SECONDS = safe_int_env('JOB_WORKER_LEASE_SECONDS', 120, minimum=30, maximum=3600)
+
+DURABLE_JOB_QUEUE = None
+if JOB_QUEUE_MODE == 'durable':
+    if db is None:
+        logger.warning('JOB_QUEUE_MODE=durable needs Firestore runtime-job storage; running background jobs in-process.')
+    else:
+        os.makedirs(os.path.dirname(JOB_QUEUE_DB_PATH) or '.', exist_ok=True)
+        DURABLE_JOB_QUEUE = durable_queue.DurableJobQueue(
+            JOB_QUEUE_DB_PATH,
+            max_pending=JOB_DURABLE_QUEUE_MAX_PENDING,
+            aging_seconds=max(1, JOB_PRIORITY_AGING_SECONDS),
+        )
+
+# Web processes read worker-owned jobs from their snapshot documents; `python worker.py` clears this.
+RUNTIME_JOBS_REMOTE = DURABLE_JOB_QUEUE is not None
+
 SENTRY_BACKEND_DSN = os.getenv('SENTRY_DSN_BACKEND', '').strip()
 
 SENTRY_FRONTEND_DSN = os.getenv('SENTRY_DSN_FRONTEND', '').strip()
@@ -413,6 +520,7 @@ SMTP_FROM_EMAIL = (os.getenv('SMTP_FROM_EMAIL', '') or '').strip()
 SMTP_FROM_NAME = (os.getenv('SMTP_FROM_NAME', 'Lecture Processor') or 'Lecture Processor').strip()
 SMTP_REPLY_TO = (os.getenv('SMTP_REPLY_TO', '') or '').strip()
 SMTP_TIMEOUT_SECONDS = safe_int_env('SMTP_TIMEOUT_SECONDS', 12, minimum=1, maximum=120)
+PHYSIO_QUERY_EMBED_SHARED_CACHE = _env_truthy('PHYSIO_QUERY_EMBED_SHARED_CACHE', '0')
 
 def should_use_minified_js_assets():
     raw = str(os.getenv('USE_MINIFIED_JS_ASSETS', '') or '').strip().lower()
@@ -641,6 +749,7 @@ def _run_periodic_cleanup():
         try:
             cleanup_old_jobs()
             cleanup_expired_audio_stream_tokens()
+            upload_chunked.cleanup_expired_upload_sessions(runtime=_self_runtime())
         except Exception:
             logger.warning('Periodic cleanup failed', exc_info=True)
 
@@ -711,11 +820,13 @@ def log_rate_limit_hit(limit_name, retry_after=0):
 def save_job_log(job_id, job_data, finished_at):
     """Save a processing job log to Firestore for analytics."""
     try:
+        from lecture_processor.domains.admin import duration_stats as admin_duration_stats
         from lecture_processor.domains.admin import metrics as admin_metrics
         from lecture_processor.domains.admin import rollups as admin_rollups
 
         started_at = job_data.get('started_at', 0)
         duration = round(finished_at - started_at, 1) if started_at else 0
+        snapshot_stats = RUNTIME_JOB_SNAPSHOTS.stats(job_id)
         payload = {
             'job_id': job_id,
             'uid': job_data.get('user_id', ''),
@@ -753,10 +864,13 @@ def save_job_log(job_id, job_data, finished_at):
             'started_at': started_at,
             'finished_at': finished_at,
             'duration_seconds': duration,
+            'snapshot_writes_saved': snapshot_stats['writes_saved'],
+            'snapshot_bytes_saved': snapshot_stats['bytes_saved'],
         }
         payload = admin_metrics.add_admin_visibility_flag(payload)
         job_logs_repo.set_job_log(db, job_id, payload)
         admin_rollups.increment_job_rollups(payload, runtime=app.extensions.get('lecture_processor', {}).get('runtime'))
+        admin_duration_stats.record_job_duration(payload, runtime=app.extensions.get('lecture_processor', {}).get('runtime'))
         status = str(job_data.get('status', '') or '').lower()
         backend_event = 'processing_finished_backend'
         if status == 'complete':
@@ -857,7 +971,7 @@ def run_startup_recovery_once():
     recover_stale_runtime_jobs()
 
 def verify_firebase_token(request):
-    return auth_service.verify_firebase_token(request, auth_module=auth, logger=logger)
+    return auth_service.verify_firebase_token(request, auth_module=auth, logger=logger, token_cache=AUTH_TOKEN_CACHE, check_revoked=AUTH_TOKEN_CHECK_REVOKED)
 
 def is_admin_user(decoded_token):
     if not decoded_token:
@@ -1034,7 +1148,7 @@ def _check_rate_limit_firestore(key, limit, window_seconds, now_ts):
     return rate_limit_service.check_rate_limit_firestore(key, limit, window_seconds, now_ts, firestore_enabled=RATE_LIMIT_FIRESTORE_ENABLED, db=db, firestore_module=firestore, counter_collection=RATE_LIMIT_COUNTER_COLLECTION)
 
 def check_rate_limit(key, limit, window_seconds):
-    return rate_limit_service.check_rate_limit(key, limit, window_seconds, firestore_enabled=RATE_LIMIT_FIRESTORE_ENABLED, db=db, firestore_module=firestore, counter_collection=RATE_LIMIT_COUNTER_COLLECTION, in_memory_events=RATE_LIMIT_EVENTS, in_memory_lock=RATE_LIMIT_LOCK, time_module=time)
+    return rate_limit_service.check_rate_limit(key, limit, window_seconds, firestore_enabled=RATE_LIMIT_FIRESTORE_ENABLED, db=db, firestore_module=firestore, counter_collection=RATE_LIMIT_COUNTER_COLLECTION, in_memory_events=RATE_LIMIT_EVENTS, in_memory_lock=RATE_LIMIT_LOCK, time_module=time, lease_percent=RATE_LIMIT_LEASE_PERCENT, lease_state=RATE_LIMIT_LEASES)
 
 def build_rate_limited_response(message, retry_after):
     response = jsonify({'error': message, 'retry_after_seconds': int(max(1, retry_after))})
@@ -1055,11 +1169,21 @@ def get_client_ip(req=None):
 
 
 def submit_background_job(target, *args, **kwargs):
+    if DURABLE_JOB_QUEUE is not None:
+        queued = job_worker.submit_durable_job(DURABLE_JOB_QUEUE, target, args, kwargs, runtime=_self_runtime(), logger=logger)
+        if queued is not None:
+            return queued
     return job_dispatcher.submit(target, *args, **kwargs)
 
 
 def get_background_queue_stats():
-    return job_dispatcher.stats()
+    stats = job_dispatcher.stats()
+    if DURABLE_JOB_QUEUE is not None:
+        try:
+            stats['durable'] = DURABLE_JOB_QUEUE.stats()
+        except Exception:
+            logger.warning('Could not read durable job queue stats', exc_info=True)
+    return stats
 
 def has_sufficient_upload_disk_space(required_bytes=0):
     """Return (ok, free_bytes, threshold_bytes) for upload safety checks."""
@@ -1447,6 +1571,27 @@ def generate_with_optional_thinking(model, prompt_text, max_output_tokens=65536,
 def convert_audio_to_mp3_with_ytdlp(local_audio_path):
     return file_service.convert_audio_to_mp3_with_ytdlp(local_audio_path, ffmpeg_binary_getter=get_ffmpeg_binary, logger=logger, which_func=shutil.which, subprocess_module=subprocess)
 
+def preprocess_audio_for_transcription(local_audio_path):
+    """Mono speech-bitrate MP3 for provider upload, falling back to the plain MP3 conversion."""
+    if AUDIO_PREPROCESS_ENABLED:
+        processed_path, processed = file_service.preprocess_audio_for_transcription(
+            local_audio_path,
+            ffmpeg_binary_getter=get_ffmpeg_binary,
+            logger=logger,
+            subprocess_module=subprocess,
+            bitrate_kbps=AUDIO_PREPROCESS_BITRATE_KBPS,
+            trim_silence=AUDIO_TRIM_SILENCE,
+        )
+        if processed:
+            return processed_path, True
+    return convert_audio_to_mp3_with_ytdlp(local_audio_path)
+
+def probe_audio_duration_seconds(path):
+    return file_service.probe_audio_duration_seconds(path, ffmpeg_binary_getter=get_ffmpeg_binary, ffprobe_binary_getter=get_ffprobe_binary, subprocess_module=subprocess)
+
+def split_audio_segments(path, windows):
+    return file_service.split_audio_segments(path, windows, ffmpeg_binary_getter=get_ffmpeg_binary, logger=logger, subprocess_module=subprocess)
+
 def resolve_auto_amount(kind, source_text):
     word_count = len((source_text or '').split())
     if kind == 'flashcards':
@@ -1775,6 +1920,12 @@ def get_saved_file_size(path):
 def get_mime_type(filename):
     return file_service.get_mime_type(filename)
 
+PROVIDER_POLLER = provider_poller.ProviderPoller(
+    logger=logger,
+    is_transient_error=lambda error: is_transient_provider_error(error),
+    classify_error=lambda error: classify_provider_error_code(error),
+)
+
 def wait_for_file_processing(uploaded_file):
     return media_runtime.wait_for_file_processing(
         uploaded_file,
@@ -1783,6 +1934,7 @@ def wait_for_file_processing(uploaded_file):
         time_module=time,
         is_transient_provider_error_fn=is_transient_provider_error,
         classify_provider_error_code_fn=classify_provider_error_code,
+        poller=PROVIDER_POLLER,
     )
 
 def cleanup_files(local_paths, gemini_files):
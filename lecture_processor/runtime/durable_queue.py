@@ -0,0 +1,274 @@
+"""Durable local job queue (SQLite in WAL mode) shared by web and worker processes."""
+
+from __future__ import annotations
+
+import dataclasses
+import importlib
+import json
+import sqlite3
+import threading
+import time
+
+QUEUED = 'queued'
+LEASED = 'leased'
+DONE = 'done'
+FAILED = 'failed'
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    job_key TEXT NOT NULL,
+    target TEXT NOT NULL,
+    payload TEXT NOT NULL,
+    job_class TEXT NOT NULL DEFAULT 'default',
+    owner TEXT NOT NULL DEFAULT '',
+    priority INTEGER NOT NULL DEFAULT 0,
+    state TEXT NOT NULL DEFAULT 'queued',
+    attempts INTEGER NOT NULL DEFAULT 0,
+    enqueued_at REAL NOT NULL,
+    leased_at REAL,
+    lease_expires_at REAL,
+    lease_holder TEXT NOT NULL DEFAULT '',
+    finished_at REAL,
+    error TEXT NOT NULL DEFAULT ''
+);
+CREATE INDEX IF NOT EXISTS jobs_state_idx ON jobs (state, priority, enqueued_at);
+CREATE INDEX IF NOT EXISTS jobs_key_idx ON jobs (job_key, state);
+"""
+
+
+class JobCallEncodingError(TypeError):
+    """Raised when a job's target or arguments cannot cross a process boundary."""
+
+
+def _target_path(fn):
+    module_name = getattr(fn, '__module__', '') or ''
+    qualname = getattr(fn, '__qualname__', '') or ''
+    if not module_name or not qualname or '<' in qualname:
+        raise JobCallEncodingError(f'{fn!r} is not an importable module-level function.')
+    return f'{module_name}:{qualname}'
+
+
+def _resolve_path(path):
+    module_name, _sep, qualname = str(path or '').partition(':')
+    value = importlib.import_module(module_name)
+    for part in qualname.split('.'):
+        value = getattr(value, part)
+    return value
+
+
+def _encode_value(value, is_runtime):
+    if is_runtime(value):
+        return {'__lp__': 'runtime'}
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return value
+    if isinstance(value, tuple):
+        return {'__lp__': 'tuple', 'items': [_encode_value(item, is_runtime) for item in value]}
+    if isinstance(value, list):
+        return [_encode_value(item, is_runtime) for item in value]
+    if isinstance(value, dict):
+        if not all(isinstance(key, str) for key in value):
+            raise JobCallEncodingError('Only string dict keys can be queued.')
+        return {'__lp__': 'dict', 'items': {key: _encode_value(item, is_runtime) for key, item in value.items()}}
+    if dataclasses.is_dataclass(value) and not isinstance(value, type):
+        return {
+            '__lp__': 'dataclass',
+            'type': _target_path(type(value)),
+            'fields': {field.name: _encode_value(getattr(value, field.name), is_runtime) for field in dataclasses.fields(value)},
+        }
+    raise JobCallEncodingError(f'Cannot queue argument of type {type(value).__name__}.')
+
+
+def _decode_value(value, runtime):
+    if isinstance(value, list):
+        return [_decode_value(item, runtime) for item in value]
+    if not isinstance(value, dict):
+        return value
+    kind = value.get('__lp__')
+    if kind == 'runtime':
+        return runtime
+    if kind == 'tuple':
+        return tuple(_decode_value(item, runtime) for item in value.get('items', []))
+    if kind == 'dict':
+        return {key: _decode_value(item, runtime) for key, item in value.get('items', {}).items()}
+    if kind == 'dataclass':
+        cls = _resolve_path(value.get('type'))
+        return cls(**{key: _decode_value(item, runtime) for key, item in value.get('fields', {}).items()})
+    raise JobCallEncodingError(f'Unknown queued value marker {kind!r}.')
+
+
+def encode_job_call(fn, args, kwargs, *, is_runtime=lambda _value: False):
+    """Serialize ``fn(*args, **kwargs)``; runtime objects become a marker rebound in the worker."""
+    target = _target_path(fn)
+    if _resolve_path(target) is not fn:
+        raise JobCallEncodingError(f'{target} does not resolve back to the submitted function.')
+    payload = {
+        'args': [_encode_value(arg, is_runtime) for arg in args],
+        'kwargs': {key: _encode_value(value, is_runtime) for key, value in (kwargs or {}).items()},
+    }
+    return target, json.dumps(payload, separators=(',', ':'))
+
+
+def decode_job_call(target, payload, runtime):
+    data = json.loads(payload)
+    fn = _resolve_path(target)
+    args = [_decode_value(arg, runtime) for arg in data.get('args', [])]
+    kwargs = {key: _decode_value(value, runtime) for key, value in data.get('kwargs', {}).items()}
+    return fn, args, kwargs
+
+
+class DurableJobQueue:
+    """Job rows in a local SQLite database (WAL) that survive web and worker restarts.
+
+    Workers ``lease`` the next row (highest aged priority first, then the owner
+    with the fewest leased jobs, then oldest), ``heartbeat`` while running and
+    ``complete`` or ``fail`` it. Leases left behind by a crashed worker expire and
+    the row is handed out again until ``max_attempts`` is reached.
+    """
+
+    def __init__(self, path, *, max_pending=100, max_attempts=2, aging_seconds=30.0, clock=time.time):
+        self.path = str(path)
+        self.max_pending = max(1, int(max_pending or 1))
+        self.max_attempts = max(1, int(max_attempts or 1))
+        self._aging_seconds = max(0.001, float(aging_seconds))
+        self._clock = clock
+        self._local = threading.local()
+        self._connection().executescript(_SCHEMA)
+
+    def _connection(self):
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=30.0, isolation_level=None)
+            conn.row_factory = sqlite3.Row
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.execute('PRAGMA synchronous=NORMAL')
+            self._local.conn = conn
+        return conn
+
+    def _connect(self):
+        return _Transaction(self._connection())
+
+    def enqueue(self, job_key, target, payload, *, job_class='default', owner='', priority=0):
+        """Append one job; raises ``OverflowError`` when ``max_pending`` rows are already waiting or running."""
+        with self._connect() as conn:
+            pending = conn.execute('SELECT COUNT(*) FROM jobs WHERE state IN (?, ?)', (QUEUED, LEASED)).fetchone()[0]
+            if pending >= self.max_pending:
+                raise OverflowError('Durable job queue is full.')
+            cursor = conn.execute(
+                'INSERT INTO jobs (job_key, target, payload, job_class, owner, priority, state, enqueued_at) VALUES (?, ?, ?, ?, ?, ?, ?, ?)',
+                (str(job_key or ''), target, payload, str(job_class or 'default'), str(owner or ''), int(priority or 0), QUEUED, self._clock()),
+            )
+            return cursor.lastrowid
+
+    def lease(self, holder, lease_seconds):
+        """Claim the next runnable row for ``holder``; returns the row as a dict or None."""
+        now = self._clock()
+        with self._connect() as conn:
+            self._expire_leases(conn, now)
+            row = conn.execute(
+                """
+                SELECT * FROM jobs AS queued
+                WHERE state = ?
+                ORDER BY
+                    priority + CAST((? - enqueued_at) / ? AS INTEGER) DESC,
+                    (SELECT COUNT(*) FROM jobs AS running WHERE running.state = ? AND running.owner = queued.owner AND queued.owner != '') ASC,
+                    enqueued_at ASC,
+                    id ASC
+                LIMIT 1
+                """,
+                (QUEUED, now, self._aging_seconds, LEASED),
+            ).fetchone()
+            if row is None:
+                return None
+            conn.execute(
+                'UPDATE jobs SET state = ?, attempts = attempts + 1, leased_at = ?, lease_expires_at = ?, lease_holder = ? WHERE id = ?',
+                (LEASED, now, now + float(lease_seconds), str(holder or ''), row['id']),
+            )
+            leased = dict(row)
+            leased.update(state=LEASED, attempts=row['attempts'] + 1, leased_at=now, lease_holder=str(holder or ''))
+            return leased
+
+    def _expire_leases(self, conn, now):
+        conn.execute(
+            "UPDATE jobs SET state = ?, finished_at = ?, error = 'lease expired after final attempt' "
+            'WHERE state = ? AND lease_expires_at < ? AND attempts >= ?',
+            (FAILED, now, LEASED, now, self.max_attempts),
+        )
+        conn.execute(
+            "UPDATE jobs SET state = ?, lease_holder = '' WHERE state = ? AND lease_expires_at < ?",
+            (QUEUED, LEASED, now),
+        )
+
+    def heartbeat(self, row_id, holder, lease_seconds):
+        with self._connect() as conn:
+            cursor = conn.execute(
+                'UPDATE jobs SET lease_expires_at = ? WHERE id = ? AND state = ? AND lease_holder = ?',
+                (self._clock() + float(lease_seconds), row_id, LEASED, str(holder or '')),
+            )
+            return cursor.rowcount == 1
+
+    def complete(self, row_id):
+        self._finish(row_id, DONE, '')
+
+    def fail(self, row_id, error):
+        self._finish(row_id, FAILED, str(error or '')[:2000])
+
+    def _finish(self, row_id, state, error):
+        with self._connect() as conn:
+            conn.execute('UPDATE jobs SET state = ?, finished_at = ?, error = ? WHERE id = ?', (state, self._clock(), error, row_id))
+
+    def expired_failures(self, since):
+        """Rows failed by lease expiry after ``since``; the worker turns these into job errors."""
+        with self._connect() as conn:
+            rows = conn.execute(
+                "SELECT * FROM jobs WHERE state = ? AND error = 'lease expired after final attempt' AND finished_at >= ?",
+                (FAILED, float(since)),
+            ).fetchall()
+            return [dict(row) for row in rows]
+
+    def is_pending(self, job_key):
+        with self._connect() as conn:
+            row = conn.execute(
+                'SELECT 1 FROM jobs WHERE job_key = ? AND state IN (?, ?) LIMIT 1',
+                (str(job_key or ''), QUEUED, LEASED),
+            ).fetchone()
+            return row is not None
+
+    def prune(self, older_than_seconds):
+        with self._connect() as conn:
+            cursor = conn.execute(
+                'DELETE FROM jobs WHERE state IN (?, ?) AND finished_at < ?',
+                (DONE, FAILED, self._clock() - float(older_than_seconds)),
+            )
+            return cursor.rowcount
+
+    def stats(self):
+        with self._connect() as conn:
+            rows = conn.execute('SELECT job_class, state, COUNT(*) AS count FROM jobs GROUP BY job_class, state').fetchall()
+        by_class = {}
+        totals = {QUEUED: 0, LEASED: 0, DONE: 0, FAILED: 0}
+        for row in rows:
+            by_class.setdefault(row['job_class'], {})[row['state']] = row['count']
+            totals[row['state']] = totals.get(row['state'], 0) + row['count']
+        return {
+            'queued': totals[QUEUED],
+            'running': totals[LEASED],
+            'done': totals[DONE],
+            'failed': totals[FAILED],
+            'classes': by_class,
+        }
+
+
+class _Transaction:
+    """``BEGIN IMMEDIATE`` so a lease's select-then-update is atomic across processes."""
+
+    def __init__(self, conn):
+        self._conn = conn
+
+    def __enter__(self):
+        self._conn.execute('BEGIN IMMEDIATE')
+        return self._conn
+
+    def __exit__(self, exc_type, _exc, _tb):
+        self._conn.execute('ROLLBACK' if exc_type is not None else 'COMMIT')
+        return False
@@ -2,55 +2,269 @@
 
 from __future__ import annotations
 
+import itertools
 import threading
-from concurrent.futures import ThreadPoolExecutor
+import time
+from collections import deque
+from concurrent.futures import Future
+from dataclasses import dataclass
 
 
 class JobQueueFullError(RuntimeError):
     """Raised when the bounded in-process queue is saturated."""
 
 
-class BoundedJobDispatcher:
-    def __init__(self, max_workers, max_pending, logger=None):
+@dataclass(frozen=True)
+class JobClass:
+    """Scheduling policy for one kind of background job.
+
+    ``priority`` picks the tier (higher runs first, with aging so low tiers
+    are never starved), ``weight`` is the class's fair share inside a tier and
+    ``base_cost`` is the relative work of a typical job before size scaling.
+    """
+
+    priority: int = 0
+    weight: float = 1.0
+    base_cost: float = 1.0
+
+
+DEFAULT_JOB_CLASS = 'default'
+JOB_CLASSES = {
+    'lecture-notes': JobClass(priority=0, weight=1.0, base_cost=4.0),
+    'interview': JobClass(priority=0, weight=1.0, base_cost=3.0),
+    'slides-only': JobClass(priority=1, weight=1.5, base_cost=1.5),
+    'tools_transcription': JobClass(priority=1, weight=1.5, base_cost=2.0),
+    'tools_extract': JobClass(priority=2, weight=2.0, base_cost=1.0),
+    'physio_transcription': JobClass(priority=2, weight=2.0, base_cost=2.0),
+    'batch': JobClass(priority=0, weight=1.0, base_cost=1.0),
+    DEFAULT_JOB_CLASS: JobClass(),
+}
+COST_SIZE_SCALE_MB = 100.0
+WAIT_SAMPLES_PER_CLASS = 256
+
+
+def estimate_job_cost(job_class, size_mb=0.0, classes=None):
+    """Relative cost of a job: the class base cost, growing linearly with input size."""
+    policy = (classes or JOB_CLASSES).get(job_class) or JobClass()
+    try:
+        safe_size = max(0.0, min(1024.0, float(size_mb or 0.0)))
+    except (TypeError, ValueError):
+        safe_size = 0.0
+    return policy.base_cost * (1.0 + safe_size / COST_SIZE_SCALE_MB)
+
+
+class ScheduledJob:
+    """Callable wrapper that carries scheduling hints for one submitted job."""
+
+    def __init__(self, fn, *, job_class=DEFAULT_JOB_CLASS, owner='', size_mb=0.0, job_id=''):
+        self.fn = fn
+        self.job_class = job_class
+        self.owner = str(owner or '')
+        self.size_mb = size_mb
+        self.job_id = str(job_id or '')
+
+    def __call__(self, *args, **kwargs):
+        return self.fn(*args, **kwargs)
+
+
+def _percentile_ms(sorted_seconds, percentile):
+    if not sorted_seconds:
+        return 0
+    index = min(len(sorted_seconds) - 1, int(round(percentile * (len(sorted_seconds) - 1))))
+    return int(round(sorted_seconds[index] * 1000))
+
+
+class _QueuedJob:
+    __slots__ = ('job_class', 'flow', 'owned', 'priority', 'finish_tag', 'sequence', 'submitted_at', 'future', 'fn', 'args', 'kwargs')
+
+    def __init__(self, job_class, flow, owned, priority, finish_tag, sequence, submitted_at, future, fn, args, kwargs):
+        self.job_class = job_class
+        self.flow = flow
+        self.owned = owned
+        self.priority = priority
+        self.finish_tag = finish_tag
+        self.sequence = sequence
+        self.submitted_at = submitted_at
+        self.future = future
+        self.fn = fn
+        self.args = args
+        self.kwargs = kwargs
+
+
+class FairJobScheduler:
+    """Fixed worker pool with a bounded, priority- and fairness-aware queue.
+
+    Queued jobs are picked by effective priority (class priority plus one
+    level per ``aging_seconds`` waited), then by self-clocked fair queuing
+    across owners: each job's finish tag advances its owner's virtual clock by
+    ``cost / weight``. Ordering alone cannot stop an owner whose jobs started
+    first from holding every worker, so while another owner has a job queued,
+    an owner already running ``max_running_per_owner`` jobs (default
+    ``max_workers - 1``) is passed over for it. The cap never leaves a worker
+    idle: a lone owner still gets every free worker. Capacity and
+    ``JobQueueFullError`` behave like a bounded FIFO: ``max_workers`` running
+    plus ``max_pending`` queued.
+    """
+
+    def __init__(
+        self,
+        max_workers,
+        max_pending,
+        logger=None,
+        *,
+        classes=None,
+        aging_seconds=30.0,
+        clock=time.monotonic,
+        max_running_per_owner=None,
+    ):
         self.max_workers = max(1, int(max_workers or 1))
         self.max_pending = max(0, int(max_pending or 0))
+        if max_running_per_owner is None:
+            max_running_per_owner = self.max_workers - 1
+        self.max_running_per_owner = max(1, min(self.max_workers, int(max_running_per_owner or 1)))
         self._capacity = self.max_workers + self.max_pending
-        self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix='lp-job')
-        self._slots = threading.BoundedSemaphore(self._capacity)
-        self._lock = threading.Lock()
-        self._active = 0
+        self._classes = dict(classes or JOB_CLASSES)
+        self._aging_seconds = max(0.001, float(aging_seconds))
+        self._clock = clock
         self._logger = logger
+        self._condition = threading.Condition()
+        self._queue = []
+        self._sequence = itertools.count()
+        self._virtual_time = 0.0
+        self._flow_finish = {}
+        self._running = 0
+        self._running_by_class = {}
+        self._running_by_flow = {}
+        self._submitted_by_class = {}
+        self._waits_by_class = {}
+        self._threads = []
+
+    def _policy(self, job_class):
+        return self._classes.get(job_class) or self._classes.get(DEFAULT_JOB_CLASS) or JobClass()
 
     def stats(self):
-        with self._lock:
-            active = self._active
-        queued = max(0, active - self.max_workers)
-        running = min(active, self.max_workers)
+        with self._condition:
+            queued = len(self._queue)
+            running = self._running
+            queued_by_class = {}
+            for entry in self._queue:
+                queued_by_class[entry.job_class] = queued_by_class.get(entry.job_class, 0) + 1
+            classes = {}
+            for job_class in set(self._submitted_by_class) | set(queued_by_class) | set(self._running_by_class):
+                waits = sorted(self._waits_by_class.get(job_class, ()))
+                classes[job_class] = {
+                    'queued': queued_by_class.get(job_class, 0),
+                    'running': self._running_by_class.get(job_class, 0),
+                    'submitted': self._submitted_by_class.get(job_class, 0),
+                    'wait_p50_ms': _percentile_ms(waits, 0.5),
+                    'wait_p95_ms': _percentile_ms(waits, 0.95),
+                }
         return {
             'capacity': self._capacity,
             'max_workers': self.max_workers,
             'max_pending': self.max_pending,
-            'active': active,
+            'max_running_per_owner': self.max_running_per_owner,
+            'active': queued + running,
             'running': running,
             'queued': queued,
+            'classes': classes,
         }
 
     def submit(self, fn, *args, **kwargs):
-        if not self._slots.acquire(blocking=False):
-            raise JobQueueFullError('Background processing queue is full.')
-        with self._lock:
-            self._active += 1
-        future = self._executor.submit(fn, *args, **kwargs)
-
-        def _release(_future):
-            with self._lock:
-                self._active = max(0, self._active - 1)
-            self._slots.release()
-            try:
-                _future.result()
-            except Exception as exc:  # pragma: no cover - logged for production visibility
-                if self._logger is not None:
-                    self._logger.exception('Background job failed: %s', exc)
-
-        future.add_done_callback(_release)
+        """Queue ``fn``; wrap it in ``ScheduledJob`` to give its class, owner and input size."""
+        hints = fn if isinstance(fn, ScheduledJob) else ScheduledJob(fn)
+        safe_class = hints.job_class if hints.job_class in self._classes else DEFAULT_JOB_CLASS
+        policy = self._policy(safe_class)
+        cost = estimate_job_cost(safe_class, hints.size_mb, classes=self._classes)
+        future = Future()
+        with self._condition:
+            if len(self._queue) + self._running >= self._capacity:
+                raise JobQueueFullError('Background processing queue is full.')
+            flow = hints.owner or f'class:{safe_class}'
+            start_tag = max(self._virtual_time, self._flow_finish.get(flow, 0.0))
+            finish_tag = start_tag + cost / max(0.001, policy.weight)
+            self._flow_finish[flow] = finish_tag
+            self._queue.append(_QueuedJob(
+                safe_class,
+                flow,
+                bool(hints.owner),
+                policy.priority,
+                finish_tag,
+                next(self._sequence),
+                self._clock(),
+                future,
+                hints.fn,
+                args,
+                kwargs,
+            ))
+            self._submitted_by_class[safe_class] = self._submitted_by_class.get(safe_class, 0) + 1
+            self._ensure_workers()
+            self._condition.notify()
         return future
+
+    def _ensure_workers(self):
+        self._threads = [thread for thread in self._threads if thread.is_alive()]
+        while len(self._threads) < self.max_workers:
+            thread = threading.Thread(target=self._worker, name=f'lp-job-{len(self._threads)}', daemon=True)
+            self._threads.append(thread)
+            thread.start()
+
+    def _pick_next(self):
+        """Pop the next job, preferring owners below their running cap over capped ones."""
+        now = self._clock()
+        best_index = 0
+        best_key = None
+        for index, entry in enumerate(self._queue):
+            capped = entry.owned and self._running_by_flow.get(entry.flow, 0) >= self.max_running_per_owner
+            aged_priority = entry.priority + int((now - entry.submitted_at) / self._aging_seconds)
+            key = (capped, -aged_priority, entry.finish_tag, entry.sequence)
+            if best_key is None or key < best_key:
+                best_index, best_key = index, key
+        entry = self._queue.pop(best_index)
+        self._virtual_time = max(self._virtual_time, entry.finish_tag)
+        queued_flows = {queued.flow for queued in self._queue}
+        for flow in [
+            flow for flow, tag in self._flow_finish.items()
+            if tag <= self._virtual_time and flow not in queued_flows and not self._running_by_flow.get(flow)
+        ]:
+            del self._flow_finish[flow]
+        waits = self._waits_by_class.setdefault(entry.job_class, deque(maxlen=WAIT_SAMPLES_PER_CLASS))
+        waits.append(max(0.0, now - entry.submitted_at))
+        return entry
+
+    def _worker(self):
+        while True:
+            with self._condition:
+                while not self._queue:
+                    self._condition.wait()
+                entry = self._pick_next()
+                self._running += 1
+                self._running_by_class[entry.job_class] = self._running_by_class.get(entry.job_class, 0) + 1
+                self._running_by_flow[entry.flow] = self._running_by_flow.get(entry.flow, 0) + 1
+            outcome = None
+            failure = None
+            started = entry.future.set_running_or_notify_cancel()
+            if started:
+                try:
+                    outcome = entry.fn(*entry.args, **entry.kwargs)
+                except BaseException as exc:
+                    failure = exc
+            with self._condition:
+                self._running = max(0, self._running - 1)
+                self._running_by_class[entry.job_class] = max(0, self._running_by_class.get(entry.job_class, 0) - 1)
+                remaining = self._running_by_flow.get(entry.flow, 0) - 1
+                if remaining > 0:
+                    self._running_by_flow[entry.flow] = remaining
+                else:
+                    self._running_by_flow.pop(entry.flow, None)
+            if not started:
+                continue
+            if failure is None:
+                entry.future.set_result(outcome)
+                continue
+            entry.future.set_exception(failure)
+            if self._logger is not None:  # pragma: no cover - logged for production visibility
+                self._logger.exception('Background job failed: %s', failure, exc_info=failure)
+
+# Kept for callers and tests that construct the dispatcher by its previous name.
+BoundedJobDispatcher = FairJobScheduler
@@ -0,0 +1,180 @@
+"""Separate worker process that runs background jobs from the durable local queue.
+
+The web process hands a job off with ``submit_durable_job`` (state lives in the
+``runtime_jobs`` snapshot documents), and ``python worker.py`` leases and runs it,
+so web and worker processes can be restarted independently. The queue is a local
+SQLite file, so the worker runs on the web process's host (see ``worker.py``).
+"""
+
+from __future__ import annotations
+
+import os
+import signal
+import socket
+import threading
+
+from lecture_processor.runtime import durable_queue
+from lecture_processor.runtime.container import AppRuntime, get_runtime
+from lecture_processor.runtime.job_dispatcher import JOB_CLASSES, JobClass, JobQueueFullError, ScheduledJob
+
+CORE_MODULE_NAME = 'lecture_processor.runtime.core'
+TERMINAL_JOB_STATUSES = frozenset({'complete', 'error'})
+
+
+def _is_runtime_value(value):
+    return isinstance(value, AppRuntime) or getattr(value, '__name__', None) == CORE_MODULE_NAME
+
+
+def submit_durable_job(queue, target, args, kwargs, *, runtime, logger=None):
+    """Queue ``target`` for a worker process; None means it must run in-process instead."""
+    from lecture_processor.domains.runtime_jobs import store as runtime_jobs_store
+
+    hints = target if isinstance(target, ScheduledJob) else ScheduledJob(target)
+    try:
+        encoded_target, payload = durable_queue.encode_job_call(hints.fn, args, kwargs, is_runtime=_is_runtime_value)
+    except durable_queue.JobCallEncodingError as error:
+        if logger is not None:
+            logger.info('Running %s in-process; it cannot be queued for a worker: %s', getattr(hints.fn, '__name__', hints.fn), error)
+        return None
+    job_class = hints.job_class if hints.job_class in JOB_CLASSES else 'default'
+    snapshot = runtime_jobs_store.get_job_snapshot(hints.job_id, runtime=runtime) if hints.job_id else None
+    if snapshot:
+        # The worker starts from the snapshot document, so it must be complete before the row is visible.
+        runtime_jobs_store.persist_runtime_job_snapshot(hints.job_id, snapshot, runtime=runtime)
+    try:
+        row_id = queue.enqueue(
+            hints.job_id,
+            encoded_target,
+            payload,
+            job_class=job_class,
+            owner=hints.owner,
+            priority=(JOB_CLASSES.get(job_class) or JobClass()).priority,
+        )
+    except OverflowError as error:
+        raise JobQueueFullError('Background processing queue is full.') from error
+    if snapshot:
+        runtime_jobs_store.release_job(hints.job_id, runtime=runtime)
+    return row_id
+
+
+class DurableJobWorker:
+    """Leases jobs from ``queue`` on ``threads`` threads and runs them against ``runtime``."""
+
+    def __init__(self, queue, runtime, *, threads=2, lease_seconds=120, poll_seconds=1.0, logger=None, on_abandoned=None, holder=None):
+        self.queue = queue
+        self.runtime = runtime
+        self.threads = max(1, int(threads or 1))
+        self.lease_seconds = max(1.0, float(lease_seconds))
+        self.poll_seconds = max(0.05, float(poll_seconds))
+        self.holder = holder or f'{socket.gethostname()}-{os.getpid()}'
+        self._logger = logger
+        self._on_abandoned = on_abandoned
+        self._abandoned_since = 0.0
+
+    def run_once(self):
+        """Run at most one job; returns True when a job was leased."""
+        from lecture_processor.domains.runtime_jobs import store as runtime_jobs_store
+
+        row = self.queue.lease(self.holder, self.lease_seconds)
+        if row is None:
+            return False
+        stop_heartbeat = threading.Event()
+        heartbeat = threading.Thread(target=self._heartbeat, args=(row['id'], stop_heartbeat), name='lp-worker-heartbeat', daemon=True)
+        heartbeat.start()
+        try:
+            snapshot = None
+            if row['job_key']:
+                # Load the handed-off snapshot so the job's own mutations find it in memory.
+                snapshot = runtime_jobs_store.get_job_snapshot(row['job_key'], runtime=self.runtime)
+            if str((snapshot or {}).get('status', '') or '').lower() in TERMINAL_JOB_STATUSES:
+                # A retried lease whose previous worker died after the job's final write;
+                # running it again would repeat the provider calls and billing.
+                if self._logger is not None:
+                    self._logger.info('Skipping background job %s; it already finished.', row['job_key'])
+            else:
+                fn, args, kwargs = durable_queue.decode_job_call(row['target'], row['payload'], self.runtime)
+                fn(*args, **kwargs)
+        except Exception as error:
+            self.queue.fail(row['id'], repr(error))
+            if self._logger is not None:
+                self._logger.exception('Background job %s (%s) failed: %s', row['job_key'] or row['id'], row['target'], error)
+        else:
+            self.queue.complete(row['id'])
+        finally:
+            stop_heartbeat.set()
+            heartbeat.join(timeout=5)
+        return True
+
+    def _heartbeat(self, row_id, stop_event):
+        while not stop_event.wait(self.lease_seconds / 3.0):
+            if not self.queue.heartbeat(row_id, self.holder, self.lease_seconds):
+                return
+
+    def report_abandoned(self):
+        """Hand rows whose final lease expired (their worker died) to ``on_abandoned`` once."""
+        rows = self.queue.expired_failures(self._abandoned_since)
+        for row in rows:
+            self._abandoned_since = max(self._abandoned_since, float(row['finished_at'] or 0) + 1e-6)
+            if self._on_abandoned is not None and row['job_key']:
+                self._on_abandoned(row['job_key'])
+        return len(rows)
+
+    def _loop(self, stop_event):
+        while not stop_event.is_set():
+            try:
+                ran = self.run_once()
+            except Exception:
+                ran = False
+                if self._logger is not None:
+                    self._logger.exception('Durable job queue lease failed')
+            if not ran:
+                stop_event.wait(self.poll_seconds)
+
+    def run(self, stop_event):
+        workers = [
+            threading.Thread(target=self._loop, args=(stop_event,), name=f'lp-worker-{index}', daemon=True)
+            for index in range(self.threads)
+        ]
+        for thread in workers:
+            thread.start()
+        while not stop_event.wait(max(self.poll_seconds, 30.0)):
+            try:
+                self.report_abandoned()
+                self.queue.prune(7 * 86400)
+            except Exception:
+                if self._logger is not None:
+                    self._logger.warning('Durable job queue maintenance failed', exc_info=True)
+        for thread in workers:
+            thread.join()
+
+
+def main(app):
+    """Entry point for ``python worker.py``."""
+    from lecture_processor.domains.runtime_jobs import recovery as runtime_jobs_recovery
+
+    runtime = get_runtime(app)
+    core = runtime.core
+    queue = getattr(core, 'DURABLE_JOB_QUEUE', None)
+    if queue is None:
+        core.logger.error('The job worker needs JOB_QUEUE_MODE=durable and Firestore runtime-job storage.')
+        return 1
+    # Jobs leased here are owned by this process, so keep their state in memory.
+    core.RUNTIME_JOBS_REMOTE = False
+    worker = DurableJobWorker(
+        queue,
+        runtime,
+        threads=core.JOB_WORKERS,
+        lease_seconds=core.JOB_WORKER_LEASE_SECONDS,
+        logger=core.logger,
+        on_abandoned=lambda job_id: runtime_jobs_recovery.fail_interrupted_runtime_job(
+            job_id,
+            message='Processing was interrupted by a worker restart. Your credit has been refunded.',
+            runtime=runtime,
+        ),
+    )
+    stop_event = threading.Event()
+    for signum in (signal.SIGTERM, signal.SIGINT):
+        signal.signal(signum, lambda _signum, _frame: stop_event.set())
+    core.logger.info('Job worker %s started: threads=%s queue=%s', worker.holder, worker.threads, queue.path)
+    worker.run(stop_event)
+    return 0
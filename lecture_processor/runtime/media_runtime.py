@@ -2,6 +2,7 @@
 
 import os
 
+from lecture_processor.runtime import provider_poller
 from lecture_processor.services import file_service
 
 
@@ -105,7 +106,10 @@ def wait_for_file_processing(
     classify_provider_error_code_fn,
     max_wait_time=300,
     wait_interval=5,
+    poller=None,
 ):
+    if poller is not None:
+        return wait_for_file_processing_with_poller(uploaded_file, client=client, poller=poller, max_wait_time=max_wait_time)
     total_waited = 0
     while total_waited < max_wait_time:
         try:
@@ -135,6 +139,40 @@ def wait_for_file_processing(
     raise Exception(f'File processing timed out after {max_wait_time} seconds')
 
 
+FILE_PROCESSING_POLL_INITIAL_SECONDS = 1.0
+
+FILE_PROCESSING_POLL_MAX_SECONDS = 10.0
+
+
+def _file_processing_state(uploaded_file):
+    def _evaluate(file_info):
+        state_name = getattr(getattr(file_info, 'state', None), 'name', '')
+        if state_name == 'FAILED':
+            raise Exception(f'File processing failed: {uploaded_file.name}')
+        return state_name, state_name == 'ACTIVE'
+
+    return _evaluate
+
+
+def wait_for_file_processing_with_poller(uploaded_file, *, client, poller, max_wait_time=300):
+    """Wait on the shared provider poller until the uploaded file is ACTIVE.
+
+    Polls start at one second and back off to ten while the file stays in the
+    same state, so short files return quickly and long ones cost few calls.
+    """
+    watch = poller.watch(
+        'file',
+        uploaded_file.name,
+        lambda: client.files.get(name=uploaded_file.name),
+        _file_processing_state(uploaded_file),
+        schedules={None: provider_poller.PollSchedule(FILE_PROCESSING_POLL_INITIAL_SECONDS, FILE_PROCESSING_POLL_MAX_SECONDS)},
+        timeout_seconds=max_wait_time,
+        timeout_error=lambda: Exception(f'File processing timed out after {max_wait_time} seconds'),
+    )
+    watch.result()
+    return True
+
+
 def cleanup_files(local_paths, gemini_files, *, client, logger, os_module=os):
     for path in local_paths:
         try:
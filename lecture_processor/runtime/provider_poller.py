@@ -0,0 +1,275 @@
+"""Shared background poller for provider files and batch jobs."""
+
+from __future__ import annotations
+
+import heapq
+import itertools
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+# ``result()`` without a timeout gives up this long after the watch's own deadline.
+RESULT_GRACE_SECONDS = 60.0
+
+
+class PollSchedule:
+    """Backoff for one provider state: start at ``initial``, grow by ``factor`` up to ``maximum``."""
+
+    def __init__(self, initial, maximum=None, factor=1.6):
+        self.initial = max(0.05, float(initial))
+        self.maximum = max(self.initial, float(maximum if maximum is not None else initial))
+        self.factor = max(1.0, float(factor))
+
+    def next_interval(self, interval):
+        return min(self.maximum, max(self.initial, interval * self.factor))
+
+
+class ProviderWatch:
+    """One in-flight provider object; waiters block on it instead of polling themselves."""
+
+    def __init__(
+        self,
+        kind,
+        name,
+        fetch,
+        evaluate,
+        schedules,
+        deadline,
+        *,
+        max_consecutive_errors=None,
+        timeout_error=None,
+        clock=time.monotonic,
+    ):
+        self.kind = kind
+        self.name = name
+        self.state = ''
+        self.polls = 0
+        self._fetch = fetch
+        self._evaluate = evaluate
+        self._schedules = schedules
+        self._deadline = deadline
+        self._max_consecutive_errors = max_consecutive_errors
+        self._timeout_error = timeout_error
+        self._clock = clock
+        self._consecutive_errors = 0
+        self._interval = 0.0
+        self._condition = threading.Condition()
+        self._done = False
+        self._value = None
+        self._error = None
+
+    def _schedule_for(self, state):
+        return self._schedules.get(state) or self._schedules[None]
+
+    def done(self):
+        with self._condition:
+            return self._done
+
+    def wait_update(self, seen_polls, timeout=None):
+        """Block until a poll newer than ``seen_polls`` lands or the watch finishes; return the poll count."""
+        with self._condition:
+            self._condition.wait_for(lambda: self._done or self.polls > seen_polls, timeout)
+            return self.polls
+
+    def result(self, timeout=None):
+        """Value once resolved; without ``timeout`` waits until shortly after the watch deadline."""
+        if timeout is None:
+            timeout = max(0.0, self._deadline - self._clock()) + RESULT_GRACE_SECONDS
+        with self._condition:
+            if not self._condition.wait_for(lambda: self._done, timeout):
+                raise TimeoutError(f'Timed out waiting for provider {self.kind} {self.name}.')
+            if self._error is not None:
+                raise self._error
+            return self._value
+
+    def _record_state(self, state):
+        with self._condition:
+            self.state = state
+            self.polls += 1
+            self._condition.notify_all()
+
+    def _finish(self, value=None, error=None):
+        with self._condition:
+            self._done = True
+            self._value = value
+            self._error = error
+            self._condition.notify_all()
+
+
+class ProviderPoller:
+    """Schedules polls for every in-flight provider file and batch job.
+
+    One daemon thread keeps the schedule and hands due polls to a small fetch
+    pool, so a slow provider call delays only its own watch. Each watch backs
+    off per provider state (the interval resets when the state changes) and is
+    resolved in place, so callers wait on an event instead of running their
+    own sleep loops. ``stats`` reports in-flight counts and the recent
+    poll-call rate.
+    """
+
+    RATE_WINDOW_SECONDS = 60.0
+
+    def __init__(self, *, logger=None, is_transient_error=None, classify_error=None, clock=time.monotonic, max_fetch_workers=4):
+        self._logger = logger
+        self._is_transient_error = is_transient_error or (lambda _error: False)
+        self._classify_error = classify_error or (lambda _error: 'unknown')
+        self._clock = clock
+        self._condition = threading.Condition()
+        self._heap = []
+        self._sequence = itertools.count()
+        self._in_flight = {}
+        self._poll_calls = 0
+        self._poll_errors = 0
+        self._recent_calls = deque(maxlen=10000)
+        self._thread = None
+        self._stopped = False
+        self._max_fetch_workers = max(1, int(max_fetch_workers or 1))
+        self._executor = None
+
+    def watch(self, kind, name, fetch, evaluate, *, schedules, timeout_seconds, max_consecutive_errors=None, timeout_error=None):
+        """Start tracking ``name``; ``evaluate(value)`` returns ``(state, finished)`` or raises to fail it."""
+        if None not in schedules:
+            raise ValueError('schedules needs a default entry under None.')
+        watch = ProviderWatch(
+            kind,
+            name,
+            fetch,
+            evaluate,
+            schedules,
+            self._clock() + max(0.0, float(timeout_seconds)),
+            max_consecutive_errors=max_consecutive_errors,
+            timeout_error=timeout_error,
+            clock=self._clock,
+        )
+        with self._condition:
+            self._in_flight[kind] = self._in_flight.get(kind, 0) + 1
+            self._push(watch, self._clock())
+            self._ensure_thread()
+            self._condition.notify_all()
+        return watch
+
+    def stats(self):
+        with self._condition:
+            cutoff = self._clock() - self.RATE_WINDOW_SECONDS
+            while self._recent_calls and self._recent_calls[0] < cutoff:
+                self._recent_calls.popleft()
+            return {
+                'in_flight': dict(self._in_flight),
+                'poll_calls': self._poll_calls,
+                'poll_errors': self._poll_errors,
+                'poll_calls_last_minute': len(self._recent_calls),
+            }
+
+    def shutdown(self):
+        with self._condition:
+            self._stopped = True
+            self._condition.notify_all()
+        thread = self._thread
+        if thread is not None:
+            thread.join(timeout=5)
+        executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False)
+
+    def _push(self, watch, due_at):
+        heapq.heappush(self._heap, (min(due_at, watch._deadline), next(self._sequence), watch))
+
+    def _ensure_thread(self):
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stopped = False
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self._max_fetch_workers, thread_name_prefix='lp-provider-fetch')
+        self._thread = threading.Thread(target=self._run, name='lp-provider-poller', daemon=True)
+        self._thread.start()
+
+    def _run(self):
+        while True:
+            with self._condition:
+                while not self._stopped:
+                    now = self._clock()
+                    if self._heap and self._heap[0][0] <= now:
+                        break
+                    self._condition.wait(self._heap[0][0] - now if self._heap else None)
+                if self._stopped:
+                    return
+                due = []
+                while self._heap and self._heap[0][0] <= now:
+                    due.append(heapq.heappop(self._heap)[2])
+            for watch in due:
+                try:
+                    self._executor.submit(self._poll_and_reschedule, watch)
+                except Exception as error:
+                    # The pool is gone (interpreter shutdown); fail the watch rather than strand its waiters.
+                    self._resolve_with_error(watch, error)
+
+    def _poll_and_reschedule(self, watch):
+        try:
+            next_due = self._poll(watch)
+        except Exception as error:
+            self._resolve_with_error(watch, error)
+            return
+        with self._condition:
+            if next_due is None:
+                self._in_flight[watch.kind] = max(0, self._in_flight.get(watch.kind, 0) - 1)
+            else:
+                self._push(watch, next_due)
+                self._condition.notify_all()
+
+    def _resolve_with_error(self, watch, error):
+        if self._logger is not None:
+            self._logger.warning('Provider poll for %s %s failed unexpectedly: %s', watch.kind, watch.name, error)
+        if not watch.done():
+            watch._finish(error=error)
+        with self._condition:
+            self._poll_errors += 1
+            self._in_flight[watch.kind] = max(0, self._in_flight.get(watch.kind, 0) - 1)
+
+    def _poll(self, watch):
+        """Poll ``watch`` once; return when to poll it next, or None once it is resolved."""
+        now = self._clock()
+        if now >= watch._deadline:
+            error = watch._timeout_error() if callable(watch._timeout_error) else TimeoutError(f'Provider {watch.kind} {watch.name} timed out.')
+            watch._finish(error=error)
+            return None
+        try:
+            value = watch._fetch()
+        except Exception as error:
+            with self._condition:
+                self._poll_calls += 1
+                self._poll_errors += 1
+                self._recent_calls.append(now)
+            watch._consecutive_errors += 1
+            limit = watch._max_consecutive_errors
+            if not self._is_transient_error(error) or (limit and watch._consecutive_errors >= limit):
+                watch._finish(error=error)
+                return None
+            watch._interval = watch._schedule_for(watch.state).next_interval(watch._interval)
+            if self._logger is not None:
+                self._logger.warning(
+                    'Transient error while polling %s %s (code=%s): %s. Retrying in %.1fs',
+                    watch.kind,
+                    watch.name,
+                    self._classify_error(error),
+                    error,
+                    watch._interval,
+                )
+            return self._clock() + watch._interval
+        with self._condition:
+            self._poll_calls += 1
+            self._recent_calls.append(now)
+        watch._consecutive_errors = 0
+        try:
+            state, finished = watch._evaluate(value)
+        except Exception as error:
+            watch._finish(error=error)
+            return None
+        state = str(state or '')
+        schedule = watch._schedule_for(state)
+        watch._interval = schedule.initial if state != watch.state or not watch.polls else schedule.next_interval(watch._interval)
+        watch._record_state(state)
+        if finished:
+            watch._finish(value=value)
+            return None
+        return self._clock() + watch._interval
@@ -498,6 +498,7 @@ def delete_account_data(app_ctx, request):
             raise RuntimeError(f"Could not delete user profile document: {error}")
 
         app_ctx.auth.delete_user(uid)
+        app_ctx.AUTH_TOKEN_CACHE.invalidate_uid(uid)
 
         return app_ctx.jsonify({
             'ok': True,
@@ -175,6 +175,7 @@ def _build_cost_analysis_payload(app_ctx, normalized_filters):
                     'cost_usd': float(stage.get('cost_usd', 0.0) or 0.0),
                     'cost_eur': float(stage.get('cost_usd', 0.0) or 0.0) * usd_to_eur,
                     'matched_pricing': bool(stage.get('matched_pricing', False)),
+                    'cache_hit': bool(stage.get('cache_hit', False)),
                 }
             )
 
@@ -345,6 +346,7 @@ def admin_cost_analysis_export(app_ctx, request):
             'cost_usd',
             'cost_eur',
             'matched_pricing',
+            'cache_hit',
         ]
     )
     for stage in analysis.get('stages', []) or []:
@@ -366,6 +368,7 @@ def admin_cost_analysis_export(app_ctx, request):
                 sanitize_excel_cell(float(stage.get('cost_usd', 0.0) or 0.0)),
                 sanitize_excel_cell(float(stage.get('cost_eur', 0.0) or 0.0)),
                 sanitize_excel_cell(bool(stage.get('matched_pricing', False))),
+                sanitize_excel_cell(bool(stage.get('cache_hit', False))),
             ]
         )
 
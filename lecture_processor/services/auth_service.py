@@ -1,15 +1,99 @@
 """Authentication utility helpers."""
 
+import hashlib
+import threading
+import time
+from collections import OrderedDict
 
-def verify_firebase_token(request, auth_module, logger):
+
+class VerifiedTokenCache:
+    """Bounded LRU of decoded Firebase ID tokens keyed by a hash of the raw token.
+
+    An entry is trusted until the token's ``exp`` or until ``revalidate_seconds``
+    after it was verified, whichever comes first; after that the next request
+    verifies the token again (and so picks up revocation when that is checked).
+    """
+
+    def __init__(self, max_entries=4096, revalidate_seconds=300, *, clock=time.time):
+        self.max_entries = max(0, int(max_entries or 0))
+        self.revalidate_seconds = max(0.0, float(revalidate_seconds or 0))
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()
+        self._counters = {'hits': 0, 'misses': 0, 'evictions': 0}
+
+    @staticmethod
+    def _key(token):
+        return hashlib.sha256(str(token).encode('utf-8')).hexdigest()
+
+    def get(self, token):
+        if self.max_entries <= 0:
+            return None
+        key = self._key(token)
+        now = self._clock()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] > now:
+                self._entries.move_to_end(key)
+                self._counters['hits'] += 1
+                return dict(entry[1])
+            if entry is not None:
+                del self._entries[key]
+            self._counters['misses'] += 1
+            return None
+
+    def put(self, token, decoded):
+        if self.max_entries <= 0 or not isinstance(decoded, dict):
+            return
+        now = self._clock()
+        try:
+            expires_at = float(decoded.get('exp', 0) or 0)
+        except (TypeError, ValueError):
+            expires_at = 0.0
+        trusted_until = min(expires_at, now + self.revalidate_seconds)
+        if trusted_until <= now:
+            return
+        key = self._key(token)
+        with self._lock:
+            self._entries[key] = (trusted_until, dict(decoded))
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self._counters['evictions'] += 1
+
+    def invalidate_uid(self, uid):
+        """Drop every cached token of ``uid`` (e.g. once the account is deleted)."""
+        safe_uid = str(uid or '')
+        with self._lock:
+            stale = [key for key, (_until, decoded) in self._entries.items() if decoded.get('uid') == safe_uid]
+            for key in stale:
+                del self._entries[key]
+        return len(stale)
+
+    def stats(self):
+        with self._lock:
+            return dict(self._counters, entries=len(self._entries))
+
+
+def verify_firebase_token(request, auth_module, logger, token_cache=None, check_revoked=False):
     """Return decoded Firebase token dict, or None when invalid/missing."""
     auth_header = request.headers.get('Authorization', '')
     if not auth_header.startswith('Bearer '):
         return None
     token = auth_header.split('Bearer ', 1)[1]
+    if token_cache is not None:
+        cached = token_cache.get(token)
+        if cached is not None:
+            return cached
     try:
-        return auth_module.verify_id_token(token)
+        if check_revoked:
+            decoded = auth_module.verify_id_token(token, check_revoked=True)
+        else:
+            decoded = auth_module.verify_id_token(token)
     except Exception as exc:
         if logger is not None:
             logger.info(f"Token verification failed: {exc}")
         return None
+    if token_cache is not None:
+        token_cache.put(token, decoded)
+    return decoded
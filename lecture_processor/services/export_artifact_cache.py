@@ -0,0 +1,111 @@
+"""Content-addressed disk cache for rendered export files (DOCX/CSV bytes).
+
+Keys hash the artifact kind with everything the renderer reads, so a finished
+batch downloaded twice reuses the bytes rendered the first time while any
+edit to a row's content produces a new key. Entries expire after
+BATCH_ARTIFACT_CACHE_TTL_SECONDS and the least recently used ones are pruned
+beyond BATCH_ARTIFACT_CACHE_MAX_ENTRIES.
+"""
+
+import hashlib
+import json
+import os
+import uuid
+
+# Bump when the DOCX/CSV renderers change output for the same inputs.
+ARTIFACT_FORMAT_VERSION = 1
+
+
+def artifact_key(kind, payload):
+    encoded = json.dumps(
+        {'kind': str(kind), 'version': ARTIFACT_FORMAT_VERSION, 'payload': payload},
+        sort_keys=True,
+        ensure_ascii=False,
+        default=str,
+    )
+    return hashlib.sha256(encoded.encode('utf-8')).hexdigest()
+
+
+def _entry_path(app_ctx, key):
+    return os.path.join(app_ctx.BATCH_ARTIFACT_CACHE_DIR, f'{key}.bin')
+
+
+def get_artifact(app_ctx, key):
+    """Return cached bytes for ``key`` or None; lookups never raise."""
+    if not key or int(app_ctx.BATCH_ARTIFACT_CACHE_MAX_ENTRIES) <= 0:
+        return None
+    path = _entry_path(app_ctx, key)
+    now_ts = app_ctx.time.time()
+    try:
+        if not os.path.exists(path):
+            return None
+        if now_ts - os.path.getmtime(path) > float(app_ctx.BATCH_ARTIFACT_CACHE_TTL_SECONDS):
+            os.remove(path)
+            return None
+        with open(path, 'rb') as handle:
+            data = handle.read()
+        os.utime(path, (now_ts, now_ts))
+        return data
+    except Exception:
+        app_ctx.logger.warning('Export artifact cache read failed for %s', key, exc_info=True)
+        return None
+
+
+def store_artifact(app_ctx, key, data, prune=True):
+    """Best-effort write of ``data``; returns True when it was stored."""
+    if not key or not isinstance(data, (bytes, bytearray)) or int(app_ctx.BATCH_ARTIFACT_CACHE_MAX_ENTRIES) <= 0:
+        return False
+    try:
+        os.makedirs(app_ctx.BATCH_ARTIFACT_CACHE_DIR, exist_ok=True)
+        path = _entry_path(app_ctx, key)
+        temp_path = f'{path}.{uuid.uuid4().hex}.tmp'
+        with open(temp_path, 'wb') as handle:
+            handle.write(data)
+        os.replace(temp_path, path)
+        now_ts = app_ctx.time.time()
+        os.utime(path, (now_ts, now_ts))
+    except Exception:
+        app_ctx.logger.warning('Export artifact cache write failed for %s', key, exc_info=True)
+        return False
+    if prune:
+        prune_artifacts(app_ctx)
+    return True
+
+
+def get_or_render(app_ctx, kind, payload, render, prune=True):
+    """Return cached bytes for ``(kind, payload)`` or call ``render()`` and cache the result."""
+    key = artifact_key(kind, payload)
+    data = get_artifact(app_ctx, key)
+    if data is None:
+        data = render()
+        store_artifact(app_ctx, key, data, prune=prune)
+    return data
+
+
+def prune_artifacts(app_ctx):
+    cache_dir = app_ctx.BATCH_ARTIFACT_CACHE_DIR
+    try:
+        names = [name for name in os.listdir(cache_dir) if name.endswith('.bin')]
+    except OSError:
+        return 0
+    now_ts = app_ctx.time.time()
+    ttl_seconds = float(app_ctx.BATCH_ARTIFACT_CACHE_TTL_SECONDS)
+    stamped = []
+    for name in names:
+        path = os.path.join(cache_dir, name)
+        try:
+            stamped.append((os.path.getmtime(path), path))
+        except OSError:
+            continue
+    stamped.sort()
+    overflow = max(0, len(stamped) - int(app_ctx.BATCH_ARTIFACT_CACHE_MAX_ENTRIES))
+    removed = 0
+    for index, (mtime, path) in enumerate(stamped):
+        if index >= overflow and now_ts - mtime <= ttl_seconds:
+            break
+        try:
+            os.remove(path)
+            removed += 1
+        except OSError:
+            continue
+    return removed
@@ -618,6 +618,121 @@ def convert_audio_to_mp3_with_ytdlp(
     return local_audio_path, False
 
 
+def _remove_quietly(paths):
+    for path in paths:
+        try:
+            if path and os.path.exists(path):
+                os.remove(path)
+        except Exception:
+            pass
+
+
+def preprocess_audio_for_transcription(
+    local_audio_path,
+    *,
+    ffmpeg_binary_getter,
+    logger,
+    subprocess_module=subprocess,
+    bitrate_kbps=48,
+    sample_rate_hz=16000,
+    trim_silence=False,
+):
+    """Re-encode audio as mono, speech-bitrate MP3 for provider upload.
+
+    With ``trim_silence`` pauses longer than two seconds are cut, so the output
+    (not the original) is what transcript timestamps refer to. Returns
+    ``(path, converted)``; on failure the original path and False.
+    """
+    ffmpeg_bin = ffmpeg_binary_getter()
+    if not local_audio_path or not ffmpeg_bin:
+        return local_audio_path, False
+    output_path = f"{os.path.splitext(local_audio_path)[0]}_speech.mp3"
+    command = [ffmpeg_bin, '-y', '-i', local_audio_path, '-vn', '-ac', '1', '-ar', str(int(sample_rate_hz))]
+    if trim_silence:
+        command.extend(['-af', 'silenceremove=start_periods=1:stop_periods=-1:stop_duration=2:stop_threshold=-45dB'])
+    command.extend(['-codec:a', 'libmp3lame', '-b:a', f'{int(bitrate_kbps)}k', output_path])
+    try:
+        result = subprocess_module.run(command, check=False, capture_output=True, text=True, timeout=900)
+        if result.returncode == 0 and os.path.exists(output_path) and os.path.getsize(output_path) > 0:
+            return output_path, True
+        if logger is not None:
+            logger.info(f"⚠️ ffmpeg speech preprocessing failed: {(result.stderr or '').strip()[:300]}")
+    except Exception as exc:
+        if logger is not None:
+            logger.info(f"⚠️ ffmpeg speech preprocessing exception: {exc}")
+    _remove_quietly([output_path])
+    return local_audio_path, False
+
+
+_FFMPEG_DURATION_RE = re.compile(r'Duration:\s*(\d+):(\d{2}):(\d{2}(?:\.\d+)?)')
+
+
+def probe_audio_duration_seconds(path, *, ffmpeg_binary_getter, ffprobe_binary_getter, subprocess_module=subprocess):
+    """Duration in seconds via ffprobe, else parsed from ``ffmpeg -i``; 0.0 when unknown."""
+    if not path or not os.path.exists(path):
+        return 0.0
+    ffprobe_bin = ffprobe_binary_getter()
+    try:
+        if ffprobe_bin:
+            result = subprocess_module.run(
+                [ffprobe_bin, '-v', 'error', '-show_entries', 'format=duration', '-of', 'default=noprint_wrappers=1:nokey=1', path],
+                check=False,
+                capture_output=True,
+                text=True,
+                timeout=30,
+            )
+            if result.returncode == 0:
+                return max(0.0, float((result.stdout or '').strip().splitlines()[0]))
+        ffmpeg_bin = ffmpeg_binary_getter()
+        if ffmpeg_bin:
+            result = subprocess_module.run([ffmpeg_bin, '-hide_banner', '-i', path], check=False, capture_output=True, text=True, timeout=30)
+            match = _FFMPEG_DURATION_RE.search(result.stderr or '')
+            if match:
+                hours, minutes, seconds = match.groups()
+                return int(hours) * 3600 + int(minutes) * 60 + float(seconds)
+    except Exception:
+        return 0.0
+    return 0.0
+
+
+def split_audio_segments(path, windows, *, ffmpeg_binary_getter, logger, subprocess_module=subprocess):
+    """Cut ``(start_seconds, end_seconds)`` windows out of ``path`` by stream copy.
+
+    Returns the segment paths in order, or ``[]`` (with nothing left on disk)
+    if any cut fails so the caller can fall back to the whole file.
+    """
+    ffmpeg_bin = ffmpeg_binary_getter()
+    if not path or not ffmpeg_bin or not windows:
+        return []
+    base_no_ext, extension = os.path.splitext(path)
+    segment_paths = []
+    for index, (start_seconds, end_seconds) in enumerate(windows):
+        segment_path = f"{base_no_ext}_part{index:03d}{extension or '.mp3'}"
+        command = [
+            ffmpeg_bin,
+            '-y',
+            '-ss', f'{float(start_seconds):.3f}',
+            '-i', path,
+            '-t', f'{max(0.0, float(end_seconds) - float(start_seconds)):.3f}',
+            '-vn',
+            '-c', 'copy',
+            segment_path,
+        ]
+        segment_paths.append(segment_path)
+        try:
+            result = subprocess_module.run(command, check=False, capture_output=True, text=True, timeout=300)
+            if result.returncode == 0 and os.path.exists(segment_path):
+                continue
+            if logger is not None:
+                logger.info(f"⚠️ ffmpeg audio split failed: {(result.stderr or '').strip()[:300]}")
+        except Exception as exc:
+            if logger is not None:
+                logger.info(f"⚠️ ffmpeg audio split exception: {exc}")
+        _remove_quietly(segment_paths)
+        return []
+    return segment_paths
+
+
 def get_mime_type(filename):
     parts = filename.rsplit('.', 1)
     ext = parts[1].lower() if len(parts) > 1 else ''
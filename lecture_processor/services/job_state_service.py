@@ -1,5 +1,9 @@
 """Thread-safe in-memory job state helpers."""
 
+import threading
+import time
+from contextlib import contextmanager
+
 
 def get_job_snapshot(job_id, *, jobs_store, lock):
     with lock:
@@ -39,3 +43,221 @@ def count_active_jobs_for_user(uid, *, jobs_store, lock, active_states=None):
             if job.get('user_id') == uid and job.get('status') in states:
                 count += 1
         return count
+
+
+TERMINAL_JOB_STATUSES = frozenset({'complete', 'error'})
+
+SNAPSHOT_SWEEP_INTERVAL_SECONDS = 60.0
+
+_MISSING = object()
+
+
+def _estimate_payload_bytes(value):
+    if isinstance(value, str):
+        return len(value)
+    if isinstance(value, dict):
+        return sum(len(str(key)) + _estimate_payload_bytes(item) for key, item in value.items())
+    if isinstance(value, (list, tuple)):
+        return sum(_estimate_payload_bytes(item) for item in value)
+    return 8
+
+
+class SnapshotWriteBehind:
+    """Dirty-field tracking for write-behind runtime job snapshots.
+
+    ``stage`` diffs a job's sanitized fields against what was last handed out for
+    writing and decides whether the changed fields go out now or wait for the
+    debounce window; ``take`` drains what a deferred flush should write. Terminal
+    statuses always flush immediately. The caller does the actual Firestore write
+    while holding ``write_lock(job_id)`` so writes for one job stay ordered.
+    """
+
+    def __init__(self, debounce_seconds=2.0, *, idle_retention_seconds=3600.0, clock=time.monotonic):
+        self.debounce_seconds = max(0.0, float(debounce_seconds or 0.0))
+        self.idle_retention_seconds = float(idle_retention_seconds)
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._jobs = {}
+        self._totals = {'updates': 0, 'writes': 0, 'bytes_written': 0, 'bytes_full': 0}
+        self._next_sweep_at = 0.0
+
+    def __len__(self):
+        with self._lock:
+            return len(self._jobs)
+
+    def _entry(self, job_id):
+        entry = self._jobs.get(job_id)
+        if entry is None:
+            entry = {
+                'written': {},
+                'pending': {},
+                'sizes': {},
+                'last_write': None,
+                'timer_due': None,
+                'touched': 0.0,
+                'write_lock': threading.Lock(),
+                'updates': 0,
+                'writes': 0,
+                'bytes_written': 0,
+                'bytes_full': 0,
+            }
+            self._jobs[job_id] = entry
+        return entry
+
+    def write_lock(self, job_id):
+        with self._lock:
+            return self._entry(job_id)['write_lock']
+
+    def _drain(self, entry, now):
+        fields = entry['pending']
+        entry['pending'] = {}
+        entry['timer_due'] = None
+        if not fields:
+            return fields
+        entry['written'].update(fields)
+        entry['last_write'] = now
+        written_bytes = sum(entry['sizes'].get(field, 0) for field in fields)
+        entry['writes'] += 1
+        entry['bytes_written'] += written_bytes
+        self._totals['writes'] += 1
+        self._totals['bytes_written'] += written_bytes
+        return fields
+
+    def stage(self, job_id, fields):
+        """Record the job's current fields; return ``(fields_to_write_now, flush_delay)``.
+
+        ``flush_delay`` is set only when the caller must schedule a deferred flush.
+        """
+        now = self._clock()
+        with self._lock:
+            self._sweep(now)
+            entry = self._entry(job_id)
+            entry['touched'] = now
+            written = entry['written']
+            pending = entry['pending']
+            sizes = entry['sizes']
+            for field, value in fields.items():
+                known = pending[field] if field in pending else written.get(field, _MISSING)
+                if known is _MISSING or known != value:
+                    pending[field] = value
+                    sizes[field] = _estimate_payload_bytes(value)
+            full_bytes = sum(sizes.get(field, 0) for field in fields)
+            entry['updates'] += 1
+            entry['bytes_full'] += full_bytes
+            self._totals['updates'] += 1
+            self._totals['bytes_full'] += full_bytes
+            if not pending:
+                return {}, None
+            last_write = entry['last_write']
+            if (
+                fields.get('status') in TERMINAL_JOB_STATUSES
+                or last_write is None
+                or now - last_write >= self.debounce_seconds
+            ):
+                return self._drain(entry, now), None
+            if entry['timer_due'] is not None:
+                return {}, None
+            entry['timer_due'] = last_write + self.debounce_seconds
+            return {}, max(0.0, entry['timer_due'] - now)
+
+    def take(self, job_id):
+        """Drain the fields a deferred flush should write for ``job_id``."""
+        with self._lock:
+            entry = self._jobs.get(job_id)
+            if entry is None:
+                return {}
+            return self._drain(entry, self._clock())
+
+    def invalidate(self, job_id):
+        """Forget what was written so the next update rewrites every field."""
+        with self._lock:
+            entry = self._jobs.get(job_id)
+            if entry is not None:
+                entry['written'] = {}
+
+    def forget(self, job_id):
+        with self._lock:
+            self._jobs.pop(job_id, None)
+
+    def _sweep(self, now):
+        if now < self._next_sweep_at:
+            return
+        self._next_sweep_at = now + SNAPSHOT_SWEEP_INTERVAL_SECONDS
+        cutoff = now - self.idle_retention_seconds
+        for job_id in [key for key, entry in self._jobs.items() if entry['touched'] < cutoff and not entry['pending']]:
+            self._jobs.pop(job_id, None)
+
+    def stats(self, job_id=None):
+        """Writes and bytes saved versus writing the full snapshot on every update."""
+        with self._lock:
+            source = self._totals if job_id is None else self._jobs.get(job_id)
+            if source is None:
+                return {'updates': 0, 'writes': 0, 'writes_saved': 0, 'bytes_written': 0, 'bytes_saved': 0}
+            return {
+                'updates': source['updates'],
+                'writes': source['writes'],
+                'writes_saved': max(0, source['updates'] - source['writes']),
+                'bytes_written': source['bytes_written'],
+                'bytes_saved': max(0, source['bytes_full'] - source['bytes_written']),
+            }
+
+
+class _JobWatch:
+    def __init__(self, condition, entry):
+        self._condition = condition
+        self._entry = entry
+        self._seen = entry[1]
+
+    def wait(self, timeout):
+        """Block until the job is mutated or ``timeout`` elapses; True if it was mutated."""
+        with self._condition:
+            changed = self._condition.wait_for(lambda: self._entry[1] != self._seen, timeout)
+            self._seen = self._entry[1]
+            return changed
+
+
+class JobChangeNotifier:
+    """Wakes long-poll requests waiting on a job when the job is mutated.
+
+    Only jobs with an active watcher are tracked, so nothing is kept for jobs
+    nobody is waiting on.
+    """
+
+    def __init__(self):
+        self._condition = threading.Condition()
+        self._watched = {}
+        self._active = 0
+
+    def notify(self, job_id):
+        with self._condition:
+            entry = self._watched.get(job_id)
+            if entry is None:
+                return
+            entry[1] += 1
+            self._condition.notify_all()
+
+    @contextmanager
+    def watch(self, job_id, max_watchers=0):
+        """Register a watch on ``job_id``; yields None when ``max_watchers`` are already waiting."""
+        with self._condition:
+            if max_watchers and self._active >= max_watchers:
+                entry = None
+            else:
+                entry = self._watched.setdefault(job_id, [0, 0])
+                entry[0] += 1
+                self._active += 1
+        if entry is None:
+            yield None
+            return
+        try:
+            yield _JobWatch(self._condition, entry)
+        finally:
+            with self._condition:
+                entry[0] -= 1
+                self._active -= 1
+                if entry[0] <= 0 and self._watched.get(job_id) is entry:
+                    self._watched.pop(job_id, None)
+
+    def watcher_count(self):
+        with self._condition:
+            return self._active
@@ -18,7 +18,7 @@ from lecture_processor.domains.physio import knowledge as physio_knowledge
 from lecture_processor.domains.physio import prompts as physio_prompts
 from lecture_processor.domains.physio import transcription as physio_transcription
 from lecture_processor.repositories import physio_repo
-from lecture_processor.runtime.job_dispatcher import JobQueueFullError
+from lecture_processor.runtime.job_dispatcher import JobQueueFullError, ScheduledJob
 
 
 DEFAULT_BODY_REGION = "algemeen"
@@ -312,7 +312,13 @@ def create_transcription_job(app_ctx, request):
     )
     try:
         app_ctx.submit_background_job(
-            physio_transcription.process_physio_transcription,
+            ScheduledJob(
+                physio_transcription.process_physio_transcription,
+                job_class="physio_transcription",
+                owner=decoded_token["uid"],
+                job_id=job_id,
+                size_mb=audio_size / (1024 * 1024),
+            ),
             job_id,
             audio_path,
             runtime=app_ctx,
@@ -1,26 +1,106 @@
 """Rate limiting helpers with Firestore-first fallback strategy."""
 
 import hashlib
+import math
 
 from lecture_processor.repositories import rate_limit_repo
 
+RATE_LIMIT_LEASE_PRUNE_THRESHOLD = 4096
+RATE_LIMIT_SWEEP_INTERVAL_SECONDS = 60.0
+
+
+class SlidingWindowCounters:
+    """Sliding-window-counter state for the in-memory fallback limiter.
+
+    Each key keeps its current fixed window's start and count plus the count
+    of the window before it. The previous count is weighted by how much of
+    that window still overlaps the sliding window, so memory per key is
+    constant. Keys idle for two full windows carry no weight and are swept
+    at most once per ``sweep_interval_seconds``, amortized over checks.
+    Callers serialize access with the limiter lock.
+    """
+
+    def __init__(self, *, sweep_interval_seconds=RATE_LIMIT_SWEEP_INTERVAL_SECONDS):
+        self.sweep_interval_seconds = float(sweep_interval_seconds)
+        self._entries = {}
+        self._next_sweep_at = 0.0
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, key):
+        return key in self._entries
+
+    def hit(self, key, limit, window_seconds, now_ts):
+        """Count one request for ``key`` if allowed; return ``(allowed, retry_after)``."""
+        if now_ts >= self._next_sweep_at:
+            self.sweep(now_ts)
+        window = float(window_seconds)
+        window_start = now_ts - (now_ts % window)
+        entry = self._entries.get(key)
+        if entry is None or entry[3] != window:
+            entry = self._entries[key] = [window_start, 0, 0, window]
+        elif entry[0] != window_start:
+            entry[1] = entry[2] if window_start - entry[0] == window else 0
+            entry[2] = 0
+            entry[0] = window_start
+        elapsed = now_ts - window_start
+        estimate = entry[1] * ((window - elapsed) / window) + entry[2]
+        if estimate + 1 > limit:
+            return False, self._retry_after(entry, limit, elapsed)
+        entry[2] += 1
+        return True, 0
+
+    @staticmethod
+    def _retry_after(entry, limit, elapsed):
+        _window_start, previous, current, window = entry
+        allowed_before = limit - 1
+        if current <= allowed_before and previous > 0:
+            # The previous window's weight decays to zero by the end of this one.
+            wait = window * (1.0 - (allowed_before - current) / previous) - elapsed
+        else:
+            wait = (window - elapsed) + window * (1.0 - allowed_before / current)
+        return max(1, int(math.ceil(round(wait, 6))))
+
+    def sweep(self, now_ts):
+        """Drop keys whose current and previous windows have both ended."""
+        idle = [key for key, entry in self._entries.items() if now_ts - entry[0] >= 2 * entry[3]]
+        for key in idle:
+            del self._entries[key]
+        self._next_sweep_at = now_ts + self.sweep_interval_seconds
+        return len(idle)
+
 
 def window_counter_id(key, window_seconds, window_start):
     raw = f"{key}|{window_seconds}|{int(window_start)}".encode('utf-8')
     return hashlib.sha256(raw).hexdigest()
 
 
-def check_rate_limit_firestore(
+def lease_size_for_limit(limit, lease_percent):
+    """Tokens one worker reserves per Firestore transaction; 1 means no leasing."""
+    safe_limit = max(1, int(limit))
+    safe_percent = min(100, max(0, int(lease_percent or 0)))
+    return min(safe_limit, max(1, int(math.ceil(safe_limit * safe_percent / 100.0))))
+
+
+def lease_rate_limit_tokens_firestore(
     key,
     limit,
     window_seconds,
     now_ts,
+    requested,
     *,
     firestore_enabled,
     db,
     firestore_module,
     counter_collection,
 ):
+    """Reserve up to ``requested`` tokens of the current window in one transaction.
+
+    Returns ``(granted, retry_after)``, or None when Firestore is unavailable.
+    The shared counter counts reserved tokens, so the window total can never
+    exceed ``limit`` however the tokens are spread across workers.
+    """
     if not firestore_enabled or db is None:
         return None
     try:
@@ -36,60 +116,168 @@ def check_rate_limit_firestore(
             count = 0
             if snapshot.exists:
                 count = int((snapshot.to_dict() or {}).get('count', 0) or 0)
-            if count >= limit:
-                return False, retry_after
+            granted = min(max(1, int(requested)), int(limit) - count)
+            if granted <= 0:
+                return 0, retry_after
             txn.set(counter_ref, {
                 'key': key,
-                'count': count + 1,
+                'count': count + granted,
                 'window_start': window_start,
                 'window_seconds': int(window_seconds),
                 'updated_at': now_ts,
                 'expires_at': window_start + (window_seconds * 3),
             }, merge=True)
-            return True, 0
+            return granted, 0
 
         return _txn(transaction)
     except Exception:
         return None
 
 
-def check_rate_limit(
+def check_rate_limit_firestore(
     key,
     limit,
     window_seconds,
+    now_ts,
     *,
     firestore_enabled,
     db,
     firestore_module,
     counter_collection,
-    in_memory_events,
-    in_memory_lock,
-    time_module,
 ):
-    now_ts = time_module.time()
-    firestore_result = check_rate_limit_firestore(
+    leased = lease_rate_limit_tokens_firestore(
+        key,
+        limit,
+        window_seconds,
+        now_ts,
+        1,
+        firestore_enabled=firestore_enabled,
+        db=db,
+        firestore_module=firestore_module,
+        counter_collection=counter_collection,
+    )
+    if leased is None:
+        return None
+    granted, retry_after = leased
+    return (True, 0) if granted > 0 else (False, retry_after)
+
+
+def _take_leased_token(lease_state, lease_key, window_start):
+    lease = lease_state.get(lease_key)
+    if lease is None:
+        return False
+    if lease['window_start'] != window_start:
+        lease_state.pop(lease_key, None)
+        return False
+    if lease['remaining'] <= 0:
+        return False
+    lease['remaining'] -= 1
+    return True
+
+
+def _prune_expired_leases(lease_state, now_ts):
+    for lease_key in [item for item, lease in lease_state.items() if lease['window_end'] <= now_ts]:
+        lease_state.pop(lease_key, None)
+
+
+def check_rate_limit_leased(
+    key,
+    limit,
+    window_seconds,
+    now_ts,
+    *,
+    lease_percent,
+    lease_state,
+    lease_lock,
+    firestore_enabled,
+    db,
+    firestore_module,
+    counter_collection,
+):
+    """Serve the check from a locally leased slice of the Firestore window counter.
+
+    A worker reserves ``lease_size_for_limit`` tokens per transaction and then
+    answers from memory until the slice runs out or the window ends. Leasing
+    never admits more than ``limit`` per window across workers; the cost is
+    that tokens idle in one worker's lease can make another deny early.
+    Returns None when Firestore is unavailable, like the unleased check.
+    """
+    window_start = int(now_ts // window_seconds) * int(window_seconds)
+    lease_key = (key, int(window_seconds))
+    with lease_lock:
+        if _take_leased_token(lease_state, lease_key, window_start):
+            return True, 0
+    leased = lease_rate_limit_tokens_firestore(
         key,
         limit,
         window_seconds,
         now_ts,
+        lease_size_for_limit(limit, lease_percent),
         firestore_enabled=firestore_enabled,
         db=db,
         firestore_module=firestore_module,
         counter_collection=counter_collection,
     )
+    if leased is None:
+        return None
+    granted, retry_after = leased
+    if granted <= 0:
+        return False, retry_after
+    with lease_lock:
+        if len(lease_state) >= RATE_LIMIT_LEASE_PRUNE_THRESHOLD:
+            _prune_expired_leases(lease_state, now_ts)
+        lease = lease_state.get(lease_key)
+        if lease is None or lease['window_start'] != window_start:
+            lease = {'window_start': window_start, 'window_end': window_start + int(window_seconds), 'remaining': 0}
+            lease_state[lease_key] = lease
+        # Concurrent leases for the same key simply pool their tokens.
+        lease['remaining'] += granted - 1
+    return True, 0
+
+
+def check_rate_limit(
+    key,
+    limit,
+    window_seconds,
+    *,
+    firestore_enabled,
+    db,
+    firestore_module,
+    counter_collection,
+    in_memory_events,
+    in_memory_lock,
+    time_module,
+    lease_percent=0,
+    lease_state=None,
+):
+    now_ts = time_module.time()
+    if lease_state is not None and lease_size_for_limit(limit, lease_percent) > 1:
+        firestore_result = check_rate_limit_leased(
+            key,
+            limit,
+            window_seconds,
+            now_ts,
+            lease_percent=lease_percent,
+            lease_state=lease_state,
+            lease_lock=in_memory_lock,
+            firestore_enabled=firestore_enabled,
+            db=db,
+            firestore_module=firestore_module,
+            counter_collection=counter_collection,
+        )
+    else:
+        firestore_result = check_rate_limit_firestore(
+            key,
+            limit,
+            window_seconds,
+            now_ts,
+            firestore_enabled=firestore_enabled,
+            db=db,
+            firestore_module=firestore_module,
+            counter_collection=counter_collection,
+        )
     if firestore_result is not None:
         return firestore_result
 
     with in_memory_lock:
-        timestamps = in_memory_events.get(key, [])
-        cutoff = now_ts - window_seconds
-        kept = [ts for ts in timestamps if ts >= cutoff]
-        if len(kept) >= limit:
-            oldest = kept[0]
-            retry_after = max(1, int((oldest + window_seconds) - now_ts))
-            in_memory_events[key] = kept
-            return False, retry_after
-        kept.append(now_ts)
-        in_memory_events[key] = kept
-
-    return True, 0
+        return in_memory_events.hit(key, limit, window_seconds, now_ts)
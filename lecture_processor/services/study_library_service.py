@@ -315,6 +315,7 @@ def delete_study_pack(app_ctx, request, pack_id):
         pack_ref.delete()
         try:
             app_ctx.get_study_card_state_doc(uid, pack_id).delete()
+            study_progress.remove_pack_from_due_histogram(app_ctx.get_study_progress_doc(uid), pack_id, runtime=app_ctx)
         except Exception as error:
             app_ctx.logger.warning(f"Warning: could not delete study progress state for pack {pack_id}: {error}")
         return app_ctx.jsonify({'ok': True})
@@ -98,6 +98,7 @@ def update_study_progress(app_ctx, request):
 
         card_states = payload.get('card_states')
         validated_card_state_writes = []
+        due_histogram_entries = []
         if card_states is not None:
             if not isinstance(card_states, dict):
                 return app_ctx.jsonify({'error': 'card_states must be an object'}), 400
@@ -126,6 +127,9 @@ def update_study_progress(app_ctx, request):
                     cleaned_state,
                     runtime=app_ctx,
                 )
+                due_histogram_entries.append(
+                    study_progress.build_due_histogram_entry(pack_id, merged_state, runtime=app_ctx)
+                )
                 validated_card_state_writes.append(
                     (
                         doc_ref,
@@ -138,6 +142,20 @@ def update_study_progress(app_ctx, request):
                     )
                 )
 
+        existing_due_histogram = existing_progress_data.get('due_histogram')
+        if due_histogram_entries or sanitized_remove_pack_ids:
+            if isinstance(existing_due_histogram, dict):
+                updates['due_histogram'] = study_progress.due_histogram_updates(
+                    due_histogram_entries,
+                    sanitized_remove_pack_ids,
+                    runtime=app_ctx,
+                )
+            else:
+                # Legacy progress docs get their histogram from a full scan on the
+                # next summary read; a partial one here would undercount, and one a
+                # concurrent backfill stored since our read would miss these writes.
+                updates['due_histogram'] = app_ctx.firestore.DELETE_FIELD
+
         if getattr(app_ctx.db, 'batch', None):
             batch = app_ctx.db.batch()
             batch.set(progress_ref, updates, merge=True)
@@ -159,19 +177,61 @@ def update_study_progress(app_ctx, request):
         return app_ctx.jsonify({'error': 'Could not save study progress'}), 500
 
 
+def _backfill_due_histogram(app_ctx, progress_ref, read_snapshot, due_histogram):
+    """Store a scanned histogram unless the progress doc changed after ``read_snapshot``.
+
+    Card-state writes rewrite the progress doc in the same batch, so an
+    unchanged doc means the scan is still current. Otherwise nothing is
+    written and the next summary read scans again.
+    """
+    transaction = app_ctx.db.transaction()
+
+    @app_ctx.firestore.transactional
+    def _txn(txn):
+        snapshot = progress_ref.get(transaction=txn)
+        if snapshot.exists != read_snapshot.exists:
+            return False
+        if getattr(snapshot, 'update_time', None) != getattr(read_snapshot, 'update_time', None):
+            return False
+        txn.set(progress_ref, {'due_histogram': due_histogram}, merge=True)
+        return True
+
+    return _txn(transaction)
+
+
 def get_study_progress_summary(app_ctx, request):
     decoded_token, error_response, status = study_api_support.require_user(app_ctx, request)
     if error_response is not None:
         return error_response, status
     uid = decoded_token['uid']
     try:
-        progress_doc = app_ctx.get_study_progress_doc(uid).get()
+        progress_ref = app_ctx.get_study_progress_doc(uid)
+        progress_doc = progress_ref.get()
         progress_data = progress_doc.to_dict() if progress_doc.exists else {}
+        if isinstance(progress_data.get('due_histogram'), dict):
+            return app_ctx.jsonify(
+                study_progress.compute_study_progress_summary(progress_data, None, runtime=app_ctx)
+            )
+
         card_state_maps = []
+        due_histogram_entries = []
         docs = app_ctx.study_repo.list_study_card_states_by_uid(app_ctx.db, uid, app_ctx.MAX_PROGRESS_PACKS_PER_SYNC)
         for doc in docs:
             data = doc.to_dict() or {}
-            card_state_maps.append(study_progress.sanitize_card_state_map(data.get('state', {}), runtime=app_ctx))
+            state_map = study_progress.sanitize_card_state_map(data.get('state', {}), runtime=app_ctx)
+            card_state_maps.append(state_map)
+            pack_id = study_progress.sanitize_pack_id(data.get('pack_id', ''), runtime=app_ctx)
+            if pack_id:
+                due_histogram_entries.append(study_progress.build_due_histogram_entry(pack_id, state_map, runtime=app_ctx))
+        try:
+            _backfill_due_histogram(
+                app_ctx,
+                progress_ref,
+                progress_doc,
+                study_progress.encode_due_histogram(due_histogram_entries, runtime=app_ctx),
+            )
+        except Exception as error:
+            app_ctx.logger.warning(f"Warning: could not backfill due histogram for user {uid}: {error}")
 
         return app_ctx.jsonify(
             study_progress.compute_study_progress_summary(progress_data, card_state_maps, runtime=app_ctx)
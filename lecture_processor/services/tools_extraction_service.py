@@ -11,7 +11,7 @@ from lecture_processor.domains.billing import credits as billing_credits
 from lecture_processor.domains.billing import receipts as billing_receipts
 from lecture_processor.domains.rate_limit import limiter as rate_limiter
 from lecture_processor.domains.runtime_jobs import store as runtime_jobs_store
-from lecture_processor.runtime.job_dispatcher import JobQueueFullError
+from lecture_processor.runtime.job_dispatcher import JobQueueFullError, ScheduledJob
 from lecture_processor.services import upload_api_service
 
 
@@ -250,7 +250,13 @@ def tools_extract(app_ctx, request):
 
     try:
         app_ctx.submit_background_job(
-            _run_tools_extract_job,
+            ScheduledJob(
+                _run_tools_extract_job,
+                job_class='tools_extract',
+                owner=uid,
+                job_id=job_id,
+                size_mb=staged_input.source_size_mb,
+            ),
             app_ctx,
             job_id,
             uid,
@@ -9,7 +9,7 @@ from lecture_processor.domains.billing import receipts as billing_receipts
 from lecture_processor.domains.rate_limit import limiter as rate_limiter
 from lecture_processor.domains.runtime_jobs import store as runtime_jobs_store
 from lecture_processor.domains.shared import parsing as shared_parsing
-from lecture_processor.runtime.job_dispatcher import JobQueueFullError
+from lecture_processor.runtime.job_dispatcher import JobQueueFullError, ScheduledJob
 
 from lecture_processor.services import upload_batch_support
 
@@ -165,7 +165,13 @@ def create_general_transcription(app_ctx, request):
 
     try:
         app_ctx.submit_background_job(
-            _run_general_transcription_job,
+            ScheduledJob(
+                _run_general_transcription_job,
+                job_class='tools_transcription',
+                owner=uid,
+                job_id=job_id,
+                size_mb=audio_size / (1024 * 1024),
+            ),
             app_ctx,
             job_id,
             audio_path,
@@ -20,12 +20,13 @@ from lecture_processor.domains.shared import sanitize_csv_row
 from lecture_processor.domains.shared import parsing as shared_parsing
 from lecture_processor.domains.study import export as study_export
 from lecture_processor.domains.upload import import_audio as upload_import_audio
-from lecture_processor.runtime.job_dispatcher import JobQueueFullError
+from lecture_processor.runtime.job_dispatcher import JobQueueFullError, ScheduledJob
 from lecture_processor.services import (
     upload_audio_import_service,
     upload_batch_service,
     upload_batch_support,
     upload_runtime_service,
+    upload_session_service,
 )
 
 
@@ -394,6 +395,26 @@ def release_imported_audio(app_ctx, request):
     return upload_audio_import_service.release_imported_audio(app_ctx, request)
 
 
+def create_upload_session(app_ctx, request):
+    return upload_session_service.create_upload_session(app_ctx, request)
+
+
+def get_upload_session(app_ctx, request, upload_id):
+    return upload_session_service.get_upload_session(app_ctx, request, upload_id)
+
+
+def append_upload_chunk(app_ctx, request, upload_id):
+    return upload_session_service.append_upload_chunk(app_ctx, request, upload_id)
+
+
+def complete_upload_session(app_ctx, request, upload_id):
+    return upload_session_service.complete_upload_session(app_ctx, request, upload_id)
+
+
+def abort_upload_session(app_ctx, request, upload_id):
+    return upload_session_service.abort_upload_session(app_ctx, request, upload_id)
+
+
 def _parse_batch_rows_payload(request):
     return upload_batch_support.parse_batch_rows_payload(request)
 
@@ -643,7 +664,13 @@ def upload_files(app_ctx, request):
             runtime_jobs_store.set_job(job_id, {'status': 'starting', 'step': 0, 'step_description': 'Starting...', 'total_steps': total_steps, 'mode': 'lecture-notes', 'user_id': uid, 'user_email': email, 'credit_deducted': deducted, 'credit_refunded': False, 'started_at': app_ctx.time.time(), 'result': None, 'slide_text': None, 'transcript': None, 'flashcard_selection': flashcard_selection, 'question_selection': question_selection, 'study_features': study_features, 'output_language': output_language, 'flashcards': [], 'test_questions': [], 'study_generation_error': None, 'study_pack_id': None, 'study_pack_title': study_pack_title, 'error': None, 'failed_stage': '', 'provider_error_code': '', 'retry_attempts': 0, 'file_size_mb': round(((pdf_size if pdf_size > 0 else 0) + audio_size) / (1024 * 1024), 2), 'billing_receipt': billing_receipts.initialize_billing_receipt({deducted: 1}, runtime=app_ctx)}, runtime=app_ctx)
             try:
                 app_ctx.submit_background_job(
-                    ai_pipelines.process_lecture_notes,
+                    ScheduledJob(
+                        ai_pipelines.process_lecture_notes,
+                        job_class='lecture-notes',
+                        owner=uid,
+                        job_id=job_id,
+                        size_mb=((pdf_size if pdf_size > 0 else 0) + audio_size) / (1024 * 1024),
+                    ),
                     job_id,
                     pdf_path,
                     audio_path,
@@ -683,7 +710,13 @@ def upload_files(app_ctx, request):
             runtime_jobs_store.set_job(job_id, {'status': 'starting', 'step': 0, 'step_description': 'Starting...', 'total_steps': total_steps, 'mode': 'slides-only', 'user_id': uid, 'user_email': email, 'credit_deducted': deducted, 'credit_refunded': False, 'started_at': app_ctx.time.time(), 'result': None, 'flashcard_selection': flashcard_selection, 'question_selection': question_selection, 'study_features': study_features, 'output_language': output_language, 'flashcards': [], 'test_questions': [], 'study_generation_error': None, 'study_pack_id': None, 'study_pack_title': study_pack_title, 'error': None, 'failed_stage': '', 'provider_error_code': '', 'retry_attempts': 0, 'file_size_mb': round((pdf_size if pdf_size > 0 else 0) / (1024 * 1024), 2), 'billing_receipt': billing_receipts.initialize_billing_receipt({deducted: 1}, runtime=app_ctx)}, runtime=app_ctx)
             try:
                 app_ctx.submit_background_job(
-                    ai_pipelines.process_slides_only,
+                    ScheduledJob(
+                        ai_pipelines.process_slides_only,
+                        job_class='slides-only',
+                        owner=uid,
+                        job_id=job_id,
+                        size_mb=(pdf_size if pdf_size > 0 else 0) / (1024 * 1024),
+                    ),
                     job_id,
                     pdf_path,
                     runtime=app_ctx,
@@ -803,7 +836,13 @@ def upload_files(app_ctx, request):
             }, runtime=app_ctx)
             try:
                 app_ctx.submit_background_job(
-                    ai_pipelines.process_interview_transcription,
+                    ScheduledJob(
+                        ai_pipelines.process_interview_transcription,
+                        job_class='interview',
+                        owner=uid,
+                        job_id=job_id,
+                        size_mb=audio_size / (1024 * 1024),
+                    ),
                     job_id,
                     audio_path,
                     runtime=app_ctx,
@@ -10,9 +10,9 @@ from lecture_processor.domains.shared import sanitize_csv_row
 from lecture_processor.domains.shared import parsing as shared_parsing
 from lecture_processor.domains.study import export as study_export
 from lecture_processor.domains.upload import import_audio as upload_import_audio
-from lecture_processor.runtime.job_dispatcher import JobQueueFullError
+from lecture_processor.runtime.job_dispatcher import JobQueueFullError, ScheduledJob
 
-from lecture_processor.services import upload_batch_support
+from lecture_processor.services import export_artifact_cache, upload_batch_support
 
 
 def create_batch_job(app_ctx, request):
@@ -329,7 +329,7 @@ def create_batch_job(app_ctx, request):
 
         try:
             app_ctx.submit_background_job(
-                batch_orchestrator.process_batch_job,
+                ScheduledJob(batch_orchestrator.process_batch_job, job_class='batch', owner=uid),
                 batch_id,
                 runtime=app_ctx,
             )
@@ -405,7 +405,15 @@ def get_batch_job_status(app_ctx, request, batch_id):
     return app_ctx.jsonify(status_payload)
 
 
-def batch_row_docx_bytes(app_ctx, row, content_type='result'):
+def _render_docx_bytes(app_ctx, content, title):
+    doc = study_export.markdown_to_docx(content, title, runtime=app_ctx)
+    docx_io = app_ctx.io.BytesIO()
+    doc.save(docx_io)
+    docx_io.seek(0)
+    return docx_io.read()
+
+
+def batch_row_docx_bytes(app_ctx, row, content_type='result', prune_cache=True):
     if content_type == 'slides' and row.get('slide_text'):
         content, title = row.get('slide_text', ''), 'Slides Extracted'
     elif content_type == 'transcript' and row.get('transcript'):
@@ -419,14 +427,27 @@ def batch_row_docx_bytes(app_ctx, row, content_type='result'):
     else:
         content = row.get('result', '') or row.get('merged_notes', '') or row.get('transcript', '') or row.get('slide_text', '')
         title = 'Batch Output'
-    doc = study_export.markdown_to_docx(content, title, runtime=app_ctx)
-    docx_io = app_ctx.io.BytesIO()
-    doc.save(docx_io)
-    docx_io.seek(0)
-    return docx_io.read()
+    return export_artifact_cache.get_or_render(
+        app_ctx,
+        'docx',
+        {'title': title, 'content': content},
+        lambda: _render_docx_bytes(app_ctx, content, title),
+        prune=prune_cache,
+    )
 
 
-def batch_row_csv_bytes(app_ctx, row, export_type='flashcards'):
+def batch_row_csv_bytes(app_ctx, row, export_type='flashcards', prune_cache=True):
+    items = row.get('test_questions', []) if export_type == 'test' else row.get('flashcards', [])
+    return export_artifact_cache.get_or_render(
+        app_ctx,
+        f'csv:{export_type}',
+        items,
+        lambda: _render_csv_bytes(app_ctx, row, export_type=export_type),
+        prune=prune_cache,
+    )
+
+
+def _render_csv_bytes(app_ctx, row, export_type='flashcards'):
     output = app_ctx.io.StringIO()
     writer = app_ctx.csv.writer(output)
     if export_type == 'test':
@@ -548,7 +569,7 @@ def batch_row_combined_markdown(batch, row):
     return '\n'.join(part for part in parts if part is not None).strip()
 
 
-def batch_combined_docx_bytes(app_ctx, batch, rows):
+def batch_combined_docx_bytes(app_ctx, batch, rows, prune_cache=True):
     batch_title = str((batch or {}).get('batch_title', '') or (batch or {}).get('batch_id', '') or 'Batch Combined').strip()
     sections = []
     for row in rows:
@@ -556,11 +577,14 @@ def batch_combined_docx_bytes(app_ctx, batch, rows):
     markdown_text = '\n\n'.join(section for section in sections if str(section or '').strip()).strip()
     if not markdown_text:
         markdown_text = '# Batch Output\n\nNo row output was available when this ZIP was created.'
-    doc = study_export.markdown_to_docx(markdown_text, title=batch_title + ' Combined', runtime=app_ctx)
-    output = app_ctx.io.BytesIO()
-    doc.save(output)
-    output.seek(0)
-    return output.read()
+    title = batch_title + ' Combined'
+    return export_artifact_cache.get_or_render(
+        app_ctx,
+        'docx',
+        {'title': title, 'content': markdown_text},
+        lambda: _render_docx_bytes(app_ctx, markdown_text, title),
+        prune=prune_cache,
+    )
 
 
 def download_batch_row_docx(app_ctx, request, batch_id, row_id):
@@ -613,6 +637,69 @@ def download_batch_row_flashcards_csv(app_ctx, request, batch_id, row_id):
     )
 
 
+class _ZipStreamBuffer:
+    """Write-only file object that collects zipfile output until it is drained."""
+
+    def __init__(self):
+        self._chunks = []
+
+    def write(self, data):
+        self._chunks.append(bytes(data))
+        return len(data)
+
+    def flush(self):
+        pass
+
+    def drain(self):
+        data = b''.join(self._chunks)
+        self._chunks = []
+        return data
+
+
+def _batch_zip_entries(app_ctx, batch, batch_id, rows, export_options):
+    summary = {
+        'batch_id': batch.get('batch_id', batch_id),
+        'mode': batch.get('mode', ''),
+        'status': batch.get('status', ''),
+        'total_rows': batch.get('total_rows', len(rows)),
+        'completed_rows': batch.get('completed_rows', 0),
+        'failed_rows': batch.get('failed_rows', 0),
+        'token_input_total': batch.get('token_input_total', 0),
+        'token_output_total': batch.get('token_output_total', 0),
+        'token_total': batch.get('token_total', 0),
+        'export_options': export_options,
+    }
+    yield 'summary.json', json.dumps(summary, ensure_ascii=False, indent=2)
+    if bool(export_options.get('include_combined_docx', False)):
+        combined_name = study_export.sanitize_export_filename(
+            batch.get('batch_title', '') or f'batch-{batch_id}',
+            fallback=f'batch-{batch_id}',
+        ) + '_Combined.docx'
+        yield combined_name, batch_combined_docx_bytes(app_ctx, batch, rows, prune_cache=False)
+    for row in rows:
+        row_id = str(row.get('row_id', '') or '')
+        folder = f'rows/{row_id}'
+        yield f'{folder}/meta.json', json.dumps(row, ensure_ascii=False, indent=2, default=str)
+        if row.get('status') != 'complete':
+            continue
+        try:
+            yield f'{folder}/result.docx', batch_row_docx_bytes(app_ctx, row, content_type='result', prune_cache=False)
+            if row.get('slide_text'):
+                yield f'{folder}/slides.docx', batch_row_docx_bytes(app_ctx, row, content_type='slides', prune_cache=False)
+            if row.get('transcript'):
+                yield f'{folder}/transcript.docx', batch_row_docx_bytes(app_ctx, row, content_type='transcript', prune_cache=False)
+            if row.get('interview_summary'):
+                yield f'{folder}/summary.docx', batch_row_docx_bytes(app_ctx, row, content_type='summary', prune_cache=False)
+            if row.get('interview_sections'):
+                yield f'{folder}/sections.docx', batch_row_docx_bytes(app_ctx, row, content_type='sections', prune_cache=False)
+            if row.get('flashcards'):
+                yield f'{folder}/flashcards.csv', batch_row_csv_bytes(app_ctx, row, export_type='flashcards', prune_cache=False)
+            if row.get('test_questions'):
+                yield f'{folder}/test_questions.csv', batch_row_csv_bytes(app_ctx, row, export_type='test', prune_cache=False)
+        except Exception as error:
+            yield f'{folder}/error.txt', str(error)
+
+
 def download_batch_zip(app_ctx, request, batch_id):
     batch, _decoded, error_response, status = upload_batch_support.get_batch_with_permission(
         app_ctx,
@@ -627,55 +714,21 @@ def download_batch_zip(app_ctx, request, batch_id):
         return app_ctx.jsonify({'error': 'Batch ZIP is available after at least one row completes.'}), 400
     rows = batch_orchestrator.list_batch_rows(batch_id, runtime=app_ctx)
     export_options = batch.get('export_options', {}) if isinstance(batch.get('export_options', {}), dict) else {}
-    include_combined_docx = bool(export_options.get('include_combined_docx', False))
-    archive_bytes = app_ctx.io.BytesIO()
-    with zipfile.ZipFile(archive_bytes, mode='w', compression=zipfile.ZIP_DEFLATED) as archive:
-        summary = {
-            'batch_id': batch.get('batch_id', batch_id),
-            'mode': batch.get('mode', ''),
-            'status': batch.get('status', ''),
-            'total_rows': batch.get('total_rows', len(rows)),
-            'completed_rows': batch.get('completed_rows', 0),
-            'failed_rows': batch.get('failed_rows', 0),
-            'token_input_total': batch.get('token_input_total', 0),
-            'token_output_total': batch.get('token_output_total', 0),
-            'token_total': batch.get('token_total', 0),
-            'export_options': export_options,
-        }
-        archive.writestr('summary.json', json.dumps(summary, ensure_ascii=False, indent=2))
-        if include_combined_docx:
-            combined_name = study_export.sanitize_export_filename(
-                batch.get('batch_title', '') or f'batch-{batch_id}',
-                fallback=f'batch-{batch_id}',
-            ) + '_Combined.docx'
-            archive.writestr(combined_name, batch_combined_docx_bytes(app_ctx, batch, rows))
-        for row in rows:
-            row_id = str(row.get('row_id', '') or '')
-            folder = f'rows/{row_id}'
-            archive.writestr(f'{folder}/meta.json', json.dumps(row, ensure_ascii=False, indent=2, default=str))
-            if row.get('status') != 'complete':
-                continue
-            try:
-                archive.writestr(f'{folder}/result.docx', batch_row_docx_bytes(app_ctx, row, content_type='result'))
-                if row.get('slide_text'):
-                    archive.writestr(f'{folder}/slides.docx', batch_row_docx_bytes(app_ctx, row, content_type='slides'))
-                if row.get('transcript'):
-                    archive.writestr(f'{folder}/transcript.docx', batch_row_docx_bytes(app_ctx, row, content_type='transcript'))
-                if row.get('interview_summary'):
-                    archive.writestr(f'{folder}/summary.docx', batch_row_docx_bytes(app_ctx, row, content_type='summary'))
-                if row.get('interview_sections'):
-                    archive.writestr(f'{folder}/sections.docx', batch_row_docx_bytes(app_ctx, row, content_type='sections'))
-                if row.get('flashcards'):
-                    archive.writestr(f'{folder}/flashcards.csv', batch_row_csv_bytes(app_ctx, row, export_type='flashcards'))
-                if row.get('test_questions'):
-                    archive.writestr(f'{folder}/test_questions.csv', batch_row_csv_bytes(app_ctx, row, export_type='test'))
-            except Exception as error:
-                archive.writestr(f'{folder}/error.txt', str(error))
-    archive_bytes.seek(0)
+
+    def generate_zip():
+        # Each entry is compressed and sent as soon as it is rendered, so memory
+        # stays at roughly one artifact instead of the whole archive.
+        buffer = _ZipStreamBuffer()
+        with zipfile.ZipFile(buffer, mode='w', compression=zipfile.ZIP_DEFLATED) as archive:
+            for name, data in _batch_zip_entries(app_ctx, batch, batch_id, rows, export_options):
+                archive.writestr(name, data)
+                chunk = buffer.drain()
+                if chunk:
+                    yield chunk
+        yield buffer.drain()
+        export_artifact_cache.prune_artifacts(app_ctx)
+
     filename = f'batch-{batch_id}.zip'
-    return app_ctx.send_file(
-        archive_bytes,
-        mimetype='application/zip',
-        as_attachment=True,
-        download_name=filename,
-    )
+    response = app_ctx.Response(app_ctx.stream_with_context(generate_zip()), mimetype='application/zip')
+    response.headers['Content-Disposition'] = f'attachment; filename={filename}'
+    return response
@@ -1,8 +1,11 @@
 """Runtime status, download, and estimate handlers for upload-related APIs."""
 
+import hashlib
+import time
 from collections import defaultdict
 
 from lecture_processor.domains.account import lifecycle as account_lifecycle
+from lecture_processor.domains.admin import duration_stats as admin_duration_stats
 from lecture_processor.domains.admin import metrics as admin_metrics
 from lecture_processor.domains.billing import receipts as billing_receipts
 from lecture_processor.domains.runtime_jobs import store as runtime_jobs_store
@@ -10,7 +13,64 @@ from lecture_processor.domains.shared import sanitize_csv_row
 from lecture_processor.domains.study import export as study_export
 
 
+TERMINAL_JOB_STATUSES = {'complete', 'error'}
+REMOTE_STATUS_POLL_SECONDS = 2.0
+
+
+def job_status_etag(job):
+    """ETag over the fields a status poller renders; other job fields do not bump it."""
+    key = f"{job.get('status', '')}|{job.get('step', '')}|{job.get('step_description', '')}"
+    return '"' + hashlib.sha1(key.encode('utf-8')).hexdigest()[:16] + '"'
+
+
+def _status_wait_seconds(app_ctx, request):
+    try:
+        requested = float(request.args.get('wait', 0) or 0)
+    except (TypeError, ValueError):
+        return 0.0
+    limit = float(getattr(app_ctx, 'JOB_STATUS_LONG_POLL_SECONDS', 0) or 0)
+    return max(0.0, min(requested, limit))
+
+
+def _wait_for_status_change(app_ctx, job_id, job, etag, wait_seconds):
+    notifier = getattr(app_ctx, 'JOB_STATUS_NOTIFIER', None)
+    if notifier is None or str(job.get('status', '') or '') in TERMINAL_JOB_STATUSES:
+        return job
+    # Jobs run by a worker process never notify this one, so re-read their snapshot periodically.
+    remote = bool(getattr(app_ctx, 'RUNTIME_JOBS_REMOTE', False))
+    deadline = time.monotonic() + wait_seconds
+    max_waiters = int(getattr(app_ctx, 'JOB_STATUS_LONG_POLL_MAX_WAITERS', 0) or 0)
+    with notifier.watch(job_id, max_watchers=max_waiters) as watch:
+        if watch is None:
+            # Too many requests are already held; answer now so request threads stay free for other routes.
+            return job
+        # Re-read after registering so a mutation in between is not missed.
+        job = runtime_jobs_store.get_job_snapshot(job_id, runtime=app_ctx) or job
+        while job_status_etag(job) == etag:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            mutated = watch.wait(min(remaining, REMOTE_STATUS_POLL_SECONDS) if remote else remaining)
+            job = runtime_jobs_store.get_job_snapshot(job_id, runtime=app_ctx) or job
+            if not mutated and not remote:
+                break
+    return job
+
+
+def _not_modified(app_ctx, etag):
+    response = app_ctx.Response(status=304)
+    response.headers['ETag'] = etag
+    response.headers['Cache-Control'] = 'no-store'
+    return response
+
+
 def get_status(app_ctx, request, job_id):
+    """Job status, optionally as a long-poll.
+
+    With ``If-None-Match`` set to the last ETag and ``?wait=N`` the request is held
+    (up to ``JOB_STATUS_LONG_POLL_SECONDS``) until the job's status, step or step
+    description changes, then answers 200 with the new state or 304 on timeout.
+    """
     decoded_token = app_ctx.verify_firebase_token(request)
     if not decoded_token:
         return app_ctx.jsonify({'error': 'Unauthorized'}), 401
@@ -28,6 +88,15 @@ def get_status(app_ctx, request, job_id):
             }), 404
     if job.get('user_id', '') != uid and not app_ctx.is_admin_user(decoded_token):
         return app_ctx.jsonify({'error': 'Forbidden'}), 403
+    etag = job_status_etag(job)
+    if_none_match = str(request.headers.get('If-None-Match', '') or '').strip()
+    if if_none_match == etag:
+        wait_seconds = _status_wait_seconds(app_ctx, request)
+        if wait_seconds > 0:
+            job = _wait_for_status_change(app_ctx, job_id, job, etag, wait_seconds)
+            etag = job_status_etag(job)
+        if if_none_match == etag:
+            return _not_modified(app_ctx, etag)
     response = {
         'status': job['status'],
         'step': job['step'],
@@ -73,7 +142,10 @@ def get_status(app_ctx, request, job_id):
     elif job['status'] == 'error':
         response['error'] = job['error']
         response['credit_refunded'] = job.get('credit_refunded', False)
-    return app_ctx.jsonify(response)
+    http_response = app_ctx.jsonify(response)
+    http_response.headers['ETag'] = etag
+    http_response.headers['Cache-Control'] = 'no-store'
+    return http_response
 
 
 def _is_active_regular_runtime_job(job, uid):
@@ -241,19 +313,7 @@ def download_flashcards_csv(app_ctx, request, job_id):
 
 
 def _estimate_size_bucket(total_mb):
-    try:
-        value = float(total_mb or 0.0)
-    except Exception:
-        value = 0.0
-    if value <= 0:
-        return 'unknown'
-    if value < 25:
-        return 's'
-    if value < 100:
-        return 'm'
-    if value < 300:
-        return 'l'
-    return 'xl'
+    return admin_duration_stats.size_bucket(total_mb)
 
 
 def _duration_percentile(sorted_values, percentile):
@@ -293,6 +353,86 @@ def _heuristic_estimate_range(mode, total_mb, study_features, interview_features
     return (low, typical, high)
 
 
+def _estimate_group_predicates(mode, study_features, requested_bucket, interview_features_count):
+    if mode in {'lecture-notes', 'slides-only'}:
+        def feature_match(row_mode, row_features, _row_bucket, _row_extras):
+            return row_mode == mode and row_features == study_features
+    else:
+        def feature_match(row_mode, _row_features, _row_bucket, row_extras):
+            return row_mode == mode and row_extras == interview_features_count
+
+    def strict_match(row_mode, row_features, row_bucket, row_extras):
+        if not feature_match(row_mode, row_features, row_bucket, row_extras):
+            return False
+        return requested_bucket == 'unknown' or row_bucket == requested_bucket
+
+    def mode_match(row_mode, _row_features, _row_bucket, _row_extras):
+        return row_mode == mode
+
+    return (('strict', strict_match), ('feature', feature_match), ('mode', mode_match))
+
+
+def _estimate_from_duration_stats(app_ctx, mode, study_features, requested_bucket, interview_features_count):
+    """Answer from the precomputed duration histograms; None means fall back to scanning job_logs."""
+    try:
+        window = admin_duration_stats.load_window_stats(runtime=app_ctx)
+    except Exception:
+        app_ctx.logger.warning('Could not read processing duration stats; scanning job_logs instead', exc_info=True)
+        return None
+    if window is None:
+        return None
+    for source, predicate in _estimate_group_predicates(mode, study_features, requested_bucket, interview_features_count):
+        group = admin_duration_stats.combine_groups(window, predicate)
+        if group['count'] >= 8:
+            percentiles = tuple(
+                int(round(admin_duration_stats.histogram_percentile(group, percentile)))
+                for percentile in (0.25, 0.5, 0.75)
+            )
+            return (source, group['count'], percentiles)
+    # Too few samples yet (e.g. right after the histograms were introduced); job_logs may still have enough.
+    return None
+
+
+def _estimate_from_job_logs(app_ctx, mode, study_features, requested_bucket, interview_features_count):
+    window_start = app_ctx.time.time() - 30 * 86400
+    docs = admin_metrics.safe_query_docs_in_window(
+        collection_name='job_logs',
+        timestamp_field='finished_at',
+        window_start=window_start,
+        order_desc=True,
+        limit=600,
+        runtime=app_ctx,
+    )
+
+    samples = {'strict': [], 'feature': [], 'mode': []}
+    predicates = _estimate_group_predicates(mode, study_features, requested_bucket, interview_features_count)
+    for doc in docs:
+        row = doc.to_dict() if hasattr(doc, 'to_dict') else {}
+        if not isinstance(row, dict):
+            continue
+        if str(row.get('status', '')).lower() != 'complete':
+            continue
+        duration = row.get('duration_seconds', 0)
+        if not isinstance(duration, (int, float)) or duration <= 0:
+            continue
+        row_key = (
+            str(row.get('mode', '')).lower(),
+            str(row.get('study_features', 'none') or 'none').strip().lower(),
+            _estimate_size_bucket(row.get('file_size_mb', 0)),
+            app_ctx.sanitize_int(row.get('interview_features_count', 0), default=0, min_value=0, max_value=4),
+        )
+        for source, predicate in predicates:
+            if predicate(*row_key):
+                samples[source].append(float(duration))
+
+    for source, _predicate in predicates:
+        if len(samples[source]) >= 8:
+            sorted_values = sorted(samples[source])
+            percentiles = tuple(_duration_percentile(sorted_values, percentile) for percentile in (0.25, 0.5, 0.75))
+            return (source, len(sorted_values), percentiles)
+    return ('heuristic', 0, None)
+
+
 def processing_estimate(app_ctx, request):
     decoded_token = app_ctx.verify_firebase_token(request)
     if not decoded_token:
@@ -319,69 +459,13 @@ def processing_estimate(app_ctx, request):
         max_value=1024.0,
     )
     requested_bucket = _estimate_size_bucket(total_mb)
-    window_start = app_ctx.time.time() - 30 * 86400
-    docs = admin_metrics.safe_query_docs_in_window(
-        collection_name='job_logs',
-        timestamp_field='finished_at',
-        window_start=window_start,
-        order_desc=True,
-        limit=600,
-        runtime=app_ctx,
-    )
+    estimate = _estimate_from_duration_stats(app_ctx, mode, study_features, requested_bucket, interview_features_count)
+    if estimate is None:
+        estimate = _estimate_from_job_logs(app_ctx, mode, study_features, requested_bucket, interview_features_count)
+    source, sample_count, percentiles = estimate
 
-    strict = []
-    feature_only = []
-    mode_only = []
-    for doc in docs:
-        row = doc.to_dict() if hasattr(doc, 'to_dict') else {}
-        if not isinstance(row, dict):
-            continue
-        if str(row.get('status', '')).lower() != 'complete':
-            continue
-        if str(row.get('mode', '')).lower() != mode:
-            continue
-        duration = row.get('duration_seconds', 0)
-        if not isinstance(duration, (int, float)) or duration <= 0:
-            continue
-        mode_only.append(float(duration))
-        if mode in {'lecture-notes', 'slides-only'}:
-            row_feature = str(row.get('study_features', 'none') or 'none').strip().lower()
-            if row_feature != study_features:
-                continue
-            feature_only.append(float(duration))
-            row_bucket = _estimate_size_bucket(row.get('file_size_mb', 0))
-            if requested_bucket != 'unknown' and row_bucket == requested_bucket:
-                strict.append(float(duration))
-            elif requested_bucket == 'unknown':
-                strict.append(float(duration))
-        else:
-            row_extras = app_ctx.sanitize_int(row.get('interview_features_count', 0), default=0, min_value=0, max_value=4)
-            if row_extras != interview_features_count:
-                continue
-            feature_only.append(float(duration))
-            row_bucket = _estimate_size_bucket(row.get('file_size_mb', 0))
-            if requested_bucket != 'unknown' and row_bucket == requested_bucket:
-                strict.append(float(duration))
-            elif requested_bucket == 'unknown':
-                strict.append(float(duration))
-
-    source = 'heuristic'
-    sample = []
-    if len(strict) >= 8:
-        sample = strict
-        source = 'strict'
-    elif len(feature_only) >= 8:
-        sample = feature_only
-        source = 'feature'
-    elif len(mode_only) >= 8:
-        sample = mode_only
-        source = 'mode'
-
-    if sample:
-        sorted_values = sorted(sample)
-        low = _duration_percentile(sorted_values, 0.25)
-        typical = _duration_percentile(sorted_values, 0.5)
-        high = _duration_percentile(sorted_values, 0.75)
+    if percentiles:
+        low, typical, high = percentiles
         low = max(15, low)
         typical = max(low, typical)
         high = max(typical + 5, high)
@@ -395,44 +479,73 @@ def processing_estimate(app_ctx, request):
             'high_seconds': int(high),
             'typical_seconds': int(typical),
         },
-        'sample_count': len(sample),
+        'sample_count': sample_count,
         'source': source,
     })
 
 
+def _averages_from_duration_stats(app_ctx):
+    """Per-mode averages from the duration histograms; min/max are bin edges, not exact values."""
+    try:
+        window = admin_duration_stats.load_window_stats(runtime=app_ctx)
+    except Exception:
+        app_ctx.logger.warning('Could not read processing duration stats; scanning job_logs instead', exc_info=True)
+        return None
+    if window is None:
+        return None
+    averages = {}
+    for mode in sorted({key[0] for key in window}):
+        group = admin_duration_stats.combine_groups(window, lambda row_mode, *_rest: row_mode == mode)
+        if group['count'] <= 0:
+            continue
+        avg = group['sum_seconds'] / group['count']
+        low, high = admin_duration_stats.histogram_bounds(group)
+        averages[mode] = {
+            'avg_seconds': round(avg, 1),
+            'job_count': group['count'],
+            'min_seconds': round(min(low, avg), 1),
+            'max_seconds': round(max(high, avg), 1),
+        }
+    return averages
+
+
+def _averages_from_job_logs(app_ctx):
+    docs = (
+        app_ctx.db.collection('job_logs')
+        .where('status', '==', 'complete')
+        .order_by('finished_at', direction=app_ctx.firestore.Query.DESCENDING)
+        .limit(200)
+        .stream()
+    )
+    by_mode = defaultdict(list)
+    for doc in docs:
+        job = doc.to_dict() or {}
+        mode = job.get('mode', 'unknown')
+        duration = job.get('duration_seconds')
+        if isinstance(duration, (int, float)) and duration > 0:
+            by_mode[mode].append(duration)
+
+    averages = {}
+    for mode, durations in by_mode.items():
+        averages[mode] = {
+            'avg_seconds': round(sum(durations) / len(durations), 1),
+            'job_count': len(durations),
+            'min_seconds': round(min(durations), 1),
+            'max_seconds': round(max(durations), 1),
+        }
+    return averages
+
+
 def processing_averages(app_ctx, request):
     decoded_token = app_ctx.verify_firebase_token(request)
     if not decoded_token:
         return app_ctx.jsonify({'error': 'Unauthorized'}), 401
 
     try:
-        docs = (
-            app_ctx.db.collection('job_logs')
-            .where('status', '==', 'complete')
-            .order_by('finished_at', direction=app_ctx.firestore.Query.DESCENDING)
-            .limit(200)
-            .stream()
-        )
-        by_mode = defaultdict(list)
-        for doc in docs:
-            job = doc.to_dict() or {}
-            mode = job.get('mode', 'unknown')
-            duration = job.get('duration_seconds')
-            if isinstance(duration, (int, float)) and duration > 0:
-                by_mode[mode].append(duration)
-
-        averages = {}
-        total_jobs = 0
-        for mode, durations in by_mode.items():
-            total_jobs += len(durations)
-            avg = round(sum(durations) / len(durations), 1)
-            averages[mode] = {
-                'avg_seconds': avg,
-                'job_count': len(durations),
-                'min_seconds': round(min(durations), 1),
-                'max_seconds': round(max(durations), 1),
-            }
-
+        averages = _averages_from_duration_stats(app_ctx)
+        if averages is None:
+            averages = _averages_from_job_logs(app_ctx)
+        total_jobs = sum(entry['job_count'] for entry in averages.values())
         response = app_ctx.jsonify({'averages': averages, 'total_jobs': total_jobs})
         response.headers['Cache-Control'] = 'private, max-age=300'
         return response
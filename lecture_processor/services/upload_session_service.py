@@ -0,0 +1,148 @@
+"""Resumable chunked audio upload routes extracted from upload API service."""
+
+from lecture_processor.domains.analytics import events as analytics_events
+from lecture_processor.domains.auth import policy as auth_policy
+from lecture_processor.domains.rate_limit import limiter as rate_limiter
+from lecture_processor.domains.rate_limit import quotas as rate_limit_quotas
+from lecture_processor.domains.upload import chunked_upload as upload_chunked
+
+from lecture_processor.services import upload_batch_support
+
+
+def _authorized_uid(app_ctx, request):
+    decoded_token = app_ctx.verify_firebase_token(request)
+    if not decoded_token:
+        return None, (app_ctx.jsonify({'error': 'Please sign in to continue'}), 401)
+    return decoded_token['uid'], None
+
+
+def _session_response(app_ctx, session, error, status_code):
+    payload = dict(session or {})
+    if error:
+        payload['error'] = error
+    return app_ctx.jsonify(payload), status_code
+
+
+def create_upload_session(app_ctx, request):
+    decoded_token = app_ctx.verify_firebase_token(request)
+    if not decoded_token:
+        return app_ctx.jsonify({'error': 'Please sign in to continue'}), 401
+    uid = decoded_token['uid']
+    email = decoded_token.get('email', '')
+    if not auth_policy.is_email_allowed(email, runtime=app_ctx):
+        return app_ctx.jsonify({'error': 'Email not allowed'}), 403
+    deletion_guard = upload_batch_support.account_write_guard_response(app_ctx, uid)
+    if deletion_guard is not None:
+        return deletion_guard
+
+    allowed_upload, retry_after = rate_limiter.check_rate_limit(
+        key=f"upload_session:{rate_limiter.normalize_rate_limit_key_part(uid, fallback='anon_uid', runtime=app_ctx)}",
+        limit=app_ctx.UPLOAD_RATE_LIMIT_MAX_REQUESTS,
+        window_seconds=app_ctx.UPLOAD_RATE_LIMIT_WINDOW_SECONDS,
+        runtime=app_ctx,
+    )
+    if not allowed_upload:
+        analytics_events.log_rate_limit_hit('upload', retry_after, runtime=app_ctx)
+        return rate_limiter.build_rate_limited_response(
+            'Too many upload attempts right now. Please wait and try again.',
+            retry_after,
+            runtime=app_ctx,
+        )
+
+    data = request.get_json(silent=True) or {}
+    file_name = str(data.get('file_name', '') or '').strip()
+    mime_type = str(data.get('mime_type', '') or '').strip().lower()
+    try:
+        total_bytes = int(data.get('total_bytes', 0) or 0)
+    except (TypeError, ValueError):
+        total_bytes = 0
+    if not file_name or not app_ctx.allowed_file(file_name, app_ctx.ALLOWED_AUDIO_EXTENSIONS):
+        return app_ctx.jsonify({'error': 'Invalid audio file'}), 400
+    if mime_type not in app_ctx.ALLOWED_AUDIO_MIME_TYPES:
+        return app_ctx.jsonify({'error': 'Invalid audio content type'}), 400
+    if total_bytes <= 0 or total_bytes > app_ctx.MAX_AUDIO_UPLOAD_BYTES:
+        return app_ctx.jsonify({'error': 'Audio exceeds server limit (max 500MB) or is empty.'}), 400
+
+    upload_chunked.cleanup_expired_upload_sessions(runtime=app_ctx)
+    if upload_chunked.count_upload_sessions_for_user(uid, runtime=app_ctx) >= app_ctx.UPLOAD_SESSIONS_MAX_PER_USER:
+        return app_ctx.jsonify({'error': 'You already have uploads in progress. Finish or cancel one before starting another.'}), 429
+    disk_ok, free_bytes, needed_bytes = rate_limit_quotas.has_sufficient_upload_disk_space(total_bytes, runtime=app_ctx)
+    if not disk_ok:
+        app_ctx.logger.warning(
+            "Upload session rejected due to low disk space: free=%s needed=%s uid=%s",
+            free_bytes,
+            needed_bytes,
+            uid,
+        )
+        return app_ctx.jsonify({
+            'error': 'Upload temporarily unavailable due to low server storage. Please try again later.'
+        }), 503
+    reserved_daily, daily_retry_after = rate_limit_quotas.reserve_daily_upload_bytes(uid, total_bytes, runtime=app_ctx)
+    if not reserved_daily:
+        analytics_events.log_rate_limit_hit('upload', daily_retry_after, runtime=app_ctx)
+        return rate_limiter.build_rate_limited_response(
+            'Daily upload quota reached for your account. Please try again tomorrow.',
+            daily_retry_after,
+            runtime=app_ctx,
+        )
+    try:
+        session = upload_chunked.create_upload_session(
+            uid,
+            file_name,
+            total_bytes,
+            reserved_bytes=total_bytes,
+            sha256=data.get('sha256', ''),
+            runtime=app_ctx,
+        )
+    except Exception as error:
+        rate_limit_quotas.release_daily_upload_bytes(uid, total_bytes, runtime=app_ctx)
+        app_ctx.logger.error(f"Error creating upload session for user {uid}: {error}")
+        return app_ctx.jsonify({'error': 'Could not start the upload. Please try again.'}), 500
+    return app_ctx.jsonify(session), 201
+
+
+def get_upload_session(app_ctx, request, upload_id):
+    uid, error_response = _authorized_uid(app_ctx, request)
+    if error_response is not None:
+        return error_response
+    session = upload_chunked.get_upload_session(uid, upload_id, runtime=app_ctx)
+    if session is None:
+        return app_ctx.jsonify({'error': 'Upload session expired or not found. Please start the upload again.'}), 404
+    return app_ctx.jsonify(session)
+
+
+def append_upload_chunk(app_ctx, request, upload_id):
+    uid, error_response = _authorized_uid(app_ctx, request)
+    if error_response is not None:
+        return error_response
+    session, error, status_code = upload_chunked.append_upload_chunk(
+        uid,
+        upload_id,
+        request.args.get('offset', ''),
+        request.stream,
+        chunk_sha256=request.args.get('chunk_sha256', ''),
+        runtime=app_ctx,
+    )
+    return _session_response(app_ctx, session, error, status_code)
+
+
+def complete_upload_session(app_ctx, request, upload_id):
+    uid, error_response = _authorized_uid(app_ctx, request)
+    if error_response is not None:
+        return error_response
+    data = request.get_json(silent=True) or {}
+    payload, error, status_code = upload_chunked.complete_upload_session(
+        uid,
+        upload_id,
+        sha256=data.get('sha256', ''),
+        runtime=app_ctx,
+    )
+    return _session_response(app_ctx, payload, error, status_code)
+
+
+def abort_upload_session(app_ctx, request, upload_id):
+    uid, error_response = _authorized_uid(app_ctx, request)
+    if error_response is not None:
+        return error_response
+    upload_chunked.abort_upload_session(uid, upload_id, runtime=app_ctx)
+    return app_ctx.jsonify({'ok': True})
@@ -0,0 +1,182 @@
+#!/usr/bin/env python3
+"""Compare per-query latency of the Physio Assistant retrieval scoring paths."""
+
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import statistics
+import sys
+import time
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from lecture_processor.domains.physio import knowledge as physio_knowledge
+
+DEFAULT_INDEX_PATH = PROJECT_ROOT / "physio_library" / "index" / "manifest.json"
+QUERY_CONTEXTS = [
+    {"question": "Welke oefentherapie adviseert de richtlijn bij knieartrose?", "body_region": "knie", "case_context": {"primary_complaint": "startpijn en pijn bij traplopen"}},
+    {"question": "Hoe bouw ik belasting op bij lage rugpijn?", "body_region": "lumbaal", "case_context": {"primary_complaint": "aspecifieke lage rugpijn", "tags": ["chronisch"]}},
+    {"question": "Wat zijn de aanbevelingen na een beroerte?", "body_region": "neurologisch", "case_context": {"notes": "hemiparese links, valrisico"}},
+    {"question": "Welke fase van revalidatie na een VKB-reconstructie?", "body_region": "knie", "case_context": {"primary_complaint": "voorste kruisband reconstructie"}},
+    {"question": "Hoe behandel ik subacromiale klachten?", "body_region": "schouder", "case_context": {}},
+    {"question": "Welke meetinstrumenten zijn geschikt bij enkelletsel?", "body_region": "enkel_voet", "case_context": {"tags": ["inversietrauma"]}},
+]
+
+
+def _timed(fn):
+    started = time.perf_counter()
+    result = fn()
+    return result, (time.perf_counter() - started) * 1000.0
+
+
+def _summary(label, timings, agreement):
+    ordered = sorted(timings)
+    p95_index = min(len(ordered) - 1, max(0, int(round(0.95 * (len(ordered) - 1)))))
+    return (
+        f"{label:<24} mean={statistics.fmean(ordered):9.1f}ms "
+        f"p50={statistics.median(ordered):9.1f}ms p95={ordered[p95_index]:9.1f}ms "
+        f"top-k match={agreement}/{len(ordered)}"
+    )
+
+
+def _ensure_vector_store(index_path: Path, payload: dict, tmpdir: str):
+    if physio_knowledge.load_vector_store(index_path=index_path) is not None:
+        return index_path
+    bench_path = Path(tmpdir) / index_path.name
+    meta = dict(payload.get("meta", {}) or {})
+    meta["document_shards"] = []
+    meta["vector_store"] = physio_knowledge.write_vector_store(
+        payload.get("documents", []) or [],
+        bench_path,
+        dimension=meta.get("embedding_dimension"),
+    )
+    meta["bm25_index"] = physio_knowledge.write_bm25_index(bench_path, meta["vector_store"])
+    bench_path.write_text(json.dumps({"meta": meta, "documents": [], "errors": []}), encoding="utf-8")
+    return bench_path
+
+
+def run_benchmark(index_path: Path, *, queries: int, limit: int, seed: int, skip_python_loop: bool = False, nprobe=None):
+    payload, load_ms = _timed(lambda: physio_knowledge.load_knowledge_index(index_path=index_path))
+    documents = [item for item in payload.get("documents", []) or [] if isinstance(item, dict) and item.get("embedding")]
+    if not documents:
+        raise SystemExit(f"No indexed documents found at {index_path}")
+    print(f"Loaded {len(documents)} chunks in {load_ms:.0f}ms from {index_path}")
+
+    rng = random.Random(seed)
+    cases = []
+    for number in range(max(1, int(queries))):
+        spec = QUERY_CONTEXTS[number % len(QUERY_CONTEXTS)]
+        cases.append(
+            (
+                list(rng.choice(documents)["embedding"]),
+                physio_knowledge._build_query_context(
+                    spec["question"],
+                    body_region=spec["body_region"],
+                    case_context=spec["case_context"],
+                ),
+                physio_knowledge._build_retrieval_query(
+                    spec["question"],
+                    body_region=spec["body_region"],
+                    case_context=spec["case_context"],
+                ),
+            )
+        )
+
+    def run_path(rank, *, hybrid=False):
+        timings = []
+        ranked_ids = []
+        for query_vector, query_context, lexical_query in cases:
+            if hybrid:
+                ranked, elapsed = _timed(lambda: rank(query_vector, query_context, lexical_query=lexical_query))
+            else:
+                ranked, elapsed = _timed(lambda: rank(query_vector, query_context))
+            ranked_ids.append([item.get("id") for item in ranked])
+            timings.append(elapsed)
+        return timings, ranked_ids
+
+    results = {}
+    with TemporaryDirectory() as tmpdir:
+        store = physio_knowledge.load_vector_store(index_path=_ensure_vector_store(index_path, payload, tmpdir))
+        if store is None:
+            raise SystemExit("Could not map the vector store.")
+
+        def rank_store(query_vector, query_context, probe=0, lexical_query=""):
+            return physio_knowledge.rank_vector_store_documents(
+                query_vector,
+                store,
+                limit=limit,
+                query_context=query_context,
+                nprobe=probe,
+                lexical_query=lexical_query,
+            )
+
+        if not skip_python_loop:
+            results["python loop"] = run_path(
+                lambda query_vector, query_context: physio_knowledge.rank_scored_index_documents(
+                    query_vector, documents, limit=limit, query_context=query_context
+                )
+            )
+        numpy_module = physio_knowledge.np
+        physio_knowledge.np = None
+        try:
+            results["mmap store (stdlib)"] = run_path(rank_store)
+        finally:
+            physio_knowledge.np = numpy_module
+        if physio_knowledge.np is None:
+            print("NumPy is not installed; skipping the vectorized engine.")
+        else:
+            _engine, init_ms = _timed(store.scoring_engine)
+            print(f"NumPy engine initialised in {init_ms:.0f}ms")
+            results["numpy engine (cold)"] = run_path(rank_store)
+            results["numpy engine (warm)"] = run_path(rank_store)
+            if store.ann_index is None:
+                print("No IVF index in the manifest; rebuild with scripts/build_physio_library.py to compare it.")
+            else:
+                probe = store.ann_index.default_nprobe if nprobe is None else nprobe
+                results[f"numpy ivf (nprobe={probe})"] = run_path(
+                    lambda query_vector, query_context: rank_store(query_vector, query_context, probe)
+                )
+            if store.bm25_index is None:
+                print("No BM25 index in the manifest; rebuild with scripts/build_physio_library.py to compare it.")
+            else:
+                results["numpy + bm25 (rrf)"] = run_path(rank_store, hybrid=True)
+
+    reference = next(iter(results.values()))[1]
+    for label, (timings, ranked_ids) in results.items():
+        agreement = sum(1 for left, right in zip(reference, ranked_ids) if left == right)
+        print(_summary(label, timings, agreement))
+    return results
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark Physio Assistant retrieval scoring latency.")
+    parser.add_argument("--index-path", default=str(DEFAULT_INDEX_PATH))
+    parser.add_argument("--queries", type=int, default=6, help="Number of sampled queries per scoring path.")
+    parser.add_argument("--limit", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--skip-python-loop", action="store_true", help="Skip the slow pure-Python baseline.")
+    parser.add_argument("--nprobe", type=int, default=None, help="IVF lists to probe (default: the index default).")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    run_benchmark(
+        Path(args.index_path).resolve(),
+        queries=args.queries,
+        limit=args.limit,
+        seed=args.seed,
+        skip_python_loop=args.skip_python_loop,
+        nprobe=args.nprobe,
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
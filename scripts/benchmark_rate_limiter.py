@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""Compare throughput and memory of the in-memory rate limiter implementations."""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from lecture_processor.services import rate_limit_service
+
+
+class TimestampListLimiter:
+    """The previous fallback: every admitted timestamp kept per key, never evicted."""
+
+    def __init__(self):
+        self.events = {}
+
+    def __len__(self):
+        return len(self.events)
+
+    def hit(self, key, limit, window_seconds, now_ts):
+        timestamps = self.events.get(key, [])
+        cutoff = now_ts - window_seconds
+        kept = [ts for ts in timestamps if ts >= cutoff]
+        if len(kept) >= limit:
+            self.events[key] = kept
+            return False, max(1, int((kept[0] + window_seconds) - now_ts))
+        kept.append(now_ts)
+        self.events[key] = kept
+        return True, 0
+
+    def sweep(self, now_ts):
+        return 0
+
+
+def run_hot_keys(label, limiter, *, keys, checks_per_key, limit, window_seconds):
+    names = [f"upload:uid-{number}" for number in range(keys)]
+    now_ts = 1_000_000.0
+    step = window_seconds / float(checks_per_key)
+    started = time.perf_counter()
+    for _round in range(checks_per_key):
+        for name in names:
+            limiter.hit(name, limit, window_seconds, now_ts)
+        now_ts += step
+    elapsed = time.perf_counter() - started
+    print(f"{label:<24} {keys * checks_per_key / elapsed:>11,.0f} checks/s  ({keys} hot keys near a limit of {limit})")
+
+
+def _fill(limiter, names, *, checks_per_key, limit, window_seconds):
+    now_ts = 1_000_000.0
+    allowed = 0
+    for _round in range(checks_per_key):
+        for name in names:
+            allowed += limiter.hit(name, limit, window_seconds, now_ts)[0]
+            now_ts += 0.0001
+    return now_ts, allowed
+
+
+def run_limiter(label, limiter_factory, *, keys, checks_per_key, limit, window_seconds):
+    names = [f"analytics:203.0.113.{number}" for number in range(keys)]
+    options = {"checks_per_key": checks_per_key, "limit": limit, "window_seconds": window_seconds}
+    started = time.perf_counter()
+    _now_ts, allowed = _fill(limiter_factory(), names, **options)
+    elapsed = time.perf_counter() - started
+
+    limiter = limiter_factory()
+    tracemalloc.start()
+    baseline, _peak = tracemalloc.get_traced_memory()
+    now_ts, _allowed = _fill(limiter, names, **options)
+    retained, _peak = tracemalloc.get_traced_memory()
+    swept = limiter.sweep(now_ts + 3 * window_seconds)
+    after_sweep, _peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(
+        f"{label:<24} {keys * checks_per_key / elapsed:>11,.0f} checks/s  "
+        f"retained={(retained - baseline) / 1e6:6.1f}MB ({(retained - baseline) / keys:4.0f} B/key)  "
+        f"after idle sweep={(after_sweep - baseline) / 1e6:5.1f}MB ({swept} swept, {len(limiter)} left)  "
+        f"allowed={allowed}"
+    )
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the in-memory rate limiter fallback.")
+    parser.add_argument("--keys", type=int, default=100_000, help="Distinct rate limit keys.")
+    parser.add_argument("--checks-per-key", type=int, default=5)
+    parser.add_argument("--limit", type=int, default=240)
+    parser.add_argument("--window-seconds", type=int, default=60)
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    options = {
+        "keys": max(1, args.keys),
+        "checks_per_key": max(1, args.checks_per_key),
+        "limit": max(1, args.limit),
+        "window_seconds": max(1, args.window_seconds),
+    }
+    print(f"{options['keys']} distinct keys, {options['checks_per_key']} checks each:")
+    run_limiter("timestamp list (old)", TimestampListLimiter, **options)
+    run_limiter("sliding window counter", rate_limit_service.SlidingWindowCounters, **options)
+    hot_options = {"keys": 100, "checks_per_key": 2 * options["limit"], "limit": options["limit"], "window_seconds": options["window_seconds"]}
+    print("Hot keys:")
+    run_hot_keys("timestamp list (old)", TimestampListLimiter(), **hot_options)
+    run_hot_keys("sliding window counter", rate_limit_service.SlidingWindowCounters(), **hot_options)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -6,8 +6,12 @@ from __future__ import annotations
 import argparse
 import gzip
 import json
+import os
+import re
 import sys
+import threading
 import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 from pathlib import Path
 from tempfile import TemporaryDirectory
 
@@ -18,6 +22,7 @@ if str(PROJECT_ROOT) not in sys.path:
 from docx import Document
 
 from lecture_processor import create_app
+from lecture_processor.domains.ai import provider as ai_provider
 from lecture_processor.domains.physio import knowledge as physio_knowledge
 from lecture_processor.runtime.container import get_runtime
 from lecture_processor.services import file_service
@@ -25,7 +30,10 @@ DEFAULT_SOURCE_ROOT = PROJECT_ROOT / "physio_library" / "sources"
 DEFAULT_INDEX_PATH = PROJECT_ROOT / "physio_library" / "index" / "manifest.json"
 SUPPORTED_EXTENSIONS = {".pdf", ".docx", ".pptx", ".txt", ".md"}
 EMBED_BATCH_SIZE = 24
+DEFAULT_EMBED_CONCURRENCY = 4
 MAX_INDEX_SHARD_BYTES = 4 * 1024 * 1024
+ANN_RECALL_K = 10
+ANN_REPORT_NPROBE_VALUES = (1, 2, 4, 8, 16, 32)
 
 
 def _relative_path(path: Path) -> str:
@@ -125,6 +133,170 @@ def extract_source_pages(path: Path):
     raise RuntimeError(f"Unsupported source format: {path.suffix}")
 
 
+def load_previous_index(index_path: Path):
+    """Group an existing index by source so unchanged sources can be reused."""
+    payload = physio_knowledge.load_knowledge_index(index_path=index_path)
+    meta = payload.get("meta", {}) or {}
+    if meta.get("missing") or (payload.get("errors") and not payload.get("documents")):
+        return None
+    documents_by_source = {}
+    for record in payload.get("documents", []) or []:
+        if isinstance(record, dict):
+            documents_by_source.setdefault(str(record.get("source_path", "") or ""), []).append(record)
+    errors_by_source = {}
+    for error in payload.get("errors", []) or []:
+        if isinstance(error, dict):
+            errors_by_source.setdefault(str(error.get("source_path", "") or ""), []).append(error)
+    return {
+        "fingerprints": dict(meta.get("source_fingerprints") or {}),
+        "document_shards": list(meta.get("document_shards") or []),
+        "shard_sources": dict(meta.get("document_shard_sources") or {}),
+        "documents_by_source": documents_by_source,
+        "errors_by_source": errors_by_source,
+    }
+
+
+def plan_reusable_shards(previous, unchanged_sources, index_path: Path):
+    """Return the previous shards that can stay on disk untouched.
+
+    A shard is kept only when every source in it is unchanged and every other
+    shard holding part of those sources is kept too, so no source ends up split
+    between a kept shard and a rewritten one.
+    """
+    if not previous:
+        return {}
+    shard_sources = previous["shard_sources"]
+    shard_totals = {}
+    for entries in shard_sources.values():
+        for source_path, count in entries:
+            shard_totals[source_path] = shard_totals.get(source_path, 0) + int(count)
+    # Only trust shard bookkeeping that matches the records actually loaded.
+    unchanged_sources = {
+        source_path
+        for source_path in unchanged_sources
+        if shard_totals.get(source_path, 0) == len(previous["documents_by_source"].get(source_path, []))
+    }
+    candidates = {
+        name: [[str(source_path), int(count)] for source_path, count in shard_sources.get(name, [])]
+        for name in previous["document_shards"]
+        if name in shard_sources and (index_path.parent / name).exists()
+    }
+    kept = {
+        name: entries
+        for name, entries in candidates.items()
+        if all(source_path in unchanged_sources for source_path, _count in entries)
+    }
+    while True:
+        rewritten_sources = {
+            source_path
+            for name in previous["document_shards"]
+            if name not in kept
+            for source_path, _count in shard_sources.get(name, [])
+        }
+        still_kept = {
+            name: entries
+            for name, entries in kept.items()
+            if not any(source_path in rewritten_sources for source_path, _count in entries)
+        }
+        if len(still_kept) == len(kept):
+            return still_kept
+        kept = still_kept
+
+
+class EmbedDispatcher:
+    """Bounded, rate-aware concurrent embedding of chunk batches.
+
+    At most ``concurrency`` provider calls are in flight. Each batch goes
+    through ``retry_fn`` (``run_with_provider_retry`` semantics). Every failed
+    attempt halves the allowed concurrency and every success raises it by one
+    again, so a quota burst backs off instead of hammering the provider.
+    """
+
+    def __init__(self, embed_many, *, concurrency=1, retry_fn=None):
+        self.embed_many = embed_many
+        self.max_concurrency = max(1, int(concurrency or 1))
+        self.limit = self.max_concurrency
+        self.in_flight = 0
+        self.failed_attempts = 0
+        self.retry_fn = retry_fn
+        self._condition = threading.Condition()
+
+    def _acquire(self):
+        with self._condition:
+            while self.in_flight >= self.limit:
+                self._condition.wait()
+            self.in_flight += 1
+
+    def _release(self, *, failed):
+        with self._condition:
+            self.in_flight -= 1
+            if failed:
+                self.failed_attempts += 1
+                self.limit = max(1, self.limit // 2)
+            else:
+                self.limit = min(self.max_concurrency, self.limit + 1)
+            self._condition.notify_all()
+
+    def _attempt(self, texts):
+        self._acquire()
+        try:
+            vectors = self.embed_many(texts, task_type="RETRIEVAL_DOCUMENT")
+        except Exception:
+            self._release(failed=True)
+            raise
+        self._release(failed=False)
+        return vectors
+
+    def embed_batch(self, texts):
+        if self.retry_fn is None:
+            return self._attempt(texts)
+        # Retry sleeps happen outside _attempt, so a backing-off batch holds no slot.
+        return self.retry_fn("physio_library_embed", lambda: self._attempt(texts))
+
+    def embed_all(self, batches):
+        """Embed every batch of texts; results keep batch order and hold vectors or the raised error."""
+        results = []
+        if self.max_concurrency <= 1 or len(batches) <= 1:
+            for texts in batches:
+                try:
+                    results.append(self.embed_batch(texts))
+                except Exception as exc:
+                    results.append(exc)
+            return results
+        with ThreadPoolExecutor(max_workers=self.max_concurrency, thread_name_prefix="physio-embed") as pool:
+            futures = [pool.submit(self.embed_batch, texts) for texts in batches]
+            for future in futures:
+                try:
+                    results.append(future.result())
+                except Exception as exc:
+                    results.append(exc)
+        return results
+
+
+def extract_sources(paths, *, workers=1):
+    """Extract pages for every path; return ``{path: pages}`` with the raised error for failures."""
+    results = {}
+    safe_workers = max(1, int(workers or 1))
+    if safe_workers <= 1 or len(paths) <= 1:
+        for path in paths:
+            try:
+                results[path] = extract_source_pages(path)
+            except Exception as exc:
+                results[path] = exc
+        return results
+    # PDF text extraction is CPU-bound pure Python, so it needs processes rather than threads.
+    # Submitting the largest files first keeps one slow guideline from finishing last alone.
+    ordered_paths = sorted(paths, key=lambda path: path.stat().st_size if path.exists() else 0, reverse=True)
+    with ProcessPoolExecutor(max_workers=min(safe_workers, len(paths))) as pool:
+        futures = {pool.submit(extract_source_pages, path): path for path in ordered_paths}
+        for future in as_completed(futures):
+            try:
+                results[futures[future]] = future.result()
+            except Exception as exc:
+                results[futures[future]] = exc
+    return results
+
+
 def build_manifest(
     source_root: Path,
     *,
@@ -133,63 +305,117 @@ def build_manifest(
     chunk_overlap: int = physio_knowledge.DEFAULT_CHUNK_OVERLAP,
     embed_text_fn=None,
     embed_texts_fn=None,
+    ann_lists=None,
+    ann_nprobe=physio_knowledge.DEFAULT_ANN_NPROBE,
+    incremental=False,
+    embed_model=None,
+    embed_dimension=None,
+    workers=1,
+    embed_concurrency=1,
+    retry_fn=None,
 ):
     embed = embed_text_fn or physio_knowledge.embed_text
-    embed_many = embed_texts_fn
-    documents = []
-    errors = []
-    indexed_source_paths = []
-    embedding_dimension = 0
+    embed_many = embed_texts_fn or (
+        lambda texts, task_type="RETRIEVAL_DOCUMENT": [embed(text, task_type=task_type) for text in texts]
+    )
+    safe_model = str(embed_model or physio_knowledge.DEFAULT_EMBED_MODEL)
+    safe_dimension = physio_knowledge.resolve_embed_dimension(output_dimensionality=embed_dimension)
+    previous = load_previous_index(index_path) if incremental and index_path is not None and index_path.exists() else None
+    timings = {"fingerprint": 0.0, "extract": 0.0, "chunk": 0.0, "embed": 0.0, "write": 0.0}
     source_files = list(iter_source_files(source_root))
 
+    phase_started = time.perf_counter()
+    plans = []
     for path in source_files:
-        source_path = _relative_path(path)
-        source_kind = path.parent.name
-        source_title = _title_from_path(path)
-        source_indexed = False
+        plan = {"path": path, "source_path": _relative_path(path), "fingerprint": "", "reuse": False}
         try:
-            pages = extract_source_pages(path)
-            if not pages:
-                errors.append({"source_path": source_path, "error": "No extractable text found."})
-                continue
-            source_records = []
-            for page in pages:
-                records = physio_knowledge.build_chunk_records(
+            plan["fingerprint"] = physio_knowledge.source_fingerprint(
+                physio_knowledge.source_content_hash(path),
+                chunk_size=chunk_size,
+                chunk_overlap=chunk_overlap,
+                embed_model=safe_model,
+                embed_dimension=safe_dimension,
+            )
+            plan["reuse"] = bool(previous and previous["fingerprints"].get(plan["source_path"]) == plan["fingerprint"])
+        except Exception as exc:
+            plan["error"] = str(exc)[:300]
+        plans.append(plan)
+    pending = [plan for plan in plans if not plan["reuse"] and not plan.get("error")]
+    timings["fingerprint"] = time.perf_counter() - phase_started
+
+    phase_started = time.perf_counter()
+    extracted = extract_sources([plan["path"] for plan in pending], workers=workers)
+    timings["extract"] = time.perf_counter() - phase_started
+
+    phase_started = time.perf_counter()
+    batches = []
+    for plan in pending:
+        pages = extracted.get(plan["path"])
+        if isinstance(pages, Exception):
+            plan["error"] = str(pages)[:300]
+            continue
+        if not pages:
+            plan["error"] = "No extractable text found."
+            plan["empty"] = True
+            continue
+        plan["records"] = []
+        for page in pages:
+            plan["records"].extend(
+                physio_knowledge.build_chunk_records(
                     page.get("text", ""),
-                    source_name=path.name,
-                    source_path=source_path,
-                    source_kind=source_kind,
+                    source_name=plan["path"].name,
+                    source_path=plan["source_path"],
+                    source_kind=plan["path"].parent.name,
                     page_label=page.get("page_label", ""),
-                    title=source_title,
+                    title=_title_from_path(plan["path"]),
                     chunk_size=chunk_size,
                     chunk_overlap=chunk_overlap,
                 )
-                source_records.extend(records)
-            if embed_many:
-                for batch in _batched(source_records, EMBED_BATCH_SIZE):
-                    vectors = embed_many(
-                        [record["text"] for record in batch],
-                        task_type="RETRIEVAL_DOCUMENT",
-                    )
-                    for record, vector in zip(batch, vectors):
-                        compact_vector = _compact_vector(vector)
-                        if compact_vector and not embedding_dimension:
-                            embedding_dimension = len(compact_vector)
-                        record["embedding"] = compact_vector
-                        documents.append(record)
-                        source_indexed = True
-            else:
-                for record in source_records:
-                    compact_vector = _compact_vector(embed(record["text"], task_type="RETRIEVAL_DOCUMENT"))
-                    if compact_vector and not embedding_dimension:
-                        embedding_dimension = len(compact_vector)
-                    record["embedding"] = compact_vector
-                    documents.append(record)
-                    source_indexed = True
-            if source_indexed:
+            )
+        batches.extend((plan, batch) for batch in _batched(plan["records"], EMBED_BATCH_SIZE))
+    timings["chunk"] = time.perf_counter() - phase_started
+
+    phase_started = time.perf_counter()
+    dispatcher = EmbedDispatcher(embed_many, concurrency=embed_concurrency, retry_fn=retry_fn)
+    results = dispatcher.embed_all([[record["text"] for record in batch] for _plan, batch in batches])
+    for (plan, batch), vectors in zip(batches, results):
+        if isinstance(vectors, Exception):
+            plan.setdefault("error", str(vectors)[:300])
+            continue
+        for record, vector in zip(batch, vectors):
+            record["embedding"] = _compact_vector(vector)
+    timings["embed"] = time.perf_counter() - phase_started
+
+    documents = []
+    errors = []
+    indexed_source_paths = []
+    source_fingerprints = {}
+    unchanged_sources = set()
+    for plan in plans:
+        source_path = plan["source_path"]
+        if plan["reuse"]:
+            reused_records = previous["documents_by_source"].get(source_path, [])
+            for record in reused_records:
+                record["embedding"] = _compact_vector(record.get("embedding"))
+            documents.extend(reused_records)
+            errors.extend(previous["errors_by_source"].get(source_path, []))
+            source_fingerprints[source_path] = plan["fingerprint"]
+            unchanged_sources.add(source_path)
+            if reused_records:
                 indexed_source_paths.append(source_path)
-        except Exception as exc:
-            errors.append({"source_path": source_path, "error": str(exc)[:300]})
+            continue
+        if plan.get("error"):
+            # A failed source contributes no partial chunks and keeps no fingerprint, so the next build retries it.
+            errors.append({"source_path": source_path, "error": plan["error"]})
+            if plan.get("empty"):
+                source_fingerprints[source_path] = plan["fingerprint"]
+            continue
+        embedded_records = [record for record in plan.get("records", []) if "embedding" in record]
+        documents.extend(embedded_records)
+        if embedded_records:
+            indexed_source_paths.append(source_path)
+        source_fingerprints[source_path] = plan["fingerprint"]
+    embedding_dimension = next((len(record["embedding"]) for record in documents if record.get("embedding")), 0)
 
     manifest = {
         "meta": {
@@ -198,31 +424,120 @@ def build_manifest(
             "source_count": len(source_files),
             "indexed_source_paths": indexed_source_paths,
             "document_count": len(documents),
-            "embedding_model": physio_knowledge.DEFAULT_EMBED_MODEL,
-            "embedding_dimension": int(embedding_dimension or physio_knowledge.DEFAULT_EMBED_DIMENSION),
+            "embedding_model": safe_model,
+            "embedding_dimension": int(embedding_dimension or safe_dimension),
             "chunk_size": int(chunk_size),
             "chunk_overlap": int(chunk_overlap),
+            "source_fingerprints": source_fingerprints,
         },
         "documents": documents,
         "errors": errors,
     }
+    current_sources = {plan["source_path"] for plan in plans}
+    build_stats = {
+        "reused_sources": len(unchanged_sources),
+        "embedded_sources": len(pending),
+        "deleted_sources": len([path for path in (previous or {}).get("fingerprints", {}) if path not in current_sources]),
+        "kept_shards": 0,
+        "written_shards": 0,
+        "embed_batches": len(batches),
+        "embed_failed_attempts": dispatcher.failed_attempts,
+    }
     if index_path is not None:
-        write_manifest(manifest, index_path)
+        phase_started = time.perf_counter()
+        reuse_shards = plan_reusable_shards(previous, unchanged_sources, index_path)
+        written_meta = write_manifest(
+            manifest,
+            index_path,
+            ann_lists=ann_lists,
+            ann_nprobe=ann_nprobe,
+            reuse_shards=reuse_shards,
+        )
+        build_stats["kept_shards"] = len(reuse_shards)
+        build_stats["written_shards"] = int(written_meta["document_shard_count"]) - len(reuse_shards)
+        timings["write"] = time.perf_counter() - phase_started
+    build_stats["timings"] = {phase: round(seconds, 3) for phase, seconds in timings.items()}
+    manifest["build_stats"] = build_stats
     return manifest
 
 
-def write_manifest(manifest: dict, index_path: Path):
+def _print_ann_report(report):
+    if not report.get("results"):
+        return
+    print(
+        f"IVF recall@{report['k']} over {report['sample_size']} sampled queries "
+        f"(exact search {report['exact_mean_ms']:.2f}ms/query):"
+    )
+    for row in report["results"]:
+        print(
+            f"  nprobe={row['nprobe']:<4} recall={row['recall_at_k']:.3f} "
+            f"candidates={row['mean_candidates']:<8} latency={row['mean_ms']:.2f}ms"
+        )
+
+
+def build_ann_index(index_path: Path, vector_store: dict, *, ann_lists=None, ann_nprobe=physio_knowledge.DEFAULT_ANN_NPROBE):
+    if ann_lists == 0:
+        return None
+    ann_index = physio_knowledge.write_ann_index(index_path, vector_store, nlist=ann_lists, nprobe=ann_nprobe)
+    if not ann_index:
+        return None
+    store = physio_knowledge.open_vector_store(index_path.parent, vector_store, ann_meta=ann_index)
+    nprobe_values = sorted({value for value in (*ANN_REPORT_NPROBE_VALUES, ann_index["nprobe"]) if value < ann_index["nlist"]})
+    report = physio_knowledge.measure_ann_recall(store, nprobe_values=nprobe_values, k=ANN_RECALL_K)
+    _print_ann_report(report)
+    for row in report["results"]:
+        if row["nprobe"] == ann_index["nprobe"]:
+            ann_index["recall_at_k"] = {"k": report["k"], "recall": row["recall_at_k"]}
+    return ann_index
+
+
+def _shard_number(index_path: Path, shard_name: str) -> int:
+    match = re.fullmatch(rf"{re.escape(index_path.stem)}\.documents-(\d+)\.json\.gz", str(shard_name))
+    return int(match.group(1)) if match else 0
+
+
+def write_manifest(
+    manifest: dict,
+    index_path: Path,
+    *,
+    ann_lists=None,
+    ann_nprobe=physio_knowledge.DEFAULT_ANN_NPROBE,
+    reuse_shards=None,
+):
+    """Write shards, vector store, search sidecars and manifest; return the written manifest meta.
+
+    ``reuse_shards`` maps existing shard names to their ``[source_path, count]``
+    entries. Those files stay untouched and their records keep their order;
+    every other record is packed into new shards.
+    """
     index_path.parent.mkdir(parents=True, exist_ok=True)
+    kept_shards = dict(reuse_shards or {})
     for stale_path in index_path.parent.glob(f"{index_path.stem}.documents-*.json.gz"):
-        stale_path.unlink(missing_ok=True)
+        if stale_path.name not in kept_shards:
+            stale_path.unlink(missing_ok=True)
 
-    document_shards = []
+    records_by_source = {}
+    for record in manifest.get("documents", []) or []:
+        records_by_source.setdefault(str(record.get("source_path", "") or ""), []).append(record)
+    ordered_documents = []
+    kept_sources = set()
+    source_cursors = {}
+    for entries in kept_shards.values():
+        for source_path, count in entries:
+            kept_sources.add(source_path)
+            start = source_cursors.get(source_path, 0)
+            ordered_documents.extend(records_by_source.get(source_path, [])[start:start + int(count)])
+            source_cursors[source_path] = start + int(count)
+
+    document_shards = list(kept_shards)
+    shard_sources = {name: entries for name, entries in kept_shards.items()}
     current_records = []
+    current_entries = []
     current_size = 2  # []
-    shard_index = 0
+    shard_index = max([_shard_number(index_path, name) for name in kept_shards] or [0])
 
     def flush_shard():
-        nonlocal current_records, current_size, shard_index
+        nonlocal current_records, current_entries, current_size, shard_index
         if not current_records:
             return
         shard_index += 1
@@ -236,24 +551,50 @@ def write_manifest(manifest: dict, index_path: Path):
                 handle.write(payload)
             handle.write(b"]\n")
         document_shards.append(shard_name)
+        shard_sources[shard_name] = current_entries
         current_records = []
+        current_entries = []
         current_size = 2
 
     for record in manifest.get("documents", []) or []:
+        source_path = str(record.get("source_path", "") or "")
+        if source_path in kept_sources:
+            continue
+        ordered_documents.append(record)
         payload = _serialized_json_bytes(record)
         separator_size = 1 if current_records else 0
         if current_records and current_size + separator_size + len(payload) > MAX_INDEX_SHARD_BYTES:
             flush_shard()
         current_records.append(payload)
         current_size += len(payload) + (1 if len(current_records) > 1 else 0)
+        if current_entries and current_entries[-1][0] == source_path:
+            current_entries[-1][1] += 1
+        else:
+            current_entries.append([source_path, 1])
     flush_shard()
+    vector_store = physio_knowledge.write_vector_store(
+        ordered_documents,
+        index_path,
+        dimension=(manifest.get("meta", {}) or {}).get("embedding_dimension"),
+    )
+    ann_index = build_ann_index(index_path, vector_store, ann_lists=ann_lists, ann_nprobe=ann_nprobe)
+    bm25_index = physio_knowledge.write_bm25_index(index_path, vector_store)
 
+    meta = {
+        key: value
+        for key, value in (manifest.get("meta", {}) or {}).items()
+        if key not in {"ann_index", "bm25_index"}
+    }
     index_payload = {
         "meta": {
-            **(manifest.get("meta", {}) or {}),
+            **meta,
             "format": physio_knowledge.SHARDED_INDEX_FORMAT,
             "document_shards": document_shards,
             "document_shard_count": len(document_shards),
+            "document_shard_sources": shard_sources,
+            "vector_store": vector_store,
+            **({"ann_index": ann_index} if ann_index else {}),
+            **({"bm25_index": bm25_index} if bm25_index else {}),
         },
         "documents": [],
         "errors": list(manifest.get("errors", []) or []),
@@ -262,6 +603,7 @@ def write_manifest(manifest: dict, index_path: Path):
         json.dumps(index_payload, ensure_ascii=False, separators=(",", ":")) + "\n",
         encoding="utf-8",
     )
+    return index_payload["meta"]
 
 
 def parse_args(argv=None):
@@ -270,13 +612,62 @@ def parse_args(argv=None):
     parser.add_argument("--index-path", default=str(DEFAULT_INDEX_PATH))
     parser.add_argument("--chunk-size", type=int, default=physio_knowledge.DEFAULT_CHUNK_SIZE)
     parser.add_argument("--chunk-overlap", type=int, default=physio_knowledge.DEFAULT_CHUNK_OVERLAP)
+    parser.add_argument(
+        "--rewrite-only",
+        action="store_true",
+        help="Rewrite the index files from the existing manifest without extracting or embedding sources.",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=max(1, min(4, os.cpu_count() or 1)),
+        help="Processes used to extract source text in parallel.",
+    )
+    parser.add_argument(
+        "--embed-concurrency",
+        type=int,
+        default=DEFAULT_EMBED_CONCURRENCY,
+        help="Maximum embedding batches in flight; halves automatically on provider errors.",
+    )
+    parser.add_argument(
+        "--full",
+        action="store_true",
+        help="Re-extract and re-embed every source instead of reusing unchanged sources from the existing index.",
+    )
+    parser.add_argument(
+        "--ann-lists",
+        type=int,
+        default=None,
+        help="IVF lists for the approximate nearest-neighbour index (default: sqrt(chunks) above "
+        f"{physio_knowledge.ANN_MIN_RECORDS} chunks; 0 disables it).",
+    )
+    parser.add_argument(
+        "--ann-nprobe",
+        type=int,
+        default=physio_knowledge.DEFAULT_ANN_NPROBE,
+        help="Default IVF lists probed per query; override at runtime with PHYSIO_ANN_NPROBE.",
+    )
     return parser.parse_args(argv)
 
 
+def rewrite_existing_index(index_path: Path, *, ann_lists=None, ann_nprobe=physio_knowledge.DEFAULT_ANN_NPROBE):
+    payload = physio_knowledge.load_knowledge_index(index_path=index_path)
+    if payload.get("meta", {}).get("missing"):
+        raise SystemExit(f"Index not found: {index_path}")
+    for record in payload.get("documents", []) or []:
+        record["embedding"] = _compact_vector(record.get("embedding"))
+    write_manifest(payload, index_path, ann_lists=ann_lists, ann_nprobe=ann_nprobe)
+    return payload
+
+
 def main(argv=None):
     args = parse_args(argv)
     source_root = Path(args.source_root).resolve()
     index_path = Path(args.index_path).resolve()
+    if args.rewrite_only:
+        manifest = rewrite_existing_index(index_path, ann_lists=args.ann_lists, ann_nprobe=args.ann_nprobe)
+        print(f"Rewrote physio library index with {len(manifest['documents'])} chunks.")
+        return 0
     if not source_root.exists():
         raise SystemExit(f"Source root not found: {source_root}")
     app = create_app()
@@ -287,6 +678,18 @@ def main(argv=None):
             index_path=index_path,
             chunk_size=args.chunk_size,
             chunk_overlap=args.chunk_overlap,
+            ann_lists=args.ann_lists,
+            ann_nprobe=args.ann_nprobe,
+            incremental=not args.full,
+            workers=args.workers,
+            embed_concurrency=args.embed_concurrency,
+            retry_fn=lambda operation_name, func: ai_provider.run_with_provider_retry(
+                operation_name,
+                func,
+                runtime=runtime,
+            ),
+            embed_model=physio_knowledge.resolve_embed_model(runtime=runtime),
+            embed_dimension=physio_knowledge.resolve_embed_dimension(runtime=runtime),
             embed_text_fn=lambda text, task_type="RETRIEVAL_DOCUMENT": physio_knowledge.embed_text(
                 text,
                 task_type=task_type,
@@ -303,6 +706,16 @@ def main(argv=None):
         f"{manifest['meta']['document_count']} chunks from "
         f"{manifest['meta']['source_count']} source files."
     )
+    stats = manifest["build_stats"]
+    print(
+        f"Embedded {stats['embedded_sources']} source(s), reused {stats['reused_sources']}, "
+        f"dropped {stats['deleted_sources']}; kept {stats['kept_shards']} shard(s), wrote {stats['written_shards']}."
+    )
+    print(
+        "Timings: "
+        + ", ".join(f"{phase} {seconds:.1f}s" for phase, seconds in stats["timings"].items())
+        + f" ({stats['embed_batches']} embed batch(es), {stats['embed_failed_attempts']} failed attempt(s))"
+    )
     if manifest["errors"]:
         print(f"Warnings: {len(manifest['errors'])} source file(s) could not be indexed.", file=sys.stderr)
     return 0
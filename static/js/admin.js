@@ -497,6 +497,24 @@ function renderAdminSystemStatus(data) {
         { key: 'video_import_available', label: 'LMS video import', value: data.runtime_checks && data.runtime_checks.video_import_available },
         { key: 'ffmpeg_available', label: 'FFmpeg', value: data.runtime_checks && data.runtime_checks.ffmpeg_available },
         { key: 'yt_dlp_available', label: 'yt-dlp', value: data.runtime_checks && data.runtime_checks.yt_dlp_available },
+        { key: 'physio_query_cache_hits', label: 'Physio query cache hits', value: data.runtime_checks && data.runtime_checks.physio_query_cache_hits },
+        { key: 'physio_query_cache_shared_hits', label: 'Physio shared cache hits', value: data.runtime_checks && data.runtime_checks.physio_query_cache_shared_hits },
+        { key: 'physio_query_cache_misses', label: 'Physio query cache misses', value: data.runtime_checks && data.runtime_checks.physio_query_cache_misses },
+        { key: 'physio_query_cache_entries', label: 'Physio query cache entries', value: data.runtime_checks && data.runtime_checks.physio_query_cache_entries },
+        { key: 'physio_query_cache_shared', label: 'Physio shared query cache', value: data.runtime_checks && data.runtime_checks.physio_query_cache_shared },
+        { key: 'runtime_job_snapshot_writes', label: 'Job snapshot writes', value: data.runtime_checks && data.runtime_checks.runtime_job_snapshot_writes },
+        { key: 'runtime_job_snapshot_writes_saved', label: 'Job snapshot writes saved', value: data.runtime_checks && data.runtime_checks.runtime_job_snapshot_writes_saved },
+        { key: 'runtime_job_snapshot_bytes_saved', label: 'Job snapshot bytes saved', value: data.runtime_checks && data.runtime_checks.runtime_job_snapshot_bytes_saved },
+        { key: 'provider_poll_files_in_flight', label: 'Provider files polling', value: data.runtime_checks && data.runtime_checks.provider_poll_files_in_flight },
+        { key: 'provider_poll_batches_in_flight', label: 'Provider batches polling', value: data.runtime_checks && data.runtime_checks.provider_poll_batches_in_flight },
+        { key: 'provider_poll_calls_last_minute', label: 'Provider polls (last minute)', value: data.runtime_checks && data.runtime_checks.provider_poll_calls_last_minute },
+        { key: 'provider_poll_errors', label: 'Provider poll errors', value: data.runtime_checks && data.runtime_checks.provider_poll_errors },
+        { key: 'job_queue_running', label: 'Background jobs running', value: data.runtime_checks && data.runtime_checks.job_queue_running },
+        { key: 'job_queue_queued', label: 'Background jobs queued', value: data.runtime_checks && data.runtime_checks.job_queue_queued },
+        { key: 'job_queue_wait_p95_ms', label: 'Job queue wait p95 (ms)', value: data.runtime_checks && data.runtime_checks.job_queue_wait_p95_ms },
+        { key: 'auth_token_cache_hits', label: 'Auth token cache hits', value: data.runtime_checks && data.runtime_checks.auth_token_cache_hits },
+        { key: 'auth_token_cache_misses', label: 'Auth token cache misses', value: data.runtime_checks && data.runtime_checks.auth_token_cache_misses },
+        { key: 'auth_token_cache_entries', label: 'Auth token cache entries', value: data.runtime_checks && data.runtime_checks.auth_token_cache_entries },
     ]);
 }
 
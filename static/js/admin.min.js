@@ -1,4 +1,4 @@
-const bootstrap=window.LectureProcessorBootstrap||{},auth=bootstrap.getAuth?bootstrap.getAuth():firebase.auth(),authUtils=window.LectureProcessorAuth||{},authClient=authUtils.createAuthClient?authUtils.createAuthClient(auth,{notSignedInMessage:"Not signed in"}):null,downloadUtils=window.LectureProcessorDownload||{},uxUtils=window.LectureProcessorUx||{},signedInMeta=document.getElementById("signed-in-meta"),stateArea=document.getElementById("state-area"),dashboard=document.getElementById("dashboard"),authBtn=document.getElementById("auth-btn"),refreshBtn=document.getElementById("refresh-btn"),backBtn=document.getElementById("back-btn"),exportJobsBtn=document.getElementById("export-jobs-btn"),exportPurchasesBtn=document.getElementById("export-purchases-btn"),exportFunnelBtn=document.getElementById("export-funnel-btn"),exportFunnelDailyBtn=document.getElementById("export-funnel-daily-btn"),adminTabButtons=Array.from(document.querySelectorAll("[data-admin-tab]")),adminOverviewContent=document.getElementById("admin-tab-overview-content"),adminBatchContent=document.getElementById("admin-tab-batch-content"),adminBatchRefreshBtn=document.getElementById("admin-batch-refresh-btn"),adminBatchMode=document.getElementById("admin-batch-mode"),adminBatchStatus=document.getElementById("admin-batch-status"),adminBatchJobsBody=document.getElementById("admin-batch-jobs-body");let currentWindow="7d",currentModeView="total",latestModeBreakdown={},activeAdminTab="overview",adminToastTimer=null;const adminToast=document.createElement("div");adminToast.className="admin-toast",document.body.appendChild(adminToast);function authFetch(e,t){return authClient&&typeof authClient.authFetch=="function"?authClient.authFetch(e,t,{retryOn401:!0}):auth.currentUser?auth.currentUser.getIdToken().then(o=>{const a=t||{},n=Object.assign({},a.headers||{},{Authorization:`Bearer ${o}`});return fetch(e,Object.assign({},a,{headers:n}))}):Promise.reject(new Error("Not signed in"))}function formatMoney(e){return`\u20AC${((e||0)/100).toFixed(2)}`}function formatDate(e){return e?uxUtils.formatDateTime?uxUtils.formatDateTime(e,{unit:"seconds"}):new Date(e*1e3).toLocaleString(navigator.language||"en-US",{day:"2-digit",month:"short",year:"numeric",hour:"2-digit",minute:"2-digit"}):"-"}function formatRateLimitLabel(e){return{upload:"Upload",checkout:"Checkout",analytics:"Analytics",tools:"Tools"}[e]||e}function formatTokenCount(e){return!e||e===0?"-":e>=1e6?`${(e/1e6).toFixed(1)}M`:e>=1e3?`${(e/1e3).toFixed(1)}K`:String(e)}function showAdminToast(e,t){e&&(adminToast.textContent=String(e),adminToast.classList.remove("success","error","visible"),t==="success"&&adminToast.classList.add("success"),t==="error"&&adminToast.classList.add("error"),adminToast.classList.add("visible"),adminToastTimer&&window.clearTimeout(adminToastTimer),adminToastTimer=window.setTimeout(()=>{adminToast.classList.remove("visible")},2400))}function setAdminTab(e){const t=e==="batch-jobs"?"batch-jobs":"overview";activeAdminTab=t,adminTabButtons.forEach(o=>{o.classList.toggle("active",o.dataset.adminTab===t)}),adminOverviewContent&&(adminOverviewContent.hidden=t!=="overview"),adminBatchContent&&(adminBatchContent.hidden=t!=="batch-jobs")}function renderAdminBatchJobs(e){if(!adminBatchJobsBody)return;adminBatchJobsBody.innerHTML="";const t=Array.isArray(e)?e:[];if(!t.length){const o=document.createElement("tr"),a=document.createElement("td");a.colSpan=9,a.className="empty",a.textContent="No batch jobs found for this filter.",o.appendChild(a),adminBatchJobsBody.appendChild(o);return}t.forEach(o=>{const a=document.createElement("tr"),n=String(o.status||"queued"),s=n==="complete"?"complete":n==="error"?"error":n==="partial"?"partial":n==="processing"?"processing":"queued",c=`${Number(o.completed_rows||0)}/${Number(o.total_rows||0)} complete \xB7 ${Number(o.failed_rows||0)} failed`,f=[o.current_stage||"-",o.current_stage_state||"-",o.provider_state||"-"].join(" \xB7 "),p=`${Number(o.credits_refunded||0)} refunded \xB7 ${Number(o.credits_refund_pending||0)} pending`;[formatDate(o.created_at),(o.email||"").slice(0,64)||"-",o.batch_title||o.batch_id||"-",o.mode||"-"].forEach(l=>{const m=document.createElement("td");m.textContent=String(l||"-"),a.appendChild(m)});const g=document.createElement("td"),h=document.createElement("span");h.className=`status ${s}`,h.textContent=n,g.appendChild(h),a.appendChild(g),[f,c,o.completion_email_status||"pending",p].forEach(l=>{const m=document.createElement("td");m.textContent=String(l||"-"),a.appendChild(m)}),adminBatchJobsBody.appendChild(a)})}async function loadAdminBatchJobs(e=!1){if(!auth.currentUser){renderAdminBatchJobs([]);return}const t=new URLSearchParams;t.set("limit","300"),adminBatchMode&&adminBatchMode.value&&t.set("mode",adminBatchMode.value),adminBatchStatus&&adminBatchStatus.value&&t.set("status",adminBatchStatus.value);try{const o=await authFetch(`/api/admin/batch-jobs?${t.toString()}`);if(!o.ok){const n=await o.json().catch(()=>({}));throw new Error(n.error||"Could not load batch jobs.")}const a=await o.json();renderAdminBatchJobs(a.batches||[]),e&&showAdminToast("Batch jobs refreshed.","success")}catch(o){console.error(o),showAdminToast(o.message||"Could not load batch jobs.","error")}}function formatPromptSummary(e){const t=String(e.prompt_template_key||"").trim(),o=String(e.custom_prompt||"").trim(),a=String(e.prompt_source||"").trim(),n=[];if(t?n.push(`Template: ${t}`):a==="default"&&n.push("Default prompt"),o){const s=o.replace(/\s+/g," ").trim();n.push(s.length>90?`${s.slice(0,87)}...`:s)}return n.join(" \xB7 ")||"Default prompt"}function setState(e,t="loading"){stateArea.textContent=e,stateArea.className=t,stateArea.hidden=!1,dashboard.hidden=!0}async function parseAdminErrorResponse(e,t){const o=await e.json().catch(()=>({})),a=String(o.error||o.message||"").trim();return e.status===401?{type:"blocked",message:a||"Your admin session expired. Please sign in again."}:e.status===403?{type:"blocked",message:a||"Your account is signed in but is not configured as an admin on the server."}:e.status>=500?{type:"error",message:a||t||"The server could not load admin data right now."}:{type:"error",message:a||t||"Request failed."}}function clearChildren(e){for(;e.firstChild;)e.removeChild(e.firstChild)}function renderRows(e,t,o,a=8){const n=document.getElementById(e);if(clearChildren(n),!t.length){const s=document.createElement("tr"),c=document.createElement("td");c.colSpan=a,c.className="empty",c.textContent=o,s.appendChild(c),n.appendChild(s);return}t.forEach(s=>{if(!(s instanceof Node)){console.warn("renderRows skipped non-Node row for",e,s);return}n.appendChild(s)})}function renderEmptyChart(e){const t=document.getElementById(e);if(!t)return null;clearChildren(t);const o=document.createElement("div");return o.className="chart-empty",o.textContent="No data for selected window.",t.appendChild(o),t}function svgNode(e,t={}){const o=document.createElementNS("http://www.w3.org/2000/svg",e);return Object.entries(t).forEach(([a,n])=>{n!=null&&o.setAttribute(a,String(n))}),o}function formatStatusValue(e,t=""){if(e==null||e==="")return"-";if(t==="host_matches_render")return e?"Matches":"Mismatch";if(t==="host_status")return{"custom-domain":"Custom domain","configured-public-host":"Configured host","render-default":"Render default",mismatch:"Mismatch",unknown:"Unknown"}[String(e||"")]||String(e);if(typeof e=="boolean")return e?"Ready":"Not ready";if(t==="app_uptime_seconds"){const o=Math.max(0,Number(e||0));return Number.isFinite(o)?o<60?`${Math.round(o)}s`:o<3600?`${Math.floor(o/60)}m`:`${Math.floor(o/3600)}h ${Math.floor(o%3600/60)}m`:"-"}return String(e)}function renderStatusPairs(e,t){const o=document.getElementById(e);o&&(clearChildren(o),t.forEach(a=>{const n=document.createElement("div");n.className="status-row";const s=document.createElement("dt");s.textContent=a.label;const c=document.createElement("dd");c.textContent=formatStatusValue(a.value,a.key),n.appendChild(s),n.appendChild(c),o.appendChild(n)}))}function renderDataWarnings(e){const t=document.getElementById("admin-data-warnings"),o=document.getElementById("admin-partial-banner");if(!t||!o)return;clearChildren(t);const a=Array.isArray(e)?e:[];if(o.hidden=a.length===0,!a.length){const n=document.createElement("li");n.className="ok",n.textContent="No data warnings in the selected window.",t.appendChild(n);return}a.forEach(n=>{const s=document.createElement("li");s.textContent=String(n||"").replace(/_/g," "),t.appendChild(s)})}function tickIndices(e,t=6){if(e<=t)return Array.from({length:e},(n,s)=>s);const o=Math.ceil((e-1)/(t-1)),a=[];for(let n=0;n<e;n+=o)a.push(n);return a[a.length-1]!==e-1&&a.push(e-1),a}function niceCeiling(e){const t=Math.max(0,Number(e||0));if(!t)return 100;const o=Math.pow(10,Math.max(0,Math.floor(Math.log10(t))-1));return Math.ceil(t/o)*o}function renderSuccessChart(e,t,o){const a=document.getElementById(e);if(!a)return;if(clearChildren(a),!t.length){renderEmptyChart(e);return}const n=720,s=260,c={top:14,right:16,bottom:34,left:46},f=n-c.left-c.right,p=s-c.top-c.bottom,g=svgNode("svg",{viewBox:`0 0 ${n} ${s}`,class:"admin-chart-svg",role:"img","aria-label":"Success rate trend chart"}),h=i=>t.length===1?c.left+f/2:c.left+f/Math.max(t.length-1,1)*i,l=i=>c.top+p-Math.max(0,Math.min(100,Number(i||0)))/100*p;[0,25,50,75,100].forEach(i=>{const u=l(i);g.appendChild(svgNode("line",{x1:c.left,y1:u,x2:n-c.right,y2:u,class:"chart-grid-line"}));const C=svgNode("text",{x:c.left-8,y:u+4,class:"chart-axis-label y"});C.textContent=`${i}%`,g.appendChild(C)});const m=new Set(tickIndices(t.length,t.length>14?5:7));t.forEach((i,u)=>{if(!m.has(u))return;const C=h(u),b=svgNode("text",{x:C,y:s-8,class:"chart-axis-label x"});b.textContent=i,g.appendChild(b)});const y=o.map((i,u)=>[h(u),l(i)]),d=y.map((i,u)=>`${u===0?"M":"L"} ${i[0]} ${i[1]}`).join(" "),r=`${d} L ${y[y.length-1][0]} ${c.top+p} L ${y[0][0]} ${c.top+p} Z`;g.appendChild(svgNode("path",{d:r,fill:"rgba(16, 185, 129, 0.14)"})),g.appendChild(svgNode("path",{d,fill:"none",stroke:"#10B981","stroke-width":3,"stroke-linecap":"round","stroke-linejoin":"round"})),y.forEach((i,u)=>{const C=svgNode("circle",{cx:i[0],cy:i[1],r:4,fill:"#ffffff",stroke:"#10B981","stroke-width":2}),b=svgNode("title");b.textContent=`${t[u]}: ${Number(o[u]||0).toFixed(1)}%`,C.appendChild(b),g.appendChild(C)}),a.appendChild(g)}function renderRevenueChart(e,t,o){const a=document.getElementById(e);if(!a)return;if(clearChildren(a),!t.length){renderEmptyChart(e);return}const n=720,s=260,c={top:14,right:16,bottom:34,left:58},f=n-c.left-c.right,p=s-c.top-c.bottom,g=niceCeiling(Math.max(...o,0)),h=svgNode("svg",{viewBox:`0 0 ${n} ${s}`,class:"admin-chart-svg",role:"img","aria-label":"Revenue trend chart"}),l=f/Math.max(t.length,1),m=Math.max(10,Math.min(34,l*.55)),y=u=>c.top+p-Math.max(0,Number(u||0))/g*p;for(let u=0;u<=4;u+=1){const C=g/4*u,b=y(C);h.appendChild(svgNode("line",{x1:c.left,y1:b,x2:n-c.right,y2:b,class:"chart-grid-line"}));const v=svgNode("text",{x:c.left-8,y:b+4,class:"chart-axis-label y"});v.textContent=formatMoney(Math.round(C)),h.appendChild(v)}const d=new Set(tickIndices(t.length,t.length>14?5:7));t.forEach((u,C)=>{const b=c.left+l*C+l/2;if(d.has(C)){const x=svgNode("text",{x:b,y:s-8,class:"chart-axis-label x"});x.textContent=u,h.appendChild(x)}const v=Math.max(0,Number(o[C]||0)),E=y(v),k=Math.max(0,c.top+p-E),w=svgNode("rect",{x:b-m/2,y:E,width:m,height:k,rx:8,fill:"url(#revenueGradient)"}),_=svgNode("title");if(_.textContent=`${u}: ${formatMoney(v)}`,w.appendChild(_),h.appendChild(w),v>0){const x=svgNode("text",{x:b,y:Math.max(18,E-6),class:"chart-column-label"});x.textContent=formatMoney(v),h.appendChild(x)}});const r=svgNode("defs"),i=svgNode("linearGradient",{id:"revenueGradient",x1:"0",y1:"0",x2:"0",y2:"1"});i.appendChild(svgNode("stop",{offset:"0%","stop-color":"#60A5FA"})),i.appendChild(svgNode("stop",{offset:"100%","stop-color":"#0EA5E9"})),r.appendChild(i),h.insertBefore(r,h.firstChild),a.appendChild(h)}function renderAdminSystemStatus(e){renderDataWarnings(e.data_warnings||[]),renderStatusPairs("admin-deployment",[{key:"runtime",label:"Runtime",value:e.deployment&&e.deployment.runtime},{key:"request_host",label:"Request host",value:e.deployment&&e.deployment.request_host},{key:"configured_public_hostname",label:"Public host",value:e.deployment&&e.deployment.configured_public_hostname},{key:"render_external_hostname",label:"Render host",value:e.deployment&&e.deployment.render_external_hostname},{key:"host_status",label:"Host routing",value:e.deployment&&e.deployment.host_status},{key:"service_name",label:"Service",value:e.deployment&&e.deployment.service_name},{key:"git_branch",label:"Git branch",value:e.deployment&&e.deployment.git_branch},{key:"git_commit_short",label:"Git commit",value:e.deployment&&e.deployment.git_commit_short},{key:"app_uptime_seconds",label:"App uptime",value:e.deployment&&e.deployment.app_uptime_seconds}]),renderStatusPairs("admin-runtime-checks",[{key:"firebase_ready",label:"Firebase",value:e.runtime_checks&&e.runtime_checks.firebase_ready},{key:"gemini_ready",label:"Gemini",value:e.runtime_checks&&e.runtime_checks.gemini_ready},{key:"stripe_secret_mode",label:"Stripe secret key",value:e.runtime_checks&&e.runtime_checks.stripe_secret_mode},{key:"stripe_publishable_mode",label:"Stripe publishable key",value:e.runtime_checks&&e.runtime_checks.stripe_publishable_mode},{key:"stripe_keys_match",label:"Stripe keys aligned",value:e.runtime_checks&&e.runtime_checks.stripe_keys_match},{key:"stripe_webhook_configured",label:"Stripe webhook",value:e.runtime_checks&&e.runtime_checks.stripe_webhook_configured},{key:"pptx_conversion_available",label:"PPTX conversion",value:e.runtime_checks&&e.runtime_checks.pptx_conversion_available},{key:"video_import_available",label:"LMS video import",value:e.runtime_checks&&e.runtime_checks.video_import_available},{key:"ffmpeg_available",label:"FFmpeg",value:e.runtime_checks&&e.runtime_checks.ffmpeg_available},{key:"yt_dlp_available",label:"yt-dlp",value:e.runtime_checks&&e.runtime_checks.yt_dlp_available}])}function renderModeBreakdown(){const e=document.getElementById("mode-breakdown-bars");clearChildren(e);const t=Object.values(latestModeBreakdown||{}).filter(a=>a&&a.label);if(!t.length){const a=document.createElement("div");a.className="empty",a.textContent="No mode data for selected window.",e.appendChild(a);return}const o=Math.max(...t.map(a=>a[currentModeView]||0),1);t.forEach(a=>{const n=a[currentModeView]||0,s=Math.max(n/o*100,n>0?2:0),c=document.createElement("div");c.className="mode-row";const f=document.createElement("div");f.className="mode-label",f.textContent=String(a.label||"-");const p=document.createElement("progress");p.className="mode-track mode-track-bar",p.max=100,p.value=s;const g=document.createElement("div");g.className="mode-value",g.textContent=String(n),c.appendChild(f),c.appendChild(p),c.appendChild(g),e.appendChild(c)})}function renderFunnel(e){const t=document.getElementById("funnel-list"),o=document.getElementById("funnel-meta"),a=e&&Array.isArray(e.steps)?e.steps:[];if(clearChildren(t),!a.length){o.textContent="No funnel events captured in the selected window.";const s=document.createElement("div");s.className="empty",s.textContent="No conversion data yet.",t.appendChild(s);return}o.textContent="Counts are unique users/sessions that reached each stage.";const n=Math.max(...a.map(s=>Number(s.count||0)),1);a.forEach((s,c)=>{const f=Number(s.count||0),p=Math.max(f/n*100,f>0?2:0),g=Number(s.conversion_from_prev||0),h=c===0?"Start":`${g}% from previous`,l=document.createElement("div");l.className="funnel-row";const m=document.createElement("div");m.className="funnel-label",m.textContent=String(s.label||s.event||"-");const y=document.createElement("progress");y.className="funnel-track funnel-track-bar",y.max=100,y.value=p;const d=document.createElement("div");d.className="funnel-count",d.textContent=String(f);const r=document.createElement("div");r.className="funnel-conversion",r.textContent=h,l.appendChild(m),l.appendChild(y),l.appendChild(d),l.appendChild(r),t.appendChild(l)})}function renderDashboard(e){const t=e.metrics||{},o=e.trends||{},a=t.job_count>0?Math.round(t.success_jobs/t.job_count*100):0;document.getElementById("m-users").textContent=t.total_users||0,document.getElementById("m-users-sub").textContent=`${t.new_users||0} new in window`,document.getElementById("m-jobs").textContent=t.job_count||0,document.getElementById("m-success-rate").textContent=`${a}%`,document.getElementById("m-revenue").textContent=formatMoney(t.total_revenue_cents||0),document.getElementById("m-purchases").textContent=t.purchase_count||0,document.getElementById("m-processed").textContent=t.total_processed||0,document.getElementById("m-refunds").textContent=t.refunded_jobs||0,document.getElementById("m-duration").textContent=`${t.avg_duration_seconds||0}s`,document.getElementById("m-success-jobs").textContent=t.success_jobs||0,document.getElementById("m-failed-jobs").textContent=t.failed_jobs||0,document.getElementById("m-rate-limit-total").textContent=t.rate_limit_429_total||0,document.getElementById("m-rate-limit-sub").textContent=`U: ${t.rate_limit_upload_429||0} \xB7 C: ${t.rate_limit_checkout_429||0} \xB7 A: ${t.rate_limit_analytics_429||0}`;const n=o.labels||[],s=o.success_rate||[],c=o.revenue_cents||[];latestModeBreakdown=e.mode_breakdown||{},renderSuccessChart("success-chart",n,s),renderRevenueChart("revenue-chart",n,c),renderAdminSystemStatus(e),renderModeBreakdown(),renderFunnel(e.funnel||{}),document.getElementById("success-granularity").textContent=`Granularity: ${o.granularity||"day"}`,document.getElementById("revenue-granularity").textContent=`Granularity: ${o.granularity||"day"}`,document.getElementById("success-latest").textContent=`Latest: ${s.length?s[s.length-1]:0}%`;const f=c.reduce((l,m)=>l+(m||0),0);document.getElementById("revenue-total").textContent=`Window total: ${formatMoney(f)}`;const p=(e.recent_jobs||[]).map(l=>{const m=l.status||"unknown",y=m==="complete"?"complete":m==="error"?"error":"other",d=document.createElement("tr"),r=document.createElement("td");r.textContent=formatDate(l.finished_at);const i=document.createElement("td");i.textContent=(l.email||"").slice(0,32)||"-";const u=document.createElement("td");u.textContent=l.mode||"-";const C=document.createElement("td");C.className="prompt-cell",C.textContent=formatPromptSummary(l);const b=document.createElement("td"),v=document.createElement("span");v.className=`status ${y}`,v.textContent=m,b.appendChild(v);const E=document.createElement("td");E.textContent=`${l.duration_seconds||0}s`;const k=document.createElement("td");k.textContent=l.credit_refunded?"Yes":"No";const w=document.createElement("td");w.textContent=formatTokenCount(l.token_input_total);const _=document.createElement("td");_.textContent=formatTokenCount(l.token_output_total);const x=document.createElement("td");return x.textContent=formatTokenCount(l.token_total),d.appendChild(r),d.appendChild(i),d.appendChild(u),d.appendChild(C),d.appendChild(b),d.appendChild(E),d.appendChild(k),d.appendChild(w),d.appendChild(_),d.appendChild(x),d});renderRows("jobs-body",p,"No jobs found in selected window.",10);const g=(e.recent_purchases||[]).map(l=>{const m=document.createElement("tr"),y=document.createElement("td");y.textContent=formatDate(l.created_at);const d=document.createElement("td");d.textContent=l.bundle_name||"-";const r=document.createElement("td");return r.textContent=formatMoney(l.price_cents||0),m.appendChild(y),m.appendChild(d),m.appendChild(r),m});renderRows("purchases-body",g,"No purchases found in selected window.",3);const h=(e.recent_rate_limits||[]).map(l=>{const m=document.createElement("tr"),y=document.createElement("td");y.textContent=formatDate(l.created_at);const d=document.createElement("td");d.textContent=formatRateLimitLabel(l.limit_name);const r=document.createElement("td");return r.textContent=`${l.retry_after_seconds||0}s`,m.appendChild(y),m.appendChild(d),m.appendChild(r),m});renderRows("rate-limit-body",h,"No rate-limit hits found in selected window.",3),stateArea.hidden=!0,dashboard.hidden=!1}async function loadAdminOverview(e){if(!e){setState("Please sign in to continue.","blocked");return}setState("Loading admin dashboard...","loading");try{const t=await authFetch(`/api/admin/overview?window=${encodeURIComponent(currentWindow)}`);if(!t.ok){const a=await parseAdminErrorResponse(t,"Could not load dashboard data.");setState(a.message,a.type);return}const o=await t.json();renderDashboard(o)}catch(t){console.error(t),setState("Network error while loading dashboard.","error")}}async function exportCsv(e){if(!auth.currentUser){setState("Please sign in to export CSV.","blocked");return}try{const t=await authFetch(`/api/admin/export?type=${encodeURIComponent(e)}&window=${encodeURIComponent(currentWindow)}`);if(!t.ok){const s=await parseAdminErrorResponse(t,"Could not export CSV right now.");setState(s.message,s.type);return}if(downloadUtils.downloadResponseBlob){await downloadUtils.downloadResponseBlob(t,`admin-${e}-${currentWindow}.csv`);return}const o=await t.blob(),a=URL.createObjectURL(o),n=document.createElement("a");n.href=a,n.download=`admin-${e}-${currentWindow}.csv`,document.body.appendChild(n),n.click(),document.body.removeChild(n),URL.revokeObjectURL(a)}catch(t){console.error(t),setState("Network error while exporting CSV.","error")}}function setActiveFilterButton(){document.querySelectorAll(".filter").forEach(e=>{e.classList.toggle("active",e.dataset.window===currentWindow)})}function setActiveModeViewButton(){document.querySelectorAll(".mode-view").forEach(e=>{e.classList.toggle("active",e.dataset.modeView===currentModeView)})}auth.onAuthStateChanged(async e=>{if(e){if(authClient&&typeof authClient.setToken=="function")try{authClient.setToken(await e.getIdToken())}catch(t){}signedInMeta.textContent=`Signed in as ${e.email}`,authBtn.textContent="Sign out",await loadAdminOverview(e),await initCostCalculator(),await runActualCostAnalysis(!1),await loadAdminBatchJobs(!1)}else authClient&&typeof authClient.clearToken=="function"&&authClient.clearToken(),signedInMeta.textContent="Not signed in",authBtn.textContent="Sign in",setAdminTab("overview"),renderAdminBatchJobs([]),setState("Please sign in with your admin account.","blocked")}),authBtn.addEventListener("click",async()=>{if(auth.currentUser){try{await fetch("/api/session/logout",{method:"POST",credentials:"include"})}catch(e){}await auth.signOut();return}window.location.href="/"}),refreshBtn.addEventListener("click",async()=>{if(!auth.currentUser){setState("Please sign in to refresh.","blocked");return}if(activeAdminTab==="batch-jobs"){await loadAdminBatchJobs(!0);return}await loadAdminOverview(auth.currentUser),await initCostCalculator(),await runActualCostAnalysis(!1)}),backBtn.addEventListener("click",()=>{window.location.href="/dashboard"}),exportJobsBtn.addEventListener("click",async()=>{await exportCsv("jobs")}),exportPurchasesBtn.addEventListener("click",async()=>{await exportCsv("purchases")}),exportFunnelBtn.addEventListener("click",async()=>{await exportCsv("funnel")}),exportFunnelDailyBtn.addEventListener("click",async()=>{await exportCsv("funnel-daily")}),document.querySelectorAll(".filter").forEach(e=>{e.addEventListener("click",async()=>{currentWindow=e.dataset.window,setActiveFilterButton(),auth.currentUser&&await loadAdminOverview(auth.currentUser)})}),document.querySelectorAll(".mode-view").forEach(e=>{e.addEventListener("click",()=>{currentModeView=e.dataset.modeView,setActiveModeViewButton(),renderModeBreakdown()})}),adminTabButtons.forEach(e=>{e.addEventListener("click",async()=>{const t=e.dataset.adminTab||"overview";setAdminTab(t),t==="batch-jobs"&&auth.currentUser&&await loadAdminBatchJobs(!1)})}),adminBatchRefreshBtn&&adminBatchRefreshBtn.addEventListener("click",async()=>{await loadAdminBatchJobs(!0)}),adminBatchMode&&adminBatchMode.addEventListener("change",async()=>{await loadAdminBatchJobs(!1)}),adminBatchStatus&&adminBatchStatus.addEventListener("change",async()=>{await loadAdminBatchJobs(!1)});const loadPromptsBtn=document.getElementById("load-prompts-btn"),promptsOutput=document.getElementById("prompts-output");loadPromptsBtn&&promptsOutput&&loadPromptsBtn.addEventListener("click",async()=>{loadPromptsBtn.disabled=!0,loadPromptsBtn.textContent="Loading\u2026";try{const e=await authFetch("/api/admin/prompts?format=markdown");if(!e.ok)promptsOutput.textContent="Error loading prompts.";else{const t=await e.json();promptsOutput.textContent=t.markdown||JSON.stringify(t,null,2)}promptsOutput.hidden=!1}catch(e){promptsOutput.textContent="Network error loading prompts.",promptsOutput.hidden=!1}loadPromptsBtn.textContent="Reload prompts",loadPromptsBtn.disabled=!1}),setActiveFilterButton(),setActiveModeViewButton(),setAdminTab("overview");const enhancedAdminSelects=[];function closeAdminSelectMenus(e){enhancedAdminSelects.forEach(t=>{!t||!t.menu||t.menu===e||t.setOpen(!1)})}function enhanceAdminSelect(e,t){if(!e||e.dataset.enhanced==="true"||!e.parentElement)return null;e.dataset.enhanced="true",e.classList.add("calculator-native-select");const a=document.createElement("div");a.className="app-select calculator-select calculator-select-upgraded";const n=document.createElement("button");n.type="button",n.className="app-select-button calculator-select-button",n.setAttribute("aria-haspopup","listbox"),n.setAttribute("aria-expanded","false");const s=document.createElement("span");s.className="app-select-label";const c=document.createElementNS("http://www.w3.org/2000/svg","svg");c.setAttribute("viewBox","0 0 24 24"),c.setAttribute("fill","none"),c.setAttribute("stroke","currentColor"),c.setAttribute("stroke-width","2"),c.setAttribute("stroke-linecap","round"),c.setAttribute("stroke-linejoin","round");const f=document.createElementNS("http://www.w3.org/2000/svg","polyline");f.setAttribute("points","6 9 12 15 18 9"),c.appendChild(f),n.appendChild(s),n.appendChild(c);const p=document.createElement("div");p.className="app-select-menu calculator-select-menu",p.setAttribute("role","listbox"),a.appendChild(n),a.appendChild(p),e.insertAdjacentElement("afterend",a);function g(){return Array.from(p.querySelectorAll(".app-select-item[data-value]")).filter(r=>!r.disabled)}function h(r){const i=g();if(!i.length)return;const u=i.indexOf(document.activeElement),C=Math.max(0,i.findIndex(v=>v.classList.contains("active")));let b=C;r==="first"&&(b=0),r==="last"&&(b=i.length-1),r==="next"&&(b=u>=0?(u+1)%i.length:C),r==="prev"&&(b=u>=0?(u-1+i.length)%i.length:C),i.forEach(v=>{v.tabIndex=-1}),i[b].tabIndex=0,i[b].focus()}function l(r,i){const u=!!r;u&&closeAdminSelectMenus(p),p.classList.toggle("visible",u),n.classList.toggle("open",u),n.setAttribute("aria-expanded",u?"true":"false"),u&&h(i||"first")}function m(){let r="";g().forEach(i=>{const u=i.dataset.value===String(e.value||"");i.classList.toggle("active",u),i.setAttribute("aria-selected",u?"true":"false"),i.tabIndex=-1,u&&(r=i.textContent)}),s.textContent=r||(e.options[e.selectedIndex]?e.options[e.selectedIndex].textContent:"Select")}function y(){clearChildren(p),Array.from(e.options||[]).forEach(r=>{const i=document.createElement("button");i.type="button",i.className="app-select-item calculator-select-item",i.dataset.value=String(r.value),i.textContent=String(r.textContent||r.value||"-"),i.setAttribute("role","option"),i.disabled=!!r.disabled,i.addEventListener("click",()=>{e.value!==r.value&&(e.value=r.value,e.dispatchEvent(new Event("change",{bubbles:!0})),typeof t=="function"&&t(r.value)),m(),l(!1),n.focus()}),p.appendChild(i)}),m()}n.addEventListener("click",r=>{r.preventDefault(),l(!p.classList.contains("visible"))}),n.addEventListener("keydown",r=>{r.key==="ArrowDown"?(r.preventDefault(),l(!0,"first")):r.key==="ArrowUp"?(r.preventDefault(),l(!0,"last")):r.key==="Enter"||r.key===" "?(r.preventDefault(),l(!p.classList.contains("visible"))):r.key==="Escape"&&(r.preventDefault(),l(!1))}),p.addEventListener("keydown",r=>{if(r.key==="ArrowDown")r.preventDefault(),h("next");else if(r.key==="ArrowUp")r.preventDefault(),h("prev");else if(r.key==="Home")r.preventDefault(),h("first");else if(r.key==="End")r.preventDefault(),h("last");else if(r.key==="Escape")r.preventDefault(),l(!1),n.focus();else if(r.key==="Enter"||r.key===" "){const i=document.activeElement&&document.activeElement.closest(".app-select-item[data-value]");if(!i)return;r.preventDefault(),i.click()}}),e.addEventListener("change",m);const d={menu:p,setOpen:l,rebuild:y,sync:m,button:n};return enhancedAdminSelects.push(d),y(),d}document.addEventListener("click",e=>{e.target&&e.target.closest(".calculator-select-upgraded")||closeAdminSelectMenus()}),document.addEventListener("keydown",e=>{e.key==="Escape"&&closeAdminSelectMenus()});const calcScenario=document.getElementById("calc-scenario"),calcScenarioPicker=document.getElementById("calc-scenario-picker"),calcScenarioButton=document.getElementById("calc-scenario-button"),calcScenarioMenu=document.getElementById("calc-scenario-menu"),calcScenarioLabel=document.getElementById("calc-scenario-label"),calcStageGrid=document.getElementById("calc-stage-grid"),calcBundlePrice=document.getElementById("calc-bundle-price"),calcEurUsd=document.getElementById("calc-eur-usd"),calcPricingVersion=document.getElementById("calc-pricing-version"),calcRevenueUsd=document.getElementById("calc-revenue-usd"),calcMargin=document.getElementById("calc-margin"),calcMarginPct=document.getElementById("calc-margin-pct"),calcBreakEven=document.getElementById("calc-break-even"),calcScenarioHeading=document.getElementById("calc-scenario-heading"),calcScenarioCopy=document.getElementById("calc-scenario-copy"),calcScenarioPoints=document.getElementById("calc-scenario-points");let calculatorConfig=null,calculatorBound=!1;function setCalcScenarioMenuVisible(e){if(!calcScenarioMenu||!calcScenarioButton)return;const t=!!e;calcScenarioMenu.classList.toggle("visible",t),calcScenarioButton.classList.toggle("open",t),calcScenarioButton.setAttribute("aria-expanded",t?"true":"false")}function syncCalcScenarioLabel(e){if(!calcScenarioLabel||!calcScenarioMenu||!calcScenario)return;const t=String(e||calcScenario.value||"");let o="";Array.from(calcScenario.options||[]).forEach(a=>{String(a.value)===t&&(o=String(a.textContent||"").trim())}),calcScenarioLabel.textContent=o||"Select scenario",calcScenarioMenu.querySelectorAll(".calculator-select-item").forEach(a=>{const n=a.dataset.value===t;a.classList.toggle("active",n),a.setAttribute("aria-selected",n?"true":"false")})}function rebuildCalcScenarioMenu(){!calcScenarioMenu||!calcScenario||(clearChildren(calcScenarioMenu),Array.from(calcScenario.options||[]).forEach(e=>{const t=document.createElement("button");t.type="button",t.className="calculator-select-item",t.dataset.value=String(e.value),t.setAttribute("role","option"),t.textContent=String(e.textContent||e.value||"-"),t.addEventListener("click",()=>{calcScenario.value=t.dataset.value||"",syncCalcScenarioLabel(calcScenario.value),setCalcScenarioMenuVisible(!1),loadCalculatorScenario(calcScenario.value)}),calcScenarioMenu.appendChild(t)}),syncCalcScenarioLabel(calcScenario.value))}function numberOrZero(e){const t=Number(e);return Number.isFinite(t)?t:0}function formatUsd(e){return`$${numberOrZero(e).toFixed(4)}`}function formatPercent(e){return`${numberOrZero(e).toFixed(1)}%`}function formatEur(e){return`\u20AC${numberOrZero(e).toFixed(4)}`}function resolveStageModelId(e,t){return e==="gemini-2.5-pro"&&Number(t||0)>2e5?"gemini-2.5-pro-200k":e}function getCalculatorModels(){return calculatorConfig&&calculatorConfig.models&&typeof calculatorConfig.models=="object"?calculatorConfig.models:{}}function getCalculatorScenarios(){return calculatorConfig&&calculatorConfig.scenarios&&typeof calculatorConfig.scenarios=="object"?calculatorConfig.scenarios:{}}function summarizeScenarioUsage(e){return(Array.isArray(e&&e.stages)?e.stages:[]).reduce((o,a)=>(o.stageCount+=1,o.totalInput+=Math.max(0,Math.round(numberOrZero(a.input_tokens))),o.totalOutput+=Math.max(0,Math.round(numberOrZero(a.output_tokens))),a.audio&&(o.audioStages+=1),o),{stageCount:0,totalInput:0,totalOutput:0,audioStages:0})}function renderCalculatorStory(e){const t=getCalculatorScenarios()[e]||null,o=summarizeScenarioUsage(t);calcScenarioHeading&&(calcScenarioHeading.textContent=t&&t.label?String(t.label):"Choose a scenario"),calcScenarioCopy&&(t?o.audioStages>0?calcScenarioCopy.textContent="Use this when you want to understand the full lecture or interview pipeline. Audio usually drives the largest portion of the cost.":calcScenarioCopy.textContent="Use this when you want a clean read on slide extraction plus study-tool generation without transcription costs.":calcScenarioCopy.textContent="Pick a scenario to see the default token assumptions, stage costs, and bundle margin."),calcScenarioPoints&&(clearChildren(calcScenarioPoints),t&&[o.stageCount+" stage"+(o.stageCount===1?"":"s")+" included",formatInteger(o.totalInput)+" input tokens modeled",formatInteger(o.totalOutput)+" output tokens modeled",o.audioStages?o.audioStages+" audio stage"+(o.audioStages===1?"":"s"):"No audio stage"].forEach(a=>{const n=document.createElement("span");n.className="calculator-story-point",n.textContent=a,calcScenarioPoints.appendChild(n)}))}function recalcCalculatorCosts(){if(!calcStageGrid)return;const e=getCalculatorModels(),t=calcStageGrid.querySelectorAll(".calc-stage-card[data-stage]");let o=0,a=0,n=0;t.forEach(d=>{const r=String(d.dataset.model||""),i=String(d.dataset.stage||""),u=d.dataset.audio==="true",C=Math.max(0,Math.round(numberOrZero((d.querySelector(".calc-in")||{}).value))),b=Math.max(0,Math.round(numberOrZero((d.querySelector(".calc-out")||{}).value))),v=resolveStageModelId(r,C),E=e[v]||e[r]||{},k=numberOrZero(E.input_text_per_M),w=E.input_audio_per_M===null?NaN:numberOrZero(E.input_audio_per_M),_=numberOrZero(E.output_per_M),x=u&&Number.isFinite(w)?w:k,S=C/1e6*x,B=b/1e6*_,I=S+B,A=d.querySelector(".calc-stage-model");if(A){const j=String(E.label||r||"-");A.innerHTML=`<div class="calc-stage-model-id">${v||r||"-"}</div><div class="calc-stage-model-label">${j}</div>`}const L=d.querySelector(".calc-stage-badge");L&&(L.textContent=u?"Audio input":"Text / vision");const N=d.querySelector(".cost-in"),M=d.querySelector(".cost-out"),$=d.querySelector(".cost-stage"),T=d.querySelector(".cost-share");N&&(N.textContent=formatUsd(S)),M&&(M.textContent=formatUsd(B)),$&&($.textContent=formatUsd(I)),T&&(T.textContent="0.0%"),o+=S,a+=B,n+=I,d.dataset.modelEffective=v,d.dataset.inputTokens=String(C),d.dataset.outputTokens=String(b),d.dataset.stageName=i});const s=document.getElementById("calc-total-input"),c=document.getElementById("calc-total-output"),f=document.getElementById("calc-total");s&&(s.textContent=formatUsd(o)),c&&(c.textContent=formatUsd(a)),f&&(f.textContent=formatUsd(n));const p=Math.max(0,numberOrZero(calcBundlePrice?calcBundlePrice.value:0)),g=Math.max(.1,numberOrZero(calcEurUsd?calcEurUsd.value:1.08)),h=p*g,l=h-n,m=h>0?l/h*100:0,y=g>0?n/g:0;calcRevenueUsd&&(calcRevenueUsd.textContent=formatUsd(h)),calcMargin&&(calcMargin.textContent=formatUsd(l),calcMargin.classList.toggle("tone-positive",l>=0),calcMargin.classList.toggle("tone-negative",l<0)),calcMarginPct&&(calcMarginPct.textContent=formatPercent(m),calcMarginPct.classList.toggle("tone-positive",m>=0),calcMarginPct.classList.toggle("tone-negative",m<0)),calcBreakEven&&(calcBreakEven.textContent=formatEur(y)),t.forEach(d=>{const r=d.querySelector(".cost-stage"),i=d.querySelector(".cost-share");if(!r||!i)return;const u=numberOrZero(String(r.textContent||"").replace(/[^0-9.-]/g,""));i.textContent=n>0?formatPercent(u/n*100):"0.0%"})}function loadCalculatorScenario(e){const o=getCalculatorScenarios()[e];!o||!Array.isArray(o.stages)||!calcStageGrid||(clearChildren(calcStageGrid),renderCalculatorStory(e),o.stages.forEach(a=>{const n=document.createElement("article");n.className="calc-stage-card",n.dataset.stage=String(a.stage||""),n.dataset.model=String(a.model||""),n.dataset.audio=String(!!a.audio),n.innerHTML=`
+const bootstrap=window.LectureProcessorBootstrap||{},auth=bootstrap.getAuth?bootstrap.getAuth():firebase.auth(),authUtils=window.LectureProcessorAuth||{},authClient=authUtils.createAuthClient?authUtils.createAuthClient(auth,{notSignedInMessage:"Not signed in"}):null,downloadUtils=window.LectureProcessorDownload||{},uxUtils=window.LectureProcessorUx||{},signedInMeta=document.getElementById("signed-in-meta"),stateArea=document.getElementById("state-area"),dashboard=document.getElementById("dashboard"),authBtn=document.getElementById("auth-btn"),refreshBtn=document.getElementById("refresh-btn"),backBtn=document.getElementById("back-btn"),exportJobsBtn=document.getElementById("export-jobs-btn"),exportPurchasesBtn=document.getElementById("export-purchases-btn"),exportFunnelBtn=document.getElementById("export-funnel-btn"),exportFunnelDailyBtn=document.getElementById("export-funnel-daily-btn"),adminTabButtons=Array.from(document.querySelectorAll("[data-admin-tab]")),adminOverviewContent=document.getElementById("admin-tab-overview-content"),adminBatchContent=document.getElementById("admin-tab-batch-content"),adminBatchRefreshBtn=document.getElementById("admin-batch-refresh-btn"),adminBatchMode=document.getElementById("admin-batch-mode"),adminBatchStatus=document.getElementById("admin-batch-status"),adminBatchJobsBody=document.getElementById("admin-batch-jobs-body");let currentWindow="7d",currentModeView="total",latestModeBreakdown={},activeAdminTab="overview",adminToastTimer=null;const adminToast=document.createElement("div");adminToast.className="admin-toast",document.body.appendChild(adminToast);function authFetch(e,t){return authClient&&typeof authClient.authFetch=="function"?authClient.authFetch(e,t,{retryOn401:!0}):auth.currentUser?auth.currentUser.getIdToken().then(o=>{const a=t||{},n=Object.assign({},a.headers||{},{Authorization:`Bearer ${o}`});return fetch(e,Object.assign({},a,{headers:n}))}):Promise.reject(new Error("Not signed in"))}function formatMoney(e){return`\u20AC${((e||0)/100).toFixed(2)}`}function formatDate(e){return e?uxUtils.formatDateTime?uxUtils.formatDateTime(e,{unit:"seconds"}):new Date(e*1e3).toLocaleString(navigator.language||"en-US",{day:"2-digit",month:"short",year:"numeric",hour:"2-digit",minute:"2-digit"}):"-"}function formatRateLimitLabel(e){return{upload:"Upload",checkout:"Checkout",analytics:"Analytics",tools:"Tools"}[e]||e}function formatTokenCount(e){return!e||e===0?"-":e>=1e6?`${(e/1e6).toFixed(1)}M`:e>=1e3?`${(e/1e3).toFixed(1)}K`:String(e)}function showAdminToast(e,t){e&&(adminToast.textContent=String(e),adminToast.classList.remove("success","error","visible"),t==="success"&&adminToast.classList.add("success"),t==="error"&&adminToast.classList.add("error"),adminToast.classList.add("visible"),adminToastTimer&&window.clearTimeout(adminToastTimer),adminToastTimer=window.setTimeout(()=>{adminToast.classList.remove("visible")},2400))}function setAdminTab(e){const t=e==="batch-jobs"?"batch-jobs":"overview";activeAdminTab=t,adminTabButtons.forEach(o=>{o.classList.toggle("active",o.dataset.adminTab===t)}),adminOverviewContent&&(adminOverviewContent.hidden=t!=="overview"),adminBatchContent&&(adminBatchContent.hidden=t!=="batch-jobs")}function renderAdminBatchJobs(e){if(!adminBatchJobsBody)return;adminBatchJobsBody.innerHTML="";const t=Array.isArray(e)?e:[];if(!t.length){const o=document.createElement("tr"),a=document.createElement("td");a.colSpan=9,a.className="empty",a.textContent="No batch jobs found for this filter.",o.appendChild(a),adminBatchJobsBody.appendChild(o);return}t.forEach(o=>{const a=document.createElement("tr"),n=String(o.status||"queued"),s=n==="complete"?"complete":n==="error"?"error":n==="partial"?"partial":n==="processing"?"processing":"queued",c=`${Number(o.completed_rows||0)}/${Number(o.total_rows||0)} complete \xB7 ${Number(o.failed_rows||0)} failed`,f=[o.current_stage||"-",o.current_stage_state||"-",o.provider_state||"-"].join(" \xB7 "),p=`${Number(o.credits_refunded||0)} refunded \xB7 ${Number(o.credits_refund_pending||0)} pending`;[formatDate(o.created_at),(o.email||"").slice(0,64)||"-",o.batch_title||o.batch_id||"-",o.mode||"-"].forEach(l=>{const m=document.createElement("td");m.textContent=String(l||"-"),a.appendChild(m)});const g=document.createElement("td"),h=document.createElement("span");h.className=`status ${s}`,h.textContent=n,g.appendChild(h),a.appendChild(g),[f,c,o.completion_email_status||"pending",p].forEach(l=>{const m=document.createElement("td");m.textContent=String(l||"-"),a.appendChild(m)}),adminBatchJobsBody.appendChild(a)})}async function loadAdminBatchJobs(e=!1){if(!auth.currentUser){renderAdminBatchJobs([]);return}const t=new URLSearchParams;t.set("limit","300"),adminBatchMode&&adminBatchMode.value&&t.set("mode",adminBatchMode.value),adminBatchStatus&&adminBatchStatus.value&&t.set("status",adminBatchStatus.value);try{const o=await authFetch(`/api/admin/batch-jobs?${t.toString()}`);if(!o.ok){const n=await o.json().catch(()=>({}));throw new Error(n.error||"Could not load batch jobs.")}const a=await o.json();renderAdminBatchJobs(a.batches||[]),e&&showAdminToast("Batch jobs refreshed.","success")}catch(o){console.error(o),showAdminToast(o.message||"Could not load batch jobs.","error")}}function formatPromptSummary(e){const t=String(e.prompt_template_key||"").trim(),o=String(e.custom_prompt||"").trim(),a=String(e.prompt_source||"").trim(),n=[];if(t?n.push(`Template: ${t}`):a==="default"&&n.push("Default prompt"),o){const s=o.replace(/\s+/g," ").trim();n.push(s.length>90?`${s.slice(0,87)}...`:s)}return n.join(" \xB7 ")||"Default prompt"}function setState(e,t="loading"){stateArea.textContent=e,stateArea.className=t,stateArea.hidden=!1,dashboard.hidden=!0}async function parseAdminErrorResponse(e,t){const o=await e.json().catch(()=>({})),a=String(o.error||o.message||"").trim();return e.status===401?{type:"blocked",message:a||"Your admin session expired. Please sign in again."}:e.status===403?{type:"blocked",message:a||"Your account is signed in but is not configured as an admin on the server."}:e.status>=500?{type:"error",message:a||t||"The server could not load admin data right now."}:{type:"error",message:a||t||"Request failed."}}function clearChildren(e){for(;e.firstChild;)e.removeChild(e.firstChild)}function renderRows(e,t,o,a=8){const n=document.getElementById(e);if(clearChildren(n),!t.length){const s=document.createElement("tr"),c=document.createElement("td");c.colSpan=a,c.className="empty",c.textContent=o,s.appendChild(c),n.appendChild(s);return}t.forEach(s=>{if(!(s instanceof Node)){console.warn("renderRows skipped non-Node row for",e,s);return}n.appendChild(s)})}function renderEmptyChart(e){const t=document.getElementById(e);if(!t)return null;clearChildren(t);const o=document.createElement("div");return o.className="chart-empty",o.textContent="No data for selected window.",t.appendChild(o),t}function svgNode(e,t={}){const o=document.createElementNS("http://www.w3.org/2000/svg",e);return Object.entries(t).forEach(([a,n])=>{n!=null&&o.setAttribute(a,String(n))}),o}function formatStatusValue(e,t=""){if(e==null||e==="")return"-";if(t==="host_matches_render")return e?"Matches":"Mismatch";if(t==="host_status")return{"custom-domain":"Custom domain","configured-public-host":"Configured host","render-default":"Render default",mismatch:"Mismatch",unknown:"Unknown"}[String(e||"")]||String(e);if(typeof e=="boolean")return e?"Ready":"Not ready";if(t==="app_uptime_seconds"){const o=Math.max(0,Number(e||0));return Number.isFinite(o)?o<60?`${Math.round(o)}s`:o<3600?`${Math.floor(o/60)}m`:`${Math.floor(o/3600)}h ${Math.floor(o%3600/60)}m`:"-"}return String(e)}function renderStatusPairs(e,t){const o=document.getElementById(e);o&&(clearChildren(o),t.forEach(a=>{const n=document.createElement("div");n.className="status-row";const s=document.createElement("dt");s.textContent=a.label;const c=document.createElement("dd");c.textContent=formatStatusValue(a.value,a.key),n.appendChild(s),n.appendChild(c),o.appendChild(n)}))}function renderDataWarnings(e){const t=document.getElementById("admin-data-warnings"),o=document.getElementById("admin-partial-banner");if(!t||!o)return;clearChildren(t);const a=Array.isArray(e)?e:[];if(o.hidden=a.length===0,!a.length){const n=document.createElement("li");n.className="ok",n.textContent="No data warnings in the selected window.",t.appendChild(n);return}a.forEach(n=>{const s=document.createElement("li");s.textContent=String(n||"").replace(/_/g," "),t.appendChild(s)})}function tickIndices(e,t=6){if(e<=t)return Array.from({length:e},(n,s)=>s);const o=Math.ceil((e-1)/(t-1)),a=[];for(let n=0;n<e;n+=o)a.push(n);return a[a.length-1]!==e-1&&a.push(e-1),a}function niceCeiling(e){const t=Math.max(0,Number(e||0));if(!t)return 100;const o=Math.pow(10,Math.max(0,Math.floor(Math.log10(t))-1));return Math.ceil(t/o)*o}function renderSuccessChart(e,t,o){const a=document.getElementById(e);if(!a)return;if(clearChildren(a),!t.length){renderEmptyChart(e);return}const n=720,s=260,c={top:14,right:16,bottom:34,left:46},f=n-c.left-c.right,p=s-c.top-c.bottom,g=svgNode("svg",{viewBox:`0 0 ${n} ${s}`,class:"admin-chart-svg",role:"img","aria-label":"Success rate trend chart"}),h=i=>t.length===1?c.left+f/2:c.left+f/Math.max(t.length-1,1)*i,l=i=>c.top+p-Math.max(0,Math.min(100,Number(i||0)))/100*p;[0,25,50,75,100].forEach(i=>{const u=l(i);g.appendChild(svgNode("line",{x1:c.left,y1:u,x2:n-c.right,y2:u,class:"chart-grid-line"}));const C=svgNode("text",{x:c.left-8,y:u+4,class:"chart-axis-label y"});C.textContent=`${i}%`,g.appendChild(C)});const m=new Set(tickIndices(t.length,t.length>14?5:7));t.forEach((i,u)=>{if(!m.has(u))return;const C=h(u),b=svgNode("text",{x:C,y:s-8,class:"chart-axis-label x"});b.textContent=i,g.appendChild(b)});const y=o.map((i,u)=>[h(u),l(i)]),d=y.map((i,u)=>`${u===0?"M":"L"} ${i[0]} ${i[1]}`).join(" "),r=`${d} L ${y[y.length-1][0]} ${c.top+p} L ${y[0][0]} ${c.top+p} Z`;g.appendChild(svgNode("path",{d:r,fill:"rgba(16, 185, 129, 0.14)"})),g.appendChild(svgNode("path",{d,fill:"none",stroke:"#10B981","stroke-width":3,"stroke-linecap":"round","stroke-linejoin":"round"})),y.forEach((i,u)=>{const C=svgNode("circle",{cx:i[0],cy:i[1],r:4,fill:"#ffffff",stroke:"#10B981","stroke-width":2}),b=svgNode("title");b.textContent=`${t[u]}: ${Number(o[u]||0).toFixed(1)}%`,C.appendChild(b),g.appendChild(C)}),a.appendChild(g)}function renderRevenueChart(e,t,o){const a=document.getElementById(e);if(!a)return;if(clearChildren(a),!t.length){renderEmptyChart(e);return}const n=720,s=260,c={top:14,right:16,bottom:34,left:58},f=n-c.left-c.right,p=s-c.top-c.bottom,g=niceCeiling(Math.max(...o,0)),h=svgNode("svg",{viewBox:`0 0 ${n} ${s}`,class:"admin-chart-svg",role:"img","aria-label":"Revenue trend chart"}),l=f/Math.max(t.length,1),m=Math.max(10,Math.min(34,l*.55)),y=u=>c.top+p-Math.max(0,Number(u||0))/g*p;for(let u=0;u<=4;u+=1){const C=g/4*u,b=y(C);h.appendChild(svgNode("line",{x1:c.left,y1:b,x2:n-c.right,y2:b,class:"chart-grid-line"}));const v=svgNode("text",{x:c.left-8,y:b+4,class:"chart-axis-label y"});v.textContent=formatMoney(Math.round(C)),h.appendChild(v)}const d=new Set(tickIndices(t.length,t.length>14?5:7));t.forEach((u,C)=>{const b=c.left+l*C+l/2;if(d.has(C)){const x=svgNode("text",{x:b,y:s-8,class:"chart-axis-label x"});x.textContent=u,h.appendChild(x)}const v=Math.max(0,Number(o[C]||0)),E=y(v),k=Math.max(0,c.top+p-E),w=svgNode("rect",{x:b-m/2,y:E,width:m,height:k,rx:8,fill:"url(#revenueGradient)"}),_=svgNode("title");if(_.textContent=`${u}: ${formatMoney(v)}`,w.appendChild(_),h.appendChild(w),v>0){const x=svgNode("text",{x:b,y:Math.max(18,E-6),class:"chart-column-label"});x.textContent=formatMoney(v),h.appendChild(x)}});const r=svgNode("defs"),i=svgNode("linearGradient",{id:"revenueGradient",x1:"0",y1:"0",x2:"0",y2:"1"});i.appendChild(svgNode("stop",{offset:"0%","stop-color":"#60A5FA"})),i.appendChild(svgNode("stop",{offset:"100%","stop-color":"#0EA5E9"})),r.appendChild(i),h.insertBefore(r,h.firstChild),a.appendChild(h)}function renderAdminSystemStatus(e){renderDataWarnings(e.data_warnings||[]),renderStatusPairs("admin-deployment",[{key:"runtime",label:"Runtime",value:e.deployment&&e.deployment.runtime},{key:"request_host",label:"Request host",value:e.deployment&&e.deployment.request_host},{key:"configured_public_hostname",label:"Public host",value:e.deployment&&e.deployment.configured_public_hostname},{key:"render_external_hostname",label:"Render host",value:e.deployment&&e.deployment.render_external_hostname},{key:"host_status",label:"Host routing",value:e.deployment&&e.deployment.host_status},{key:"service_name",label:"Service",value:e.deployment&&e.deployment.service_name},{key:"git_branch",label:"Git branch",value:e.deployment&&e.deployment.git_branch},{key:"git_commit_short",label:"Git commit",value:e.deployment&&e.deployment.git_commit_short},{key:"app_uptime_seconds",label:"App uptime",value:e.deployment&&e.deployment.app_uptime_seconds}]),renderStatusPairs("admin-runtime-checks",[{key:"firebase_ready",label:"Firebase",value:e.runtime_checks&&e.runtime_checks.firebase_ready},{key:"gemini_ready",label:"Gemini",value:e.runtime_checks&&e.runtime_checks.gemini_ready},{key:"stripe_secret_mode",label:"Stripe secret key",value:e.runtime_checks&&e.runtime_checks.stripe_secret_mode},{key:"stripe_publishable_mode",label:"Stripe publishable key",value:e.runtime_checks&&e.runtime_checks.stripe_publishable_mode},{key:"stripe_keys_match",label:"Stripe keys aligned",value:e.runtime_checks&&e.runtime_checks.stripe_keys_match},{key:"stripe_webhook_configured",label:"Stripe webhook",value:e.runtime_checks&&e.runtime_checks.stripe_webhook_configured},{key:"pptx_conversion_available",label:"PPTX conversion",value:e.runtime_checks&&e.runtime_checks.pptx_conversion_available},{key:"video_import_available",label:"LMS video import",value:e.runtime_checks&&e.runtime_checks.video_import_available},{key:"ffmpeg_available",label:"FFmpeg",value:e.runtime_checks&&e.runtime_checks.ffmpeg_available},{key:"yt_dlp_available",label:"yt-dlp",value:e.runtime_checks&&e.runtime_checks.yt_dlp_available},{key:"physio_query_cache_hits",label:"Physio query cache hits",value:e.runtime_checks&&e.runtime_checks.physio_query_cache_hits},{key:"physio_query_cache_shared_hits",label:"Physio shared cache hits",value:e.runtime_checks&&e.runtime_checks.physio_query_cache_shared_hits},{key:"physio_query_cache_misses",label:"Physio query cache misses",value:e.runtime_checks&&e.runtime_checks.physio_query_cache_misses},{key:"physio_query_cache_entries",label:"Physio query cache entries",value:e.runtime_checks&&e.runtime_checks.physio_query_cache_entries},{key:"physio_query_cache_shared",label:"Physio shared query cache",value:e.runtime_checks&&e.runtime_checks.physio_query_cache_shared},{key:"runtime_job_snapshot_writes",label:"Job snapshot writes",value:e.runtime_checks&&e.runtime_checks.runtime_job_snapshot_writes},{key:"runtime_job_snapshot_writes_saved",label:"Job snapshot writes saved",value:e.runtime_checks&&e.runtime_checks.runtime_job_snapshot_writes_saved},{key:"runtime_job_snapshot_bytes_saved",label:"Job snapshot bytes saved",value:e.runtime_checks&&e.runtime_checks.runtime_job_snapshot_bytes_saved},{key:"provider_poll_files_in_flight",label:"Provider files polling",value:e.runtime_checks&&e.runtime_checks.provider_poll_files_in_flight},{key:"provider_poll_batches_in_flight",label:"Provider batches polling",value:e.runtime_checks&&e.runtime_checks.provider_poll_batches_in_flight},{key:"provider_poll_calls_last_minute",label:"Provider polls (last minute)",value:e.runtime_checks&&e.runtime_checks.provider_poll_calls_last_minute},{key:"provider_poll_errors",label:"Provider poll errors",value:e.runtime_checks&&e.runtime_checks.provider_poll_errors},{key:"job_queue_running",label:"Background jobs running",value:e.runtime_checks&&e.runtime_checks.job_queue_running},{key:"job_queue_queued",label:"Background jobs queued",value:e.runtime_checks&&e.runtime_checks.job_queue_queued},{key:"job_queue_wait_p95_ms",label:"Job queue wait p95 (ms)",value:e.runtime_checks&&e.runtime_checks.job_queue_wait_p95_ms},{key:"auth_token_cache_hits",label:"Auth token cache hits",value:e.runtime_checks&&e.runtime_checks.auth_token_cache_hits},{key:"auth_token_cache_misses",label:"Auth token cache misses",value:e.runtime_checks&&e.runtime_checks.auth_token_cache_misses},{key:"auth_token_cache_entries",label:"Auth token cache entries",value:e.runtime_checks&&e.runtime_checks.auth_token_cache_entries}])}function renderModeBreakdown(){const e=document.getElementById("mode-breakdown-bars");clearChildren(e);const t=Object.values(latestModeBreakdown||{}).filter(a=>a&&a.label);if(!t.length){const a=document.createElement("div");a.className="empty",a.textContent="No mode data for selected window.",e.appendChild(a);return}const o=Math.max(...t.map(a=>a[currentModeView]||0),1);t.forEach(a=>{const n=a[currentModeView]||0,s=Math.max(n/o*100,n>0?2:0),c=document.createElement("div");c.className="mode-row";const f=document.createElement("div");f.className="mode-label",f.textContent=String(a.label||"-");const p=document.createElement("progress");p.className="mode-track mode-track-bar",p.max=100,p.value=s;const g=document.createElement("div");g.className="mode-value",g.textContent=String(n),c.appendChild(f),c.appendChild(p),c.appendChild(g),e.appendChild(c)})}function renderFunnel(e){const t=document.getElementById("funnel-list"),o=document.getElementById("funnel-meta"),a=e&&Array.isArray(e.steps)?e.steps:[];if(clearChildren(t),!a.length){o.textContent="No funnel events captured in the selected window.";const s=document.createElement("div");s.className="empty",s.textContent="No conversion data yet.",t.appendChild(s);return}o.textContent="Counts are unique users/sessions that reached each stage.";const n=Math.max(...a.map(s=>Number(s.count||0)),1);a.forEach((s,c)=>{const f=Number(s.count||0),p=Math.max(f/n*100,f>0?2:0),g=Number(s.conversion_from_prev||0),h=c===0?"Start":`${g}% from previous`,l=document.createElement("div");l.className="funnel-row";const m=document.createElement("div");m.className="funnel-label",m.textContent=String(s.label||s.event||"-");const y=document.createElement("progress");y.className="funnel-track funnel-track-bar",y.max=100,y.value=p;const d=document.createElement("div");d.className="funnel-count",d.textContent=String(f);const r=document.createElement("div");r.className="funnel-conversion",r.textContent=h,l.appendChild(m),l.appendChild(y),l.appendChild(d),l.appendChild(r),t.appendChild(l)})}function renderDashboard(e){const t=e.metrics||{},o=e.trends||{},a=t.job_count>0?Math.round(t.success_jobs/t.job_count*100):0;document.getElementById("m-users").textContent=t.total_users||0,document.getElementById("m-users-sub").textContent=`${t.new_users||0} new in window`,document.getElementById("m-jobs").textContent=t.job_count||0,document.getElementById("m-success-rate").textContent=`${a}%`,document.getElementById("m-revenue").textContent=formatMoney(t.total_revenue_cents||0),document.getElementById("m-purchases").textContent=t.purchase_count||0,document.getElementById("m-processed").textContent=t.total_processed||0,document.getElementById("m-refunds").textContent=t.refunded_jobs||0,document.getElementById("m-duration").textContent=`${t.avg_duration_seconds||0}s`,document.getElementById("m-success-jobs").textContent=t.success_jobs||0,document.getElementById("m-failed-jobs").textContent=t.failed_jobs||0,document.getElementById("m-rate-limit-total").textContent=t.rate_limit_429_total||0,document.getElementById("m-rate-limit-sub").textContent=`U: ${t.rate_limit_upload_429||0} \xB7 C: ${t.rate_limit_checkout_429||0} \xB7 A: ${t.rate_limit_analytics_429||0}`;const n=o.labels||[],s=o.success_rate||[],c=o.revenue_cents||[];latestModeBreakdown=e.mode_breakdown||{},renderSuccessChart("success-chart",n,s),renderRevenueChart("revenue-chart",n,c),renderAdminSystemStatus(e),renderModeBreakdown(),renderFunnel(e.funnel||{}),document.getElementById("success-granularity").textContent=`Granularity: ${o.granularity||"day"}`,document.getElementById("revenue-granularity").textContent=`Granularity: ${o.granularity||"day"}`,document.getElementById("success-latest").textContent=`Latest: ${s.length?s[s.length-1]:0}%`;const f=c.reduce((l,m)=>l+(m||0),0);document.getElementById("revenue-total").textContent=`Window total: ${formatMoney(f)}`;const p=(e.recent_jobs||[]).map(l=>{const m=l.status||"unknown",y=m==="complete"?"complete":m==="error"?"error":"other",d=document.createElement("tr"),r=document.createElement("td");r.textContent=formatDate(l.finished_at);const i=document.createElement("td");i.textContent=(l.email||"").slice(0,32)||"-";const u=document.createElement("td");u.textContent=l.mode||"-";const C=document.createElement("td");C.className="prompt-cell",C.textContent=formatPromptSummary(l);const b=document.createElement("td"),v=document.createElement("span");v.className=`status ${y}`,v.textContent=m,b.appendChild(v);const E=document.createElement("td");E.textContent=`${l.duration_seconds||0}s`;const k=document.createElement("td");k.textContent=l.credit_refunded?"Yes":"No";const w=document.createElement("td");w.textContent=formatTokenCount(l.token_input_total);const _=document.createElement("td");_.textContent=formatTokenCount(l.token_output_total);const x=document.createElement("td");return x.textContent=formatTokenCount(l.token_total),d.appendChild(r),d.appendChild(i),d.appendChild(u),d.appendChild(C),d.appendChild(b),d.appendChild(E),d.appendChild(k),d.appendChild(w),d.appendChild(_),d.appendChild(x),d});renderRows("jobs-body",p,"No jobs found in selected window.",10);const g=(e.recent_purchases||[]).map(l=>{const m=document.createElement("tr"),y=document.createElement("td");y.textContent=formatDate(l.created_at);const d=document.createElement("td");d.textContent=l.bundle_name||"-";const r=document.createElement("td");return r.textContent=formatMoney(l.price_cents||0),m.appendChild(y),m.appendChild(d),m.appendChild(r),m});renderRows("purchases-body",g,"No purchases found in selected window.",3);const h=(e.recent_rate_limits||[]).map(l=>{const m=document.createElement("tr"),y=document.createElement("td");y.textContent=formatDate(l.created_at);const d=document.createElement("td");d.textContent=formatRateLimitLabel(l.limit_name);const r=document.createElement("td");return r.textContent=`${l.retry_after_seconds||0}s`,m.appendChild(y),m.appendChild(d),m.appendChild(r),m});renderRows("rate-limit-body",h,"No rate-limit hits found in selected window.",3),stateArea.hidden=!0,dashboard.hidden=!1}async function loadAdminOverview(e){if(!e){setState("Please sign in to continue.","blocked");return}setState("Loading admin dashboard...","loading");try{const t=await authFetch(`/api/admin/overview?window=${encodeURIComponent(currentWindow)}`);if(!t.ok){const a=await parseAdminErrorResponse(t,"Could not load dashboard data.");setState(a.message,a.type);return}const o=await t.json();renderDashboard(o)}catch(t){console.error(t),setState("Network error while loading dashboard.","error")}}async function exportCsv(e){if(!auth.currentUser){setState("Please sign in to export CSV.","blocked");return}try{const t=await authFetch(`/api/admin/export?type=${encodeURIComponent(e)}&window=${encodeURIComponent(currentWindow)}`);if(!t.ok){const s=await parseAdminErrorResponse(t,"Could not export CSV right now.");setState(s.message,s.type);return}if(downloadUtils.downloadResponseBlob){await downloadUtils.downloadResponseBlob(t,`admin-${e}-${currentWindow}.csv`);return}const o=await t.blob(),a=URL.createObjectURL(o),n=document.createElement("a");n.href=a,n.download=`admin-${e}-${currentWindow}.csv`,document.body.appendChild(n),n.click(),document.body.removeChild(n),URL.revokeObjectURL(a)}catch(t){console.error(t),setState("Network error while exporting CSV.","error")}}function setActiveFilterButton(){document.querySelectorAll(".filter").forEach(e=>{e.classList.toggle("active",e.dataset.window===currentWindow)})}function setActiveModeViewButton(){document.querySelectorAll(".mode-view").forEach(e=>{e.classList.toggle("active",e.dataset.modeView===currentModeView)})}auth.onAuthStateChanged(async e=>{if(e){if(authClient&&typeof authClient.setToken=="function")try{authClient.setToken(await e.getIdToken())}catch(t){}signedInMeta.textContent=`Signed in as ${e.email}`,authBtn.textContent="Sign out",await loadAdminOverview(e),await initCostCalculator(),await runActualCostAnalysis(!1),await loadAdminBatchJobs(!1)}else authClient&&typeof authClient.clearToken=="function"&&authClient.clearToken(),signedInMeta.textContent="Not signed in",authBtn.textContent="Sign in",setAdminTab("overview"),renderAdminBatchJobs([]),setState("Please sign in with your admin account.","blocked")}),authBtn.addEventListener("click",async()=>{if(auth.currentUser){try{await fetch("/api/session/logout",{method:"POST",credentials:"include"})}catch(e){}await auth.signOut();return}window.location.href="/"}),refreshBtn.addEventListener("click",async()=>{if(!auth.currentUser){setState("Please sign in to refresh.","blocked");return}if(activeAdminTab==="batch-jobs"){await loadAdminBatchJobs(!0);return}await loadAdminOverview(auth.currentUser),await initCostCalculator(),await runActualCostAnalysis(!1)}),backBtn.addEventListener("click",()=>{window.location.href="/dashboard"}),exportJobsBtn.addEventListener("click",async()=>{await exportCsv("jobs")}),exportPurchasesBtn.addEventListener("click",async()=>{await exportCsv("purchases")}),exportFunnelBtn.addEventListener("click",async()=>{await exportCsv("funnel")}),exportFunnelDailyBtn.addEventListener("click",async()=>{await exportCsv("funnel-daily")}),document.querySelectorAll(".filter").forEach(e=>{e.addEventListener("click",async()=>{currentWindow=e.dataset.window,setActiveFilterButton(),auth.currentUser&&await loadAdminOverview(auth.currentUser)})}),document.querySelectorAll(".mode-view").forEach(e=>{e.addEventListener("click",()=>{currentModeView=e.dataset.modeView,setActiveModeViewButton(),renderModeBreakdown()})}),adminTabButtons.forEach(e=>{e.addEventListener("click",async()=>{const t=e.dataset.adminTab||"overview";setAdminTab(t),t==="batch-jobs"&&auth.currentUser&&await loadAdminBatchJobs(!1)})}),adminBatchRefreshBtn&&adminBatchRefreshBtn.addEventListener("click",async()=>{await loadAdminBatchJobs(!0)}),adminBatchMode&&adminBatchMode.addEventListener("change",async()=>{await loadAdminBatchJobs(!1)}),adminBatchStatus&&adminBatchStatus.addEventListener("change",async()=>{await loadAdminBatchJobs(!1)});const loadPromptsBtn=document.getElementById("load-prompts-btn"),promptsOutput=document.getElementById("prompts-output");loadPromptsBtn&&promptsOutput&&loadPromptsBtn.addEventListener("click",async()=>{loadPromptsBtn.disabled=!0,loadPromptsBtn.textContent="Loading\u2026";try{const e=await authFetch("/api/admin/prompts?format=markdown");if(!e.ok)promptsOutput.textContent="Error loading prompts.";else{const t=await e.json();promptsOutput.textContent=t.markdown||JSON.stringify(t,null,2)}promptsOutput.hidden=!1}catch(e){promptsOutput.textContent="Network error loading prompts.",promptsOutput.hidden=!1}loadPromptsBtn.textContent="Reload prompts",loadPromptsBtn.disabled=!1}),setActiveFilterButton(),setActiveModeViewButton(),setAdminTab("overview");const enhancedAdminSelects=[];function closeAdminSelectMenus(e){enhancedAdminSelects.forEach(t=>{!t||!t.menu||t.menu===e||t.setOpen(!1)})}function enhanceAdminSelect(e,t){if(!e||e.dataset.enhanced==="true"||!e.parentElement)return null;e.dataset.enhanced="true",e.classList.add("calculator-native-select");const a=document.createElement("div");a.className="app-select calculator-select calculator-select-upgraded";const n=document.createElement("button");n.type="button",n.className="app-select-button calculator-select-button",n.setAttribute("aria-haspopup","listbox"),n.setAttribute("aria-expanded","false");const s=document.createElement("span");s.className="app-select-label";const c=document.createElementNS("http://www.w3.org/2000/svg","svg");c.setAttribute("viewBox","0 0 24 24"),c.setAttribute("fill","none"),c.setAttribute("stroke","currentColor"),c.setAttribute("stroke-width","2"),c.setAttribute("stroke-linecap","round"),c.setAttribute("stroke-linejoin","round");const f=document.createElementNS("http://www.w3.org/2000/svg","polyline");f.setAttribute("points","6 9 12 15 18 9"),c.appendChild(f),n.appendChild(s),n.appendChild(c);const p=document.createElement("div");p.className="app-select-menu calculator-select-menu",p.setAttribute("role","listbox"),a.appendChild(n),a.appendChild(p),e.insertAdjacentElement("afterend",a);function g(){return Array.from(p.querySelectorAll(".app-select-item[data-value]")).filter(r=>!r.disabled)}function h(r){const i=g();if(!i.length)return;const u=i.indexOf(document.activeElement),C=Math.max(0,i.findIndex(v=>v.classList.contains("active")));let b=C;r==="first"&&(b=0),r==="last"&&(b=i.length-1),r==="next"&&(b=u>=0?(u+1)%i.length:C),r==="prev"&&(b=u>=0?(u-1+i.length)%i.length:C),i.forEach(v=>{v.tabIndex=-1}),i[b].tabIndex=0,i[b].focus()}function l(r,i){const u=!!r;u&&closeAdminSelectMenus(p),p.classList.toggle("visible",u),n.classList.toggle("open",u),n.setAttribute("aria-expanded",u?"true":"false"),u&&h(i||"first")}function m(){let r="";g().forEach(i=>{const u=i.dataset.value===String(e.value||"");i.classList.toggle("active",u),i.setAttribute("aria-selected",u?"true":"false"),i.tabIndex=-1,u&&(r=i.textContent)}),s.textContent=r||(e.options[e.selectedIndex]?e.options[e.selectedIndex].textContent:"Select")}function y(){clearChildren(p),Array.from(e.options||[]).forEach(r=>{const i=document.createElement("button");i.type="button",i.className="app-select-item calculator-select-item",i.dataset.value=String(r.value),i.textContent=String(r.textContent||r.value||"-"),i.setAttribute("role","option"),i.disabled=!!r.disabled,i.addEventListener("click",()=>{e.value!==r.value&&(e.value=r.value,e.dispatchEvent(new Event("change",{bubbles:!0})),typeof t=="function"&&t(r.value)),m(),l(!1),n.focus()}),p.appendChild(i)}),m()}n.addEventListener("click",r=>{r.preventDefault(),l(!p.classList.contains("visible"))}),n.addEventListener("keydown",r=>{r.key==="ArrowDown"?(r.preventDefault(),l(!0,"first")):r.key==="ArrowUp"?(r.preventDefault(),l(!0,"last")):r.key==="Enter"||r.key===" "?(r.preventDefault(),l(!p.classList.contains("visible"))):r.key==="Escape"&&(r.preventDefault(),l(!1))}),p.addEventListener("keydown",r=>{if(r.key==="ArrowDown")r.preventDefault(),h("next");else if(r.key==="ArrowUp")r.preventDefault(),h("prev");else if(r.key==="Home")r.preventDefault(),h("first");else if(r.key==="End")r.preventDefault(),h("last");else if(r.key==="Escape")r.preventDefault(),l(!1),n.focus();else if(r.key==="Enter"||r.key===" "){const i=document.activeElement&&document.activeElement.closest(".app-select-item[data-value]");if(!i)return;r.preventDefault(),i.click()}}),e.addEventListener("change",m);const d={menu:p,setOpen:l,rebuild:y,sync:m,button:n};return enhancedAdminSelects.push(d),y(),d}document.addEventListener("click",e=>{e.target&&e.target.closest(".calculator-select-upgraded")||closeAdminSelectMenus()}),document.addEventListener("keydown",e=>{e.key==="Escape"&&closeAdminSelectMenus()});const calcScenario=document.getElementById("calc-scenario"),calcScenarioPicker=document.getElementById("calc-scenario-picker"),calcScenarioButton=document.getElementById("calc-scenario-button"),calcScenarioMenu=document.getElementById("calc-scenario-menu"),calcScenarioLabel=document.getElementById("calc-scenario-label"),calcStageGrid=document.getElementById("calc-stage-grid"),calcBundlePrice=document.getElementById("calc-bundle-price"),calcEurUsd=document.getElementById("calc-eur-usd"),calcPricingVersion=document.getElementById("calc-pricing-version"),calcRevenueUsd=document.getElementById("calc-revenue-usd"),calcMargin=document.getElementById("calc-margin"),calcMarginPct=document.getElementById("calc-margin-pct"),calcBreakEven=document.getElementById("calc-break-even"),calcScenarioHeading=document.getElementById("calc-scenario-heading"),calcScenarioCopy=document.getElementById("calc-scenario-copy"),calcScenarioPoints=document.getElementById("calc-scenario-points");let calculatorConfig=null,calculatorBound=!1;function setCalcScenarioMenuVisible(e){if(!calcScenarioMenu||!calcScenarioButton)return;const t=!!e;calcScenarioMenu.classList.toggle("visible",t),calcScenarioButton.classList.toggle("open",t),calcScenarioButton.setAttribute("aria-expanded",t?"true":"false")}function syncCalcScenarioLabel(e){if(!calcScenarioLabel||!calcScenarioMenu||!calcScenario)return;const t=String(e||calcScenario.value||"");let o="";Array.from(calcScenario.options||[]).forEach(a=>{String(a.value)===t&&(o=String(a.textContent||"").trim())}),calcScenarioLabel.textContent=o||"Select scenario",calcScenarioMenu.querySelectorAll(".calculator-select-item").forEach(a=>{const n=a.dataset.value===t;a.classList.toggle("active",n),a.setAttribute("aria-selected",n?"true":"false")})}function rebuildCalcScenarioMenu(){!calcScenarioMenu||!calcScenario||(clearChildren(calcScenarioMenu),Array.from(calcScenario.options||[]).forEach(e=>{const t=document.createElement("button");t.type="button",t.className="calculator-select-item",t.dataset.value=String(e.value),t.setAttribute("role","option"),t.textContent=String(e.textContent||e.value||"-"),t.addEventListener("click",()=>{calcScenario.value=t.dataset.value||"",syncCalcScenarioLabel(calcScenario.value),setCalcScenarioMenuVisible(!1),loadCalculatorScenario(calcScenario.value)}),calcScenarioMenu.appendChild(t)}),syncCalcScenarioLabel(calcScenario.value))}function numberOrZero(e){const t=Number(e);return Number.isFinite(t)?t:0}function formatUsd(e){return`$${numberOrZero(e).toFixed(4)}`}function formatPercent(e){return`${numberOrZero(e).toFixed(1)}%`}function formatEur(e){return`\u20AC${numberOrZero(e).toFixed(4)}`}function resolveStageModelId(e,t){return e==="gemini-2.5-pro"&&Number(t||0)>2e5?"gemini-2.5-pro-200k":e}function getCalculatorModels(){return calculatorConfig&&calculatorConfig.models&&typeof calculatorConfig.models=="object"?calculatorConfig.models:{}}function getCalculatorScenarios(){return calculatorConfig&&calculatorConfig.scenarios&&typeof calculatorConfig.scenarios=="object"?calculatorConfig.scenarios:{}}function summarizeScenarioUsage(e){return(Array.isArray(e&&e.stages)?e.stages:[]).reduce((o,a)=>(o.stageCount+=1,o.totalInput+=Math.max(0,Math.round(numberOrZero(a.input_tokens))),o.totalOutput+=Math.max(0,Math.round(numberOrZero(a.output_tokens))),a.audio&&(o.audioStages+=1),o),{stageCount:0,totalInput:0,totalOutput:0,audioStages:0})}function renderCalculatorStory(e){const t=getCalculatorScenarios()[e]||null,o=summarizeScenarioUsage(t);calcScenarioHeading&&(calcScenarioHeading.textContent=t&&t.label?String(t.label):"Choose a scenario"),calcScenarioCopy&&(t?o.audioStages>0?calcScenarioCopy.textContent="Use this when you want to understand the full lecture or interview pipeline. Audio usually drives the largest portion of the cost.":calcScenarioCopy.textContent="Use this when you want a clean read on slide extraction plus study-tool generation without transcription costs.":calcScenarioCopy.textContent="Pick a scenario to see the default token assumptions, stage costs, and bundle margin."),calcScenarioPoints&&(clearChildren(calcScenarioPoints),t&&[o.stageCount+" stage"+(o.stageCount===1?"":"s")+" included",formatInteger(o.totalInput)+" input tokens modeled",formatInteger(o.totalOutput)+" output tokens modeled",o.audioStages?o.audioStages+" audio stage"+(o.audioStages===1?"":"s"):"No audio stage"].forEach(a=>{const n=document.createElement("span");n.className="calculator-story-point",n.textContent=a,calcScenarioPoints.appendChild(n)}))}function recalcCalculatorCosts(){if(!calcStageGrid)return;const e=getCalculatorModels(),t=calcStageGrid.querySelectorAll(".calc-stage-card[data-stage]");let o=0,a=0,n=0;t.forEach(d=>{const r=String(d.dataset.model||""),i=String(d.dataset.stage||""),u=d.dataset.audio==="true",C=Math.max(0,Math.round(numberOrZero((d.querySelector(".calc-in")||{}).value))),b=Math.max(0,Math.round(numberOrZero((d.querySelector(".calc-out")||{}).value))),v=resolveStageModelId(r,C),E=e[v]||e[r]||{},k=numberOrZero(E.input_text_per_M),w=E.input_audio_per_M===null?NaN:numberOrZero(E.input_audio_per_M),_=numberOrZero(E.output_per_M),x=u&&Number.isFinite(w)?w:k,S=C/1e6*x,B=b/1e6*_,I=S+B,A=d.querySelector(".calc-stage-model");if(A){const j=String(E.label||r||"-");A.innerHTML=`<div class="calc-stage-model-id">${v||r||"-"}</div><div class="calc-stage-model-label">${j}</div>`}const L=d.querySelector(".calc-stage-badge");L&&(L.textContent=u?"Audio input":"Text / vision");const N=d.querySelector(".cost-in"),M=d.querySelector(".cost-out"),$=d.querySelector(".cost-stage"),T=d.querySelector(".cost-share");N&&(N.textContent=formatUsd(S)),M&&(M.textContent=formatUsd(B)),$&&($.textContent=formatUsd(I)),T&&(T.textContent="0.0%"),o+=S,a+=B,n+=I,d.dataset.modelEffective=v,d.dataset.inputTokens=String(C),d.dataset.outputTokens=String(b),d.dataset.stageName=i});const s=document.getElementById("calc-total-input"),c=document.getElementById("calc-total-output"),f=document.getElementById("calc-total");s&&(s.textContent=formatUsd(o)),c&&(c.textContent=formatUsd(a)),f&&(f.textContent=formatUsd(n));const p=Math.max(0,numberOrZero(calcBundlePrice?calcBundlePrice.value:0)),g=Math.max(.1,numberOrZero(calcEurUsd?calcEurUsd.value:1.08)),h=p*g,l=h-n,m=h>0?l/h*100:0,y=g>0?n/g:0;calcRevenueUsd&&(calcRevenueUsd.textContent=formatUsd(h)),calcMargin&&(calcMargin.textContent=formatUsd(l),calcMargin.classList.toggle("tone-positive",l>=0),calcMargin.classList.toggle("tone-negative",l<0)),calcMarginPct&&(calcMarginPct.textContent=formatPercent(m),calcMarginPct.classList.toggle("tone-positive",m>=0),calcMarginPct.classList.toggle("tone-negative",m<0)),calcBreakEven&&(calcBreakEven.textContent=formatEur(y)),t.forEach(d=>{const r=d.querySelector(".cost-stage"),i=d.querySelector(".cost-share");if(!r||!i)return;const u=numberOrZero(String(r.textContent||"").replace(/[^0-9.-]/g,""));i.textContent=n>0?formatPercent(u/n*100):"0.0%"})}function loadCalculatorScenario(e){const o=getCalculatorScenarios()[e];!o||!Array.isArray(o.stages)||!calcStageGrid||(clearChildren(calcStageGrid),renderCalculatorStory(e),o.stages.forEach(a=>{const n=document.createElement("article");n.className="calc-stage-card",n.dataset.stage=String(a.stage||""),n.dataset.model=String(a.model||""),n.dataset.audio=String(!!a.audio),n.innerHTML=`
             <div class="calc-stage-head">
               <div>
                 <div class="calc-stage-name">${String(a.stage||"-")}</div>
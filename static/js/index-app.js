@@ -114,6 +114,7 @@ let pollInterval = null;
 let pollFailures = 0;
 let pollMissingResponses = 0;
 let pollStartedAt = 0;
+let pollStatusEtag = '';
 let currentMode = forcedMode || 'lecture-notes';
 let resultMarkdown = '';
 let slideText = '';
@@ -178,6 +179,7 @@ const analyticsEndpoint = '/api/lp-event';
 const POLL_BASE_MS = 2000;
 const POLL_MAX_MS = 30000;
 const POLL_MAX_RUNTIME_MS = 30 * 60 * 1000;
+const POLL_LONG_WAIT_SECONDS = 20;
 const ACTIVE_RUNTIME_JOBS_CACHE_KEY = 'active_runtime_jobs';
 const RUNTIME_JOBS_REFRESH_MS = 12000;
 const DOWNLOAD_LABELS = Object.freeze({
@@ -2023,6 +2025,65 @@ async function applyImportedAudio(payload, previousToken = '', sourceUrl = '') {
     }
     return true;
 }
+const CHUNKED_AUDIO_UPLOAD_THRESHOLD_BYTES = 32 * 1024 * 1024;
+const CHUNKED_AUDIO_UPLOAD_MAX_RETRIES = 3;
+async function sha256Hex(blob) {
+    if (!window.crypto || !window.crypto.subtle || typeof blob.arrayBuffer !== 'function') return '';
+    const digest = await window.crypto.subtle.digest('SHA-256', await blob.arrayBuffer());
+    return Array.from(new Uint8Array(digest)).map((byte) => byte.toString(16).padStart(2, '0')).join('');
+}
+async function uploadAudioFileInChunks(file, onProgress) {
+    const created = await authenticatedFetch('/api/uploads', {
+        method: 'POST',
+        headers: { 'Content-Type': 'application/json' },
+        body: JSON.stringify({ file_name: file.name, mime_type: file.type || '', total_bytes: file.size }),
+    });
+    const session = await created.json();
+    if (!created.ok || session.error) return { response: created, payload: session };
+    const sessionPath = `/api/uploads/${encodeURIComponent(session.upload_id)}`;
+    const chunkSize = Math.max(1, Number(session.chunk_max_bytes || 0) || 8 * 1024 * 1024);
+    let offset = Math.max(0, Number(session.offset || 0));
+    let retries = 0;
+    while (offset < file.size) {
+        const chunk = file.slice(offset, offset + chunkSize);
+        let response = null;
+        let payload = null;
+        try {
+            const chunkSha256 = await sha256Hex(chunk);
+            response = await authenticatedFetch(`${sessionPath}?offset=${offset}&chunk_sha256=${chunkSha256}`, {
+                method: 'PATCH',
+                headers: { 'Content-Type': 'application/octet-stream' },
+                body: chunk,
+            });
+            payload = await response.json();
+        } catch (error) {
+            retries += 1;
+            if (retries > CHUNKED_AUDIO_UPLOAD_MAX_RETRIES) throw error;
+            // Resume from whatever the server stored before the connection dropped.
+            const statusResponse = await authenticatedFetch(sessionPath);
+            const status = await statusResponse.json();
+            if (!statusResponse.ok) return { response: statusResponse, payload: status };
+            offset = Math.max(0, Number(status.offset || 0));
+            continue;
+        }
+        if (!response.ok) {
+            retries += 1;
+            const retryable = (response.status === 409 || (response.status === 400 && typeof payload.offset === 'number'));
+            if (!retryable || retries > CHUNKED_AUDIO_UPLOAD_MAX_RETRIES) return { response, payload };
+            offset = Math.max(0, Number(payload.offset || 0));
+            continue;
+        }
+        retries = 0;
+        offset = Math.max(0, Number(payload.offset || 0));
+        if (typeof onProgress === 'function') onProgress(offset, file.size);
+    }
+    const completed = await authenticatedFetch(`${sessionPath}/complete`, {
+        method: 'POST',
+        headers: { 'Content-Type': 'application/json' },
+        body: '{}',
+    });
+    return { response: completed, payload: await completed.json() };
+}
 function syncAudioImportStatusForUrlChange() {
     if (!((modeConfig[currentMode] || {}).needsAudio) || audioFile || audioImportInFlight) {
         updateProcessButton();
@@ -2759,6 +2820,10 @@ function scheduleNextPoll(delayMs) {
     if (pollInterval) clearTimeout(pollInterval);
     pollInterval = setTimeout(pollStatus, Math.max(0, delayMs || 0));
 }
+// The server answers at once when long-polling is off or busy; keep each poll cycle at least POLL_BASE_MS.
+function longPollFloorDelay(requestStartedAt) {
+    return Math.max(0, POLL_BASE_MS - (Date.now() - requestStartedAt));
+}
 function setProgressRetryVisible(visible) {
     if (!progressRetry || !progressRetryBtn) return;
     progressRetry.classList.toggle('visible', Boolean(visible));
@@ -2791,6 +2856,7 @@ function stopPolling() {
     pollFailures = 0;
     pollMissingResponses = 0;
     pollStartedAt = 0;
+    pollStatusEtag = '';
 }
 function resetProcessingSession(options = {}) {
     const keepProgressVisible = Boolean(options.keepProgressVisible);
@@ -3056,7 +3122,11 @@ async function pollStatus() {
         return;
     }
     try {
-        const r = await authenticatedFetch(`/status/${currentJobId}`);
+        const requestStartedAt = Date.now();
+        const r = await authenticatedFetch(
+            `/status/${currentJobId}?wait=${POLL_LONG_WAIT_SECONDS}`,
+            pollStatusEtag ? { headers: { 'If-None-Match': pollStatusEtag } } : {}
+        );
         if (r.status === 401) {
             resetProcessingSession({ keepProgressVisible: true });
             showAuthModal('signin');
@@ -3067,6 +3137,12 @@ async function pollStatus() {
             showError('You do not have access to this job.');
             return;
         }
+        if (r.status === 304) {
+            pollFailures = 0;
+            scheduleNextPoll(longPollFloorDelay(requestStartedAt));
+            return;
+        }
+        pollStatusEtag = r.headers.get('ETag') || '';
         const d = await r.json();
         if (d.error && d.status !== 'error') {
             const isRetryableMissing = r.status === 404 && (d.retryable || d.error_code === 'JOB_TEMPORARILY_UNAVAILABLE' || d.job_lost);
@@ -3152,7 +3228,7 @@ async function pollStatus() {
             setProgressRetryVisible(false);
             pollFailures = 0;
             pollMissingResponses = 0;
-            scheduleNextPoll(POLL_BASE_MS);
+            scheduleNextPoll(pollStatusEtag ? longPollFloorDelay(requestStartedAt) : POLL_BASE_MS);
         }
     } catch (e) {
         console.error(e);
@@ -3192,7 +3268,8 @@ async function processFiles() {
     fd.append('mode', currentMode);
     fd.append('study_pack_title', studyPackTitle);
     if (config.needsPdf && pdfFile) fd.append('pdf', pdfFile);
-    if (config.needsAudio && audioFile) fd.append('audio', audioFile);
+    const useChunkedAudioUpload = Boolean(config.needsAudio && audioFile && audioFile.size > CHUNKED_AUDIO_UPLOAD_THRESHOLD_BYTES);
+    if (config.needsAudio && audioFile && !useChunkedAudioUpload) fd.append('audio', audioFile);
     const readyImportedAudioToken = config.needsAudio ? getReadyImportedAudioToken() : '';
     if (config.needsAudio && readyImportedAudioToken && !audioFile) {
         fd.append('audio_import_token', readyImportedAudioToken);
@@ -3235,8 +3312,23 @@ async function processFiles() {
         interview_features_count: selectedInterviewFeatures.length,
     });
     try {
-        const r = await authenticatedFetch('/upload', { method: 'POST', body: fd });
-        const d = await r.json();
+        let r = null;
+        let d = null;
+        if (useChunkedAudioUpload) {
+            const uploaded = await uploadAudioFileInChunks(audioFile, (sentBytes, totalBytes) => {
+                updateProgressUI(0, `Uploading audio... ${Math.floor((sentBytes / Math.max(1, totalBytes)) * 100)}%`, steps.length);
+            });
+            if (uploaded.payload && uploaded.payload.audio_import_token) {
+                fd.append('audio_import_token', uploaded.payload.audio_import_token);
+            } else {
+                r = uploaded.response;
+                d = (uploaded.payload && uploaded.payload.error) ? uploaded.payload : { error: 'Audio upload failed. Please try again.' };
+            }
+        }
+        if (!d) {
+            r = await authenticatedFetch('/upload', { method: 'POST', body: fd });
+            d = await r.json();
+        }
         if (d.error) {
             trackEvent('processing_failed', { reason: d.error || 'upload_failed' });
             if (typeof d.error === 'string' && d.error.toLowerCase().includes('imported audio token')) {
@@ -1,4 +1,4 @@
-const runtimeConfig=window.LectureProcessorRuntime||{},sentryFrontendDsn=runtimeConfig.sentryFrontendDsn||"",sentryEnvironment=runtimeConfig.sentryEnvironment||"",sentryRelease=runtimeConfig.sentryRelease||"",sentryCaptureLocal=runtimeConfig.sentryCaptureLocal===!0,sentryLocalHostnames=new Set(["localhost","127.0.0.1","[::1]"]),sentryHostname=String(window.location.hostname||"").trim().toLowerCase(),sentryEnvironmentName=String(sentryEnvironment||"").trim().toLowerCase(),frontendSentryEnabled=!!window.Sentry&&!!sentryFrontendDsn&&(sentryCaptureLocal||!sentryLocalHostnames.has(sentryHostname)&&!sentryHostname.endsWith(".local"))&&sentryEnvironmentName!=="test"&&sentryEnvironmentName!=="testing";frontendSentryEnabled&&window.Sentry.init({dsn:sentryFrontendDsn,environment:sentryEnvironment||"production",release:sentryRelease||void 0,tracesSampleRate:0});const bootstrap=window.LectureProcessorBootstrap||{},auth=bootstrap.getAuth?bootstrap.getAuth():firebase.auth(),authUtils=window.LectureProcessorAuth||{},authClient=authUtils.createAuthClient?authUtils.createAuthClient(auth,{notSignedInMessage:"Please sign in"}):null,analyticsUtils=window.LectureProcessorIndexAnalytics||{},markdownUtils=window.LectureProcessorMarkdown||{},uxUtils=window.LectureProcessorUx||{},downloadUtils=window.LectureProcessorDownload||{},topbarUtils=window.LectureProcessorTopbar||{},progressUtils=window.LectureProcessorStudyProgressUtils||{},displayFormatUtils=window.LectureProcessorDisplayFormatUtils||{},runtimeJobUtils=window.LectureProcessorRuntimeJobUtils||{},audioImportUtils=window.LectureProcessorLectureAudioImportUtils||{},processingUi=window.LectureProcessorProcessingUi||{},progressFlowUtils=window.LectureProcessorIndexProgress||{},indexResultsUtils=window.LectureProcessorIndexResults||{},pageConfig=window.LectureProcessorPageConfig||{},forcedMode=["lecture-notes","slides-only","interview"].includes(String(pageConfig.forcedMode||"").trim())?String(pageConfig.forcedMode||"").trim():"",appShell=document.getElementById("app-shell"),analyticsPage=typeof analyticsUtils.resolveProcessingAnalyticsPage=="function"?analyticsUtils.resolveProcessingAnalyticsPage({forcedMode,pathname:window.location.pathname,shellPageKey:appShell?appShell.getAttribute("data-page-key"):""}):"processing",setHidden=typeof uxUtils.setHidden=="function"?uxUtils.setHidden:function(e,t){e&&(e.hidden=!!t)};function normalizeAudioImportUrl(e){return typeof audioImportUtils.normalizeAudioImportUrl=="function"?audioImportUtils.normalizeAudioImportUrl(e):String(e||"").trim()}function describeAudioImportRequest(e){if(typeof audioImportUtils.describeAudioImportRequest=="function")return audioImportUtils.describeAudioImportRequest(e);const t=e&&typeof e=="object"?e:{},n=String(t.mode||"").trim(),o=normalizeAudioImportUrl(t.url),s=!!t.hasLocalAudioFile,r=String(t.importedAudioToken||"").trim(),i=normalizeAudioImportUrl(t.importedAudioSourceUrl);return n!=="lecture-notes"&&n!=="interview"?{shouldImport:!1,reason:"unsupported-mode"}:o?s?{shouldImport:!1,reason:"local-audio-selected"}:r&&i===o?{shouldImport:!1,reason:"already-imported"}:r&&i&&i!==o?{shouldImport:!0,reason:"replace-imported-audio"}:{shouldImport:!0,reason:"import"}:{shouldImport:!1,reason:"empty-url"}}function formatDateLabel(e){if(typeof uxUtils.formatDate=="function")return uxUtils.formatDate(e);const t=e instanceof Date?e:new Date(e);if(Number.isNaN(t.getTime()))return"-";const n=navigator.language||"en-US";return t.toLocaleDateString(n,{day:"2-digit",month:"short",year:"numeric"})}function formatTimeLabel(e){if(typeof uxUtils.formatTime=="function")return uxUtils.formatTime(e);const t=e instanceof Date?e:new Date(e);if(Number.isNaN(t.getTime()))return"-";const n=navigator.language||"en-US";return t.toLocaleTimeString(n,{hour:"2-digit",minute:"2-digit"})}let currentUser=null,userCredits=null,idToken=null,currentUserIsAdmin=!1,pdfFile=null,audioFile=null,audioFileOrigin="upload",recordedAudioNeedsDownload=!1,currentJobId=null,pollInterval=null,pollFailures=0,pollMissingResponses=0,pollStartedAt=0,currentMode=forcedMode||"lecture-notes",resultMarkdown="",slideText="",transcript="",flashcards=[],testQuestions=[],activeResultsTab="notes",flashcardIndex=0,flashcardFlipped=!1,activeRuntimeJobs=[],runtimeJobsRefreshTimer=null,runtimeJobsRefreshInFlight=!1,notificationPermissionRequested=!1,notifiedTerminalJobIds=new Set,quizIndex=0,quizScore=0,quizAnswered=!1,studyGenerationError=null,currentStudyPackId=null,resultsLocked=!1,selectedStudyFeatures="both",selectedFlashcardAmount="20",selectedQuestionAmount="10",selectedInterviewFeatures=[],importedAudioToken="",importedAudioSizeBytes=0,importedAudioName="",importedAudioSourceUrl="",pendingAutoImportUrl="",audioImportInFlight=!1,audioImportRequestUrl="",recordingState="idle",recordingStream=null,mediaRecorder=null,recordingChunks=[],recordingMimeType="",recordingExtension="",recordingStartedAtMs=0,recordingElapsedMs=0,recordingTimer=null,recorderStatusMessage="",recorderStatusTone="info",discardNextRecordingResult=!1,languageOnboardingOpen=!1,languageOnboardingSaving=!1,userPreferences=null,languagePreferenceSaveTimer=null,suppressLanguagePreferencePersist=!1,interviewSummaryText="",interviewSectionsText="",interviewCombinedText="",currentBillingReceipt=null,exportCsvType="flashcards",progressSummaryCache=null,userTotalProcessed=0,userHasCreatedStudyPack=!1,userProfileLoaded=!1,trackedTerminalJobId="",otherAudioOpen=!1;const analyticsEndpoint="/api/lp-event",POLL_BASE_MS=2e3,POLL_MAX_MS=3e4,POLL_MAX_RUNTIME_MS=1800*1e3,ACTIVE_RUNTIME_JOBS_CACHE_KEY="active_runtime_jobs",RUNTIME_JOBS_REFRESH_MS=12e3,DOWNLOAD_LABELS=Object.freeze({lectureNotes:"Lecture Notes",slideExtract:"Slide Extract",lectureTranscript:"Lecture Transcript",interviewTranscript:"Interview Transcription"}),OUTPUT_LANGUAGE_LABELS=Object.freeze({dutch:"\u{1F1F3}\u{1F1F1} Dutch",english:"\u{1F1EC}\u{1F1E7} English",spanish:"\u{1F1EA}\u{1F1F8} Spanish",french:"\u{1F1EB}\u{1F1F7} French",german:"\u{1F1E9}\u{1F1EA} German",chinese:"\u{1F1E8}\u{1F1F3} Chinese",other:"\u{1F310} Other"});function createAnalyticsSessionId(){try{if(window.crypto&&typeof window.crypto.randomUUID=="function")return window.crypto.randomUUID().replace(/[^A-Za-z0-9_-]/g,"").slice(0,64)}catch(e){}return`sess_${Date.now()}_${Math.random().toString(36).slice(2,12)}`}const analyticsSessionId=(()=>{const e="lp_analytics_session_id";try{const t=localStorage.getItem(e);if(t&&/^[A-Za-z0-9_-]{6,80}$/.test(t))return t;const n=createAnalyticsSessionId();return localStorage.setItem(e,n),n}catch(t){return createAnalyticsSessionId()}})();function captureClientError(e,t=""){if(!(!frontendSentryEnabled||!window.Sentry||!e)){if(t){window.Sentry.withScope(n=>{n.setTag("context",t),window.Sentry.captureException(e)});return}window.Sentry.captureException(e)}}function trackEvent(e,t={},n={}){const o=String(e||"").trim().toLowerCase();if(!o)return Promise.resolve(!1);const s={event:o,session_id:analyticsSessionId,page:analyticsPage,path:window.location.pathname,properties:Object.assign({},t||{},{mode:currentMode})},r=JSON.stringify(s);if(n.preferBeacon&&navigator.sendBeacon)try{const a=new Blob([r],{type:"application/json"});return Promise.resolve(navigator.sendBeacon(analyticsEndpoint,a))}catch(a){}const i={"Content-Type":"application/json"};return idToken&&(i.Authorization=`Bearer ${idToken}`),fetch(analyticsEndpoint,{method:"POST",headers:i,body:r,keepalive:!0}).then(a=>a.ok).catch(()=>!1)}const modeConfig={"lecture-notes":{description:"Upload lecture slides and audio to generate complete notes, flashcards, and practice tests from the same lecture.",creditCost:"Uses <strong>1 lecture credit</strong>",creditType:"lecture",needsPdf:!0,needsAudio:!0,pdfTitle:"Lecture Slides",pdfRequirement:"Required",pdfRequirementTone:"required",pdfHelper:"Required for lecture notes. Upload the slide deck used in the lecture.",audioTitle:"Lecture Recording",audioRequirement:"Required",audioRequirementTone:"required",audioHelper:"Required for lecture notes. LMS import counts as your audio source.",lmsImportTitle:"Import from lecture video URL",lmsImportHint:"Paste the normal lecture video page from your LMS first. Direct playlist links also work.",buttonText:"Process Lecture",resultTitle:"Study Dashboard",steps:[{num:1,label:"Extract Slides"},{num:2,label:"Transcribe Audio"},{num:3,label:"Merge Notes"},{num:4,label:"Build Study Tools"}]},"slides-only":{description:"Upload lecture slides (PDF or PPTX) to run slide extraction and generate clean text notes.",creditCost:"Uses <strong>1 text extraction credit</strong>",creditType:"slides",needsPdf:!0,needsAudio:!1,pdfTitle:"Lecture Slides",pdfRequirement:"Required",pdfRequirementTone:"required",pdfHelper:"Required in this mode. Audio is not used for slides extraction.",audioTitle:"Lecture Recording",audioRequirement:"Optional",audioRequirementTone:"optional",audioHelper:"Not used in this mode. Switch to Lecture Notes if you want slides and audio merged together.",lmsImportTitle:"Import from lecture video URL",lmsImportHint:"Only needed in Lecture Notes mode.",buttonText:"Extract Slides",resultTitle:"Study Dashboard",steps:[{num:1,label:"Extract Text"},{num:2,label:"Build Study Tools"}]},interview:{description:"Upload an interview recording to generate a timestamped transcript with speaker identification.",creditCost:"Uses <strong>1 interview credit</strong> (+ <strong>1 text extraction credit</strong> per selected extra)",creditType:"interview",needsPdf:!1,needsAudio:!0,pdfTitle:"Lecture Slides",pdfRequirement:"Optional",pdfRequirementTone:"optional",pdfHelper:"Slides are not used in interview mode.",audioTitle:"Interview Recording",audioRequirement:"Required",audioRequirementTone:"required",audioHelper:"Required in this mode. Upload the source audio you want transcribed.",lmsImportTitle:"Import from lecture video URL",lmsImportHint:"Use this only when the interview audio is hosted on a supported lecture video page or direct playlist URL.",buttonText:"Run Interview Transcription",resultTitle:"Interview Transcription",steps:[{num:1,label:"Transcribe"}]}},UPLOAD_ESTIMATE_COPY=Object.freeze({"lecture-notes":"A 60-minute lecture usually finishes in about 5 minutes. Longer or noisy recordings can take longer.","slides-only":"Most slide extractions finish within a couple of minutes. Large or image-heavy decks can take longer.",interview:"Most interview transcripts finish within a few minutes. Summary and structured transcript extras add more time."}),allowedSlideExtensions=[".pdf",".pptx"],allowedSlideMimeTypes=["application/pdf","application/vnd.openxmlformats-officedocument.presentationml.presentation","application/vnd.ms-powerpoint","application/octet-stream",""],headerSignInBtn=document.getElementById("header-sign-in-btn"),headerNavToggle=document.getElementById("header-nav-toggle"),headerSidebar=document.getElementById("header-sidebar"),headerSidebarBackdrop=document.getElementById("header-sidebar-backdrop"),headerSidebarClose=document.getElementById("header-sidebar-close"),headerStudyLibraryBtn=document.getElementById("header-study-library-btn"),headerFeaturesBtn=document.getElementById("header-features-btn"),headerToolsBtn=document.getElementById("header-tools-btn"),headerPlannerBtn=document.getElementById("header-planner-btn"),headerPlannerGroup=document.getElementById("header-planner-group"),headerPlannerSubmenu=document.getElementById("header-planner-submenu"),headerCalendarBtn=document.getElementById("header-calendar-btn"),progressMenu=document.getElementById("progress-menu"),progressButton=document.getElementById("progress-button"),progressDropdown=document.getElementById("progress-dropdown"),progressStreakCount=document.getElementById("progress-streak-count"),progressDueCount=document.getElementById("progress-due-count"),progressGoalText=document.getElementById("progress-goal-text"),progressSetGoalBtn=document.getElementById("progress-set-goal-btn"),progressOpenCalendarBtn=document.getElementById("progress-open-calendar-btn"),progressOpenPlanBtn=document.getElementById("progress-open-plan-btn"),goalModalOverlay=document.getElementById("goal-modal-overlay"),goalModalInput=document.getElementById("goal-modal-input"),goalModalError=document.getElementById("goal-modal-error"),goalModalCancelBtn=document.getElementById("goal-modal-cancel-btn"),goalModalSaveBtn=document.getElementById("goal-modal-save-btn"),deleteAccountOverlay=document.getElementById("delete-account-overlay"),deleteAccountClose=document.getElementById("delete-account-close"),deleteAccountCancelBtn=document.getElementById("delete-account-cancel-btn"),deleteAccountConfirmBtn=document.getElementById("delete-account-confirm-btn"),deleteAccountTextInput=document.getElementById("delete-account-text-input"),deleteAccountEmailInput=document.getElementById("delete-account-email-input"),deleteAccountError=document.getElementById("delete-account-error"),creditsDisplay=document.getElementById("credits-display"),creditsCount=document.getElementById("credits-count"),creditsTooltip=document.getElementById("credits-tooltip"),userMenu=document.getElementById("user-menu"),userButton=document.getElementById("user-button"),userDropdown=document.getElementById("user-dropdown"),userAvatar=document.getElementById("user-avatar"),userName=document.getElementById("user-name"),userEmail=document.getElementById("user-email"),dropdownLectureCredits=document.getElementById("dropdown-lecture-credits"),dropdownSlidesCredits=document.getElementById("dropdown-slides-credits"),dropdownInterviewCredits=document.getElementById("dropdown-interview-credits"),buyCreditsBtn=document.getElementById("buy-credits-btn"),purchaseHistoryBtn=document.getElementById("purchase-history-btn"),exportDataBtn=document.getElementById("export-data-btn"),adminDashboardBtn=document.getElementById("admin-dashboard-btn"),deleteAccountBtn=document.getElementById("delete-account-btn"),signOutBtn=document.getElementById("sign-out-btn"),authOverlay=document.getElementById("auth-overlay"),authModalClose=document.getElementById("auth-modal-close"),signinView=document.getElementById("signin-view"),signupView=document.getElementById("signup-view"),resetView=document.getElementById("reset-view"),signinForm=document.getElementById("signin-form"),signupForm=document.getElementById("signup-form"),resetForm=document.getElementById("reset-form"),signinEmail=document.getElementById("signin-email"),signinPassword=document.getElementById("signin-password"),signupEmail=document.getElementById("signup-email"),signupPassword=document.getElementById("signup-password"),signupPasswordConfirm=document.getElementById("signup-password-confirm"),resetEmail=document.getElementById("reset-email"),signinError=document.getElementById("signin-error"),signupError=document.getElementById("signup-error"),resetError=document.getElementById("reset-error"),resetSuccess=document.getElementById("reset-success"),googleSignInBtn=document.getElementById("google-sign-in-btn"),googleSignUpBtn=document.getElementById("google-sign-up-btn"),switchToSignup=document.getElementById("switch-to-signup"),switchToSignin=document.getElementById("switch-to-signin"),forgotPasswordLink=document.getElementById("forgot-password-link"),backToSignin=document.getElementById("back-to-signin"),signInRequired=document.getElementById("sign-in-required"),signInToProcessBtn=document.getElementById("sign-in-to-process-btn"),studyPackTitleInput=document.getElementById("study-pack-title-input"),modeTabs=document.querySelectorAll(".mode-tab"),modeDescriptionText=document.getElementById("mode-description-text"),modeCreditCost=document.getElementById("mode-credit-cost"),modeCostSummary=document.getElementById("mode-cost-summary"),uploadEstimate=document.getElementById("upload-estimate"),uploadEstimateTime=document.getElementById("upload-estimate-time"),uploadEstimateMeta=document.getElementById("upload-estimate-meta"),uploadSection=document.getElementById("upload-section"),buttonSection=document.getElementById("button-section"),mobileProcessSummary=document.getElementById("mobile-process-summary"),generationControls=document.getElementById("generation-controls"),interviewControls=document.getElementById("interview-controls"),languageControls=document.getElementById("language-controls"),quickstartCard=document.getElementById("quickstart-card"),quickstartApplyBtn=document.getElementById("quickstart-apply-btn"),quickstartDismissBtn=document.getElementById("quickstart-dismiss-btn"),advancedSettingsToggle=document.getElementById("advanced-settings-toggle"),advancedSettingsBody=document.getElementById("advanced-settings-body"),advancedSettingsSummary=document.getElementById("advanced-settings-summary"),studyToolsToggle=document.getElementById("study-tools-toggle"),studyToolsToggleText=document.getElementById("study-tools-toggle-text"),studyToolsPanel=document.getElementById("study-tools-panel"),studyToolsNote=document.getElementById("study-tools-note"),flashcardAmountControl=document.getElementById("flashcard-amount-control"),questionAmountControl=document.getElementById("question-amount-control"),studyToolChips=document.querySelectorAll(".tool-chip[data-study-features]"),flashcardAmountChips=document.querySelectorAll("#flashcard-amount-chips .amount-chip"),questionAmountChips=document.querySelectorAll("#question-amount-chips .amount-chip"),interviewOptionButtons=document.querySelectorAll(".interview-option[data-feature]"),interviewExtraNote=document.getElementById("interview-extra-note"),outputLanguageSelect=document.getElementById("output-language-select"),outputLanguagePicker=document.getElementById("output-language-picker"),outputLanguageButton=document.getElementById("output-language-button"),outputLanguageLabel=document.getElementById("output-language-label"),outputLanguageMenu=document.getElementById("output-language-menu"),outputLanguageItems=document.querySelectorAll("#output-language-menu .app-select-item"),outputLanguageCustom=document.getElementById("output-language-custom"),pdfZone=document.getElementById("pdf-zone"),audioZone=document.getElementById("audio-zone"),pdfZoneTitle=document.getElementById("pdf-zone-title"),pdfZoneBadge=document.getElementById("pdf-zone-badge"),pdfZoneHelper=document.getElementById("pdf-zone-helper"),audioZoneTitle=document.getElementById("audio-zone-title"),audioZoneBadge=document.getElementById("audio-zone-badge"),audioZoneHelper=document.getElementById("audio-zone-helper"),pdfInput=document.getElementById("pdf-input"),audioInput=document.getElementById("audio-input"),pdfInfo=document.getElementById("pdf-info"),audioInfo=document.getElementById("audio-info"),pdfName=document.getElementById("pdf-name"),pdfSize=document.getElementById("pdf-size"),audioName=document.getElementById("audio-name"),audioSize=document.getElementById("audio-size"),pdfRemove=document.getElementById("pdf-remove"),audioRemove=document.getElementById("audio-remove"),audioUrlImport=document.getElementById("audio-url-import"),audioUrlImportTitle=document.getElementById("audio-url-import-title"),audioUrlImportHint=document.getElementById("audio-url-import-hint"),audioUrlAdvanced=document.getElementById("audio-url-advanced"),audioUrlAdvancedToggle=document.getElementById("audio-url-advanced-toggle"),audioUrlAdvancedPanel=document.getElementById("audio-url-advanced-panel"),otherAudioDisclosure=document.getElementById("other-audio-disclosure"),otherAudioToggle=document.getElementById("other-audio-toggle"),otherAudioBody=document.getElementById("other-audio-body"),otherAudioSummary=document.getElementById("other-audio-summary"),audioUrlInput=document.getElementById("audio-url-input"),audioUrlFetchBtn=document.getElementById("audio-url-fetch-btn"),audioUrlStatus=document.getElementById("audio-url-status"),audioRecorderPanel=document.getElementById("audio-recorder-panel"),audioRecordStartBtn=document.getElementById("audio-record-start"),audioRecordPauseBtn=document.getElementById("audio-record-pause"),audioRecordStopBtn=document.getElementById("audio-record-stop"),audioRecorderTimer=document.getElementById("audio-recorder-timer"),audioRecordingStatus=document.getElementById("audio-recording-status"),audioRecordingWarning=document.getElementById("audio-recording-warning"),languageOnboardingOverlay=document.getElementById("language-onboarding-overlay"),languageOnboardingGrid=document.getElementById("language-onboarding-grid"),languageOnboardingButtons=document.querySelectorAll("#language-onboarding-grid .onboarding-language-btn"),languageOnboardingCustom=document.getElementById("language-onboarding-custom"),languageOnboardingError=document.getElementById("language-onboarding-error"),languageOnboardingSaveBtn=document.getElementById("language-onboarding-save-btn"),processButton=document.getElementById("process-button"),noCreditsWarning=document.getElementById("no-credits-warning"),buyCreditsLink=document.getElementById("buy-credits-link"),progressSection=document.getElementById("progress-section"),progressSteps=document.getElementById("progress-steps"),progressStatus=document.getElementById("progress-status"),statusText=document.getElementById("status-text"),progressSpinner=progressStatus?progressStatus.querySelector(".spinner"):null,progressSafeBanner=document.getElementById("progress-safe-banner"),progressRetry=document.getElementById("progress-retry"),progressRetryBtn=document.getElementById("progress-retry-btn"),resultsSection=document.getElementById("results-section"),resultsTitleText=document.getElementById("results-title-text"),resultsContent=document.getElementById("results-content"),studyWarning=document.getElementById("study-warning"),billingReceiptPanel=document.getElementById("billing-receipt"),copyButton=document.getElementById("copy-button"),copyButtonText=document.getElementById("copy-button-text"),downloadButton=document.getElementById("download-button"),downloadDropdown=document.getElementById("download-dropdown"),downloadDropdownContent=document.getElementById("download-dropdown-content"),moreActionsDropdown=document.getElementById("more-actions-dropdown"),moreActionsButton=document.getElementById("more-actions-button"),moreActionsContent=document.getElementById("more-actions-content"),exportStudyCsvBtn=document.getElementById("export-study-csv-btn"),exportStudyCsvText=document.getElementById("export-study-csv-text"),studyNowBtn=document.getElementById("study-now-btn"),studyLibraryBtn=document.getElementById("study-library-btn"),newLectureButton=document.getElementById("new-lecture-button"),tabButtons=document.querySelectorAll(".focus-tab"),tabFlashcards=document.getElementById("tab-flashcards"),tabTest=document.getElementById("tab-test"),paneNotes=document.getElementById("pane-notes"),paneFlashcards=document.getElementById("pane-flashcards"),paneTest=document.getElementById("pane-test"),flashcardCountBadge=document.getElementById("flashcard-count-badge"),testCountBadge=document.getElementById("test-count-badge"),flashcardCard=document.getElementById("flashcard-card"),flashcardInner=document.getElementById("flashcard-inner"),flashcardFrontText=document.getElementById("flashcard-front-text"),flashcardBackText=document.getElementById("flashcard-back-text"),flashcardPrevBtn=document.getElementById("flashcard-prev-btn"),flashcardFlipBtn=document.getElementById("flashcard-flip-btn"),flashcardNextBtn=document.getElementById("flashcard-next-btn"),flashcardProgress=document.getElementById("flashcard-progress"),flashcardEmpty=document.getElementById("flashcard-empty"),quizProgress=document.getElementById("quiz-progress"),quizScoreEl=document.getElementById("quiz-score"),quizQuestionText=document.getElementById("quiz-question-text"),quizOptions=document.getElementById("quiz-options"),quizExplanation=document.getElementById("quiz-explanation"),quizNextBtn=document.getElementById("quiz-next-btn"),quizEmpty=document.getElementById("quiz-empty"),pricingOverlay=document.getElementById("pricing-overlay"),pricingModalClose=document.getElementById("pricing-modal-close"),historyOverlay=document.getElementById("history-overlay"),historyModalClose=document.getElementById("history-modal-close"),historyList=document.getElementById("history-list"),toast=document.getElementById("toast"),toastIcon=document.getElementById("toast-icon"),toastText=document.getElementById("toast-text");function localDateString(e){const t=e?new Date(e):new Date,n=t.getFullYear(),o=String(t.getMonth()+1).padStart(2,"0"),s=String(t.getDate()).padStart(2,"0");return`${n}-${o}-${s}`}const htmlUtils=window.LectureProcessorHtml||{},escapeHtml=htmlUtils.escapeHtml||function(e){return String(e!=null?e:"").replace(/&/g,"&amp;").replace(/</g,"&lt;").replace(/>/g,"&gt;").replace(/"/g,"&quot;").replace(/'/g,"&#39;")},setSanitizedHtml=htmlUtils.setSanitizedHtml||function(e,t,n=null){if(!e)return;const o=String(t!=null?t:"");if(window.DOMPurify&&typeof window.DOMPurify.sanitize=="function"){e.innerHTML=window.DOMPurify.sanitize(o,n||{});return}e.textContent=o};function buildUserScopedCacheKey(e,t){const n=typeof t=="string"?t:t&&t.uid?String(t.uid):"",o=String(n||"").trim();return o?`${e}:${o}`:""}function readUiCacheJsonForUser(e,t,n){const o=buildUserScopedCacheKey(t,e);if(!o)return n;try{const s=localStorage.getItem(o);if(!s)return n;const r=JSON.parse(s);return r==null?n:r}catch(s){return n}}function writeUiCacheJsonForUser(e,t,n){const o=buildUserScopedCacheKey(t,e);if(!o)return n;try{localStorage.setItem(o,JSON.stringify(n))}catch(s){}return n}function formatCreditTypeLabel(e){const t=String(e||"").trim();return{lecture_credits_standard:"lecture credit",lecture_credits_extended:"lecture extended credit",slides_credits:"text extraction credit",interview_credits_short:"interview short credit",interview_credits_medium:"interview medium credit",interview_credits_long:"interview long credit"}[t]||t.replace(/_/g," ")}function formatCreditLedger(e){return!e||typeof e!="object"?"":Object.entries(e).map(([n,o])=>[formatCreditTypeLabel(n),Number(o||0)]).filter(([,n])=>Number.isFinite(n)&&n>0).map(([n,o])=>`${o} ${n}${o===1?"":"s"}`).join(" + ")}function buildBillingReceiptText(e){if(!e||typeof e!="object")return"";const t=formatCreditLedger(e.charged||{}),n=formatCreditLedger(e.refunded||{});return!t&&!n?"":t&&n?`Billing receipt: Charged ${t}. Refunded ${n}.`:t?`Billing receipt: Charged ${t}.`:`Billing receipt: Refunded ${n}.`}function renderBillingReceipt(e){if(currentBillingReceipt=e&&typeof e=="object"?e:null,!billingReceiptPanel)return;const t=buildBillingReceiptText(currentBillingReceipt);if(!t){billingReceiptPanel.textContent="",billingReceiptPanel.classList.remove("visible"),setHidden(billingReceiptPanel,!0);return}billingReceiptPanel.textContent=t,setHidden(billingReceiptPanel,!1),billingReceiptPanel.classList.add("visible")}function getDailyGoalStorage(e){if(progressUtils&&typeof progressUtils.readDailyGoalCache=="function")return progressUtils.readDailyGoalCache(e,progressUtils.DEFAULT_DAILY_GOAL||20);const t=parseInt(localStorage.getItem(`daily_goal_${e}`)||"20",10);return Number.isFinite(t)&&t>0?Math.min(t,500):20}function getProgressSummaryForHeader(e){const t=progressSummaryCache&&typeof progressSummaryCache=="object"?progressSummaryCache:{};if(progressUtils&&typeof progressUtils.buildSummary=="function")return progressUtils.buildSummary(t,getDailyGoalStorage(e));const n=Number(t.daily_goal||getDailyGoalStorage(e)||20);return{current_streak:Number(t.current_streak||0),due_today:Number(t.due_today||0),today_progress:Number(t.today_progress||0),daily_goal:Number.isFinite(n)&&n>0?n:20}}function refreshStudyHeaderMetrics(){if(!progressMenu||!progressButton||!progressStreakCount||!progressDueCount||!progressGoalText)return;if(!currentUser){setHidden(progressMenu,!0);return}const e=currentUser.uid,t=getProgressSummaryForHeader(e),n=t.current_streak,o=t.due_today;progressStreakCount.textContent=String(n),progressDueCount.textContent=String(o),progressGoalText.textContent=progressUtils&&typeof progressUtils.goalProgressText=="function"?progressUtils.goalProgressText(t,getDailyGoalStorage(e)):`${Math.min(t.today_progress,t.daily_goal)} / ${t.daily_goal}`,progressButton.title=`Streak ${n} days \xB7 ${o} due today \xB7 Goal ${progressGoalText.textContent}`,setHidden(progressMenu,!1)}async function fetchStudyProgressSummary(){if(currentUser)try{const e=await authenticatedFetch("/api/study-progress");if(!e.ok)return;const t=await e.json(),n=t&&t.summary&&typeof t.summary=="object"?t.summary:null;if(!n)return;if(progressSummaryCache=n,typeof n.daily_goal=="number"&&n.daily_goal>0)try{progressUtils&&typeof progressUtils.writeDailyGoalCache=="function"?progressUtils.writeDailyGoalCache(currentUser.uid,n.daily_goal):localStorage.setItem(`daily_goal_${currentUser.uid}`,String(n.daily_goal))}catch(o){}refreshStudyHeaderMetrics()}catch(e){console.warn("Could not fetch study progress summary:",e)}}let activeModalOverlay=null,modalStateStack=[],accountActionInFlight=!1,checkoutCooldownUntilMs=0,checkoutCooldownTimer=null,checkoutRequestInFlight=!1,uploadCooldownUntilMs=0,uploadCooldownTimer=null;function getModalContainer(e){return uxUtils.getModalContainer?uxUtils.getModalContainer(e):e?e.querySelector('[role="dialog"]')||e.firstElementChild||e:null}function getFocusableElements(e){if(uxUtils.getFocusableElements)return uxUtils.getFocusableElements(e);const t=getModalContainer(e);return t?Array.from(t.querySelectorAll('a[href],button:not([disabled]),textarea:not([disabled]),input:not([disabled]),select:not([disabled]),[tabindex]:not([tabindex="-1"])')).filter(o=>o.offsetParent!==null||o===document.activeElement):[]}function openOverlay(e){if(!e)return;modalStateStack.push({overlay:e,restore:document.activeElement}),e.classList.add("visible"),e.setAttribute("aria-hidden","false"),activeModalOverlay=e;const t=getFocusableElements(e);t.length&&setTimeout(()=>t[0].focus(),30)}function closeOverlay(e){if(!e)return;e.classList.remove("visible"),e.setAttribute("aria-hidden","true");let t=null;for(let n=modalStateStack.length-1;n>=0;n-=1)if(modalStateStack[n].overlay===e){t=modalStateStack[n].restore||null,modalStateStack.splice(n,1);break}if(activeModalOverlay=modalStateStack.length?modalStateStack[modalStateStack.length-1].overlay:null,t&&typeof t.focus=="function")try{t.focus()}catch(n){}}function getVisibleMenuItems(e,t="button:not([disabled])"){return uxUtils.getVisibleMenuItems?uxUtils.getVisibleMenuItems(e,t):e?Array.from(e.querySelectorAll(t)).filter(n=>(n.offsetParent!==null||n===document.activeElement)&&!n.disabled):[]}function focusMenuItem(e,t,n="first"){if(uxUtils.focusMenuItem){uxUtils.focusMenuItem(e,t,n);return}const o=getVisibleMenuItems(e,t);if(!o.length)return;if(n==="last"){o[o.length-1].focus();return}const s=o.indexOf(document.activeElement);if(n==="next"){o[(s+1+o.length)%o.length].focus();return}if(n==="prev"){o[(s-1+o.length)%o.length].focus();return}if(n==="active"){(o.find(i=>i.classList.contains("active")||i.getAttribute("aria-selected")==="true")||o[0]).focus();return}o[0].focus()}function setUserDropdownVisible(e){!userDropdown||!userButton||(userDropdown.classList.toggle("visible",e),userButton.setAttribute("aria-expanded",e?"true":"false"))}function setProgressDropdownVisible(e){!progressDropdown||!progressButton||(progressDropdown.classList.toggle("visible",e),progressButton.classList.toggle("open",e),progressButton.setAttribute("aria-expanded",e?"true":"false"))}function setDownloadDropdownVisible(e){downloadDropdownContent.classList.toggle("visible",e),downloadButton.setAttribute("aria-expanded",e?"true":"false")}function setMoreActionsDropdownVisible(e){moreActionsContent.classList.toggle("visible",e),moreActionsButton.setAttribute("aria-expanded",e?"true":"false")}function setAdvancedSettingsVisible(e){e||setOutputLanguageMenuVisible(!1),advancedSettingsBody.classList.toggle("visible",e),advancedSettingsToggle.classList.toggle("open",e),advancedSettingsToggle.setAttribute("aria-expanded",e?"true":"false"),advancedSettingsBody.setAttribute("aria-hidden",e?"false":"true")}function setAudioUrlAdvancedOpen(e){if(!audioUrlAdvanced||!audioUrlAdvancedToggle||!audioUrlAdvancedPanel)return;const t=!!e;audioUrlAdvanced.classList.toggle("is-open",t),audioUrlAdvancedToggle.setAttribute("aria-expanded",t?"true":"false"),audioUrlAdvancedPanel.setAttribute("aria-hidden",t?"false":"true")}function setOutputLanguageMenuVisible(e){outputLanguageMenu.classList.toggle("visible",e),outputLanguageButton.classList.toggle("open",e),outputLanguageButton.setAttribute("aria-expanded",e?"true":"false")}function setHeaderSidebarVisible(e){if(!headerSidebar||!headerSidebarBackdrop||!headerNavToggle)return;const t=!!e;headerSidebar.classList.toggle("visible",t),headerSidebarBackdrop.classList.toggle("visible",t),headerSidebar.setAttribute("aria-hidden",t?"false":"true"),headerNavToggle.setAttribute("aria-expanded",t?"true":"false"),document.body.classList.toggle("sidebar-open",t),!t&&headerPlannerGroup&&headerPlannerGroup.classList.remove("open")}function closeHeaderDropdowns(e){e!=="user"&&setUserDropdownVisible(!1),e!=="progress"&&setProgressDropdownVisible(!1),e!=="download"&&setDownloadDropdownVisible(!1),e!=="more-actions"&&setMoreActionsDropdownVisible(!1),e!=="language"&&setOutputLanguageMenuVisible(!1),e!=="sidebar"&&e!=="progress"&&setHeaderSidebarVisible(!1)}function showAuthModal(e="signin"){openOverlay(authOverlay),showAuthView(e),clearAuthErrors(),trackEvent("auth_modal_opened",{view:e||"signin"})}function hideAuthModal(){closeOverlay(authOverlay),clearAuthErrors(),signinForm.reset(),signupForm.reset(),resetForm.reset()}function showAuthView(e){signinView.classList.remove("active"),signupView.classList.remove("active"),resetView.classList.remove("active"),clearAuthErrors(),e==="signin"&&signinView.classList.add("active"),e==="signup"&&signupView.classList.add("active"),e==="reset"&&resetView.classList.add("active")}function clearAuthErrors(){[signinError,signupError,resetError,resetSuccess].forEach(e=>{e.classList.remove("visible"),e.textContent=""})}function showAuthError(e,t){e.textContent=t,e.classList.add("visible")}function getFirebaseErrorMessage(e){return{"auth/email-already-in-use":"This email is already registered. Please sign in instead.","auth/invalid-email":"Please enter a valid email address.","auth/weak-password":"Password should be at least 6 characters.","auth/user-not-found":"No account found with this email.","auth/wrong-password":"Incorrect password. Please try again.","auth/invalid-credential":"Invalid email or password. Please try again.","auth/too-many-requests":"Too many failed attempts. Please try again later.","auth/network-request-failed":"Network error. Please check your connection.","auth/internal-error":"Sign-in is temporarily unavailable right now. Please try again in a minute. If this keeps happening, contact support because the Firebase sign-in configuration likely needs to be redeployed."}[e.code]||e.message||"An error occurred. Please try again."}async function checkEmailAllowed(e){try{return await(await fetch("/api/verify-email",{method:"POST",headers:{"Content-Type":"application/json"},body:JSON.stringify({email:e})})).json()}catch(t){return{allowed:!1,message:"Could not verify email. Please try again."}}}async function signInWithEmail(e,t){try{const n=await checkEmailAllowed(e);if(!n.allowed){trackEvent("auth_failed",{method:"email",reason:"disallowed_email"}),showAuthError(signinError,n.message);return}await auth.signInWithEmailAndPassword(e,t),hideAuthModal(),showToast("Signed in successfully!","success"),trackEvent("auth_success",{method:"email"})}catch(n){trackEvent("auth_failed",{method:"email",reason:n.code||"unknown"}),captureClientError(n,"signin_email"),showAuthError(signinError,getFirebaseErrorMessage(n))}}async function signUpWithEmail(e,t){try{const n=await checkEmailAllowed(e);if(!n.allowed){trackEvent("auth_failed",{method:"signup_email",reason:"disallowed_email"}),showAuthError(signupError,n.message);return}await auth.createUserWithEmailAndPassword(e,t),hideAuthModal(),showToast("Account created successfully!","success"),trackEvent("auth_success",{method:"signup_email"})}catch(n){trackEvent("auth_failed",{method:"signup_email",reason:n.code||"unknown"}),captureClientError(n,"signup_email"),showAuthError(signupError,getFirebaseErrorMessage(n))}}async function signInWithGoogle(){const e=new firebase.auth.GoogleAuthProvider;try{const t=await auth.signInWithPopup(e),n=t.user.email||"",o=await checkEmailAllowed(n);if(!o.allowed){try{await t.user.delete()}catch(s){console.warn("Could not delete disallowed Google user immediately:",s)}await auth.signOut(),trackEvent("auth_failed",{method:"google",reason:"disallowed_email"}),showAuthError(signinView.classList.contains("active")?signinError:signupError,o.message);return}hideAuthModal(),showToast("Signed in successfully!","success"),trackEvent("auth_success",{method:"google"})}catch(t){trackEvent("auth_failed",{method:"google",reason:t.code||"unknown"}),captureClientError(t,"signin_google"),showAuthError(signinView.classList.contains("active")?signinError:signupError,getFirebaseErrorMessage(t))}}async function sendPasswordReset(e){try{await auth.sendPasswordResetEmail(e),resetSuccess.textContent="Password reset email sent! Check your inbox.",resetSuccess.classList.add("visible")}catch(t){showAuthError(resetError,getFirebaseErrorMessage(t))}}async function signOut(){try{await releaseImportedAudioToken({clearStatus:!0});try{await fetch("/api/session/logout",{method:"POST",credentials:"include"})}catch(e){}await auth.signOut(),showToast("Signed out","success")}catch(e){console.error(e),captureClientError(e,"fetch_user_data")}}async function fetchUserData(){if(currentUser)try{const e=await authenticatedFetch("/api/auth/user");if(!e.ok){(e.status===401||e.status===403)&&(currentUserIsAdmin=!1,userPreferences=null,closeLanguageOnboarding(),adminDashboardBtn&&setHidden(adminDashboardBtn,!0),userProfileLoaded=!1);return}const t=await e.json();userCredits=t.credits,userTotalProcessed=Number(t.total_processed||0),userHasCreatedStudyPack=!!(t.has_created_study_pack||userTotalProcessed>0),userProfileLoaded=!0,currentUserIsAdmin=!!t.is_admin,userPreferences=t.preferences&&typeof t.preferences=="object"?t.preferences:null,adminDashboardBtn&&setHidden(adminDashboardBtn,!currentUserIsAdmin),userPreferences&&applyPreferencesToOutputLanguage(userPreferences,{forceOnboardingOpen:!0}),updateCreditsDisplay(),await fetchStudyProgressSummary(),refreshStudyHeaderMetrics(),updateQuickstartVisibility()}catch(e){console.error(e),userProfileLoaded=!1}}function updateCreditsDisplay(){if(!userCredits)return;const e=userCredits.lecture_standard+userCredits.lecture_extended,t=userCredits.interview_short+userCredits.interview_medium+userCredits.interview_long,n=e+userCredits.slides+t;creditsCount&&(creditsCount.textContent=n),creditsDisplay&&creditsDisplay.setAttribute("data-tooltip",`Lecture ${e}, Text extraction ${userCredits.slides}, Interview ${t}, Total ${n}`),creditsTooltip&&setSanitizedHtml(creditsTooltip,`<div class="credit-tip-row"><span>Lecture</span><strong>${e}</strong></div>
+const runtimeConfig=window.LectureProcessorRuntime||{},sentryFrontendDsn=runtimeConfig.sentryFrontendDsn||"",sentryEnvironment=runtimeConfig.sentryEnvironment||"",sentryRelease=runtimeConfig.sentryRelease||"",sentryCaptureLocal=runtimeConfig.sentryCaptureLocal===!0,sentryLocalHostnames=new Set(["localhost","127.0.0.1","[::1]"]),sentryHostname=String(window.location.hostname||"").trim().toLowerCase(),sentryEnvironmentName=String(sentryEnvironment||"").trim().toLowerCase(),frontendSentryEnabled=!!window.Sentry&&!!sentryFrontendDsn&&(sentryCaptureLocal||!sentryLocalHostnames.has(sentryHostname)&&!sentryHostname.endsWith(".local"))&&sentryEnvironmentName!=="test"&&sentryEnvironmentName!=="testing";frontendSentryEnabled&&window.Sentry.init({dsn:sentryFrontendDsn,environment:sentryEnvironment||"production",release:sentryRelease||void 0,tracesSampleRate:0});const bootstrap=window.LectureProcessorBootstrap||{},auth=bootstrap.getAuth?bootstrap.getAuth():firebase.auth(),authUtils=window.LectureProcessorAuth||{},authClient=authUtils.createAuthClient?authUtils.createAuthClient(auth,{notSignedInMessage:"Please sign in"}):null,analyticsUtils=window.LectureProcessorIndexAnalytics||{},markdownUtils=window.LectureProcessorMarkdown||{},uxUtils=window.LectureProcessorUx||{},downloadUtils=window.LectureProcessorDownload||{},topbarUtils=window.LectureProcessorTopbar||{},progressUtils=window.LectureProcessorStudyProgressUtils||{},displayFormatUtils=window.LectureProcessorDisplayFormatUtils||{},runtimeJobUtils=window.LectureProcessorRuntimeJobUtils||{},audioImportUtils=window.LectureProcessorLectureAudioImportUtils||{},processingUi=window.LectureProcessorProcessingUi||{},progressFlowUtils=window.LectureProcessorIndexProgress||{},indexResultsUtils=window.LectureProcessorIndexResults||{},pageConfig=window.LectureProcessorPageConfig||{},forcedMode=["lecture-notes","slides-only","interview"].includes(String(pageConfig.forcedMode||"").trim())?String(pageConfig.forcedMode||"").trim():"",appShell=document.getElementById("app-shell"),analyticsPage=typeof analyticsUtils.resolveProcessingAnalyticsPage=="function"?analyticsUtils.resolveProcessingAnalyticsPage({forcedMode,pathname:window.location.pathname,shellPageKey:appShell?appShell.getAttribute("data-page-key"):""}):"processing",setHidden=typeof uxUtils.setHidden=="function"?uxUtils.setHidden:function(e,t){e&&(e.hidden=!!t)};function normalizeAudioImportUrl(e){return typeof audioImportUtils.normalizeAudioImportUrl=="function"?audioImportUtils.normalizeAudioImportUrl(e):String(e||"").trim()}function describeAudioImportRequest(e){if(typeof audioImportUtils.describeAudioImportRequest=="function")return audioImportUtils.describeAudioImportRequest(e);const t=e&&typeof e=="object"?e:{},n=String(t.mode||"").trim(),o=normalizeAudioImportUrl(t.url),s=!!t.hasLocalAudioFile,r=String(t.importedAudioToken||"").trim(),i=normalizeAudioImportUrl(t.importedAudioSourceUrl);return n!=="lecture-notes"&&n!=="interview"?{shouldImport:!1,reason:"unsupported-mode"}:o?s?{shouldImport:!1,reason:"local-audio-selected"}:r&&i===o?{shouldImport:!1,reason:"already-imported"}:r&&i&&i!==o?{shouldImport:!0,reason:"replace-imported-audio"}:{shouldImport:!0,reason:"import"}:{shouldImport:!1,reason:"empty-url"}}function formatDateLabel(e){if(typeof uxUtils.formatDate=="function")return uxUtils.formatDate(e);const t=e instanceof Date?e:new Date(e);if(Number.isNaN(t.getTime()))return"-";const n=navigator.language||"en-US";return t.toLocaleDateString(n,{day:"2-digit",month:"short",year:"numeric"})}function formatTimeLabel(e){if(typeof uxUtils.formatTime=="function")return uxUtils.formatTime(e);const t=e instanceof Date?e:new Date(e);if(Number.isNaN(t.getTime()))return"-";const n=navigator.language||"en-US";return t.toLocaleTimeString(n,{hour:"2-digit",minute:"2-digit"})}let currentUser=null,userCredits=null,idToken=null,currentUserIsAdmin=!1,pdfFile=null,audioFile=null,audioFileOrigin="upload",recordedAudioNeedsDownload=!1,currentJobId=null,pollInterval=null,pollFailures=0,pollMissingResponses=0,pollStartedAt=0,pollStatusEtag="",currentMode=forcedMode||"lecture-notes",resultMarkdown="",slideText="",transcript="",flashcards=[],testQuestions=[],activeResultsTab="notes",flashcardIndex=0,flashcardFlipped=!1,activeRuntimeJobs=[],runtimeJobsRefreshTimer=null,runtimeJobsRefreshInFlight=!1,notificationPermissionRequested=!1,notifiedTerminalJobIds=new Set,quizIndex=0,quizScore=0,quizAnswered=!1,studyGenerationError=null,currentStudyPackId=null,resultsLocked=!1,selectedStudyFeatures="both",selectedFlashcardAmount="20",selectedQuestionAmount="10",selectedInterviewFeatures=[],importedAudioToken="",importedAudioSizeBytes=0,importedAudioName="",importedAudioSourceUrl="",pendingAutoImportUrl="",audioImportInFlight=!1,audioImportRequestUrl="",recordingState="idle",recordingStream=null,mediaRecorder=null,recordingChunks=[],recordingMimeType="",recordingExtension="",recordingStartedAtMs=0,recordingElapsedMs=0,recordingTimer=null,recorderStatusMessage="",recorderStatusTone="info",discardNextRecordingResult=!1,languageOnboardingOpen=!1,languageOnboardingSaving=!1,userPreferences=null,languagePreferenceSaveTimer=null,suppressLanguagePreferencePersist=!1,interviewSummaryText="",interviewSectionsText="",interviewCombinedText="",currentBillingReceipt=null,exportCsvType="flashcards",progressSummaryCache=null,userTotalProcessed=0,userHasCreatedStudyPack=!1,userProfileLoaded=!1,trackedTerminalJobId="",otherAudioOpen=!1;const analyticsEndpoint="/api/lp-event",POLL_BASE_MS=2e3,POLL_MAX_MS=3e4,POLL_MAX_RUNTIME_MS=1800*1e3,POLL_LONG_WAIT_SECONDS=20,ACTIVE_RUNTIME_JOBS_CACHE_KEY="active_runtime_jobs",RUNTIME_JOBS_REFRESH_MS=12e3,DOWNLOAD_LABELS=Object.freeze({lectureNotes:"Lecture Notes",slideExtract:"Slide Extract",lectureTranscript:"Lecture Transcript",interviewTranscript:"Interview Transcription"}),OUTPUT_LANGUAGE_LABELS=Object.freeze({dutch:"\u{1F1F3}\u{1F1F1} Dutch",english:"\u{1F1EC}\u{1F1E7} English",spanish:"\u{1F1EA}\u{1F1F8} Spanish",french:"\u{1F1EB}\u{1F1F7} French",german:"\u{1F1E9}\u{1F1EA} German",chinese:"\u{1F1E8}\u{1F1F3} Chinese",other:"\u{1F310} Other"});function createAnalyticsSessionId(){try{if(window.crypto&&typeof window.crypto.randomUUID=="function")return window.crypto.randomUUID().replace(/[^A-Za-z0-9_-]/g,"").slice(0,64)}catch(e){}return`sess_${Date.now()}_${Math.random().toString(36).slice(2,12)}`}const analyticsSessionId=(()=>{const e="lp_analytics_session_id";try{const t=localStorage.getItem(e);if(t&&/^[A-Za-z0-9_-]{6,80}$/.test(t))return t;const n=createAnalyticsSessionId();return localStorage.setItem(e,n),n}catch(t){return createAnalyticsSessionId()}})();function captureClientError(e,t=""){if(!(!frontendSentryEnabled||!window.Sentry||!e)){if(t){window.Sentry.withScope(n=>{n.setTag("context",t),window.Sentry.captureException(e)});return}window.Sentry.captureException(e)}}function trackEvent(e,t={},n={}){const o=String(e||"").trim().toLowerCase();if(!o)return Promise.resolve(!1);const s={event:o,session_id:analyticsSessionId,page:analyticsPage,path:window.location.pathname,properties:Object.assign({},t||{},{mode:currentMode})},r=JSON.stringify(s);if(n.preferBeacon&&navigator.sendBeacon)try{const a=new Blob([r],{type:"application/json"});return Promise.resolve(navigator.sendBeacon(analyticsEndpoint,a))}catch(a){}const i={"Content-Type":"application/json"};return idToken&&(i.Authorization=`Bearer ${idToken}`),fetch(analyticsEndpoint,{method:"POST",headers:i,body:r,keepalive:!0}).then(a=>a.ok).catch(()=>!1)}const modeConfig={"lecture-notes":{description:"Upload lecture slides and audio to generate complete notes, flashcards, and practice tests from the same lecture.",creditCost:"Uses <strong>1 lecture credit</strong>",creditType:"lecture",needsPdf:!0,needsAudio:!0,pdfTitle:"Lecture Slides",pdfRequirement:"Required",pdfRequirementTone:"required",pdfHelper:"Required for lecture notes. Upload the slide deck used in the lecture.",audioTitle:"Lecture Recording",audioRequirement:"Required",audioRequirementTone:"required",audioHelper:"Required for lecture notes. LMS import counts as your audio source.",lmsImportTitle:"Import from lecture video URL",lmsImportHint:"Paste the normal lecture video page from your LMS first. Direct playlist links also work.",buttonText:"Process Lecture",resultTitle:"Study Dashboard",steps:[{num:1,label:"Extract Slides"},{num:2,label:"Transcribe Audio"},{num:3,label:"Merge Notes"},{num:4,label:"Build Study Tools"}]},"slides-only":{description:"Upload lecture slides (PDF or PPTX) to run slide extraction and generate clean text notes.",creditCost:"Uses <strong>1 text extraction credit</strong>",creditType:"slides",needsPdf:!0,needsAudio:!1,pdfTitle:"Lecture Slides",pdfRequirement:"Required",pdfRequirementTone:"required",pdfHelper:"Required in this mode. Audio is not used for slides extraction.",audioTitle:"Lecture Recording",audioRequirement:"Optional",audioRequirementTone:"optional",audioHelper:"Not used in this mode. Switch to Lecture Notes if you want slides and audio merged together.",lmsImportTitle:"Import from lecture video URL",lmsImportHint:"Only needed in Lecture Notes mode.",buttonText:"Extract Slides",resultTitle:"Study Dashboard",steps:[{num:1,label:"Extract Text"},{num:2,label:"Build Study Tools"}]},interview:{description:"Upload an interview recording to generate a timestamped transcript with speaker identification.",creditCost:"Uses <strong>1 interview credit</strong> (+ <strong>1 text extraction credit</strong> per selected extra)",creditType:"interview",needsPdf:!1,needsAudio:!0,pdfTitle:"Lecture Slides",pdfRequirement:"Optional",pdfRequirementTone:"optional",pdfHelper:"Slides are not used in interview mode.",audioTitle:"Interview Recording",audioRequirement:"Required",audioRequirementTone:"required",audioHelper:"Required in this mode. Upload the source audio you want transcribed.",lmsImportTitle:"Import from lecture video URL",lmsImportHint:"Use this only when the interview audio is hosted on a supported lecture video page or direct playlist URL.",buttonText:"Run Interview Transcription",resultTitle:"Interview Transcription",steps:[{num:1,label:"Transcribe"}]}},UPLOAD_ESTIMATE_COPY=Object.freeze({"lecture-notes":"A 60-minute lecture usually finishes in about 5 minutes. Longer or noisy recordings can take longer.","slides-only":"Most slide extractions finish within a couple of minutes. Large or image-heavy decks can take longer.",interview:"Most interview transcripts finish within a few minutes. Summary and structured transcript extras add more time."}),allowedSlideExtensions=[".pdf",".pptx"],allowedSlideMimeTypes=["application/pdf","application/vnd.openxmlformats-officedocument.presentationml.presentation","application/vnd.ms-powerpoint","application/octet-stream",""],headerSignInBtn=document.getElementById("header-sign-in-btn"),headerNavToggle=document.getElementById("header-nav-toggle"),headerSidebar=document.getElementById("header-sidebar"),headerSidebarBackdrop=document.getElementById("header-sidebar-backdrop"),headerSidebarClose=document.getElementById("header-sidebar-close"),headerStudyLibraryBtn=document.getElementById("header-study-library-btn"),headerFeaturesBtn=document.getElementById("header-features-btn"),headerToolsBtn=document.getElementById("header-tools-btn"),headerPlannerBtn=document.getElementById("header-planner-btn"),headerPlannerGroup=document.getElementById("header-planner-group"),headerPlannerSubmenu=document.getElementById("header-planner-submenu"),headerCalendarBtn=document.getElementById("header-calendar-btn"),progressMenu=document.getElementById("progress-menu"),progressButton=document.getElementById("progress-button"),progressDropdown=document.getElementById("progress-dropdown"),progressStreakCount=document.getElementById("progress-streak-count"),progressDueCount=document.getElementById("progress-due-count"),progressGoalText=document.getElementById("progress-goal-text"),progressSetGoalBtn=document.getElementById("progress-set-goal-btn"),progressOpenCalendarBtn=document.getElementById("progress-open-calendar-btn"),progressOpenPlanBtn=document.getElementById("progress-open-plan-btn"),goalModalOverlay=document.getElementById("goal-modal-overlay"),goalModalInput=document.getElementById("goal-modal-input"),goalModalError=document.getElementById("goal-modal-error"),goalModalCancelBtn=document.getElementById("goal-modal-cancel-btn"),goalModalSaveBtn=document.getElementById("goal-modal-save-btn"),deleteAccountOverlay=document.getElementById("delete-account-overlay"),deleteAccountClose=document.getElementById("delete-account-close"),deleteAccountCancelBtn=document.getElementById("delete-account-cancel-btn"),deleteAccountConfirmBtn=document.getElementById("delete-account-confirm-btn"),deleteAccountTextInput=document.getElementById("delete-account-text-input"),deleteAccountEmailInput=document.getElementById("delete-account-email-input"),deleteAccountError=document.getElementById("delete-account-error"),creditsDisplay=document.getElementById("credits-display"),creditsCount=document.getElementById("credits-count"),creditsTooltip=document.getElementById("credits-tooltip"),userMenu=document.getElementById("user-menu"),userButton=document.getElementById("user-button"),userDropdown=document.getElementById("user-dropdown"),userAvatar=document.getElementById("user-avatar"),userName=document.getElementById("user-name"),userEmail=document.getElementById("user-email"),dropdownLectureCredits=document.getElementById("dropdown-lecture-credits"),dropdownSlidesCredits=document.getElementById("dropdown-slides-credits"),dropdownInterviewCredits=document.getElementById("dropdown-interview-credits"),buyCreditsBtn=document.getElementById("buy-credits-btn"),purchaseHistoryBtn=document.getElementById("purchase-history-btn"),exportDataBtn=document.getElementById("export-data-btn"),adminDashboardBtn=document.getElementById("admin-dashboard-btn"),deleteAccountBtn=document.getElementById("delete-account-btn"),signOutBtn=document.getElementById("sign-out-btn"),authOverlay=document.getElementById("auth-overlay"),authModalClose=document.getElementById("auth-modal-close"),signinView=document.getElementById("signin-view"),signupView=document.getElementById("signup-view"),resetView=document.getElementById("reset-view"),signinForm=document.getElementById("signin-form"),signupForm=document.getElementById("signup-form"),resetForm=document.getElementById("reset-form"),signinEmail=document.getElementById("signin-email"),signinPassword=document.getElementById("signin-password"),signupEmail=document.getElementById("signup-email"),signupPassword=document.getElementById("signup-password"),signupPasswordConfirm=document.getElementById("signup-password-confirm"),resetEmail=document.getElementById("reset-email"),signinError=document.getElementById("signin-error"),signupError=document.getElementById("signup-error"),resetError=document.getElementById("reset-error"),resetSuccess=document.getElementById("reset-success"),googleSignInBtn=document.getElementById("google-sign-in-btn"),googleSignUpBtn=document.getElementById("google-sign-up-btn"),switchToSignup=document.getElementById("switch-to-signup"),switchToSignin=document.getElementById("switch-to-signin"),forgotPasswordLink=document.getElementById("forgot-password-link"),backToSignin=document.getElementById("back-to-signin"),signInRequired=document.getElementById("sign-in-required"),signInToProcessBtn=document.getElementById("sign-in-to-process-btn"),studyPackTitleInput=document.getElementById("study-pack-title-input"),modeTabs=document.querySelectorAll(".mode-tab"),modeDescriptionText=document.getElementById("mode-description-text"),modeCreditCost=document.getElementById("mode-credit-cost"),modeCostSummary=document.getElementById("mode-cost-summary"),uploadEstimate=document.getElementById("upload-estimate"),uploadEstimateTime=document.getElementById("upload-estimate-time"),uploadEstimateMeta=document.getElementById("upload-estimate-meta"),uploadSection=document.getElementById("upload-section"),buttonSection=document.getElementById("button-section"),mobileProcessSummary=document.getElementById("mobile-process-summary"),generationControls=document.getElementById("generation-controls"),interviewControls=document.getElementById("interview-controls"),languageControls=document.getElementById("language-controls"),quickstartCard=document.getElementById("quickstart-card"),quickstartApplyBtn=document.getElementById("quickstart-apply-btn"),quickstartDismissBtn=document.getElementById("quickstart-dismiss-btn"),advancedSettingsToggle=document.getElementById("advanced-settings-toggle"),advancedSettingsBody=document.getElementById("advanced-settings-body"),advancedSettingsSummary=document.getElementById("advanced-settings-summary"),studyToolsToggle=document.getElementById("study-tools-toggle"),studyToolsToggleText=document.getElementById("study-tools-toggle-text"),studyToolsPanel=document.getElementById("study-tools-panel"),studyToolsNote=document.getElementById("study-tools-note"),flashcardAmountControl=document.getElementById("flashcard-amount-control"),questionAmountControl=document.getElementById("question-amount-control"),studyToolChips=document.querySelectorAll(".tool-chip[data-study-features]"),flashcardAmountChips=document.querySelectorAll("#flashcard-amount-chips .amount-chip"),questionAmountChips=document.querySelectorAll("#question-amount-chips .amount-chip"),interviewOptionButtons=document.querySelectorAll(".interview-option[data-feature]"),interviewExtraNote=document.getElementById("interview-extra-note"),outputLanguageSelect=document.getElementById("output-language-select"),outputLanguagePicker=document.getElementById("output-language-picker"),outputLanguageButton=document.getElementById("output-language-button"),outputLanguageLabel=document.getElementById("output-language-label"),outputLanguageMenu=document.getElementById("output-language-menu"),outputLanguageItems=document.querySelectorAll("#output-language-menu .app-select-item"),outputLanguageCustom=document.getElementById("output-language-custom"),pdfZone=document.getElementById("pdf-zone"),audioZone=document.getElementById("audio-zone"),pdfZoneTitle=document.getElementById("pdf-zone-title"),pdfZoneBadge=document.getElementById("pdf-zone-badge"),pdfZoneHelper=document.getElementById("pdf-zone-helper"),audioZoneTitle=document.getElementById("audio-zone-title"),audioZoneBadge=document.getElementById("audio-zone-badge"),audioZoneHelper=document.getElementById("audio-zone-helper"),pdfInput=document.getElementById("pdf-input"),audioInput=document.getElementById("audio-input"),pdfInfo=document.getElementById("pdf-info"),audioInfo=document.getElementById("audio-info"),pdfName=document.getElementById("pdf-name"),pdfSize=document.getElementById("pdf-size"),audioName=document.getElementById("audio-name"),audioSize=document.getElementById("audio-size"),pdfRemove=document.getElementById("pdf-remove"),audioRemove=document.getElementById("audio-remove"),audioUrlImport=document.getElementById("audio-url-import"),audioUrlImportTitle=document.getElementById("audio-url-import-title"),audioUrlImportHint=document.getElementById("audio-url-import-hint"),audioUrlAdvanced=document.getElementById("audio-url-advanced"),audioUrlAdvancedToggle=document.getElementById("audio-url-advanced-toggle"),audioUrlAdvancedPanel=document.getElementById("audio-url-advanced-panel"),otherAudioDisclosure=document.getElementById("other-audio-disclosure"),otherAudioToggle=document.getElementById("other-audio-toggle"),otherAudioBody=document.getElementById("other-audio-body"),otherAudioSummary=document.getElementById("other-audio-summary"),audioUrlInput=document.getElementById("audio-url-input"),audioUrlFetchBtn=document.getElementById("audio-url-fetch-btn"),audioUrlStatus=document.getElementById("audio-url-status"),audioRecorderPanel=document.getElementById("audio-recorder-panel"),audioRecordStartBtn=document.getElementById("audio-record-start"),audioRecordPauseBtn=document.getElementById("audio-record-pause"),audioRecordStopBtn=document.getElementById("audio-record-stop"),audioRecorderTimer=document.getElementById("audio-recorder-timer"),audioRecordingStatus=document.getElementById("audio-recording-status"),audioRecordingWarning=document.getElementById("audio-recording-warning"),languageOnboardingOverlay=document.getElementById("language-onboarding-overlay"),languageOnboardingGrid=document.getElementById("language-onboarding-grid"),languageOnboardingButtons=document.querySelectorAll("#language-onboarding-grid .onboarding-language-btn"),languageOnboardingCustom=document.getElementById("language-onboarding-custom"),languageOnboardingError=document.getElementById("language-onboarding-error"),languageOnboardingSaveBtn=document.getElementById("language-onboarding-save-btn"),processButton=document.getElementById("process-button"),noCreditsWarning=document.getElementById("no-credits-warning"),buyCreditsLink=document.getElementById("buy-credits-link"),progressSection=document.getElementById("progress-section"),progressSteps=document.getElementById("progress-steps"),progressStatus=document.getElementById("progress-status"),statusText=document.getElementById("status-text"),progressSpinner=progressStatus?progressStatus.querySelector(".spinner"):null,progressSafeBanner=document.getElementById("progress-safe-banner"),progressRetry=document.getElementById("progress-retry"),progressRetryBtn=document.getElementById("progress-retry-btn"),resultsSection=document.getElementById("results-section"),resultsTitleText=document.getElementById("results-title-text"),resultsContent=document.getElementById("results-content"),studyWarning=document.getElementById("study-warning"),billingReceiptPanel=document.getElementById("billing-receipt"),copyButton=document.getElementById("copy-button"),copyButtonText=document.getElementById("copy-button-text"),downloadButton=document.getElementById("download-button"),downloadDropdown=document.getElementById("download-dropdown"),downloadDropdownContent=document.getElementById("download-dropdown-content"),moreActionsDropdown=document.getElementById("more-actions-dropdown"),moreActionsButton=document.getElementById("more-actions-button"),moreActionsContent=document.getElementById("more-actions-content"),exportStudyCsvBtn=document.getElementById("export-study-csv-btn"),exportStudyCsvText=document.getElementById("export-study-csv-text"),studyNowBtn=document.getElementById("study-now-btn"),studyLibraryBtn=document.getElementById("study-library-btn"),newLectureButton=document.getElementById("new-lecture-button"),tabButtons=document.querySelectorAll(".focus-tab"),tabFlashcards=document.getElementById("tab-flashcards"),tabTest=document.getElementById("tab-test"),paneNotes=document.getElementById("pane-notes"),paneFlashcards=document.getElementById("pane-flashcards"),paneTest=document.getElementById("pane-test"),flashcardCountBadge=document.getElementById("flashcard-count-badge"),testCountBadge=document.getElementById("test-count-badge"),flashcardCard=document.getElementById("flashcard-card"),flashcardInner=document.getElementById("flashcard-inner"),flashcardFrontText=document.getElementById("flashcard-front-text"),flashcardBackText=document.getElementById("flashcard-back-text"),flashcardPrevBtn=document.getElementById("flashcard-prev-btn"),flashcardFlipBtn=document.getElementById("flashcard-flip-btn"),flashcardNextBtn=document.getElementById("flashcard-next-btn"),flashcardProgress=document.getElementById("flashcard-progress"),flashcardEmpty=document.getElementById("flashcard-empty"),quizProgress=document.getElementById("quiz-progress"),quizScoreEl=document.getElementById("quiz-score"),quizQuestionText=document.getElementById("quiz-question-text"),quizOptions=document.getElementById("quiz-options"),quizExplanation=document.getElementById("quiz-explanation"),quizNextBtn=document.getElementById("quiz-next-btn"),quizEmpty=document.getElementById("quiz-empty"),pricingOverlay=document.getElementById("pricing-overlay"),pricingModalClose=document.getElementById("pricing-modal-close"),historyOverlay=document.getElementById("history-overlay"),historyModalClose=document.getElementById("history-modal-close"),historyList=document.getElementById("history-list"),toast=document.getElementById("toast"),toastIcon=document.getElementById("toast-icon"),toastText=document.getElementById("toast-text");function localDateString(e){const t=e?new Date(e):new Date,n=t.getFullYear(),o=String(t.getMonth()+1).padStart(2,"0"),s=String(t.getDate()).padStart(2,"0");return`${n}-${o}-${s}`}const htmlUtils=window.LectureProcessorHtml||{},escapeHtml=htmlUtils.escapeHtml||function(e){return String(e!=null?e:"").replace(/&/g,"&amp;").replace(/</g,"&lt;").replace(/>/g,"&gt;").replace(/"/g,"&quot;").replace(/'/g,"&#39;")},setSanitizedHtml=htmlUtils.setSanitizedHtml||function(e,t,n=null){if(!e)return;const o=String(t!=null?t:"");if(window.DOMPurify&&typeof window.DOMPurify.sanitize=="function"){e.innerHTML=window.DOMPurify.sanitize(o,n||{});return}e.textContent=o};function buildUserScopedCacheKey(e,t){const n=typeof t=="string"?t:t&&t.uid?String(t.uid):"",o=String(n||"").trim();return o?`${e}:${o}`:""}function readUiCacheJsonForUser(e,t,n){const o=buildUserScopedCacheKey(t,e);if(!o)return n;try{const s=localStorage.getItem(o);if(!s)return n;const r=JSON.parse(s);return r==null?n:r}catch(s){return n}}function writeUiCacheJsonForUser(e,t,n){const o=buildUserScopedCacheKey(t,e);if(!o)return n;try{localStorage.setItem(o,JSON.stringify(n))}catch(s){}return n}function formatCreditTypeLabel(e){const t=String(e||"").trim();return{lecture_credits_standard:"lecture credit",lecture_credits_extended:"lecture extended credit",slides_credits:"text extraction credit",interview_credits_short:"interview short credit",interview_credits_medium:"interview medium credit",interview_credits_long:"interview long credit"}[t]||t.replace(/_/g," ")}function formatCreditLedger(e){return!e||typeof e!="object"?"":Object.entries(e).map(([n,o])=>[formatCreditTypeLabel(n),Number(o||0)]).filter(([,n])=>Number.isFinite(n)&&n>0).map(([n,o])=>`${o} ${n}${o===1?"":"s"}`).join(" + ")}function buildBillingReceiptText(e){if(!e||typeof e!="object")return"";const t=formatCreditLedger(e.charged||{}),n=formatCreditLedger(e.refunded||{});return!t&&!n?"":t&&n?`Billing receipt: Charged ${t}. Refunded ${n}.`:t?`Billing receipt: Charged ${t}.`:`Billing receipt: Refunded ${n}.`}function renderBillingReceipt(e){if(currentBillingReceipt=e&&typeof e=="object"?e:null,!billingReceiptPanel)return;const t=buildBillingReceiptText(currentBillingReceipt);if(!t){billingReceiptPanel.textContent="",billingReceiptPanel.classList.remove("visible"),setHidden(billingReceiptPanel,!0);return}billingReceiptPanel.textContent=t,setHidden(billingReceiptPanel,!1),billingReceiptPanel.classList.add("visible")}function getDailyGoalStorage(e){if(progressUtils&&typeof progressUtils.readDailyGoalCache=="function")return progressUtils.readDailyGoalCache(e,progressUtils.DEFAULT_DAILY_GOAL||20);const t=parseInt(localStorage.getItem(`daily_goal_${e}`)||"20",10);return Number.isFinite(t)&&t>0?Math.min(t,500):20}function getProgressSummaryForHeader(e){const t=progressSummaryCache&&typeof progressSummaryCache=="object"?progressSummaryCache:{};if(progressUtils&&typeof progressUtils.buildSummary=="function")return progressUtils.buildSummary(t,getDailyGoalStorage(e));const n=Number(t.daily_goal||getDailyGoalStorage(e)||20);return{current_streak:Number(t.current_streak||0),due_today:Number(t.due_today||0),today_progress:Number(t.today_progress||0),daily_goal:Number.isFinite(n)&&n>0?n:20}}function refreshStudyHeaderMetrics(){if(!progressMenu||!progressButton||!progressStreakCount||!progressDueCount||!progressGoalText)return;if(!currentUser){setHidden(progressMenu,!0);return}const e=currentUser.uid,t=getProgressSummaryForHeader(e),n=t.current_streak,o=t.due_today;progressStreakCount.textContent=String(n),progressDueCount.textContent=String(o),progressGoalText.textContent=progressUtils&&typeof progressUtils.goalProgressText=="function"?progressUtils.goalProgressText(t,getDailyGoalStorage(e)):`${Math.min(t.today_progress,t.daily_goal)} / ${t.daily_goal}`,progressButton.title=`Streak ${n} days \xB7 ${o} due today \xB7 Goal ${progressGoalText.textContent}`,setHidden(progressMenu,!1)}async function fetchStudyProgressSummary(){if(currentUser)try{const e=await authenticatedFetch("/api/study-progress");if(!e.ok)return;const t=await e.json(),n=t&&t.summary&&typeof t.summary=="object"?t.summary:null;if(!n)return;if(progressSummaryCache=n,typeof n.daily_goal=="number"&&n.daily_goal>0)try{progressUtils&&typeof progressUtils.writeDailyGoalCache=="function"?progressUtils.writeDailyGoalCache(currentUser.uid,n.daily_goal):localStorage.setItem(`daily_goal_${currentUser.uid}`,String(n.daily_goal))}catch(o){}refreshStudyHeaderMetrics()}catch(e){console.warn("Could not fetch study progress summary:",e)}}let activeModalOverlay=null,modalStateStack=[],accountActionInFlight=!1,checkoutCooldownUntilMs=0,checkoutCooldownTimer=null,checkoutRequestInFlight=!1,uploadCooldownUntilMs=0,uploadCooldownTimer=null;function getModalContainer(e){return uxUtils.getModalContainer?uxUtils.getModalContainer(e):e?e.querySelector('[role="dialog"]')||e.firstElementChild||e:null}function getFocusableElements(e){if(uxUtils.getFocusableElements)return uxUtils.getFocusableElements(e);const t=getModalContainer(e);return t?Array.from(t.querySelectorAll('a[href],button:not([disabled]),textarea:not([disabled]),input:not([disabled]),select:not([disabled]),[tabindex]:not([tabindex="-1"])')).filter(o=>o.offsetParent!==null||o===document.activeElement):[]}function openOverlay(e){if(!e)return;modalStateStack.push({overlay:e,restore:document.activeElement}),e.classList.add("visible"),e.setAttribute("aria-hidden","false"),activeModalOverlay=e;const t=getFocusableElements(e);t.length&&setTimeout(()=>t[0].focus(),30)}function closeOverlay(e){if(!e)return;e.classList.remove("visible"),e.setAttribute("aria-hidden","true");let t=null;for(let n=modalStateStack.length-1;n>=0;n-=1)if(modalStateStack[n].overlay===e){t=modalStateStack[n].restore||null,modalStateStack.splice(n,1);break}if(activeModalOverlay=modalStateStack.length?modalStateStack[modalStateStack.length-1].overlay:null,t&&typeof t.focus=="function")try{t.focus()}catch(n){}}function getVisibleMenuItems(e,t="button:not([disabled])"){return uxUtils.getVisibleMenuItems?uxUtils.getVisibleMenuItems(e,t):e?Array.from(e.querySelectorAll(t)).filter(n=>(n.offsetParent!==null||n===document.activeElement)&&!n.disabled):[]}function focusMenuItem(e,t,n="first"){if(uxUtils.focusMenuItem){uxUtils.focusMenuItem(e,t,n);return}const o=getVisibleMenuItems(e,t);if(!o.length)return;if(n==="last"){o[o.length-1].focus();return}const s=o.indexOf(document.activeElement);if(n==="next"){o[(s+1+o.length)%o.length].focus();return}if(n==="prev"){o[(s-1+o.length)%o.length].focus();return}if(n==="active"){(o.find(i=>i.classList.contains("active")||i.getAttribute("aria-selected")==="true")||o[0]).focus();return}o[0].focus()}function setUserDropdownVisible(e){!userDropdown||!userButton||(userDropdown.classList.toggle("visible",e),userButton.setAttribute("aria-expanded",e?"true":"false"))}function setProgressDropdownVisible(e){!progressDropdown||!progressButton||(progressDropdown.classList.toggle("visible",e),progressButton.classList.toggle("open",e),progressButton.setAttribute("aria-expanded",e?"true":"false"))}function setDownloadDropdownVisible(e){downloadDropdownContent.classList.toggle("visible",e),downloadButton.setAttribute("aria-expanded",e?"true":"false")}function setMoreActionsDropdownVisible(e){moreActionsContent.classList.toggle("visible",e),moreActionsButton.setAttribute("aria-expanded",e?"true":"false")}function setAdvancedSettingsVisible(e){e||setOutputLanguageMenuVisible(!1),advancedSettingsBody.classList.toggle("visible",e),advancedSettingsToggle.classList.toggle("open",e),advancedSettingsToggle.setAttribute("aria-expanded",e?"true":"false"),advancedSettingsBody.setAttribute("aria-hidden",e?"false":"true")}function setAudioUrlAdvancedOpen(e){if(!audioUrlAdvanced||!audioUrlAdvancedToggle||!audioUrlAdvancedPanel)return;const t=!!e;audioUrlAdvanced.classList.toggle("is-open",t),audioUrlAdvancedToggle.setAttribute("aria-expanded",t?"true":"false"),audioUrlAdvancedPanel.setAttribute("aria-hidden",t?"false":"true")}function setOutputLanguageMenuVisible(e){outputLanguageMenu.classList.toggle("visible",e),outputLanguageButton.classList.toggle("open",e),outputLanguageButton.setAttribute("aria-expanded",e?"true":"false")}function setHeaderSidebarVisible(e){if(!headerSidebar||!headerSidebarBackdrop||!headerNavToggle)return;const t=!!e;headerSidebar.classList.toggle("visible",t),headerSidebarBackdrop.classList.toggle("visible",t),headerSidebar.setAttribute("aria-hidden",t?"false":"true"),headerNavToggle.setAttribute("aria-expanded",t?"true":"false"),document.body.classList.toggle("sidebar-open",t),!t&&headerPlannerGroup&&headerPlannerGroup.classList.remove("open")}function closeHeaderDropdowns(e){e!=="user"&&setUserDropdownVisible(!1),e!=="progress"&&setProgressDropdownVisible(!1),e!=="download"&&setDownloadDropdownVisible(!1),e!=="more-actions"&&setMoreActionsDropdownVisible(!1),e!=="language"&&setOutputLanguageMenuVisible(!1),e!=="sidebar"&&e!=="progress"&&setHeaderSidebarVisible(!1)}function showAuthModal(e="signin"){openOverlay(authOverlay),showAuthView(e),clearAuthErrors(),trackEvent("auth_modal_opened",{view:e||"signin"})}function hideAuthModal(){closeOverlay(authOverlay),clearAuthErrors(),signinForm.reset(),signupForm.reset(),resetForm.reset()}function showAuthView(e){signinView.classList.remove("active"),signupView.classList.remove("active"),resetView.classList.remove("active"),clearAuthErrors(),e==="signin"&&signinView.classList.add("active"),e==="signup"&&signupView.classList.add("active"),e==="reset"&&resetView.classList.add("active")}function clearAuthErrors(){[signinError,signupError,resetError,resetSuccess].forEach(e=>{e.classList.remove("visible"),e.textContent=""})}function showAuthError(e,t){e.textContent=t,e.classList.add("visible")}function getFirebaseErrorMessage(e){return{"auth/email-already-in-use":"This email is already registered. Please sign in instead.","auth/invalid-email":"Please enter a valid email address.","auth/weak-password":"Password should be at least 6 characters.","auth/user-not-found":"No account found with this email.","auth/wrong-password":"Incorrect password. Please try again.","auth/invalid-credential":"Invalid email or password. Please try again.","auth/too-many-requests":"Too many failed attempts. Please try again later.","auth/network-request-failed":"Network error. Please check your connection.","auth/internal-error":"Sign-in is temporarily unavailable right now. Please try again in a minute. If this keeps happening, contact support because the Firebase sign-in configuration likely needs to be redeployed."}[e.code]||e.message||"An error occurred. Please try again."}async function checkEmailAllowed(e){try{return await(await fetch("/api/verify-email",{method:"POST",headers:{"Content-Type":"application/json"},body:JSON.stringify({email:e})})).json()}catch(t){return{allowed:!1,message:"Could not verify email. Please try again."}}}async function signInWithEmail(e,t){try{const n=await checkEmailAllowed(e);if(!n.allowed){trackEvent("auth_failed",{method:"email",reason:"disallowed_email"}),showAuthError(signinError,n.message);return}await auth.signInWithEmailAndPassword(e,t),hideAuthModal(),showToast("Signed in successfully!","success"),trackEvent("auth_success",{method:"email"})}catch(n){trackEvent("auth_failed",{method:"email",reason:n.code||"unknown"}),captureClientError(n,"signin_email"),showAuthError(signinError,getFirebaseErrorMessage(n))}}async function signUpWithEmail(e,t){try{const n=await checkEmailAllowed(e);if(!n.allowed){trackEvent("auth_failed",{method:"signup_email",reason:"disallowed_email"}),showAuthError(signupError,n.message);return}await auth.createUserWithEmailAndPassword(e,t),hideAuthModal(),showToast("Account created successfully!","success"),trackEvent("auth_success",{method:"signup_email"})}catch(n){trackEvent("auth_failed",{method:"signup_email",reason:n.code||"unknown"}),captureClientError(n,"signup_email"),showAuthError(signupError,getFirebaseErrorMessage(n))}}async function signInWithGoogle(){const e=new firebase.auth.GoogleAuthProvider;try{const t=await auth.signInWithPopup(e),n=t.user.email||"",o=await checkEmailAllowed(n);if(!o.allowed){try{await t.user.delete()}catch(s){console.warn("Could not delete disallowed Google user immediately:",s)}await auth.signOut(),trackEvent("auth_failed",{method:"google",reason:"disallowed_email"}),showAuthError(signinView.classList.contains("active")?signinError:signupError,o.message);return}hideAuthModal(),showToast("Signed in successfully!","success"),trackEvent("auth_success",{method:"google"})}catch(t){trackEvent("auth_failed",{method:"google",reason:t.code||"unknown"}),captureClientError(t,"signin_google"),showAuthError(signinView.classList.contains("active")?signinError:signupError,getFirebaseErrorMessage(t))}}async function sendPasswordReset(e){try{await auth.sendPasswordResetEmail(e),resetSuccess.textContent="Password reset email sent! Check your inbox.",resetSuccess.classList.add("visible")}catch(t){showAuthError(resetError,getFirebaseErrorMessage(t))}}async function signOut(){try{await releaseImportedAudioToken({clearStatus:!0});try{await fetch("/api/session/logout",{method:"POST",credentials:"include"})}catch(e){}await auth.signOut(),showToast("Signed out","success")}catch(e){console.error(e),captureClientError(e,"fetch_user_data")}}async function fetchUserData(){if(currentUser)try{const e=await authenticatedFetch("/api/auth/user");if(!e.ok){(e.status===401||e.status===403)&&(currentUserIsAdmin=!1,userPreferences=null,closeLanguageOnboarding(),adminDashboardBtn&&setHidden(adminDashboardBtn,!0),userProfileLoaded=!1);return}const t=await e.json();userCredits=t.credits,userTotalProcessed=Number(t.total_processed||0),userHasCreatedStudyPack=!!(t.has_created_study_pack||userTotalProcessed>0),userProfileLoaded=!0,currentUserIsAdmin=!!t.is_admin,userPreferences=t.preferences&&typeof t.preferences=="object"?t.preferences:null,adminDashboardBtn&&setHidden(adminDashboardBtn,!currentUserIsAdmin),userPreferences&&applyPreferencesToOutputLanguage(userPreferences,{forceOnboardingOpen:!0}),updateCreditsDisplay(),await fetchStudyProgressSummary(),refreshStudyHeaderMetrics(),updateQuickstartVisibility()}catch(e){console.error(e),userProfileLoaded=!1}}function updateCreditsDisplay(){if(!userCredits)return;const e=userCredits.lecture_standard+userCredits.lecture_extended,t=userCredits.interview_short+userCredits.interview_medium+userCredits.interview_long,n=e+userCredits.slides+t;creditsCount&&(creditsCount.textContent=n),creditsDisplay&&creditsDisplay.setAttribute("data-tooltip",`Lecture ${e}, Text extraction ${userCredits.slides}, Interview ${t}, Total ${n}`),creditsTooltip&&setSanitizedHtml(creditsTooltip,`<div class="credit-tip-row"><span>Lecture</span><strong>${e}</strong></div>
              <div class="credit-tip-row"><span>Text extraction</span><strong>${userCredits.slides}</strong></div>
              <div class="credit-tip-row"><span>Interview</span><strong>${t}</strong></div>
-             <div class="credit-tip-row total"><span>Total</span><strong>${n}</strong></div>`),dropdownLectureCredits&&(dropdownLectureCredits.textContent=e),dropdownSlidesCredits&&(dropdownSlidesCredits.textContent=userCredits.slides),dropdownInterviewCredits&&(dropdownInterviewCredits.textContent=t),updateInterviewOptionAvailability(),updateModeCostSummary(),updateProcessButton(),refreshStudyHeaderMetrics()}function getTotalInterviewCredits(){return userCredits?userCredits.interview_short+userCredits.interview_medium+userCredits.interview_long:0}function getInterviewExtraCost(){return currentMode==="interview"?selectedInterviewFeatures.length:0}function getInterviewFeaturesValue(){return selectedInterviewFeatures.length?selectedInterviewFeatures.length===2?"both":selectedInterviewFeatures[0]:"none"}function getStudyPackTitleValue(){return studyPackTitleInput?String(studyPackTitleInput.value||"").replace(/\s+/g," ").trim().slice(0,120):""}function updateModeCostSummary(){modeCostSummary&&(modeCostSummary.textContent="",setHidden(modeCostSummary,!0))}function updateInterviewOptionAvailability(){const e=userCredits?Number(userCredits.slides||0):Number.POSITIVE_INFINITY,t=selectedInterviewFeatures.length;interviewOptionButtons.forEach(n=>{const o=n.dataset.feature,s=selectedInterviewFeatures.includes(o),r=s?Math.max(0,t-1):t+1,i=e>=r;n.disabled=!i&&!s,n.classList.toggle("disabled",n.disabled),n.title=n.disabled?"Not enough text extraction credits for this extra.":"",n.setAttribute("aria-disabled",n.disabled?"true":"false")})}function updateModeCreditDisplay(){if(currentMode!=="interview"){setSanitizedHtml(modeCreditCost,modeConfig[currentMode].creditCost),updateModeCostSummary();return}const e=getInterviewExtraCost();e?setSanitizedHtml(modeCreditCost,`Uses <strong>1 interview credit</strong> + <strong>${e} text extraction credits</strong> for selected extras.`):setSanitizedHtml(modeCreditCost,"Uses <strong>1 interview credit</strong>. Optional extras cost <strong>1 text extraction credit</strong> each."),updateModeCostSummary()}function setStudyFeature(e){selectedStudyFeatures=["none","flashcards","test","both"].includes(e)?e:"none";const t={none:"No study tools",flashcards:"Flashcards only",test:"Practice test only",both:"Flashcards + test"};if(studyToolsToggleText.textContent=t[selectedStudyFeatures],studyToolChips.forEach(s=>{s.classList.toggle("active",s.dataset.studyFeatures===selectedStudyFeatures)}),selectedStudyFeatures==="none"?studyToolsNote.textContent="Notes-only output. No flashcards or test questions will be generated.":selectedStudyFeatures==="flashcards"?studyToolsNote.textContent="Only flashcards will be generated.":selectedStudyFeatures==="test"?studyToolsNote.textContent="Only practice test questions will be generated.":studyToolsNote.textContent="Recommended for first runs: both flashcards and practice test questions will be generated.",currentUser&&currentUser.uid)try{localStorage.setItem(`study_tools_pref_${currentUser.uid}`,selectedStudyFeatures)}catch(s){}const n=currentMode==="interview"||selectedStudyFeatures==="none"||selectedStudyFeatures==="test",o=currentMode==="interview"||selectedStudyFeatures==="none"||selectedStudyFeatures==="flashcards";flashcardAmountChips.forEach(s=>{s.disabled=n}),questionAmountChips.forEach(s=>{s.disabled=o}),setHidden(flashcardAmountControl,n),setHidden(questionAmountControl,o),syncProcessingLayout(),updateProcessButton()}function setAmountSelection(e,t){e==="flashcards"?(selectedFlashcardAmount=t,flashcardAmountChips.forEach(n=>n.classList.toggle("active",n.dataset.value===t))):(selectedQuestionAmount=t,questionAmountChips.forEach(n=>n.classList.toggle("active",n.dataset.value===t)))}function updateInterviewOptionsUI(){if(userCredits){const t=Math.max(0,Number(userCredits.slides||0));selectedInterviewFeatures.length>t&&(selectedInterviewFeatures=selectedInterviewFeatures.slice(0,t))}updateInterviewOptionAvailability(),interviewOptionButtons.forEach(t=>{t.classList.toggle("active",selectedInterviewFeatures.includes(t.dataset.feature))});const e=userCredits?Number(userCredits.slides||0):0;!selectedInterviewFeatures.length&&userCredits&&e<=0?interviewExtraNote.textContent="No extras selected. You currently have 0 text extraction credits, so extras are disabled.":selectedInterviewFeatures.length?selectedInterviewFeatures.length===1?interviewExtraNote.textContent="Selected 1 extra option. This adds 1 text extraction credit.":interviewExtraNote.textContent="Selected both extra options. This adds 2 text extraction credits.":interviewExtraNote.textContent="No extras selected. Select one or both options (1 text extraction credit per option).",syncProcessingLayout(),updateModeCreditDisplay(),updateProcessButton()}function updateOutputLanguageInput(){const e=outputLanguageSelect.value==="other";setHidden(outputLanguageCustom,!e),e||(outputLanguageCustom.value=""),syncProcessingLayout()}function getLanguageLabel(e,t=""){const n=String(e||"english").trim().toLowerCase();if(n==="other"){const o=String(t||"").trim();return o?`\u{1F310} ${o}`:OUTPUT_LANGUAGE_LABELS.other}return OUTPUT_LANGUAGE_LABELS[n]||OUTPUT_LANGUAGE_LABELS.english}function setOutputLanguage(e,t){const n=Object.prototype.hasOwnProperty.call(OUTPUT_LANGUAGE_LABELS,e)?e:"english";outputLanguageSelect.value=n,outputLanguageLabel.textContent=t||getLanguageLabel(n,outputLanguageCustom.value),outputLanguageItems.forEach(o=>{const s=o.dataset.value===n;o.classList.toggle("active",s),o.setAttribute("aria-selected",s?"true":"false")}),updateOutputLanguageInput()}function clearLanguagePreferenceSaveTimer(){languagePreferenceSaveTimer&&(clearTimeout(languagePreferenceSaveTimer),languagePreferenceSaveTimer=null)}async function saveUserPreferences(e){if(!currentUser)return{ok:!1,error:"Please sign in"};try{const t=await authenticatedFetch("/api/user-preferences",{method:"PUT",headers:{"Content-Type":"application/json"},body:JSON.stringify(e||{})}),n=await t.json().catch(()=>({}));return t.ok?(n.preferences&&typeof n.preferences=="object"&&(userPreferences=n.preferences),{ok:!0,preferences:userPreferences}):{ok:!1,error:n.error||"Could not save preferences."}}catch(t){return captureClientError(t,"save_user_preferences"),{ok:!1,error:"Could not save preferences."}}}function setOnboardingError(e){if(!languageOnboardingError)return;const t=String(e||"").trim();languageOnboardingError.textContent=t,languageOnboardingError.classList.toggle("visible",!!t)}function setOnboardingLanguageSelection(e){const t=String(e||"english").trim().toLowerCase();languageOnboardingButtons.forEach(o=>{o.classList.toggle("active",o.dataset.value===t)});const n=t==="other";setHidden(languageOnboardingCustom,!n),n||(languageOnboardingCustom.value="")}function getOnboardingLanguageSelection(){const e=Array.from(languageOnboardingButtons).find(n=>n.classList.contains("active")),t=e?String(e.dataset.value||"english").trim().toLowerCase():"english";return{value:t,custom:t==="other"?String(languageOnboardingCustom.value||"").trim():""}}function closeLanguageOnboarding(){languageOnboardingOpen&&(languageOnboardingOpen=!1,setOnboardingError(""),closeOverlay(languageOnboardingOverlay))}function openLanguageOnboarding(e=null){if(!currentUser||languageOnboardingOpen)return;const t=e&&typeof e=="object"?e:userPreferences||{},n=String(t.output_language||outputLanguageSelect.value||"english").trim().toLowerCase(),o=String(t.output_language_custom||outputLanguageCustom.value||"").trim();setOnboardingLanguageSelection(n),languageOnboardingCustom.value=o,n==="other"&&setHidden(languageOnboardingCustom,!1),languageOnboardingSaveBtn.disabled=!1,setOnboardingError(""),languageOnboardingOpen=!0,openOverlay(languageOnboardingOverlay)}async function saveLanguageOnboardingPreference(){if(!currentUser||languageOnboardingSaving)return;const e=getOnboardingLanguageSelection();if(e.value==="other"&&!e.custom){setOnboardingError("Please enter a custom language.");return}languageOnboardingSaving=!0,languageOnboardingSaveBtn.disabled=!0,setOnboardingError("");const t=await saveUserPreferences({output_language:e.value,output_language_custom:e.custom,onboarding_completed:!0});if(languageOnboardingSaving=!1,languageOnboardingSaveBtn.disabled=!1,!t.ok){setOnboardingError(t.error||"Could not save preference.");return}suppressLanguagePreferencePersist=!0,setOutputLanguage(e.value,getLanguageLabel(e.value,e.custom)),e.value==="other"&&(outputLanguageCustom.value=e.custom),suppressLanguagePreferencePersist=!1,closeLanguageOnboarding(),showToast("Default language saved.","success")}async function persistCurrentOutputLanguage(e={}){if(!currentUser||suppressLanguagePreferencePersist)return;const t=String(outputLanguageSelect.value||"english").trim().toLowerCase(),n=t==="other"?String(outputLanguageCustom.value||"").trim():"";if(t==="other"&&!n){e.strict&&showToast("Please enter a custom language before saving.","info");return}const o={output_language:t,output_language_custom:n};Object.prototype.hasOwnProperty.call(e,"onboarding_completed")&&(o.onboarding_completed=!!e.onboarding_completed);const s=await saveUserPreferences(o);!s.ok&&e.showErrorToast&&showToast(s.error||"Could not save language preference.","error")}function scheduleLanguagePreferenceSave(){!currentUser||suppressLanguagePreferencePersist||languageOnboardingOpen||(clearLanguagePreferenceSaveTimer(),languagePreferenceSaveTimer=setTimeout(()=>{persistCurrentOutputLanguage({showErrorToast:!0})},500))}function applyPreferencesToOutputLanguage(e,t={}){const n=e&&typeof e=="object"?e:{},o=String(n.output_language||"english").trim().toLowerCase(),s=["dutch","english","spanish","french","german","chinese","other"].includes(o)?o:"english",r=String(n.output_language_custom||"").trim();suppressLanguagePreferencePersist=!0,setOutputLanguage(s,getLanguageLabel(s,r)),s==="other"&&(outputLanguageCustom.value=r),suppressLanguagePreferencePersist=!1,t.forceOnboardingOpen&&(n.onboarding_completed?closeLanguageOnboarding():openLanguageOnboarding(n))}function setQuickstartVisible(e){quickstartCard&&setHidden(quickstartCard,!e)}function syncProcessingLayout(){if(processingUi&&typeof processingUi.syncProcessingLayout=="function"){processingUi.syncProcessingLayout({uploadSection,pdfZone,audioZone,uploadEstimate,otherAudioDisclosure,otherAudioToggle,otherAudioBody,otherAudioSummary,generationControls,interviewControls,advancedSettingsSummary},{signedIn:!!currentUser,currentMode,modeConfig,hasAnySourceFile:!!(pdfFile||audioFile||hasReadyImportedAudioToken()),audioImportInFlight,importedAudioReady:hasReadyImportedAudioToken(),recordingState,audioStatusText:audioUrlStatus?String(audioUrlStatus.textContent||"").trim():"",outputLanguageValue:outputLanguageSelect?outputLanguageSelect.value:"english",outputLanguageCustomValue:outputLanguageCustom?outputLanguageCustom.value:"",selectedStudyFeatures,selectedInterviewFeatures,otherAudioOpen,getLanguageLabel});return}setHidden(uploadEstimate,!(currentUser&&(pdfFile||audioFile||hasReadyImportedAudioToken())))}function applyStoredStudyFeaturePreference(e){if(!e||!e.uid)return;let t="";try{t=localStorage.getItem(`study_tools_pref_${e.uid}`)||""}catch(o){}const n=["none","flashcards","test","both"].includes(t)?t:"both";setStudyFeature(n)}function applyRecommendedSetup(){switchMode("lecture-notes"),setStudyFeature("both"),setAdvancedSettingsVisible(!1),showToast("Recommended setup applied: Lecture Notes + Flashcards + Test.","success");try{uploadSection.scrollIntoView({behavior:"smooth",block:"start"})}catch(e){}}function updateQuickstartVisibility(){if(!currentUser||!quickstartCard||!userProfileLoaded){setQuickstartVisible(!1);return}const e=!userHasCreatedStudyPack;let t=!1;try{t=localStorage.getItem(`quickstart_dismissed_${currentUser.uid}`)==="1"}catch(n){}setQuickstartVisible(e&&!t&&!resultsLocked)}function mergeRuntimeJobs(e,t){return runtimeJobUtils&&typeof runtimeJobUtils.mergeActiveRuntimeJobs=="function"?runtimeJobUtils.mergeActiveRuntimeJobs(e,t):Array.isArray(t)?t.slice():[]}function getLatestRuntimeJob(e){return runtimeJobUtils&&typeof runtimeJobUtils.findLatestRuntimeJob=="function"?runtimeJobUtils.findLatestRuntimeJob(e):Array.isArray(e)&&e.length?e[0]:null}function readActiveRuntimeJobsCache(e){return mergeRuntimeJobs([],readUiCacheJsonForUser(e,ACTIVE_RUNTIME_JOBS_CACHE_KEY,[]))}function writeActiveRuntimeJobsCache(e,t){return writeUiCacheJsonForUser(e,ACTIVE_RUNTIME_JOBS_CACHE_KEY,mergeRuntimeJobs([],t))}function setActiveRuntimeJobs(e){activeRuntimeJobs=mergeRuntimeJobs([],e),currentUser&&writeActiveRuntimeJobsCache(currentUser,activeRuntimeJobs)}function cacheActiveRuntimeJob(e){e&&setActiveRuntimeJobs(mergeRuntimeJobs(activeRuntimeJobs,[e]))}function removeActiveRuntimeJob(e){const t=String(e||"").trim();t&&(runtimeJobUtils&&typeof runtimeJobUtils.removeRuntimeJob=="function"?activeRuntimeJobs=runtimeJobUtils.removeRuntimeJob(activeRuntimeJobs,t):activeRuntimeJobs=(Array.isArray(activeRuntimeJobs)?activeRuntimeJobs:[]).filter(n=>String(n&&n.job_id||"").trim()!==t),currentUser&&writeActiveRuntimeJobsCache(currentUser,activeRuntimeJobs))}function clearRuntimeJobsRefreshTimer(){runtimeJobsRefreshTimer&&(clearTimeout(runtimeJobsRefreshTimer),runtimeJobsRefreshTimer=null)}function scheduleRuntimeJobsRefresh(e=RUNTIME_JOBS_REFRESH_MS){clearRuntimeJobsRefreshTimer(),currentUser&&(runtimeJobsRefreshTimer=setTimeout(()=>{runtimeJobsRefreshTimer=null,refreshActiveRuntimeJobs(!1)},Math.max(1e3,Number(e||RUNTIME_JOBS_REFRESH_MS))))}function showProgressSafeBanner(e){progressSafeBanner&&(progressSafeBanner.hidden=!e)}function updateUIForAuthState(e){if(e){userProfileLoaded=!1,userHasCreatedStudyPack=!1,closeHeaderDropdowns(""),headerSignInBtn&&setHidden(headerSignInBtn,!0),headerNavToggle&&setHidden(headerNavToggle,!1),creditsDisplay&&setHidden(creditsDisplay,!1),headerStudyLibraryBtn&&setHidden(headerStudyLibraryBtn,!1),headerFeaturesBtn&&setHidden(headerFeaturesBtn,!1),headerToolsBtn&&setHidden(headerToolsBtn,!1),headerPlannerBtn&&setHidden(headerPlannerBtn,!1),progressMenu&&setHidden(progressMenu,!1),userMenu&&setHidden(userMenu,!1),adminDashboardBtn&&setHidden(adminDashboardBtn,!0),signInRequired.classList.remove("visible"),setHidden(buttonSection,!1),setHidden(languageControls,!1),setAdvancedSettingsVisible(!1),applyStoredStudyFeaturePreference(e);const t=e.displayName||e.email.split("@")[0],n=t.charAt(0).toUpperCase();if(userAvatar)if(userAvatar.innerHTML="",e.photoURL){const o=document.createElement("img");o.src=e.photoURL,o.alt=t,userAvatar.appendChild(o)}else{const o=document.createElement("span");o.textContent=n,userAvatar.appendChild(o)}userName&&(userName.textContent=t),topbarUtils.applyAuthState&&userEmail?topbarUtils.applyAuthState({user:e,userTextEl:userEmail,signedInText:function(o){return o&&o.email?o.email:""}}):userEmail&&(userEmail.textContent=e.email),switchMode(currentMode),updateModeCostSummary(),refreshStudyHeaderMetrics(),updateQuickstartVisibility(),syncProcessingLayout()}else closeHeaderDropdowns(""),headerSignInBtn&&setHidden(headerSignInBtn,!1),headerNavToggle&&setHidden(headerNavToggle,!0),creditsDisplay&&setHidden(creditsDisplay,!0),headerStudyLibraryBtn&&setHidden(headerStudyLibraryBtn,!0),headerFeaturesBtn&&setHidden(headerFeaturesBtn,!0),headerToolsBtn&&setHidden(headerToolsBtn,!0),headerPlannerBtn&&setHidden(headerPlannerBtn,!0),progressMenu&&setHidden(progressMenu,!0),userMenu&&setHidden(userMenu,!0),signInRequired.classList.add("visible"),setHidden(buttonSection,!1),generationControls.classList.add("hidden"),interviewControls.classList.add("hidden"),setHidden(languageControls,!1),setAdvancedSettingsVisible(!1),releaseImportedAudioToken({clearStatus:!0}),currentUser=null,userCredits=null,idToken=null,authClient&&typeof authClient.clearToken=="function"&&authClient.clearToken(),progressSummaryCache=null,userTotalProcessed=0,userHasCreatedStudyPack=!1,userProfileLoaded=!1,currentUserIsAdmin=!1,userPreferences=null,clearLanguagePreferenceSaveTimer(),closeLanguageOnboarding(),stopPolling(),currentJobId=null,setActiveRuntimeJobs([]),clearRuntimeJobsRefreshTimer(),runtimeJobsRefreshInFlight=!1,notificationPermissionRequested=!1,notifiedTerminalJobIds=new Set,otherAudioOpen=!1,uploadCooldownUntilMs=0,clearUploadCooldownTimer(),modalStateStack=[],activeModalOverlay=null,adminDashboardBtn&&setHidden(adminDashboardBtn,!0),updateInterviewOptionAvailability(),updateModeCostSummary(),processButton&&(processButton.disabled=!0),showProgressSafeBanner(!1),setQuickstartVisible(!1),syncProcessingLayout()}let handlingDisallowedAuthState=!1;auth.onAuthStateChanged(async e=>{if(!handlingDisallowedAuthState)if(currentUser=e,e){const t=await checkEmailAllowed(e.email||"");if(!t.allowed){handlingDisallowedAuthState=!0;try{await auth.signOut()}catch(o){console.error(o),captureClientError(o,"disallowed_signout")}finally{handlingDisallowedAuthState=!1}updateUIForAuthState(null);const n=signupView.classList.contains("active")?"signup":"signin";showAuthModal(n),showAuthError(n==="signup"?signupError:signinError,t.message||"This email is not allowed.");return}idToken=await e.getIdToken(),authClient&&typeof authClient.setToken=="function"&&authClient.setToken(idToken),updateUIForAuthState(e),setActiveRuntimeJobs(readActiveRuntimeJobsCache(e)),resumeLatestRuntimeJob(activeRuntimeJobs,{startPolling:!0}),await fetchUserData(),await checkPaymentResult(),await refreshActiveRuntimeJobs(!0)}else updateUIForAuthState(null)}),setInterval(async()=>{currentUser&&(idToken=await currentUser.getIdToken(!0),authClient&&typeof authClient.setToken=="function"&&authClient.setToken(idToken))},600*1e3);function formatFileSize(e){if(!e)return"0 Bytes";const t=1024,n=["Bytes","KB","MB","GB"],o=Math.floor(Math.log(e)/Math.log(t));return`${parseFloat((e/Math.pow(t,o)).toFixed(2))} ${n[o]}`}function getCurrentAudioImportUrl(){return normalizeAudioImportUrl(audioUrlInput?audioUrlInput.value:"")}function hasReadyImportedAudioToken(e){const t=normalizeAudioImportUrl(e==null?getCurrentAudioImportUrl():e);return typeof audioImportUtils.hasReadyImportedAudioToken=="function"?audioImportUtils.hasReadyImportedAudioToken({url:t,importedAudioToken,importedAudioSourceUrl}):!!importedAudioToken&&(!t||normalizeAudioImportUrl(importedAudioSourceUrl)===t)}function getReadyImportedAudioToken(e){return hasReadyImportedAudioToken(e)?String(importedAudioToken||"").trim():""}function currentAudioBytes(){return audioFile?Number(audioFile.size||0):hasReadyImportedAudioToken()?Number(importedAudioSizeBytes||0):0}function setAudioImportStatus(e="",t=!1){if(!audioUrlStatus)return;const n=String(e||"").trim();audioUrlStatus.textContent=n,audioUrlStatus.classList.toggle("error",!!(t&&n)),syncProcessingLayout()}function setAudioImportPending(e){audioUrlFetchBtn&&(audioUrlFetchBtn.dataset.defaultLabel||(audioUrlFetchBtn.dataset.defaultLabel=audioUrlFetchBtn.textContent||"Import Audio"),audioUrlFetchBtn.disabled=!!e,audioUrlFetchBtn.textContent=e?"Importing...":audioUrlFetchBtn.dataset.defaultLabel||"Import Audio",syncProcessingLayout())}function setRecorderStatus(e="",t="info"){recorderStatusMessage=String(e||"").trim(),recorderStatusTone=String(t||"info").trim()||"info",audioRecordingStatus&&(audioRecordingStatus.textContent=recorderStatusMessage,audioRecordingStatus.dataset.tone=recorderStatusTone)}function formatRecordingElapsed(e){const t=Math.max(0,Math.floor(Number(e||0)/1e3)),n=String(Math.floor(t/60)).padStart(2,"0"),o=String(t%60).padStart(2,"0");return`${n}:${o}`}function stopRecordingTimer(){recordingTimer&&(window.clearInterval(recordingTimer),recordingTimer=null)}function currentRecordingElapsedMs(){return recordingState==="recording"&&recordingStartedAtMs>0?recordingElapsedMs+Math.max(0,Date.now()-recordingStartedAtMs):recordingElapsedMs}function updateRecordingTimer(){audioRecorderTimer&&(audioRecorderTimer.textContent=formatRecordingElapsed(currentRecordingElapsedMs()))}function cleanupRecordingStream(){if(recordingStream){try{recordingStream.getTracks().forEach(e=>e.stop())}catch(e){}recordingStream=null}}async function getMicrophonePermissionState(){if(!navigator.permissions||typeof navigator.permissions.query!="function")return"unknown";try{const e=await navigator.permissions.query({name:"microphone"});return String(e&&e.state||"unknown").trim().toLowerCase()||"unknown"}catch(e){return"unknown"}}function getPreferredRecordingConfig(){if(!window.MediaRecorder||!navigator.mediaDevices||typeof navigator.mediaDevices.getUserMedia!="function")return null;const e=[{mimeType:"audio/ogg;codecs=opus",extension:"ogg"},{mimeType:"audio/ogg",extension:"ogg"},{mimeType:"audio/mp4;codecs=mp4a.40.2",extension:"m4a"},{mimeType:"audio/mp4",extension:"m4a"}],t=typeof window.MediaRecorder.isTypeSupported=="function";for(const n of e)if(!t||window.MediaRecorder.isTypeSupported(n.mimeType))return n;return null}function syncRecorderUI(){const e=!!(modeConfig[currentMode]||{}).needsAudio,t=getPreferredRecordingConfig();if(setHidden(audioRecorderPanel,!e),!!e){if(audioRecordStartBtn&&(audioRecordStartBtn.disabled=recordingState!=="idle"||!t),audioRecordPauseBtn&&(audioRecordPauseBtn.disabled=!(recordingState==="recording"&&mediaRecorder&&typeof mediaRecorder.pause=="function"||recordingState==="paused"&&mediaRecorder&&typeof mediaRecorder.resume=="function"),audioRecordPauseBtn.textContent=recordingState==="paused"?"Resume":"Pause"),audioRecordStopBtn&&(audioRecordStopBtn.disabled=!(recordingState==="recording"||recordingState==="paused")),updateRecordingTimer(),recordingState==="recording"){setRecorderStatus("Recording in progress. Stop to attach it to this lecture.","recording");return}if(recordingState==="paused"){setRecorderStatus("Recording paused. Resume or stop to attach it to this lecture.","info");return}if(recordingState==="stopping"){setRecorderStatus("Saving recording...","info");return}if(!t){setRecorderStatus("Browser recording is not available here. Upload or import audio instead.","error");return}recorderStatusMessage?setRecorderStatus(recorderStatusMessage,recorderStatusTone):setRecorderStatus("Record directly here if you do not have an audio file yet.","info")}}function syncAudioInfoUI(){audioFile?(audioName.textContent=audioFile.name,audioSize.textContent=audioFileOrigin==="recording"?`${formatFileSize(audioFile.size)} \xB7 Recorded in browser`:formatFileSize(audioFile.size),setHidden(audioInfo,!1),audioZone.classList.add("has-file")):importedAudioToken?(audioName.textContent=importedAudioName||"Imported audio",audioSize.textContent=importedAudioSizeBytes>0?`${formatFileSize(importedAudioSizeBytes)} \xB7 Imported from URL`:"Imported from URL",setHidden(audioInfo,!1),audioZone.classList.add("has-file")):(setHidden(audioInfo,!0),audioZone.classList.remove("has-file")),audioRecordingWarning&&(audioFile&&audioFileOrigin==="recording"?(setHidden(audioRecordingWarning,!1),audioRecordingWarning.textContent=recordedAudioNeedsDownload?"This recording only exists in this browser tab. Download it now if you want to keep it, or it will be lost forever when you leave this page.":"This recording was downloaded. Keep the saved file somewhere safe, because the in-browser copy still disappears when you leave this page."):(setHidden(audioRecordingWarning,!0),audioRecordingWarning.textContent="")),syncRecorderUI(),syncProcessingLayout()}function clearImportedAudioLocalState(){importedAudioToken="",importedAudioSizeBytes=0,importedAudioName="",importedAudioSourceUrl=""}function buildRecordedAudioFileName(e){const t=new Date;return`lecture-recording-${[t.getFullYear(),String(t.getMonth()+1).padStart(2,"0"),String(t.getDate()).padStart(2,"0")].join("")+"-"+[String(t.getHours()).padStart(2,"0"),String(t.getMinutes()).padStart(2,"0"),String(t.getSeconds()).padStart(2,"0")].join("")}.${String(e||"ogg").trim()||"ogg"}`}function finalizeRecordedAudio(e){cleanupRecordingStream(),stopRecordingTimer(),recordingState="idle",recordingStartedAtMs=0;const t=e instanceof Blob?e:null;if(!t||!t.size){recordingChunks=[],recordingMimeType="",recordingExtension="",setRecorderStatus("No audio was captured. Please try again.","error"),showToast("No audio was captured. Please try again.","error"),syncRecorderUI();return}const n=String(recordingMimeType||t.type||"audio/ogg").trim()||"audio/ogg",o=buildRecordedAudioFileName(recordingExtension||(n.indexOf("mp4")>=0?"m4a":"ogg")),s=new File([t],o,{type:n,lastModified:Date.now()});if(recordingChunks=[],recordingMimeType="",recordingExtension="",discardNextRecordingResult){discardNextRecordingResult=!1,setRecorderStatus("Recording discarded.","info"),syncRecorderUI();return}handleAudioFile(s,{origin:"recording"}),setRecorderStatus("Recording attached. Download it from the audio card now if you want to keep it.","success"),showToast("Recording attached as your audio file. Download it now if you want to keep it.","success",4200),syncRecorderUI()}async function startAudioRecording(){if(currentMode!=="lecture-notes"){setRecorderStatus("Recording is only available in Lecture Notes mode.","error");return}if(recordingState!=="idle")return;const e=getPreferredRecordingConfig();if(!e){setRecorderStatus("Browser recording is not available here. Upload or import audio instead.","error");return}try{if(await getMicrophonePermissionState()==="denied"){const n="Microphone access is blocked in your browser. Allow microphone access in the site settings, then try again.";setRecorderStatus(n,"error"),showToast(n,"error",4200),syncRecorderUI();return}cleanupRecordingStream(),recordingStream=await navigator.mediaDevices.getUserMedia({audio:!0}),recordingChunks=[],recordingMimeType=e.mimeType,recordingExtension=e.extension,mediaRecorder=new window.MediaRecorder(recordingStream,{mimeType:e.mimeType}),mediaRecorder.addEventListener("dataavailable",n=>{n.data&&n.data.size>0&&recordingChunks.push(n.data)}),mediaRecorder.addEventListener("stop",()=>{const n=new Blob(recordingChunks,{type:recordingMimeType||mediaRecorder&&mediaRecorder.mimeType||e.mimeType});mediaRecorder=null,finalizeRecordedAudio(n)}),mediaRecorder.addEventListener("error",()=>{mediaRecorder=null,cleanupRecordingStream(),stopRecordingTimer(),recordingState="idle",recordingChunks=[],recordingMimeType="",recordingExtension="",setRecorderStatus("Recording failed. Please try again.","error"),showToast("Recording failed. Please try again.","error"),syncRecorderUI()}),recordingElapsedMs=0,recordingStartedAtMs=Date.now(),recordingState="recording",recorderStatusMessage="",mediaRecorder.start(),updateRecordingTimer(),recordingTimer=window.setInterval(updateRecordingTimer,500),syncRecorderUI()}catch(t){cleanupRecordingStream(),stopRecordingTimer(),recordingState="idle",recordingChunks=[],recordingMimeType="",recordingExtension="";const n=t&&t.name==="NotAllowedError"?"Microphone access was blocked. Allow microphone access in your browser and try again.":"Could not start recording in this browser.";setRecorderStatus(n,"error"),showToast(n,"error",3600),syncRecorderUI()}}function toggleAudioRecordingPause(){if(mediaRecorder){if(recordingState==="recording"&&typeof mediaRecorder.pause=="function"){try{recordingElapsedMs=currentRecordingElapsedMs(),recordingStartedAtMs=0,mediaRecorder.pause(),stopRecordingTimer(),recordingState="paused",syncRecorderUI()}catch(e){}return}if(recordingState==="paused"&&typeof mediaRecorder.resume=="function")try{recordingStartedAtMs=Date.now(),mediaRecorder.resume(),recordingState="recording",updateRecordingTimer(),recordingTimer=window.setInterval(updateRecordingTimer,500),syncRecorderUI()}catch(e){}}}function stopAudioRecording(){if(!(!mediaRecorder||!(recordingState==="recording"||recordingState==="paused"))){recordingElapsedMs=currentRecordingElapsedMs(),recordingStartedAtMs=0,recordingState="stopping",stopRecordingTimer(),syncRecorderUI();try{mediaRecorder.stop()}catch(e){mediaRecorder=null,cleanupRecordingStream(),recordingState="idle",recordingChunks=[],recordingMimeType="",recordingExtension="",setRecorderStatus("Recording could not be saved. Please try again.","error"),syncRecorderUI()}}}async function releaseImportedAudioToken(e={}){const t=String(importedAudioToken||"").trim(),n=e.clearStatus!==!1;if(e.resetPendingUrl!==!1&&(pendingAutoImportUrl=""),!t){n&&setAudioImportStatus("");return}if(clearImportedAudioLocalState(),audioFile||syncAudioInfoUI(),n&&setAudioImportStatus(""),!!currentUser)try{await authenticatedFetch("/api/import-audio-url/release",{method:"POST",headers:{"Content-Type":"application/json"},body:JSON.stringify({audio_import_token:t})})}catch(o){}}async function applyImportedAudio(e,t="",n=""){const o=String(e&&e.audio_import_token?e.audio_import_token:"").trim();if(!o)return!1;if(audioFile){if(currentUser)try{await authenticatedFetch("/api/import-audio-url/release",{method:"POST",headers:{"Content-Type":"application/json"},body:JSON.stringify({audio_import_token:o})})}catch(r){}return!1}importedAudioToken=o,importedAudioName=String(e.file_name||"Imported audio.mp3").trim(),importedAudioSizeBytes=Math.max(0,Number(e.size_bytes||0)),importedAudioSourceUrl=normalizeAudioImportUrl(n),syncAudioInfoUI(),updateProcessButton();const s=Math.max(0,Number(e.expires_in_seconds||0));if(s>0){const r=Math.max(1,Math.round(s/60));setAudioImportStatus(`Imported ${importedAudioName}. Token expires in about ${r} minute${r===1?"":"s"}.`)}else setAudioImportStatus(`Imported ${importedAudioName}.`);if(t&&t!==o&&currentUser)try{await authenticatedFetch("/api/import-audio-url/release",{method:"POST",headers:{"Content-Type":"application/json"},body:JSON.stringify({audio_import_token:t})})}catch(r){}return!0}function syncAudioImportStatusForUrlChange(){if(!(modeConfig[currentMode]||{}).needsAudio||audioFile||audioImportInFlight){updateProcessButton();return}const e=getCurrentAudioImportUrl();if(!e){setAudioImportStatus(importedAudioToken?`Imported ${importedAudioName||"audio"}.`:""),updateProcessButton();return}const t=normalizeAudioImportUrl(importedAudioSourceUrl);setAudioImportStatus(importedAudioToken&&t!==e?"URL changed. Paste again, press Enter, or click Import Audio to use this source.":importedAudioToken&&t===e?`Imported ${importedAudioName||"audio"} from this URL.`:""),updateProcessButton()}async function importAudioFromUrl(e={}){const t=e&&typeof e=="object"?e:{},n=String(t.reason||"manual").trim()||"manual",o=normalizeAudioImportUrl(t.url==null?getCurrentAudioImportUrl():t.url);if(!currentUser)return n==="manual"?showAuthModal("signin"):setAudioImportStatus("Sign in to import audio from a lecture video URL.",!0),updateProcessButton(),!1;if(!(modeConfig[currentMode]||{}).needsAudio)return setAudioImportStatus("URL import is only available when this mode accepts audio.",!0),updateProcessButton(),!1;if(!o)return setAudioImportStatus("Paste the lecture video page URL or direct playlist URL first.",!0),updateProcessButton(),!1;if(audioImportInFlight)return!audioFile&&o&&o!==audioImportRequestUrl?(pendingAutoImportUrl=o,setAudioImportStatus("Import in progress. The latest pasted lecture video URL will import next.")):n==="manual"&&setAudioImportStatus("Import already in progress. Please wait."),updateProcessButton(),!1;const s=describeAudioImportRequest({mode:currentMode,url:o,hasLocalAudioFile:!!audioFile,importedAudioToken,importedAudioSourceUrl});if(!s.shouldImport)return s.reason==="already-imported"&&n==="manual"?setAudioImportStatus(`Imported ${importedAudioName||"audio"} from this URL.`):s.reason==="local-audio-selected"&&n==="manual"&&setAudioImportStatus("Using your uploaded audio file. Remove it to import from LMS URL."),updateProcessButton(),s.reason==="already-imported";audioImportInFlight=!0,audioImportRequestUrl=o,setAudioImportPending(!0),updateProcessButton(),setAudioImportStatus(n==="paste"?"Importing audio from the pasted lecture video URL...":"Importing audio from URL...");const r=String(importedAudioToken||"").trim();try{const i=await authenticatedFetch("/api/import-audio-url",{method:"POST",headers:{"Content-Type":"application/json"},body:JSON.stringify({url:o})}),a=await i.json().catch(()=>({}));if(!i.ok){const d=getRetryAfterSeconds(i,a),u=String(a.error||"Could not import audio from URL.");return i.status===429&&d>0?setAudioImportStatus(`${u} Try again in ${formatRetryDelay(d)}.`,!0):setAudioImportStatus(u,!0),!1}const c=await applyImportedAudio(a,r,o),l=normalizeAudioImportUrl(pendingAutoImportUrl);return c?l&&l!==o?setAudioImportStatus("Newest pasted lecture video URL detected. Importing latest audio..."):showToast("Audio imported from URL.","success"):audioFile&&setAudioImportStatus("Using your uploaded audio file. LMS import was ignored."),c}catch(i){return captureClientError(i,"import_audio_url"),setAudioImportStatus("Could not import audio from URL. Please try again.",!0),!1}finally{audioImportInFlight=!1,audioImportRequestUrl="",setAudioImportPending(!1),updateProcessButton();const i=normalizeAudioImportUrl(pendingAutoImportUrl);pendingAutoImportUrl="",!audioFile&&i&&describeAudioImportRequest({mode:currentMode,url:i,hasLocalAudioFile:!!audioFile,importedAudioToken,importedAudioSourceUrl}).shouldImport&&window.setTimeout(()=>{importAudioFromUrl({url:i,reason:"queued-auto"})},0)}}function renderToastIcon(e){for(;toastIcon.firstChild;)toastIcon.removeChild(toastIcon.firstChild);const t="http://www.w3.org/2000/svg",n=(o,s)=>{const r=document.createElementNS(t,o);Object.entries(s||{}).forEach(([i,a])=>r.setAttribute(i,String(a))),toastIcon.appendChild(r)};if(e==="success"){n("polyline",{points:"20 6 9 17 4 12"});return}if(e==="error"){n("circle",{cx:"12",cy:"12",r:"10"}),n("line",{x1:"15",y1:"9",x2:"9",y2:"15"}),n("line",{x1:"9",y1:"9",x2:"15",y2:"15"});return}n("circle",{cx:"12",cy:"12",r:"10"}),n("line",{x1:"12",y1:"16",x2:"12",y2:"12"}),n("line",{x1:"12",y1:"8",x2:"12.01",y2:"8"})}function showToast(e,t="success",n=3e3){toastText.textContent=e,toast.className=`toast visible ${t}`,renderToastIcon(t),setTimeout(()=>toast.classList.remove("visible"),n)}function getRetryAfterSeconds(e,t){const n=Number(t&&t.retry_after_seconds||0);if(Number.isFinite(n)&&n>0)return Math.ceil(n);const o=Number(e&&e.headers&&e.headers.get("Retry-After")||0);return Number.isFinite(o)&&o>0?Math.ceil(o):0}function formatRetryDelay(e){const t=Math.max(0,Number(e)||0);if(!t)return"";if(t<60)return`${t}s`;const n=Math.floor(t/60),o=t%60;return o?`${n}m ${o}s`:`${n}m`}function ensureBundleButtonDefaults(){document.querySelectorAll(".bundle-buy-btn").forEach(e=>{e.dataset.defaultLabel||(e.dataset.defaultLabel=e.textContent||"Buy now")})}function getCheckoutCooldownSeconds(){return checkoutCooldownUntilMs?Math.max(0,Math.ceil((checkoutCooldownUntilMs-Date.now())/1e3)):0}function clearCheckoutCooldownTimer(){checkoutCooldownTimer&&(clearInterval(checkoutCooldownTimer),checkoutCooldownTimer=null)}function applyCheckoutButtonsState(){ensureBundleButtonDefaults();const e=document.querySelectorAll(".bundle-buy-btn"),t=getCheckoutCooldownSeconds();if(t>0){const n=`Try again in ${formatRetryDelay(t)}`;e.forEach(o=>{o.disabled=!0,o.textContent=n});return}if(checkoutRequestInFlight){e.forEach(n=>{n.disabled=!0});return}e.forEach(n=>{n.disabled=!1,n.textContent=n.dataset.defaultLabel||"Buy now"})}function startCheckoutCooldown(e){const t=Math.max(1,Math.ceil(Number(e)||0));checkoutCooldownUntilMs=Date.now()+t*1e3,clearCheckoutCooldownTimer(),applyCheckoutButtonsState(),checkoutCooldownTimer=setInterval(()=>{getCheckoutCooldownSeconds()<=0&&(checkoutCooldownUntilMs=0,clearCheckoutCooldownTimer()),applyCheckoutButtonsState()},1e3)}function getUploadCooldownSeconds(){return uploadCooldownUntilMs?Math.max(0,Math.ceil((uploadCooldownUntilMs-Date.now())/1e3)):0}function clearUploadCooldownTimer(){uploadCooldownTimer&&(clearInterval(uploadCooldownTimer),uploadCooldownTimer=null)}function startUploadCooldown(e){const t=Math.max(1,Math.ceil(Number(e)||0));uploadCooldownUntilMs=Date.now()+t*1e3,clearUploadCooldownTimer(),updateProcessButton(),uploadCooldownTimer=setInterval(()=>{getUploadCooldownSeconds()<=0&&(uploadCooldownUntilMs=0,clearUploadCooldownTimer()),updateProcessButton()},1e3)}function hasEnoughCredits(){if(!userCredits)return!1;const e=modeConfig[currentMode];if(e.creditType==="lecture")return userCredits.lecture_standard+userCredits.lecture_extended>0;if(e.creditType==="slides")return userCredits.slides>0;if(e.creditType==="interview"){const t=getInterviewExtraCost();return getTotalInterviewCredits()>0&&userCredits.slides>=t}return!1}function getProgressStepsForMode(e,t){return progressFlowUtils&&typeof progressFlowUtils.getProgressStepsForMode=="function"?progressFlowUtils.getProgressStepsForMode(e,t,modeConfig):String(e||"").trim()==="slides-only"?modeConfig["slides-only"].steps.slice():modeConfig["lecture-notes"].steps.slice()}function updateProgressStepsForStatus(e){const t=Math.max(0,Number(e&&e.total_steps||0)),n=String(e&&e.mode||currentMode||"").trim()||currentMode,o=getProgressStepsForMode(n,t);progressSteps.childElementCount!==o.length&&buildProgressSteps(o)}function buildRuntimeJobSnapshot(e,t={}){return progressFlowUtils&&typeof progressFlowUtils.buildRuntimeJobSnapshot=="function"?progressFlowUtils.buildRuntimeJobSnapshot(e,t,runtimeJobUtils):Object.assign({},t||{},e||{})}function applyRuntimeJobProgress(e,t={}){const n=buildRuntimeJobSnapshot(e);if(!n.job_id)return!1;n.mode&&n.mode!==currentMode&&switchMode(n.mode),studyPackTitleInput&&!String(studyPackTitleInput.value||"").trim()&&n.study_pack_title&&(studyPackTitleInput.value=n.study_pack_title);const o=getProgressStepsForMode(n.mode||currentMode,t.totalSteps||n.total_steps);return buildProgressSteps(o),progressSection.classList.add("visible"),resultsSection.classList.remove("visible"),progressStatus.classList.remove("error"),setHidden(progressSpinner,!1),showProgressSafeBanner(!0),focusProgressSection(),updateProgressUI(Math.max(0,Number(n.step||0)),n.step_description||"Processing continues in the background...",o.length),currentJobId=n.job_id,trackedTerminalJobId="",cacheActiveRuntimeJob(n),updateProcessButton(),!0}function shouldPromptForNotificationsAfterJobStart(){return runtimeJobUtils&&typeof runtimeJobUtils.shouldPromptForNotifications=="function"?runtimeJobUtils.shouldPromptForNotifications({jobStarted:!0,notificationSupported:"Notification"in window,permission:"Notification"in window?Notification.permission:"denied"}):"Notification"in window&&Notification.permission==="default"}function maybeRequestNotificationPermissionAfterJobStart(){if(!(notificationPermissionRequested||!shouldPromptForNotificationsAfterJobStart())){notificationPermissionRequested=!0;try{Notification.requestPermission().catch(()=>{})}catch(e){}}}function maybeSendCompletionNotification(e,t){const n=buildRuntimeJobSnapshot(e,t);if(!n.job_id||notifiedTerminalJobIds.has(n.job_id)||!(document.visibilityState!=="visible"||!document.hasFocus())||!(runtimeJobUtils&&typeof runtimeJobUtils.shouldSendCompletionNotification=="function")||!runtimeJobUtils.shouldSendCompletionNotification({notificationSupported:"Notification"in window,permission:"Notification"in window?Notification.permission:"denied",status:t&&t.status}))return;const s=runtimeJobUtils.buildCompletionNotification(n,t||{});if(!(!s||!s.title)){notifiedTerminalJobIds.add(n.job_id);try{const r=new Notification(s.title,{body:s.body||"",silent:!1});r.onclick=()=>{try{window.focus()}catch(i){}window.location.href="/study"}}catch(r){}}}function updateUploadEstimatePanel(){if(!uploadEstimate||!uploadEstimateTime||!uploadEstimateMeta)return;if(!currentUser||resultsLocked){setHidden(uploadEstimate,!0);return}setHidden(uploadEstimate,!1),uploadEstimateTime.textContent=UPLOAD_ESTIMATE_COPY[currentMode]||"Processing time depends on the upload.";const t=((pdfFile?Number(pdfFile.size||0):0)+currentAudioBytes())/(1024*1024);if(currentMode==="lecture-notes")uploadEstimateMeta.textContent=`Requires PDF or PPTX (max 50 MB) + audio (max 500 MB). Current upload: ${t.toFixed(1)} MB.`;else if(currentMode==="slides-only")uploadEstimateMeta.textContent=`Requires PDF or PPTX (max 50 MB). Current upload: ${t.toFixed(1)} MB.`;else{const n=getInterviewExtraCost();uploadEstimateMeta.textContent=`Requires audio only (max 500 MB). Selected extras: ${n} (${n} text extraction credits). Current upload: ${t.toFixed(1)} MB.`}}function updateMobileProcessSummary(e={}){if(!mobileProcessSummary)return;const t=modeConfig[currentMode]||{},n=Math.max(0,Number(e.uploadCooldown||0)),o=e.hasCredits!==!1,s=!t.needsPdf||!!pdfFile,r=!t.needsAudio||!!audioFile||hasReadyImportedAudioToken();if(processingUi&&typeof processingUi.getProcessReadinessSummary=="function"){mobileProcessSummary.textContent=processingUi.getProcessReadinessSummary({signedIn:!!currentUser,currentMode,modeConfig,pdfReady:s,audioReady:r,hasCredits:o,uploadedAudioReady:!!audioFile,importedAudioReady:hasReadyImportedAudioToken(),hasLocalAudioFile:!!audioFile,audioImportInFlight,currentJobActive:!!(currentJobId&&!resultsLocked),uploadCooldown:n,formatRetryDelay});return}mobileProcessSummary.textContent="Complete the required items to start processing."}function updateProcessButton(){const e=modeConfig[currentMode],t=!e.needsPdf||pdfFile,n=!e.needsAudio||audioFile||hasReadyImportedAudioToken(),o=hasEnoughCredits(),s=getUploadCooldownSeconds();if(updateUploadEstimatePanel(),updateMobileProcessSummary({pdfReady:t,audioReady:n,hasCredits:o,uploadCooldown:s}),s>0){processButton.disabled=!0,processButton.querySelector("span").textContent=`Try again in ${formatRetryDelay(s)}`,noCreditsWarning.classList.remove("visible");return}if(e.needsAudio&&audioImportInFlight&&!audioFile){processButton.disabled=!0,processButton.querySelector("span").textContent="Importing lecture audio...",noCreditsWarning.classList.remove("visible");return}if(currentJobId&&!resultsLocked){processButton.disabled=!0,processButton.querySelector("span").textContent="Processing in background...",noCreditsWarning.classList.remove("visible");return}if(processButton.disabled=!(t&&n&&o)||resultsLocked,processButton.querySelector("span").textContent=e.buttonText,currentUser&&!o&&!resultsLocked){currentMode==="interview"&&getTotalInterviewCredits()>0&&userCredits.slides<getInterviewExtraCost()?setSanitizedHtml(noCreditsWarning,`You don't have enough text extraction credits for the selected interview extras. <a href="#" id="buy-credits-link-inline">Buy more credits</a>`):setSanitizedHtml(noCreditsWarning,`You don't have enough credits. <a href="#" id="buy-credits-link-inline">Buy more credits</a>`),noCreditsWarning.classList.add("visible");const r=document.getElementById("buy-credits-link-inline");r&&r.addEventListener("click",i=>{i.preventDefault(),window.location.href="/buy_credits"})}else noCreditsWarning.classList.remove("visible")}function switchMode(e){forcedMode&&e!==forcedMode&&(e=forcedMode),!(modeConfig[e]||{}).needsAudio&&(recordingState==="recording"||recordingState==="paused")&&stopAudioRecording(),currentMode=e;const t=modeConfig[e];modeTabs.forEach(n=>{const o=n.dataset.mode===e;n.classList.toggle("active",o),n.setAttribute("aria-selected",o?"true":"false"),n.tabIndex=o?0:-1}),modeDescriptionText.textContent=t.description,pdfZoneTitle&&(pdfZoneTitle.textContent=t.pdfTitle||"Lecture Slides"),pdfZoneBadge&&(pdfZoneBadge.textContent=t.pdfRequirement||"Required",pdfZoneBadge.className=`upload-badge ${t.pdfRequirementTone||"required"}`),pdfZoneHelper&&(pdfZoneHelper.textContent=t.pdfHelper||""),audioZoneTitle.textContent=t.audioTitle,audioZoneBadge&&(audioZoneBadge.textContent=t.audioRequirement||"Required",audioZoneBadge.className=`upload-badge ${t.audioRequirementTone||"required"}`),audioZoneHelper&&(audioZoneHelper.textContent=t.audioHelper||""),audioUrlImportTitle&&(audioUrlImportTitle.textContent=t.lmsImportTitle||"Import from lecture video URL"),audioUrlImportHint&&(audioUrlImportHint.textContent=t.lmsImportHint||""),generationControls.classList.toggle("hidden",e==="interview"),interviewControls.classList.toggle("hidden",e!=="interview"),e==="interview"&&(studyToolsPanel.classList.remove("visible"),studyToolsToggle.classList.remove("open")),updateModeCreditDisplay(),setHidden(pdfInfo,!pdfFile),pdfZone.classList.toggle("has-file",!!pdfFile),t.needsAudio||syncAudioInfoUI(),setStudyFeature(selectedStudyFeatures),updateInterviewOptionsUI(),syncRecorderUI(),syncProcessingLayout(),updateProcessButton()}modeTabs.forEach(e=>e.addEventListener("click",()=>switchMode(e.dataset.mode))),modeTabs.forEach((e,t)=>e.addEventListener("keydown",n=>{if(modeTabs.length){if(n.key==="ArrowRight"||n.key==="ArrowDown"){n.preventDefault();const o=modeTabs[(t+1)%modeTabs.length];switchMode(o.dataset.mode),o.focus()}else if(n.key==="ArrowLeft"||n.key==="ArrowUp"){n.preventDefault();const o=modeTabs[(t-1+modeTabs.length)%modeTabs.length];switchMode(o.dataset.mode),o.focus()}else if(n.key==="Home"){n.preventDefault();const o=modeTabs[0];switchMode(o.dataset.mode),o.focus()}else if(n.key==="End"){n.preventDefault();const o=modeTabs[modeTabs.length-1];switchMode(o.dataset.mode),o.focus()}}})),advancedSettingsToggle.addEventListener("click",()=>{const e=!advancedSettingsBody.classList.contains("visible");setAdvancedSettingsVisible(e),e||(setOutputLanguageMenuVisible(!1),studyToolsPanel.classList.remove("visible"),studyToolsToggle.classList.remove("open"))});function handlePdfFile(e){if(!e)return;const t=String(e.name||"").toLowerCase(),n=allowedSlideExtensions.some(r=>t.endsWith(r)),o=String(e.type||"").toLowerCase(),s=allowedSlideMimeTypes.includes(o);if(!n||!s){showToast("Please select a valid PDF or PPTX file","error");return}if(e.size>50*1024*1024){showToast("Slide file must be under 50 MB","error");return}pdfFile=e,pdfName.textContent=e.name,pdfSize.textContent=formatFileSize(e.size),setHidden(pdfInfo,!1),pdfZone.classList.add("has-file"),syncProcessingLayout(),updateProcessButton()}function handleAudioFile(e,t={}){if(!e)return;if(![".mp3",".m4a",".wav",".aac",".ogg",".flac"].some(o=>e.name.toLowerCase().endsWith(o))){showToast("Please select a valid audio file","error");return}if(e.size>500*1024*1024){showToast("Audio file must be under 500 MB","error");return}pendingAutoImportUrl="",importedAudioToken&&releaseImportedAudioToken({clearStatus:!0}),audioFile=e,audioFileOrigin=t.origin==="recording"?"recording":"upload",recordedAudioNeedsDownload=audioFileOrigin==="recording",audioFileOrigin!=="recording"&&(recorderStatusMessage="",recorderStatusTone="info"),syncAudioInfoUI(),updateProcessButton()}function shouldIgnoreDropZoneActivation(e){return!e||typeof e.closest!="function"?!1:!!(e.closest(".file-remove")||e.closest(".file-info")||e.closest(".audio-recorder-panel")||e.closest("button")||e.closest("a")||e.closest("input")||e.closest("select")||e.closest("textarea"))}function setupDropZone(e,t,n){e.addEventListener("click",o=>{shouldIgnoreDropZoneActivation(o.target)||t.click()}),e.addEventListener("keydown",o=>{o.target===e&&(o.key!=="Enter"&&o.key!==" "||(o.preventDefault(),t.click()))}),t.addEventListener("change",o=>{o.target.files.length&&n(o.target.files[0])}),e.addEventListener("dragover",o=>{o.preventDefault(),e.classList.add("drag-over")}),e.addEventListener("dragleave",o=>{o.preventDefault(),e.classList.remove("drag-over")}),e.addEventListener("drop",o=>{o.preventDefault(),e.classList.remove("drag-over"),o.dataTransfer.files.length&&n(o.dataTransfer.files[0])})}function downloadLocalPreviewFile(e){if(!e)return!1;const t=URL.createObjectURL(e),n=document.createElement("a");return n.href=t,n.download=String(e.name||"upload"),document.body.appendChild(n),n.click(),document.body.removeChild(n),URL.revokeObjectURL(t),!0}setupDropZone(pdfZone,pdfInput,handlePdfFile),setupDropZone(audioZone,audioInput,handleAudioFile),audioRecordStartBtn&&audioRecordStartBtn.addEventListener("click",e=>{e.stopPropagation(),startAudioRecording()}),audioRecordPauseBtn&&audioRecordPauseBtn.addEventListener("click",e=>{e.stopPropagation(),toggleAudioRecordingPause()}),audioRecordStopBtn&&audioRecordStopBtn.addEventListener("click",e=>{e.stopPropagation(),stopAudioRecording()}),pdfInfo&&(pdfInfo.title="Click to download this selected file",pdfInfo.addEventListener("click",e=>{e.target.closest(".file-remove")||downloadLocalPreviewFile(pdfFile)&&showToast("Lecture slides download started.","success",1600)})),audioInfo&&(audioInfo.title="Click to download this selected file",audioInfo.addEventListener("click",e=>{if(!e.target.closest(".file-remove")){if(downloadLocalPreviewFile(audioFile)){audioFileOrigin==="recording"?(recordedAudioNeedsDownload=!1,syncAudioInfoUI(),showToast("Recording download started. Keep that file safe because the in-browser copy will disappear when you leave this page.","success",4200)):showToast("Audio file download started.","success",1600);return}importedAudioToken&&showToast("Imported audio is temporary and cannot be downloaded from this preview.","info",2800)}})),pdfRemove.addEventListener("click",e=>{e.stopPropagation(),pdfFile=null,pdfInput.value="",setHidden(pdfInfo,!0),pdfZone.classList.remove("has-file"),syncProcessingLayout(),updateProcessButton()}),audioRemove.addEventListener("click",e=>{e.stopPropagation(),audioFile=null,audioFileOrigin="upload",recordedAudioNeedsDownload=!1,recorderStatusMessage="",recorderStatusTone="info",audioInput.value="",pendingAutoImportUrl="",importedAudioToken&&releaseImportedAudioToken({clearStatus:!0}),syncAudioInfoUI(),updateProcessButton()});function buildProgressSteps(e){progressSteps.innerHTML="",progressSteps.classList.toggle("single-step",e.length===1),e.forEach(t=>{const n=document.createElement("div");n.className="progress-step",n.id=`step-${t.num}`;const o=document.createElement("div");o.className="step-indicator",o.textContent=String(t.num);const s=document.createElement("div");s.className="step-label",s.textContent=String(t.label||""),n.appendChild(o),n.appendChild(s),progressSteps.appendChild(n)})}function updateProgressUI(e,t,n){for(let o=1;o<=n;o++){const s=document.getElementById(`step-${o}`);s&&(s.classList.remove("active","complete"),o<e?s.classList.add("complete"):o===e&&s.classList.add("active"))}progressStatus&&(progressStatus.setAttribute("role","status"),progressStatus.setAttribute("aria-live","polite"),progressStatus.setAttribute("aria-atomic","true")),statusText.textContent=t||"Processing..."}function announceProgressError(e){!progressStatus||!statusText||(progressStatus.setAttribute("role","alert"),progressStatus.setAttribute("aria-live","assertive"),progressStatus.setAttribute("aria-atomic","true"),statusText.textContent=e||"Error while processing.")}function focusProgressSection(){if(progressSection)try{progressSection.focus({preventScroll:!0})}catch(e){try{progressSection.focus()}catch(t){}}}function getCurrentModeSteps(){return currentMode==="lecture-notes"?selectedStudyFeatures==="none"?modeConfig["lecture-notes"].steps.slice(0,3):modeConfig["lecture-notes"].steps:currentMode==="slides-only"?selectedStudyFeatures==="none"?modeConfig["slides-only"].steps.slice(0,1):modeConfig["slides-only"].steps:selectedInterviewFeatures.length>0?[{num:1,label:"Transcribe"},{num:2,label:"Create Extras"}]:modeConfig.interview.steps}function scheduleNextPoll(e){pollInterval&&clearTimeout(pollInterval),pollInterval=setTimeout(pollStatus,Math.max(0,e||0))}function setProgressRetryVisible(e){!progressRetry||!progressRetryBtn||(progressRetry.classList.toggle("visible",!!e),e&&(progressRetryBtn.disabled=!1))}function retryStatusCheckNow(){if(!currentJobId){showToast("No active job to retry.","info"),setProgressRetryVisible(!1);return}setProgressRetryVisible(!1),progressStatus.classList.remove("error"),setHidden(progressSpinner,!1),statusText.textContent="Re-checking job status...",trackEvent("processing_retry_requested",{job_id:currentJobId}),startPolling()}function startPolling(){stopPolling(),pollFailures=0,pollMissingResponses=0,pollStartedAt=Date.now(),setProgressRetryVisible(!1),scheduleNextPoll(0)}function stopPolling(){pollInterval&&clearTimeout(pollInterval),pollInterval=null,pollFailures=0,pollMissingResponses=0,pollStartedAt=0}function resetProcessingSession(e={}){const t=!!e.keepProgressVisible,n=!!e.keepStatusMessage,o=e.hideRetry!==!1;stopPolling(),o&&setProgressRetryVisible(!1),currentJobId=null,trackedTerminalJobId="",showProgressSafeBanner(!1),n||(statusText.textContent="Starting..."),!t&&!resultsLocked&&(progressSection.classList.remove("visible"),progressStatus.classList.remove("error"),setHidden(progressSpinner,!1)),updateProcessButton()}async function authenticatedFetch(e,t={},n=!0){if(!currentUser)throw new Error("Please sign in");if(authClient&&typeof authClient.authFetch=="function"){const r=await authClient.authFetch(e,t,{retryOn401:n!==!1});if(authClient&&typeof authClient.getToken=="function"){const i=authClient.getToken();i&&(idToken=i)}return r}idToken||(idToken=await currentUser.getIdToken());const o={...t.headers||{},Authorization:`Bearer ${idToken}`},s=await fetch(e,{...t,headers:o});return s.status===401&&n?(idToken=await currentUser.getIdToken(!0),fetch(e,{...t,headers:{...t.headers||{},Authorization:`Bearer ${idToken}`}})):s}async function downloadAuthenticatedFile(e,t){const n=await authenticatedFetch(e);if(!n.ok){let i="Could not download file.";try{i=(await n.json()).error||i}catch(a){}throw new Error(i)}if(downloadUtils.downloadResponseBlob){await downloadUtils.downloadResponseBlob(n,t);return}const o=await n.blob(),s=URL.createObjectURL(o),r=document.createElement("a");r.href=s,r.download=t,document.body.appendChild(r),r.click(),document.body.removeChild(r),URL.revokeObjectURL(s)}function reconcileCachedRuntimeJobs(e){if(!currentUser)return Promise.resolve({jobs:mergeRuntimeJobs([],e),latestJob:null});const t=mergeRuntimeJobs([],e),o=readActiveRuntimeJobsCache(currentUser).filter(s=>{const r=String(s&&s.job_id||"").trim();return r&&!t.some(i=>String(i&&i.job_id||"").trim()===r)});return o.length?Promise.all(o.map(async s=>{const r=String(s&&s.job_id||"").trim();if(!r)return null;try{const i=await authenticatedFetch(`/status/${encodeURIComponent(r)}`);if(!i.ok)return i.status===404&&removeActiveRuntimeJob(r),null;const a=await i.json();return{cached:s,payload:a}}catch(i){return null}})).then(s=>{let r=t.slice();return s.forEach(i=>{if(!i||!i.payload)return;const a=String(i.payload.status||"").trim().toLowerCase();if(runtimeJobUtils&&typeof runtimeJobUtils.isActiveStatus=="function"&&runtimeJobUtils.isActiveStatus(a)){r=mergeRuntimeJobs(r,[Object.assign({},i.cached||{},i.payload||{})]);return}removeActiveRuntimeJob(i.cached&&i.cached.job_id)}),{jobs:r,latestJob:getLatestRuntimeJob(r)}}):Promise.resolve({jobs:t,latestJob:getLatestRuntimeJob(t)})}function resumeLatestRuntimeJob(e,t={}){if(resultsLocked)return!1;const n=getLatestRuntimeJob(e);return!n||!n.job_id?!1:(currentJobId&&currentJobId===n.job_id&&t.force!==!0||(applyRuntimeJobProgress(n),t.startPolling!==!1&&startPolling()),!0)}async function refreshActiveRuntimeJobs(e){if(!currentUser||!idToken){setActiveRuntimeJobs([]),clearRuntimeJobsRefreshTimer();return}if(!(runtimeJobsRefreshInFlight&&!e)){runtimeJobsRefreshInFlight=!0;try{const t=await authenticatedFetch("/api/runtime-jobs/active");if(!t.ok)throw new Error("Could not refresh active jobs.");const n=await t.json(),o=await reconcileCachedRuntimeJobs(n&&n.jobs?n.jobs:[]);setActiveRuntimeJobs(o.jobs||[]),resultsLocked||resumeLatestRuntimeJob(o.jobs||[],{startPolling:!0,force:e})}catch(t){e&&showToast(t.message||"Could not refresh processing jobs.","error")}finally{runtimeJobsRefreshInFlight=!1,scheduleRuntimeJobsRefresh(RUNTIME_JOBS_REFRESH_MS)}}}async function exportMyAccountData(){if(!currentUser){showAuthModal("signin");return}if(!accountActionInFlight){accountActionInFlight=!0;try{const e=`lecture-processor-account-export-${localDateString()}.json`;await downloadAuthenticatedFile("/api/account/export",e),showToast("Your data export has been downloaded.","success",5e3)}catch(e){captureClientError(e,"account_export"),showToast(e.message||"Could not export your data.","error",5e3)}finally{accountActionInFlight=!1}}}function setDeleteAccountError(e){deleteAccountError&&(deleteAccountError.textContent=String(e||"").trim())}function openDeleteAccountModal(){if(!deleteAccountOverlay)return;const e=String(currentUser&&currentUser.email||"").trim();deleteAccountTextInput&&(deleteAccountTextInput.value=""),deleteAccountEmailInput&&(deleteAccountEmailInput.value=e),setDeleteAccountError(""),deleteAccountConfirmBtn&&(deleteAccountConfirmBtn.disabled=!1,deleteAccountConfirmBtn.textContent="Delete permanently"),openOverlay(deleteAccountOverlay),setTimeout(()=>{deleteAccountTextInput&&deleteAccountTextInput.focus()},20)}function closeDeleteAccountModal(){deleteAccountOverlay&&(closeOverlay(deleteAccountOverlay),setDeleteAccountError(""))}async function submitDeleteAccountModal(){if(!currentUser||accountActionInFlight)return;const e=String(currentUser.email||"").trim();if(!e){setDeleteAccountError("Could not verify account email. Please sign in again.");return}if(String(deleteAccountTextInput&&deleteAccountTextInput.value||"").trim().toUpperCase()!=="DELETE MY ACCOUNT"){setDeleteAccountError("Type DELETE MY ACCOUNT exactly to continue.");return}if(String(deleteAccountEmailInput&&deleteAccountEmailInput.value||"").trim().toLowerCase()!==e.toLowerCase()){setDeleteAccountError("Email does not match your signed-in account.");return}accountActionInFlight=!0,deleteAccountConfirmBtn&&(deleteAccountConfirmBtn.disabled=!0,deleteAccountConfirmBtn.textContent="Deleting...");try{const o=await authenticatedFetch("/api/account/delete",{method:"POST",headers:{"Content-Type":"application/json"},body:JSON.stringify({confirm_text:"DELETE MY ACCOUNT",confirm_email:e})}),s=await o.json().catch(()=>({}));if(!o.ok)throw new Error(s.error||"Could not delete account data.");closeDeleteAccountModal(),showToast("Account deleted. Signing out...","success",5e3);try{await auth.signOut()}catch(r){}window.location.href="/"}catch(o){captureClientError(o,"account_delete"),setDeleteAccountError(o.message||"Could not delete account data.")}finally{accountActionInFlight=!1,deleteAccountConfirmBtn&&(deleteAccountConfirmBtn.disabled=!1,deleteAccountConfirmBtn.textContent="Delete permanently")}}async function deleteMyAccountData(){if(!currentUser){showAuthModal("signin");return}accountActionInFlight||openDeleteAccountModal()}async function pollStatus(){if(currentJobId){if(pollStartedAt&&Date.now()-pollStartedAt>POLL_MAX_RUNTIME_MS){const e=currentJobId;resetProcessingSession({keepProgressVisible:!0,keepStatusMessage:!0}),progressStatus.classList.add("error"),setHidden(progressSpinner,!0),statusText.textContent="Still processing on the server. Start a new run or retry later from Study Library.",showToast("Processing is taking longer than expected. Please check again shortly.","info",6e3),trackEvent("processing_timeout",e?{job_id:e}:{});return}try{const e=await authenticatedFetch(`/status/${currentJobId}`);if(e.status===401){resetProcessingSession({keepProgressVisible:!0}),showAuthModal("signin");return}if(e.status===403){resetProcessingSession({keepProgressVisible:!0}),showError("You do not have access to this job.");return}const t=await e.json();if(t.error&&t.status!=="error"){if(e.status===404&&(t.retryable||t.error_code==="JOB_TEMPORARILY_UNAVAILABLE"||t.job_lost)&&pollMissingResponses<3){pollMissingResponses+=1;const s=Math.min(POLL_MAX_MS,POLL_BASE_MS*Math.pow(2,pollMissingResponses));statusText.textContent=`Reconnecting to job status... retrying in ${Math.ceil(s/1e3)}s`,scheduleNextPoll(s);return}const o=currentJobId;resetProcessingSession({keepProgressVisible:!0}),trackEvent("processing_failed",{reason:t.error_code||"job_not_found",job_id:o||void 0}),showToast(t.error||"Error: Job not found","error");return}if(updateProgressStepsForStatus(t),updateProgressUI(t.step,t.step_description,t.total_steps),cacheActiveRuntimeJob({job_id:currentJobId,mode:t.mode||currentMode,status:t.status,step:t.step,step_description:t.step_description,study_pack_title:getStudyPackTitleValue(),started_at:Math.floor((pollStartedAt||Date.now())/1e3),study_pack_id:t.study_pack_id||"",error:t.error||""}),t.status==="complete")stopPolling(),setProgressRetryVisible(!1),pollMissingResponses=0,maybeSendCompletionNotification({job_id:currentJobId,mode:t.mode||currentMode,study_pack_title:getStudyPackTitleValue(),study_pack_id:t.study_pack_id||""},t),removeActiveRuntimeJob(currentJobId),currentJobId&&trackedTerminalJobId!==currentJobId&&(trackedTerminalJobId=currentJobId,trackEvent("processing_completed",{job_id:currentJobId})),showResults(t.result,t.slide_text,t.transcript,t.flashcards||[],t.test_questions||[],t.study_generation_error||null,t.study_pack_id||null,t.study_features||"none",t.interview_summary||"",t.interview_sections||"",t.interview_combined||"",t.interview_features_successful||[],t.billing_receipt||null),fetchUserData();else if(t.status==="error"){const n=currentJobId;maybeSendCompletionNotification({job_id:n,mode:t.mode||currentMode,study_pack_title:getStudyPackTitleValue(),study_pack_id:t.study_pack_id||"",error:t.error||""},t),removeActiveRuntimeJob(n),resetProcessingSession({keepProgressVisible:!0}),pollMissingResponses=0,n&&trackedTerminalJobId!==n&&(trackedTerminalJobId=n,trackEvent("processing_failed",{job_id:n,credit_refunded:!!t.credit_refunded})),showError(t.error,t.credit_refunded,t.billing_receipt||null)}else showProgressSafeBanner(!0),setProgressRetryVisible(!1),pollFailures=0,pollMissingResponses=0,scheduleNextPoll(POLL_BASE_MS)}catch(e){console.error(e),captureClientError(e,"poll_status"),pollFailures+=1;const t=Math.min(POLL_MAX_MS,POLL_BASE_MS*Math.pow(2,Math.min(pollFailures,5)));statusText.textContent=`Temporary connection issue. Retrying in ${Math.ceil(t/1e3)}s...`,scheduleNextPoll(t)}}}async function processFiles(){if(!currentUser){showAuthModal("signin");return}if(resultsLocked){showToast('Click "Process Another File" to start a new generation.',"info");return}if(currentJobId){showToast("A job is already processing. You can safely leave and find the result in Study Library.","info",4200);return}const e=getUploadCooldownSeconds();if(e>0){showToast(`Upload temporarily limited. Try again in ${formatRetryDelay(e)}.`,"info",4500),updateProcessButton();return}const t=modeConfig[currentMode],n=getStudyPackTitleValue();if(!n){showToast("Lecture Topic / Name is required.","error"),studyPackTitleInput&&typeof studyPackTitleInput.focus=="function"&&studyPackTitleInput.focus();return}const o=new FormData;o.append("mode",currentMode),o.append("study_pack_title",n),t.needsPdf&&pdfFile&&o.append("pdf",pdfFile),t.needsAudio&&audioFile&&o.append("audio",audioFile);const s=t.needsAudio?getReadyImportedAudioToken():"";t.needsAudio&&s&&!audioFile&&o.append("audio_import_token",s);const r=outputLanguageSelect.value||"english";if(o.append("output_language",r),r==="other"){const a=outputLanguageCustom.value.trim();if(!a){showToast("Please enter a custom output language.","error");return}o.append("output_language_custom",a)}currentMode!=="interview"?(o.append("flashcard_amount",selectedFlashcardAmount),o.append("question_amount",selectedQuestionAmount),o.append("study_features",selectedStudyFeatures)):o.append("interview_features",getInterviewFeaturesValue());const i=getCurrentModeSteps();buildProgressSteps(i),processButton.disabled=!0,setProgressRetryVisible(!1),progressSection.classList.add("visible"),resultsSection.classList.remove("visible"),progressStatus.classList.remove("error"),setHidden(progressSpinner,!1),showProgressSafeBanner(!1);try{progressSection.scrollIntoView({behavior:"smooth",block:"start"})}catch(a){}focusProgressSection(),updateProgressUI(0,"Uploading files...",i.length),trackEvent("process_clicked",{study_features:selectedStudyFeatures,flashcard_amount:selectedFlashcardAmount,question_amount:selectedQuestionAmount,interview_features_count:selectedInterviewFeatures.length});try{const a=await authenticatedFetch("/upload",{method:"POST",body:o}),c=await a.json();if(c.error){if(trackEvent("processing_failed",{reason:c.error||"upload_failed"}),typeof c.error=="string"&&c.error.toLowerCase().includes("imported audio token")&&(clearImportedAudioLocalState(),syncAudioInfoUI()),a.status===401)showAuthModal();else if(a.status===402)showError("No credits remaining. Please purchase more credits."),noCreditsWarning.classList.add("visible");else if(a.status===429){const l=getRetryAfterSeconds(a,c),d=l?`${c.error} Try again in ${formatRetryDelay(l)}.`:c.error;l>0&&startUploadCooldown(l),showError(d),showToast(d,"info",6e3)}else showError(c.error);resetProcessingSession({keepProgressVisible:!0,keepStatusMessage:!0});return}currentJobId=c.job_id,trackedTerminalJobId="",cacheActiveRuntimeJob({job_id:currentJobId,mode:currentMode,status:"starting",step:0,step_description:"Starting...",study_pack_title:n,started_at:Math.floor(Date.now()/1e3),study_pack_id:"",error:""}),showProgressSafeBanner(!0),maybeRequestNotificationPermissionAfterJobStart(),trackEvent("processing_started",{job_id:currentJobId,study_features:selectedStudyFeatures,interview_features_count:selectedInterviewFeatures.length}),startPolling()}catch(a){captureClientError(a,"process_files"),showError("Failed to upload files. Please try again."),resetProcessingSession({keepProgressVisible:!0,keepStatusMessage:!0})}}processButton.addEventListener("click",processFiles);function simpleMarkdownToHtml(e){return markdownUtils.parseMarkdownToSafeHtml?markdownUtils.parseMarkdownToSafeHtml(e):escapeHtml(String(e||"")).replace(/\n/g,"<br>")}function buildDownloadDropdown(){const e=typeof indexResultsUtils.buildDownloadOptions=="function"?indexResultsUtils.buildDownloadOptions({currentMode,currentStudyPackId,downloadLabels:DOWNLOAD_LABELS,interviewCombinedText,interviewSectionsText,interviewSummaryText,transcript}):[];for(;downloadDropdownContent.firstChild;)downloadDropdownContent.removeChild(downloadDropdownContent.firstChild);e.forEach(t=>{if(t.divider){const s=document.createElement("div");s.className="dropdown-divider",downloadDropdownContent.appendChild(s);return}const n=document.createElement("button");n.type="button",n.className="dropdown-item",n.setAttribute("role","menuitem"),n.dataset.type=t.type,n.dataset.format=t.format,n.append(document.createTextNode(t.label));const o=document.createElement("span");o.textContent=t.detail,n.appendChild(o),n.addEventListener("click",()=>{downloadFile(t.type,t.format),setDownloadDropdownVisible(!1)}),downloadDropdownContent.appendChild(n)})}async function downloadFile(e,t){if(e==="pdf-answers"||e==="pdf-no-answers"){if(!currentStudyPackId)return;const r=e==="pdf-answers",i="answers="+(r?"true":"false")+"&download=true",a="study-pack-"+currentStudyPackId+(r?"":"-no-answers")+".pdf";showToast("Download started","success");try{const l=await(await authenticatedFetch("/api/study-packs/"+encodeURIComponent(currentStudyPackId)+"/export-pdf?"+i)).blob();if(downloadUtils.saveBlobAsFile)downloadUtils.saveBlobAsFile(l,a);else{const d=URL.createObjectURL(l),u=document.createElement("a");u.href=d,u.download=a,document.body.appendChild(u),u.click(),document.body.removeChild(u),URL.revokeObjectURL(d)}}catch(c){showToast(c.message||"Could not download PDF.","error")}return}const n=typeof indexResultsUtils.resolveTextDownload=="function"?indexResultsUtils.resolveTextDownload({currentMode,format:t,interviewCombinedText,interviewSectionsText,interviewSummaryText,resultMarkdown,slideText,transcript,type:e}):{content:resultMarkdown,filename:"output.md"},o=n.content,s=n.filename;if(t==="md"){const r=new Blob([o],{type:"text/markdown"});if(downloadUtils.saveBlobAsFile)downloadUtils.saveBlobAsFile(r,s);else{const i=URL.createObjectURL(r),a=document.createElement("a");a.href=i,a.download=s,document.body.appendChild(a),a.click(),document.body.removeChild(a),URL.revokeObjectURL(i)}showToast("Download started","success")}else{if(!currentJobId)return;try{await downloadAuthenticatedFile(`/download-docx/${currentJobId}?type=${encodeURIComponent(e)}`,s),showToast("Download started","success")}catch(r){showToast(r.message||"Could not download file.","error")}}}function updateExportCsvButton(){const e=typeof indexResultsUtils.getExportCsvState=="function"?indexResultsUtils.getExportCsvState({activeResultsTab,currentMode,flashcards,testQuestions}):{visible:!1,type:"",text:""};exportCsvType=e.type||exportCsvType,e.text&&(exportStudyCsvText.textContent=e.text),setHidden(exportStudyCsvBtn,!e.visible)}function setActiveResultsTab(e){activeResultsTab=e,tabButtons.forEach(t=>{const n=t.dataset.tab===e;t.classList.toggle("active",n),t.setAttribute("aria-selected",n?"true":"false"),t.tabIndex=n?0:-1}),paneNotes.classList.toggle("active",e==="notes"),paneNotes.hidden=e!=="notes",paneFlashcards.classList.toggle("active",e==="flashcards"),paneFlashcards.hidden=e!=="flashcards",paneTest.classList.toggle("active",e==="test"),paneTest.hidden=e!=="test",updateExportCsvButton()}tabButtons.forEach(e=>e.addEventListener("click",()=>setActiveResultsTab(e.dataset.tab))),tabButtons.forEach((e,t)=>e.addEventListener("keydown",n=>{if(tabButtons.length){if(n.key==="ArrowRight"||n.key==="ArrowDown"){n.preventDefault();const o=tabButtons[(t+1)%tabButtons.length];setActiveResultsTab(o.dataset.tab),o.focus()}else if(n.key==="ArrowLeft"||n.key==="ArrowUp"){n.preventDefault();const o=tabButtons[(t-1+tabButtons.length)%tabButtons.length];setActiveResultsTab(o.dataset.tab),o.focus()}else if(n.key==="Home"){n.preventDefault();const o=tabButtons[0];setActiveResultsTab(o.dataset.tab),o.focus()}else if(n.key==="End"){n.preventDefault();const o=tabButtons[tabButtons.length-1];setActiveResultsTab(o.dataset.tab),o.focus()}}}));function renderFlashcard(){const e=typeof indexResultsUtils.buildFlashcardViewModel=="function"?indexResultsUtils.buildFlashcardViewModel(flashcards,flashcardIndex,flashcardFlipped):{hasCards:!1,progressText:"Card 0 of 0",canGoPrev:!1,canGoNext:!1};if(!e.hasCards){setHidden(flashcardEmpty,!1),setHidden(flashcardCard,!0),flashcardProgress.textContent=e.progressText,flashcardPrevBtn.disabled=!0,flashcardNextBtn.disabled=!0,flashcardFlipBtn.disabled=!0;return}setHidden(flashcardEmpty,!0),setHidden(flashcardCard,!1),flashcardFrontText.textContent=e.front,flashcardBackText.textContent=e.back,flashcardInner.classList.toggle("flipped",e.flipped),flashcardProgress.textContent=e.progressText,flashcardPrevBtn.disabled=!e.canGoPrev,flashcardNextBtn.disabled=!e.canGoNext,flashcardFlipBtn.disabled=!1}function goFlashcard(e){flashcards.length&&(flashcardIndex=Math.max(0,Math.min(flashcards.length-1,flashcardIndex+e)),flashcardFlipped=!1,renderFlashcard())}function flipFlashcard(){flashcards.length&&(flashcardFlipped=!flashcardFlipped,renderFlashcard())}flashcardCard.addEventListener("click",flipFlashcard),flashcardPrevBtn.addEventListener("click",()=>goFlashcard(-1)),flashcardNextBtn.addEventListener("click",()=>goFlashcard(1)),flashcardFlipBtn.addEventListener("click",flipFlashcard);function renderQuizQuestion(){const e=typeof indexResultsUtils.buildQuizViewModel=="function"?indexResultsUtils.buildQuizViewModel(testQuestions,quizIndex,quizScore):{hasQuestions:!1,progressText:"Question 0 of 0",scoreText:"Score: 0/0",options:[]};if(!e.hasQuestions){setHidden(quizEmpty,!1),quizQuestionText.textContent="",quizOptions.innerHTML="",quizExplanation.classList.remove("visible"),setHidden(quizNextBtn,!0),quizProgress.textContent=e.progressText,quizScoreEl.textContent=e.scoreText;return}setHidden(quizEmpty,!0),quizAnswered=!1,quizProgress.textContent=e.progressText,quizScoreEl.textContent=e.scoreText,quizQuestionText.textContent=e.questionText,quizOptions.innerHTML="",quizExplanation.classList.remove("visible"),quizExplanation.textContent="",e.options.forEach(t=>{const n=document.createElement("button");n.type="button",n.className="quiz-option",n.textContent=t,n.addEventListener("click",()=>answerQuizOption(n,t)),quizOptions.appendChild(n)}),setHidden(quizNextBtn,!0)}function answerQuizOption(e,t){if(quizAnswered)return;quizAnswered=!0;const n=typeof indexResultsUtils.evaluateQuizAnswer=="function"?indexResultsUtils.evaluateQuizAnswer(testQuestions,quizIndex,quizScore,t):{correctAnswer:"",explanation:"",hasNext:!1,nextScore:quizScore,selectedCorrect:!1};[...quizOptions.querySelectorAll(".quiz-option")].forEach(s=>{s.disabled=!0,s.textContent===n.correctAnswer&&s.classList.add("correct")}),n.selectedCorrect?(e.classList.add("correct"),quizScore=n.nextScore):e.classList.add("wrong"),quizScoreEl.textContent=`Score: ${quizScore}/${testQuestions.length}`,quizExplanation.textContent=n.explanation,quizExplanation.classList.add("visible"),setHidden(quizNextBtn,!n.hasNext)}quizNextBtn.addEventListener("click",()=>{quizIndex<testQuestions.length-1&&(quizIndex+=1,renderQuizQuestion())});function showResults(e,t,n,o,s,r,i,a,c,l,d,u,f){const m=currentJobId,g=modeConfig[currentMode];resultMarkdown=e||"",slideText=t||"",transcript=n||"",flashcards=Array.isArray(o)?o:[],testQuestions=Array.isArray(s)?s:[],interviewSummaryText=c||"",interviewSectionsText=l||"",interviewCombinedText=d||"",studyGenerationError=r,currentStudyPackId=i,currentStudyPackId&&(userHasCreatedStudyPack=!0,userProfileLoaded=!0),currentBillingReceipt=f&&typeof f=="object"?f:null,resultsLocked=!0,updateQuickstartVisibility(),resultsTitleText.textContent=g.resultTitle,setSanitizedHtml(resultsContent,simpleMarkdownToHtml(resultMarkdown),{ALLOWED_TAGS:["h1","h2","h3","p","br","strong","em","code","pre","ul","ol","li","blockquote","a","hr"],ALLOWED_ATTR:["href","title","target","rel"]}),flashcardCountBadge.textContent=String(flashcards.length),testCountBadge.textContent=String(testQuestions.length);const p=typeof indexResultsUtils.buildStudyWarning=="function"?indexResultsUtils.buildStudyWarning({currentMode,selectedInterviewFeatures,studyFeatures:a,studyGenerationError,successfulInterviewFeatures:u}):"";setHidden(studyWarning,!p),studyWarning.textContent=p,renderBillingReceipt(currentMode==="interview"?currentBillingReceipt:null),flashcardIndex=0,flashcardFlipped=!1,quizIndex=0,quizScore=0,renderFlashcard(),renderQuizQuestion(),setHidden(tabFlashcards,currentMode==="interview"),setHidden(tabTest,currentMode==="interview"),setActiveResultsTab("notes"),tabFlashcards.disabled=currentMode==="interview"||!flashcards.length,tabTest.disabled=currentMode==="interview"||!testQuestions.length,progressSection.classList.remove("visible"),showProgressSafeBanner(!1),setProgressRetryVisible(!1),resultsSection.classList.add("visible"),buildDownloadDropdown(),updateExportCsvButton(),m&&removeActiveRuntimeJob(m),updateProcessButton(),showToast("Processing complete!","success")}function showError(e,t,n){const o=currentJobId;setProgressRetryVisible(!1),renderBillingReceipt(null),progressStatus.classList.add("error"),setHidden(progressSpinner,!0),showProgressSafeBanner(!1);const s=buildBillingReceiptText(n);t?(announceProgressError(`Error: ${e} - Your credit has been refunded.`),showToast("Processing failed. Your credit has been refunded.","info",5e3),fetchUserData()):announceProgressError(`Error: ${e}`),s&&showToast(s,"info",5500),o&&removeActiveRuntimeJob(o),updateProcessButton()}function resetResultsState(){resultMarkdown="",slideText="",transcript="",flashcards=[],testQuestions=[],interviewSummaryText="",interviewSectionsText="",interviewCombinedText="",currentBillingReceipt=null,currentStudyPackId=null,resultsLocked=!1,updateQuickstartVisibility(),flashcardCountBadge.textContent="0",testCountBadge.textContent="0",setHidden(studyWarning,!0),renderBillingReceipt(null),setHidden(exportStudyCsvBtn,!0),showProgressSafeBanner(!1),setHidden(tabFlashcards,!1),setHidden(tabTest,!1),tabFlashcards.disabled=!1,tabTest.disabled=!1,setActiveResultsTab("notes")}function showPricingModal(){window.location.href="/buy_credits"}function hidePricingModal(){}function showHistoryModal(){window.location.href="/buy_credits"}function hideHistoryModal(){}function formatPrice(e,t){if(displayFormatUtils&&typeof displayFormatUtils.formatCurrencyFromCents=="function")return displayFormatUtils.formatCurrencyFromCents(e,t);const n=(Number(e||0)/100).toFixed(2);return String(t||"eur").toLowerCase()==="eur"?`\u20AC${n}`:`${n} ${String(t||"EUR").toUpperCase()}`}function formatCreditsText(e){return Object.entries(e).map(([t,n])=>`${n} ${t.replace(/_/g," ").replace("credits ","").replace("credits","").trim()}`).join(", ")}function setHistoryMessage(e,t=!1){for(;historyList.firstChild;)historyList.removeChild(historyList.firstChild);const n=document.createElement("div");if(n.className=t?"history-loading":"history-empty",t){const s=document.createElement("div");s.className="spinner",n.appendChild(s)}const o=document.createElement("span");o.textContent=e,n.appendChild(o),historyList.appendChild(n)}function setHistoryLoadingSkeleton(){for(;historyList.firstChild;)historyList.removeChild(historyList.firstChild);const e=document.createElement("div");e.className="history-skeleton-list";for(let t=0;t<3;t+=1){const n=document.createElement("div");n.className="history-skeleton-item";const o=document.createElement("div");o.className="history-skeleton-left";const s=document.createElement("div");s.className="history-skeleton-line title";const r=document.createElement("div");r.className="history-skeleton-line meta";const i=document.createElement("div");i.className="history-skeleton-line submeta",o.appendChild(s),o.appendChild(r),o.appendChild(i);const a=document.createElement("div");a.className="history-skeleton-price",n.appendChild(o),n.appendChild(a),e.appendChild(n)}historyList.appendChild(e)}function setHistoryEmptyState(){for(;historyList.firstChild;)historyList.removeChild(historyList.firstChild);const e=document.createElement("div");e.className="history-empty";const t=document.createElement("span");t.textContent="No purchases yet";const n=document.createElement("div");n.className="history-empty-note",n.textContent="You can keep using free credits or buy a bundle when you need more.";const o=document.createElement("button");o.type="button",o.className="history-empty-action",o.textContent="Buy credits",o.addEventListener("click",()=>{showPricingModal()}),e.appendChild(t),e.appendChild(n),e.appendChild(o),historyList.appendChild(e)}async function loadPurchaseHistory(){if(setHistoryLoadingSkeleton(),!!currentUser)try{const t=await(await authenticatedFetch("/api/purchase-history")).json();if(!t.purchases||!t.purchases.length){setHistoryEmptyState();return}for(;historyList.firstChild;)historyList.removeChild(historyList.firstChild);t.purchases.forEach(n=>{const o=document.createElement("div");o.className="history-item";const s=document.createElement("div");s.className="history-item-left";const r=document.createElement("div");r.className="history-item-name",r.textContent=n.bundle_name||"-";const i=document.createElement("div");i.className="history-item-date",i.textContent=displayFormatUtils&&typeof displayFormatUtils.formatDateTimeFromEpochSeconds=="function"?displayFormatUtils.formatDateTimeFromEpochSeconds(n.created_at):"-";const a=document.createElement("div");a.className="history-item-credits",a.textContent=formatCreditsText(n.credits||{}),s.appendChild(r),s.appendChild(i),s.appendChild(a);const c=document.createElement("div");c.className="history-item-price",c.textContent=formatPrice(n.price_cents||0,n.currency||"eur"),o.appendChild(s),o.appendChild(c),historyList.appendChild(o)})}catch(e){setHistoryMessage("Could not load purchase history. Please try again.")}}async function purchaseBundle(e){if(!currentUser){showAuthModal();return}const t=getCheckoutCooldownSeconds();if(t>0){applyCheckoutButtonsState(),showToast(`Checkout temporarily limited. Try again in ${formatRetryDelay(t)}.`,"info",4500);return}if(checkoutRequestInFlight)return;checkoutRequestInFlight=!0,document.querySelectorAll(".bundle-buy-btn").forEach(o=>{o.disabled=!0,o.dataset.bundleId===e&&(o.textContent="Redirecting...")});try{trackEvent("checkout_started",{bundle_id:e},{preferBeacon:!0});const o=await authenticatedFetch("/api/create-checkout-session",{method:"POST",headers:{"Content-Type":"application/json"},body:JSON.stringify({bundle_id:e})}),s=await o.json();if(s.error){if(o.status===429){const r=getRetryAfterSeconds(o,s),i=r?`${s.error} Try again in ${formatRetryDelay(r)}.`:s.error;showToast(i,"info",6e3),checkoutRequestInFlight=!1,r>0?startCheckoutCooldown(r):applyCheckoutButtonsState()}else showToast(s.error,"error"),checkoutRequestInFlight=!1,applyCheckoutButtonsState();return}if(s.checkout_url){window.location.href=s.checkout_url;return}showToast("Could not start checkout. Please try again.","error"),checkoutRequestInFlight=!1,applyCheckoutButtonsState()}catch(o){captureClientError(o,"purchase_bundle"),showToast("Something went wrong. Please try again.","error"),checkoutRequestInFlight=!1,applyCheckoutButtonsState()}}displayFormatUtils&&typeof displayFormatUtils.applyPricingCatalog=="function"&&displayFormatUtils.applyPricingCatalog(document);async function confirmCheckoutSession(e){if(!e)return{ok:!1,status:"missing_session"};if(!currentUser)return{ok:!1,status:"not_signed_in"};try{const t=await authenticatedFetch(`/api/confirm-checkout-session?session_id=${encodeURIComponent(e)}`),n=await t.json();return t.ok?{ok:!0,status:n.status||"granted"}:{ok:!1,status:n.error||"confirm_failed"}}catch(t){return captureClientError(t,"confirm_checkout_session"),{ok:!1,status:"confirm_failed"}}}async function checkPaymentResult(){const e=new URLSearchParams(window.location.search),t=e.get("payment"),n=e.get("session_id");if(t==="success"){let o=!1;n&&(o=(await confirmCheckoutSession(n)).ok),o?(showToast("Payment successful! Your credits have been added.","success",5e3),trackEvent("payment_confirmed",{session_id:n||""},{preferBeacon:!0})):showToast("Payment received. Credits may take a few seconds to appear.","info",5e3),window.history.replaceState({},"",window.location.pathname),setTimeout(()=>{currentUser&&fetchUserData()},1e3),setTimeout(()=>{currentUser&&fetchUserData()},4e3)}else t==="cancelled"&&(showToast("Payment cancelled. No charges were made.","info",4e3),trackEvent("payment_cancelled",{},{preferBeacon:!0}),window.history.replaceState({},"",window.location.pathname))}function maybeOpenAuthModalFromQuery(){const e=new URLSearchParams(window.location.search),t=String(e.get("auth")||"").trim().toLowerCase();if(!t)return;const n=["signin","signup","reset"].includes(t)?t:"signin";showAuthModal(n),e.delete("auth");const o=e.toString(),s=window.location.pathname+(o?`?${o}`:"")+window.location.hash;window.history.replaceState({},"",s)}headerSignInBtn&&headerSignInBtn.addEventListener("click",()=>showAuthModal("signin")),signInToProcessBtn.addEventListener("click",()=>showAuthModal("signin")),authModalClose.addEventListener("click",hideAuthModal),authOverlay.addEventListener("click",e=>{e.target===authOverlay&&hideAuthModal()}),switchToSignup.addEventListener("click",e=>{e.preventDefault(),showAuthView("signup")}),switchToSignin.addEventListener("click",e=>{e.preventDefault(),showAuthView("signin")}),forgotPasswordLink.addEventListener("click",e=>{e.preventDefault(),showAuthView("reset")}),backToSignin.addEventListener("click",e=>{e.preventDefault(),showAuthView("signin")}),signinForm.addEventListener("submit",async e=>{e.preventDefault(),await signInWithEmail(signinEmail.value.trim(),signinPassword.value)}),signupForm.addEventListener("submit",async e=>{if(e.preventDefault(),signupPassword.value!==signupPasswordConfirm.value){showAuthError(signupError,"Passwords do not match.");return}await signUpWithEmail(signupEmail.value.trim(),signupPassword.value)}),resetForm.addEventListener("submit",async e=>{e.preventDefault(),await sendPasswordReset(resetEmail.value.trim())}),googleSignInBtn.addEventListener("click",signInWithGoogle),googleSignUpBtn.addEventListener("click",signInWithGoogle),document.querySelectorAll(".password-toggle").forEach(e=>{e.addEventListener("click",()=>{const t=document.getElementById(e.dataset.target),n=e.querySelector(".eye-open"),o=e.querySelector(".eye-closed");t.type==="password"?(t.type="text",setHidden(n,!0),setHidden(o,!1)):(t.type="password",setHidden(n,!1),setHidden(o,!0))})}),headerNavToggle&&headerNavToggle.addEventListener("click",()=>{const e=!(headerSidebar&&headerSidebar.classList.contains("visible"));closeHeaderDropdowns(e?"sidebar":""),setHeaderSidebarVisible(e)}),headerSidebarClose&&headerSidebarClose.addEventListener("click",()=>setHeaderSidebarVisible(!1)),headerSidebarBackdrop&&headerSidebarBackdrop.addEventListener("click",()=>setHeaderSidebarVisible(!1)),signOutBtn&&signOutBtn.addEventListener("click",signOut),userButton&&userDropdown&&(userButton.addEventListener("click",e=>{e.stopPropagation();const t=!userDropdown.classList.contains("visible");closeHeaderDropdowns(t?"user":""),setUserDropdownVisible(t)}),userButton.addEventListener("keydown",e=>{if(e.key==="ArrowDown"&&(e.preventDefault(),closeHeaderDropdowns("user"),setUserDropdownVisible(!0),focusMenuItem(userDropdown,".user-dropdown-item","first")),e.key==="ArrowUp"&&(e.preventDefault(),closeHeaderDropdowns("user"),setUserDropdownVisible(!0),focusMenuItem(userDropdown,".user-dropdown-item","last")),e.key==="Enter"||e.key===" "){e.preventDefault();const t=!userDropdown.classList.contains("visible");closeHeaderDropdowns(t?"user":""),setUserDropdownVisible(t)}e.key==="Escape"&&(e.preventDefault(),setUserDropdownVisible(!1))}),userDropdown.addEventListener("keydown",e=>{e.key==="ArrowDown"&&(e.preventDefault(),focusMenuItem(userDropdown,".user-dropdown-item","next")),e.key==="ArrowUp"&&(e.preventDefault(),focusMenuItem(userDropdown,".user-dropdown-item","prev")),e.key==="Home"&&(e.preventDefault(),focusMenuItem(userDropdown,".user-dropdown-item","first")),e.key==="End"&&(e.preventDefault(),focusMenuItem(userDropdown,".user-dropdown-item","last")),e.key==="Escape"&&(e.preventDefault(),setUserDropdownVisible(!1),userButton.focus()),e.key==="Tab"&&setUserDropdownVisible(!1)})),document.addEventListener("click",e=>{userMenu&&!userMenu.contains(e.target)&&setUserDropdownVisible(!1)}),buyCreditsBtn&&buyCreditsBtn.addEventListener("click",()=>{setUserDropdownVisible(!1),showPricingModal()}),purchaseHistoryBtn&&purchaseHistoryBtn.addEventListener("click",()=>{setUserDropdownVisible(!1),showHistoryModal()}),exportDataBtn&&exportDataBtn.addEventListener("click",async()=>{setUserDropdownVisible(!1),await exportMyAccountData()}),deleteAccountBtn&&deleteAccountBtn.addEventListener("click",async()=>{setUserDropdownVisible(!1),await deleteMyAccountData()}),deleteAccountClose&&deleteAccountClose.addEventListener("click",closeDeleteAccountModal),deleteAccountCancelBtn&&deleteAccountCancelBtn.addEventListener("click",closeDeleteAccountModal),deleteAccountConfirmBtn&&deleteAccountConfirmBtn.addEventListener("click",submitDeleteAccountModal),deleteAccountOverlay&&deleteAccountOverlay.addEventListener("click",e=>{e.target===deleteAccountOverlay&&closeDeleteAccountModal()}),deleteAccountTextInput&&deleteAccountTextInput.addEventListener("keydown",e=>{e.key==="Enter"&&(e.preventDefault(),submitDeleteAccountModal())}),deleteAccountEmailInput&&deleteAccountEmailInput.addEventListener("keydown",e=>{e.key==="Enter"&&(e.preventDefault(),submitDeleteAccountModal())}),headerStudyLibraryBtn&&headerStudyLibraryBtn.addEventListener("click",()=>{setHeaderSidebarVisible(!1),trackEvent("study_mode_opened",{source:"header_study_library"},{preferBeacon:!0}),window.location.href="/study"}),headerFeaturesBtn&&headerFeaturesBtn.addEventListener("click",()=>{setHeaderSidebarVisible(!1),window.location.href="/features"}),headerToolsBtn&&headerToolsBtn.addEventListener("click",()=>{setHeaderSidebarVisible(!1),trackEvent("tools_page_opened",{source:"header_tools"},{preferBeacon:!0}),window.location.href="/tools"}),headerPlannerBtn&&headerPlannerBtn.addEventListener("click",()=>{if(window.matchMedia("(hover: none), (pointer: coarse)").matches&&headerPlannerGroup&&!headerPlannerGroup.classList.contains("open")){headerPlannerGroup.classList.add("open");return}setHeaderSidebarVisible(!1),window.location.href="/plan"}),headerPlannerGroup&&(headerPlannerGroup.addEventListener("mouseenter",()=>{headerPlannerGroup.classList.add("open")}),headerPlannerGroup.addEventListener("mouseleave",()=>{headerPlannerGroup.classList.remove("open")})),headerCalendarBtn&&headerCalendarBtn.addEventListener("click",()=>{setHeaderSidebarVisible(!1),window.location.href="/calendar"});function openGoalModal(){currentUser&&(goalModalError.classList.remove("visible"),goalModalError.textContent="",goalModalInput.value=String(getProgressSummaryForHeader(currentUser.uid).daily_goal),openOverlay(goalModalOverlay),setTimeout(()=>goalModalInput.focus(),30),setTimeout(()=>goalModalInput.select(),30))}function closeGoalModal(){closeOverlay(goalModalOverlay)}async function saveGoalFromModal(){if(!currentUser)return;const e=progressUtils&&typeof progressUtils.parseGoalValue=="function"?progressUtils.parseGoalValue(goalModalInput.value):parseInt(String(goalModalInput.value||"").trim(),10);if(!Number.isFinite(e)||e<1||e>500){goalModalError.textContent="Use a number between 1 and 500.",goalModalError.classList.add("visible");return}try{const t=await authenticatedFetch("/api/study-progress",{method:"PUT",headers:{"Content-Type":"application/json"},body:JSON.stringify({daily_goal:e,timezone:Intl.DateTimeFormat().resolvedOptions().timeZone||""})});if(!t.ok){const n=await t.json().catch(()=>({}));throw new Error(n.error||"Could not sync daily goal.")}progressUtils&&typeof progressUtils.writeDailyGoalCache=="function"?progressUtils.writeDailyGoalCache(currentUser.uid,e):localStorage.setItem(`daily_goal_${currentUser.uid}`,String(e)),progressSummaryCache=Object.assign({},progressSummaryCache||{},{daily_goal:e}),await fetchStudyProgressSummary(),closeGoalModal(),showToast("Daily goal updated.","success",1800)}catch(t){console.warn("Could not sync daily goal:",t),goalModalError.textContent=t&&t.message?t.message:"Could not sync daily goal.",goalModalError.classList.add("visible");return}}progressButton&&progressDropdown&&(progressButton.addEventListener("click",e=>{e.stopPropagation();const t=!progressDropdown.classList.contains("visible");closeHeaderDropdowns(t?"progress":""),setProgressDropdownVisible(t),t&&refreshStudyHeaderMetrics()}),progressButton.addEventListener("keydown",e=>{if(e.key==="ArrowDown"&&(e.preventDefault(),closeHeaderDropdowns("progress"),setProgressDropdownVisible(!0),refreshStudyHeaderMetrics(),focusMenuItem(progressDropdown,".progress-action-btn","first")),e.key==="ArrowUp"&&(e.preventDefault(),closeHeaderDropdowns("progress"),setProgressDropdownVisible(!0),refreshStudyHeaderMetrics(),focusMenuItem(progressDropdown,".progress-action-btn","last")),e.key==="Enter"||e.key===" "){e.preventDefault();const t=!progressDropdown.classList.contains("visible");closeHeaderDropdowns(t?"progress":""),setProgressDropdownVisible(t),t&&refreshStudyHeaderMetrics()}e.key==="Escape"&&(e.preventDefault(),setProgressDropdownVisible(!1))}),progressDropdown.addEventListener("keydown",e=>{e.key==="ArrowDown"&&(e.preventDefault(),focusMenuItem(progressDropdown,".progress-action-btn","next")),e.key==="ArrowUp"&&(e.preventDefault(),focusMenuItem(progressDropdown,".progress-action-btn","prev")),e.key==="Home"&&(e.preventDefault(),focusMenuItem(progressDropdown,".progress-action-btn","first")),e.key==="End"&&(e.preventDefault(),focusMenuItem(progressDropdown,".progress-action-btn","last")),e.key==="Escape"&&(e.preventDefault(),setProgressDropdownVisible(!1),progressButton.focus()),e.key==="Tab"&&setProgressDropdownVisible(!1)})),progressSetGoalBtn&&progressSetGoalBtn.addEventListener("click",e=>{e.stopPropagation(),setHeaderSidebarVisible(!1),setProgressDropdownVisible(!1),openGoalModal()}),progressOpenPlanBtn&&progressOpenPlanBtn.addEventListener("click",()=>{setHeaderSidebarVisible(!1),setProgressDropdownVisible(!1),window.location.href="/plan"}),progressOpenCalendarBtn&&progressOpenCalendarBtn.addEventListener("click",()=>{setHeaderSidebarVisible(!1),setProgressDropdownVisible(!1),window.location.href="/calendar"});let mobileCreditsTooltipTimer=null;creditsDisplay&&creditsDisplay.addEventListener("click",e=>{if(!window.matchMedia("(hover: none), (pointer: coarse)").matches){showPricingModal();return}if(!creditsDisplay.classList.contains("tooltip-open")){e.preventDefault(),creditsDisplay.classList.add("tooltip-open"),mobileCreditsTooltipTimer&&clearTimeout(mobileCreditsTooltipTimer),mobileCreditsTooltipTimer=setTimeout(()=>{creditsDisplay.classList.remove("tooltip-open")},2600);return}creditsDisplay.classList.remove("tooltip-open"),mobileCreditsTooltipTimer&&clearTimeout(mobileCreditsTooltipTimer),showPricingModal()}),document.addEventListener("click",e=>{creditsDisplay&&!creditsDisplay.contains(e.target)&&(creditsDisplay.classList.remove("tooltip-open"),mobileCreditsTooltipTimer&&clearTimeout(mobileCreditsTooltipTimer)),progressMenu&&!progressMenu.contains(e.target)&&setProgressDropdownVisible(!1)}),document.addEventListener("keydown",e=>{e.key==="Escape"&&setHeaderSidebarVisible(!1)}),goalModalCancelBtn.addEventListener("click",closeGoalModal),goalModalSaveBtn.addEventListener("click",saveGoalFromModal),goalModalInput.addEventListener("keydown",e=>{e.key==="Enter"&&(e.preventDefault(),saveGoalFromModal()),e.key==="Escape"&&(e.preventDefault(),closeGoalModal())}),goalModalOverlay.addEventListener("click",e=>{e.target===goalModalOverlay&&closeGoalModal()}),window.addEventListener("focus",()=>{currentUser?fetchStudyProgressSummary():refreshStudyHeaderMetrics()}),document.addEventListener("visibilitychange",()=>{document.hidden||(currentUser?fetchStudyProgressSummary():refreshStudyHeaderMetrics())}),adminDashboardBtn&&adminDashboardBtn.addEventListener("click",async()=>{if(setUserDropdownVisible(!1),!currentUser||!currentUserIsAdmin){showToast("Admin access is only available for configured admin accounts.","error",4200);return}try{if(!(await authenticatedFetch("/api/session/login",{method:"POST",headers:{"Content-Type":"application/json"},body:JSON.stringify({})})).ok)throw new Error("Could not start admin session.");window.location.href="/admin"}catch(e){captureClientError(e,"admin_session_login"),showToast("Could not open admin dashboard right now. Please retry.","error",4500)}}),buyCreditsLink.addEventListener("click",e=>{e.preventDefault(),showPricingModal()}),pricingModalClose.addEventListener("click",hidePricingModal),pricingOverlay.addEventListener("click",e=>{e.target===pricingOverlay&&void 0}),historyModalClose.addEventListener("click",hideHistoryModal),historyOverlay.addEventListener("click",e=>{e.target===historyOverlay&&void 0}),document.addEventListener("keydown",e=>{if(!activeModalOverlay)return;if(e.key==="Escape"){e.preventDefault(),activeModalOverlay===authOverlay?hideAuthModal():activeModalOverlay===pricingOverlay?void 0:activeModalOverlay===historyOverlay?void 0:activeModalOverlay===goalModalOverlay?closeGoalModal():activeModalOverlay===deleteAccountOverlay&&closeDeleteAccountModal();return}if(e.key!=="Tab")return;const t=getFocusableElements(activeModalOverlay);if(!t.length)return;const n=t[0],o=t[t.length-1],s=document.activeElement;e.shiftKey&&s===n?(e.preventDefault(),o.focus()):!e.shiftKey&&s===o&&(e.preventDefault(),n.focus())}),document.querySelectorAll(".bundle-buy-btn").forEach(e=>e.addEventListener("click",()=>purchaseBundle(e.dataset.bundleId))),downloadButton.addEventListener("click",e=>{e.stopPropagation();const t=!downloadDropdownContent.classList.contains("visible");closeHeaderDropdowns(t?"download":""),setDownloadDropdownVisible(t),t&&focusMenuItem(downloadDropdownContent,".dropdown-item","first")}),downloadButton.addEventListener("keydown",e=>{if(e.key==="ArrowDown"&&(e.preventDefault(),closeHeaderDropdowns("download"),setDownloadDropdownVisible(!0),focusMenuItem(downloadDropdownContent,".dropdown-item","first")),e.key==="ArrowUp"&&(e.preventDefault(),closeHeaderDropdowns("download"),setDownloadDropdownVisible(!0),focusMenuItem(downloadDropdownContent,".dropdown-item","last")),e.key==="Enter"||e.key===" "){e.preventDefault();const t=!downloadDropdownContent.classList.contains("visible");closeHeaderDropdowns(t?"download":""),setDownloadDropdownVisible(t),t&&focusMenuItem(downloadDropdownContent,".dropdown-item","first")}e.key==="Escape"&&(e.preventDefault(),setDownloadDropdownVisible(!1))}),downloadDropdownContent.addEventListener("keydown",e=>{e.key==="ArrowDown"&&(e.preventDefault(),focusMenuItem(downloadDropdownContent,".dropdown-item","next")),e.key==="ArrowUp"&&(e.preventDefault(),focusMenuItem(downloadDropdownContent,".dropdown-item","prev")),e.key==="Home"&&(e.preventDefault(),focusMenuItem(downloadDropdownContent,".dropdown-item","first")),e.key==="End"&&(e.preventDefault(),focusMenuItem(downloadDropdownContent,".dropdown-item","last")),e.key==="Escape"&&(e.preventDefault(),setDownloadDropdownVisible(!1),downloadButton.focus()),e.key==="Tab"&&setDownloadDropdownVisible(!1)}),moreActionsButton.addEventListener("click",e=>{e.stopPropagation();const t=!moreActionsContent.classList.contains("visible");closeHeaderDropdowns(t?"more-actions":""),setMoreActionsDropdownVisible(t),t&&focusMenuItem(moreActionsContent,".dropdown-item","first")}),moreActionsButton.addEventListener("keydown",e=>{if(e.key==="ArrowDown"&&(e.preventDefault(),closeHeaderDropdowns("more-actions"),setMoreActionsDropdownVisible(!0),focusMenuItem(moreActionsContent,".dropdown-item","first")),e.key==="ArrowUp"&&(e.preventDefault(),closeHeaderDropdowns("more-actions"),setMoreActionsDropdownVisible(!0),focusMenuItem(moreActionsContent,".dropdown-item","last")),e.key==="Enter"||e.key===" "){e.preventDefault();const t=!moreActionsContent.classList.contains("visible");closeHeaderDropdowns(t?"more-actions":""),setMoreActionsDropdownVisible(t),t&&focusMenuItem(moreActionsContent,".dropdown-item","first")}e.key==="Escape"&&(e.preventDefault(),setMoreActionsDropdownVisible(!1))}),moreActionsContent.addEventListener("keydown",e=>{e.key==="ArrowDown"&&(e.preventDefault(),focusMenuItem(moreActionsContent,".dropdown-item","next")),e.key==="ArrowUp"&&(e.preventDefault(),focusMenuItem(moreActionsContent,".dropdown-item","prev")),e.key==="Home"&&(e.preventDefault(),focusMenuItem(moreActionsContent,".dropdown-item","first")),e.key==="End"&&(e.preventDefault(),focusMenuItem(moreActionsContent,".dropdown-item","last")),e.key==="Escape"&&(e.preventDefault(),setMoreActionsDropdownVisible(!1),moreActionsButton.focus()),e.key==="Tab"&&setMoreActionsDropdownVisible(!1)}),document.addEventListener("click",e=>{downloadDropdown.contains(e.target)||setDownloadDropdownVisible(!1),moreActionsDropdown.contains(e.target)||setMoreActionsDropdownVisible(!1)}),copyButton.addEventListener("click",async()=>{setMoreActionsDropdownVisible(!1);try{await navigator.clipboard.writeText(resultMarkdown),copyButtonText.textContent="Copied!",showToast("Notes copied to clipboard","success"),setTimeout(()=>{copyButtonText.textContent="Copy notes"},1800)}catch(e){showToast("Failed to copy notes","error")}}),exportStudyCsvBtn.addEventListener("click",async()=>{if(setMoreActionsDropdownVisible(!1),!currentJobId)return;const e=exportCsvType==="test"?`practice-test-${currentJobId}.csv`:`flashcards-${currentJobId}.csv`;try{await downloadAuthenticatedFile(`/download-flashcards-csv/${currentJobId}?type=${encodeURIComponent(exportCsvType)}`,e),showToast("CSV download started.","success")}catch(t){showToast(t.message||"Could not export CSV.","error")}}),studyLibraryBtn.addEventListener("click",()=>{setMoreActionsDropdownVisible(!1),trackEvent("study_mode_opened",{source:"results_library"},{preferBeacon:!0}),window.location.href="/study"}),studyNowBtn.addEventListener("click",()=>{if(closeHeaderDropdowns(""),!currentStudyPackId){showToast("No saved study pack available yet for this result.","info");return}trackEvent("study_mode_opened",{source:"results_study_now",pack_id:currentStudyPackId},{preferBeacon:!0}),window.open(`/study?pack_id=${encodeURIComponent(currentStudyPackId)}&mode=learn`,"_blank")}),newLectureButton.addEventListener("click",()=>{setMoreActionsDropdownVisible(!1),(recordingState==="recording"||recordingState==="paused")&&(discardNextRecordingResult=!0,stopAudioRecording()),pdfFile=null,audioFile=null,audioFileOrigin="upload",recordedAudioNeedsDownload=!1,recorderStatusMessage="",recorderStatusTone="info",releaseImportedAudioToken({clearStatus:!0}),currentJobId=null,trackedTerminalJobId="",pdfInput.value="",audioInput.value="",setHidden(pdfInfo,!0),pdfZone.classList.remove("has-file"),syncAudioInfoUI(),progressSection.classList.remove("visible"),showProgressSafeBanner(!1),setProgressRetryVisible(!1),resultsSection.classList.remove("visible"),progressStatus.classList.remove("error"),setHidden(progressSpinner,!1),resetResultsState(),switchMode(currentMode),updateProcessButton(),window.scrollTo({top:0,behavior:"smooth"})}),quickstartApplyBtn&&quickstartApplyBtn.addEventListener("click",()=>{applyRecommendedSetup(),updateQuickstartVisibility()}),quickstartDismissBtn&&quickstartDismissBtn.addEventListener("click",()=>{if(currentUser&&currentUser.uid)try{localStorage.setItem(`quickstart_dismissed_${currentUser.uid}`,"1")}catch(e){}setQuickstartVisible(!1)}),progressRetryBtn.addEventListener("click",retryStatusCheckNow),studyToolsToggle.addEventListener("click",e=>{e.stopPropagation(),studyToolsPanel.classList.toggle("visible"),studyToolsToggle.classList.toggle("open",studyToolsPanel.classList.contains("visible"))}),studyToolChips.forEach(e=>{e.addEventListener("click",()=>{setStudyFeature(e.dataset.studyFeatures||"none")})}),flashcardAmountChips.forEach(e=>{e.addEventListener("click",()=>{e.disabled||setAmountSelection("flashcards",e.dataset.value)})}),questionAmountChips.forEach(e=>{e.addEventListener("click",()=>{e.disabled||setAmountSelection("questions",e.dataset.value)})}),interviewOptionButtons.forEach(e=>{e.addEventListener("click",()=>{if(e.disabled)return;const t=e.dataset.feature;if(t){if(selectedInterviewFeatures.includes(t))selectedInterviewFeatures=selectedInterviewFeatures.filter(n=>n!==t);else{const n=userCredits?Math.max(0,Number(userCredits.slides||0)):2;if(selectedInterviewFeatures.length>=n){showToast("Not enough text extraction credits for more interview extras.","info",2600),updateInterviewOptionsUI();return}selectedInterviewFeatures.push(t)}selectedInterviewFeatures=selectedInterviewFeatures.slice(0,2),updateInterviewOptionsUI()}})}),outputLanguageButton.addEventListener("click",e=>{e.stopPropagation();const t=!outputLanguageMenu.classList.contains("visible");closeHeaderDropdowns(t?"language":""),setOutputLanguageMenuVisible(t),t&&focusMenuItem(outputLanguageMenu,".app-select-item","active")}),outputLanguageButton.addEventListener("keydown",e=>{if(e.key==="ArrowDown"&&(e.preventDefault(),closeHeaderDropdowns("language"),setOutputLanguageMenuVisible(!0),focusMenuItem(outputLanguageMenu,".app-select-item","active")),e.key==="ArrowUp"&&(e.preventDefault(),closeHeaderDropdowns("language"),setOutputLanguageMenuVisible(!0),focusMenuItem(outputLanguageMenu,".app-select-item","last")),e.key==="Enter"||e.key===" "){e.preventDefault();const t=!outputLanguageMenu.classList.contains("visible");closeHeaderDropdowns(t?"language":""),setOutputLanguageMenuVisible(t),t&&focusMenuItem(outputLanguageMenu,".app-select-item","active")}e.key==="Escape"&&(e.preventDefault(),setOutputLanguageMenuVisible(!1))}),outputLanguageMenu.addEventListener("keydown",e=>{e.key==="ArrowDown"&&(e.preventDefault(),focusMenuItem(outputLanguageMenu,".app-select-item","next")),e.key==="ArrowUp"&&(e.preventDefault(),focusMenuItem(outputLanguageMenu,".app-select-item","prev")),e.key==="Home"&&(e.preventDefault(),focusMenuItem(outputLanguageMenu,".app-select-item","first")),e.key==="End"&&(e.preventDefault(),focusMenuItem(outputLanguageMenu,".app-select-item","last")),e.key==="Escape"&&(e.preventDefault(),setOutputLanguageMenuVisible(!1),outputLanguageButton.focus()),e.key==="Tab"&&setOutputLanguageMenuVisible(!1)}),outputLanguageItems.forEach(e=>{e.addEventListener("click",()=>{const t=e.dataset.value||"english";setOutputLanguage(t,e.textContent.trim()),setOutputLanguageMenuVisible(!1),t==="other"?(outputLanguageCustom.focus(),outputLanguageCustom.select()):(scheduleLanguagePreferenceSave(),outputLanguageButton.focus())})}),outputLanguageCustom.addEventListener("input",()=>{outputLanguageSelect.value==="other"&&(outputLanguageLabel.textContent=getLanguageLabel("other",outputLanguageCustom.value),scheduleLanguagePreferenceSave())}),outputLanguageCustom.addEventListener("blur",()=>{outputLanguageSelect.value==="other"&&(outputLanguageLabel.textContent=getLanguageLabel("other",outputLanguageCustom.value),scheduleLanguagePreferenceSave())}),audioUrlFetchBtn&&audioUrlFetchBtn.addEventListener("click",importAudioFromUrl),otherAudioToggle&&otherAudioToggle.addEventListener("click",()=>{otherAudioOpen=!otherAudioOpen,syncProcessingLayout()}),audioUrlAdvancedToggle&&audioUrlAdvancedToggle.addEventListener("click",()=>{setAudioUrlAdvancedOpen(!(audioUrlAdvanced&&audioUrlAdvanced.classList.contains("is-open")))}),audioUrlInput&&(audioUrlInput.addEventListener("input",()=>{syncAudioImportStatusForUrlChange()}),audioUrlInput.addEventListener("paste",()=>{window.setTimeout(()=>{importAudioFromUrl({url:getCurrentAudioImportUrl(),reason:"paste"})},0)}),audioUrlInput.addEventListener("keydown",e=>{e.key==="Enter"&&(e.preventDefault(),importAudioFromUrl({reason:"manual"}))})),languageOnboardingButtons.forEach(e=>{e.addEventListener("click",()=>{setOnboardingLanguageSelection(e.dataset.value||"english"),setOnboardingError(""),(e.dataset.value||"")==="other"&&languageOnboardingCustom.focus()})}),languageOnboardingCustom.addEventListener("input",()=>setOnboardingError("")),languageOnboardingCustom.addEventListener("keydown",e=>{e.key==="Enter"&&(e.preventDefault(),saveLanguageOnboardingPreference())}),languageOnboardingSaveBtn.addEventListener("click",saveLanguageOnboardingPreference),languageOnboardingOverlay.addEventListener("click",e=>{e.target===languageOnboardingOverlay&&languageOnboardingCustom.focus()}),document.addEventListener("click",e=>{!studyToolsPanel.contains(e.target)&&!studyToolsToggle.contains(e.target)&&(studyToolsPanel.classList.remove("visible"),studyToolsToggle.classList.remove("open")),outputLanguagePicker.contains(e.target)||setOutputLanguageMenuVisible(!1)}),window.addEventListener("keydown",e=>{resultsSection.classList.contains("visible")&&activeResultsTab==="flashcards"&&(e.key==="ArrowLeft"&&(e.preventDefault(),goFlashcard(-1)),e.key==="ArrowRight"&&(e.preventDefault(),goFlashcard(1)),e.code==="Space"&&(e.preventDefault(),flipFlashcard()))}),window.addEventListener("beforeunload",e=>{(audioFile&&audioFileOrigin==="recording"&&recordedAudioNeedsDownload||recordingState==="recording"||recordingState==="paused")&&(e.preventDefault(),e.returnValue="")});function updateHeaderNavActiveState(){const e=window.location.pathname.replace(/\/+$/,"")||"/";document.querySelectorAll(".header-nav-link").forEach(t=>{const n=(t.getAttribute("href")||"").replace(/\/+$/,"")||"/",o=e==="/dashboard"&&n==="/";t.classList.toggle("active",n===e||o)})}setAmountSelection("flashcards",selectedFlashcardAmount),setAmountSelection("questions",selectedQuestionAmount),setStudyFeature("both"),updateInterviewOptionsUI(),setOutputLanguage("english","\u{1F1EC}\u{1F1E7} English"),forcedMode&&modeTabs.forEach(e=>{e.disabled=!0,e.setAttribute("aria-disabled","true")}),switchMode(forcedMode||"lecture-notes"),maybeOpenAuthModalFromQuery(),resetResultsState(),updateHeaderNavActiveState();
+             <div class="credit-tip-row total"><span>Total</span><strong>${n}</strong></div>`),dropdownLectureCredits&&(dropdownLectureCredits.textContent=e),dropdownSlidesCredits&&(dropdownSlidesCredits.textContent=userCredits.slides),dropdownInterviewCredits&&(dropdownInterviewCredits.textContent=t),updateInterviewOptionAvailability(),updateModeCostSummary(),updateProcessButton(),refreshStudyHeaderMetrics()}function getTotalInterviewCredits(){return userCredits?userCredits.interview_short+userCredits.interview_medium+userCredits.interview_long:0}function getInterviewExtraCost(){return currentMode==="interview"?selectedInterviewFeatures.length:0}function getInterviewFeaturesValue(){return selectedInterviewFeatures.length?selectedInterviewFeatures.length===2?"both":selectedInterviewFeatures[0]:"none"}function getStudyPackTitleValue(){return studyPackTitleInput?String(studyPackTitleInput.value||"").replace(/\s+/g," ").trim().slice(0,120):""}function updateModeCostSummary(){modeCostSummary&&(modeCostSummary.textContent="",setHidden(modeCostSummary,!0))}function updateInterviewOptionAvailability(){const e=userCredits?Number(userCredits.slides||0):Number.POSITIVE_INFINITY,t=selectedInterviewFeatures.length;interviewOptionButtons.forEach(n=>{const o=n.dataset.feature,s=selectedInterviewFeatures.includes(o),r=s?Math.max(0,t-1):t+1,i=e>=r;n.disabled=!i&&!s,n.classList.toggle("disabled",n.disabled),n.title=n.disabled?"Not enough text extraction credits for this extra.":"",n.setAttribute("aria-disabled",n.disabled?"true":"false")})}function updateModeCreditDisplay(){if(currentMode!=="interview"){setSanitizedHtml(modeCreditCost,modeConfig[currentMode].creditCost),updateModeCostSummary();return}const e=getInterviewExtraCost();e?setSanitizedHtml(modeCreditCost,`Uses <strong>1 interview credit</strong> + <strong>${e} text extraction credits</strong> for selected extras.`):setSanitizedHtml(modeCreditCost,"Uses <strong>1 interview credit</strong>. Optional extras cost <strong>1 text extraction credit</strong> each."),updateModeCostSummary()}function setStudyFeature(e){selectedStudyFeatures=["none","flashcards","test","both"].includes(e)?e:"none";const t={none:"No study tools",flashcards:"Flashcards only",test:"Practice test only",both:"Flashcards + test"};if(studyToolsToggleText.textContent=t[selectedStudyFeatures],studyToolChips.forEach(s=>{s.classList.toggle("active",s.dataset.studyFeatures===selectedStudyFeatures)}),selectedStudyFeatures==="none"?studyToolsNote.textContent="Notes-only output. No flashcards or test questions will be generated.":selectedStudyFeatures==="flashcards"?studyToolsNote.textContent="Only flashcards will be generated.":selectedStudyFeatures==="test"?studyToolsNote.textContent="Only practice test questions will be generated.":studyToolsNote.textContent="Recommended for first runs: both flashcards and practice test questions will be generated.",currentUser&&currentUser.uid)try{localStorage.setItem(`study_tools_pref_${currentUser.uid}`,selectedStudyFeatures)}catch(s){}const n=currentMode==="interview"||selectedStudyFeatures==="none"||selectedStudyFeatures==="test",o=currentMode==="interview"||selectedStudyFeatures==="none"||selectedStudyFeatures==="flashcards";flashcardAmountChips.forEach(s=>{s.disabled=n}),questionAmountChips.forEach(s=>{s.disabled=o}),setHidden(flashcardAmountControl,n),setHidden(questionAmountControl,o),syncProcessingLayout(),updateProcessButton()}function setAmountSelection(e,t){e==="flashcards"?(selectedFlashcardAmount=t,flashcardAmountChips.forEach(n=>n.classList.toggle("active",n.dataset.value===t))):(selectedQuestionAmount=t,questionAmountChips.forEach(n=>n.classList.toggle("active",n.dataset.value===t)))}function updateInterviewOptionsUI(){if(userCredits){const t=Math.max(0,Number(userCredits.slides||0));selectedInterviewFeatures.length>t&&(selectedInterviewFeatures=selectedInterviewFeatures.slice(0,t))}updateInterviewOptionAvailability(),interviewOptionButtons.forEach(t=>{t.classList.toggle("active",selectedInterviewFeatures.includes(t.dataset.feature))});const e=userCredits?Number(userCredits.slides||0):0;!selectedInterviewFeatures.length&&userCredits&&e<=0?interviewExtraNote.textContent="No extras selected. You currently have 0 text extraction credits, so extras are disabled.":selectedInterviewFeatures.length?selectedInterviewFeatures.length===1?interviewExtraNote.textContent="Selected 1 extra option. This adds 1 text extraction credit.":interviewExtraNote.textContent="Selected both extra options. This adds 2 text extraction credits.":interviewExtraNote.textContent="No extras selected. Select one or both options (1 text extraction credit per option).",syncProcessingLayout(),updateModeCreditDisplay(),updateProcessButton()}function updateOutputLanguageInput(){const e=outputLanguageSelect.value==="other";setHidden(outputLanguageCustom,!e),e||(outputLanguageCustom.value=""),syncProcessingLayout()}function getLanguageLabel(e,t=""){const n=String(e||"english").trim().toLowerCase();if(n==="other"){const o=String(t||"").trim();return o?`\u{1F310} ${o}`:OUTPUT_LANGUAGE_LABELS.other}return OUTPUT_LANGUAGE_LABELS[n]||OUTPUT_LANGUAGE_LABELS.english}function setOutputLanguage(e,t){const n=Object.prototype.hasOwnProperty.call(OUTPUT_LANGUAGE_LABELS,e)?e:"english";outputLanguageSelect.value=n,outputLanguageLabel.textContent=t||getLanguageLabel(n,outputLanguageCustom.value),outputLanguageItems.forEach(o=>{const s=o.dataset.value===n;o.classList.toggle("active",s),o.setAttribute("aria-selected",s?"true":"false")}),updateOutputLanguageInput()}function clearLanguagePreferenceSaveTimer(){languagePreferenceSaveTimer&&(clearTimeout(languagePreferenceSaveTimer),languagePreferenceSaveTimer=null)}async function saveUserPreferences(e){if(!currentUser)return{ok:!1,error:"Please sign in"};try{const t=await authenticatedFetch("/api/user-preferences",{method:"PUT",headers:{"Content-Type":"application/json"},body:JSON.stringify(e||{})}),n=await t.json().catch(()=>({}));return t.ok?(n.preferences&&typeof n.preferences=="object"&&(userPreferences=n.preferences),{ok:!0,preferences:userPreferences}):{ok:!1,error:n.error||"Could not save preferences."}}catch(t){return captureClientError(t,"save_user_preferences"),{ok:!1,error:"Could not save preferences."}}}function setOnboardingError(e){if(!languageOnboardingError)return;const t=String(e||"").trim();languageOnboardingError.textContent=t,languageOnboardingError.classList.toggle("visible",!!t)}function setOnboardingLanguageSelection(e){const t=String(e||"english").trim().toLowerCase();languageOnboardingButtons.forEach(o=>{o.classList.toggle("active",o.dataset.value===t)});const n=t==="other";setHidden(languageOnboardingCustom,!n),n||(languageOnboardingCustom.value="")}function getOnboardingLanguageSelection(){const e=Array.from(languageOnboardingButtons).find(n=>n.classList.contains("active")),t=e?String(e.dataset.value||"english").trim().toLowerCase():"english";return{value:t,custom:t==="other"?String(languageOnboardingCustom.value||"").trim():""}}function closeLanguageOnboarding(){languageOnboardingOpen&&(languageOnboardingOpen=!1,setOnboardingError(""),closeOverlay(languageOnboardingOverlay))}function openLanguageOnboarding(e=null){if(!currentUser||languageOnboardingOpen)return;const t=e&&typeof e=="object"?e:userPreferences||{},n=String(t.output_language||outputLanguageSelect.value||"english").trim().toLowerCase(),o=String(t.output_language_custom||outputLanguageCustom.value||"").trim();setOnboardingLanguageSelection(n),languageOnboardingCustom.value=o,n==="other"&&setHidden(languageOnboardingCustom,!1),languageOnboardingSaveBtn.disabled=!1,setOnboardingError(""),languageOnboardingOpen=!0,openOverlay(languageOnboardingOverlay)}async function saveLanguageOnboardingPreference(){if(!currentUser||languageOnboardingSaving)return;const e=getOnboardingLanguageSelection();if(e.value==="other"&&!e.custom){setOnboardingError("Please enter a custom language.");return}languageOnboardingSaving=!0,languageOnboardingSaveBtn.disabled=!0,setOnboardingError("");const t=await saveUserPreferences({output_language:e.value,output_language_custom:e.custom,onboarding_completed:!0});if(languageOnboardingSaving=!1,languageOnboardingSaveBtn.disabled=!1,!t.ok){setOnboardingError(t.error||"Could not save preference.");return}suppressLanguagePreferencePersist=!0,setOutputLanguage(e.value,getLanguageLabel(e.value,e.custom)),e.value==="other"&&(outputLanguageCustom.value=e.custom),suppressLanguagePreferencePersist=!1,closeLanguageOnboarding(),showToast("Default language saved.","success")}async function persistCurrentOutputLanguage(e={}){if(!currentUser||suppressLanguagePreferencePersist)return;const t=String(outputLanguageSelect.value||"english").trim().toLowerCase(),n=t==="other"?String(outputLanguageCustom.value||"").trim():"";if(t==="other"&&!n){e.strict&&showToast("Please enter a custom language before saving.","info");return}const o={output_language:t,output_language_custom:n};Object.prototype.hasOwnProperty.call(e,"onboarding_completed")&&(o.onboarding_completed=!!e.onboarding_completed);const s=await saveUserPreferences(o);!s.ok&&e.showErrorToast&&showToast(s.error||"Could not save language preference.","error")}function scheduleLanguagePreferenceSave(){!currentUser||suppressLanguagePreferencePersist||languageOnboardingOpen||(clearLanguagePreferenceSaveTimer(),languagePreferenceSaveTimer=setTimeout(()=>{persistCurrentOutputLanguage({showErrorToast:!0})},500))}function applyPreferencesToOutputLanguage(e,t={}){const n=e&&typeof e=="object"?e:{},o=String(n.output_language||"english").trim().toLowerCase(),s=["dutch","english","spanish","french","german","chinese","other"].includes(o)?o:"english",r=String(n.output_language_custom||"").trim();suppressLanguagePreferencePersist=!0,setOutputLanguage(s,getLanguageLabel(s,r)),s==="other"&&(outputLanguageCustom.value=r),suppressLanguagePreferencePersist=!1,t.forceOnboardingOpen&&(n.onboarding_completed?closeLanguageOnboarding():openLanguageOnboarding(n))}function setQuickstartVisible(e){quickstartCard&&setHidden(quickstartCard,!e)}function syncProcessingLayout(){if(processingUi&&typeof processingUi.syncProcessingLayout=="function"){processingUi.syncProcessingLayout({uploadSection,pdfZone,audioZone,uploadEstimate,otherAudioDisclosure,otherAudioToggle,otherAudioBody,otherAudioSummary,generationControls,interviewControls,advancedSettingsSummary},{signedIn:!!currentUser,currentMode,modeConfig,hasAnySourceFile:!!(pdfFile||audioFile||hasReadyImportedAudioToken()),audioImportInFlight,importedAudioReady:hasReadyImportedAudioToken(),recordingState,audioStatusText:audioUrlStatus?String(audioUrlStatus.textContent||"").trim():"",outputLanguageValue:outputLanguageSelect?outputLanguageSelect.value:"english",outputLanguageCustomValue:outputLanguageCustom?outputLanguageCustom.value:"",selectedStudyFeatures,selectedInterviewFeatures,otherAudioOpen,getLanguageLabel});return}setHidden(uploadEstimate,!(currentUser&&(pdfFile||audioFile||hasReadyImportedAudioToken())))}function applyStoredStudyFeaturePreference(e){if(!e||!e.uid)return;let t="";try{t=localStorage.getItem(`study_tools_pref_${e.uid}`)||""}catch(o){}const n=["none","flashcards","test","both"].includes(t)?t:"both";setStudyFeature(n)}function applyRecommendedSetup(){switchMode("lecture-notes"),setStudyFeature("both"),setAdvancedSettingsVisible(!1),showToast("Recommended setup applied: Lecture Notes + Flashcards + Test.","success");try{uploadSection.scrollIntoView({behavior:"smooth",block:"start"})}catch(e){}}function updateQuickstartVisibility(){if(!currentUser||!quickstartCard||!userProfileLoaded){setQuickstartVisible(!1);return}const e=!userHasCreatedStudyPack;let t=!1;try{t=localStorage.getItem(`quickstart_dismissed_${currentUser.uid}`)==="1"}catch(n){}setQuickstartVisible(e&&!t&&!resultsLocked)}function mergeRuntimeJobs(e,t){return runtimeJobUtils&&typeof runtimeJobUtils.mergeActiveRuntimeJobs=="function"?runtimeJobUtils.mergeActiveRuntimeJobs(e,t):Array.isArray(t)?t.slice():[]}function getLatestRuntimeJob(e){return runtimeJobUtils&&typeof runtimeJobUtils.findLatestRuntimeJob=="function"?runtimeJobUtils.findLatestRuntimeJob(e):Array.isArray(e)&&e.length?e[0]:null}function readActiveRuntimeJobsCache(e){return mergeRuntimeJobs([],readUiCacheJsonForUser(e,ACTIVE_RUNTIME_JOBS_CACHE_KEY,[]))}function writeActiveRuntimeJobsCache(e,t){return writeUiCacheJsonForUser(e,ACTIVE_RUNTIME_JOBS_CACHE_KEY,mergeRuntimeJobs([],t))}function setActiveRuntimeJobs(e){activeRuntimeJobs=mergeRuntimeJobs([],e),currentUser&&writeActiveRuntimeJobsCache(currentUser,activeRuntimeJobs)}function cacheActiveRuntimeJob(e){e&&setActiveRuntimeJobs(mergeRuntimeJobs(activeRuntimeJobs,[e]))}function removeActiveRuntimeJob(e){const t=String(e||"").trim();t&&(runtimeJobUtils&&typeof runtimeJobUtils.removeRuntimeJob=="function"?activeRuntimeJobs=runtimeJobUtils.removeRuntimeJob(activeRuntimeJobs,t):activeRuntimeJobs=(Array.isArray(activeRuntimeJobs)?activeRuntimeJobs:[]).filter(n=>String(n&&n.job_id||"").trim()!==t),currentUser&&writeActiveRuntimeJobsCache(currentUser,activeRuntimeJobs))}function clearRuntimeJobsRefreshTimer(){runtimeJobsRefreshTimer&&(clearTimeout(runtimeJobsRefreshTimer),runtimeJobsRefreshTimer=null)}function scheduleRuntimeJobsRefresh(e=RUNTIME_JOBS_REFRESH_MS){clearRuntimeJobsRefreshTimer(),currentUser&&(runtimeJobsRefreshTimer=setTimeout(()=>{runtimeJobsRefreshTimer=null,refreshActiveRuntimeJobs(!1)},Math.max(1e3,Number(e||RUNTIME_JOBS_REFRESH_MS))))}function showProgressSafeBanner(e){progressSafeBanner&&(progressSafeBanner.hidden=!e)}function updateUIForAuthState(e){if(e){userProfileLoaded=!1,userHasCreatedStudyPack=!1,closeHeaderDropdowns(""),headerSignInBtn&&setHidden(headerSignInBtn,!0),headerNavToggle&&setHidden(headerNavToggle,!1),creditsDisplay&&setHidden(creditsDisplay,!1),headerStudyLibraryBtn&&setHidden(headerStudyLibraryBtn,!1),headerFeaturesBtn&&setHidden(headerFeaturesBtn,!1),headerToolsBtn&&setHidden(headerToolsBtn,!1),headerPlannerBtn&&setHidden(headerPlannerBtn,!1),progressMenu&&setHidden(progressMenu,!1),userMenu&&setHidden(userMenu,!1),adminDashboardBtn&&setHidden(adminDashboardBtn,!0),signInRequired.classList.remove("visible"),setHidden(buttonSection,!1),setHidden(languageControls,!1),setAdvancedSettingsVisible(!1),applyStoredStudyFeaturePreference(e);const t=e.displayName||e.email.split("@")[0],n=t.charAt(0).toUpperCase();if(userAvatar)if(userAvatar.innerHTML="",e.photoURL){const o=document.createElement("img");o.src=e.photoURL,o.alt=t,userAvatar.appendChild(o)}else{const o=document.createElement("span");o.textContent=n,userAvatar.appendChild(o)}userName&&(userName.textContent=t),topbarUtils.applyAuthState&&userEmail?topbarUtils.applyAuthState({user:e,userTextEl:userEmail,signedInText:function(o){return o&&o.email?o.email:""}}):userEmail&&(userEmail.textContent=e.email),switchMode(currentMode),updateModeCostSummary(),refreshStudyHeaderMetrics(),updateQuickstartVisibility(),syncProcessingLayout()}else closeHeaderDropdowns(""),headerSignInBtn&&setHidden(headerSignInBtn,!1),headerNavToggle&&setHidden(headerNavToggle,!0),creditsDisplay&&setHidden(creditsDisplay,!0),headerStudyLibraryBtn&&setHidden(headerStudyLibraryBtn,!0),headerFeaturesBtn&&setHidden(headerFeaturesBtn,!0),headerToolsBtn&&setHidden(headerToolsBtn,!0),headerPlannerBtn&&setHidden(headerPlannerBtn,!0),progressMenu&&setHidden(progressMenu,!0),userMenu&&setHidden(userMenu,!0),signInRequired.classList.add("visible"),setHidden(buttonSection,!1),generationControls.classList.add("hidden"),interviewControls.classList.add("hidden"),setHidden(languageControls,!1),setAdvancedSettingsVisible(!1),releaseImportedAudioToken({clearStatus:!0}),currentUser=null,userCredits=null,idToken=null,authClient&&typeof authClient.clearToken=="function"&&authClient.clearToken(),progressSummaryCache=null,userTotalProcessed=0,userHasCreatedStudyPack=!1,userProfileLoaded=!1,currentUserIsAdmin=!1,userPreferences=null,clearLanguagePreferenceSaveTimer(),closeLanguageOnboarding(),stopPolling(),currentJobId=null,setActiveRuntimeJobs([]),clearRuntimeJobsRefreshTimer(),runtimeJobsRefreshInFlight=!1,notificationPermissionRequested=!1,notifiedTerminalJobIds=new Set,otherAudioOpen=!1,uploadCooldownUntilMs=0,clearUploadCooldownTimer(),modalStateStack=[],activeModalOverlay=null,adminDashboardBtn&&setHidden(adminDashboardBtn,!0),updateInterviewOptionAvailability(),updateModeCostSummary(),processButton&&(processButton.disabled=!0),showProgressSafeBanner(!1),setQuickstartVisible(!1),syncProcessingLayout()}let handlingDisallowedAuthState=!1;auth.onAuthStateChanged(async e=>{if(!handlingDisallowedAuthState)if(currentUser=e,e){const t=await checkEmailAllowed(e.email||"");if(!t.allowed){handlingDisallowedAuthState=!0;try{await auth.signOut()}catch(o){console.error(o),captureClientError(o,"disallowed_signout")}finally{handlingDisallowedAuthState=!1}updateUIForAuthState(null);const n=signupView.classList.contains("active")?"signup":"signin";showAuthModal(n),showAuthError(n==="signup"?signupError:signinError,t.message||"This email is not allowed.");return}idToken=await e.getIdToken(),authClient&&typeof authClient.setToken=="function"&&authClient.setToken(idToken),updateUIForAuthState(e),setActiveRuntimeJobs(readActiveRuntimeJobsCache(e)),resumeLatestRuntimeJob(activeRuntimeJobs,{startPolling:!0}),await fetchUserData(),await checkPaymentResult(),await refreshActiveRuntimeJobs(!0)}else updateUIForAuthState(null)}),setInterval(async()=>{currentUser&&(idToken=await currentUser.getIdToken(!0),authClient&&typeof authClient.setToken=="function"&&authClient.setToken(idToken))},600*1e3);function formatFileSize(e){if(!e)return"0 Bytes";const t=1024,n=["Bytes","KB","MB","GB"],o=Math.floor(Math.log(e)/Math.log(t));return`${parseFloat((e/Math.pow(t,o)).toFixed(2))} ${n[o]}`}function getCurrentAudioImportUrl(){return normalizeAudioImportUrl(audioUrlInput?audioUrlInput.value:"")}function hasReadyImportedAudioToken(e){const t=normalizeAudioImportUrl(e==null?getCurrentAudioImportUrl():e);return typeof audioImportUtils.hasReadyImportedAudioToken=="function"?audioImportUtils.hasReadyImportedAudioToken({url:t,importedAudioToken,importedAudioSourceUrl}):!!importedAudioToken&&(!t||normalizeAudioImportUrl(importedAudioSourceUrl)===t)}function getReadyImportedAudioToken(e){return hasReadyImportedAudioToken(e)?String(importedAudioToken||"").trim():""}function currentAudioBytes(){return audioFile?Number(audioFile.size||0):hasReadyImportedAudioToken()?Number(importedAudioSizeBytes||0):0}function setAudioImportStatus(e="",t=!1){if(!audioUrlStatus)return;const n=String(e||"").trim();audioUrlStatus.textContent=n,audioUrlStatus.classList.toggle("error",!!(t&&n)),syncProcessingLayout()}function setAudioImportPending(e){audioUrlFetchBtn&&(audioUrlFetchBtn.dataset.defaultLabel||(audioUrlFetchBtn.dataset.defaultLabel=audioUrlFetchBtn.textContent||"Import Audio"),audioUrlFetchBtn.disabled=!!e,audioUrlFetchBtn.textContent=e?"Importing...":audioUrlFetchBtn.dataset.defaultLabel||"Import Audio",syncProcessingLayout())}function setRecorderStatus(e="",t="info"){recorderStatusMessage=String(e||"").trim(),recorderStatusTone=String(t||"info").trim()||"info",audioRecordingStatus&&(audioRecordingStatus.textContent=recorderStatusMessage,audioRecordingStatus.dataset.tone=recorderStatusTone)}function formatRecordingElapsed(e){const t=Math.max(0,Math.floor(Number(e||0)/1e3)),n=String(Math.floor(t/60)).padStart(2,"0"),o=String(t%60).padStart(2,"0");return`${n}:${o}`}function stopRecordingTimer(){recordingTimer&&(window.clearInterval(recordingTimer),recordingTimer=null)}function currentRecordingElapsedMs(){return recordingState==="recording"&&recordingStartedAtMs>0?recordingElapsedMs+Math.max(0,Date.now()-recordingStartedAtMs):recordingElapsedMs}function updateRecordingTimer(){audioRecorderTimer&&(audioRecorderTimer.textContent=formatRecordingElapsed(currentRecordingElapsedMs()))}function cleanupRecordingStream(){if(recordingStream){try{recordingStream.getTracks().forEach(e=>e.stop())}catch(e){}recordingStream=null}}async function getMicrophonePermissionState(){if(!navigator.permissions||typeof navigator.permissions.query!="function")return"unknown";try{const e=await navigator.permissions.query({name:"microphone"});return String(e&&e.state||"unknown").trim().toLowerCase()||"unknown"}catch(e){return"unknown"}}function getPreferredRecordingConfig(){if(!window.MediaRecorder||!navigator.mediaDevices||typeof navigator.mediaDevices.getUserMedia!="function")return null;const e=[{mimeType:"audio/ogg;codecs=opus",extension:"ogg"},{mimeType:"audio/ogg",extension:"ogg"},{mimeType:"audio/mp4;codecs=mp4a.40.2",extension:"m4a"},{mimeType:"audio/mp4",extension:"m4a"}],t=typeof window.MediaRecorder.isTypeSupported=="function";for(const n of e)if(!t||window.MediaRecorder.isTypeSupported(n.mimeType))return n;return null}function syncRecorderUI(){const e=!!(modeConfig[currentMode]||{}).needsAudio,t=getPreferredRecordingConfig();if(setHidden(audioRecorderPanel,!e),!!e){if(audioRecordStartBtn&&(audioRecordStartBtn.disabled=recordingState!=="idle"||!t),audioRecordPauseBtn&&(audioRecordPauseBtn.disabled=!(recordingState==="recording"&&mediaRecorder&&typeof mediaRecorder.pause=="function"||recordingState==="paused"&&mediaRecorder&&typeof mediaRecorder.resume=="function"),audioRecordPauseBtn.textContent=recordingState==="paused"?"Resume":"Pause"),audioRecordStopBtn&&(audioRecordStopBtn.disabled=!(recordingState==="recording"||recordingState==="paused")),updateRecordingTimer(),recordingState==="recording"){setRecorderStatus("Recording in progress. Stop to attach it to this lecture.","recording");return}if(recordingState==="paused"){setRecorderStatus("Recording paused. Resume or stop to attach it to this lecture.","info");return}if(recordingState==="stopping"){setRecorderStatus("Saving recording...","info");return}if(!t){setRecorderStatus("Browser recording is not available here. Upload or import audio instead.","error");return}recorderStatusMessage?setRecorderStatus(recorderStatusMessage,recorderStatusTone):setRecorderStatus("Record directly here if you do not have an audio file yet.","info")}}function syncAudioInfoUI(){audioFile?(audioName.textContent=audioFile.name,audioSize.textContent=audioFileOrigin==="recording"?`${formatFileSize(audioFile.size)} \xB7 Recorded in browser`:formatFileSize(audioFile.size),setHidden(audioInfo,!1),audioZone.classList.add("has-file")):importedAudioToken?(audioName.textContent=importedAudioName||"Imported audio",audioSize.textContent=importedAudioSizeBytes>0?`${formatFileSize(importedAudioSizeBytes)} \xB7 Imported from URL`:"Imported from URL",setHidden(audioInfo,!1),audioZone.classList.add("has-file")):(setHidden(audioInfo,!0),audioZone.classList.remove("has-file")),audioRecordingWarning&&(audioFile&&audioFileOrigin==="recording"?(setHidden(audioRecordingWarning,!1),audioRecordingWarning.textContent=recordedAudioNeedsDownload?"This recording only exists in this browser tab. Download it now if you want to keep it, or it will be lost forever when you leave this page.":"This recording was downloaded. Keep the saved file somewhere safe, because the in-browser copy still disappears when you leave this page."):(setHidden(audioRecordingWarning,!0),audioRecordingWarning.textContent="")),syncRecorderUI(),syncProcessingLayout()}function clearImportedAudioLocalState(){importedAudioToken="",importedAudioSizeBytes=0,importedAudioName="",importedAudioSourceUrl=""}function buildRecordedAudioFileName(e){const t=new Date;return`lecture-recording-${[t.getFullYear(),String(t.getMonth()+1).padStart(2,"0"),String(t.getDate()).padStart(2,"0")].join("")+"-"+[String(t.getHours()).padStart(2,"0"),String(t.getMinutes()).padStart(2,"0"),String(t.getSeconds()).padStart(2,"0")].join("")}.${String(e||"ogg").trim()||"ogg"}`}function finalizeRecordedAudio(e){cleanupRecordingStream(),stopRecordingTimer(),recordingState="idle",recordingStartedAtMs=0;const t=e instanceof Blob?e:null;if(!t||!t.size){recordingChunks=[],recordingMimeType="",recordingExtension="",setRecorderStatus("No audio was captured. Please try again.","error"),showToast("No audio was captured. Please try again.","error"),syncRecorderUI();return}const n=String(recordingMimeType||t.type||"audio/ogg").trim()||"audio/ogg",o=buildRecordedAudioFileName(recordingExtension||(n.indexOf("mp4")>=0?"m4a":"ogg")),s=new File([t],o,{type:n,lastModified:Date.now()});if(recordingChunks=[],recordingMimeType="",recordingExtension="",discardNextRecordingResult){discardNextRecordingResult=!1,setRecorderStatus("Recording discarded.","info"),syncRecorderUI();return}handleAudioFile(s,{origin:"recording"}),setRecorderStatus("Recording attached. Download it from the audio card now if you want to keep it.","success"),showToast("Recording attached as your audio file. Download it now if you want to keep it.","success",4200),syncRecorderUI()}async function startAudioRecording(){if(currentMode!=="lecture-notes"){setRecorderStatus("Recording is only available in Lecture Notes mode.","error");return}if(recordingState!=="idle")return;const e=getPreferredRecordingConfig();if(!e){setRecorderStatus("Browser recording is not available here. Upload or import audio instead.","error");return}try{if(await getMicrophonePermissionState()==="denied"){const n="Microphone access is blocked in your browser. Allow microphone access in the site settings, then try again.";setRecorderStatus(n,"error"),showToast(n,"error",4200),syncRecorderUI();return}cleanupRecordingStream(),recordingStream=await navigator.mediaDevices.getUserMedia({audio:!0}),recordingChunks=[],recordingMimeType=e.mimeType,recordingExtension=e.extension,mediaRecorder=new window.MediaRecorder(recordingStream,{mimeType:e.mimeType}),mediaRecorder.addEventListener("dataavailable",n=>{n.data&&n.data.size>0&&recordingChunks.push(n.data)}),mediaRecorder.addEventListener("stop",()=>{const n=new Blob(recordingChunks,{type:recordingMimeType||mediaRecorder&&mediaRecorder.mimeType||e.mimeType});mediaRecorder=null,finalizeRecordedAudio(n)}),mediaRecorder.addEventListener("error",()=>{mediaRecorder=null,cleanupRecordingStream(),stopRecordingTimer(),recordingState="idle",recordingChunks=[],recordingMimeType="",recordingExtension="",setRecorderStatus("Recording failed. Please try again.","error"),showToast("Recording failed. Please try again.","error"),syncRecorderUI()}),recordingElapsedMs=0,recordingStartedAtMs=Date.now(),recordingState="recording",recorderStatusMessage="",mediaRecorder.start(),updateRecordingTimer(),recordingTimer=window.setInterval(updateRecordingTimer,500),syncRecorderUI()}catch(t){cleanupRecordingStream(),stopRecordingTimer(),recordingState="idle",recordingChunks=[],recordingMimeType="",recordingExtension="";const n=t&&t.name==="NotAllowedError"?"Microphone access was blocked. Allow microphone access in your browser and try again.":"Could not start recording in this browser.";setRecorderStatus(n,"error"),showToast(n,"error",3600),syncRecorderUI()}}function toggleAudioRecordingPause(){if(mediaRecorder){if(recordingState==="recording"&&typeof mediaRecorder.pause=="function"){try{recordingElapsedMs=currentRecordingElapsedMs(),recordingStartedAtMs=0,mediaRecorder.pause(),stopRecordingTimer(),recordingState="paused",syncRecorderUI()}catch(e){}return}if(recordingState==="paused"&&typeof mediaRecorder.resume=="function")try{recordingStartedAtMs=Date.now(),mediaRecorder.resume(),recordingState="recording",updateRecordingTimer(),recordingTimer=window.setInterval(updateRecordingTimer,500),syncRecorderUI()}catch(e){}}}function stopAudioRecording(){if(!(!mediaRecorder||!(recordingState==="recording"||recordingState==="paused"))){recordingElapsedMs=currentRecordingElapsedMs(),recordingStartedAtMs=0,recordingState="stopping",stopRecordingTimer(),syncRecorderUI();try{mediaRecorder.stop()}catch(e){mediaRecorder=null,cleanupRecordingStream(),recordingState="idle",recordingChunks=[],recordingMimeType="",recordingExtension="",setRecorderStatus("Recording could not be saved. Please try again.","error"),syncRecorderUI()}}}async function releaseImportedAudioToken(e={}){const t=String(importedAudioToken||"").trim(),n=e.clearStatus!==!1;if(e.resetPendingUrl!==!1&&(pendingAutoImportUrl=""),!t){n&&setAudioImportStatus("");return}if(clearImportedAudioLocalState(),audioFile||syncAudioInfoUI(),n&&setAudioImportStatus(""),!!currentUser)try{await authenticatedFetch("/api/import-audio-url/release",{method:"POST",headers:{"Content-Type":"application/json"},body:JSON.stringify({audio_import_token:t})})}catch(o){}}async function applyImportedAudio(e,t="",n=""){const o=String(e&&e.audio_import_token?e.audio_import_token:"").trim();if(!o)return!1;if(audioFile){if(currentUser)try{await authenticatedFetch("/api/import-audio-url/release",{method:"POST",headers:{"Content-Type":"application/json"},body:JSON.stringify({audio_import_token:o})})}catch(r){}return!1}importedAudioToken=o,importedAudioName=String(e.file_name||"Imported audio.mp3").trim(),importedAudioSizeBytes=Math.max(0,Number(e.size_bytes||0)),importedAudioSourceUrl=normalizeAudioImportUrl(n),syncAudioInfoUI(),updateProcessButton();const s=Math.max(0,Number(e.expires_in_seconds||0));if(s>0){const r=Math.max(1,Math.round(s/60));setAudioImportStatus(`Imported ${importedAudioName}. Token expires in about ${r} minute${r===1?"":"s"}.`)}else setAudioImportStatus(`Imported ${importedAudioName}.`);if(t&&t!==o&&currentUser)try{await authenticatedFetch("/api/import-audio-url/release",{method:"POST",headers:{"Content-Type":"application/json"},body:JSON.stringify({audio_import_token:t})})}catch(r){}return!0}const CHUNKED_AUDIO_UPLOAD_THRESHOLD_BYTES=33554432,CHUNKED_AUDIO_UPLOAD_MAX_RETRIES=3;async function sha256Hex(e){if(!window.crypto||!window.crypto.subtle||typeof e.arrayBuffer!="function")return"";const t=await window.crypto.subtle.digest("SHA-256",await e.arrayBuffer());return Array.from(new Uint8Array(t)).map(o=>o.toString(16).padStart(2,"0")).join("")}async function uploadAudioFileInChunks(e,t){const o=await authenticatedFetch("/api/uploads",{method:"POST",headers:{"Content-Type":"application/json"},body:JSON.stringify({file_name:e.name,mime_type:e.type||"",total_bytes:e.size})}),n=await o.json();if(!o.ok||n.error)return{response:o,payload:n};const s=`/api/uploads/${encodeURIComponent(n.upload_id)}`,r=Math.max(1,Number(n.chunk_max_bytes||0)||8388608);let a=Math.max(0,Number(n.offset||0)),i=0;for(;a<e.size;){const d=e.slice(a,a+r);let l=null,c=null;try{const p=await sha256Hex(d);l=await authenticatedFetch(`${s}?offset=${a}&chunk_sha256=${p}`,{method:"PATCH",headers:{"Content-Type":"application/octet-stream"},body:d}),c=await l.json()}catch(p){if(i+=1,i>CHUNKED_AUDIO_UPLOAD_MAX_RETRIES)throw p;const f=await authenticatedFetch(s),h=await f.json();if(!f.ok)return{response:f,payload:h};a=Math.max(0,Number(h.offset||0));continue}if(!l.ok){i+=1;if(!(l.status===409||l.status===400&&typeof c.offset=="number")||i>CHUNKED_AUDIO_UPLOAD_MAX_RETRIES)return{response:l,payload:c};a=Math.max(0,Number(c.offset||0));continue}i=0,a=Math.max(0,Number(c.offset||0)),typeof t=="function"&&t(a,e.size)}const u=await authenticatedFetch(`${s}/complete`,{method:"POST",headers:{"Content-Type":"application/json"},body:"{}"});return{response:u,payload:await u.json()}}function syncAudioImportStatusForUrlChange(){if(!(modeConfig[currentMode]||{}).needsAudio||audioFile||audioImportInFlight){updateProcessButton();return}const e=getCurrentAudioImportUrl();if(!e){setAudioImportStatus(importedAudioToken?`Imported ${importedAudioName||"audio"}.`:""),updateProcessButton();return}const t=normalizeAudioImportUrl(importedAudioSourceUrl);setAudioImportStatus(importedAudioToken&&t!==e?"URL changed. Paste again, press Enter, or click Import Audio to use this source.":importedAudioToken&&t===e?`Imported ${importedAudioName||"audio"} from this URL.`:""),updateProcessButton()}async function importAudioFromUrl(e={}){const t=e&&typeof e=="object"?e:{},n=String(t.reason||"manual").trim()||"manual",o=normalizeAudioImportUrl(t.url==null?getCurrentAudioImportUrl():t.url);if(!currentUser)return n==="manual"?showAuthModal("signin"):setAudioImportStatus("Sign in to import audio from a lecture video URL.",!0),updateProcessButton(),!1;if(!(modeConfig[currentMode]||{}).needsAudio)return setAudioImportStatus("URL import is only available when this mode accepts audio.",!0),updateProcessButton(),!1;if(!o)return setAudioImportStatus("Paste the lecture video page URL or direct playlist URL first.",!0),updateProcessButton(),!1;if(audioImportInFlight)return!audioFile&&o&&o!==audioImportRequestUrl?(pendingAutoImportUrl=o,setAudioImportStatus("Import in progress. The latest pasted lecture video URL will import next.")):n==="manual"&&setAudioImportStatus("Import already in progress. Please wait."),updateProcessButton(),!1;const s=describeAudioImportRequest({mode:currentMode,url:o,hasLocalAudioFile:!!audioFile,importedAudioToken,importedAudioSourceUrl});if(!s.shouldImport)return s.reason==="already-imported"&&n==="manual"?setAudioImportStatus(`Imported ${importedAudioName||"audio"} from this URL.`):s.reason==="local-audio-selected"&&n==="manual"&&setAudioImportStatus("Using your uploaded audio file. Remove it to import from LMS URL."),updateProcessButton(),s.reason==="already-imported";audioImportInFlight=!0,audioImportRequestUrl=o,setAudioImportPending(!0),updateProcessButton(),setAudioImportStatus(n==="paste"?"Importing audio from the pasted lecture video URL...":"Importing audio from URL...");const r=String(importedAudioToken||"").trim();try{const i=await authenticatedFetch("/api/import-audio-url",{method:"POST",headers:{"Content-Type":"application/json"},body:JSON.stringify({url:o})}),a=await i.json().catch(()=>({}));if(!i.ok){const d=getRetryAfterSeconds(i,a),u=String(a.error||"Could not import audio from URL.");return i.status===429&&d>0?setAudioImportStatus(`${u} Try again in ${formatRetryDelay(d)}.`,!0):setAudioImportStatus(u,!0),!1}const c=await applyImportedAudio(a,r,o),l=normalizeAudioImportUrl(pendingAutoImportUrl);return c?l&&l!==o?setAudioImportStatus("Newest pasted lecture video URL detected. Importing latest audio..."):showToast("Audio imported from URL.","success"):audioFile&&setAudioImportStatus("Using your uploaded audio file. LMS import was ignored."),c}catch(i){return captureClientError(i,"import_audio_url"),setAudioImportStatus("Could not import audio from URL. Please try again.",!0),!1}finally{audioImportInFlight=!1,audioImportRequestUrl="",setAudioImportPending(!1),updateProcessButton();const i=normalizeAudioImportUrl(pendingAutoImportUrl);pendingAutoImportUrl="",!audioFile&&i&&describeAudioImportRequest({mode:currentMode,url:i,hasLocalAudioFile:!!audioFile,importedAudioToken,importedAudioSourceUrl}).shouldImport&&window.setTimeout(()=>{importAudioFromUrl({url:i,reason:"queued-auto"})},0)}}function renderToastIcon(e){for(;toastIcon.firstChild;)toastIcon.removeChild(toastIcon.firstChild);const t="http://www.w3.org/2000/svg",n=(o,s)=>{const r=document.createElementNS(t,o);Object.entries(s||{}).forEach(([i,a])=>r.setAttribute(i,String(a))),toastIcon.appendChild(r)};if(e==="success"){n("polyline",{points:"20 6 9 17 4 12"});return}if(e==="error"){n("circle",{cx:"12",cy:"12",r:"10"}),n("line",{x1:"15",y1:"9",x2:"9",y2:"15"}),n("line",{x1:"9",y1:"9",x2:"15",y2:"15"});return}n("circle",{cx:"12",cy:"12",r:"10"}),n("line",{x1:"12",y1:"16",x2:"12",y2:"12"}),n("line",{x1:"12",y1:"8",x2:"12.01",y2:"8"})}function showToast(e,t="success",n=3e3){toastText.textContent=e,toast.className=`toast visible ${t}`,renderToastIcon(t),setTimeout(()=>toast.classList.remove("visible"),n)}function getRetryAfterSeconds(e,t){const n=Number(t&&t.retry_after_seconds||0);if(Number.isFinite(n)&&n>0)return Math.ceil(n);const o=Number(e&&e.headers&&e.headers.get("Retry-After")||0);return Number.isFinite(o)&&o>0?Math.ceil(o):0}function formatRetryDelay(e){const t=Math.max(0,Number(e)||0);if(!t)return"";if(t<60)return`${t}s`;const n=Math.floor(t/60),o=t%60;return o?`${n}m ${o}s`:`${n}m`}function ensureBundleButtonDefaults(){document.querySelectorAll(".bundle-buy-btn").forEach(e=>{e.dataset.defaultLabel||(e.dataset.defaultLabel=e.textContent||"Buy now")})}function getCheckoutCooldownSeconds(){return checkoutCooldownUntilMs?Math.max(0,Math.ceil((checkoutCooldownUntilMs-Date.now())/1e3)):0}function clearCheckoutCooldownTimer(){checkoutCooldownTimer&&(clearInterval(checkoutCooldownTimer),checkoutCooldownTimer=null)}function applyCheckoutButtonsState(){ensureBundleButtonDefaults();const e=document.querySelectorAll(".bundle-buy-btn"),t=getCheckoutCooldownSeconds();if(t>0){const n=`Try again in ${formatRetryDelay(t)}`;e.forEach(o=>{o.disabled=!0,o.textContent=n});return}if(checkoutRequestInFlight){e.forEach(n=>{n.disabled=!0});return}e.forEach(n=>{n.disabled=!1,n.textContent=n.dataset.defaultLabel||"Buy now"})}function startCheckoutCooldown(e){const t=Math.max(1,Math.ceil(Number(e)||0));checkoutCooldownUntilMs=Date.now()+t*1e3,clearCheckoutCooldownTimer(),applyCheckoutButtonsState(),checkoutCooldownTimer=setInterval(()=>{getCheckoutCooldownSeconds()<=0&&(checkoutCooldownUntilMs=0,clearCheckoutCooldownTimer()),applyCheckoutButtonsState()},1e3)}function getUploadCooldownSeconds(){return uploadCooldownUntilMs?Math.max(0,Math.ceil((uploadCooldownUntilMs-Date.now())/1e3)):0}function clearUploadCooldownTimer(){uploadCooldownTimer&&(clearInterval(uploadCooldownTimer),uploadCooldownTimer=null)}function startUploadCooldown(e){const t=Math.max(1,Math.ceil(Number(e)||0));uploadCooldownUntilMs=Date.now()+t*1e3,clearUploadCooldownTimer(),updateProcessButton(),uploadCooldownTimer=setInterval(()=>{getUploadCooldownSeconds()<=0&&(uploadCooldownUntilMs=0,clearUploadCooldownTimer()),updateProcessButton()},1e3)}function hasEnoughCredits(){if(!userCredits)return!1;const e=modeConfig[currentMode];if(e.creditType==="lecture")return userCredits.lecture_standard+userCredits.lecture_extended>0;if(e.creditType==="slides")return userCredits.slides>0;if(e.creditType==="interview"){const t=getInterviewExtraCost();return getTotalInterviewCredits()>0&&userCredits.slides>=t}return!1}function getProgressStepsForMode(e,t){return progressFlowUtils&&typeof progressFlowUtils.getProgressStepsForMode=="function"?progressFlowUtils.getProgressStepsForMode(e,t,modeConfig):String(e||"").trim()==="slides-only"?modeConfig["slides-only"].steps.slice():modeConfig["lecture-notes"].steps.slice()}function updateProgressStepsForStatus(e){const t=Math.max(0,Number(e&&e.total_steps||0)),n=String(e&&e.mode||currentMode||"").trim()||currentMode,o=getProgressStepsForMode(n,t);progressSteps.childElementCount!==o.length&&buildProgressSteps(o)}function buildRuntimeJobSnapshot(e,t={}){return progressFlowUtils&&typeof progressFlowUtils.buildRuntimeJobSnapshot=="function"?progressFlowUtils.buildRuntimeJobSnapshot(e,t,runtimeJobUtils):Object.assign({},t||{},e||{})}function applyRuntimeJobProgress(e,t={}){const n=buildRuntimeJobSnapshot(e);if(!n.job_id)return!1;n.mode&&n.mode!==currentMode&&switchMode(n.mode),studyPackTitleInput&&!String(studyPackTitleInput.value||"").trim()&&n.study_pack_title&&(studyPackTitleInput.value=n.study_pack_title);const o=getProgressStepsForMode(n.mode||currentMode,t.totalSteps||n.total_steps);return buildProgressSteps(o),progressSection.classList.add("visible"),resultsSection.classList.remove("visible"),progressStatus.classList.remove("error"),setHidden(progressSpinner,!1),showProgressSafeBanner(!0),focusProgressSection(),updateProgressUI(Math.max(0,Number(n.step||0)),n.step_description||"Processing continues in the background...",o.length),currentJobId=n.job_id,trackedTerminalJobId="",cacheActiveRuntimeJob(n),updateProcessButton(),!0}function shouldPromptForNotificationsAfterJobStart(){return runtimeJobUtils&&typeof runtimeJobUtils.shouldPromptForNotifications=="function"?runtimeJobUtils.shouldPromptForNotifications({jobStarted:!0,notificationSupported:"Notification"in window,permission:"Notification"in window?Notification.permission:"denied"}):"Notification"in window&&Notification.permission==="default"}function maybeRequestNotificationPermissionAfterJobStart(){if(!(notificationPermissionRequested||!shouldPromptForNotificationsAfterJobStart())){notificationPermissionRequested=!0;try{Notification.requestPermission().catch(()=>{})}catch(e){}}}function maybeSendCompletionNotification(e,t){const n=buildRuntimeJobSnapshot(e,t);if(!n.job_id||notifiedTerminalJobIds.has(n.job_id)||!(document.visibilityState!=="visible"||!document.hasFocus())||!(runtimeJobUtils&&typeof runtimeJobUtils.shouldSendCompletionNotification=="function")||!runtimeJobUtils.shouldSendCompletionNotification({notificationSupported:"Notification"in window,permission:"Notification"in window?Notification.permission:"denied",status:t&&t.status}))return;const s=runtimeJobUtils.buildCompletionNotification(n,t||{});if(!(!s||!s.title)){notifiedTerminalJobIds.add(n.job_id);try{const r=new Notification(s.title,{body:s.body||"",silent:!1});r.onclick=()=>{try{window.focus()}catch(i){}window.location.href="/study"}}catch(r){}}}function updateUploadEstimatePanel(){if(!uploadEstimate||!uploadEstimateTime||!uploadEstimateMeta)return;if(!currentUser||resultsLocked){setHidden(uploadEstimate,!0);return}setHidden(uploadEstimate,!1),uploadEstimateTime.textContent=UPLOAD_ESTIMATE_COPY[currentMode]||"Processing time depends on the upload.";const t=((pdfFile?Number(pdfFile.size||0):0)+currentAudioBytes())/(1024*1024);if(currentMode==="lecture-notes")uploadEstimateMeta.textContent=`Requires PDF or PPTX (max 50 MB) + audio (max 500 MB). Current upload: ${t.toFixed(1)} MB.`;else if(currentMode==="slides-only")uploadEstimateMeta.textContent=`Requires PDF or PPTX (max 50 MB). Current upload: ${t.toFixed(1)} MB.`;else{const n=getInterviewExtraCost();uploadEstimateMeta.textContent=`Requires audio only (max 500 MB). Selected extras: ${n} (${n} text extraction credits). Current upload: ${t.toFixed(1)} MB.`}}function updateMobileProcessSummary(e={}){if(!mobileProcessSummary)return;const t=modeConfig[currentMode]||{},n=Math.max(0,Number(e.uploadCooldown||0)),o=e.hasCredits!==!1,s=!t.needsPdf||!!pdfFile,r=!t.needsAudio||!!audioFile||hasReadyImportedAudioToken();if(processingUi&&typeof processingUi.getProcessReadinessSummary=="function"){mobileProcessSummary.textContent=processingUi.getProcessReadinessSummary({signedIn:!!currentUser,currentMode,modeConfig,pdfReady:s,audioReady:r,hasCredits:o,uploadedAudioReady:!!audioFile,importedAudioReady:hasReadyImportedAudioToken(),hasLocalAudioFile:!!audioFile,audioImportInFlight,currentJobActive:!!(currentJobId&&!resultsLocked),uploadCooldown:n,formatRetryDelay});return}mobileProcessSummary.textContent="Complete the required items to start processing."}function updateProcessButton(){const e=modeConfig[currentMode],t=!e.needsPdf||pdfFile,n=!e.needsAudio||audioFile||hasReadyImportedAudioToken(),o=hasEnoughCredits(),s=getUploadCooldownSeconds();if(updateUploadEstimatePanel(),updateMobileProcessSummary({pdfReady:t,audioReady:n,hasCredits:o,uploadCooldown:s}),s>0){processButton.disabled=!0,processButton.querySelector("span").textContent=`Try again in ${formatRetryDelay(s)}`,noCreditsWarning.classList.remove("visible");return}if(e.needsAudio&&audioImportInFlight&&!audioFile){processButton.disabled=!0,processButton.querySelector("span").textContent="Importing lecture audio...",noCreditsWarning.classList.remove("visible");return}if(currentJobId&&!resultsLocked){processButton.disabled=!0,processButton.querySelector("span").textContent="Processing in background...",noCreditsWarning.classList.remove("visible");return}if(processButton.disabled=!(t&&n&&o)||resultsLocked,processButton.querySelector("span").textContent=e.buttonText,currentUser&&!o&&!resultsLocked){currentMode==="interview"&&getTotalInterviewCredits()>0&&userCredits.slides<getInterviewExtraCost()?setSanitizedHtml(noCreditsWarning,`You don't have enough text extraction credits for the selected interview extras. <a href="#" id="buy-credits-link-inline">Buy more credits</a>`):setSanitizedHtml(noCreditsWarning,`You don't have enough credits. <a href="#" id="buy-credits-link-inline">Buy more credits</a>`),noCreditsWarning.classList.add("visible");const r=document.getElementById("buy-credits-link-inline");r&&r.addEventListener("click",i=>{i.preventDefault(),window.location.href="/buy_credits"})}else noCreditsWarning.classList.remove("visible")}function switchMode(e){forcedMode&&e!==forcedMode&&(e=forcedMode),!(modeConfig[e]||{}).needsAudio&&(recordingState==="recording"||recordingState==="paused")&&stopAudioRecording(),currentMode=e;const t=modeConfig[e];modeTabs.forEach(n=>{const o=n.dataset.mode===e;n.classList.toggle("active",o),n.setAttribute("aria-selected",o?"true":"false"),n.tabIndex=o?0:-1}),modeDescriptionText.textContent=t.description,pdfZoneTitle&&(pdfZoneTitle.textContent=t.pdfTitle||"Lecture Slides"),pdfZoneBadge&&(pdfZoneBadge.textContent=t.pdfRequirement||"Required",pdfZoneBadge.className=`upload-badge ${t.pdfRequirementTone||"required"}`),pdfZoneHelper&&(pdfZoneHelper.textContent=t.pdfHelper||""),audioZoneTitle.textContent=t.audioTitle,audioZoneBadge&&(audioZoneBadge.textContent=t.audioRequirement||"Required",audioZoneBadge.className=`upload-badge ${t.audioRequirementTone||"required"}`),audioZoneHelper&&(audioZoneHelper.textContent=t.audioHelper||""),audioUrlImportTitle&&(audioUrlImportTitle.textContent=t.lmsImportTitle||"Import from lecture video URL"),audioUrlImportHint&&(audioUrlImportHint.textContent=t.lmsImportHint||""),generationControls.classList.toggle("hidden",e==="interview"),interviewControls.classList.toggle("hidden",e!=="interview"),e==="interview"&&(studyToolsPanel.classList.remove("visible"),studyToolsToggle.classList.remove("open")),updateModeCreditDisplay(),setHidden(pdfInfo,!pdfFile),pdfZone.classList.toggle("has-file",!!pdfFile),t.needsAudio||syncAudioInfoUI(),setStudyFeature(selectedStudyFeatures),updateInterviewOptionsUI(),syncRecorderUI(),syncProcessingLayout(),updateProcessButton()}modeTabs.forEach(e=>e.addEventListener("click",()=>switchMode(e.dataset.mode))),modeTabs.forEach((e,t)=>e.addEventListener("keydown",n=>{if(modeTabs.length){if(n.key==="ArrowRight"||n.key==="ArrowDown"){n.preventDefault();const o=modeTabs[(t+1)%modeTabs.length];switchMode(o.dataset.mode),o.focus()}else if(n.key==="ArrowLeft"||n.key==="ArrowUp"){n.preventDefault();const o=modeTabs[(t-1+modeTabs.length)%modeTabs.length];switchMode(o.dataset.mode),o.focus()}else if(n.key==="Home"){n.preventDefault();const o=modeTabs[0];switchMode(o.dataset.mode),o.focus()}else if(n.key==="End"){n.preventDefault();const o=modeTabs[modeTabs.length-1];switchMode(o.dataset.mode),o.focus()}}})),advancedSettingsToggle.addEventListener("click",()=>{const e=!advancedSettingsBody.classList.contains("visible");setAdvancedSettingsVisible(e),e||(setOutputLanguageMenuVisible(!1),studyToolsPanel.classList.remove("visible"),studyToolsToggle.classList.remove("open"))});function handlePdfFile(e){if(!e)return;const t=String(e.name||"").toLowerCase(),n=allowedSlideExtensions.some(r=>t.endsWith(r)),o=String(e.type||"").toLowerCase(),s=allowedSlideMimeTypes.includes(o);if(!n||!s){showToast("Please select a valid PDF or PPTX file","error");return}if(e.size>50*1024*1024){showToast("Slide file must be under 50 MB","error");return}pdfFile=e,pdfName.textContent=e.name,pdfSize.textContent=formatFileSize(e.size),setHidden(pdfInfo,!1),pdfZone.classList.add("has-file"),syncProcessingLayout(),updateProcessButton()}function handleAudioFile(e,t={}){if(!e)return;if(![".mp3",".m4a",".wav",".aac",".ogg",".flac"].some(o=>e.name.toLowerCase().endsWith(o))){showToast("Please select a valid audio file","error");return}if(e.size>500*1024*1024){showToast("Audio file must be under 500 MB","error");return}pendingAutoImportUrl="",importedAudioToken&&releaseImportedAudioToken({clearStatus:!0}),audioFile=e,audioFileOrigin=t.origin==="recording"?"recording":"upload",recordedAudioNeedsDownload=audioFileOrigin==="recording",audioFileOrigin!=="recording"&&(recorderStatusMessage="",recorderStatusTone="info"),syncAudioInfoUI(),updateProcessButton()}function shouldIgnoreDropZoneActivation(e){return!e||typeof e.closest!="function"?!1:!!(e.closest(".file-remove")||e.closest(".file-info")||e.closest(".audio-recorder-panel")||e.closest("button")||e.closest("a")||e.closest("input")||e.closest("select")||e.closest("textarea"))}function setupDropZone(e,t,n){e.addEventListener("click",o=>{shouldIgnoreDropZoneActivation(o.target)||t.click()}),e.addEventListener("keydown",o=>{o.target===e&&(o.key!=="Enter"&&o.key!==" "||(o.preventDefault(),t.click()))}),t.addEventListener("change",o=>{o.target.files.length&&n(o.target.files[0])}),e.addEventListener("dragover",o=>{o.preventDefault(),e.classList.add("drag-over")}),e.addEventListener("dragleave",o=>{o.preventDefault(),e.classList.remove("drag-over")}),e.addEventListener("drop",o=>{o.preventDefault(),e.classList.remove("drag-over"),o.dataTransfer.files.length&&n(o.dataTransfer.files[0])})}function downloadLocalPreviewFile(e){if(!e)return!1;const t=URL.createObjectURL(e),n=document.createElement("a");return n.href=t,n.download=String(e.name||"upload"),document.body.appendChild(n),n.click(),document.body.removeChild(n),URL.revokeObjectURL(t),!0}setupDropZone(pdfZone,pdfInput,handlePdfFile),setupDropZone(audioZone,audioInput,handleAudioFile),audioRecordStartBtn&&audioRecordStartBtn.addEventListener("click",e=>{e.stopPropagation(),startAudioRecording()}),audioRecordPauseBtn&&audioRecordPauseBtn.addEventListener("click",e=>{e.stopPropagation(),toggleAudioRecordingPause()}),audioRecordStopBtn&&audioRecordStopBtn.addEventListener("click",e=>{e.stopPropagation(),stopAudioRecording()}),pdfInfo&&(pdfInfo.title="Click to download this selected file",pdfInfo.addEventListener("click",e=>{e.target.closest(".file-remove")||downloadLocalPreviewFile(pdfFile)&&showToast("Lecture slides download started.","success",1600)})),audioInfo&&(audioInfo.title="Click to download this selected file",audioInfo.addEventListener("click",e=>{if(!e.target.closest(".file-remove")){if(downloadLocalPreviewFile(audioFile)){audioFileOrigin==="recording"?(recordedAudioNeedsDownload=!1,syncAudioInfoUI(),showToast("Recording download started. Keep that file safe because the in-browser copy will disappear when you leave this page.","success",4200)):showToast("Audio file download started.","success",1600);return}importedAudioToken&&showToast("Imported audio is temporary and cannot be downloaded from this preview.","info",2800)}})),pdfRemove.addEventListener("click",e=>{e.stopPropagation(),pdfFile=null,pdfInput.value="",setHidden(pdfInfo,!0),pdfZone.classList.remove("has-file"),syncProcessingLayout(),updateProcessButton()}),audioRemove.addEventListener("click",e=>{e.stopPropagation(),audioFile=null,audioFileOrigin="upload",recordedAudioNeedsDownload=!1,recorderStatusMessage="",recorderStatusTone="info",audioInput.value="",pendingAutoImportUrl="",importedAudioToken&&releaseImportedAudioToken({clearStatus:!0}),syncAudioInfoUI(),updateProcessButton()});function buildProgressSteps(e){progressSteps.innerHTML="",progressSteps.classList.toggle("single-step",e.length===1),e.forEach(t=>{const n=document.createElement("div");n.className="progress-step",n.id=`step-${t.num}`;const o=document.createElement("div");o.className="step-indicator",o.textContent=String(t.num);const s=document.createElement("div");s.className="step-label",s.textContent=String(t.label||""),n.appendChild(o),n.appendChild(s),progressSteps.appendChild(n)})}function updateProgressUI(e,t,n){for(let o=1;o<=n;o++){const s=document.getElementById(`step-${o}`);s&&(s.classList.remove("active","complete"),o<e?s.classList.add("complete"):o===e&&s.classList.add("active"))}progressStatus&&(progressStatus.setAttribute("role","status"),progressStatus.setAttribute("aria-live","polite"),progressStatus.setAttribute("aria-atomic","true")),statusText.textContent=t||"Processing..."}function announceProgressError(e){!progressStatus||!statusText||(progressStatus.setAttribute("role","alert"),progressStatus.setAttribute("aria-live","assertive"),progressStatus.setAttribute("aria-atomic","true"),statusText.textContent=e||"Error while processing.")}function focusProgressSection(){if(progressSection)try{progressSection.focus({preventScroll:!0})}catch(e){try{progressSection.focus()}catch(t){}}}function getCurrentModeSteps(){return currentMode==="lecture-notes"?selectedStudyFeatures==="none"?modeConfig["lecture-notes"].steps.slice(0,3):modeConfig["lecture-notes"].steps:currentMode==="slides-only"?selectedStudyFeatures==="none"?modeConfig["slides-only"].steps.slice(0,1):modeConfig["slides-only"].steps:selectedInterviewFeatures.length>0?[{num:1,label:"Transcribe"},{num:2,label:"Create Extras"}]:modeConfig.interview.steps}function longPollFloorDelay(e){return Math.max(0,POLL_BASE_MS-(Date.now()-e))}function scheduleNextPoll(e){pollInterval&&clearTimeout(pollInterval),pollInterval=setTimeout(pollStatus,Math.max(0,e||0))}function setProgressRetryVisible(e){!progressRetry||!progressRetryBtn||(progressRetry.classList.toggle("visible",!!e),e&&(progressRetryBtn.disabled=!1))}function retryStatusCheckNow(){if(!currentJobId){showToast("No active job to retry.","info"),setProgressRetryVisible(!1);return}setProgressRetryVisible(!1),progressStatus.classList.remove("error"),setHidden(progressSpinner,!1),statusText.textContent="Re-checking job status...",trackEvent("processing_retry_requested",{job_id:currentJobId}),startPolling()}function startPolling(){stopPolling(),pollFailures=0,pollMissingResponses=0,pollStartedAt=Date.now(),setProgressRetryVisible(!1),scheduleNextPoll(0)}function stopPolling(){pollInterval&&clearTimeout(pollInterval),pollInterval=null,pollFailures=0,pollMissingResponses=0,pollStartedAt=0,pollStatusEtag=""}function resetProcessingSession(e={}){const t=!!e.keepProgressVisible,n=!!e.keepStatusMessage,o=e.hideRetry!==!1;stopPolling(),o&&setProgressRetryVisible(!1),currentJobId=null,trackedTerminalJobId="",showProgressSafeBanner(!1),n||(statusText.textContent="Starting..."),!t&&!resultsLocked&&(progressSection.classList.remove("visible"),progressStatus.classList.remove("error"),setHidden(progressSpinner,!1)),updateProcessButton()}async function authenticatedFetch(e,t={},n=!0){if(!currentUser)throw new Error("Please sign in");if(authClient&&typeof authClient.authFetch=="function"){const r=await authClient.authFetch(e,t,{retryOn401:n!==!1});if(authClient&&typeof authClient.getToken=="function"){const i=authClient.getToken();i&&(idToken=i)}return r}idToken||(idToken=await currentUser.getIdToken());const o={...t.headers||{},Authorization:`Bearer ${idToken}`},s=await fetch(e,{...t,headers:o});return s.status===401&&n?(idToken=await currentUser.getIdToken(!0),fetch(e,{...t,headers:{...t.headers||{},Authorization:`Bearer ${idToken}`}})):s}async function downloadAuthenticatedFile(e,t){const n=await authenticatedFetch(e);if(!n.ok){let i="Could not download file.";try{i=(await n.json()).error||i}catch(a){}throw new Error(i)}if(downloadUtils.downloadResponseBlob){await downloadUtils.downloadResponseBlob(n,t);return}const o=await n.blob(),s=URL.createObjectURL(o),r=document.createElement("a");r.href=s,r.download=t,document.body.appendChild(r),r.click(),document.body.removeChild(r),URL.revokeObjectURL(s)}function reconcileCachedRuntimeJobs(e){if(!currentUser)return Promise.resolve({jobs:mergeRuntimeJobs([],e),latestJob:null});const t=mergeRuntimeJobs([],e),o=readActiveRuntimeJobsCache(currentUser).filter(s=>{const r=String(s&&s.job_id||"").trim();return r&&!t.some(i=>String(i&&i.job_id||"").trim()===r)});return o.length?Promise.all(o.map(async s=>{const r=String(s&&s.job_id||"").trim();if(!r)return null;try{const i=await authenticatedFetch(`/status/${encodeURIComponent(r)}`);if(!i.ok)return i.status===404&&removeActiveRuntimeJob(r),null;const a=await i.json();return{cached:s,payload:a}}catch(i){return null}})).then(s=>{let r=t.slice();return s.forEach(i=>{if(!i||!i.payload)return;const a=String(i.payload.status||"").trim().toLowerCase();if(runtimeJobUtils&&typeof runtimeJobUtils.isActiveStatus=="function"&&runtimeJobUtils.isActiveStatus(a)){r=mergeRuntimeJobs(r,[Object.assign({},i.cached||{},i.payload||{})]);return}removeActiveRuntimeJob(i.cached&&i.cached.job_id)}),{jobs:r,latestJob:getLatestRuntimeJob(r)}}):Promise.resolve({jobs:t,latestJob:getLatestRuntimeJob(t)})}function resumeLatestRuntimeJob(e,t={}){if(resultsLocked)return!1;const n=getLatestRuntimeJob(e);return!n||!n.job_id?!1:(currentJobId&&currentJobId===n.job_id&&t.force!==!0||(applyRuntimeJobProgress(n),t.startPolling!==!1&&startPolling()),!0)}async function refreshActiveRuntimeJobs(e){if(!currentUser||!idToken){setActiveRuntimeJobs([]),clearRuntimeJobsRefreshTimer();return}if(!(runtimeJobsRefreshInFlight&&!e)){runtimeJobsRefreshInFlight=!0;try{const t=await authenticatedFetch("/api/runtime-jobs/active");if(!t.ok)throw new Error("Could not refresh active jobs.");const n=await t.json(),o=await reconcileCachedRuntimeJobs(n&&n.jobs?n.jobs:[]);setActiveRuntimeJobs(o.jobs||[]),resultsLocked||resumeLatestRuntimeJob(o.jobs||[],{startPolling:!0,force:e})}catch(t){e&&showToast(t.message||"Could not refresh processing jobs.","error")}finally{runtimeJobsRefreshInFlight=!1,scheduleRuntimeJobsRefresh(RUNTIME_JOBS_REFRESH_MS)}}}async function exportMyAccountData(){if(!currentUser){showAuthModal("signin");return}if(!accountActionInFlight){accountActionInFlight=!0;try{const e=`lecture-processor-account-export-${localDateString()}.json`;await downloadAuthenticatedFile("/api/account/export",e),showToast("Your data export has been downloaded.","success",5e3)}catch(e){captureClientError(e,"account_export"),showToast(e.message||"Could not export your data.","error",5e3)}finally{accountActionInFlight=!1}}}function setDeleteAccountError(e){deleteAccountError&&(deleteAccountError.textContent=String(e||"").trim())}function openDeleteAccountModal(){if(!deleteAccountOverlay)return;const e=String(currentUser&&currentUser.email||"").trim();deleteAccountTextInput&&(deleteAccountTextInput.value=""),deleteAccountEmailInput&&(deleteAccountEmailInput.value=e),setDeleteAccountError(""),deleteAccountConfirmBtn&&(deleteAccountConfirmBtn.disabled=!1,deleteAccountConfirmBtn.textContent="Delete permanently"),openOverlay(deleteAccountOverlay),setTimeout(()=>{deleteAccountTextInput&&deleteAccountTextInput.focus()},20)}function closeDeleteAccountModal(){deleteAccountOverlay&&(closeOverlay(deleteAccountOverlay),setDeleteAccountError(""))}async function submitDeleteAccountModal(){if(!currentUser||accountActionInFlight)return;const e=String(currentUser.email||"").trim();if(!e){setDeleteAccountError("Could not verify account email. Please sign in again.");return}if(String(deleteAccountTextInput&&deleteAccountTextInput.value||"").trim().toUpperCase()!=="DELETE MY ACCOUNT"){setDeleteAccountError("Type DELETE MY ACCOUNT exactly to continue.");return}if(String(deleteAccountEmailInput&&deleteAccountEmailInput.value||"").trim().toLowerCase()!==e.toLowerCase()){setDeleteAccountError("Email does not match your signed-in account.");return}accountActionInFlight=!0,deleteAccountConfirmBtn&&(deleteAccountConfirmBtn.disabled=!0,deleteAccountConfirmBtn.textContent="Deleting...");try{const o=await authenticatedFetch("/api/account/delete",{method:"POST",headers:{"Content-Type":"application/json"},body:JSON.stringify({confirm_text:"DELETE MY ACCOUNT",confirm_email:e})}),s=await o.json().catch(()=>({}));if(!o.ok)throw new Error(s.error||"Could not delete account data.");closeDeleteAccountModal(),showToast("Account deleted. Signing out...","success",5e3);try{await auth.signOut()}catch(r){}window.location.href="/"}catch(o){captureClientError(o,"account_delete"),setDeleteAccountError(o.message||"Could not delete account data.")}finally{accountActionInFlight=!1,deleteAccountConfirmBtn&&(deleteAccountConfirmBtn.disabled=!1,deleteAccountConfirmBtn.textContent="Delete permanently")}}async function deleteMyAccountData(){if(!currentUser){showAuthModal("signin");return}accountActionInFlight||openDeleteAccountModal()}async function pollStatus(){if(currentJobId){if(pollStartedAt&&Date.now()-pollStartedAt>POLL_MAX_RUNTIME_MS){const e=currentJobId;resetProcessingSession({keepProgressVisible:!0,keepStatusMessage:!0}),progressStatus.classList.add("error"),setHidden(progressSpinner,!0),statusText.textContent="Still processing on the server. Start a new run or retry later from Study Library.",showToast("Processing is taking longer than expected. Please check again shortly.","info",6e3),trackEvent("processing_timeout",e?{job_id:e}:{});return}try{const requestStartedAt=Date.now(),e=await authenticatedFetch(`/status/${currentJobId}?wait=${POLL_LONG_WAIT_SECONDS}`,pollStatusEtag?{headers:{"If-None-Match":pollStatusEtag}}:{});if(e.status===401){resetProcessingSession({keepProgressVisible:!0}),showAuthModal("signin");return}if(e.status===403){resetProcessingSession({keepProgressVisible:!0}),showError("You do not have access to this job.");return}if(e.status===304){pollFailures=0,scheduleNextPoll(longPollFloorDelay(requestStartedAt));return}pollStatusEtag=e.headers.get("ETag")||"";const t=await e.json();if(t.error&&t.status!=="error"){if(e.status===404&&(t.retryable||t.error_code==="JOB_TEMPORARILY_UNAVAILABLE"||t.job_lost)&&pollMissingResponses<3){pollMissingResponses+=1;const s=Math.min(POLL_MAX_MS,POLL_BASE_MS*Math.pow(2,pollMissingResponses));statusText.textContent=`Reconnecting to job status... retrying in ${Math.ceil(s/1e3)}s`,scheduleNextPoll(s);return}const o=currentJobId;resetProcessingSession({keepProgressVisible:!0}),trackEvent("processing_failed",{reason:t.error_code||"job_not_found",job_id:o||void 0}),showToast(t.error||"Error: Job not found","error");return}if(updateProgressStepsForStatus(t),updateProgressUI(t.step,t.step_description,t.total_steps),cacheActiveRuntimeJob({job_id:currentJobId,mode:t.mode||currentMode,status:t.status,step:t.step,step_description:t.step_description,study_pack_title:getStudyPackTitleValue(),started_at:Math.floor((pollStartedAt||Date.now())/1e3),study_pack_id:t.study_pack_id||"",error:t.error||""}),t.status==="complete")stopPolling(),setProgressRetryVisible(!1),pollMissingResponses=0,maybeSendCompletionNotification({job_id:currentJobId,mode:t.mode||currentMode,study_pack_title:getStudyPackTitleValue(),study_pack_id:t.study_pack_id||""},t),removeActiveRuntimeJob(currentJobId),currentJobId&&trackedTerminalJobId!==currentJobId&&(trackedTerminalJobId=currentJobId,trackEvent("processing_completed",{job_id:currentJobId})),showResults(t.result,t.slide_text,t.transcript,t.flashcards||[],t.test_questions||[],t.study_generation_error||null,t.study_pack_id||null,t.study_features||"none",t.interview_summary||"",t.interview_sections||"",t.interview_combined||"",t.interview_features_successful||[],t.billing_receipt||null),fetchUserData();else if(t.status==="error"){const n=currentJobId;maybeSendCompletionNotification({job_id:n,mode:t.mode||currentMode,study_pack_title:getStudyPackTitleValue(),study_pack_id:t.study_pack_id||"",error:t.error||""},t),removeActiveRuntimeJob(n),resetProcessingSession({keepProgressVisible:!0}),pollMissingResponses=0,n&&trackedTerminalJobId!==n&&(trackedTerminalJobId=n,trackEvent("processing_failed",{job_id:n,credit_refunded:!!t.credit_refunded})),showError(t.error,t.credit_refunded,t.billing_receipt||null)}else showProgressSafeBanner(!0),setProgressRetryVisible(!1),pollFailures=0,pollMissingResponses=0,scheduleNextPoll(pollStatusEtag?longPollFloorDelay(requestStartedAt):POLL_BASE_MS)}catch(e){console.error(e),captureClientError(e,"poll_status"),pollFailures+=1;const t=Math.min(POLL_MAX_MS,POLL_BASE_MS*Math.pow(2,Math.min(pollFailures,5)));statusText.textContent=`Temporary connection issue. Retrying in ${Math.ceil(t/1e3)}s...`,scheduleNextPoll(t)}}}async function processFiles(){if(!currentUser){showAuthModal("signin");return}if(resultsLocked){showToast('Click "Process Another File" to start a new generation.',"info");return}if(currentJobId){showToast("A job is already processing. You can safely leave and find the result in Study Library.","info",4200);return}const e=getUploadCooldownSeconds();if(e>0){showToast(`Upload temporarily limited. Try again in ${formatRetryDelay(e)}.`,"info",4500),updateProcessButton();return}const t=modeConfig[currentMode],n=getStudyPackTitleValue();if(!n){showToast("Lecture Topic / Name is required.","error"),studyPackTitleInput&&typeof studyPackTitleInput.focus=="function"&&studyPackTitleInput.focus();return}const u=!!(t.needsAudio&&audioFile&&audioFile.size>CHUNKED_AUDIO_UPLOAD_THRESHOLD_BYTES),o=new FormData;o.append("mode",currentMode),o.append("study_pack_title",n),t.needsPdf&&pdfFile&&o.append("pdf",pdfFile),t.needsAudio&&audioFile&&!u&&o.append("audio",audioFile);const s=t.needsAudio?getReadyImportedAudioToken():"";t.needsAudio&&s&&!audioFile&&o.append("audio_import_token",s);const r=outputLanguageSelect.value||"english";if(o.append("output_language",r),r==="other"){const a=outputLanguageCustom.value.trim();if(!a){showToast("Please enter a custom output language.","error");return}o.append("output_language_custom",a)}currentMode!=="interview"?(o.append("flashcard_amount",selectedFlashcardAmount),o.append("question_amount",selectedQuestionAmount),o.append("study_features",selectedStudyFeatures)):o.append("interview_features",getInterviewFeaturesValue());const i=getCurrentModeSteps();buildProgressSteps(i),processButton.disabled=!0,setProgressRetryVisible(!1),progressSection.classList.add("visible"),resultsSection.classList.remove("visible"),progressStatus.classList.remove("error"),setHidden(progressSpinner,!1),showProgressSafeBanner(!1);try{progressSection.scrollIntoView({behavior:"smooth",block:"start"})}catch(a){}focusProgressSection(),updateProgressUI(0,"Uploading files...",i.length),trackEvent("process_clicked",{study_features:selectedStudyFeatures,flashcard_amount:selectedFlashcardAmount,question_amount:selectedQuestionAmount,interview_features_count:selectedInterviewFeatures.length});try{let a=null,c=null;if(u){const m=await uploadAudioFileInChunks(audioFile,(h,p)=>{updateProgressUI(0,`Uploading audio... ${Math.floor(h/Math.max(1,p)*100)}%`,i.length)});m.payload&&m.payload.audio_import_token?o.append("audio_import_token",m.payload.audio_import_token):(a=m.response,c=m.payload&&m.payload.error?m.payload:{error:"Audio upload failed. Please try again."})}c||(a=await authenticatedFetch("/upload",{method:"POST",body:o}),c=await a.json());if(c.error){if(trackEvent("processing_failed",{reason:c.error||"upload_failed"}),typeof c.error=="string"&&c.error.toLowerCase().includes("imported audio token")&&(clearImportedAudioLocalState(),syncAudioInfoUI()),a.status===401)showAuthModal();else if(a.status===402)showError("No credits remaining. Please purchase more credits."),noCreditsWarning.classList.add("visible");else if(a.status===429){const l=getRetryAfterSeconds(a,c),d=l?`${c.error} Try again in ${formatRetryDelay(l)}.`:c.error;l>0&&startUploadCooldown(l),showError(d),showToast(d,"info",6e3)}else showError(c.error);resetProcessingSession({keepProgressVisible:!0,keepStatusMessage:!0});return}currentJobId=c.job_id,trackedTerminalJobId="",cacheActiveRuntimeJob({job_id:currentJobId,mode:currentMode,status:"starting",step:0,step_description:"Starting...",study_pack_title:n,started_at:Math.floor(Date.now()/1e3),study_pack_id:"",error:""}),showProgressSafeBanner(!0),maybeRequestNotificationPermissionAfterJobStart(),trackEvent("processing_started",{job_id:currentJobId,study_features:selectedStudyFeatures,interview_features_count:selectedInterviewFeatures.length}),startPolling()}catch(a){captureClientError(a,"process_files"),showError("Failed to upload files. Please try again."),resetProcessingSession({keepProgressVisible:!0,keepStatusMessage:!0})}}processButton.addEventListener("click",processFiles);function simpleMarkdownToHtml(e){return markdownUtils.parseMarkdownToSafeHtml?markdownUtils.parseMarkdownToSafeHtml(e):escapeHtml(String(e||"")).replace(/\n/g,"<br>")}function buildDownloadDropdown(){const e=typeof indexResultsUtils.buildDownloadOptions=="function"?indexResultsUtils.buildDownloadOptions({currentMode,currentStudyPackId,downloadLabels:DOWNLOAD_LABELS,interviewCombinedText,interviewSectionsText,interviewSummaryText,transcript}):[];for(;downloadDropdownContent.firstChild;)downloadDropdownContent.removeChild(downloadDropdownContent.firstChild);e.forEach(t=>{if(t.divider){const s=document.createElement("div");s.className="dropdown-divider",downloadDropdownContent.appendChild(s);return}const n=document.createElement("button");n.type="button",n.className="dropdown-item",n.setAttribute("role","menuitem"),n.dataset.type=t.type,n.dataset.format=t.format,n.append(document.createTextNode(t.label));const o=document.createElement("span");o.textContent=t.detail,n.appendChild(o),n.addEventListener("click",()=>{downloadFile(t.type,t.format),setDownloadDropdownVisible(!1)}),downloadDropdownContent.appendChild(n)})}async function downloadFile(e,t){if(e==="pdf-answers"||e==="pdf-no-answers"){if(!currentStudyPackId)return;const r=e==="pdf-answers",i="answers="+(r?"true":"false")+"&download=true",a="study-pack-"+currentStudyPackId+(r?"":"-no-answers")+".pdf";showToast("Download started","success");try{const l=await(await authenticatedFetch("/api/study-packs/"+encodeURIComponent(currentStudyPackId)+"/export-pdf?"+i)).blob();if(downloadUtils.saveBlobAsFile)downloadUtils.saveBlobAsFile(l,a);else{const d=URL.createObjectURL(l),u=document.createElement("a");u.href=d,u.download=a,document.body.appendChild(u),u.click(),document.body.removeChild(u),URL.revokeObjectURL(d)}}catch(c){showToast(c.message||"Could not download PDF.","error")}return}const n=typeof indexResultsUtils.resolveTextDownload=="function"?indexResultsUtils.resolveTextDownload({currentMode,format:t,interviewCombinedText,interviewSectionsText,interviewSummaryText,resultMarkdown,slideText,transcript,type:e}):{content:resultMarkdown,filename:"output.md"},o=n.content,s=n.filename;if(t==="md"){const r=new Blob([o],{type:"text/markdown"});if(downloadUtils.saveBlobAsFile)downloadUtils.saveBlobAsFile(r,s);else{const i=URL.createObjectURL(r),a=document.createElement("a");a.href=i,a.download=s,document.body.appendChild(a),a.click(),document.body.removeChild(a),URL.revokeObjectURL(i)}showToast("Download started","success")}else{if(!currentJobId)return;try{await downloadAuthenticatedFile(`/download-docx/${currentJobId}?type=${encodeURIComponent(e)}`,s),showToast("Download started","success")}catch(r){showToast(r.message||"Could not download file.","error")}}}function updateExportCsvButton(){const e=typeof indexResultsUtils.getExportCsvState=="function"?indexResultsUtils.getExportCsvState({activeResultsTab,currentMode,flashcards,testQuestions}):{visible:!1,type:"",text:""};exportCsvType=e.type||exportCsvType,e.text&&(exportStudyCsvText.textContent=e.text),setHidden(exportStudyCsvBtn,!e.visible)}function setActiveResultsTab(e){activeResultsTab=e,tabButtons.forEach(t=>{const n=t.dataset.tab===e;t.classList.toggle("active",n),t.setAttribute("aria-selected",n?"true":"false"),t.tabIndex=n?0:-1}),paneNotes.classList.toggle("active",e==="notes"),paneNotes.hidden=e!=="notes",paneFlashcards.classList.toggle("active",e==="flashcards"),paneFlashcards.hidden=e!=="flashcards",paneTest.classList.toggle("active",e==="test"),paneTest.hidden=e!=="test",updateExportCsvButton()}tabButtons.forEach(e=>e.addEventListener("click",()=>setActiveResultsTab(e.dataset.tab))),tabButtons.forEach((e,t)=>e.addEventListener("keydown",n=>{if(tabButtons.length){if(n.key==="ArrowRight"||n.key==="ArrowDown"){n.preventDefault();const o=tabButtons[(t+1)%tabButtons.length];setActiveResultsTab(o.dataset.tab),o.focus()}else if(n.key==="ArrowLeft"||n.key==="ArrowUp"){n.preventDefault();const o=tabButtons[(t-1+tabButtons.length)%tabButtons.length];setActiveResultsTab(o.dataset.tab),o.focus()}else if(n.key==="Home"){n.preventDefault();const o=tabButtons[0];setActiveResultsTab(o.dataset.tab),o.focus()}else if(n.key==="End"){n.preventDefault();const o=tabButtons[tabButtons.length-1];setActiveResultsTab(o.dataset.tab),o.focus()}}}));function renderFlashcard(){const e=typeof indexResultsUtils.buildFlashcardViewModel=="function"?indexResultsUtils.buildFlashcardViewModel(flashcards,flashcardIndex,flashcardFlipped):{hasCards:!1,progressText:"Card 0 of 0",canGoPrev:!1,canGoNext:!1};if(!e.hasCards){setHidden(flashcardEmpty,!1),setHidden(flashcardCard,!0),flashcardProgress.textContent=e.progressText,flashcardPrevBtn.disabled=!0,flashcardNextBtn.disabled=!0,flashcardFlipBtn.disabled=!0;return}setHidden(flashcardEmpty,!0),setHidden(flashcardCard,!1),flashcardFrontText.textContent=e.front,flashcardBackText.textContent=e.back,flashcardInner.classList.toggle("flipped",e.flipped),flashcardProgress.textContent=e.progressText,flashcardPrevBtn.disabled=!e.canGoPrev,flashcardNextBtn.disabled=!e.canGoNext,flashcardFlipBtn.disabled=!1}function goFlashcard(e){flashcards.length&&(flashcardIndex=Math.max(0,Math.min(flashcards.length-1,flashcardIndex+e)),flashcardFlipped=!1,renderFlashcard())}function flipFlashcard(){flashcards.length&&(flashcardFlipped=!flashcardFlipped,renderFlashcard())}flashcardCard.addEventListener("click",flipFlashcard),flashcardPrevBtn.addEventListener("click",()=>goFlashcard(-1)),flashcardNextBtn.addEventListener("click",()=>goFlashcard(1)),flashcardFlipBtn.addEventListener("click",flipFlashcard);function renderQuizQuestion(){const e=typeof indexResultsUtils.buildQuizViewModel=="function"?indexResultsUtils.buildQuizViewModel(testQuestions,quizIndex,quizScore):{hasQuestions:!1,progressText:"Question 0 of 0",scoreText:"Score: 0/0",options:[]};if(!e.hasQuestions){setHidden(quizEmpty,!1),quizQuestionText.textContent="",quizOptions.innerHTML="",quizExplanation.classList.remove("visible"),setHidden(quizNextBtn,!0),quizProgress.textContent=e.progressText,quizScoreEl.textContent=e.scoreText;return}setHidden(quizEmpty,!0),quizAnswered=!1,quizProgress.textContent=e.progressText,quizScoreEl.textContent=e.scoreText,quizQuestionText.textContent=e.questionText,quizOptions.innerHTML="",quizExplanation.classList.remove("visible"),quizExplanation.textContent="",e.options.forEach(t=>{const n=document.createElement("button");n.type="button",n.className="quiz-option",n.textContent=t,n.addEventListener("click",()=>answerQuizOption(n,t)),quizOptions.appendChild(n)}),setHidden(quizNextBtn,!0)}function answerQuizOption(e,t){if(quizAnswered)return;quizAnswered=!0;const n=typeof indexResultsUtils.evaluateQuizAnswer=="function"?indexResultsUtils.evaluateQuizAnswer(testQuestions,quizIndex,quizScore,t):{correctAnswer:"",explanation:"",hasNext:!1,nextScore:quizScore,selectedCorrect:!1};[...quizOptions.querySelectorAll(".quiz-option")].forEach(s=>{s.disabled=!0,s.textContent===n.correctAnswer&&s.classList.add("correct")}),n.selectedCorrect?(e.classList.add("correct"),quizScore=n.nextScore):e.classList.add("wrong"),quizScoreEl.textContent=`Score: ${quizScore}/${testQuestions.length}`,quizExplanation.textContent=n.explanation,quizExplanation.classList.add("visible"),setHidden(quizNextBtn,!n.hasNext)}quizNextBtn.addEventListener("click",()=>{quizIndex<testQuestions.length-1&&(quizIndex+=1,renderQuizQuestion())});function showResults(e,t,n,o,s,r,i,a,c,l,d,u,f){const m=currentJobId,g=modeConfig[currentMode];resultMarkdown=e||"",slideText=t||"",transcript=n||"",flashcards=Array.isArray(o)?o:[],testQuestions=Array.isArray(s)?s:[],interviewSummaryText=c||"",interviewSectionsText=l||"",interviewCombinedText=d||"",studyGenerationError=r,currentStudyPackId=i,currentStudyPackId&&(userHasCreatedStudyPack=!0,userProfileLoaded=!0),currentBillingReceipt=f&&typeof f=="object"?f:null,resultsLocked=!0,updateQuickstartVisibility(),resultsTitleText.textContent=g.resultTitle,setSanitizedHtml(resultsContent,simpleMarkdownToHtml(resultMarkdown),{ALLOWED_TAGS:["h1","h2","h3","p","br","strong","em","code","pre","ul","ol","li","blockquote","a","hr"],ALLOWED_ATTR:["href","title","target","rel"]}),flashcardCountBadge.textContent=String(flashcards.length),testCountBadge.textContent=String(testQuestions.length);const p=typeof indexResultsUtils.buildStudyWarning=="function"?indexResultsUtils.buildStudyWarning({currentMode,selectedInterviewFeatures,studyFeatures:a,studyGenerationError,successfulInterviewFeatures:u}):"";setHidden(studyWarning,!p),studyWarning.textContent=p,renderBillingReceipt(currentMode==="interview"?currentBillingReceipt:null),flashcardIndex=0,flashcardFlipped=!1,quizIndex=0,quizScore=0,renderFlashcard(),renderQuizQuestion(),setHidden(tabFlashcards,currentMode==="interview"),setHidden(tabTest,currentMode==="interview"),setActiveResultsTab("notes"),tabFlashcards.disabled=currentMode==="interview"||!flashcards.length,tabTest.disabled=currentMode==="interview"||!testQuestions.length,progressSection.classList.remove("visible"),showProgressSafeBanner(!1),setProgressRetryVisible(!1),resultsSection.classList.add("visible"),buildDownloadDropdown(),updateExportCsvButton(),m&&removeActiveRuntimeJob(m),updateProcessButton(),showToast("Processing complete!","success")}function showError(e,t,n){const o=currentJobId;setProgressRetryVisible(!1),renderBillingReceipt(null),progressStatus.classList.add("error"),setHidden(progressSpinner,!0),showProgressSafeBanner(!1);const s=buildBillingReceiptText(n);t?(announceProgressError(`Error: ${e} - Your credit has been refunded.`),showToast("Processing failed. Your credit has been refunded.","info",5e3),fetchUserData()):announceProgressError(`Error: ${e}`),s&&showToast(s,"info",5500),o&&removeActiveRuntimeJob(o),updateProcessButton()}function resetResultsState(){resultMarkdown="",slideText="",transcript="",flashcards=[],testQuestions=[],interviewSummaryText="",interviewSectionsText="",interviewCombinedText="",currentBillingReceipt=null,currentStudyPackId=null,resultsLocked=!1,updateQuickstartVisibility(),flashcardCountBadge.textContent="0",testCountBadge.textContent="0",setHidden(studyWarning,!0),renderBillingReceipt(null),setHidden(exportStudyCsvBtn,!0),showProgressSafeBanner(!1),setHidden(tabFlashcards,!1),setHidden(tabTest,!1),tabFlashcards.disabled=!1,tabTest.disabled=!1,setActiveResultsTab("notes")}function showPricingModal(){window.location.href="/buy_credits"}function hidePricingModal(){}function showHistoryModal(){window.location.href="/buy_credits"}function hideHistoryModal(){}function formatPrice(e,t){if(displayFormatUtils&&typeof displayFormatUtils.formatCurrencyFromCents=="function")return displayFormatUtils.formatCurrencyFromCents(e,t);const n=(Number(e||0)/100).toFixed(2);return String(t||"eur").toLowerCase()==="eur"?`\u20AC${n}`:`${n} ${String(t||"EUR").toUpperCase()}`}function formatCreditsText(e){return Object.entries(e).map(([t,n])=>`${n} ${t.replace(/_/g," ").replace("credits ","").replace("credits","").trim()}`).join(", ")}function setHistoryMessage(e,t=!1){for(;historyList.firstChild;)historyList.removeChild(historyList.firstChild);const n=document.createElement("div");if(n.className=t?"history-loading":"history-empty",t){const s=document.createElement("div");s.className="spinner",n.appendChild(s)}const o=document.createElement("span");o.textContent=e,n.appendChild(o),historyList.appendChild(n)}function setHistoryLoadingSkeleton(){for(;historyList.firstChild;)historyList.removeChild(historyList.firstChild);const e=document.createElement("div");e.className="history-skeleton-list";for(let t=0;t<3;t+=1){const n=document.createElement("div");n.className="history-skeleton-item";const o=document.createElement("div");o.className="history-skeleton-left";const s=document.createElement("div");s.className="history-skeleton-line title";const r=document.createElement("div");r.className="history-skeleton-line meta";const i=document.createElement("div");i.className="history-skeleton-line submeta",o.appendChild(s),o.appendChild(r),o.appendChild(i);const a=document.createElement("div");a.className="history-skeleton-price",n.appendChild(o),n.appendChild(a),e.appendChild(n)}historyList.appendChild(e)}function setHistoryEmptyState(){for(;historyList.firstChild;)historyList.removeChild(historyList.firstChild);const e=document.createElement("div");e.className="history-empty";const t=document.createElement("span");t.textContent="No purchases yet";const n=document.createElement("div");n.className="history-empty-note",n.textContent="You can keep using free credits or buy a bundle when you need more.";const o=document.createElement("button");o.type="button",o.className="history-empty-action",o.textContent="Buy credits",o.addEventListener("click",()=>{showPricingModal()}),e.appendChild(t),e.appendChild(n),e.appendChild(o),historyList.appendChild(e)}async function loadPurchaseHistory(){if(setHistoryLoadingSkeleton(),!!currentUser)try{const t=await(await authenticatedFetch("/api/purchase-history")).json();if(!t.purchases||!t.purchases.length){setHistoryEmptyState();return}for(;historyList.firstChild;)historyList.removeChild(historyList.firstChild);t.purchases.forEach(n=>{const o=document.createElement("div");o.className="history-item";const s=document.createElement("div");s.className="history-item-left";const r=document.createElement("div");r.className="history-item-name",r.textContent=n.bundle_name||"-";const i=document.createElement("div");i.className="history-item-date",i.textContent=displayFormatUtils&&typeof displayFormatUtils.formatDateTimeFromEpochSeconds=="function"?displayFormatUtils.formatDateTimeFromEpochSeconds(n.created_at):"-";const a=document.createElement("div");a.className="history-item-credits",a.textContent=formatCreditsText(n.credits||{}),s.appendChild(r),s.appendChild(i),s.appendChild(a);const c=document.createElement("div");c.className="history-item-price",c.textContent=formatPrice(n.price_cents||0,n.currency||"eur"),o.appendChild(s),o.appendChild(c),historyList.appendChild(o)})}catch(e){setHistoryMessage("Could not load purchase history. Please try again.")}}async function purchaseBundle(e){if(!currentUser){showAuthModal();return}const t=getCheckoutCooldownSeconds();if(t>0){applyCheckoutButtonsState(),showToast(`Checkout temporarily limited. Try again in ${formatRetryDelay(t)}.`,"info",4500);return}if(checkoutRequestInFlight)return;checkoutRequestInFlight=!0,document.querySelectorAll(".bundle-buy-btn").forEach(o=>{o.disabled=!0,o.dataset.bundleId===e&&(o.textContent="Redirecting...")});try{trackEvent("checkout_started",{bundle_id:e},{preferBeacon:!0});const o=await authenticatedFetch("/api/create-checkout-session",{method:"POST",headers:{"Content-Type":"application/json"},body:JSON.stringify({bundle_id:e})}),s=await o.json();if(s.error){if(o.status===429){const r=getRetryAfterSeconds(o,s),i=r?`${s.error} Try again in ${formatRetryDelay(r)}.`:s.error;showToast(i,"info",6e3),checkoutRequestInFlight=!1,r>0?startCheckoutCooldown(r):applyCheckoutButtonsState()}else showToast(s.error,"error"),checkoutRequestInFlight=!1,applyCheckoutButtonsState();return}if(s.checkout_url){window.location.href=s.checkout_url;return}showToast("Could not start checkout. Please try again.","error"),checkoutRequestInFlight=!1,applyCheckoutButtonsState()}catch(o){captureClientError(o,"purchase_bundle"),showToast("Something went wrong. Please try again.","error"),checkoutRequestInFlight=!1,applyCheckoutButtonsState()}}displayFormatUtils&&typeof displayFormatUtils.applyPricingCatalog=="function"&&displayFormatUtils.applyPricingCatalog(document);async function confirmCheckoutSession(e){if(!e)return{ok:!1,status:"missing_session"};if(!currentUser)return{ok:!1,status:"not_signed_in"};try{const t=await authenticatedFetch(`/api/confirm-checkout-session?session_id=${encodeURIComponent(e)}`),n=await t.json();return t.ok?{ok:!0,status:n.status||"granted"}:{ok:!1,status:n.error||"confirm_failed"}}catch(t){return captureClientError(t,"confirm_checkout_session"),{ok:!1,status:"confirm_failed"}}}async function checkPaymentResult(){const e=new URLSearchParams(window.location.search),t=e.get("payment"),n=e.get("session_id");if(t==="success"){let o=!1;n&&(o=(await confirmCheckoutSession(n)).ok),o?(showToast("Payment successful! Your credits have been added.","success",5e3),trackEvent("payment_confirmed",{session_id:n||""},{preferBeacon:!0})):showToast("Payment received. Credits may take a few seconds to appear.","info",5e3),window.history.replaceState({},"",window.location.pathname),setTimeout(()=>{currentUser&&fetchUserData()},1e3),setTimeout(()=>{currentUser&&fetchUserData()},4e3)}else t==="cancelled"&&(showToast("Payment cancelled. No charges were made.","info",4e3),trackEvent("payment_cancelled",{},{preferBeacon:!0}),window.history.replaceState({},"",window.location.pathname))}function maybeOpenAuthModalFromQuery(){const e=new URLSearchParams(window.location.search),t=String(e.get("auth")||"").trim().toLowerCase();if(!t)return;const n=["signin","signup","reset"].includes(t)?t:"signin";showAuthModal(n),e.delete("auth");const o=e.toString(),s=window.location.pathname+(o?`?${o}`:"")+window.location.hash;window.history.replaceState({},"",s)}headerSignInBtn&&headerSignInBtn.addEventListener("click",()=>showAuthModal("signin")),signInToProcessBtn.addEventListener("click",()=>showAuthModal("signin")),authModalClose.addEventListener("click",hideAuthModal),authOverlay.addEventListener("click",e=>{e.target===authOverlay&&hideAuthModal()}),switchToSignup.addEventListener("click",e=>{e.preventDefault(),showAuthView("signup")}),switchToSignin.addEventListener("click",e=>{e.preventDefault(),showAuthView("signin")}),forgotPasswordLink.addEventListener("click",e=>{e.preventDefault(),showAuthView("reset")}),backToSignin.addEventListener("click",e=>{e.preventDefault(),showAuthView("signin")}),signinForm.addEventListener("submit",async e=>{e.preventDefault(),await signInWithEmail(signinEmail.value.trim(),signinPassword.value)}),signupForm.addEventListener("submit",async e=>{if(e.preventDefault(),signupPassword.value!==signupPasswordConfirm.value){showAuthError(signupError,"Passwords do not match.");return}await signUpWithEmail(signupEmail.value.trim(),signupPassword.value)}),resetForm.addEventListener("submit",async e=>{e.preventDefault(),await sendPasswordReset(resetEmail.value.trim())}),googleSignInBtn.addEventListener("click",signInWithGoogle),googleSignUpBtn.addEventListener("click",signInWithGoogle),document.querySelectorAll(".password-toggle").forEach(e=>{e.addEventListener("click",()=>{const t=document.getElementById(e.dataset.target),n=e.querySelector(".eye-open"),o=e.querySelector(".eye-closed");t.type==="password"?(t.type="text",setHidden(n,!0),setHidden(o,!1)):(t.type="password",setHidden(n,!1),setHidden(o,!0))})}),headerNavToggle&&headerNavToggle.addEventListener("click",()=>{const e=!(headerSidebar&&headerSidebar.classList.contains("visible"));closeHeaderDropdowns(e?"sidebar":""),setHeaderSidebarVisible(e)}),headerSidebarClose&&headerSidebarClose.addEventListener("click",()=>setHeaderSidebarVisible(!1)),headerSidebarBackdrop&&headerSidebarBackdrop.addEventListener("click",()=>setHeaderSidebarVisible(!1)),signOutBtn&&signOutBtn.addEventListener("click",signOut),userButton&&userDropdown&&(userButton.addEventListener("click",e=>{e.stopPropagation();const t=!userDropdown.classList.contains("visible");closeHeaderDropdowns(t?"user":""),setUserDropdownVisible(t)}),userButton.addEventListener("keydown",e=>{if(e.key==="ArrowDown"&&(e.preventDefault(),closeHeaderDropdowns("user"),setUserDropdownVisible(!0),focusMenuItem(userDropdown,".user-dropdown-item","first")),e.key==="ArrowUp"&&(e.preventDefault(),closeHeaderDropdowns("user"),setUserDropdownVisible(!0),focusMenuItem(userDropdown,".user-dropdown-item","last")),e.key==="Enter"||e.key===" "){e.preventDefault();const t=!userDropdown.classList.contains("visible");closeHeaderDropdowns(t?"user":""),setUserDropdownVisible(t)}e.key==="Escape"&&(e.preventDefault(),setUserDropdownVisible(!1))}),userDropdown.addEventListener("keydown",e=>{e.key==="ArrowDown"&&(e.preventDefault(),focusMenuItem(userDropdown,".user-dropdown-item","next")),e.key==="ArrowUp"&&(e.preventDefault(),focusMenuItem(userDropdown,".user-dropdown-item","prev")),e.key==="Home"&&(e.preventDefault(),focusMenuItem(userDropdown,".user-dropdown-item","first")),e.key==="End"&&(e.preventDefault(),focusMenuItem(userDropdown,".user-dropdown-item","last")),e.key==="Escape"&&(e.preventDefault(),setUserDropdownVisible(!1),userButton.focus()),e.key==="Tab"&&setUserDropdownVisible(!1)})),document.addEventListener("click",e=>{userMenu&&!userMenu.contains(e.target)&&setUserDropdownVisible(!1)}),buyCreditsBtn&&buyCreditsBtn.addEventListener("click",()=>{setUserDropdownVisible(!1),showPricingModal()}),purchaseHistoryBtn&&purchaseHistoryBtn.addEventListener("click",()=>{setUserDropdownVisible(!1),showHistoryModal()}),exportDataBtn&&exportDataBtn.addEventListener("click",async()=>{setUserDropdownVisible(!1),await exportMyAccountData()}),deleteAccountBtn&&deleteAccountBtn.addEventListener("click",async()=>{setUserDropdownVisible(!1),await deleteMyAccountData()}),deleteAccountClose&&deleteAccountClose.addEventListener("click",closeDeleteAccountModal),deleteAccountCancelBtn&&deleteAccountCancelBtn.addEventListener("click",closeDeleteAccountModal),deleteAccountConfirmBtn&&deleteAccountConfirmBtn.addEventListener("click",submitDeleteAccountModal),deleteAccountOverlay&&deleteAccountOverlay.addEventListener("click",e=>{e.target===deleteAccountOverlay&&closeDeleteAccountModal()}),deleteAccountTextInput&&deleteAccountTextInput.addEventListener("keydown",e=>{e.key==="Enter"&&(e.preventDefault(),submitDeleteAccountModal())}),deleteAccountEmailInput&&deleteAccountEmailInput.addEventListener("keydown",e=>{e.key==="Enter"&&(e.preventDefault(),submitDeleteAccountModal())}),headerStudyLibraryBtn&&headerStudyLibraryBtn.addEventListener("click",()=>{setHeaderSidebarVisible(!1),trackEvent("study_mode_opened",{source:"header_study_library"},{preferBeacon:!0}),window.location.href="/study"}),headerFeaturesBtn&&headerFeaturesBtn.addEventListener("click",()=>{setHeaderSidebarVisible(!1),window.location.href="/features"}),headerToolsBtn&&headerToolsBtn.addEventListener("click",()=>{setHeaderSidebarVisible(!1),trackEvent("tools_page_opened",{source:"header_tools"},{preferBeacon:!0}),window.location.href="/tools"}),headerPlannerBtn&&headerPlannerBtn.addEventListener("click",()=>{if(window.matchMedia("(hover: none), (pointer: coarse)").matches&&headerPlannerGroup&&!headerPlannerGroup.classList.contains("open")){headerPlannerGroup.classList.add("open");return}setHeaderSidebarVisible(!1),window.location.href="/plan"}),headerPlannerGroup&&(headerPlannerGroup.addEventListener("mouseenter",()=>{headerPlannerGroup.classList.add("open")}),headerPlannerGroup.addEventListener("mouseleave",()=>{headerPlannerGroup.classList.remove("open")})),headerCalendarBtn&&headerCalendarBtn.addEventListener("click",()=>{setHeaderSidebarVisible(!1),window.location.href="/calendar"});function openGoalModal(){currentUser&&(goalModalError.classList.remove("visible"),goalModalError.textContent="",goalModalInput.value=String(getProgressSummaryForHeader(currentUser.uid).daily_goal),openOverlay(goalModalOverlay),setTimeout(()=>goalModalInput.focus(),30),setTimeout(()=>goalModalInput.select(),30))}function closeGoalModal(){closeOverlay(goalModalOverlay)}async function saveGoalFromModal(){if(!currentUser)return;const e=progressUtils&&typeof progressUtils.parseGoalValue=="function"?progressUtils.parseGoalValue(goalModalInput.value):parseInt(String(goalModalInput.value||"").trim(),10);if(!Number.isFinite(e)||e<1||e>500){goalModalError.textContent="Use a number between 1 and 500.",goalModalError.classList.add("visible");return}try{const t=await authenticatedFetch("/api/study-progress",{method:"PUT",headers:{"Content-Type":"application/json"},body:JSON.stringify({daily_goal:e,timezone:Intl.DateTimeFormat().resolvedOptions().timeZone||""})});if(!t.ok){const n=await t.json().catch(()=>({}));throw new Error(n.error||"Could not sync daily goal.")}progressUtils&&typeof progressUtils.writeDailyGoalCache=="function"?progressUtils.writeDailyGoalCache(currentUser.uid,e):localStorage.setItem(`daily_goal_${currentUser.uid}`,String(e)),progressSummaryCache=Object.assign({},progressSummaryCache||{},{daily_goal:e}),await fetchStudyProgressSummary(),closeGoalModal(),showToast("Daily goal updated.","success",1800)}catch(t){console.warn("Could not sync daily goal:",t),goalModalError.textContent=t&&t.message?t.message:"Could not sync daily goal.",goalModalError.classList.add("visible");return}}progressButton&&progressDropdown&&(progressButton.addEventListener("click",e=>{e.stopPropagation();const t=!progressDropdown.classList.contains("visible");closeHeaderDropdowns(t?"progress":""),setProgressDropdownVisible(t),t&&refreshStudyHeaderMetrics()}),progressButton.addEventListener("keydown",e=>{if(e.key==="ArrowDown"&&(e.preventDefault(),closeHeaderDropdowns("progress"),setProgressDropdownVisible(!0),refreshStudyHeaderMetrics(),focusMenuItem(progressDropdown,".progress-action-btn","first")),e.key==="ArrowUp"&&(e.preventDefault(),closeHeaderDropdowns("progress"),setProgressDropdownVisible(!0),refreshStudyHeaderMetrics(),focusMenuItem(progressDropdown,".progress-action-btn","last")),e.key==="Enter"||e.key===" "){e.preventDefault();const t=!progressDropdown.classList.contains("visible");closeHeaderDropdowns(t?"progress":""),setProgressDropdownVisible(t),t&&refreshStudyHeaderMetrics()}e.key==="Escape"&&(e.preventDefault(),setProgressDropdownVisible(!1))}),progressDropdown.addEventListener("keydown",e=>{e.key==="ArrowDown"&&(e.preventDefault(),focusMenuItem(progressDropdown,".progress-action-btn","next")),e.key==="ArrowUp"&&(e.preventDefault(),focusMenuItem(progressDropdown,".progress-action-btn","prev")),e.key==="Home"&&(e.preventDefault(),focusMenuItem(progressDropdown,".progress-action-btn","first")),e.key==="End"&&(e.preventDefault(),focusMenuItem(progressDropdown,".progress-action-btn","last")),e.key==="Escape"&&(e.preventDefault(),setProgressDropdownVisible(!1),progressButton.focus()),e.key==="Tab"&&setProgressDropdownVisible(!1)})),progressSetGoalBtn&&progressSetGoalBtn.addEventListener("click",e=>{e.stopPropagation(),setHeaderSidebarVisible(!1),setProgressDropdownVisible(!1),openGoalModal()}),progressOpenPlanBtn&&progressOpenPlanBtn.addEventListener("click",()=>{setHeaderSidebarVisible(!1),setProgressDropdownVisible(!1),window.location.href="/plan"}),progressOpenCalendarBtn&&progressOpenCalendarBtn.addEventListener("click",()=>{setHeaderSidebarVisible(!1),setProgressDropdownVisible(!1),window.location.href="/calendar"});let mobileCreditsTooltipTimer=null;creditsDisplay&&creditsDisplay.addEventListener("click",e=>{if(!window.matchMedia("(hover: none), (pointer: coarse)").matches){showPricingModal();return}if(!creditsDisplay.classList.contains("tooltip-open")){e.preventDefault(),creditsDisplay.classList.add("tooltip-open"),mobileCreditsTooltipTimer&&clearTimeout(mobileCreditsTooltipTimer),mobileCreditsTooltipTimer=setTimeout(()=>{creditsDisplay.classList.remove("tooltip-open")},2600);return}creditsDisplay.classList.remove("tooltip-open"),mobileCreditsTooltipTimer&&clearTimeout(mobileCreditsTooltipTimer),showPricingModal()}),document.addEventListener("click",e=>{creditsDisplay&&!creditsDisplay.contains(e.target)&&(creditsDisplay.classList.remove("tooltip-open"),mobileCreditsTooltipTimer&&clearTimeout(mobileCreditsTooltipTimer)),progressMenu&&!progressMenu.contains(e.target)&&setProgressDropdownVisible(!1)}),document.addEventListener("keydown",e=>{e.key==="Escape"&&setHeaderSidebarVisible(!1)}),goalModalCancelBtn.addEventListener("click",closeGoalModal),goalModalSaveBtn.addEventListener("click",saveGoalFromModal),goalModalInput.addEventListener("keydown",e=>{e.key==="Enter"&&(e.preventDefault(),saveGoalFromModal()),e.key==="Escape"&&(e.preventDefault(),closeGoalModal())}),goalModalOverlay.addEventListener("click",e=>{e.target===goalModalOverlay&&closeGoalModal()}),window.addEventListener("focus",()=>{currentUser?fetchStudyProgressSummary():refreshStudyHeaderMetrics()}),document.addEventListener("visibilitychange",()=>{document.hidden||(currentUser?fetchStudyProgressSummary():refreshStudyHeaderMetrics())}),adminDashboardBtn&&adminDashboardBtn.addEventListener("click",async()=>{if(setUserDropdownVisible(!1),!currentUser||!currentUserIsAdmin){showToast("Admin access is only available for configured admin accounts.","error",4200);return}try{if(!(await authenticatedFetch("/api/session/login",{method:"POST",headers:{"Content-Type":"application/json"},body:JSON.stringify({})})).ok)throw new Error("Could not start admin session.");window.location.href="/admin"}catch(e){captureClientError(e,"admin_session_login"),showToast("Could not open admin dashboard right now. Please retry.","error",4500)}}),buyCreditsLink.addEventListener("click",e=>{e.preventDefault(),showPricingModal()}),pricingModalClose.addEventListener("click",hidePricingModal),pricingOverlay.addEventListener("click",e=>{e.target===pricingOverlay&&void 0}),historyModalClose.addEventListener("click",hideHistoryModal),historyOverlay.addEventListener("click",e=>{e.target===historyOverlay&&void 0}),document.addEventListener("keydown",e=>{if(!activeModalOverlay)return;if(e.key==="Escape"){e.preventDefault(),activeModalOverlay===authOverlay?hideAuthModal():activeModalOverlay===pricingOverlay?void 0:activeModalOverlay===historyOverlay?void 0:activeModalOverlay===goalModalOverlay?closeGoalModal():activeModalOverlay===deleteAccountOverlay&&closeDeleteAccountModal();return}if(e.key!=="Tab")return;const t=getFocusableElements(activeModalOverlay);if(!t.length)return;const n=t[0],o=t[t.length-1],s=document.activeElement;e.shiftKey&&s===n?(e.preventDefault(),o.focus()):!e.shiftKey&&s===o&&(e.preventDefault(),n.focus())}),document.querySelectorAll(".bundle-buy-btn").forEach(e=>e.addEventListener("click",()=>purchaseBundle(e.dataset.bundleId))),downloadButton.addEventListener("click",e=>{e.stopPropagation();const t=!downloadDropdownContent.classList.contains("visible");closeHeaderDropdowns(t?"download":""),setDownloadDropdownVisible(t),t&&focusMenuItem(downloadDropdownContent,".dropdown-item","first")}),downloadButton.addEventListener("keydown",e=>{if(e.key==="ArrowDown"&&(e.preventDefault(),closeHeaderDropdowns("download"),setDownloadDropdownVisible(!0),focusMenuItem(downloadDropdownContent,".dropdown-item","first")),e.key==="ArrowUp"&&(e.preventDefault(),closeHeaderDropdowns("download"),setDownloadDropdownVisible(!0),focusMenuItem(downloadDropdownContent,".dropdown-item","last")),e.key==="Enter"||e.key===" "){e.preventDefault();const t=!downloadDropdownContent.classList.contains("visible");closeHeaderDropdowns(t?"download":""),setDownloadDropdownVisible(t),t&&focusMenuItem(downloadDropdownContent,".dropdown-item","first")}e.key==="Escape"&&(e.preventDefault(),setDownloadDropdownVisible(!1))}),downloadDropdownContent.addEventListener("keydown",e=>{e.key==="ArrowDown"&&(e.preventDefault(),focusMenuItem(downloadDropdownContent,".dropdown-item","next")),e.key==="ArrowUp"&&(e.preventDefault(),focusMenuItem(downloadDropdownContent,".dropdown-item","prev")),e.key==="Home"&&(e.preventDefault(),focusMenuItem(downloadDropdownContent,".dropdown-item","first")),e.key==="End"&&(e.preventDefault(),focusMenuItem(downloadDropdownContent,".dropdown-item","last")),e.key==="Escape"&&(e.preventDefault(),setDownloadDropdownVisible(!1),downloadButton.focus()),e.key==="Tab"&&setDownloadDropdownVisible(!1)}),moreActionsButton.addEventListener("click",e=>{e.stopPropagation();const t=!moreActionsContent.classList.contains("visible");closeHeaderDropdowns(t?"more-actions":""),setMoreActionsDropdownVisible(t),t&&focusMenuItem(moreActionsContent,".dropdown-item","first")}),moreActionsButton.addEventListener("keydown",e=>{if(e.key==="ArrowDown"&&(e.preventDefault(),closeHeaderDropdowns("more-actions"),setMoreActionsDropdownVisible(!0),focusMenuItem(moreActionsContent,".dropdown-item","first")),e.key==="ArrowUp"&&(e.preventDefault(),closeHeaderDropdowns("more-actions"),setMoreActionsDropdownVisible(!0),focusMenuItem(moreActionsContent,".dropdown-item","last")),e.key==="Enter"||e.key===" "){e.preventDefault();const t=!moreActionsContent.classList.contains("visible");closeHeaderDropdowns(t?"more-actions":""),setMoreActionsDropdownVisible(t),t&&focusMenuItem(moreActionsContent,".dropdown-item","first")}e.key==="Escape"&&(e.preventDefault(),setMoreActionsDropdownVisible(!1))}),moreActionsContent.addEventListener("keydown",e=>{e.key==="ArrowDown"&&(e.preventDefault(),focusMenuItem(moreActionsContent,".dropdown-item","next")),e.key==="ArrowUp"&&(e.preventDefault(),focusMenuItem(moreActionsContent,".dropdown-item","prev")),e.key==="Home"&&(e.preventDefault(),focusMenuItem(moreActionsContent,".dropdown-item","first")),e.key==="End"&&(e.preventDefault(),focusMenuItem(moreActionsContent,".dropdown-item","last")),e.key==="Escape"&&(e.preventDefault(),setMoreActionsDropdownVisible(!1),moreActionsButton.focus()),e.key==="Tab"&&setMoreActionsDropdownVisible(!1)}),document.addEventListener("click",e=>{downloadDropdown.contains(e.target)||setDownloadDropdownVisible(!1),moreActionsDropdown.contains(e.target)||setMoreActionsDropdownVisible(!1)}),copyButton.addEventListener("click",async()=>{setMoreActionsDropdownVisible(!1);try{await navigator.clipboard.writeText(resultMarkdown),copyButtonText.textContent="Copied!",showToast("Notes copied to clipboard","success"),setTimeout(()=>{copyButtonText.textContent="Copy notes"},1800)}catch(e){showToast("Failed to copy notes","error")}}),exportStudyCsvBtn.addEventListener("click",async()=>{if(setMoreActionsDropdownVisible(!1),!currentJobId)return;const e=exportCsvType==="test"?`practice-test-${currentJobId}.csv`:`flashcards-${currentJobId}.csv`;try{await downloadAuthenticatedFile(`/download-flashcards-csv/${currentJobId}?type=${encodeURIComponent(exportCsvType)}`,e),showToast("CSV download started.","success")}catch(t){showToast(t.message||"Could not export CSV.","error")}}),studyLibraryBtn.addEventListener("click",()=>{setMoreActionsDropdownVisible(!1),trackEvent("study_mode_opened",{source:"results_library"},{preferBeacon:!0}),window.location.href="/study"}),studyNowBtn.addEventListener("click",()=>{if(closeHeaderDropdowns(""),!currentStudyPackId){showToast("No saved study pack available yet for this result.","info");return}trackEvent("study_mode_opened",{source:"results_study_now",pack_id:currentStudyPackId},{preferBeacon:!0}),window.open(`/study?pack_id=${encodeURIComponent(currentStudyPackId)}&mode=learn`,"_blank")}),newLectureButton.addEventListener("click",()=>{setMoreActionsDropdownVisible(!1),(recordingState==="recording"||recordingState==="paused")&&(discardNextRecordingResult=!0,stopAudioRecording()),pdfFile=null,audioFile=null,audioFileOrigin="upload",recordedAudioNeedsDownload=!1,recorderStatusMessage="",recorderStatusTone="info",releaseImportedAudioToken({clearStatus:!0}),currentJobId=null,trackedTerminalJobId="",pdfInput.value="",audioInput.value="",setHidden(pdfInfo,!0),pdfZone.classList.remove("has-file"),syncAudioInfoUI(),progressSection.classList.remove("visible"),showProgressSafeBanner(!1),setProgressRetryVisible(!1),resultsSection.classList.remove("visible"),progressStatus.classList.remove("error"),setHidden(progressSpinner,!1),resetResultsState(),switchMode(currentMode),updateProcessButton(),window.scrollTo({top:0,behavior:"smooth"})}),quickstartApplyBtn&&quickstartApplyBtn.addEventListener("click",()=>{applyRecommendedSetup(),updateQuickstartVisibility()}),quickstartDismissBtn&&quickstartDismissBtn.addEventListener("click",()=>{if(currentUser&&currentUser.uid)try{localStorage.setItem(`quickstart_dismissed_${currentUser.uid}`,"1")}catch(e){}setQuickstartVisible(!1)}),progressRetryBtn.addEventListener("click",retryStatusCheckNow),studyToolsToggle.addEventListener("click",e=>{e.stopPropagation(),studyToolsPanel.classList.toggle("visible"),studyToolsToggle.classList.toggle("open",studyToolsPanel.classList.contains("visible"))}),studyToolChips.forEach(e=>{e.addEventListener("click",()=>{setStudyFeature(e.dataset.studyFeatures||"none")})}),flashcardAmountChips.forEach(e=>{e.addEventListener("click",()=>{e.disabled||setAmountSelection("flashcards",e.dataset.value)})}),questionAmountChips.forEach(e=>{e.addEventListener("click",()=>{e.disabled||setAmountSelection("questions",e.dataset.value)})}),interviewOptionButtons.forEach(e=>{e.addEventListener("click",()=>{if(e.disabled)return;const t=e.dataset.feature;if(t){if(selectedInterviewFeatures.includes(t))selectedInterviewFeatures=selectedInterviewFeatures.filter(n=>n!==t);else{const n=userCredits?Math.max(0,Number(userCredits.slides||0)):2;if(selectedInterviewFeatures.length>=n){showToast("Not enough text extraction credits for more interview extras.","info",2600),updateInterviewOptionsUI();return}selectedInterviewFeatures.push(t)}selectedInterviewFeatures=selectedInterviewFeatures.slice(0,2),updateInterviewOptionsUI()}})}),outputLanguageButton.addEventListener("click",e=>{e.stopPropagation();const t=!outputLanguageMenu.classList.contains("visible");closeHeaderDropdowns(t?"language":""),setOutputLanguageMenuVisible(t),t&&focusMenuItem(outputLanguageMenu,".app-select-item","active")}),outputLanguageButton.addEventListener("keydown",e=>{if(e.key==="ArrowDown"&&(e.preventDefault(),closeHeaderDropdowns("language"),setOutputLanguageMenuVisible(!0),focusMenuItem(outputLanguageMenu,".app-select-item","active")),e.key==="ArrowUp"&&(e.preventDefault(),closeHeaderDropdowns("language"),setOutputLanguageMenuVisible(!0),focusMenuItem(outputLanguageMenu,".app-select-item","last")),e.key==="Enter"||e.key===" "){e.preventDefault();const t=!outputLanguageMenu.classList.contains("visible");closeHeaderDropdowns(t?"language":""),setOutputLanguageMenuVisible(t),t&&focusMenuItem(outputLanguageMenu,".app-select-item","active")}e.key==="Escape"&&(e.preventDefault(),setOutputLanguageMenuVisible(!1))}),outputLanguageMenu.addEventListener("keydown",e=>{e.key==="ArrowDown"&&(e.preventDefault(),focusMenuItem(outputLanguageMenu,".app-select-item","next")),e.key==="ArrowUp"&&(e.preventDefault(),focusMenuItem(outputLanguageMenu,".app-select-item","prev")),e.key==="Home"&&(e.preventDefault(),focusMenuItem(outputLanguageMenu,".app-select-item","first")),e.key==="End"&&(e.preventDefault(),focusMenuItem(outputLanguageMenu,".app-select-item","last")),e.key==="Escape"&&(e.preventDefault(),setOutputLanguageMenuVisible(!1),outputLanguageButton.focus()),e.key==="Tab"&&setOutputLanguageMenuVisible(!1)}),outputLanguageItems.forEach(e=>{e.addEventListener("click",()=>{const t=e.dataset.value||"english";setOutputLanguage(t,e.textContent.trim()),setOutputLanguageMenuVisible(!1),t==="other"?(outputLanguageCustom.focus(),outputLanguageCustom.select()):(scheduleLanguagePreferenceSave(),outputLanguageButton.focus())})}),outputLanguageCustom.addEventListener("input",()=>{outputLanguageSelect.value==="other"&&(outputLanguageLabel.textContent=getLanguageLabel("other",outputLanguageCustom.value),scheduleLanguagePreferenceSave())}),outputLanguageCustom.addEventListener("blur",()=>{outputLanguageSelect.value==="other"&&(outputLanguageLabel.textContent=getLanguageLabel("other",outputLanguageCustom.value),scheduleLanguagePreferenceSave())}),audioUrlFetchBtn&&audioUrlFetchBtn.addEventListener("click",importAudioFromUrl),otherAudioToggle&&otherAudioToggle.addEventListener("click",()=>{otherAudioOpen=!otherAudioOpen,syncProcessingLayout()}),audioUrlAdvancedToggle&&audioUrlAdvancedToggle.addEventListener("click",()=>{setAudioUrlAdvancedOpen(!(audioUrlAdvanced&&audioUrlAdvanced.classList.contains("is-open")))}),audioUrlInput&&(audioUrlInput.addEventListener("input",()=>{syncAudioImportStatusForUrlChange()}),audioUrlInput.addEventListener("paste",()=>{window.setTimeout(()=>{importAudioFromUrl({url:getCurrentAudioImportUrl(),reason:"paste"})},0)}),audioUrlInput.addEventListener("keydown",e=>{e.key==="Enter"&&(e.preventDefault(),importAudioFromUrl({reason:"manual"}))})),languageOnboardingButtons.forEach(e=>{e.addEventListener("click",()=>{setOnboardingLanguageSelection(e.dataset.value||"english"),setOnboardingError(""),(e.dataset.value||"")==="other"&&languageOnboardingCustom.focus()})}),languageOnboardingCustom.addEventListener("input",()=>setOnboardingError("")),languageOnboardingCustom.addEventListener("keydown",e=>{e.key==="Enter"&&(e.preventDefault(),saveLanguageOnboardingPreference())}),languageOnboardingSaveBtn.addEventListener("click",saveLanguageOnboardingPreference),languageOnboardingOverlay.addEventListener("click",e=>{e.target===languageOnboardingOverlay&&languageOnboardingCustom.focus()}),document.addEventListener("click",e=>{!studyToolsPanel.contains(e.target)&&!studyToolsToggle.contains(e.target)&&(studyToolsPanel.classList.remove("visible"),studyToolsToggle.classList.remove("open")),outputLanguagePicker.contains(e.target)||setOutputLanguageMenuVisible(!1)}),window.addEventListener("keydown",e=>{resultsSection.classList.contains("visible")&&activeResultsTab==="flashcards"&&(e.key==="ArrowLeft"&&(e.preventDefault(),goFlashcard(-1)),e.key==="ArrowRight"&&(e.preventDefault(),goFlashcard(1)),e.code==="Space"&&(e.preventDefault(),flipFlashcard()))}),window.addEventListener("beforeunload",e=>{(audioFile&&audioFileOrigin==="recording"&&recordedAudioNeedsDownload||recordingState==="recording"||recordingState==="paused")&&(e.preventDefault(),e.returnValue="")});function updateHeaderNavActiveState(){const e=window.location.pathname.replace(/\/+$/,"")||"/";document.querySelectorAll(".header-nav-link").forEach(t=>{const n=(t.getAttribute("href")||"").replace(/\/+$/,"")||"/",o=e==="/dashboard"&&n==="/";t.classList.toggle("active",n===e||o)})}setAmountSelection("flashcards",selectedFlashcardAmount),setAmountSelection("questions",selectedQuestionAmount),setStudyFeature("both"),updateInterviewOptionsUI(),setOutputLanguage("english","\u{1F1EC}\u{1F1E7} English"),forcedMode&&modeTabs.forEach(e=>{e.disabled=!0,e.setAttribute("aria-disabled","true")}),switchMode(forcedMode||"lecture-notes"),maybeOpenAuthModalFromQuery(),resetResultsState(),updateHeaderNavActiveState();
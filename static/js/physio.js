@@ -1237,7 +1237,7 @@
       '<div class="physio-inline-note">Chunks in index: ' + escapeHtml(String(data.document_count || 0)) + '</div>'
     ];
     if (data.stale) {
-      parts.push('<div class="physio-inline-note">The index is older than one or more source files. Rebuild the knowledge base and deploy again.</div>');
+      parts.push('<div class="physio-inline-note">Source files were added, changed or removed since the index was built. Rebuild the knowledge base and deploy again.</div>');
     }
     if (data.error_count) {
       parts.push('<div class="physio-inline-note">Files without indexable text or with errors: ' + escapeHtml(String(data.error_count)) + '</div>');
@@ -1,3 +1,3 @@
 (function(){"use strict";var ot=window.LectureProcessorBootstrap||{},Oe=ot.getAuth?ot.getAuth():window.firebase?window.firebase.auth():null;if(!Oe)return;var te=window.LectureProcessorUx||{},Bt=window.PhysioConfig||{},l=String(Bt.page||"").trim();if(!l)return;var H=document.getElementById("physio-auth-banner"),Ue=document.getElementById("physio-status"),Te=document.getElementById("physio-toast"),lt=new URL(window.location.href),Pe=lt.searchParams.get("case_id")||"",Ot=lt.searchParams.get("session_id")||"",b=document.getElementById("physio-case-select"),T=document.getElementById("physio-body-region"),je=document.getElementById("physio-session-type"),A=document.getElementById("physio-session-date"),U=document.getElementById("physio-nprs-before"),q=document.getElementById("physio-nprs-after"),K=document.getElementById("physio-session-notes"),x=document.getElementById("physio-transcript"),ie=document.getElementById("physio-audio-input"),qe=document.getElementById("physio-audio-note"),W=document.getElementById("physio-record-start"),Y=document.getElementById("physio-record-stop"),R=document.getElementById("physio-transcribe-btn"),Ke=document.getElementById("physio-generate-btn"),We=document.getElementById("physio-save-btn"),Ye=document.getElementById("physio-export-docx-btn"),Je=document.getElementById("physio-export-pdf-btn"),B=document.getElementById("physio-output"),Fe=document.getElementById("physio-output-label"),dt=document.getElementById("physio-output-card"),Xe=document.getElementById("physio-alerts"),Qe=document.getElementById("physio-knowledge-question"),ne=document.getElementById("physio-context-text"),L=document.getElementById("physio-knowledge-ask-btn"),J=document.getElementById("physio-knowledge-meta"),X=document.getElementById("physio-knowledge-answer"),ut=document.getElementById("physio-knowledge-output-card"),re=document.getElementById("physio-citations"),N=document.getElementById("physio-source-list"),Re=document.getElementById("physio-case-list"),ct=document.getElementById("physio-case-new-btn"),Ne=document.getElementById("physio-case-meta"),ae=document.getElementById("physio-case-display-label"),se=document.getElementById("physio-case-patient-name"),oe=document.getElementById("physio-case-age"),le=document.getElementById("physio-case-sex"),de=document.getElementById("physio-case-referral-source"),ue=document.getElementById("physio-case-body-region"),ce=document.getElementById("physio-case-primary-complaint"),pe=document.getElementById("physio-case-tags"),fe=document.getElementById("physio-case-notes"),Ve=document.getElementById("physio-case-save-btn"),he=document.getElementById("physio-session-list"),ge=document.getElementById("physio-session-preview"),ve=document.getElementById("physio-progress-chart"),Me=document.getElementById("physio-session-panel-note"),Tt={algemeen:"General",nek:"Neck / C-spine",schouder:"Shoulder",elleboog_pols_hand:"Elbow / Wrist / Hand",thoracaal:"Thoracic / T-spine",lumbaal:"Lumbar / L-spine",heup:"Hip",knie:"Knee",enkel_voet:"Ankle / Foot",neurologisch:"Neurological",overig:"Other"},Pt={guidelines:"Guideline",forms:"Form",lectures:"Lecture",articles:"Article",books:"Book",cases:"Case",overig:"Source"},pt={hulpvraag:"Reason for visit",hoofdklacht:"Primary complaint",pijn_beschrijving:"Pain description",functionele_beperkingen:"Functional limitations",voorgeschiedenis:"Medical history",medicatie:"Medication",beloop:"Symptom course",verwachtingen_patient:"Patient expectations",overig_subjectief:"Other subjective findings",inspectie:"Inspection",palpatie:"Palpation",actief_bewegingsonderzoek:"Active range of motion",passief_bewegingsonderzoek:"Passive range of motion",spierkracht:"Muscle strength",speciale_testen:"Special tests",neurologisch_onderzoek:"Neurological exam",functionele_testen:"Functional tests",meetinstrumenten:"Outcome measures",overig_objectief:"Other objective findings",fysiotherapeutische_diagnose:"Physiotherapy diagnosis",betrokken_structuren:"Involved structures",fase_herstel:"Recovery phase",belemmerende_factoren:"Barriers",bevorderende_factoren:"Facilitators",prognose:"Prognosis",behandeldoelen:"Treatment goals",behandelplan:"Treatment plan",frequentie:"Frequency",thuisoefeningen:"Home exercises",adviezen:"Advice",evaluatie:"Evaluation",verwijzing:"Referral",naam_patient:"Patient name",leeftijd:"Age",geslacht:"Sex",datum:"Date",pathologie:"Pathology",volgens_patient:"Patient perspective",volgens_therapeut:"Therapist perspective",functies_stoornissen:"Functions and impairments",activiteiten:"Activities",participatie:"Participation",persoonlijke_factoren:"Personal factors",omgevingsfactoren:"Environmental factors",differentiaal_diagnostiek:"Differential diagnosis",cognitief:"Cognitive",emotioneel:"Emotional",sociaal:"Social",beschrijving:"Description",hypothese_1:"Hypothesis 1",hypothese_2:"Hypothesis 2",hypothese_3:"Hypothesis 3",pijn:"Pain",type:"Type",nprs_score:"NPRS score",locatie:"Location",provocatie:"Provocation",mobiliteit:"Mobility",arom:"AROM",prom:"PROM",spierfunctie:"Muscle function",kracht:"Strength",uithoudingsvermogen:"Endurance",snelheid:"Speed",coordinatie:"Coordination",lenigheid:"Flexibility",sensibiliteit_proprioceptie:"Sensation / proprioception",tonus:"Tone",stabiliteit:"Stability",passief:"Passive",actief:"Active",reiken:"Reach",grijpen:"Grip",schrijven:"Writing",dragen:"Carrying",tillen:"Lifting",haarkammen:"Combing hair",aankleden:"Dressing",wassen:"Washing",deur_open_maken:"Opening door",lopen:"Walking",overige_activiteiten:"Other activities",deelname_verkeer:"Transportation",deelname_werk:"Work",deelname_hobbys:"Hobbies",sport:"Sports",stap_1_onduidelijke_termen:"Step 1 \xB7 Unclear terms",stap_2_3_probleemdefinitie:"Step 2/3 \xB7 Problem definition",stap_4_gezondheidsprobleem:"Step 4 \xB7 Health problem",stap_5_diagnostisch_proces:"Step 5 \xB7 Diagnostic process",stap_6_therapeutisch_proces:"Step 6 \xB7 Therapeutic process",stap_7_effect_therapie:"Step 7 \xB7 Therapy effect",persoonsgegevens:"Personal details",patientencategorie:"Patient category",additioneel_onderzoek:"Additional exam",icf_classificatie:"ICF classification",horizontale_relaties:"Horizontal relationships",persoonlijke_factor_invloed:"Impact of personal factors",externe_factor_invloed:"Impact of external factors",medisch_biologische_processen:"Medical-biological processes",screening:"Screening",rode_vlaggen:"Red flags",gele_vlaggen:"Yellow flags",medische_diagnose_type:"Medical diagnosis / type",indicatie_fysiotherapie:"Physiotherapy indication",voorgesteld_onderzoek:"Proposed assessment",anamnese_vragen:"History-taking questions",functieonderzoek:"Functional exam",fysiotherapeutische_conclusie:"Physiotherapy conclusion",hoofddoel:"Primary goal",subdoelen:"Subgoals",evaluatieve_meetinstrumenten:"Evaluation measures",behandelmethoden:"Treatment methods",informeren_adviseren:"Educate and advise",interventies:"Interventions",hulpmiddelen:"Aids",multidisciplinair:"Multidisciplinary",verwacht_effect_informeren:"Expected effect of education",verwacht_effect_interventies:"Expected effect of interventions",externe_factoren:"External factors",onderbouwing:"Rationale",hypothesen:"Hypotheses",vlag:"Flag",actie:"Recommended action",ernst:"Severity"},r={user:null,accessGranted:!1,cases:[],sessionsByCase:{},selectedCaseId:"",selectedSessionId:"",selectedAudioFile:null,recorder:null,recorderChunks:[],currentOutput:{},currentEditorData:{},loading:!1,lastOutputLabel:"",hasKnowledgeResult:!1},$e=null,De=null,jt=L?String(L.textContent||"").trim():"Ask Knowledge Base";function me(){var e=new Date,t=e.getFullYear(),i=String(e.getMonth()+1).padStart(2,"0"),n=String(e.getDate()).padStart(2,"0");return t+"-"+i+"-"+n}function u(e,t){Ue&&(Ue.textContent=String(e||""),Ue.className="physio-status"+(t?" "+t:""))}function Ze(e,t){if(H){if(!e){H.hidden=!0,H.textContent="",H.className="physio-auth-banner";return}H.hidden=!1,H.textContent=String(e),H.className="physio-auth-banner"+(t?" "+t:"")}}function ze(e){!Te||!e||(Te.textContent=String(e),Te.classList.add("visible"),$e&&window.clearTimeout($e),$e=window.setTimeout(function(){Te.classList.remove("visible")},2200))}function w(e){[Ke,We,Ye,Je,L,Ve].forEach(function(t){t&&(t.disabled=!!e)}),R&&(R.disabled=!!e||!r.selectedAudioFile)}function O(e,t){return Oe.currentUser?Oe.currentUser.getIdToken().then(function(i){var n=t||{},a=Object.assign({},n.headers||{},{Authorization:"Bearer "+i});return fetch(e,Object.assign({},n,{headers:a}))}):Promise.reject(new Error("Please sign in"))}function C(e){return JSON.parse(JSON.stringify(e==null?null:e))}function f(e){return String(e||"").replace(/&/g,"&amp;").replace(/</g,"&lt;").replace(/>/g,"&gt;").replace(/"/g,"&quot;").replace(/'/g,"&#39;")}function Ft(e){var t=String(e||"").split(`
-`),i=[],n=!1;return t.forEach(function(a){var s=a.trim();if(!s){n&&(i.push("</ul>"),n=!1);return}if(s.indexOf("### ")===0){n&&(i.push("</ul>"),n=!1),i.push("<h3>"+f(s.slice(4))+"</h3>");return}if(s.indexOf("## ")===0){n&&(i.push("</ul>"),n=!1),i.push("<h2>"+f(s.slice(3))+"</h2>");return}if(s.indexOf("# ")===0){n&&(i.push("</ul>"),n=!1),i.push("<h1>"+f(s.slice(2))+"</h1>");return}if(s.indexOf("- ")===0){n||(i.push("<ul>"),n=!0),i.push("<li>"+f(s.slice(2))+"</li>");return}n&&(i.push("</ul>"),n=!1),i.push("<p>"+f(s)+"</p>")}),n&&i.push("</ul>"),i.join("")}function _(e){var t=String(e||"").trim();return pt[t]?pt[t]:t.replace(/^stap_(\d+)_/,"Step $1 ").replace(/_/g," ").replace(/\b\w/g,function(i){return i.toUpperCase()})}function et(e){var t=String(e||"").trim().toLowerCase();return Tt[t]||_(t)}function Rt(e){var t=String(e||"").trim().toLowerCase();return Pt[t]||_(t||"bron")}function tt(e,t){for(var i=e,n=0;n<t.length;n+=1){if(!i||typeof i!="object")return;i=i[t[n]]}return i}function it(e,t,i){if(!(!e||!Array.isArray(t)||!t.length)){for(var n=e,a=0;a<t.length-1;a+=1){var s=t[a];n[s]===void 0&&(n[s]=typeof t[a+1]=="number"?[]:{}),n=n[s]}n[t[t.length-1]]=i}}function ft(e,t,i){var n=tt(e,t);Array.isArray(n)&&n.splice(i,1)}function ht(e,t){var i=tt(e,t);return Array.isArray(i)?i:(it(e,t,[]),tt(e,t))}function gt(e,t){if(typeof e=="number"){if(String(t||"").trim()==="")return null;var i=Number(t);return Number.isFinite(i)?i:e}return typeof e=="boolean"?String(t||"").trim().toLowerCase()==="true":String(t||"")}function o(e,t,i){var n=document.createElement(e);return t&&(n.className=t),i!=null&&(n.textContent=String(i)),n}function vt(e){if(e){var t=Math.max(4,parseInt(e.getAttribute("rows")||e.rows||4,10)||4);e.rows=t;var i=window.getComputedStyle?window.getComputedStyle(e):null,n=i?parseFloat(i.lineHeight||0):0,a=i?parseFloat(i.paddingTop||0):0,s=i?parseFloat(i.paddingBottom||0):0,c=Number.isFinite(n)&&n>0?n:22,p=Math.max(0,e.scrollHeight-a-s),d=Math.max(t,Math.ceil(p/c));e.rows=d}}function nt(e,t,i,n){var a=n||{},s=o("label","physio-field editor-field"+(a.full?" full":"")),c=o("span","",e),p=!!a.multiline,d=document.createElement(p?"textarea":"input");return p?(d.rows=a.rows||4,d.value=i==null?"":String(i),vt(d),d.addEventListener("input",function(){it(r.currentEditorData,t,gt(i,d.value)),vt(d)})):(d.type=a.type||"text",d.value=i==null?"":String(i),d.addEventListener("input",function(){it(r.currentEditorData,t,gt(i,d.value))})),a.placeholder&&(d.placeholder=a.placeholder),s.appendChild(c),s.appendChild(d),s}function E(e,t){var i=o("section","physio-section-card");return i.appendChild(o("h3","",e)),t&&i.appendChild(o("p","",t)),i}function S(e){var t=o("div","physio-subsection-card");return t.appendChild(o("h4","",e)),t}function g(){return o("div","physio-section-grid")}function Ge(){return o("div","physio-subsection-grid")}function v(e,t,i,n){(n||[]).forEach(function(a){var s=a.key,c=t?t[s]:null;e.appendChild(nt(a.label||_(s),i.concat([s]),c,{multiline:!!a.multiline,full:!!a.full,rows:a.rows||4}))})}function P(e,t,i,n){var a=n||{},s=E(e,a.description||""),c=o("div","physio-inline-actions"),p=o("button","physio-mini-btn primary",a.addLabel||"Add item");p.type="button",p.addEventListener("click",function(){var h=ht(r.currentEditorData,t);h.push(""),_e()}),c.appendChild(p),s.appendChild(c);var d=o("div","physio-array-list");return i.length?i.forEach(function(h,m){var k=o("div","physio-array-item"),y=o("div","physio-array-item-head");y.appendChild(o("strong","",(a.itemLabel||"Item")+" "+(m+1)));var I=o("button","physio-mini-btn danger","Remove");I.type="button",I.addEventListener("click",function(){ft(r.currentEditorData,t,m),_e()}),y.appendChild(I),k.appendChild(y),k.appendChild(nt(a.itemFieldLabel||_(e),t.concat([m]),h,{multiline:a.multiline!==!1,full:!0,rows:a.rows||3})),d.appendChild(k)}):d.appendChild(o("div","physio-output-empty compact",a.emptyMessage||"No items added yet.")),s.appendChild(d),s}function mt(e,t,i,n,a){var s=a||{},c=E(e,s.description||""),p=o("div","physio-inline-actions"),d=o("button","physio-mini-btn primary",s.addLabel||"Add");d.type="button",d.addEventListener("click",function(){var m=ht(r.currentEditorData,t);m.push(typeof s.createItem=="function"?s.createItem():{}),_e()}),p.appendChild(d),c.appendChild(p);var h=o("div","physio-array-list");return i.length?i.forEach(function(m,k){var y=o("div","physio-array-item"),I=o("div","physio-array-item-head");I.appendChild(o("strong","",(s.itemLabel||"Item")+" "+(k+1)));var F=o("button","physio-mini-btn danger","Remove");F.type="button",F.addEventListener("click",function(){ft(r.currentEditorData,t,k),_e()}),I.appendChild(F),y.appendChild(I);var M=g();v(M,m||{},t.concat([k]),n),y.appendChild(M),h.appendChild(y)}):h.appendChild(o("div","physio-output-empty compact",s.emptyMessage||"No items yet.")),c.appendChild(h),c}function yt(e){B&&B.classList.toggle("is-empty",!!e),dt&&dt.classList.toggle("is-empty",!!e)}function _t(e){X&&X.classList.toggle("is-empty",!!e),N&&N.classList.toggle("is-empty",!!e),ut&&ut.classList.toggle("is-empty",!!e)}function ye(e){r.currentEditorData={},r.lastOutputLabel="",Fe&&(Fe.textContent="Nothing generated yet."),B&&(B.innerHTML="",B.appendChild(o("div","physio-output-empty",e||"No output available yet.")),yt(!0))}function j(e){if(Xe){Xe.innerHTML="";var t=Array.isArray(e)?e:[];t.forEach(function(i,n){var a=o("div","physio-alert");a.appendChild(o("strong","",String(i&&i.vlag||"Red flag "+(n+1)))),i&&i.ernst&&a.appendChild(o("div","","Severity: "+String(i.ernst))),i&&i.actie&&a.appendChild(o("div","",String(i.actie))),Xe.appendChild(a)})}}function Nt(){var e=(r.currentEditorData||{}).soap||{},t=o("div","physio-structured-stack");[{title:"S \xB7 Subjectief",key:"subjective",description:"The patient's reason for visit, symptoms, and history.",fields:[{key:"hulpvraag"},{key:"hoofdklacht"},{key:"medicatie"},{key:"verwachtingen_patient"},{key:"pijn_beschrijving",multiline:!0,full:!0},{key:"functionele_beperkingen",multiline:!0,full:!0},{key:"voorgeschiedenis",multiline:!0,full:!0},{key:"beloop",multiline:!0,full:!0},{key:"overig_subjectief",multiline:!0,full:!0}]},{title:"O \xB7 Objectief",key:"objective",description:"Exam findings and relevant measurements.",fields:[{key:"spierkracht"},{key:"meetinstrumenten"},{key:"inspectie",multiline:!0,full:!0},{key:"palpatie",multiline:!0,full:!0},{key:"actief_bewegingsonderzoek",multiline:!0,full:!0},{key:"passief_bewegingsonderzoek",multiline:!0,full:!0},{key:"speciale_testen",multiline:!0,full:!0},{key:"neurologisch_onderzoek",multiline:!0,full:!0},{key:"functionele_testen",multiline:!0,full:!0},{key:"overig_objectief",multiline:!0,full:!0}]},{title:"A \xB7 Analyse",key:"assessment",description:"Physiotherapy interpretation and prognosis.",fields:[{key:"fysiotherapeutische_diagnose",full:!0,multiline:!0},{key:"betrokken_structuren",full:!0,multiline:!0},{key:"fase_herstel"},{key:"prognose"},{key:"belemmerende_factoren",full:!0,multiline:!0},{key:"bevorderende_factoren",full:!0,multiline:!0}]},{title:"P \xB7 Plan",key:"plan",description:"Goals, treatment approach, and follow-up.",fields:[{key:"frequentie"},{key:"evaluatie"},{key:"behandeldoelen",full:!0,multiline:!0},{key:"behandelplan",full:!0,multiline:!0},{key:"thuisoefeningen",full:!0,multiline:!0},{key:"adviezen",full:!0,multiline:!0},{key:"verwijzing",full:!0,multiline:!0}]}].forEach(function(i){var n=E(i.title,i.description),a=g();v(a,e[i.key]||{},["soap",i.key],i.fields),n.appendChild(a),t.appendChild(n)}),B.appendChild(t)}function Mt(){var e=(r.currentEditorData||{}).rps||{},t=o("div","physio-structured-stack"),i=E("Header","Core patient and session details."),n=g();v(n,e.header||{},["rps","header"],[{key:"naam_patient"},{key:"leeftijd"},{key:"geslacht"},{key:"datum"},{key:"pathologie"},{key:"medicatie"}]),i.appendChild(n),t.appendChild(i);var a=E("Patient perspective","What the patient experiences in functions, activities, and participation."),s=g();v(s,e.volgens_patient||{},["rps","volgens_patient"],[{key:"functies_stoornissen",multiline:!0,full:!0},{key:"activiteiten",multiline:!0,full:!0},{key:"participatie",multiline:!0,full:!0}]),a.appendChild(s),t.appendChild(a);var c=E("Therapist perspective","Observations and findings from the physiotherapy exam."),p=Ge(),d=(e.volgens_therapeut||{}).functies_stoornissen||{},h=S("Functions and impairments"),m=Ge(),k=S("Pain"),y=g();v(y,d.pijn||{},["rps","volgens_therapeut","functies_stoornissen","pijn"],[{key:"type"},{key:"nprs_score"},{key:"locatie"},{key:"provocatie"}]),k.appendChild(y),m.appendChild(k);var I=S("Mobility"),F=g();v(F,d.mobiliteit||{},["rps","volgens_therapeut","functies_stoornissen","mobiliteit"],[{key:"arom"},{key:"prom"}]),I.appendChild(F),m.appendChild(I);var M=S("Muscle function"),D=g();v(D,d.spierfunctie||{},["rps","volgens_therapeut","functies_stoornissen","spierfunctie"],[{key:"kracht"},{key:"uithoudingsvermogen"},{key:"snelheid"},{key:"coordinatie"},{key:"lenigheid"}]),M.appendChild(D),m.appendChild(M);var Se=S("Stability"),z=g();v(z,d.stabiliteit||{},["rps","volgens_therapeut","functies_stoornissen","stabiliteit"],[{key:"passief"},{key:"actief"}]),Se.appendChild(z),m.appendChild(Se);var Ee=S("Other functions"),$=g();v($,d,["rps","volgens_therapeut","functies_stoornissen"],[{key:"sensibiliteit_proprioceptie",multiline:!0,full:!0},{key:"tonus",multiline:!0,full:!0}]),Ee.appendChild($),m.appendChild(Ee),h.appendChild(m),p.appendChild(h);var we=S("Activities"),Z=g();v(Z,(e.volgens_therapeut||{}).activiteiten||{},["rps","volgens_therapeut","activiteiten"],[{key:"reiken"},{key:"grijpen"},{key:"schrijven"},{key:"dragen"},{key:"tillen"},{key:"haarkammen"},{key:"aankleden"},{key:"wassen"},{key:"deur_open_maken"},{key:"lopen"},{key:"overige_activiteiten",full:!0,multiline:!0}]),we.appendChild(Z),p.appendChild(we);var Ie=S("Participation"),Le=g();v(Le,(e.volgens_therapeut||{}).participatie||{},["rps","volgens_therapeut","participatie"],[{key:"deelname_verkeer"},{key:"deelname_werk"},{key:"deelname_hobbys"},{key:"sport"}]),Ie.appendChild(Le),p.appendChild(Ie),c.appendChild(p),t.appendChild(c);var Ae=E("Personal and environmental factors","Factors that influence recovery and tolerance."),G=Ge(),xe=S("Personal factors"),Be=g();v(Be,e.persoonlijke_factoren||{},["rps","persoonlijke_factoren"],[{key:"cognitief",multiline:!0,full:!0},{key:"emotioneel",multiline:!0,full:!0},{key:"sociaal",multiline:!0,full:!0}]),xe.appendChild(Be),G.appendChild(xe);var ee=S("Environmental factors"),Lt=g();v(Lt,e.omgevingsfactoren||{},["rps","omgevingsfactoren"],[{key:"beschrijving",multiline:!0,full:!0}]),ee.appendChild(Lt),G.appendChild(ee),Ae.appendChild(G),t.appendChild(Ae);var At=E("Differential diagnosis","Working hypotheses and the central care question."),xt=g();v(xt,e.differentiaal_diagnostiek||{},["rps","differentiaal_diagnostiek"],[{key:"hypothese_1",full:!0,multiline:!0},{key:"hypothese_2",full:!0,multiline:!0},{key:"hypothese_3",full:!0,multiline:!0},{key:"hulpvraag",full:!0,multiline:!0}]),At.appendChild(xt),t.appendChild(At),B.appendChild(t)}function Dt(){var e=(r.currentEditorData||{}).reasoning||{},t=(r.currentEditorData||{}).differential_diagnosis||{},i=Array.isArray((r.currentEditorData||{}).red_flags)?r.currentEditorData.red_flags:[],n=o("div","physio-structured-stack");n.appendChild(P(_("stap_1_onduidelijke_termen"),["reasoning","stap_1_onduidelijke_termen"],Array.isArray(e.stap_1_onduidelijke_termen)?e.stap_1_onduidelijke_termen:[],{description:"Loose terms or concepts that need clarification first.",addLabel:"Add term",itemLabel:"Term",itemFieldLabel:"Unclear term",multiline:!1,emptyMessage:"No unclear terms added yet."}));var a=E(_("stap_2_3_probleemdefinitie"),"Personal details, referral context, and ICF framing of the problem."),s=g();v(s,e.stap_2_3_probleemdefinitie||{},["reasoning","stap_2_3_probleemdefinitie"],[{key:"persoonsgegevens",full:!0,multiline:!0},{key:"verwijzing",full:!0,multiline:!0},{key:"patientencategorie",full:!0,multiline:!0},{key:"additioneel_onderzoek",full:!0,multiline:!0}]),a.appendChild(s);var c=Ge(),p=(e.stap_2_3_probleemdefinitie||{}).icf_classificatie||{};[{key:"volgens_patient",fields:["functies_stoornissen","activiteiten","participatie"]},{key:"volgens_therapeut",fields:["functies_stoornissen","activiteiten","participatie"]}].forEach(function(G){var xe=S(_(G.key)),Be=g();G.fields.forEach(function(ee){Be.appendChild(nt(_(ee),["reasoning","stap_2_3_probleemdefinitie","icf_classificatie",G.key,ee],(p[G.key]||{})[ee],{multiline:!0,full:!0}))}),xe.appendChild(Be),c.appendChild(xe)});var d=S("Factors"),h=g();v(h,p,["reasoning","stap_2_3_probleemdefinitie","icf_classificatie"],[{key:"persoonlijke_factoren",full:!0,multiline:!0},{key:"externe_factoren",full:!0,multiline:!0}]),d.appendChild(h),c.appendChild(d),a.appendChild(c),n.appendChild(a);var m=E(_("stap_4_gezondheidsprobleem"),"Hypotheses about relationships, influencing factors, and medical-biological processes."),k=g();v(k,e.stap_4_gezondheidsprobleem||{},["reasoning","stap_4_gezondheidsprobleem"],[{key:"persoonlijke_factor_invloed",full:!0,multiline:!0},{key:"externe_factor_invloed",full:!0,multiline:!0},{key:"medisch_biologische_processen",full:!0,multiline:!0}]),m.appendChild(k),m.appendChild(P(_("horizontale_relaties"),["reasoning","stap_4_gezondheidsprobleem","horizontale_relaties"],Array.isArray((e.stap_4_gezondheidsprobleem||{}).horizontale_relaties)?e.stap_4_gezondheidsprobleem.horizontale_relaties:[],{addLabel:"Add relationship",itemLabel:"Relationship",itemFieldLabel:"Relationship",emptyMessage:"No horizontal relationships added yet."})),n.appendChild(m);var y=E(_("stap_5_diagnostisch_proces"),"Screening, diagnostic reasoning, and the proposed assessment."),I=S("Screening"),F=g();v(F,(e.stap_5_diagnostisch_proces||{}).screening||{},["reasoning","stap_5_diagnostisch_proces","screening"],[{key:"rode_vlaggen",full:!0,multiline:!0},{key:"gele_vlaggen",full:!0,multiline:!0}]),I.appendChild(F),y.appendChild(I);var M=g();v(M,e.stap_5_diagnostisch_proces||{},["reasoning","stap_5_diagnostisch_proces"],[{key:"medische_diagnose_type",full:!0,multiline:!0},{key:"indicatie_fysiotherapie",full:!0,multiline:!0},{key:"fysiotherapeutische_conclusie",full:!0,multiline:!0}]),y.appendChild(M);var D=S("Proposed assessment"),Se=g();v(Se,(e.stap_5_diagnostisch_proces||{}).voorgesteld_onderzoek||{},["reasoning","stap_5_diagnostisch_proces","voorgesteld_onderzoek"],[{key:"inspectie",full:!0,multiline:!0},{key:"palpatie",full:!0,multiline:!0},{key:"functieonderzoek",full:!0,multiline:!0}]),D.appendChild(Se),D.appendChild(P(_("anamnese_vragen"),["reasoning","stap_5_diagnostisch_proces","voorgesteld_onderzoek","anamnese_vragen"],Array.isArray(((e.stap_5_diagnostisch_proces||{}).voorgesteld_onderzoek||{}).anamnese_vragen)?e.stap_5_diagnostisch_proces.voorgesteld_onderzoek.anamnese_vragen:[],{addLabel:"Add question",itemLabel:"Question",itemFieldLabel:"History-taking question",emptyMessage:"No history-taking questions added yet."})),D.appendChild(P(_("speciale_testen"),["reasoning","stap_5_diagnostisch_proces","voorgesteld_onderzoek","speciale_testen"],Array.isArray(((e.stap_5_diagnostisch_proces||{}).voorgesteld_onderzoek||{}).speciale_testen)?e.stap_5_diagnostisch_proces.voorgesteld_onderzoek.speciale_testen:[],{addLabel:"Add test",itemLabel:"Test",itemFieldLabel:"Special test",emptyMessage:"No special tests added yet."})),D.appendChild(P(_("meetinstrumenten"),["reasoning","stap_5_diagnostisch_proces","voorgesteld_onderzoek","meetinstrumenten"],Array.isArray(((e.stap_5_diagnostisch_proces||{}).voorgesteld_onderzoek||{}).meetinstrumenten)?e.stap_5_diagnostisch_proces.voorgesteld_onderzoek.meetinstrumenten:[],{addLabel:"Add measure",itemLabel:"Measure",itemFieldLabel:"Outcome measure",emptyMessage:"No outcome measures added yet."})),y.appendChild(D),n.appendChild(y);var z=E(_("stap_6_therapeutisch_proces"),"Goals, measurement points, and treatment choices."),Ee=g();v(Ee,e.stap_6_therapeutisch_proces||{},["reasoning","stap_6_therapeutisch_proces"],[{key:"hoofddoel",full:!0,multiline:!0},{key:"hulpmiddelen",full:!0,multiline:!0},{key:"multidisciplinair",full:!0,multiline:!0}]),z.appendChild(Ee),z.appendChild(P(_("subdoelen"),["reasoning","stap_6_therapeutisch_proces","subdoelen"],Array.isArray((e.stap_6_therapeutisch_proces||{}).subdoelen)?e.stap_6_therapeutisch_proces.subdoelen:[],{addLabel:"Add subgoal",itemLabel:"Subgoal",itemFieldLabel:"Subgoal",emptyMessage:"No subgoals added yet."})),z.appendChild(P(_("evaluatieve_meetinstrumenten"),["reasoning","stap_6_therapeutisch_proces","evaluatieve_meetinstrumenten"],Array.isArray((e.stap_6_therapeutisch_proces||{}).evaluatieve_meetinstrumenten)?e.stap_6_therapeutisch_proces.evaluatieve_meetinstrumenten:[],{addLabel:"Add measure",itemLabel:"Measure",itemFieldLabel:"Evaluation measure",emptyMessage:"No evaluation measures added yet."}));var $=S("Treatment methods"),we=g();v(we,(e.stap_6_therapeutisch_proces||{}).behandelmethoden||{},["reasoning","stap_6_therapeutisch_proces","behandelmethoden"],[{key:"informeren_adviseren",full:!0,multiline:!0}]),$.appendChild(we),$.appendChild(P(_("interventies"),["reasoning","stap_6_therapeutisch_proces","behandelmethoden","interventies"],Array.isArray(((e.stap_6_therapeutisch_proces||{}).behandelmethoden||{}).interventies)?e.stap_6_therapeutisch_proces.behandelmethoden.interventies:[],{addLabel:"Add intervention",itemLabel:"Intervention",itemFieldLabel:"Intervention",emptyMessage:"No interventions added yet."})),z.appendChild($),n.appendChild(z);var Z=E(_("stap_7_effect_therapie"),"Expectations about the effect of education and interventions."),Ie=g();v(Ie,e.stap_7_effect_therapie||{},["reasoning","stap_7_effect_therapie"],[{key:"verwacht_effect_informeren",full:!0,multiline:!0}]),Z.appendChild(Ie),Z.appendChild(P(_("verwacht_effect_interventies"),["reasoning","stap_7_effect_therapie","verwacht_effect_interventies"],Array.isArray((e.stap_7_effect_therapie||{}).verwacht_effect_interventies)?e.stap_7_effect_therapie.verwacht_effect_interventies:[],{addLabel:"Add effect",itemLabel:"Effect",itemFieldLabel:"Expected effect",emptyMessage:"No expected effects added yet."})),n.appendChild(Z),n.appendChild(mt("Differential diagnosis",["differential_diagnosis","hypothesen"],Array.isArray(t.hypothesen)?t.hypothesen:[],[{key:"titel"},{key:"onderbouwing",multiline:!0,full:!0}],{addLabel:"Add hypothesis",itemLabel:"Hypothesis",createItem:function(){return{titel:"",onderbouwing:""}},emptyMessage:"No hypotheses added yet."}));var Le=E("Central care question","Which care question is central within the differential diagnosis?"),Ae=g();v(Ae,t,["differential_diagnosis"],[{key:"hulpvraag",full:!0,multiline:!0}]),Le.appendChild(Ae),n.appendChild(Le),n.appendChild(mt("Red flags",["red_flags"],i,[{key:"vlag"},{key:"ernst"},{key:"actie",full:!0,multiline:!0}],{addLabel:"Add red flag",itemLabel:"Flag",createItem:function(){return{vlag:"",ernst:"",actie:""}},emptyMessage:"No standalone red flags added yet."})),B.appendChild(n)}function _e(){if(B){if(B.innerHTML="",yt(!1),Fe&&(Fe.textContent=r.lastOutputLabel||"Editable output"),l==="soap"){Nt();return}if(l==="rps"){Mt();return}Dt()}}function Q(e,t){r.currentEditorData=C(e||{}),r.lastOutputLabel=String(t||"Editable output"),_e()}function zt(e){if(!e||typeof e!="object"){ye("Generate new output or load a saved session."),j([]),r.currentOutput={};return}if(l==="soap"&&e.soap){r.currentOutput={soap:C(e.soap),rps:C(e.rps||{}),reasoning:C(e.reasoning||{}),differential_diagnosis:C(e.differential_diagnosis||{}),red_flags:C(e.red_flags||[])},j(e.red_flags||[]),Q({soap:e.soap},"SOAP-notitie");return}if(l==="rps"&&e.rps){r.currentOutput={soap:C(e.soap||{}),rps:C(e.rps),reasoning:C(e.reasoning||{}),differential_diagnosis:C(e.differential_diagnosis||{}),red_flags:C(e.red_flags||[])},j(e.red_flags||[]),Q({rps:e.rps},"RPS form");return}if(l==="reasoning"&&(e.reasoning||e.differential_diagnosis)){r.currentOutput={soap:C(e.soap||{}),rps:C(e.rps||{}),reasoning:C(e.reasoning||{}),differential_diagnosis:C(e.differential_diagnosis||{}),red_flags:C(e.red_flags||[])},j(e.red_flags||[]),Q({reasoning:e.reasoning||{},differential_diagnosis:e.differential_diagnosis||{},red_flags:e.red_flags||[]},"Clinical reasoning");return}ye("No saved output is available for this page yet."),j(e.red_flags||[])}function Gt(e){var t=Number(e);if(!Number.isFinite(t)||t<=0)return"unknown";try{return new Date(t*1e3).toLocaleString(navigator.language||"en-GB")}catch(i){return"unknown"}}function Ht(e){if(J){var t=e||{},i=["<strong>Knowledge base status</strong>",'<div class="physio-inline-note">Built: '+f(Gt(t.generated_at))+"</div>",'<div class="physio-inline-note">Source files on disk: '+f(String(t.source_count_on_disk||0))+"</div>",'<div class="physio-inline-note">Indexed sources: '+f(String(t.indexed_source_count||0))+"</div>",'<div class="physio-inline-note">Chunks in index: '+f(String(t.document_count||0))+"</div>"];t.stale&&i.push('<div class="physio-inline-note">The index is older than one or more source files. Rebuild the knowledge base and deploy again.</div>'),t.error_count&&i.push('<div class="physio-inline-note">Files without indexable text or with errors: '+f(String(t.error_count))+"</div>"),Array.isArray(t.missing_source_paths)&&t.missing_source_paths.length&&i.push('<div class="physio-inline-note">Not included in index: '+f(t.missing_source_paths.slice(0,3).join(", "))+(t.missing_source_paths.length>3?" ...":"")+"</div>"),J.className="physio-knowledge-meta"+(t.stale?" stale":""),J.innerHTML=i.join("")}}function Ut(){return l!=="knowledge"?Promise.resolve(null):O("/api/physio/knowledge/status").then(function(e){return e.json().then(function(t){if(!e.ok)throw t;return t})}).then(function(e){return Ht(e),e}).catch(function(e){return J&&(J.className="physio-knowledge-meta stale",J.textContent=e&&e.error||"Could not load knowledge base status."),null})}function qt(e){var t=String(e.transcript||"").slice(0,260);return"<strong>"+f(e.session_date||"Unknown date")+" \xB7 "+f(e.session_type||"")+"</strong><div>"+f(et(e.body_region||""))+'</div><div class="physio-inline-note">'+f(t)+(t.length>=260?"...":"")+"</div>"}function kt(e){if(ve){var t=[];if((e||[]).slice().reverse().forEach(function(h,m){var k=h.metrics||{},y=Number(k.nprs_after||k.nprs_before);Number.isFinite(y)&&t.push({x:m,y,label:String(h.session_date||"")})}),!t.length){ve.innerHTML="",ve.hidden=!0;return}ve.hidden=!1;var i=520,n=180,a=28,s=i-a*2,c=n-a*2,p=t.map(function(h,m){var k=a+(t.length===1?s/2:s*m/(t.length-1)),y=a+c-(h.y-0)/10*c;return h.svgX=k,h.svgY=y,(m===0?"M":"L")+k+" "+y}).join(" "),d=t.map(function(h){return'<circle cx="'+h.svgX+'" cy="'+h.svgY+'" r="4" fill="#136f63"></circle><text x="'+h.svgX+'" y="'+(h.svgY-10)+'" text-anchor="middle" font-size="10" fill="#12324a">'+f(String(h.y))+"</text>"}).join("");ve.innerHTML='<svg viewBox="0 0 '+i+" "+n+'" role="img" aria-label="NPRS trend"><rect x="0" y="0" width="'+i+'" height="'+n+'" fill="transparent"></rect><line x1="'+a+'" y1="'+a+'" x2="'+a+'" y2="'+(n-a)+'" stroke="#b7cddd"></line><line x1="'+a+'" y1="'+(n-a)+'" x2="'+(i-a)+'" y2="'+(n-a)+'" stroke="#b7cddd"></line><path d="'+p+'" fill="none" stroke="#136f63" stroke-width="3" stroke-linecap="round"></path>'+d+"</svg>"}}function rt(e,t){if(ge){if(ge.innerHTML="",ge.classList.toggle("compact-empty",!e),!e){ge.appendChild(o("div","physio-output-empty",t||"Save a session first to see an overview here."));return}var i='<div class="physio-session-links"><a class="physio-session-link" href="/physio/soap?case_id='+encodeURIComponent(e.case_id||"")+"&session_id="+encodeURIComponent(e.session_id||"")+'">Open in SOAP</a><a class="physio-session-link" href="/physio/rps?case_id='+encodeURIComponent(e.case_id||"")+"&session_id="+encodeURIComponent(e.session_id||"")+'">Open in RPS</a><a class="physio-session-link" href="/physio/reasoning?case_id='+encodeURIComponent(e.case_id||"")+"&session_id="+encodeURIComponent(e.session_id||"")+'">Open in Reasoning</a></div>';ge.innerHTML="<h3>"+f(e.session_date||"Session")+" \xB7 "+f(e.session_type||"")+"</h3>"+i+'<div><strong>Transcript</strong><div class="physio-inline-note">'+f(String(e.transcript||"").slice(0,900))+'</div></div><div><strong>Saved sections</strong><div class="physio-inline-note">'+(e.soap?"SOAP \xB7 ":"")+(e.rps?"RPS \xB7 ":"")+(e.reasoning?"7-step model \xB7 ":"")+(e.differential_diagnosis?"Differential diagnosis":"No generated output yet")+"</div></div>"}}function ke(e){if(he){var t=r.sessionsByCase[e]||[];if(he.innerHTML="",!t.length){Me&&(Me.textContent=e?"Save a session first to view progress.":"Choose or create a case first."),he.hidden=!0,kt([]),rt(null,e?"No sessions in this case yet.":"No case selected yet.");return}Me&&(Me.textContent="Click a session to view details."),he.hidden=!1,t.forEach(function(n){var a=document.createElement("button");a.type="button",a.className="physio-session-item"+(String(n.session_id||"")===r.selectedSessionId?" active":""),a.innerHTML=qt(n),a.addEventListener("click",function(){r.selectedSessionId=String(n.session_id||""),ke(e),rt(n)}),he.appendChild(a)}),kt(t);var i=t.find(function(n){return String(n.session_id||"")===r.selectedSessionId})||t[0];i&&(r.selectedSessionId=String(i.session_id||""),rt(i))}}function be(){for(var e=String(b?b.value||r.selectedCaseId||"":r.selectedCaseId||""),t=0;t<r.cases.length;t+=1)if(String(r.cases[t].case_id||"")===e)return r.cases[t];return null}function at(e){!e||!te||typeof te.refreshEnhancedSelect!="function"||te.refreshEnhancedSelect(e)}function V(e,t){e&&(e.value=t,at(e))}function bt(e){var t=String(e||"");De&&typeof De.setDate=="function"&&De.setDate(t||me(),!1,"Y-m-d"),A&&(A.value=t||me())}function Kt(){if(b){var e=b.value||r.selectedCaseId||"",t=l==="knowledge"?"No case selected":"Choose a case...";b.innerHTML='<option value="">'+t+"</option>",r.cases.forEach(function(i){var n=document.createElement("option");n.value=String(i.case_id||""),n.textContent=String(i.display_label||i.patient_name||i.case_id||"Case"),b.appendChild(n)}),e?b.value=e:Pe&&(b.value=Pe),r.selectedCaseId=String(b.value||""),at(b)}}function He(){if(Re){if(Re.innerHTML="",!r.cases.length){Re.appendChild(o("div","physio-output-empty","No cases saved yet."));return}r.cases.forEach(function(e){var t=document.createElement("button");t.type="button",t.className="physio-case-item"+(String(e.case_id||"")===r.selectedCaseId?" active":""),t.innerHTML="<strong>"+f(e.display_label||e.patient_name||"Case")+"</strong><div>"+f(e.primary_complaint||et(e.body_region||""))+'</div><div class="physio-inline-note">'+f(e.patient_name||"")+"</div>",t.addEventListener("click",function(){Ce(String(e.case_id||""),{syncForm:!0})}),Re.appendChild(t)})}}function Ct(e){!e||typeof e!="object"||(r.selectedSessionId=String(e.session_id||""),bt(e.session_date||""),V(je,String(e.session_type||"intake")),V(T,String(e.body_region||"algemeen")),x&&(x.value=String(e.transcript||"")),K&&(K.value=String((e.metrics||{}).notes||"")),U&&(U.value=String((e.metrics||{}).nprs_before||"")),q&&(q.value=String((e.metrics||{}).nprs_after||"")),zt(e))}function Wt(e){e&&(r.selectedCaseId=String(e.case_id||""),Ne&&(Ne.textContent=(e.display_label||e.patient_name||"Case")+" \xB7 "+et(e.body_region||"")),ae&&(ae.value=String(e.display_label||"")),se&&(se.value=String(e.patient_name||"")),oe&&(oe.value=String(e.age||"")),le&&(le.value=String(e.sex||"")),de&&(de.value=String(e.referral_source||"")),V(ue,String(e.body_region||"algemeen")),ce&&(ce.value=String(e.primary_complaint||"")),pe&&(pe.value=Array.isArray(e.tags)?e.tags.join(", "):String(e.tags||"")),fe&&(fe.value=String(e.notes||"")))}function Yt(){return{display_label:ae?ae.value:"",patient_name:se?se.value:"",age:oe?oe.value:"",sex:le?le.value:"",referral_source:de?de.value:"",body_region:ue?ue.value:"algemeen",primary_complaint:ce?ce.value:"",tags:pe?pe.value:"",notes:fe?fe.value:""}}function St(){var e=be(),t={session_date:A?A.value:"",session_type:je?je.value:"intake",body_region:T?T.value:"algemeen",transcript:x?x.value:"",metrics:{nprs_before:U?U.value:"",nprs_after:q?q.value:"",notes:K?K.value:""},soap:r.currentOutput.soap||{},rps:r.currentOutput.rps||{},reasoning:r.currentOutput.reasoning||{},differential_diagnosis:r.currentOutput.differential_diagnosis||{},red_flags:r.currentOutput.red_flags||[]};return l==="soap"?t.soap=(r.currentEditorData||{}).soap||r.currentOutput.soap||{}:l==="rps"?t.rps=(r.currentEditorData||{}).rps||r.currentOutput.rps||{}:l==="reasoning"&&(t.reasoning=(r.currentEditorData||{}).reasoning||r.currentOutput.reasoning||{},t.differential_diagnosis=(r.currentEditorData||{}).differential_diagnosis||r.currentOutput.differential_diagnosis||{},t.red_flags=(r.currentEditorData||{}).red_flags||r.currentOutput.red_flags||[]),e&&(t.case_context=e),t}function Jt(){return l==="soap"?{kind:"SOAP",title:(be()||{}).display_label||"SOAP Note",data:(r.currentEditorData||{}).soap||{}}:l==="rps"?{kind:"RPS",title:(be()||{}).display_label||"RPS Form",data:(r.currentEditorData||{}).rps||{}}:{kind:"Clinical Reasoning",title:(be()||{}).display_label||"Clinical Reasoning",data:{reasoning:(r.currentEditorData||{}).reasoning||{},differential_diagnosis:(r.currentEditorData||{}).differential_diagnosis||{},red_flags:(r.currentEditorData||{}).red_flags||[]}}}function Xt(e){u("Transcript wordt gemaakt...","");var t=0;function i(){return t+=1,O("/status/"+encodeURIComponent(e)).then(function(n){return n.json().then(function(a){return{ok:n.ok,body:a}})}).then(function(n){if(!n.ok)throw new Error((n.body||{}).error||"Transcript ophalen mislukt.");var a=n.body||{};if(a.status==="complete"){x&&(x.value=String(a.transcript||a.result||"")),u("Transcript klaar. Controleer en bewerk het waar nodig.","success"),ze("Transcript klaar");return}if(a.status==="error")throw new Error(a.error||"Transcription failed.");if(t>150)throw new Error("Transcription is taking longer than expected.");return u(String(a.step_description||"Processing..."),""),new Promise(function(s){window.setTimeout(s,1600)}).then(i)}).catch(function(n){u(n.message||"Transcription failed.","error")})}return i()}function Et(){return O("/api/physio/cases").then(function(e){return e.json().then(function(t){if(!e.ok)throw t;return t})}).then(function(e){if(r.accessGranted=!0,r.cases=Array.isArray(e.cases)?e.cases:[],Kt(),He(),l==="cases"&&r.cases.length){var t=r.selectedCaseId||Pe||String(r.cases[0].case_id||"");return Ce(t,{syncForm:!0})}return null}).catch(function(e){return e&&e.error?(Ze(e.error,"error"),w(!0),r.accessGranted=!1):u("Could not load cases.","error"),null})}function wt(e){return e?O("/api/physio/cases/"+encodeURIComponent(e)+"/sessions").then(function(t){return t.json().then(function(i){if(!t.ok)throw i;return i})}).then(function(t){var i=Array.isArray(t.sessions)?t.sessions:[];return r.sessionsByCase[e]=i,l==="cases"&&ke(e),i}).catch(function(t){return u(t&&t.error||"Could not load sessions.","error"),[]}):Promise.resolve([])}function Qt(e){if(e&&(l==="soap"||l==="rps"||l==="reasoning"||l==="knowledge")&&(T&&!r.selectedSessionId&&V(T,String(e.body_region||T.value||"algemeen")),l==="knowledge"&&ne)){var t=String(ne.value||"").trim();if(!t){var i=[];e.primary_complaint&&i.push("Primary complaint: "+e.primary_complaint),e.notes&&i.push("Notes: "+e.notes),i.length&&(ne.value=i.join(`
+`),i=[],n=!1;return t.forEach(function(a){var s=a.trim();if(!s){n&&(i.push("</ul>"),n=!1);return}if(s.indexOf("### ")===0){n&&(i.push("</ul>"),n=!1),i.push("<h3>"+f(s.slice(4))+"</h3>");return}if(s.indexOf("## ")===0){n&&(i.push("</ul>"),n=!1),i.push("<h2>"+f(s.slice(3))+"</h2>");return}if(s.indexOf("# ")===0){n&&(i.push("</ul>"),n=!1),i.push("<h1>"+f(s.slice(2))+"</h1>");return}if(s.indexOf("- ")===0){n||(i.push("<ul>"),n=!0),i.push("<li>"+f(s.slice(2))+"</li>");return}n&&(i.push("</ul>"),n=!1),i.push("<p>"+f(s)+"</p>")}),n&&i.push("</ul>"),i.join("")}function _(e){var t=String(e||"").trim();return pt[t]?pt[t]:t.replace(/^stap_(\d+)_/,"Step $1 ").replace(/_/g," ").replace(/\b\w/g,function(i){return i.toUpperCase()})}function et(e){var t=String(e||"").trim().toLowerCase();return Tt[t]||_(t)}function Rt(e){var t=String(e||"").trim().toLowerCase();return Pt[t]||_(t||"bron")}function tt(e,t){for(var i=e,n=0;n<t.length;n+=1){if(!i||typeof i!="object")return;i=i[t[n]]}return i}function it(e,t,i){if(!(!e||!Array.isArray(t)||!t.length)){for(var n=e,a=0;a<t.length-1;a+=1){var s=t[a];n[s]===void 0&&(n[s]=typeof t[a+1]=="number"?[]:{}),n=n[s]}n[t[t.length-1]]=i}}function ft(e,t,i){var n=tt(e,t);Array.isArray(n)&&n.splice(i,1)}function ht(e,t){var i=tt(e,t);return Array.isArray(i)?i:(it(e,t,[]),tt(e,t))}function gt(e,t){if(typeof e=="number"){if(String(t||"").trim()==="")return null;var i=Number(t);return Number.isFinite(i)?i:e}return typeof e=="boolean"?String(t||"").trim().toLowerCase()==="true":String(t||"")}function o(e,t,i){var n=document.createElement(e);return t&&(n.className=t),i!=null&&(n.textContent=String(i)),n}function vt(e){if(e){var t=Math.max(4,parseInt(e.getAttribute("rows")||e.rows||4,10)||4);e.rows=t;var i=window.getComputedStyle?window.getComputedStyle(e):null,n=i?parseFloat(i.lineHeight||0):0,a=i?parseFloat(i.paddingTop||0):0,s=i?parseFloat(i.paddingBottom||0):0,c=Number.isFinite(n)&&n>0?n:22,p=Math.max(0,e.scrollHeight-a-s),d=Math.max(t,Math.ceil(p/c));e.rows=d}}function nt(e,t,i,n){var a=n||{},s=o("label","physio-field editor-field"+(a.full?" full":"")),c=o("span","",e),p=!!a.multiline,d=document.createElement(p?"textarea":"input");return p?(d.rows=a.rows||4,d.value=i==null?"":String(i),vt(d),d.addEventListener("input",function(){it(r.currentEditorData,t,gt(i,d.value)),vt(d)})):(d.type=a.type||"text",d.value=i==null?"":String(i),d.addEventListener("input",function(){it(r.currentEditorData,t,gt(i,d.value))})),a.placeholder&&(d.placeholder=a.placeholder),s.appendChild(c),s.appendChild(d),s}function E(e,t){var i=o("section","physio-section-card");return i.appendChild(o("h3","",e)),t&&i.appendChild(o("p","",t)),i}function S(e){var t=o("div","physio-subsection-card");return t.appendChild(o("h4","",e)),t}function g(){return o("div","physio-section-grid")}function Ge(){return o("div","physio-subsection-grid")}function v(e,t,i,n){(n||[]).forEach(function(a){var s=a.key,c=t?t[s]:null;e.appendChild(nt(a.label||_(s),i.concat([s]),c,{multiline:!!a.multiline,full:!!a.full,rows:a.rows||4}))})}function P(e,t,i,n){var a=n||{},s=E(e,a.description||""),c=o("div","physio-inline-actions"),p=o("button","physio-mini-btn primary",a.addLabel||"Add item");p.type="button",p.addEventListener("click",function(){var h=ht(r.currentEditorData,t);h.push(""),_e()}),c.appendChild(p),s.appendChild(c);var d=o("div","physio-array-list");return i.length?i.forEach(function(h,m){var k=o("div","physio-array-item"),y=o("div","physio-array-item-head");y.appendChild(o("strong","",(a.itemLabel||"Item")+" "+(m+1)));var I=o("button","physio-mini-btn danger","Remove");I.type="button",I.addEventListener("click",function(){ft(r.currentEditorData,t,m),_e()}),y.appendChild(I),k.appendChild(y),k.appendChild(nt(a.itemFieldLabel||_(e),t.concat([m]),h,{multiline:a.multiline!==!1,full:!0,rows:a.rows||3})),d.appendChild(k)}):d.appendChild(o("div","physio-output-empty compact",a.emptyMessage||"No items added yet.")),s.appendChild(d),s}function mt(e,t,i,n,a){var s=a||{},c=E(e,s.description||""),p=o("div","physio-inline-actions"),d=o("button","physio-mini-btn primary",s.addLabel||"Add");d.type="button",d.addEventListener("click",function(){var m=ht(r.currentEditorData,t);m.push(typeof s.createItem=="function"?s.createItem():{}),_e()}),p.appendChild(d),c.appendChild(p);var h=o("div","physio-array-list");return i.length?i.forEach(function(m,k){var y=o("div","physio-array-item"),I=o("div","physio-array-item-head");I.appendChild(o("strong","",(s.itemLabel||"Item")+" "+(k+1)));var F=o("button","physio-mini-btn danger","Remove");F.type="button",F.addEventListener("click",function(){ft(r.currentEditorData,t,k),_e()}),I.appendChild(F),y.appendChild(I);var M=g();v(M,m||{},t.concat([k]),n),y.appendChild(M),h.appendChild(y)}):h.appendChild(o("div","physio-output-empty compact",s.emptyMessage||"No items yet.")),c.appendChild(h),c}function yt(e){B&&B.classList.toggle("is-empty",!!e),dt&&dt.classList.toggle("is-empty",!!e)}function _t(e){X&&X.classList.toggle("is-empty",!!e),N&&N.classList.toggle("is-empty",!!e),ut&&ut.classList.toggle("is-empty",!!e)}function ye(e){r.currentEditorData={},r.lastOutputLabel="",Fe&&(Fe.textContent="Nothing generated yet."),B&&(B.innerHTML="",B.appendChild(o("div","physio-output-empty",e||"No output available yet.")),yt(!0))}function j(e){if(Xe){Xe.innerHTML="";var t=Array.isArray(e)?e:[];t.forEach(function(i,n){var a=o("div","physio-alert");a.appendChild(o("strong","",String(i&&i.vlag||"Red flag "+(n+1)))),i&&i.ernst&&a.appendChild(o("div","","Severity: "+String(i.ernst))),i&&i.actie&&a.appendChild(o("div","",String(i.actie))),Xe.appendChild(a)})}}function Nt(){var e=(r.currentEditorData||{}).soap||{},t=o("div","physio-structured-stack");[{title:"S \xB7 Subjectief",key:"subjective",description:"The patient's reason for visit, symptoms, and history.",fields:[{key:"hulpvraag"},{key:"hoofdklacht"},{key:"medicatie"},{key:"verwachtingen_patient"},{key:"pijn_beschrijving",multiline:!0,full:!0},{key:"functionele_beperkingen",multiline:!0,full:!0},{key:"voorgeschiedenis",multiline:!0,full:!0},{key:"beloop",multiline:!0,full:!0},{key:"overig_subjectief",multiline:!0,full:!0}]},{title:"O \xB7 Objectief",key:"objective",description:"Exam findings and relevant measurements.",fields:[{key:"spierkracht"},{key:"meetinstrumenten"},{key:"inspectie",multiline:!0,full:!0},{key:"palpatie",multiline:!0,full:!0},{key:"actief_bewegingsonderzoek",multiline:!0,full:!0},{key:"passief_bewegingsonderzoek",multiline:!0,full:!0},{key:"speciale_testen",multiline:!0,full:!0},{key:"neurologisch_onderzoek",multiline:!0,full:!0},{key:"functionele_testen",multiline:!0,full:!0},{key:"overig_objectief",multiline:!0,full:!0}]},{title:"A \xB7 Analyse",key:"assessment",description:"Physiotherapy interpretation and prognosis.",fields:[{key:"fysiotherapeutische_diagnose",full:!0,multiline:!0},{key:"betrokken_structuren",full:!0,multiline:!0},{key:"fase_herstel"},{key:"prognose"},{key:"belemmerende_factoren",full:!0,multiline:!0},{key:"bevorderende_factoren",full:!0,multiline:!0}]},{title:"P \xB7 Plan",key:"plan",description:"Goals, treatment approach, and follow-up.",fields:[{key:"frequentie"},{key:"evaluatie"},{key:"behandeldoelen",full:!0,multiline:!0},{key:"behandelplan",full:!0,multiline:!0},{key:"thuisoefeningen",full:!0,multiline:!0},{key:"adviezen",full:!0,multiline:!0},{key:"verwijzing",full:!0,multiline:!0}]}].forEach(function(i){var n=E(i.title,i.description),a=g();v(a,e[i.key]||{},["soap",i.key],i.fields),n.appendChild(a),t.appendChild(n)}),B.appendChild(t)}function Mt(){var e=(r.currentEditorData||{}).rps||{},t=o("div","physio-structured-stack"),i=E("Header","Core patient and session details."),n=g();v(n,e.header||{},["rps","header"],[{key:"naam_patient"},{key:"leeftijd"},{key:"geslacht"},{key:"datum"},{key:"pathologie"},{key:"medicatie"}]),i.appendChild(n),t.appendChild(i);var a=E("Patient perspective","What the patient experiences in functions, activities, and participation."),s=g();v(s,e.volgens_patient||{},["rps","volgens_patient"],[{key:"functies_stoornissen",multiline:!0,full:!0},{key:"activiteiten",multiline:!0,full:!0},{key:"participatie",multiline:!0,full:!0}]),a.appendChild(s),t.appendChild(a);var c=E("Therapist perspective","Observations and findings from the physiotherapy exam."),p=Ge(),d=(e.volgens_therapeut||{}).functies_stoornissen||{},h=S("Functions and impairments"),m=Ge(),k=S("Pain"),y=g();v(y,d.pijn||{},["rps","volgens_therapeut","functies_stoornissen","pijn"],[{key:"type"},{key:"nprs_score"},{key:"locatie"},{key:"provocatie"}]),k.appendChild(y),m.appendChild(k);var I=S("Mobility"),F=g();v(F,d.mobiliteit||{},["rps","volgens_therapeut","functies_stoornissen","mobiliteit"],[{key:"arom"},{key:"prom"}]),I.appendChild(F),m.appendChild(I);var M=S("Muscle function"),D=g();v(D,d.spierfunctie||{},["rps","volgens_therapeut","functies_stoornissen","spierfunctie"],[{key:"kracht"},{key:"uithoudingsvermogen"},{key:"snelheid"},{key:"coordinatie"},{key:"lenigheid"}]),M.appendChild(D),m.appendChild(M);var Se=S("Stability"),z=g();v(z,d.stabiliteit||{},["rps","volgens_therapeut","functies_stoornissen","stabiliteit"],[{key:"passief"},{key:"actief"}]),Se.appendChild(z),m.appendChild(Se);var Ee=S("Other functions"),$=g();v($,d,["rps","volgens_therapeut","functies_stoornissen"],[{key:"sensibiliteit_proprioceptie",multiline:!0,full:!0},{key:"tonus",multiline:!0,full:!0}]),Ee.appendChild($),m.appendChild(Ee),h.appendChild(m),p.appendChild(h);var we=S("Activities"),Z=g();v(Z,(e.volgens_therapeut||{}).activiteiten||{},["rps","volgens_therapeut","activiteiten"],[{key:"reiken"},{key:"grijpen"},{key:"schrijven"},{key:"dragen"},{key:"tillen"},{key:"haarkammen"},{key:"aankleden"},{key:"wassen"},{key:"deur_open_maken"},{key:"lopen"},{key:"overige_activiteiten",full:!0,multiline:!0}]),we.appendChild(Z),p.appendChild(we);var Ie=S("Participation"),Le=g();v(Le,(e.volgens_therapeut||{}).participatie||{},["rps","volgens_therapeut","participatie"],[{key:"deelname_verkeer"},{key:"deelname_werk"},{key:"deelname_hobbys"},{key:"sport"}]),Ie.appendChild(Le),p.appendChild(Ie),c.appendChild(p),t.appendChild(c);var Ae=E("Personal and environmental factors","Factors that influence recovery and tolerance."),G=Ge(),xe=S("Personal factors"),Be=g();v(Be,e.persoonlijke_factoren||{},["rps","persoonlijke_factoren"],[{key:"cognitief",multiline:!0,full:!0},{key:"emotioneel",multiline:!0,full:!0},{key:"sociaal",multiline:!0,full:!0}]),xe.appendChild(Be),G.appendChild(xe);var ee=S("Environmental factors"),Lt=g();v(Lt,e.omgevingsfactoren||{},["rps","omgevingsfactoren"],[{key:"beschrijving",multiline:!0,full:!0}]),ee.appendChild(Lt),G.appendChild(ee),Ae.appendChild(G),t.appendChild(Ae);var At=E("Differential diagnosis","Working hypotheses and the central care question."),xt=g();v(xt,e.differentiaal_diagnostiek||{},["rps","differentiaal_diagnostiek"],[{key:"hypothese_1",full:!0,multiline:!0},{key:"hypothese_2",full:!0,multiline:!0},{key:"hypothese_3",full:!0,multiline:!0},{key:"hulpvraag",full:!0,multiline:!0}]),At.appendChild(xt),t.appendChild(At),B.appendChild(t)}function Dt(){var e=(r.currentEditorData||{}).reasoning||{},t=(r.currentEditorData||{}).differential_diagnosis||{},i=Array.isArray((r.currentEditorData||{}).red_flags)?r.currentEditorData.red_flags:[],n=o("div","physio-structured-stack");n.appendChild(P(_("stap_1_onduidelijke_termen"),["reasoning","stap_1_onduidelijke_termen"],Array.isArray(e.stap_1_onduidelijke_termen)?e.stap_1_onduidelijke_termen:[],{description:"Loose terms or concepts that need clarification first.",addLabel:"Add term",itemLabel:"Term",itemFieldLabel:"Unclear term",multiline:!1,emptyMessage:"No unclear terms added yet."}));var a=E(_("stap_2_3_probleemdefinitie"),"Personal details, referral context, and ICF framing of the problem."),s=g();v(s,e.stap_2_3_probleemdefinitie||{},["reasoning","stap_2_3_probleemdefinitie"],[{key:"persoonsgegevens",full:!0,multiline:!0},{key:"verwijzing",full:!0,multiline:!0},{key:"patientencategorie",full:!0,multiline:!0},{key:"additioneel_onderzoek",full:!0,multiline:!0}]),a.appendChild(s);var c=Ge(),p=(e.stap_2_3_probleemdefinitie||{}).icf_classificatie||{};[{key:"volgens_patient",fields:["functies_stoornissen","activiteiten","participatie"]},{key:"volgens_therapeut",fields:["functies_stoornissen","activiteiten","participatie"]}].forEach(function(G){var xe=S(_(G.key)),Be=g();G.fields.forEach(function(ee){Be.appendChild(nt(_(ee),["reasoning","stap_2_3_probleemdefinitie","icf_classificatie",G.key,ee],(p[G.key]||{})[ee],{multiline:!0,full:!0}))}),xe.appendChild(Be),c.appendChild(xe)});var d=S("Factors"),h=g();v(h,p,["reasoning","stap_2_3_probleemdefinitie","icf_classificatie"],[{key:"persoonlijke_factoren",full:!0,multiline:!0},{key:"externe_factoren",full:!0,multiline:!0}]),d.appendChild(h),c.appendChild(d),a.appendChild(c),n.appendChild(a);var m=E(_("stap_4_gezondheidsprobleem"),"Hypotheses about relationships, influencing factors, and medical-biological processes."),k=g();v(k,e.stap_4_gezondheidsprobleem||{},["reasoning","stap_4_gezondheidsprobleem"],[{key:"persoonlijke_factor_invloed",full:!0,multiline:!0},{key:"externe_factor_invloed",full:!0,multiline:!0},{key:"medisch_biologische_processen",full:!0,multiline:!0}]),m.appendChild(k),m.appendChild(P(_("horizontale_relaties"),["reasoning","stap_4_gezondheidsprobleem","horizontale_relaties"],Array.isArray((e.stap_4_gezondheidsprobleem||{}).horizontale_relaties)?e.stap_4_gezondheidsprobleem.horizontale_relaties:[],{addLabel:"Add relationship",itemLabel:"Relationship",itemFieldLabel:"Relationship",emptyMessage:"No horizontal relationships added yet."})),n.appendChild(m);var y=E(_("stap_5_diagnostisch_proces"),"Screening, diagnostic reasoning, and the proposed assessment."),I=S("Screening"),F=g();v(F,(e.stap_5_diagnostisch_proces||{}).screening||{},["reasoning","stap_5_diagnostisch_proces","screening"],[{key:"rode_vlaggen",full:!0,multiline:!0},{key:"gele_vlaggen",full:!0,multiline:!0}]),I.appendChild(F),y.appendChild(I);var M=g();v(M,e.stap_5_diagnostisch_proces||{},["reasoning","stap_5_diagnostisch_proces"],[{key:"medische_diagnose_type",full:!0,multiline:!0},{key:"indicatie_fysiotherapie",full:!0,multiline:!0},{key:"fysiotherapeutische_conclusie",full:!0,multiline:!0}]),y.appendChild(M);var D=S("Proposed assessment"),Se=g();v(Se,(e.stap_5_diagnostisch_proces||{}).voorgesteld_onderzoek||{},["reasoning","stap_5_diagnostisch_proces","voorgesteld_onderzoek"],[{key:"inspectie",full:!0,multiline:!0},{key:"palpatie",full:!0,multiline:!0},{key:"functieonderzoek",full:!0,multiline:!0}]),D.appendChild(Se),D.appendChild(P(_("anamnese_vragen"),["reasoning","stap_5_diagnostisch_proces","voorgesteld_onderzoek","anamnese_vragen"],Array.isArray(((e.stap_5_diagnostisch_proces||{}).voorgesteld_onderzoek||{}).anamnese_vragen)?e.stap_5_diagnostisch_proces.voorgesteld_onderzoek.anamnese_vragen:[],{addLabel:"Add question",itemLabel:"Question",itemFieldLabel:"History-taking question",emptyMessage:"No history-taking questions added yet."})),D.appendChild(P(_("speciale_testen"),["reasoning","stap_5_diagnostisch_proces","voorgesteld_onderzoek","speciale_testen"],Array.isArray(((e.stap_5_diagnostisch_proces||{}).voorgesteld_onderzoek||{}).speciale_testen)?e.stap_5_diagnostisch_proces.voorgesteld_onderzoek.speciale_testen:[],{addLabel:"Add test",itemLabel:"Test",itemFieldLabel:"Special test",emptyMessage:"No special tests added yet."})),D.appendChild(P(_("meetinstrumenten"),["reasoning","stap_5_diagnostisch_proces","voorgesteld_onderzoek","meetinstrumenten"],Array.isArray(((e.stap_5_diagnostisch_proces||{}).voorgesteld_onderzoek||{}).meetinstrumenten)?e.stap_5_diagnostisch_proces.voorgesteld_onderzoek.meetinstrumenten:[],{addLabel:"Add measure",itemLabel:"Measure",itemFieldLabel:"Outcome measure",emptyMessage:"No outcome measures added yet."})),y.appendChild(D),n.appendChild(y);var z=E(_("stap_6_therapeutisch_proces"),"Goals, measurement points, and treatment choices."),Ee=g();v(Ee,e.stap_6_therapeutisch_proces||{},["reasoning","stap_6_therapeutisch_proces"],[{key:"hoofddoel",full:!0,multiline:!0},{key:"hulpmiddelen",full:!0,multiline:!0},{key:"multidisciplinair",full:!0,multiline:!0}]),z.appendChild(Ee),z.appendChild(P(_("subdoelen"),["reasoning","stap_6_therapeutisch_proces","subdoelen"],Array.isArray((e.stap_6_therapeutisch_proces||{}).subdoelen)?e.stap_6_therapeutisch_proces.subdoelen:[],{addLabel:"Add subgoal",itemLabel:"Subgoal",itemFieldLabel:"Subgoal",emptyMessage:"No subgoals added yet."})),z.appendChild(P(_("evaluatieve_meetinstrumenten"),["reasoning","stap_6_therapeutisch_proces","evaluatieve_meetinstrumenten"],Array.isArray((e.stap_6_therapeutisch_proces||{}).evaluatieve_meetinstrumenten)?e.stap_6_therapeutisch_proces.evaluatieve_meetinstrumenten:[],{addLabel:"Add measure",itemLabel:"Measure",itemFieldLabel:"Evaluation measure",emptyMessage:"No evaluation measures added yet."}));var $=S("Treatment methods"),we=g();v(we,(e.stap_6_therapeutisch_proces||{}).behandelmethoden||{},["reasoning","stap_6_therapeutisch_proces","behandelmethoden"],[{key:"informeren_adviseren",full:!0,multiline:!0}]),$.appendChild(we),$.appendChild(P(_("interventies"),["reasoning","stap_6_therapeutisch_proces","behandelmethoden","interventies"],Array.isArray(((e.stap_6_therapeutisch_proces||{}).behandelmethoden||{}).interventies)?e.stap_6_therapeutisch_proces.behandelmethoden.interventies:[],{addLabel:"Add intervention",itemLabel:"Intervention",itemFieldLabel:"Intervention",emptyMessage:"No interventions added yet."})),z.appendChild($),n.appendChild(z);var Z=E(_("stap_7_effect_therapie"),"Expectations about the effect of education and interventions."),Ie=g();v(Ie,e.stap_7_effect_therapie||{},["reasoning","stap_7_effect_therapie"],[{key:"verwacht_effect_informeren",full:!0,multiline:!0}]),Z.appendChild(Ie),Z.appendChild(P(_("verwacht_effect_interventies"),["reasoning","stap_7_effect_therapie","verwacht_effect_interventies"],Array.isArray((e.stap_7_effect_therapie||{}).verwacht_effect_interventies)?e.stap_7_effect_therapie.verwacht_effect_interventies:[],{addLabel:"Add effect",itemLabel:"Effect",itemFieldLabel:"Expected effect",emptyMessage:"No expected effects added yet."})),n.appendChild(Z),n.appendChild(mt("Differential diagnosis",["differential_diagnosis","hypothesen"],Array.isArray(t.hypothesen)?t.hypothesen:[],[{key:"titel"},{key:"onderbouwing",multiline:!0,full:!0}],{addLabel:"Add hypothesis",itemLabel:"Hypothesis",createItem:function(){return{titel:"",onderbouwing:""}},emptyMessage:"No hypotheses added yet."}));var Le=E("Central care question","Which care question is central within the differential diagnosis?"),Ae=g();v(Ae,t,["differential_diagnosis"],[{key:"hulpvraag",full:!0,multiline:!0}]),Le.appendChild(Ae),n.appendChild(Le),n.appendChild(mt("Red flags",["red_flags"],i,[{key:"vlag"},{key:"ernst"},{key:"actie",full:!0,multiline:!0}],{addLabel:"Add red flag",itemLabel:"Flag",createItem:function(){return{vlag:"",ernst:"",actie:""}},emptyMessage:"No standalone red flags added yet."})),B.appendChild(n)}function _e(){if(B){if(B.innerHTML="",yt(!1),Fe&&(Fe.textContent=r.lastOutputLabel||"Editable output"),l==="soap"){Nt();return}if(l==="rps"){Mt();return}Dt()}}function Q(e,t){r.currentEditorData=C(e||{}),r.lastOutputLabel=String(t||"Editable output"),_e()}function zt(e){if(!e||typeof e!="object"){ye("Generate new output or load a saved session."),j([]),r.currentOutput={};return}if(l==="soap"&&e.soap){r.currentOutput={soap:C(e.soap),rps:C(e.rps||{}),reasoning:C(e.reasoning||{}),differential_diagnosis:C(e.differential_diagnosis||{}),red_flags:C(e.red_flags||[])},j(e.red_flags||[]),Q({soap:e.soap},"SOAP-notitie");return}if(l==="rps"&&e.rps){r.currentOutput={soap:C(e.soap||{}),rps:C(e.rps),reasoning:C(e.reasoning||{}),differential_diagnosis:C(e.differential_diagnosis||{}),red_flags:C(e.red_flags||[])},j(e.red_flags||[]),Q({rps:e.rps},"RPS form");return}if(l==="reasoning"&&(e.reasoning||e.differential_diagnosis)){r.currentOutput={soap:C(e.soap||{}),rps:C(e.rps||{}),reasoning:C(e.reasoning||{}),differential_diagnosis:C(e.differential_diagnosis||{}),red_flags:C(e.red_flags||[])},j(e.red_flags||[]),Q({reasoning:e.reasoning||{},differential_diagnosis:e.differential_diagnosis||{},red_flags:e.red_flags||[]},"Clinical reasoning");return}ye("No saved output is available for this page yet."),j(e.red_flags||[])}function Gt(e){var t=Number(e);if(!Number.isFinite(t)||t<=0)return"unknown";try{return new Date(t*1e3).toLocaleString(navigator.language||"en-GB")}catch(i){return"unknown"}}function Ht(e){if(J){var t=e||{},i=["<strong>Knowledge base status</strong>",'<div class="physio-inline-note">Built: '+f(Gt(t.generated_at))+"</div>",'<div class="physio-inline-note">Source files on disk: '+f(String(t.source_count_on_disk||0))+"</div>",'<div class="physio-inline-note">Indexed sources: '+f(String(t.indexed_source_count||0))+"</div>",'<div class="physio-inline-note">Chunks in index: '+f(String(t.document_count||0))+"</div>"];t.stale&&i.push('<div class="physio-inline-note">Source files were added, changed or removed since the index was built. Rebuild the knowledge base and deploy again.</div>'),t.error_count&&i.push('<div class="physio-inline-note">Files without indexable text or with errors: '+f(String(t.error_count))+"</div>"),Array.isArray(t.missing_source_paths)&&t.missing_source_paths.length&&i.push('<div class="physio-inline-note">Not included in index: '+f(t.missing_source_paths.slice(0,3).join(", "))+(t.missing_source_paths.length>3?" ...":"")+"</div>"),J.className="physio-knowledge-meta"+(t.stale?" stale":""),J.innerHTML=i.join("")}}function Ut(){return l!=="knowledge"?Promise.resolve(null):O("/api/physio/knowledge/status").then(function(e){return e.json().then(function(t){if(!e.ok)throw t;return t})}).then(function(e){return Ht(e),e}).catch(function(e){return J&&(J.className="physio-knowledge-meta stale",J.textContent=e&&e.error||"Could not load knowledge base status."),null})}function qt(e){var t=String(e.transcript||"").slice(0,260);return"<strong>"+f(e.session_date||"Unknown date")+" \xB7 "+f(e.session_type||"")+"</strong><div>"+f(et(e.body_region||""))+'</div><div class="physio-inline-note">'+f(t)+(t.length>=260?"...":"")+"</div>"}function kt(e){if(ve){var t=[];if((e||[]).slice().reverse().forEach(function(h,m){var k=h.metrics||{},y=Number(k.nprs_after||k.nprs_before);Number.isFinite(y)&&t.push({x:m,y,label:String(h.session_date||"")})}),!t.length){ve.innerHTML="",ve.hidden=!0;return}ve.hidden=!1;var i=520,n=180,a=28,s=i-a*2,c=n-a*2,p=t.map(function(h,m){var k=a+(t.length===1?s/2:s*m/(t.length-1)),y=a+c-(h.y-0)/10*c;return h.svgX=k,h.svgY=y,(m===0?"M":"L")+k+" "+y}).join(" "),d=t.map(function(h){return'<circle cx="'+h.svgX+'" cy="'+h.svgY+'" r="4" fill="#136f63"></circle><text x="'+h.svgX+'" y="'+(h.svgY-10)+'" text-anchor="middle" font-size="10" fill="#12324a">'+f(String(h.y))+"</text>"}).join("");ve.innerHTML='<svg viewBox="0 0 '+i+" "+n+'" role="img" aria-label="NPRS trend"><rect x="0" y="0" width="'+i+'" height="'+n+'" fill="transparent"></rect><line x1="'+a+'" y1="'+a+'" x2="'+a+'" y2="'+(n-a)+'" stroke="#b7cddd"></line><line x1="'+a+'" y1="'+(n-a)+'" x2="'+(i-a)+'" y2="'+(n-a)+'" stroke="#b7cddd"></line><path d="'+p+'" fill="none" stroke="#136f63" stroke-width="3" stroke-linecap="round"></path>'+d+"</svg>"}}function rt(e,t){if(ge){if(ge.innerHTML="",ge.classList.toggle("compact-empty",!e),!e){ge.appendChild(o("div","physio-output-empty",t||"Save a session first to see an overview here."));return}var i='<div class="physio-session-links"><a class="physio-session-link" href="/physio/soap?case_id='+encodeURIComponent(e.case_id||"")+"&session_id="+encodeURIComponent(e.session_id||"")+'">Open in SOAP</a><a class="physio-session-link" href="/physio/rps?case_id='+encodeURIComponent(e.case_id||"")+"&session_id="+encodeURIComponent(e.session_id||"")+'">Open in RPS</a><a class="physio-session-link" href="/physio/reasoning?case_id='+encodeURIComponent(e.case_id||"")+"&session_id="+encodeURIComponent(e.session_id||"")+'">Open in Reasoning</a></div>';ge.innerHTML="<h3>"+f(e.session_date||"Session")+" \xB7 "+f(e.session_type||"")+"</h3>"+i+'<div><strong>Transcript</strong><div class="physio-inline-note">'+f(String(e.transcript||"").slice(0,900))+'</div></div><div><strong>Saved sections</strong><div class="physio-inline-note">'+(e.soap?"SOAP \xB7 ":"")+(e.rps?"RPS \xB7 ":"")+(e.reasoning?"7-step model \xB7 ":"")+(e.differential_diagnosis?"Differential diagnosis":"No generated output yet")+"</div></div>"}}function ke(e){if(he){var t=r.sessionsByCase[e]||[];if(he.innerHTML="",!t.length){Me&&(Me.textContent=e?"Save a session first to view progress.":"Choose or create a case first."),he.hidden=!0,kt([]),rt(null,e?"No sessions in this case yet.":"No case selected yet.");return}Me&&(Me.textContent="Click a session to view details."),he.hidden=!1,t.forEach(function(n){var a=document.createElement("button");a.type="button",a.className="physio-session-item"+(String(n.session_id||"")===r.selectedSessionId?" active":""),a.innerHTML=qt(n),a.addEventListener("click",function(){r.selectedSessionId=String(n.session_id||""),ke(e),rt(n)}),he.appendChild(a)}),kt(t);var i=t.find(function(n){return String(n.session_id||"")===r.selectedSessionId})||t[0];i&&(r.selectedSessionId=String(i.session_id||""),rt(i))}}function be(){for(var e=String(b?b.value||r.selectedCaseId||"":r.selectedCaseId||""),t=0;t<r.cases.length;t+=1)if(String(r.cases[t].case_id||"")===e)return r.cases[t];return null}function at(e){!e||!te||typeof te.refreshEnhancedSelect!="function"||te.refreshEnhancedSelect(e)}function V(e,t){e&&(e.value=t,at(e))}function bt(e){var t=String(e||"");De&&typeof De.setDate=="function"&&De.setDate(t||me(),!1,"Y-m-d"),A&&(A.value=t||me())}function Kt(){if(b){var e=b.value||r.selectedCaseId||"",t=l==="knowledge"?"No case selected":"Choose a case...";b.innerHTML='<option value="">'+t+"</option>",r.cases.forEach(function(i){var n=document.createElement("option");n.value=String(i.case_id||""),n.textContent=String(i.display_label||i.patient_name||i.case_id||"Case"),b.appendChild(n)}),e?b.value=e:Pe&&(b.value=Pe),r.selectedCaseId=String(b.value||""),at(b)}}function He(){if(Re){if(Re.innerHTML="",!r.cases.length){Re.appendChild(o("div","physio-output-empty","No cases saved yet."));return}r.cases.forEach(function(e){var t=document.createElement("button");t.type="button",t.className="physio-case-item"+(String(e.case_id||"")===r.selectedCaseId?" active":""),t.innerHTML="<strong>"+f(e.display_label||e.patient_name||"Case")+"</strong><div>"+f(e.primary_complaint||et(e.body_region||""))+'</div><div class="physio-inline-note">'+f(e.patient_name||"")+"</div>",t.addEventListener("click",function(){Ce(String(e.case_id||""),{syncForm:!0})}),Re.appendChild(t)})}}function Ct(e){!e||typeof e!="object"||(r.selectedSessionId=String(e.session_id||""),bt(e.session_date||""),V(je,String(e.session_type||"intake")),V(T,String(e.body_region||"algemeen")),x&&(x.value=String(e.transcript||"")),K&&(K.value=String((e.metrics||{}).notes||"")),U&&(U.value=String((e.metrics||{}).nprs_before||"")),q&&(q.value=String((e.metrics||{}).nprs_after||"")),zt(e))}function Wt(e){e&&(r.selectedCaseId=String(e.case_id||""),Ne&&(Ne.textContent=(e.display_label||e.patient_name||"Case")+" \xB7 "+et(e.body_region||"")),ae&&(ae.value=String(e.display_label||"")),se&&(se.value=String(e.patient_name||"")),oe&&(oe.value=String(e.age||"")),le&&(le.value=String(e.sex||"")),de&&(de.value=String(e.referral_source||"")),V(ue,String(e.body_region||"algemeen")),ce&&(ce.value=String(e.primary_complaint||"")),pe&&(pe.value=Array.isArray(e.tags)?e.tags.join(", "):String(e.tags||"")),fe&&(fe.value=String(e.notes||"")))}function Yt(){return{display_label:ae?ae.value:"",patient_name:se?se.value:"",age:oe?oe.value:"",sex:le?le.value:"",referral_source:de?de.value:"",body_region:ue?ue.value:"algemeen",primary_complaint:ce?ce.value:"",tags:pe?pe.value:"",notes:fe?fe.value:""}}function St(){var e=be(),t={session_date:A?A.value:"",session_type:je?je.value:"intake",body_region:T?T.value:"algemeen",transcript:x?x.value:"",metrics:{nprs_before:U?U.value:"",nprs_after:q?q.value:"",notes:K?K.value:""},soap:r.currentOutput.soap||{},rps:r.currentOutput.rps||{},reasoning:r.currentOutput.reasoning||{},differential_diagnosis:r.currentOutput.differential_diagnosis||{},red_flags:r.currentOutput.red_flags||[]};return l==="soap"?t.soap=(r.currentEditorData||{}).soap||r.currentOutput.soap||{}:l==="rps"?t.rps=(r.currentEditorData||{}).rps||r.currentOutput.rps||{}:l==="reasoning"&&(t.reasoning=(r.currentEditorData||{}).reasoning||r.currentOutput.reasoning||{},t.differential_diagnosis=(r.currentEditorData||{}).differential_diagnosis||r.currentOutput.differential_diagnosis||{},t.red_flags=(r.currentEditorData||{}).red_flags||r.currentOutput.red_flags||[]),e&&(t.case_context=e),t}function Jt(){return l==="soap"?{kind:"SOAP",title:(be()||{}).display_label||"SOAP Note",data:(r.currentEditorData||{}).soap||{}}:l==="rps"?{kind:"RPS",title:(be()||{}).display_label||"RPS Form",data:(r.currentEditorData||{}).rps||{}}:{kind:"Clinical Reasoning",title:(be()||{}).display_label||"Clinical Reasoning",data:{reasoning:(r.currentEditorData||{}).reasoning||{},differential_diagnosis:(r.currentEditorData||{}).differential_diagnosis||{},red_flags:(r.currentEditorData||{}).red_flags||[]}}}function Xt(e){u("Transcript wordt gemaakt...","");var t=0;function i(){return t+=1,O("/status/"+encodeURIComponent(e)).then(function(n){return n.json().then(function(a){return{ok:n.ok,body:a}})}).then(function(n){if(!n.ok)throw new Error((n.body||{}).error||"Transcript ophalen mislukt.");var a=n.body||{};if(a.status==="complete"){x&&(x.value=String(a.transcript||a.result||"")),u("Transcript klaar. Controleer en bewerk het waar nodig.","success"),ze("Transcript klaar");return}if(a.status==="error")throw new Error(a.error||"Transcription failed.");if(t>150)throw new Error("Transcription is taking longer than expected.");return u(String(a.step_description||"Processing..."),""),new Promise(function(s){window.setTimeout(s,1600)}).then(i)}).catch(function(n){u(n.message||"Transcription failed.","error")})}return i()}function Et(){return O("/api/physio/cases").then(function(e){return e.json().then(function(t){if(!e.ok)throw t;return t})}).then(function(e){if(r.accessGranted=!0,r.cases=Array.isArray(e.cases)?e.cases:[],Kt(),He(),l==="cases"&&r.cases.length){var t=r.selectedCaseId||Pe||String(r.cases[0].case_id||"");return Ce(t,{syncForm:!0})}return null}).catch(function(e){return e&&e.error?(Ze(e.error,"error"),w(!0),r.accessGranted=!1):u("Could not load cases.","error"),null})}function wt(e){return e?O("/api/physio/cases/"+encodeURIComponent(e)+"/sessions").then(function(t){return t.json().then(function(i){if(!t.ok)throw i;return i})}).then(function(t){var i=Array.isArray(t.sessions)?t.sessions:[];return r.sessionsByCase[e]=i,l==="cases"&&ke(e),i}).catch(function(t){return u(t&&t.error||"Could not load sessions.","error"),[]}):Promise.resolve([])}function Qt(e){if(e&&(l==="soap"||l==="rps"||l==="reasoning"||l==="knowledge")&&(T&&!r.selectedSessionId&&V(T,String(e.body_region||T.value||"algemeen")),l==="knowledge"&&ne)){var t=String(ne.value||"").trim();if(!t){var i=[];e.primary_complaint&&i.push("Primary complaint: "+e.primary_complaint),e.notes&&i.push("Notes: "+e.notes),i.length&&(ne.value=i.join(`
 `))}}}function Ce(e,t){var i=t||{};r.selectedCaseId=String(e||""),b&&V(b,r.selectedCaseId),He();var n=be();return Qt(n),n&&i.syncForm&&Wt(n),r.selectedCaseId?wt(r.selectedCaseId).then(function(a){if(l==="soap"||l==="rps"||l==="reasoning"){var s=a.find(function(c){return String(c.session_id||"")===(Ot||r.selectedSessionId)})||a[0];s?Ct(s):(r.selectedSessionId="",bt(me()),x&&(x.value=""),K&&(K.value=""),U&&(U.value=""),q&&(q.value=""),ye("No session is saved for this case yet. Generate output first or save a session."),j([]))}return n}):(r.selectedSessionId="",l==="cases"&&ke(""),(l==="soap"||l==="rps"||l==="reasoning")&&ye("Generate new output or load a saved session."),Promise.resolve(null))}function It(e){var t=Jt();if(!t.data||!Object.keys(t.data).length){u("There is no output to export yet.","error");return}u("Preparing export...",""),O("/api/physio/export",{method:"POST",headers:{"Content-Type":"application/json"},body:JSON.stringify({kind:t.kind,title:t.title,format:e,data:t.data})}).then(function(i){return i.ok?Promise.all([i.blob(),Promise.resolve(i.headers.get("Content-Disposition")||"")]):i.json().then(function(n){throw new Error(n.error||"Export failed.")})}).then(function(i){var n=i[0],a=i[1],s=a.match(/filename=\"?([^\";]+)\"?/i),c=s&&s[1]?s[1]:"physio-export."+e,p=document.createElement("a");p.href=URL.createObjectURL(n),p.download=c,document.body.appendChild(p),p.click(),document.body.removeChild(p),window.setTimeout(function(){URL.revokeObjectURL(p.href)},1200),u("Export started.","success")}).catch(function(i){u(i.message||"Export failed.","error")})}function Vt(){return r.selectedCaseId?!0:(u("Choose a case first, or create one on the Cases page.","error"),!1)}function $t(){if(!x||!x.value.trim()){u("Enter a transcript first.","error");return}var e=l==="soap"?"/api/physio/soap":l==="rps"?"/api/physio/rps":"/api/physio/reasoning",t=St();w(!0),u("Generating AI output...",""),O(e,{method:"POST",headers:{"Content-Type":"application/json"},body:JSON.stringify(t)}).then(function(i){return i.json().then(function(n){if(!i.ok)throw n;return n})}).then(function(i){l==="soap"?(r.currentOutput.soap=i.soap||{},j([]),Q({soap:r.currentOutput.soap},"SOAP note")):l==="rps"?(r.currentOutput.rps=i.rps||{},j([]),Q({rps:r.currentOutput.rps},"RPS form")):(r.currentOutput.reasoning=i.seven_step||{},r.currentOutput.differential_diagnosis=i.differential_diagnosis||{},r.currentOutput.red_flags=Array.isArray(i.red_flags)?i.red_flags:[],j(r.currentOutput.red_flags),Q({reasoning:r.currentOutput.reasoning,differential_diagnosis:r.currentOutput.differential_diagnosis,red_flags:r.currentOutput.red_flags},"Clinical reasoning")),u("Output generated. Review everything carefully before saving.","success")}).catch(function(i){u(i&&i.error||i.message||"Generation failed.","error")}).finally(function(){w(!1)})}function Zt(){if(Vt()){var e=St();if(!e.transcript||!String(e.transcript).trim()){u("A transcript is required to save a session.","error");return}r.selectedSessionId&&(e.session_id=r.selectedSessionId),w(!0),u("Saving session...",""),O("/api/physio/cases/"+encodeURIComponent(r.selectedCaseId)+"/sessions",{method:r.selectedSessionId?"PATCH":"POST",headers:{"Content-Type":"application/json"},body:JSON.stringify(e)}).then(function(t){return t.json().then(function(i){if(!t.ok)throw i;return i})}).then(function(t){var i=t.session||{};return r.selectedSessionId=String(i.session_id||""),ze("Session saved"),u("Session saved in the selected case.","success"),wt(r.selectedCaseId)}).then(function(t){var i=(t||[]).find(function(n){return String(n.session_id||"")===r.selectedSessionId});i&&Ct(i)}).catch(function(t){u(t&&t.error||t.message||"Saving failed.","error")}).finally(function(){w(!1)})}}function ei(e){var t={},i=[];return(e||[]).forEach(function(n,a){var s=String(n.source_path||n.source_name||n.source_title||"source-"+a);t[s]||(t[s]={key:s,source_name:String(n.source_name||"").trim(),source_title:String(n.source_title||n.source_name||"Source").trim(),source_kind:String(n.source_kind||"").trim(),hits:[]},i.push(t[s])),t[s].hits.push({page_label:String(n.page_label||"").trim(),excerpt:String(n.excerpt||"").trim(),score:Number(n.score||0)||0})}),i}function ti(e){if(_t(!1),X&&(X.innerHTML=Ft(e.answer_markdown||"")),re&&(re.innerHTML="",(e.citations||[]).forEach(function(i,n){var a=o("div","physio-citation-chip");a.innerHTML="<strong>["+(n+1)+"]</strong><span>"+f(String(i.label||i.source_name||"Source"))+"</span>",re.appendChild(a)})),N){N.innerHTML="";var t=ei(e.retrieved_sources||[]);t.length?t.forEach(function(i){var n=o("div","physio-source-card"),a=o("div","physio-source-card-head");a.innerHTML="<div><strong>"+f(i.source_title)+'</strong><div class="physio-inline-note">'+f(i.source_name)+'</div></div><span class="physio-source-kind">'+f(Rt(i.source_kind||"overig"))+"</span>",n.appendChild(a);var s=o("div","physio-source-hit-list");i.hits.forEach(function(c,p){var d=o("div","physio-source-hit");d.innerHTML='<div class="physio-source-hit-topline"><span class="physio-source-page">'+f(c.page_label||"Excerpt "+(p+1))+'</span><span class="physio-source-score">Relevance '+f(c.score.toFixed(3))+"</span></div><div>"+f(c.excerpt||"")+"</div>",s.appendChild(d)}),n.appendChild(s),N.appendChild(n)}):N.appendChild(o("div","physio-output-empty","No source excerpts available."))}}function ii(){if(!Qe||!Qe.value.trim()){u("Type a question first.","error");return}w(!0),L&&(L.textContent="Working..."),u("Searching knowledge base...",""),O("/api/physio/knowledge/query",{method:"POST",headers:{"Content-Type":"application/json"},body:JSON.stringify({question:Qe.value,context_text:ne?ne.value:"",body_region:T?T.value:"",case_id:b?b.value:""})}).then(function(e){return e.json().then(function(t){if(!e.ok)throw t;return t})}).then(function(e){r.hasKnowledgeResult=!0,ti(e),L&&(L.textContent="Ask again"),u("Answer ready.","success")}).catch(function(e){L&&(L.textContent=r.hasKnowledgeResult?"Ask again":jt),u(e&&e.error||e.message||"Knowledge base query failed.","error")}).finally(function(){w(!1)})}function ni(){var e=Yt();if(!e.display_label&&!e.patient_name){u("Enter at least a label or patient name.","error");return}w(!0),u("Saving case...","");var t="/api/physio/cases"+(r.selectedCaseId?"/"+encodeURIComponent(r.selectedCaseId):"");O(t,{method:r.selectedCaseId?"PATCH":"POST",headers:{"Content-Type":"application/json"},body:JSON.stringify(e)}).then(function(i){return i.json().then(function(n){if(!i.ok)throw n;return n})}).then(function(i){var n=i.case||{};return r.selectedCaseId=String(n.case_id||""),ze("Case saved"),u("Case saved.","success"),Et().then(function(){return Ce(r.selectedCaseId,{syncForm:!0})})}).catch(function(i){u(i&&i.error||i.message||"Could not save case.","error")}).finally(function(){w(!1)})}function ri(){r.selectedCaseId="",r.selectedSessionId="",Ne&&(Ne.textContent="New case"),[ae,se,oe,le,de,ce,pe,fe].forEach(function(e){e&&(e.value="")}),V(ue,"algemeen"),He(),ke("")}function st(){if(qe){if(r.selectedAudioFile){qe.textContent=r.selectedAudioFile.name+" selected.",R&&(R.disabled=!1);return}qe.textContent="No audio selected yet.",R&&(R.disabled=!0)}}function ai(){return!navigator.permissions||typeof navigator.permissions.query!="function"?Promise.resolve("prompt"):navigator.permissions.query({name:"microphone"}).then(function(e){return e&&e.state?String(e.state):"prompt"}).catch(function(){return"prompt"})}function si(){if(!navigator.mediaDevices||!navigator.mediaDevices.getUserMedia||!window.MediaRecorder){u("Recording is not supported in this browser.","error");return}ai().then(function(e){if(e==="denied")throw new Error("Microphone access is blocked. Allow microphone access in your browser and try again.");return navigator.mediaDevices.getUserMedia({audio:!0})}).then(function(e){r.recorderChunks=[],r.recorder=new window.MediaRecorder(e),r.recorder.addEventListener("dataavailable",function(t){t.data&&t.data.size>0&&r.recorderChunks.push(t.data)}),r.recorder.addEventListener("stop",function(){e.getTracks().forEach(function(i){i.stop()});var t=new Blob(r.recorderChunks,{type:r.recorder.mimeType||"audio/webm"});r.selectedAudioFile=new File([t],"physio-recording.webm",{type:t.type||"audio/webm"}),st(),W&&(W.disabled=!1),Y&&(Y.disabled=!0),u("Recording finished. You can create a transcript now.","success"),ze("Recording finished")}),r.recorder.start(),W&&(W.disabled=!0),Y&&(Y.disabled=!1),u("Recording in progress...","")}).catch(function(e){var t=e&&e.message||"Microphone access was denied.";u(t,"error")})}function oi(){r.recorder&&r.recorder.state!=="inactive"&&(r.recorder.stop(),u("Finishing recording...",""))}function li(){if(!r.selectedAudioFile){u("Choose an audio file first, or record something.","error");return}w(!0);var e=new FormData;e.append("audio",r.selectedAudioFile),O("/api/physio/transcriptions",{method:"POST",body:e}).then(function(t){return t.json().then(function(i){if(!t.ok)throw i;return i})}).then(function(t){if(!t.job_id)throw new Error("No job ID was returned.");return Xt(t.job_id)}).catch(function(t){u(t&&t.error||t.message||"Could not start transcription.","error")}).finally(function(){w(!1)})}function di(){[b,T,je,ue].forEach(function(e){!e||typeof te.enhanceNativeSelect!="function"||(te.enhanceNativeSelect(e),at(e))}),A&&typeof flatpickr!="undefined"&&(De=flatpickr(A,{dateFormat:"Y-m-d",allowInput:!0,defaultDate:A.value||me()}))}function ui(){A&&!A.value&&(A.value=me()),di(),Oe.onAuthStateChanged(function(e){if(r.user=e,!e){Ze("Sign in to use Physio Assistant.","error"),w(!0),r.accessGranted=!1;return}Ze("",""),w(!1),Et().then(function(){return Ut()}).then(function(){return(l==="soap"||l==="rps"||l==="reasoning"||l==="knowledge")&&r.selectedCaseId?Ce(r.selectedCaseId||Pe,{syncForm:l==="cases"}):null})}),b&&b.addEventListener("change",function(){Ce(b.value,{syncForm:!1})}),ie&&ie.addEventListener("change",function(){r.selectedAudioFile=ie.files&&ie.files[0]?ie.files[0]:null,st()}),W&&W.addEventListener("click",si),Y&&Y.addEventListener("click",oi),R&&R.addEventListener("click",li),Ke&&Ke.addEventListener("click",$t),We&&We.addEventListener("click",Zt),Ye&&Ye.addEventListener("click",function(){It("docx")}),Je&&Je.addEventListener("click",function(){It("pdf")}),L&&L.addEventListener("click",ii),Ve&&Ve.addEventListener("click",ni),ct&&ct.addEventListener("click",ri),l==="cases"?(He(),ke("")):l==="knowledge"?(_t(!0),X&&(X.innerHTML='<div class="physio-output-empty">Ask a question to get an answer from your knowledge base.</div>'),re&&(re.innerHTML=""),N&&(N.innerHTML="")):ye("Generate new output or load a saved session."),st()}ui()})();
@@ -34,3 +34,9 @@ def client(app, core):
 @pytest.fixture()
 def disable_sentry(monkeypatch, core):
     monkeypatch.setattr(core, "sentry_sdk", None)
+
+
+@pytest.fixture(autouse=True)
+def isolated_result_cache(monkeypatch, runtime, tmp_path):
+    monkeypatch.setattr(runtime.core, "AI_RESULT_CACHE_DIR", str(tmp_path / "result-cache"))
+    monkeypatch.setattr(runtime.core, "BATCH_ARTIFACT_CACHE_DIR", str(tmp_path / "export-artifacts"))
@@ -1,6 +1,8 @@
 import io
 import json
 import re
+import threading
+import time
 import zipfile
 import pytest
 from datetime import datetime, timedelta, timezone
@@ -9,6 +11,7 @@ from types import SimpleNamespace
 from flask import request
 
 from lecture_processor.domains.account import lifecycle as account_lifecycle
+from lecture_processor.domains.admin import duration_stats as admin_duration_stats
 from lecture_processor.domains.admin import rollups as admin_rollups
 from lecture_processor.domains.admin import metrics as admin_metrics
 from lecture_processor.domains.ai import batch_orchestrator
@@ -1547,6 +1550,73 @@ def test_status_uses_runtime_job_fallback(client, monkeypatch):
     assert body["step"] == 2
 
 
+def test_status_long_poll_returns_304_until_step_changes(client, monkeypatch):
+    core.jobs.clear()
+    monkeypatch.setattr(core, "verify_firebase_token", lambda _request: {"uid": "u-poll", "email": "user@example.com"})
+    core.jobs["job-poll"] = {
+        "status": "processing",
+        "step": 1,
+        "step_description": "Extracting text from slides...",
+        "total_steps": 3,
+        "mode": "lecture-notes",
+        "user_id": "u-poll",
+    }
+
+    first = client.get("/status/job-poll")
+    etag = first.headers.get("ETag")
+    assert first.status_code == 200
+    assert etag
+
+    unchanged = client.get("/status/job-poll?wait=0.05", headers={"If-None-Match": etag})
+    assert unchanged.status_code == 304
+    assert unchanged.headers.get("ETag") == etag
+
+    # A mutation that leaves status/step/description alone keeps the request waiting.
+    timers = [
+        threading.Timer(0.02, lambda: runtime_jobs_store.update_job_fields("job-poll", runtime=core, token_total=10)),
+        threading.Timer(
+            0.1,
+            lambda: runtime_jobs_store.update_job_fields("job-poll", runtime=core, step=2, step_description="Transcribing audio..."),
+        ),
+    ]
+    for timer in timers:
+        timer.start()
+    try:
+        changed = client.get("/status/job-poll?wait=5", headers={"If-None-Match": etag})
+    finally:
+        for timer in timers:
+            timer.join()
+
+    assert changed.status_code == 200
+    assert changed.get_json()["step"] == 2
+    assert changed.headers.get("ETag") != etag
+    assert core.JOB_STATUS_NOTIFIER.watcher_count() == 0
+
+
+def test_status_long_poll_answers_immediately_when_waiters_are_capped(client, monkeypatch):
+    core.jobs.clear()
+    monkeypatch.setattr(core, "verify_firebase_token", lambda _request: {"uid": "u-poll", "email": "user@example.com"})
+    monkeypatch.setattr(core, "JOB_STATUS_LONG_POLL_MAX_WAITERS", 1)
+    core.jobs["job-capped"] = {
+        "status": "processing",
+        "step": 1,
+        "step_description": "Extracting text from slides...",
+        "total_steps": 3,
+        "mode": "lecture-notes",
+        "user_id": "u-poll",
+    }
+    etag = client.get("/status/job-capped").headers.get("ETag")
+
+    with core.JOB_STATUS_NOTIFIER.watch("other-job"):
+        started = time.monotonic()
+        response = client.get("/status/job-capped?wait=5", headers={"If-None-Match": etag})
+        elapsed = time.monotonic() - started
+
+    assert response.status_code == 304
+    assert elapsed < 1
+    assert core.JOB_STATUS_NOTIFIER.watcher_count() == 0
+
+
 def test_verify_email_handles_empty_body(client, monkeypatch):
     monkeypatch.setattr(rate_limiter, "check_rate_limit", lambda **_kwargs: (True, 0))
 
@@ -1647,6 +1717,98 @@ def test_processing_estimate_uses_sanitized_total_mb_and_percentiles(client, mon
     assert payload["range"]["high_seconds"] >= payload["range"]["typical_seconds"]
 
 
+class _Increment:
+    def __init__(self, value):
+        self.value = value
+
+
+class _MergingStatsDB:
+    """Firestore stand-in that applies ``Increment`` merges and serves ``get_all``."""
+
+    def __init__(self):
+        self.docs = {}
+        self.get_all_calls = 0
+
+    def collection(self, name):
+        return SimpleNamespace(document=lambda doc_id: SimpleNamespace(
+            key=(name, doc_id),
+            set=lambda payload, merge=False: self._merge(self.docs.setdefault((name, doc_id), {}), payload),
+        ))
+
+    def _merge(self, target, payload):
+        for key, value in payload.items():
+            if isinstance(value, dict):
+                self._merge(target.setdefault(key, {}), value)
+            elif isinstance(value, _Increment):
+                target[key] = target.get(key, 0) + value.value
+            else:
+                target[key] = value
+
+    def get_all(self, refs):
+        self.get_all_calls += 1
+        return [
+            SimpleNamespace(exists=ref.key in self.docs, to_dict=lambda key=ref.key: json.loads(json.dumps(self.docs[key])))
+            for ref in refs
+        ]
+
+
+def test_processing_estimate_and_averages_read_precomputed_duration_stats(client, monkeypatch):
+    monkeypatch.setattr(core, "verify_firebase_token", lambda _request: {"uid": "u", "email": "user@example.com"})
+    db = _MergingStatsDB()
+    monkeypatch.setattr(core, "db", db)
+    admin_duration_stats.clear_cache()
+    now_ts = core.time.time()
+    stats_runtime = SimpleNamespace(db=db, firestore=SimpleNamespace(Increment=_Increment), time=core.time)
+    for index, duration in enumerate([90, 100, 110, 120, 130, 140, 150, 160]):
+        admin_duration_stats.record_job_duration({
+            "status": "complete",
+            "mode": "lecture-notes",
+            "study_features": "both",
+            "file_size_mb": 55.0,
+            "duration_seconds": duration,
+            "finished_at": now_ts - index * 86400,
+        }, runtime=stats_runtime)
+    admin_duration_stats.record_job_duration({
+        "status": "complete", "mode": "slides-only", "file_size_mb": 3.0, "duration_seconds": 40, "finished_at": now_ts,
+    }, runtime=stats_runtime)
+    admin_duration_stats.record_job_duration({
+        "status": "error", "mode": "slides-only", "duration_seconds": 500, "finished_at": now_ts,
+    }, runtime=stats_runtime)
+    job_log_scans = []
+    monkeypatch.setattr(
+        admin_metrics,
+        "safe_query_docs_in_window",
+        lambda *_args, **_kwargs: job_log_scans.append(_kwargs.get("collection_name")) or [],
+    )
+
+    try:
+        response = client.get("/api/processing-estimate?mode=lecture-notes&study_features=both&total_mb=60")
+        averages_response = client.get("/api/processing-averages")
+        assert job_log_scans == []
+        # One slides-only sample is not enough, so the estimate falls back to job_logs.
+        sparse_response = client.get("/api/processing-estimate?mode=slides-only")
+    finally:
+        admin_duration_stats.clear_cache()
+
+    assert job_log_scans == ["job_logs"]
+    assert sparse_response.get_json()["source"] == "heuristic"
+
+    payload = response.get_json()
+    assert payload["source"] == "strict"
+    assert payload["sample_count"] == 8
+    assert 100 <= payload["range"]["low_seconds"] <= 112
+    assert 118 <= payload["range"]["typical_seconds"] <= 132
+    assert 136 <= payload["range"]["high_seconds"] <= 150
+    averages = averages_response.get_json()
+    assert averages["total_jobs"] == 9
+    assert averages["averages"]["lecture-notes"]["avg_seconds"] == 125.0
+    assert averages["averages"]["lecture-notes"]["min_seconds"] <= 90
+    assert averages["averages"]["lecture-notes"]["max_seconds"] >= 160
+    assert averages["averages"]["slides-only"]["job_count"] == 1
+    assert averages_response.headers["Cache-Control"] == "private, max-age=300"
+    assert db.get_all_calls == 1
+
+
 def test_checkout_session_uses_trusted_public_base_url(client, monkeypatch):
     monkeypatch.setattr(core, "verify_firebase_token", lambda _request: {"uid": "checkout-u1", "email": "u@example.com"})
     monkeypatch.setattr(auth_policy, "is_email_allowed", lambda _email, runtime=None: True)
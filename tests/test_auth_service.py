@@ -0,0 +1,64 @@
+from types import SimpleNamespace
+
+from lecture_processor.services import auth_service
+
+
+class _Clock:
+    def __init__(self, now):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+class _FakeAuth:
+    def __init__(self, clock):
+        self.clock = clock
+        self.calls = []
+
+    def verify_id_token(self, token, check_revoked=False):
+        self.calls.append((token, check_revoked))
+        if token == "bad":
+            raise ValueError("invalid signature")
+        return {"uid": f"uid-{token}", "exp": self.clock.now + 600}
+
+
+def _request(token):
+    return SimpleNamespace(headers={"Authorization": f"Bearer {token}"})
+
+
+def test_verify_firebase_token_serves_repeat_requests_from_cache_until_revalidation():
+    clock = _Clock(1_000.0)
+    auth = _FakeAuth(clock)
+    cache = auth_service.VerifiedTokenCache(max_entries=8, revalidate_seconds=60, clock=clock)
+
+    for _ in range(3):
+        assert auth_service.verify_firebase_token(_request("t1"), auth, None, token_cache=cache)["uid"] == "uid-t1"
+    assert auth.calls == [("t1", False)]
+    assert cache.stats() == {"hits": 2, "misses": 1, "evictions": 0, "entries": 1}
+
+    clock.now += 61
+    auth_service.verify_firebase_token(_request("t1"), auth, None, token_cache=cache, check_revoked=True)
+    assert auth.calls[-1] == ("t1", True)
+    assert auth_service.verify_firebase_token(_request("bad"), auth, None, token_cache=cache) is None
+    assert cache.stats()["entries"] == 1
+
+
+def test_verified_token_cache_honours_exp_lru_cap_and_uid_invalidation():
+    clock = _Clock(1_000.0)
+    cache = auth_service.VerifiedTokenCache(max_entries=2, revalidate_seconds=300, clock=clock)
+
+    cache.put("expired", {"uid": "u0", "exp": 999})
+    cache.put("short", {"uid": "u1", "exp": 1_010})
+    cache.put("long", {"uid": "u2", "exp": 5_000})
+    assert cache.get("expired") is None
+    assert cache.get("short")["uid"] == "u1"
+
+    cache.put("other", {"uid": "u2", "exp": 5_000})
+    assert cache.get("long") is None
+    assert cache.stats()["evictions"] == 1
+
+    clock.now = 1_011
+    assert cache.get("short") is None
+    assert cache.invalidate_uid("u2") == 1
+    assert cache.get("other") is None
@@ -1,5 +1,6 @@
 import io
 import json
+import threading
 import zipfile
 
 import pytest
@@ -587,6 +588,60 @@ def test_batch_download_zip_omits_combined_docx_when_disabled(client, monkeypatc
     assert summary['export_options'] == {'include_combined_docx': False}
 
 
+def test_batch_download_zip_streams_and_reuses_rendered_artifacts(client, monkeypatch):
+    _patch_batch_auth(monkeypatch)
+    monkeypatch.setattr(
+        batch_orchestrator,
+        'get_batch',
+        lambda batch_id, runtime=None: {
+            'batch_id': batch_id,
+            'uid': 'u-batch',
+            'mode': 'lecture-notes',
+            'status': 'complete',
+            'batch_title': 'Cached Batch',
+            'total_rows': 1,
+            'export_options': {'include_combined_docx': True},
+        },
+    )
+    monkeypatch.setattr(batch_orchestrator, 'get_batch_status', lambda batch_id, runtime=None: {'can_download_zip': True})
+    monkeypatch.setattr(
+        batch_orchestrator,
+        'list_batch_rows',
+        lambda batch_id, runtime=None: [
+            {
+                'row_id': 'row-1',
+                'ordinal': 1,
+                'status': 'complete',
+                'result': 'Merged lecture notes',
+                'transcript': 'Transcript text',
+                'flashcards': [{'front': 'What is ATP?', 'back': 'Energy currency'}],
+            }
+        ],
+    )
+    rendered = []
+
+    def _counting_docx(markdown_text, title='Document', runtime=None):
+        rendered.append(title)
+        return _SimpleDocx(f'{title}\n{markdown_text}')
+
+    monkeypatch.setattr(study_export, 'markdown_to_docx', _counting_docx)
+
+    first = client.get('/api/batch/jobs/batch-cached/download.zip')
+    assert first.is_streamed
+    first_archive = zipfile.ZipFile(io.BytesIO(first.data), 'r')
+    rendered_first = len(rendered)
+    second = client.get('/api/batch/jobs/batch-cached/download.zip')
+    second_archive = zipfile.ZipFile(io.BytesIO(second.data), 'r')
+
+    assert first.status_code == 200
+    assert 'batch-batch-cached.zip' in first.headers.get('Content-Disposition', '')
+    assert rendered_first == 3
+    assert len(rendered) == rendered_first
+    assert first_archive.namelist() == second_archive.namelist()
+    assert second_archive.read('rows/row-1/transcript.docx') == first_archive.read('rows/row-1/transcript.docx')
+    assert 'Energy currency' in second_archive.read('rows/row-1/flashcards.csv').decode('utf-8')
+
+
 def test_batch_status_repairs_terminal_batch_with_incomplete_rows(monkeypatch):
     _clear_batch_memory()
     _patch_batch_refunds(monkeypatch)
@@ -813,3 +868,181 @@ def test_batch_completion_email_status_skipped_when_disabled(monkeypatch):
     batch = batch_orchestrator.get_batch(batch_id, runtime=core)
     assert batch.get('completion_email_status') == 'skipped'
     assert 'disabled' in str(batch.get('completion_email_error', '')).lower()
+
+
+class _FakeWriteBatch:
+    def __init__(self, commits):
+        self.commits = commits
+        self.writes = []
+
+    def set(self, ref, payload, merge=False):
+        self.writes.append((ref.path, dict(payload), merge))
+
+    def commit(self):
+        self.commits.append(list(self.writes))
+
+
+class _FakeDocRef:
+    def __init__(self, path):
+        self.path = path
+
+    def collection(self, name):
+        return _FakeDocRef(f'{self.path}/{name}')
+
+    def document(self, doc_id):
+        return _FakeDocRef(f'{self.path}/{doc_id}')
+
+
+class _FakeBatchDb(_FakeDocRef):
+    def __init__(self):
+        super().__init__('')
+        self.commits = []
+
+    def batch(self):
+        return _FakeWriteBatch(self.commits)
+
+
+def test_set_batch_rows_commits_in_chunks_of_max_ops():
+    db = _FakeBatchDb()
+    writes = [(f'row-{idx}', {'status': 'processing'}, True) for idx in range(7)]
+
+    commit_count = core.batch_repo.set_batch_rows(db, 'batch-bulk', writes, max_ops=3)
+
+    assert commit_count == 3
+    assert [len(commit) for commit in db.commits] == [3, 3, 1]
+    assert db.commits[0][0] == ('/batch_jobs/batch-bulk/rows/row-0', {'status': 'processing'}, True)
+
+
+def test_set_batch_rows_splits_commits_by_payload_size():
+    db = _FakeBatchDb()
+    transcript = 'x' * 4000
+    writes = [(f'row-{idx}', {'transcript': transcript}, False) for idx in range(5)]
+
+    commit_count = core.batch_repo.set_batch_rows(db, 'batch-large', writes, max_bytes=9000)
+
+    assert commit_count == 3
+    assert [len(commit) for commit in db.commits] == [2, 2, 1]
+
+
+def test_stage_row_transitions_use_bulk_writes(monkeypatch):
+    _clear_batch_memory()
+    db = _FakeBatchDb()
+    single_writes = []
+    monkeypatch.setattr(core, 'db', db)
+    monkeypatch.setattr(core.batch_repo, 'set_batch_job', lambda *args, **kwargs: None)
+    monkeypatch.setattr(core.batch_repo, 'set_batch_row', lambda *args, **kwargs: single_writes.append(args))
+    monkeypatch.setattr(
+        batch_orchestrator,
+        '_run_batch_stage',
+        lambda batch_id, stage_name, requests, **kwargs: [{'response': {'text': 'ok'}}, {'error': 'quota'}],
+    )
+    rows = [
+        {'row_id': 'row-1', 'status': 'queued'},
+        {'row_id': 'row-2', 'status': 'queued'},
+        {'row_id': 'row-3', 'status': 'error', 'error': 'missing slides'},
+    ]
+
+    batch_orchestrator._run_stage_with_builder(
+        'batch-bulk',
+        rows,
+        'slide_extraction',
+        lambda row: None if row.get('status') == 'error' else {'contents': []},
+        lambda row, response: row.update({'slide_text': 'ok'}),
+        runtime=core,
+    )
+
+    assert single_writes == []
+    assert len(db.commits) == 2
+    before_stage, after_stage = db.commits
+    assert sorted(path.rsplit('/', 1)[-1] for path, _payload, _merge in before_stage) == ['row-1', 'row-2', 'row-3']
+    assert all(merge for _path, _payload, merge in before_stage)
+    after_by_row = {path.rsplit('/', 1)[-1]: payload for path, payload, _merge in after_stage}
+    assert after_by_row['row-1']['status'] == 'processing'
+    assert after_by_row['row-2']['status'] == 'error'
+    assert after_by_row['row-2']['failed_stage'] == 'slide_extraction'
+
+
+def test_row_uploads_run_concurrently_and_isolate_failures(monkeypatch):
+    _clear_batch_memory()
+    _patch_batch_refunds(monkeypatch)
+    monkeypatch.setattr(core, 'BATCH_UPLOAD_MAX_PARALLEL', 2)
+    started = threading.Barrier(2, timeout=5)
+    active = {'now': 0, 'peak': 0}
+    lock = threading.Lock()
+
+    def _fake_upload(row, runtime=None):
+        with lock:
+            active['now'] += 1
+            active['peak'] = max(active['peak'], active['now'])
+        try:
+            if row['row_id'] in {'row-1', 'row-2'}:
+                started.wait()
+            if row['row_id'] == 'row-2':
+                raise RuntimeError('provider upload rejected')
+            row['slides_file_uri'] = f"files/{row['row_id']}"
+        finally:
+            with lock:
+                active['now'] -= 1
+
+    monkeypatch.setattr(batch_orchestrator, '_upload_row_files', _fake_upload)
+    batch_id = batch_orchestrator.create_batch_job(
+        {'batch_id': 'batch-parallel-upload', 'uid': 'u-batch', 'mode': 'slides-only', 'status': 'processing', 'total_rows': 3},
+        [{'row_id': f'row-{idx}', 'ordinal': idx, 'status': 'processing'} for idx in (1, 2, 3)],
+        runtime=core,
+    )
+    rows = batch_orchestrator._list_rows(batch_id, runtime=core)
+
+    batch_orchestrator._upload_rows_concurrently(
+        batch_id,
+        rows,
+        batch_orchestrator._RowStateWriter(batch_id, core),
+        runtime=core,
+    )
+
+    assert active['peak'] == 2
+    stored = {row['row_id']: row for row in batch_orchestrator._list_rows(batch_id, runtime=core)}
+    assert stored['row-1']['current_stage'] == 'files_ready'
+    assert stored['row-3']['current_stage'] == 'files_ready'
+    assert stored['row-2']['status'] == 'error'
+    assert stored['row-2']['failed_stage'] == 'file_upload'
+    assert 'provider upload rejected' in stored['row-2']['error']
+
+
+def test_list_batches_reads_rows_only_for_stale_or_legacy_batches(monkeypatch):
+    _clear_batch_memory()
+    _patch_batch_refunds(monkeypatch)
+    monkeypatch.setattr(core.time, 'time', lambda: 100.0)
+    batch_orchestrator.create_batch_job(
+        {'batch_id': 'batch-fresh', 'uid': 'u-batch', 'mode': 'slides-only', 'status': 'processing', 'total_rows': 1},
+        [{'row_id': 'row-1', 'ordinal': 1, 'status': 'processing'}],
+        runtime=core,
+    )
+    batch_orchestrator.create_batch_job(
+        {'batch_id': 'batch-legacy', 'uid': 'u-batch', 'mode': 'slides-only', 'status': 'partial', 'total_rows': 2},
+        [
+            {'row_id': 'row-1', 'ordinal': 1, 'status': 'complete'},
+            {'row_id': 'row-2', 'ordinal': 2, 'status': 'error', 'error': 'slides unreadable'},
+        ],
+        runtime=core,
+    )
+    legacy = core._BATCH_JOBS_MEMORY['batch-legacy']
+    for field in ('active_rows', 'can_download_zip', 'last_row_error'):
+        legacy.pop(field, None)
+    original_list_rows = batch_orchestrator._list_rows
+    row_reads = []
+
+    def _counting_list_rows(batch_id, runtime=None):
+        row_reads.append(batch_id)
+        return original_list_rows(batch_id, runtime=runtime)
+
+    monkeypatch.setattr(batch_orchestrator, '_list_rows', _counting_list_rows)
+
+    first = {item['batch_id']: item for item in batch_orchestrator.list_batches_for_uid('u-batch', runtime=core)}
+    second = {item['batch_id']: item for item in batch_orchestrator.list_batches_for_uid('u-batch', runtime=core)}
+
+    assert row_reads == ['batch-legacy']
+    assert first['batch-fresh']['can_download_zip'] is False
+    assert first['batch-legacy']['can_download_zip'] is True
+    assert second['batch-legacy']['can_download_zip'] is True
+    assert core._BATCH_JOBS_MEMORY['batch-legacy']['last_row_error'] == 'slides unreadable'
+    assert second['batch-legacy']['error_message'] == first['batch-legacy']['error_message'] == 'slides unreadable'
@@ -142,6 +142,12 @@ def test_admin_status_helpers_expose_warning_and_runtime_metadata(app, monkeypat
     assert 'video_import_available' in runtime_checks
     assert 'ffmpeg_available' in runtime_checks
     assert 'yt_dlp_available' in runtime_checks
+    assert runtime_checks['physio_query_cache_misses'] >= 0
+    assert runtime_checks['physio_query_cache_shared'] is False
+    assert runtime_checks['runtime_job_snapshot_writes_saved'] >= 0
+    assert runtime_checks['provider_poll_files_in_flight'] >= 0
+    assert runtime_checks['job_queue_queued'] >= 0
+    assert runtime_checks['job_queue_wait_p95_ms'] >= 0
 
 
 def test_build_admin_deployment_info_marks_custom_domain_on_render(app, monkeypatch):
@@ -0,0 +1,62 @@
+import threading
+
+import pytest
+
+from lecture_processor.domains.ai import audio_segments
+
+
+def test_plan_segments_overlaps_and_folds_short_remainder():
+    segments = audio_segments.plan_segments(2000, 900, 10)
+
+    assert [(segment["start"], segment["end"]) for segment in segments] == [(0.0, 910.0), (900.0, 2000.0)]
+    assert segments[0]["keep_end"] == segments[1]["keep_start"] == 905.0
+    assert len(audio_segments.plan_segments(600, 900, 10)) == 1
+
+
+def test_stitch_transcript_segments_drops_overlap_duplicates_and_rebases_timestamps():
+    first, second = audio_segments.plan_segments(2000, 900, 10)
+    stitched_text, stitched = audio_segments.stitch_transcript_segments([
+        (first, "", [
+            {"start_ms": 1_000, "end_ms": 4_000, "text": "Welcome."},
+            {"start_ms": 901_000, "end_ms": 903_000, "text": "Boundary sentence."},
+        ]),
+        (second, "", [
+            {"start_ms": 1_000, "end_ms": 3_000, "text": "Boundary sentence."},
+            {"start_ms": 20_000, "end_ms": 25_000, "text": "Second half."},
+        ]),
+    ])
+
+    assert stitched_text == "Welcome.\nBoundary sentence.\nSecond half."
+    assert [item["start_ms"] for item in stitched] == [1_000, 901_000, 920_000]
+
+
+def test_stitch_timecoded_text_rebases_interview_lines():
+    first, second = audio_segments.plan_segments(4000, 1800, 10)[:2]
+    stitched = audio_segments.stitch_timecoded_text([
+        (first, "00:05 - Speaker A - Hello\n30:02 - Speaker B - Overlap"),
+        (second, "00:02 - Speaker B - Overlap\n00:40 - Speaker A - Later\ncontinued line"),
+    ])
+
+    assert stitched.splitlines() == [
+        "00:05 - Speaker A - Hello",
+        "30:02 - Speaker B - Overlap",
+        "30:40 - Speaker A - Later",
+        "continued line",
+    ]
+
+
+def test_run_segments_in_parallel_keeps_order_and_waits_before_raising():
+    finished = []
+    lock = threading.Lock()
+
+    def work(index, segment):
+        with lock:
+            finished.append(index)
+        if index == 1:
+            raise RuntimeError("segment failed")
+        return segment * 10
+
+    assert audio_segments.run_segments_in_parallel(lambda index, segment: segment * 10, [1, 2, 3], 3) == [10, 20, 30]
+    with pytest.raises(RuntimeError, match="segment failed"):
+        audio_segments.run_segments_in_parallel(work, [1, 2, 3], 3)
+    assert sorted(finished) == [0, 1, 2]
@@ -0,0 +1,91 @@
+import logging
+import os
+from types import SimpleNamespace
+
+from lecture_processor.domains.ai import result_cache
+
+
+class _Clock:
+    def __init__(self, now):
+        self.now = now
+
+    def time(self):
+        return self.now
+
+
+class _CacheRepo:
+    def __init__(self):
+        self.docs = {}
+
+    def get_doc(self, _db, _collection, key):
+        return SimpleNamespace(exists=key in self.docs, to_dict=lambda: dict(self.docs[key]))
+
+    def set_doc(self, _db, _collection, key, payload):
+        self.docs[key] = dict(payload)
+
+    def delete_doc(self, _db, _collection, key):
+        self.docs.pop(key, None)
+
+
+def _runtime(tmp_path, **overrides):
+    values = {
+        "AI_RESULT_CACHE_MODE": "local",
+        "AI_RESULT_CACHE_DIR": str(tmp_path / "cache"),
+        "AI_RESULT_CACHE_TTL_SECONDS": 3600,
+        "AI_RESULT_CACHE_MAX_ENTRIES": 2,
+        "AI_RESULT_CACHE_COLLECTION": "ai_result_cache",
+        "PROMPT_REGISTRY_VERSION": "2026-03-05",
+        "db": None,
+        "time": _Clock(1_000_000.0),
+        "logger": logging.getLogger("test-result-cache"),
+    }
+    values.update(overrides)
+    return SimpleNamespace(**values)
+
+
+def test_cache_key_covers_content_model_prompt_and_language(tmp_path):
+    runtime = _runtime(tmp_path)
+    deck = tmp_path / "deck.pdf"
+    copy = tmp_path / "copy.pdf"
+    deck.write_bytes(b"%PDF-1.4 deck")
+    copy.write_bytes(b"%PDF-1.4 deck")
+
+    def key(path=deck, **overrides):
+        kwargs = {"model": "m1", "prompt_id": "slide_extraction", "prompt_template": "Extract", "output_language": "English"}
+        kwargs.update(overrides)
+        return result_cache.build_cache_key(str(path), runtime=runtime, **kwargs)
+
+    assert key() == key(path=copy)
+    assert len({key(), key(model="m2"), key(prompt_template="Extract v2"), key(output_language="Dutch")}) == 4
+    before_bump = key()
+    runtime.PROMPT_REGISTRY_VERSION = "2026-04-01"
+    assert key() != before_bump
+    assert result_cache.build_cache_key(str(deck), model="m1", prompt_id="x", prompt_template="", runtime=_runtime(tmp_path, AI_RESULT_CACHE_MODE="off")) == ""
+
+
+def test_local_cache_expires_and_evicts_least_recently_used(tmp_path):
+    runtime = _runtime(tmp_path)
+    for key in ("a" * 64, "b" * 64):
+        assert result_cache.store_cached_result(key, {"slide_text": key[:1]}, runtime=runtime) is True
+        runtime.time.now += 10
+
+    assert result_cache.get_cached_result("a" * 64, runtime=runtime) == {"slide_text": "a"}
+    runtime.time.now += 10
+    result_cache.store_cached_result("c" * 64, {"slide_text": "c"}, runtime=runtime)
+
+    assert sorted(name[0] for name in os.listdir(runtime.AI_RESULT_CACHE_DIR)) == ["a", "c"]
+    runtime.time.now += 3601
+    assert result_cache.get_cached_result("c" * 64, runtime=runtime) is None
+
+
+def test_firestore_cache_stores_expiry_and_drops_expired_entries(tmp_path):
+    repo = _CacheRepo()
+    runtime = _runtime(tmp_path, AI_RESULT_CACHE_MODE="auto", db=object(), result_cache_repo=repo)
+
+    assert result_cache.store_cached_result("k" * 64, {"transcript": "hello"}, runtime=runtime) is True
+    assert repo.docs["k" * 64]["expires_at"] == runtime.time.now + 3600
+    assert result_cache.get_cached_result("k" * 64, runtime=runtime) == {"transcript": "hello"}
+
+    runtime.time.now += 3601
+    assert result_cache.get_cached_result("k" * 64, runtime=runtime) is None
+    assert repo.docs == {}
@@ -1,5 +1,64 @@
+import threading
+from types import SimpleNamespace
+
 from lecture_processor.domains.rate_limit import limiter
 from lecture_processor.runtime.container import get_runtime
+from lecture_processor.services import rate_limit_service
+
+
+class _CounterDb:
+    def __init__(self, *, fail=False):
+        self.docs = {}
+        self.transactions = 0
+        self.fail = fail
+
+    def collection(self, _name):
+        return self
+
+    def document(self, counter_id):
+        return _CounterRef(self.docs, counter_id)
+
+    def transaction(self):
+        if self.fail:
+            raise RuntimeError("firestore unavailable")
+        self.transactions += 1
+        return _CounterTransaction()
+
+
+class _CounterRef:
+    def __init__(self, docs, counter_id):
+        self.docs = docs
+        self.counter_id = counter_id
+
+    def get(self, transaction=None):
+        data = self.docs.get(self.counter_id)
+        return SimpleNamespace(exists=data is not None, to_dict=lambda: dict(data or {}))
+
+
+class _CounterTransaction:
+    @staticmethod
+    def set(ref, payload, merge=False):
+        ref.docs.setdefault(ref.counter_id, {}).update(payload)
+
+
+_TRANSACTIONAL_FIRESTORE = SimpleNamespace(transactional=lambda func: func)
+
+
+def _check(db, lease_state, now, *, limit=20, lease_percent=25, events=None):
+    return rate_limit_service.check_rate_limit(
+        "analytics:u1",
+        limit,
+        60,
+        firestore_enabled=True,
+        db=db,
+        firestore_module=_TRANSACTIONAL_FIRESTORE,
+        counter_collection="rate_limit_counters",
+        in_memory_events=rate_limit_service.SlidingWindowCounters() if events is None else events,
+        in_memory_lock=threading.Lock(),
+        time_module=SimpleNamespace(time=lambda: now),
+        lease_percent=lease_percent,
+        lease_state=lease_state,
+    )
 
 
 def test_rate_limit_uses_runtime_service_dependencies():
@@ -16,6 +75,8 @@ def test_rate_limit_uses_runtime_service_dependencies():
         RATE_LIMIT_FIRESTORE_ENABLED = True
         RATE_LIMIT_COUNTER_COLLECTION = "rate_limit_counters"
         RATE_LIMIT_EVENTS = {}
+        RATE_LIMIT_LEASES = {}
+        RATE_LIMIT_LEASE_PERCENT = 10
         RATE_LIMIT_LOCK = object()
         db = object()
         firestore = object()
@@ -35,6 +96,8 @@ def test_rate_limit_uses_runtime_service_dependencies():
     assert payload["limit"] == 10
     assert payload["window_seconds"] == 60
     assert captured["kwargs"]["counter_collection"] == "rate_limit_counters"
+    assert captured["kwargs"]["lease_percent"] == 10
+    assert captured["kwargs"]["lease_state"] is runtime.RATE_LIMIT_LEASES
     response = limiter.build_rate_limited_response("Too many", 12, runtime=runtime)
     assert response["error"] == "Too many"
     assert response["retry_after_seconds"] == 12
@@ -53,3 +116,63 @@ def test_rate_limit_uses_current_app_runtime(app, monkeypatch):
         assert response.status_code == 429
         assert response.get_json()["error"] == "limited"
         assert limiter.normalize_rate_limit_key_part("abc", fallback="dev") == "abc"
+
+
+def test_leased_rate_limit_serves_from_memory_and_never_exceeds_shared_limit():
+    db = _CounterDb()
+    worker_a = {}
+    worker_b = {}
+
+    results_a = [_check(db, worker_a, 120.0) for _ in range(12)]
+    results_b = [_check(db, worker_b, 125.0) for _ in range(6)]
+
+    assert rate_limit_service.lease_size_for_limit(20, 25) == 5
+    assert results_a == [(True, 0)] * 12
+    assert results_b == [(True, 0)] * 5 + [(False, 55)]
+    assert db.transactions == 5
+    assert [doc["count"] for doc in db.docs.values()] == [20]
+    assert worker_a[("analytics:u1", 60)]["remaining"] == 3
+
+
+def test_leased_rate_limit_drops_lease_at_window_end_and_supports_unleased_mode():
+    db = _CounterDb()
+    lease_state = {}
+
+    assert _check(db, lease_state, 119.0) == (True, 0)
+    assert _check(db, lease_state, 121.0) == (True, 0)
+    assert lease_state[("analytics:u1", 60)]["window_start"] == 120
+    assert db.transactions == 2
+    assert sorted(doc["count"] for doc in db.docs.values()) == [5, 5]
+
+    unleased_db = _CounterDb()
+    for _ in range(3):
+        assert _check(unleased_db, {}, 130.0, lease_percent=0) == (True, 0)
+    assert unleased_db.transactions == 3
+
+
+def test_leased_rate_limit_falls_back_to_in_memory_window_when_firestore_fails():
+    events = rate_limit_service.SlidingWindowCounters()
+    db = _CounterDb(fail=True)
+
+    results = [_check(db, {}, 200.0, limit=2, lease_percent=50, events=events) for _ in range(3)]
+
+    assert results == [(True, 0), (True, 0), (False, 70)]
+    assert "analytics:u1" in events
+
+
+def test_sliding_window_counters_weight_previous_window_and_sweep_idle_keys():
+    counters = rate_limit_service.SlidingWindowCounters(sweep_interval_seconds=30)
+
+    assert [counters.hit("upload:u1", 3, 60, now) for now in (10.0, 20.0, 30.0)] == [(True, 0)] * 3
+    assert counters.hit("upload:u1", 3, 60, 40.0) == (False, 40)
+    assert counters.hit("upload:u1", 3, 60, 80.0) == (True, 0)
+    assert counters.hit("upload:u1", 3, 60, 81.0) == (False, 19)
+    assert counters.hit("upload:u1", 3, 60, 100.0) == (True, 0)
+    assert counters.hit("upload:u2", 3, 600, 110.0) == (True, 0)
+
+    assert counters.hit("upload:u3", 3, 60, 240.0) == (True, 0)
+    assert "upload:u1" not in counters
+    assert "upload:u2" in counters
+    assert len(counters) == 2
+    assert counters.sweep(1500.0) == 2
+    assert len(counters) == 0
@@ -3,6 +3,7 @@ from types import SimpleNamespace
 from lecture_processor.domains.runtime_jobs import recovery
 from lecture_processor.domains.runtime_jobs import store
 from lecture_processor.runtime.container import get_runtime
+from lecture_processor.services import job_state_service
 
 
 def test_runtime_job_store_roundtrip_in_memory(app):
@@ -44,6 +45,78 @@ def test_runtime_job_snapshot_persist_uses_repo(app, monkeypatch):
     assert "ignored" not in captured["payload"]
 
 
+def test_snapshot_write_behind_coalesces_changed_fields():
+    clock = SimpleNamespace(now=100.0)
+    snapshots = job_state_service.SnapshotWriteBehind(2.0, clock=lambda: clock.now)
+    transcript = "word " * 2000
+
+    fields, delay = snapshots.stage("job-a", {"status": "processing", "step_description": "Uploading", "transcript": transcript})
+    assert set(fields) == {"status", "step_description", "transcript"}
+    assert delay is None
+
+    clock.now = 100.5
+    fields, delay = snapshots.stage("job-a", {"status": "processing", "step_description": "Transcribing", "transcript": transcript})
+    assert fields == {}
+    assert delay == 1.5
+
+    clock.now = 101.0
+    fields, delay = snapshots.stage("job-a", {"status": "processing", "step_description": "Still transcribing", "transcript": transcript})
+    assert (fields, delay) == ({}, None)
+
+    clock.now = 102.0
+    assert snapshots.take("job-a") == {"step_description": "Still transcribing"}
+    assert snapshots.take("job-a") == {}
+
+    clock.now = 102.1
+    fields, delay = snapshots.stage("job-a", {"status": "complete", "step_description": "Complete!", "transcript": transcript})
+    assert fields == {"status": "complete", "step_description": "Complete!"}
+    assert delay is None
+
+    stats = snapshots.stats("job-a")
+    assert stats["updates"] == 4
+    assert stats["writes"] == 3
+    assert stats["writes_saved"] == 1
+    assert stats["bytes_saved"] >= 3 * len(transcript)
+    assert snapshots.stats()["writes"] == 3
+
+
+def test_runtime_job_updates_write_only_changed_fields(app, monkeypatch):
+    runtime = get_runtime(app)
+    clock = SimpleNamespace(now=50.0)
+    monkeypatch.setattr(runtime, "db", object())
+    monkeypatch.setattr(runtime, "RUNTIME_JOB_PERSISTED_FIELDS", ("status", "step_description", "transcript"))
+    monkeypatch.setattr(runtime, "RUNTIME_JOB_SNAPSHOTS", job_state_service.SnapshotWriteBehind(5.0, clock=lambda: clock.now))
+    writes = []
+    scheduled = []
+    monkeypatch.setattr(
+        runtime.runtime_jobs_repo,
+        "set_doc",
+        lambda _db, _collection, job_id, payload, merge=True: writes.append((job_id, dict(payload), merge)),
+    )
+    monkeypatch.setattr(store, "_schedule_runtime_job_flush", lambda job_id, delay, _runtime: scheduled.append((job_id, delay)))
+
+    store.set_job("job-w", {"status": "processing", "step_description": "Starting...", "transcript": "long transcript"}, runtime=runtime)
+    clock.now = 51.0
+    store.update_job_fields("job-w", runtime=runtime, step_description="Generating transcript...")
+    assert len(writes) == 1
+    assert scheduled == [("job-w", 4.0)]
+
+    store.flush_runtime_job_snapshot("job-w", runtime=runtime)
+    clock.now = 52.0
+    store.update_job_fields("job-w", runtime=runtime, status="complete")
+
+    assert [set(payload) - {"job_id", "updated_at"} for _job_id, payload, _merge in writes] == [
+        {"status", "step_description", "transcript"},
+        {"step_description"},
+        {"status"},
+    ]
+    assert all(merge is True for _job_id, _payload, merge in writes)
+    assert runtime.RUNTIME_JOB_SNAPSHOTS.stats("job-w")["writes_saved"] == 0
+
+    store.delete_job("job-w", runtime=runtime)
+    assert runtime.RUNTIME_JOB_SNAPSHOTS.stats("job-w")["updates"] == 0
+
+
 def test_run_startup_recovery_once_honors_disabled_flag():
     class _Lock:
         def __enter__(self):
@@ -93,6 +93,70 @@ def test_progress_helpers_count_viewed_cards_as_familiar_and_due():
     assert summary['due_today'] == 1
 
 
+_DELETE_FIELD = object()
+
+
+def _merge_set(target, payload):
+    """Apply ``payload`` like a Firestore ``set(..., merge=True)``: maps deep-merge, lists replace."""
+    merged = dict(target or {})
+    for key, value in payload.items():
+        if value is _DELETE_FIELD:
+            merged.pop(key, None)
+        elif isinstance(value, dict) and isinstance(merged.get(key), dict):
+            merged[key] = _merge_set(merged[key], value)
+        else:
+            merged[key] = value
+    return merged
+
+
+def test_due_histogram_matches_card_state_scan_and_updates_only_touched_packs():
+    runtime = SimpleNamespace(firestore=SimpleNamespace(DELETE_FIELD=_DELETE_FIELD))
+    state = progress.sanitize_card_state_map(
+        {
+            'fc_1': {'seen': 1, 'next_review_date': '2026-01-01'},
+            'fc_2': {'seen': 2, 'next_review_date': '2026-01-05'},
+            'fc_3': {'flip_count': 1},
+            'fc_4': {},
+            'q_1': {'seen': 1, 'next_review_date': '2026-01-01'},
+        },
+        runtime=runtime,
+    )
+
+    entry = progress.build_due_histogram_entry('pack-1', state, runtime=runtime)
+    stored = progress.encode_due_histogram(
+        [
+            {'pack_id': 'pack-1', 'undated': 0, 'dates': {'2025-12-01': 9}},
+            {'pack_id': 'pack-2', 'undated': 0, 'dates': {'2025-12-30': 4}},
+            {'pack_id': 'pack-3', 'undated': 1, 'dates': {}},
+        ],
+        runtime=runtime,
+    )
+    stored = _merge_set(stored, progress.due_histogram_updates([entry], ['pack-3'], runtime=runtime))
+    histogram = progress.sanitize_due_histogram(stored, runtime=runtime)
+
+    assert entry == {'pack_id': 'pack-1', 'undated': 1, 'dates': {'2026-01-01': 1, '2026-01-05': 1}}
+    # The stale 2025-12-01 date of pack-1 is replaced, not merged back in.
+    assert histogram == [entry, {'pack_id': 'pack-2', 'undated': 0, 'dates': {'2025-12-30': 4}}]
+    assert progress.count_due_cards_in_histogram(progress.encode_due_histogram([entry]), '2026-01-02', runtime=runtime) == progress.count_due_cards_in_state(state, '2026-01-02', runtime=runtime) == 2
+    assert progress.count_due_cards_in_histogram(stored, '2026-01-05', runtime=runtime) == 7
+    emptied = _merge_set(stored, progress.due_histogram_updates([{'pack_id': 'pack-2', 'undated': 0, 'dates': {}}], runtime=runtime))
+    assert sorted(emptied) == ['pack-1']
+    assert progress.sanitize_due_histogram(None, runtime=runtime) is None
+    assert progress.sanitize_due_histogram([], runtime=runtime) is None
+    raw_state = {'fc_1': {'seen': 1, 'next_review_date': '2025-7-4'}}
+    raw_histogram = progress.encode_due_histogram([progress.build_due_histogram_entry('pack-4', raw_state, runtime=runtime)], runtime=runtime)
+    assert progress.count_due_cards_in_histogram(raw_histogram, '2026-01-02', runtime=runtime) == progress.count_due_cards_in_state(raw_state, '2026-01-02', runtime=runtime) == 1
+
+    summary = progress.compute_study_progress_summary(
+        {'timezone': 'UTC', 'due_histogram': stored},
+        None,
+        base_now=datetime(2026, 1, 2, 12, 0, tzinfo=timezone.utc),
+        runtime=runtime,
+    )
+
+    assert summary['due_today'] == 6
+
+
 def test_audio_storage_round_trip_and_persist(tmp_path):
     root = tmp_path / 'uploads' / 'study_audio'
     runtime = SimpleNamespace(
@@ -0,0 +1,191 @@
+from dataclasses import dataclass
+from types import SimpleNamespace
+
+import pytest
+
+from lecture_processor.domains.runtime_jobs import recovery
+from lecture_processor.domains.runtime_jobs import store
+from lecture_processor.runtime import durable_queue, job_worker
+from lecture_processor.runtime.container import get_runtime
+from lecture_processor.runtime.job_dispatcher import JobQueueFullError, ScheduledJob
+
+
+@dataclass(frozen=True)
+class _StagedInput:
+    paths: tuple
+    size_mb: float
+
+
+def _finish_job(job_id, staged, runtime=None):
+    store.update_job_fields(job_id, runtime=runtime, status="complete", step=1, step_description=f"{len(staged.paths)} files")
+
+
+class _SnapshotRepo:
+    def __init__(self):
+        self.docs = {}
+
+    def set_doc(self, _db, _collection, job_id, payload, merge=True):
+        target = self.docs.setdefault(job_id, {}) if merge else {}
+        target.update(payload)
+        self.docs[job_id] = target
+
+    def get_doc(self, _db, _collection, job_id):
+        return SimpleNamespace(exists=job_id in self.docs, to_dict=lambda: dict(self.docs[job_id]))
+
+    def delete_doc(self, _db, _collection, job_id):
+        self.docs.pop(job_id, None)
+
+    def query_statuses(self, _db, _collection, statuses, limit=100):
+        return [
+            SimpleNamespace(id=job_id, to_dict=lambda payload=payload: dict(payload))
+            for job_id, payload in self.docs.items()
+            if payload.get("status") in statuses
+        ][:limit]
+
+
+def test_durable_queue_orders_by_priority_and_retries_expired_leases(tmp_path):
+    now = [1000.0]
+    queue = durable_queue.DurableJobQueue(tmp_path / "jobs.sqlite3", max_pending=3, max_attempts=2, clock=lambda: now[0])
+    queue.enqueue("lecture", "mod:fn", "{}", job_class="lecture-notes", owner="u1")
+    queue.enqueue("tools", "mod:fn", "{}", job_class="tools_extract", owner="u2", priority=2)
+    queue.enqueue("lecture-2", "mod:fn", "{}", job_class="lecture-notes", owner="u1")
+
+    with pytest.raises(OverflowError):
+        queue.enqueue("overflow", "mod:fn", "{}")
+
+    first = queue.lease("worker-a", 60)
+    assert first["job_key"] == "tools"
+    second = queue.lease("worker-a", 60)
+    assert second["job_key"] == "lecture"
+    queue.complete(first["id"])
+    assert queue.is_pending("lecture") is True
+
+    now[0] += 61.0
+    retried = queue.lease("worker-b", 60)
+    assert retried["job_key"] == "lecture"
+    assert retried["attempts"] == 2
+    assert queue.heartbeat(retried["id"], "worker-a", 60) is False
+
+    now[0] += 61.0
+    assert queue.lease("worker-b", 60)["job_key"] == "lecture-2"
+    assert queue.is_pending("lecture") is False
+    assert [row["job_key"] for row in queue.expired_failures(0)] == ["lecture"]
+    assert queue.stats()["done"] == 1
+
+
+def test_job_call_codec_rebinds_runtime_and_rejects_local_functions():
+    runtime = object()
+    staged = _StagedInput(paths=("a.pdf", "b.pdf"), size_mb=1.5)
+    target, payload = durable_queue.encode_job_call(
+        _finish_job,
+        ("job-1", staged),
+        {"runtime": runtime},
+        is_runtime=lambda value: value is runtime,
+    )
+
+    worker_runtime = object()
+    fn, args, kwargs = durable_queue.decode_job_call(target, payload, worker_runtime)
+    assert fn is _finish_job
+    assert args == ["job-1", staged]
+    assert kwargs == {"runtime": worker_runtime}
+
+    with pytest.raises(durable_queue.JobCallEncodingError):
+        durable_queue.encode_job_call(lambda: None, (), {})
+
+
+def test_web_hands_job_to_worker_through_snapshot_documents(app, monkeypatch, tmp_path):
+    runtime = get_runtime(app)
+    repo = _SnapshotRepo()
+    monkeypatch.setattr(runtime, "db", object())
+    monkeypatch.setattr(runtime, "runtime_jobs_repo", repo)
+    monkeypatch.setattr(runtime, "RUNTIME_JOBS_REMOTE", True)
+    queue = durable_queue.DurableJobQueue(tmp_path / "jobs.sqlite3", max_pending=1)
+    monkeypatch.setattr(runtime, "DURABLE_JOB_QUEUE", queue)
+    with runtime.JOBS_LOCK:
+        runtime.jobs.clear()
+
+    store.set_job("job-q", {"status": "starting", "step": 0, "step_description": "Starting...", "user_id": "u1"}, runtime=runtime)
+    row_id = job_worker.submit_durable_job(
+        queue,
+        ScheduledJob(_finish_job, job_class="slides-only", owner="u1", job_id="job-q"),
+        ("job-q", _StagedInput(paths=("a.pdf",), size_mb=0.5)),
+        {"runtime": runtime},
+        runtime=runtime,
+    )
+
+    assert row_id is not None
+    assert "job-q" not in runtime.jobs
+    assert repo.docs["job-q"]["status"] == "starting"
+    assert store.get_job_snapshot("job-q", runtime=runtime)["status"] == "starting"
+    assert "job-q" not in runtime.jobs
+    assert recovery.recover_stale_runtime_jobs(runtime=runtime) == 0
+    with pytest.raises(JobQueueFullError):
+        job_worker.submit_durable_job(queue, ScheduledJob(_finish_job), ("other", None), {}, runtime=runtime)
+    assert job_worker.submit_durable_job(queue, lambda: None, (), {}, runtime=runtime) is None
+
+    monkeypatch.setattr(runtime, "RUNTIME_JOBS_REMOTE", False)
+    worker = job_worker.DurableJobWorker(queue, runtime, lease_seconds=30)
+    assert worker.run_once() is True
+    assert worker.run_once() is False
+
+    assert repo.docs["job-q"]["status"] == "complete"
+    assert repo.docs["job-q"]["step_description"] == "1 files"
+    assert queue.stats()["done"] == 1
+    with runtime.JOBS_LOCK:
+        runtime.jobs.clear()
+
+
+def test_worker_skips_leased_job_that_already_finished(app, monkeypatch, tmp_path):
+    runtime = get_runtime(app)
+    repo = _SnapshotRepo()
+    monkeypatch.setattr(runtime, "db", object())
+    monkeypatch.setattr(runtime, "runtime_jobs_repo", repo)
+    monkeypatch.setattr(runtime, "RUNTIME_JOBS_REMOTE", False)
+    queue = durable_queue.DurableJobQueue(tmp_path / "jobs.sqlite3")
+    calls = []
+    monkeypatch.setattr(durable_queue, "decode_job_call", lambda *_args: (lambda: calls.append("ran"), [], {}))
+    with runtime.JOBS_LOCK:
+        runtime.jobs.clear()
+    repo.docs["job-done"] = {"status": "complete", "step": 2, "user_id": "u1"}
+    queue.enqueue("job-done", "mod:fn", "{}")
+
+    worker = job_worker.DurableJobWorker(queue, runtime, lease_seconds=30)
+    assert worker.run_once() is True
+
+    assert calls == []
+    assert queue.stats()["done"] == 1
+    with runtime.JOBS_LOCK:
+        runtime.jobs.clear()
+
+
+def test_abandoned_job_refund_skips_credits_already_on_the_receipt(app, monkeypatch):
+    runtime = get_runtime(app)
+    repo = _SnapshotRepo()
+    refunds = []
+    monkeypatch.setattr(runtime, "db", object())
+    monkeypatch.setattr(runtime, "runtime_jobs_repo", repo)
+    monkeypatch.setattr(runtime, "RUNTIME_JOBS_REMOTE", True)
+    monkeypatch.setattr(recovery.billing_credits, "refund_credit", lambda uid, credit_type, runtime=None: refunds.append((credit_type, 1)))
+    monkeypatch.setattr(
+        recovery.billing_credits,
+        "refund_slides_credits",
+        lambda uid, amount, runtime=None: refunds.append(("slides_credits", amount)),
+    )
+    monkeypatch.setattr(runtime, "save_job_log", lambda *_args, **_kwargs: None)
+    receipt = runtime.initialize_billing_receipt({"interview_credits_short": 1, "slides_credits": 2})
+    receipt["refunded"] = {"interview_credits_short": 1, "slides_credits": 1}
+    repo.docs["job-dead"] = {
+        "status": "processing",
+        "user_id": "u1",
+        "credit_deducted": "interview_credits_short",
+        "credit_refunded": False,
+        "interview_features_cost": 2,
+        "extra_slides_refunded": 0,
+        "billing_receipt": receipt,
+    }
+
+    assert recovery.fail_interrupted_runtime_job("job-dead", message="Interrupted", runtime=runtime) is True
+
+    assert refunds == [("slides_credits", 1)]
+    assert repo.docs["job-dead"]["status"] == "error"
+    assert repo.docs["job-dead"]["billing_receipt"]["refunded"] == {"interview_credits_short": 1, "slides_credits": 2}
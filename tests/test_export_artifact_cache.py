@@ -0,0 +1,61 @@
+import logging
+import os
+from types import SimpleNamespace
+
+from lecture_processor.services import export_artifact_cache
+
+
+def _app_ctx(tmp_path, now_holder, max_entries=10, ttl_seconds=100):
+    return SimpleNamespace(
+        BATCH_ARTIFACT_CACHE_DIR=str(tmp_path / 'artifacts'),
+        BATCH_ARTIFACT_CACHE_MAX_ENTRIES=max_entries,
+        BATCH_ARTIFACT_CACHE_TTL_SECONDS=ttl_seconds,
+        time=SimpleNamespace(time=lambda: now_holder['value']),
+        logger=logging.getLogger('test-export-artifacts'),
+    )
+
+
+def test_artifact_key_is_content_addressed():
+    key = export_artifact_cache.artifact_key('docx', {'title': 'Transcript', 'content': 'hello'})
+
+    assert key == export_artifact_cache.artifact_key('docx', {'content': 'hello', 'title': 'Transcript'})
+    assert key != export_artifact_cache.artifact_key('docx', {'title': 'Transcript', 'content': 'hello!'})
+    assert key != export_artifact_cache.artifact_key('csv:flashcards', {'title': 'Transcript', 'content': 'hello'})
+
+
+def test_get_or_render_reuses_bytes_until_ttl_expires(tmp_path):
+    now_holder = {'value': 1000.0}
+    app_ctx = _app_ctx(tmp_path, now_holder)
+    renders = []
+
+    def _render():
+        renders.append(1)
+        return b'docx-bytes'
+
+    assert export_artifact_cache.get_or_render(app_ctx, 'docx', {'content': 'a'}, _render) == b'docx-bytes'
+    assert export_artifact_cache.get_or_render(app_ctx, 'docx', {'content': 'a'}, _render) == b'docx-bytes'
+    assert len(renders) == 1
+
+    now_holder['value'] += 101
+    export_artifact_cache.get_or_render(app_ctx, 'docx', {'content': 'a'}, _render)
+    assert len(renders) == 2
+
+
+def test_prune_drops_least_recently_used_entries(tmp_path):
+    now_holder = {'value': 1000.0}
+    app_ctx = _app_ctx(tmp_path, now_holder, max_entries=2, ttl_seconds=10_000)
+    keys = []
+    for index in range(3):
+        now_holder['value'] += 1
+        key = export_artifact_cache.artifact_key('csv:flashcards', [index])
+        export_artifact_cache.store_artifact(app_ctx, key, f'row-{index}'.encode('utf-8'), prune=False)
+        keys.append(key)
+    now_holder['value'] += 1
+    assert export_artifact_cache.get_artifact(app_ctx, keys[0]) == b'row-0'
+
+    removed = export_artifact_cache.prune_artifacts(app_ctx)
+
+    assert removed == 1
+    assert len(os.listdir(app_ctx.BATCH_ARTIFACT_CACHE_DIR)) == 2
+    assert export_artifact_cache.get_artifact(app_ctx, keys[1]) is None
+    assert export_artifact_cache.get_artifact(app_ctx, keys[0]) == b'row-0'
@@ -246,3 +246,80 @@ def test_convert_audio_to_mp3_with_ytdlp_falls_back_to_ytdlp_when_ffmpeg_fails(t
     assert len(commands) == 2
     assert commands[0][0] == "/usr/bin/ffmpeg"
     assert commands[1][0] == "/usr/bin/yt-dlp"
+
+
+def test_preprocess_audio_for_transcription_encodes_mono_speech_mp3(tmp_path):
+    source_path = Path(tmp_path) / "lecture.m4a"
+    source_path.write_bytes(b"\x00\x00\x00\x18ftypM4A ")
+    commands = []
+
+    class _FakeSubprocess:
+        def run(self, cmd, **_kwargs):
+            commands.append(list(cmd))
+            Path(cmd[-1]).write_bytes(b"ID3\x03\x00\x00\x00")
+            return SimpleNamespace(returncode=0, stdout="", stderr="")
+
+    output_path, converted = file_service.preprocess_audio_for_transcription(
+        str(source_path),
+        ffmpeg_binary_getter=lambda: "/usr/bin/ffmpeg",
+        logger=None,
+        subprocess_module=_FakeSubprocess(),
+        bitrate_kbps=32,
+        trim_silence=True,
+    )
+
+    assert converted is True
+    assert output_path.endswith("_speech.mp3")
+    command = commands[0]
+    assert command[command.index("-ac") + 1] == "1"
+    assert command[command.index("-b:a") + 1] == "32k"
+    assert command[command.index("-af") + 1].startswith("silenceremove=")
+
+
+def test_split_audio_segments_removes_partial_cuts_when_one_fails(tmp_path):
+    source_path = Path(tmp_path) / "lecture_speech.mp3"
+    source_path.write_bytes(b"ID3\x03\x00\x00\x00")
+
+    class _FakeSubprocess:
+        def __init__(self):
+            self.calls = 0
+
+        def run(self, cmd, **_kwargs):
+            self.calls += 1
+            if self.calls == 2:
+                return SimpleNamespace(returncode=1, stdout="", stderr="cut failed")
+            Path(cmd[-1]).write_bytes(b"ID3\x03\x00\x00\x00")
+            return SimpleNamespace(returncode=0, stdout="", stderr="")
+
+    windows = [(0.0, 910.0), (900.0, 1810.0), (1800.0, 2400.0)]
+    fake = _FakeSubprocess()
+    segment_paths = file_service.split_audio_segments(
+        str(source_path),
+        windows,
+        ffmpeg_binary_getter=lambda: "/usr/bin/ffmpeg",
+        logger=None,
+        subprocess_module=fake,
+    )
+
+    assert segment_paths == []
+    assert fake.calls == 2
+    assert sorted(path.name for path in Path(tmp_path).iterdir()) == ["lecture_speech.mp3"]
+
+
+def test_probe_audio_duration_seconds_parses_ffmpeg_banner_without_ffprobe(tmp_path):
+    source_path = Path(tmp_path) / "lecture.mp3"
+    source_path.write_bytes(b"ID3\x03\x00\x00\x00")
+
+    class _FakeSubprocess:
+        def run(self, cmd, **_kwargs):
+            assert cmd[0] == "/usr/bin/ffmpeg"
+            return SimpleNamespace(returncode=1, stdout="", stderr="  Duration: 01:02:03.50, start: 0.000000, bitrate: 48 kb/s")
+
+    duration = file_service.probe_audio_duration_seconds(
+        str(source_path),
+        ffmpeg_binary_getter=lambda: "/usr/bin/ffmpeg",
+        ffprobe_binary_getter=lambda: "",
+        subprocess_module=_FakeSubprocess(),
+    )
+
+    assert duration == pytest.approx(3723.5)
@@ -1,5 +1,7 @@
+import hashlib
 import io
 import json
+import threading
 import zipfile
 from datetime import datetime, timezone
 from pathlib import Path
@@ -24,6 +26,7 @@ from lecture_processor.domains.rate_limit import quotas as rate_limit_quotas
 from lecture_processor.domains.study import audio as study_audio
 from lecture_processor.domains.study import export as study_export
 from lecture_processor.domains.upload import import_audio as upload_import_audio
+from lecture_processor.services import study_progress_service
 from lecture_processor.services import upload_api_service
 
 pytestmark = pytest.mark.usefixtures("disable_sentry")
@@ -441,6 +444,94 @@ def test_import_audio_url_success_returns_token(client, monkeypatch, tmp_path):
     assert body["file_name"] == "lecture.mp3"
 
 
+def _patch_chunked_upload_guards(client, monkeypatch, uid, tmp_path, reserved, released):
+    core.UPLOAD_SESSIONS.clear()
+    # chunked_upload reads the folder from the app runtime, which may already pin its own copy.
+    monkeypatch.setattr(core, "UPLOAD_FOLDER", str(tmp_path))
+    monkeypatch.setattr(get_runtime(client.application), "UPLOAD_FOLDER", str(tmp_path), raising=False)
+    monkeypatch.setattr(core, "UPLOAD_CHUNK_MAX_BYTES", 8)
+    monkeypatch.setattr(core, "verify_firebase_token", lambda _request: {"uid": uid, "email": "user@gmail.com"})
+    monkeypatch.setattr(core, "is_email_allowed", lambda _email: True)
+    monkeypatch.setattr(rate_limiter, "check_rate_limit", lambda **_kwargs: (True, 0))
+    monkeypatch.setattr(rate_limit_quotas, "has_sufficient_upload_disk_space", lambda _bytes=0, runtime=None: (True, 99999999, 100))
+    monkeypatch.setattr(rate_limit_quotas, "reserve_daily_upload_bytes", lambda uid, requested, runtime=None: reserved.append((uid, requested)) or (True, 0))
+    monkeypatch.setattr(rate_limit_quotas, "release_daily_upload_bytes", lambda uid, requested, runtime=None: released.append((uid, requested)) or True)
+
+
+def test_chunked_upload_resumes_from_offset_and_returns_import_token(client, monkeypatch, tmp_path):
+    reserved, released = [], []
+    _patch_chunked_upload_guards(client, monkeypatch, "chunk-u1", tmp_path, reserved, released)
+    core.AUDIO_IMPORT_TOKENS.clear()
+    audio_bytes = b"ID3\x03\x00\x00\x00" + bytes(range(13))
+
+    created = client.post(
+        "/api/uploads",
+        json={"file_name": "lecture.mp3", "mime_type": "audio/mpeg", "total_bytes": len(audio_bytes)},
+    )
+    assert created.status_code == 201
+    upload_id = created.get_json()["upload_id"]
+    assert reserved == [("chunk-u1", len(audio_bytes))]
+
+    offset = 0
+    while offset < len(audio_bytes):
+        chunk = audio_bytes[offset:offset + 8]
+        response = client.patch(f"/api/uploads/{upload_id}?offset={offset}", data=chunk)
+        assert response.status_code == 200
+        offset = response.get_json()["offset"]
+        if offset == 8:
+            stale = client.patch(f"/api/uploads/{upload_id}?offset=0", data=chunk)
+            assert stale.status_code == 409
+            assert stale.get_json()["offset"] == 8
+            assert client.get(f"/api/uploads/{upload_id}").get_json()["offset"] == 8
+
+    mismatch = client.post(f"/api/uploads/{upload_id}/complete", json={"sha256": "0" * 64})
+    assert mismatch.status_code == 400
+    assert released == [("chunk-u1", len(audio_bytes))]
+    assert list(tmp_path.iterdir()) == []
+
+    created = client.post(
+        "/api/uploads",
+        json={"file_name": "lecture.mp3", "mime_type": "audio/mpeg", "total_bytes": len(audio_bytes)},
+    )
+    upload_id = created.get_json()["upload_id"]
+    for offset in range(0, len(audio_bytes), 8):
+        assert client.patch(f"/api/uploads/{upload_id}?offset={offset}", data=audio_bytes[offset:offset + 8]).status_code == 200
+    completed = client.post(
+        f"/api/uploads/{upload_id}/complete",
+        json={"sha256": hashlib.sha256(audio_bytes).hexdigest()},
+    )
+    assert completed.status_code == 200
+    token = completed.get_json()["audio_import_token"]
+    path, error = upload_import_audio.get_audio_import_token_path("chunk-u1", token)
+    assert error == ""
+    assert Path(path).read_bytes() == audio_bytes
+    assert Path(path).parent == tmp_path
+    assert not path.endswith(".part")
+    assert core.UPLOAD_SESSIONS == {}
+
+
+def test_chunked_upload_rejects_non_audio_first_chunk(client, monkeypatch, tmp_path):
+    reserved, released = [], []
+    _patch_chunked_upload_guards(client, monkeypatch, "chunk-u2", tmp_path, reserved, released)
+    monkeypatch.setattr(core, "file_looks_like_audio", lambda _path: False)
+
+    created = client.post(
+        "/api/uploads",
+        json={"file_name": "lecture.mp3", "mime_type": "audio/mpeg", "total_bytes": 8},
+    )
+    upload_id = created.get_json()["upload_id"]
+    oversized = client.patch(f"/api/uploads/{upload_id}?offset=0", data=b"x" * 9)
+    assert oversized.status_code == 413
+    assert oversized.get_json()["offset"] == 0
+
+    response = client.patch(f"/api/uploads/{upload_id}?offset=0", data=b"%PDF-1.4")
+    assert response.status_code == 400
+    assert response.get_json()["error"] == "Uploaded audio file is invalid or unsupported."
+    assert released == [("chunk-u2", 8)]
+    assert client.get(f"/api/uploads/{upload_id}").status_code == 404
+    assert list(tmp_path.iterdir()) == []
+
+
 def test_tools_lecture_download_returns_zip_for_both_formats(client, monkeypatch, tmp_path):
     video_path = tmp_path / "lecture.mp4"
     audio_path = tmp_path / "lecture.mp3"
@@ -1850,6 +1941,210 @@ def test_update_study_progress_merges_cross_browser_card_states(client, monkeypa
     assert saved_cards["fc_2"]["seen"] == 1
 
 
+class _VersionedSnapshot:
+    def __init__(self, payload=None, exists=False, update_time=None):
+        self._payload = payload or {}
+        self.exists = exists
+        self.update_time = update_time
+
+    def to_dict(self):
+        return dict(self._payload)
+
+
+def _firestore_merge(target, payload):
+    merged = dict(target or {})
+    for field, value in payload.items():
+        if value is core.firestore.DELETE_FIELD:
+            merged.pop(field, None)
+        elif isinstance(value, dict) and isinstance(merged.get(field), dict):
+            merged[field] = _firestore_merge(merged[field], value)
+        else:
+            merged[field] = value
+    return merged
+
+
+class _VersionedDocRef:
+    """Fake doc ref whose snapshots carry an update_time bumped on every write; merges like Firestore."""
+
+    versions = {}
+
+    def __init__(self, store, key):
+        self.store = store
+        self.key = key
+
+    def get(self, transaction=None):
+        _ = transaction
+        payload = self.store.get(self.key)
+        return _VersionedSnapshot(payload, exists=payload is not None, update_time=self.versions.get(self.key))
+
+    def set(self, payload, merge=False):
+        self.store[self.key] = _firestore_merge(self.store.get(self.key) if merge else {}, payload or {})
+        self.versions[self.key] = self.versions.get(self.key, 0) + 1
+
+    def delete(self):
+        self.store.pop(self.key, None)
+        self.versions[self.key] = self.versions.get(self.key, 0) + 1
+
+
+class _TransactionalDb:
+    class _Transaction:
+        def __init__(self):
+            self.pending = []
+
+        def set(self, ref, payload, merge=False):
+            self.pending.append((ref, payload, merge))
+
+    def transaction(self):
+        return self._Transaction()
+
+    @staticmethod
+    def transactional(fn):
+        def _wrapped(transaction, *args, **kwargs):
+            result = fn(transaction, *args, **kwargs)
+            for ref, payload, merge in transaction.pending:
+                ref.set(payload, merge=merge)
+            return result
+        return _wrapped
+
+
+def _use_transactional_db(runtime, monkeypatch):
+    # Startup recovery would otherwise query the fake db on the first request.
+    monkeypatch.setattr(core, "run_startup_recovery_once", lambda: None)
+    monkeypatch.setattr("lecture_processor.runtime.hooks.batch_orchestrator.run_startup_batch_recovery_once", lambda runtime=None: None)
+    monkeypatch.setattr(runtime, "db", _TransactionalDb(), raising=False)
+    monkeypatch.setattr(runtime.firestore, "transactional", _TransactionalDb.transactional, raising=False)
+
+
+def test_study_progress_summary_backfills_and_reads_due_histogram(client, monkeypatch):
+    monkeypatch.setattr(_VersionedDocRef, "versions", {})
+
+    progress_store = {"u14": {"timezone": "UTC"}}
+    card_state_store = {
+        "u14:pack-1": {
+            "uid": "u14",
+            "pack_id": "pack-1",
+            "state": {"fc_1": {"seen": 1, "next_review_date": "2000-01-01"}, "fc_2": {"seen": 1, "next_review_date": "2999-01-01"}},
+        }
+    }
+    list_calls = []
+    runtime = get_runtime(client.application)
+
+    def _list_card_states(_db, uid, _limit):
+        list_calls.append(uid)
+        return [SimpleNamespace(to_dict=lambda value=value: dict(value)) for value in card_state_store.values()]
+
+    monkeypatch.setattr(core, "verify_firebase_token", lambda _request: {"uid": "u14", "email": "user@gmail.com"})
+    _use_transactional_db(runtime, monkeypatch)
+    monkeypatch.setattr(runtime.study_repo, "list_study_card_states_by_uid", _list_card_states)
+    monkeypatch.setattr(runtime, "get_study_progress_doc", lambda uid: _VersionedDocRef(progress_store, uid), raising=False)
+    monkeypatch.setattr(
+        runtime,
+        "get_study_card_state_doc",
+        lambda uid, pack_id: _VersionedDocRef(card_state_store, f"{uid}:{pack_id}"),
+        raising=False,
+    )
+
+    first = client.get("/api/study-progress/summary", headers={"Authorization": "Bearer dev"})
+    update = client.put(
+        "/api/study-progress",
+        json={"card_states": {"pack-2": {"fc_1": {"seen": 1, "next_review_date": "2000-01-02"}}}, "remove_pack_ids": []},
+        headers={"Authorization": "Bearer dev"},
+    )
+    second = client.get("/api/study-progress/summary", headers={"Authorization": "Bearer dev"})
+
+    assert first.get_json()["due_today"] == 1
+    assert update.status_code == 200
+    assert second.get_json()["due_today"] == 2
+    assert list_calls == ["u14"]
+    assert sorted(progress_store["u14"]["due_histogram"]) == ["pack-1", "pack-2"]
+
+    removal = client.put("/api/study-progress", json={"remove_pack_ids": ["pack-1"]}, headers={"Authorization": "Bearer dev"})
+    third = client.get("/api/study-progress/summary", headers={"Authorization": "Bearer dev"})
+
+    assert removal.status_code == 200
+    assert third.get_json()["due_today"] == 1
+    assert "u14:pack-1" not in card_state_store
+    assert list_calls == ["u14"]
+
+
+def test_study_progress_summary_skips_backfill_when_progress_changed_during_scan(client, monkeypatch):
+    monkeypatch.setattr(_VersionedDocRef, "versions", {})
+    progress_store = {"u15": {"timezone": "UTC"}}
+    runtime = get_runtime(client.application)
+
+    def _list_card_states(_db, uid, _limit):
+        # A concurrent progress sync lands while the summary scans card states.
+        _VersionedDocRef(progress_store, uid).set({"updated_at": 1.0}, merge=True)
+        return [
+            SimpleNamespace(
+                to_dict=lambda: {"uid": uid, "pack_id": "pack-1", "state": {"fc_1": {"seen": 1, "next_review_date": "2000-01-01"}}}
+            )
+        ]
+
+    monkeypatch.setattr(core, "verify_firebase_token", lambda _request: {"uid": "u15", "email": "user@gmail.com"})
+    _use_transactional_db(runtime, monkeypatch)
+    monkeypatch.setattr(runtime.study_repo, "list_study_card_states_by_uid", _list_card_states)
+    monkeypatch.setattr(runtime, "get_study_progress_doc", lambda uid: _VersionedDocRef(progress_store, uid), raising=False)
+
+    response = client.get("/api/study-progress/summary", headers={"Authorization": "Bearer dev"})
+
+    assert response.get_json()["due_today"] == 1
+    assert "due_histogram" not in progress_store["u15"]
+
+
+def test_overlapping_study_progress_syncs_keep_each_others_histogram_entries(client, monkeypatch):
+    monkeypatch.setattr(_VersionedDocRef, "versions", {})
+    progress_store = {
+        "u16": {
+            "timezone": "UTC",
+            "due_histogram": {
+                "pack-1": {"undated": 0, "dates": [{"date": "2999-01-01", "count": 1}]},
+                "pack-2": {"undated": 0, "dates": [{"date": "2999-01-01", "count": 1}]},
+            },
+        }
+    }
+    card_state_store = {}
+    runtime = get_runtime(client.application)
+    interleaved = []
+
+    class _InterleavingProgressRef(_VersionedDocRef):
+        def get(self, transaction=None):
+            snapshot = super().get(transaction=transaction)
+            if not interleaved:
+                # Sync B for pack-2 runs to completion between sync A's read and its write.
+                interleaved.append(True)
+                payload = {"card_states": {"pack-2": {"fc_1": {"seen": 1, "next_review_date": "2000-01-02"}}}}
+                other = SimpleNamespace(get_json=lambda silent=False: payload, headers={"Authorization": "Bearer dev"})
+                response = study_progress_service.update_study_progress(runtime, other)
+                assert response.get_json() == {"ok": True}
+            return snapshot
+
+    monkeypatch.setattr(core, "verify_firebase_token", lambda _request: {"uid": "u16", "email": "user@gmail.com"})
+    _use_transactional_db(runtime, monkeypatch)
+    monkeypatch.setattr(runtime.study_repo, "list_study_card_states_by_uid", lambda *_args: pytest.fail("summary should not scan"))
+    monkeypatch.setattr(runtime, "get_study_progress_doc", lambda uid: _InterleavingProgressRef(progress_store, uid), raising=False)
+    monkeypatch.setattr(
+        runtime,
+        "get_study_card_state_doc",
+        lambda uid, pack_id: _VersionedDocRef(card_state_store, f"{uid}:{pack_id}"),
+        raising=False,
+    )
+
+    update = client.put(
+        "/api/study-progress",
+        json={"card_states": {"pack-1": {"fc_1": {"seen": 1, "next_review_date": "2000-01-01"}}}},
+        headers={"Authorization": "Bearer dev"},
+    )
+    summary = client.get("/api/study-progress/summary", headers={"Authorization": "Bearer dev"})
+
+    assert update.status_code == 200
+    assert interleaved == [True]
+    assert progress_store["u16"]["due_histogram"] == {
+        "pack-1": {"undated": 0, "dates": [{"date": "2000-01-01", "count": 1}]},
+        "pack-2": {"undated": 0, "dates": [{"date": "2000-01-02", "count": 1}]},
+    }
+    assert summary.get_json()["due_today"] == 2
+
 def test_billing_receipt_helpers_track_charged_and_refunded_credits():
     job = {"billing_receipt": core.initialize_billing_receipt({"interview_credits_short": 1, "slides_credits": 2})}
 
@@ -2085,6 +2380,319 @@ def test_process_interview_transcription_saves_pack_on_success(monkeypatch, tmp_
     assert saved == [job_id]
 
 
+def test_process_interview_transcription_stitches_parallel_segments(monkeypatch, tmp_path):
+    transcripts = {
+        "part000": "00:05 - Speaker A - Opening\n30:03 - Speaker B - Boundary",
+        "part001": "00:03 - Speaker B - Boundary\n10:00 - Speaker A - Closing",
+    }
+    uploaded = []
+
+    class _FakeFiles:
+        def upload(self, file=None, config=None):
+            uploaded.append(file)
+            return SimpleNamespace(uri=f"gs://fake/{Path(file).stem}", name=f"files/{Path(file).stem}")
+
+    class _FakeModels:
+        def generate_content(self, **kwargs):
+            file_uri = kwargs["contents"][0].parts[0].file_data.file_uri
+            return SimpleNamespace(text=transcripts[file_uri.rsplit("_", 1)[-1]], usage_metadata=None)
+
+    audio_path = tmp_path / "interview.mp3"
+    audio_path.write_bytes(b"ID3\x03\x00\x00\x00")
+    split_windows = []
+
+    def _split(path, windows):
+        split_windows.extend(windows)
+        return [str(tmp_path / f"interview_part{index:03d}.mp3") for index in range(len(windows))]
+
+    monkeypatch.setattr(core, "client", SimpleNamespace(files=_FakeFiles(), models=_FakeModels()))
+    monkeypatch.setattr(core, "preprocess_audio_for_transcription", lambda path: (str(path), False))
+    monkeypatch.setattr(core, "probe_audio_duration_seconds", lambda _path: 2400.0)
+    monkeypatch.setattr(core, "split_audio_segments", _split)
+    monkeypatch.setattr(core, "AUDIO_SEGMENT_MIN_DURATION_SECONDS", 1800)
+    monkeypatch.setattr(core, "AUDIO_SEGMENT_SECONDS", 1800)
+    monkeypatch.setattr(core, "persist_audio_for_study_pack", lambda _job_id, _path: "")
+    monkeypatch.setattr(core, "get_mime_type", lambda _path: "audio/mpeg")
+    monkeypatch.setattr(core, "wait_for_file_processing", lambda _uploaded: None)
+    monkeypatch.setattr(core, "save_study_pack", lambda _job_id, _job: None)
+    monkeypatch.setattr(core, "cleanup_files", lambda _local, _gemini: None)
+    monkeypatch.setattr(core, "save_job_log", lambda *_args, **_kwargs: None)
+
+    job_id = "job-interview-segments"
+    core.jobs[job_id] = {
+        "status": "starting",
+        "step": 0,
+        "mode": "interview",
+        "user_id": "seg-u1",
+        "credit_deducted": "interview_credits_short",
+        "credit_refunded": False,
+        "output_language": "English",
+        "interview_features": [],
+        "billing_receipt": core.initialize_billing_receipt({"interview_credits_short": 1}),
+    }
+
+    core.process_interview_transcription(job_id, str(audio_path))
+
+    assert core.jobs[job_id]["status"] == "complete"
+    assert split_windows == [(0.0, 1810.0), (1800.0, 2400.0)]
+    assert sorted(Path(path).name for path in uploaded) == ["interview_part000.mp3", "interview_part001.mp3"]
+    assert core.jobs[job_id]["transcript"].splitlines() == [
+        "00:05 - Speaker A - Opening",
+        "30:03 - Speaker B - Boundary",
+        "40:00 - Speaker A - Closing",
+    ]
+    core.jobs.pop(job_id, None)
+
+
+def _lecture_notes_job(user_id):
+    return {
+        "status": "starting",
+        "step": 0,
+        "step_description": "Starting...",
+        "total_steps": 3,
+        "mode": "lecture-notes",
+        "user_id": user_id,
+        "user_email": "user@gmail.com",
+        "credit_deducted": "lecture_credits_standard",
+        "credit_refunded": False,
+        "started_at": 1772000000.0,
+        "result": None,
+        "slide_text": None,
+        "transcript": None,
+        "flashcards": [],
+        "test_questions": [],
+        "study_features": "none",
+        "output_language": "English",
+        "study_generation_error": None,
+        "error": None,
+        "billing_receipt": core.initialize_billing_receipt({"lecture_credits_standard": 1}),
+    }
+
+
+def _patch_lecture_notes_runtime(monkeypatch, *, upload, wait_for_file_processing, cleaned, saved):
+    class _FakeFiles:
+        def upload(self, **kwargs):
+            return upload(kwargs["file"], kwargs["config"]["mime_type"])
+
+    class _FakeModels:
+        def generate_content(self, **_kwargs):
+            return SimpleNamespace(text="Slide or merged text")
+
+    monkeypatch.setattr(core, "client", SimpleNamespace(files=_FakeFiles(), models=_FakeModels()))
+    monkeypatch.setattr(core, "FEATURE_AUDIO_SECTION_SYNC", False)
+    monkeypatch.setattr(core, "convert_audio_to_mp3_with_ytdlp", lambda path: (str(path), False))
+    monkeypatch.setattr(core, "persist_audio_for_study_pack", lambda _job_id, _path: "")
+    monkeypatch.setattr(core, "get_mime_type", lambda _path: "audio/mpeg")
+    monkeypatch.setattr(core, "wait_for_file_processing", wait_for_file_processing)
+    monkeypatch.setattr(
+        core,
+        "transcribe_audio_plain",
+        lambda _file, _mime, _language, retry_tracker=None, include_usage=False: (
+            "Transcript text",
+            {"input_tokens": 40, "output_tokens": 10, "total_tokens": 50},
+        ),
+    )
+    monkeypatch.setattr(core, "save_study_pack", lambda job_id, _job: saved.append(job_id))
+    monkeypatch.setattr(core, "cleanup_files", lambda _local, gemini: cleaned.extend(gemini))
+    monkeypatch.setattr(core, "save_job_log", lambda *_args, **_kwargs: None)
+
+
+def test_process_lecture_notes_runs_slide_and_audio_branches_concurrently(monkeypatch, tmp_path):
+    audio_uploaded = threading.Event()
+    cleaned = []
+    saved = []
+
+    def _upload(path, mime_type):
+        if mime_type == "audio/mpeg":
+            audio_uploaded.set()
+        return SimpleNamespace(uri=f"gs://fake/{Path(path).name}", name=f"files/{Path(path).name}", mime_type=mime_type)
+
+    def _wait(uploaded):
+        # The slide branch only gets past processing if the audio branch runs alongside it.
+        if uploaded.mime_type == "application/pdf":
+            assert audio_uploaded.wait(timeout=5)
+
+    _patch_lecture_notes_runtime(monkeypatch, upload=_upload, wait_for_file_processing=_wait, cleaned=cleaned, saved=saved)
+    pdf_path = tmp_path / "slides.pdf"
+    audio_path = tmp_path / "lecture.mp3"
+    pdf_path.write_bytes(b"%PDF-1.4")
+    audio_path.write_bytes(b"ID3")
+    job_id = "job-lecture-parallel"
+    core.jobs[job_id] = _lecture_notes_job("parallel-u1")
+
+    core.process_lecture_notes(job_id, str(pdf_path), str(audio_path))
+
+    job = core.jobs[job_id]
+    assert job["status"] == "complete"
+    assert job["slide_text"] == "Slide or merged text"
+    assert job["transcript"] == "Transcript text"
+    assert job["token_usage_by_stage"]["audio_transcription"]["total_tokens"] == 50
+    assert job["token_total"] == 50
+    assert job["retry_attempts"] == 0
+    assert sorted(item.mime_type for item in cleaned) == ["application/pdf", "audio/mpeg"]
+    assert saved == [job_id]
+
+
+def test_process_lecture_notes_cancels_sibling_branch_on_first_failure(monkeypatch, tmp_path):
+    slide_waiting = threading.Event()
+    branch_failed = threading.Event()
+    extraction_calls = []
+    cleaned = []
+    saved = []
+
+    def _upload(path, mime_type):
+        if mime_type == "audio/mpeg":
+            assert slide_waiting.wait(timeout=5)
+            raise ValueError("audio upload rejected")
+        return SimpleNamespace(uri="gs://fake/slides", name="files/slides", mime_type=mime_type)
+
+    def _wait(_uploaded):
+        slide_waiting.set()
+        # Keep the slide stage in flight until the audio branch has failed.
+        assert branch_failed.wait(timeout=5)
+
+    _patch_lecture_notes_runtime(monkeypatch, upload=_upload, wait_for_file_processing=_wait, cleaned=cleaned, saved=saved)
+    original_generate = ai_provider.generate_with_policy
+
+    def _tracking_generate(*args, **kwargs):
+        extraction_calls.append(kwargs.get("operation_name"))
+        return original_generate(*args, **kwargs)
+
+    monkeypatch.setattr(ai_provider, "generate_with_policy", _tracking_generate)
+    original_run_branch = ai_pipelines.ParallelStageRunner._run_branch
+
+    def _run_branch(self, branch, func):
+        result = original_run_branch(self, branch, func)
+        if self.failed_stage:
+            branch_failed.set()
+        return result
+
+    monkeypatch.setattr(ai_pipelines.ParallelStageRunner, "_run_branch", _run_branch)
+    monkeypatch.setattr(core, "refund_credit", lambda *_args, **_kwargs: True)
+    pdf_path = tmp_path / "slides.pdf"
+    audio_path = tmp_path / "lecture.mp3"
+    pdf_path.write_bytes(b"%PDF-1.4")
+    audio_path.write_bytes(b"ID3")
+    job_id = "job-lecture-cancel"
+    core.jobs[job_id] = _lecture_notes_job("parallel-u2")
+
+    core.process_lecture_notes(job_id, str(pdf_path), str(audio_path))
+
+    job = core.jobs[job_id]
+    assert job["status"] == "error"
+    assert job["failed_stage"] == "audio_upload"
+    assert job["retry_attempts"] == 1
+    assert extraction_calls == []
+    assert [item.mime_type for item in cleaned] == ["application/pdf"]
+    assert saved == []
+
+
+def test_process_lecture_notes_reports_segment_upload_failures_as_audio_upload(monkeypatch, tmp_path):
+    cleaned = []
+    saved = []
+
+    def _upload(path, mime_type):
+        if mime_type == "audio/mpeg":
+            raise ValueError("segment upload rejected")
+        return SimpleNamespace(uri="gs://fake/slides", name="files/slides", mime_type=mime_type)
+
+    _patch_lecture_notes_runtime(monkeypatch, upload=_upload, wait_for_file_processing=lambda _uploaded: None, cleaned=cleaned, saved=saved)
+    monkeypatch.setattr(core, "preprocess_audio_for_transcription", lambda path: (str(path), False))
+    monkeypatch.setattr(core, "probe_audio_duration_seconds", lambda _path: 2400.0)
+    monkeypatch.setattr(
+        core,
+        "split_audio_segments",
+        lambda _path, windows: [str(tmp_path / f"lecture_part{index:03d}.mp3") for index in range(len(windows))],
+    )
+    monkeypatch.setattr(core, "AUDIO_SEGMENT_MIN_DURATION_SECONDS", 1800)
+    monkeypatch.setattr(core, "AUDIO_SEGMENT_SECONDS", 1800)
+    monkeypatch.setattr(core, "refund_credit", lambda *_args, **_kwargs: True)
+    pdf_path = tmp_path / "slides.pdf"
+    audio_path = tmp_path / "lecture.mp3"
+    pdf_path.write_bytes(b"%PDF-1.4")
+    audio_path.write_bytes(b"ID3")
+    job_id = "job-lecture-segment-upload"
+    core.jobs[job_id] = _lecture_notes_job("segments-u1")
+
+    core.process_lecture_notes(job_id, str(pdf_path), str(audio_path))
+
+    job = core.jobs[job_id]
+    assert job["status"] == "error"
+    assert job["failed_stage"] == "audio_upload"
+    assert saved == []
+    core.jobs.pop(job_id, None)
+
+
+def test_process_lecture_notes_persists_full_quality_audio_for_playback(monkeypatch, tmp_path):
+    uploaded_audio = []
+    persisted = []
+    cleaned = []
+    saved = []
+
+    def _upload(path, mime_type):
+        if mime_type == "audio/mpeg":
+            uploaded_audio.append(Path(path).name)
+        return SimpleNamespace(uri=f"gs://fake/{Path(path).name}", name=f"files/{Path(path).name}", mime_type=mime_type)
+
+    _patch_lecture_notes_runtime(monkeypatch, upload=_upload, wait_for_file_processing=lambda _uploaded: None, cleaned=cleaned, saved=saved)
+    speech_path = tmp_path / "lecture_speech.mp3"
+    monkeypatch.setattr(core, "preprocess_audio_for_transcription", lambda _path: (str(speech_path), True))
+    monkeypatch.setattr(
+        study_audio,
+        "persist_audio_for_study_pack",
+        lambda _job_id, path, runtime=None: persisted.append(Path(path).name) or "",
+    )
+    pdf_path = tmp_path / "slides.pdf"
+    audio_path = tmp_path / "lecture.mp3"
+    pdf_path.write_bytes(b"%PDF-1.4")
+    audio_path.write_bytes(b"ID3")
+    job_id = "job-lecture-playback"
+    core.jobs[job_id] = _lecture_notes_job("playback-u1")
+
+    core.process_lecture_notes(job_id, str(pdf_path), str(audio_path))
+
+    assert core.jobs[job_id]["status"] == "complete"
+    assert uploaded_audio == ["lecture_speech.mp3"]
+    assert persisted == ["lecture.mp3"]
+
+    monkeypatch.setattr(core, "AUDIO_TRIM_SILENCE", True)
+    persisted.clear()
+    core.jobs[job_id] = _lecture_notes_job("playback-u1")
+    core.process_lecture_notes(job_id, str(pdf_path), str(audio_path))
+
+    # Trimmed audio is what the transcript timestamps refer to.
+    assert persisted == ["lecture_speech.mp3"]
+    core.jobs.pop(job_id, None)
+
+def test_process_lecture_notes_reuses_cached_results_for_identical_uploads(monkeypatch, tmp_path):
+    uploads = []
+    cleaned = []
+    saved = []
+
+    def _upload(path, mime_type):
+        uploads.append(mime_type)
+        return SimpleNamespace(uri=f"gs://fake/{Path(path).name}", name=f"files/{Path(path).name}", mime_type=mime_type)
+
+    _patch_lecture_notes_runtime(monkeypatch, upload=_upload, wait_for_file_processing=lambda _uploaded: None, cleaned=cleaned, saved=saved)
+    monkeypatch.setattr(core, "db", None)
+    monkeypatch.setattr(core, "AI_RESULT_CACHE_MODE", "local")
+    for run in ("first", "second"):
+        run_dir = tmp_path / run
+        run_dir.mkdir()
+        (run_dir / "slides.pdf").write_bytes(b"%PDF-1.4 same deck")
+        (run_dir / "lecture.mp3").write_bytes(b"ID3 same recording")
+        core.jobs[f"job-cache-{run}"] = _lecture_notes_job("cache-u1")
+        core.process_lecture_notes(f"job-cache-{run}", str(run_dir / "slides.pdf"), str(run_dir / "lecture.mp3"))
+
+    first, second = core.jobs["job-cache-first"], core.jobs["job-cache-second"]
+    assert sorted(uploads) == ["application/pdf", "audio/mpeg"]
+    assert second["status"] == "complete"
+    assert (second["slide_text"], second["transcript"]) == (first["slide_text"], first["transcript"])
+    assert second["token_usage_by_stage"]["slide_extraction"]["cache_hit"] is True
+    assert second["token_usage_by_stage"]["audio_transcription"]["total_tokens"] == 0
+    assert first["token_usage_by_stage"]["audio_transcription"]["total_tokens"] == 50
+
+
 def test_upload_requires_auth(client):
     response = client.post("/upload", data={"mode": "slides-only"})
     assert response.status_code == 401
@@ -1,6 +1,7 @@
 import importlib.util
 import gzip
 import json
+import threading
 from pathlib import Path
 from types import SimpleNamespace
 
@@ -9,6 +10,7 @@ import pytest
 from lecture_processor.domains.ai import provider as ai_provider
 from lecture_processor.domains.physio import access as physio_access
 from lecture_processor.domains.physio import knowledge as physio_knowledge
+from lecture_processor.repositories import physio_repo
 
 
 pytestmark = pytest.mark.usefixtures("disable_sentry")
@@ -26,8 +28,15 @@ def _allow_physio(monkeypatch, core, *, uid="physio-u1", email="owner@example.co
 @pytest.fixture(autouse=True)
 def clear_knowledge_cache():
     physio_knowledge._INDEX_CACHE.update({"path": "", "mtime": 0.0, "signature": "", "payload": None})
+    physio_knowledge._VECTOR_STORE_CACHE.update({"signature": "", "store": None})
+    physio_knowledge._QUERY_EMBEDDING_CACHE["entries"].clear()
+    physio_knowledge._QUERY_EMBEDDING_CACHE["signature"] = ""
+    physio_knowledge._QUERY_EMBEDDING_STATS.update({"hits": 0, "shared_hits": 0, "misses": 0, "invalidations": 0})
     yield
     physio_knowledge._INDEX_CACHE.update({"path": "", "mtime": 0.0, "signature": "", "payload": None})
+    physio_knowledge._VECTOR_STORE_CACHE.update({"signature": "", "store": None})
+    physio_knowledge._QUERY_EMBEDDING_CACHE["entries"].clear()
+    physio_knowledge._QUERY_EMBEDDING_CACHE["signature"] = ""
 
 
 def test_rank_index_documents_orders_by_similarity():
@@ -498,5 +507,426 @@ def test_build_physio_library_script_writes_manifest_from_text_source(tmp_path):
     assert written["meta"]["format"] == physio_knowledge.SHARDED_INDEX_FORMAT
     assert written["meta"]["indexed_source_paths"] == [str(forms_dir / "notes.md")]
     assert written["meta"]["document_shards"]
+    assert written["meta"]["vector_store"]["format"] == physio_knowledge.VECTOR_STORE_FORMAT
+    assert written["meta"]["vector_store"]["count"] == written["meta"]["document_count"]
+    assert (tmp_path / written["meta"]["vector_store"]["vectors"]).exists()
+    assert "ann_index" not in written["meta"]
+    assert written["meta"]["bm25_index"]["format"] == physio_knowledge.BM25_INDEX_FORMAT
+    assert (tmp_path / written["meta"]["bm25_index"]["postings"]).exists()
     assert manifest["documents"][0]["source_kind"] == "forms"
     assert loaded["documents"][0]["embedding"][1] == 1.0
+
+
+def _write_vector_store_manifest(tmp_path, documents):
+    manifest_path = tmp_path / "manifest.json"
+    vector_store = physio_knowledge.write_vector_store(documents, manifest_path, dimension=2)
+    manifest_path.write_text(
+        json.dumps(
+            {
+                "meta": {
+                    "source_count": 1,
+                    "document_count": len(documents),
+                    "embedding_dimension": 2,
+                    "format": physio_knowledge.SHARDED_INDEX_FORMAT,
+                    "document_shards": ["manifest.documents-001.json.gz"],
+                    "vector_store": vector_store,
+                },
+                "documents": [],
+                "errors": [],
+            }
+        ),
+        encoding="utf-8",
+    )
+    return manifest_path
+
+
+def test_query_knowledge_index_scores_vector_store_without_reading_shards(monkeypatch, tmp_path):
+    manifest_path = _write_vector_store_manifest(
+        tmp_path,
+        [
+            {
+                "id": "doc-1",
+                "text": "Linker hemisferisch CVA gaat vaker samen met afasie.",
+                "source_name": "beroerte.pdf",
+                "source_title": "Beroerte Richtlijn",
+                "source_kind": "guidelines",
+                "page_label": "pagina 4",
+                "embedding": [0.0, 3.0],
+            },
+            {
+                "id": "doc-2",
+                "text": "Rechts hemisferisch CVA geeft vaak linkszijdige neglect.",
+                "source_name": "beroerte.pdf",
+                "source_title": "Beroerte Richtlijn",
+                "source_kind": "guidelines",
+                "page_label": "pagina 3",
+                "embedding": [2.0, 0.0],
+            },
+        ],
+    )
+    monkeypatch.setattr(physio_knowledge, "PHYSIO_LIBRARY_INDEX_PATH", manifest_path)
+    monkeypatch.setattr(
+        physio_knowledge,
+        "rank_sharded_index_documents",
+        lambda *args, **kwargs: (_ for _ in ()).throw(AssertionError("gzip shards should not be scanned when a vector store exists")),
+    )
+    monkeypatch.setattr(
+        physio_knowledge,
+        "embed_text",
+        lambda text, task_type="RETRIEVAL_QUERY", runtime=None, output_dimensionality=None: [1.0, 0.0],
+    )
+    monkeypatch.setattr(
+        ai_provider,
+        "generate_with_optional_thinking",
+        lambda model, prompt, max_output_tokens=4096, operation_name="", runtime=None: SimpleNamespace(text="## Antwoord\n- Rechts CVA geeft vaak linkszijdige uitval."),
+    )
+
+    response = physio_knowledge.query_knowledge_index(
+        "Wat hoort bij een CVA rechts?",
+        runtime=SimpleNamespace(MODEL_TOOLS="gemini-test"),
+    )
+
+    assert response["citations"][0]["label"] == "Beroerte Richtlijn (pagina 3)"
+    assert response["retrieved_sources"][0]["excerpt"].startswith("Rechts hemisferisch CVA")
+    assert physio_knowledge.knowledge_index_status(index_path=manifest_path, source_root=tmp_path)["vector_store_format"] == physio_knowledge.VECTOR_STORE_FORMAT
+
+
+def test_load_vector_store_maps_vectors_and_records_once(tmp_path):
+    manifest_path = _write_vector_store_manifest(
+        tmp_path,
+        [
+            {"id": "doc-1", "text": "Eerste chunk.", "source_name": "a.pdf", "embedding": [3.0, 4.0]},
+            {"id": "doc-2", "text": "Tweede chunk.", "source_name": "b.pdf", "embedding": [0.0, 0.0]},
+        ],
+    )
+
+    store = physio_knowledge.load_vector_store(index_path=manifest_path)
+    loaded = physio_knowledge.load_knowledge_index(index_path=manifest_path)
+
+    assert store is physio_knowledge.load_vector_store(index_path=manifest_path)
+    assert len(store) == 2
+    assert list(store.vector(0)) == [3.0, 4.0]
+    assert list(store.vector(1)) == [0.0, 0.0]
+    assert store.record(1) == {"id": "doc-2", "text": "Tweede chunk.", "source_name": "b.pdf"}
+    assert store.similarities([1.0, 0.0]) == pytest.approx([0.6, 0.0])
+    assert [item["id"] for item in loaded["documents"]] == ["doc-1", "doc-2"]
+    assert loaded["documents"][0]["embedding"] == [3.0, 4.0]
+
+
+def test_numpy_scoring_engine_matches_in_memory_ranking(monkeypatch, tmp_path):
+    pytest.importorskip("numpy")
+    documents = [
+        {
+            "id": f"doc-{number}",
+            "text": text,
+            "source_name": f"{name}.pdf",
+            "source_title": title,
+            "source_kind": kind,
+            "page_label": f"pagina {number}",
+            "embedding": embedding,
+        }
+        for number, (text, name, title, kind, embedding) in enumerate(
+            [
+                ("Oefentherapie bij knieartrose vermindert startpijn.", "knie", "Knieartrose Richtlijn", "guidelines", [0.9, 0.1]),
+                ("Traplopen en pijn bij artrose van de knie.", "knie", "Knieartrose Richtlijn", "guidelines", [0.8, 0.3]),
+                ("Schouderklachten en subacromiale pijn.", "schouder", "Schouder", "lectures", [0.95, 0.05]),
+                ("Lage rugpijn vraagt geleidelijke belastingopbouw.", "rug", "Lage Rugpijn", "guidelines", [0.7, 0.7]),
+                ("Algemene informatie zonder match.", "overig", "Overig", "forms", [0.0, 1.0]),
+                ("Knie instabiliteit na VKB-reconstructie.", "vkb", "VKB Revalidatie", "lectures", [0.85, 0.2]),
+            ]
+        )
+    ]
+    manifest_path = _write_vector_store_manifest(tmp_path, documents)
+    query_context = physio_knowledge._build_query_context(
+        "Welke oefentherapie bij knieartrose?",
+        body_region="knie",
+        case_context={"primary_complaint": "startpijn bij traplopen"},
+    )
+    expected = physio_knowledge.rank_scored_index_documents([1.0, 0.2], documents, limit=3, query_context=query_context)
+    store = physio_knowledge.load_vector_store(index_path=manifest_path)
+
+    engine = store.scoring_engine()
+    vectorized = physio_knowledge.rank_vector_store_documents([1.0, 0.2], store, limit=3, query_context=query_context)
+    monkeypatch.setattr(physio_knowledge, "np", None)
+    fallback = physio_knowledge.rank_vector_store_documents([1.0, 0.2], store, limit=3, query_context=query_context)
+
+    assert engine is not None
+    assert [item["id"] for item in vectorized] == [item["id"] for item in expected]
+    assert [item["id"] for item in fallback] == [item["id"] for item in expected]
+    assert [item["score"] for item in vectorized] == pytest.approx([item["score"] for item in expected])
+
+
+def test_ivf_ann_index_probes_nearest_lists_and_falls_back_to_exact(tmp_path):
+    np = pytest.importorskip("numpy")
+    rng = np.random.default_rng(3)
+    centers = np.eye(4, dtype=np.float32)
+    documents = [
+        {
+            "id": f"doc-{number}",
+            "text": f"Chunk {number}.",
+            "source_name": f"bron-{number % 7}.pdf",
+            "embedding": (centers[number % 4] + 0.05 * rng.standard_normal(4)).tolist(),
+        }
+        for number in range(80)
+    ]
+    manifest_path = tmp_path / "manifest.json"
+    vector_store = physio_knowledge.write_vector_store(documents, manifest_path, dimension=4)
+    ann_index = physio_knowledge.write_ann_index(manifest_path, vector_store, nlist=4, nprobe=1)
+    manifest_path.write_text(
+        json.dumps({"meta": {"embedding_dimension": 4, "vector_store": vector_store, "ann_index": ann_index}, "documents": [], "errors": []}),
+        encoding="utf-8",
+    )
+
+    store = physio_knowledge.load_vector_store(index_path=manifest_path)
+    engine = store.scoring_engine()
+    rows = engine.ann_candidate_rows([1.0, 0.0, 0.0, 0.0], min_rows=5)
+    approximate = physio_knowledge.rank_vector_store_documents([1.0, 0.0, 0.0, 0.0], store, limit=3)
+    exact = physio_knowledge.rank_vector_store_documents([1.0, 0.0, 0.0, 0.0], store, limit=3, nprobe=0)
+    report = physio_knowledge.measure_ann_recall(store, nprobe_values=[1, 3], k=5, sample_size=20)
+    status = physio_knowledge.knowledge_index_status(index_path=manifest_path, source_root=tmp_path)
+
+    assert ann_index["nlist"] == 4
+    assert physio_knowledge.write_ann_index(manifest_path, vector_store) is None
+    assert store.ann_index is not None
+    assert sorted(rows.tolist()) == list(range(0, 80, 4))
+    assert engine.ann_candidate_rows([1.0, 0.0, 0.0, 0.0], min_rows=21) is None
+    assert engine.ann_candidate_rows([1.0, 0.0, 0.0, 0.0], nprobe=4) is None
+    assert [item["id"] for item in approximate] == [item["id"] for item in exact]
+    assert [row["nprobe"] for row in report["results"]] == [1, 3]
+    assert report["results"][1]["recall_at_k"] >= report["results"][0]["recall_at_k"]
+    assert status["ann_index"] == {"format": physio_knowledge.ANN_INDEX_FORMAT, "nlist": 4, "nprobe": 1}
+
+
+def test_bm25_index_reads_postings_and_fuses_with_vector_ranking(monkeypatch, tmp_path):
+    documents = [
+        {"id": "doc-0", "text": "Schouderklachten en subacromiale pijn.", "source_name": "schouder.pdf", "embedding": [1.0, 0.0]},
+        {"id": "doc-1", "text": "Lage rugpijn vraagt belastingopbouw.", "source_name": "rug.pdf", "embedding": [0.9, 0.2]},
+        {"id": "doc-2", "text": "Oefentherapie bij heupklachten.", "source_name": "heup.pdf", "embedding": [0.5, 0.5]},
+        {
+            "id": "doc-3",
+            "text": "Knieartrose: oefentherapie vermindert pijn bij knieartrose.",
+            "source_name": "knie-b.pdf",
+            "source_title": "Knieartrose Richtlijn",
+            "embedding": [0.0, 1.0],
+        },
+    ]
+    manifest_path = tmp_path / "manifest.json"
+    vector_store = physio_knowledge.write_vector_store(documents, manifest_path, dimension=2)
+    bm25_index = physio_knowledge.write_bm25_index(manifest_path, vector_store)
+    manifest_path.write_text(
+        json.dumps({"meta": {"embedding_dimension": 2, "vector_store": vector_store, "bm25_index": bm25_index}, "documents": [], "errors": []}),
+        encoding="utf-8",
+    )
+
+    store = physio_knowledge.load_vector_store(index_path=manifest_path)
+    keyword_matches = store.bm25_index.top_matches("Welke oefentherapie bij knieartrose?", limit=10)
+    vector_only = physio_knowledge.rank_vector_store_documents([1.0, 0.0], store, limit=2)
+    hybrid = physio_knowledge.rank_vector_store_documents([1.0, 0.0], store, limit=2, lexical_query="knieartrose oefentherapie")
+    monkeypatch.setattr(physio_knowledge, "np", None)
+    store.bm25_index._length_norms = None
+    fallback_matches = store.bm25_index.top_matches("Welke oefentherapie bij knieartrose?", limit=10)
+    fallback_hybrid = physio_knowledge.rank_vector_store_documents([1.0, 0.0], store, limit=2, lexical_query="knieartrose oefentherapie")
+    status = physio_knowledge.knowledge_index_status(index_path=manifest_path, source_root=tmp_path)
+
+    assert store.bm25_index.vocabulary["oefentherapie"][1] == 2
+    assert store.bm25_index.vocabulary["knieartrose"][1] == 1
+    assert [row for _score, row in keyword_matches] == [3, 2]
+    assert [row for _score, row in fallback_matches] == [3, 2]
+    assert [score for score, _row in fallback_matches] == pytest.approx([score for score, _row in keyword_matches])
+    assert [item["id"] for item in vector_only] == ["doc-0", "doc-1"]
+    assert [item["id"] for item in hybrid] == ["doc-3", "doc-2"]
+    assert [item["id"] for item in fallback_hybrid] == ["doc-3", "doc-2"]
+    assert hybrid[0]["keyword_score"] > hybrid[1]["keyword_score"] > 0
+    assert hybrid[0]["score"] == pytest.approx(0.0)
+    assert hybrid[0]["fusion_score"] == round(1 / 61 + 1 / 64, 6)
+    assert physio_knowledge.reciprocal_rank_fusion([[5, 7], [7, 9]], k=1) == [(1 / 2 + 1 / 3, 7), (1 / 2, 5), (1 / 3, 9)]
+    assert status["bm25_index"] == {"format": physio_knowledge.BM25_INDEX_FORMAT, "terms": bm25_index["terms"], "average_length": bm25_index["average_length"]}
+
+
+def test_resolve_ann_nprobe_reads_runtime_then_environment(monkeypatch):
+    monkeypatch.delenv("PHYSIO_ANN_NPROBE", raising=False)
+    assert physio_knowledge.resolve_ann_nprobe() is None
+    monkeypatch.setenv("PHYSIO_ANN_NPROBE", "0")
+    assert physio_knowledge.resolve_ann_nprobe() == 0
+    assert physio_knowledge.resolve_ann_nprobe(runtime=SimpleNamespace(PHYSIO_ANN_NPROBE=12)) == 12
+
+
+def test_embed_query_cached_reuses_vectors_until_index_signature_changes(monkeypatch):
+    calls = []
+    monkeypatch.setattr(
+        physio_knowledge,
+        "embed_text",
+        lambda text, task_type="RETRIEVAL_QUERY", runtime=None, output_dimensionality=None: calls.append(text) or [float(len(calls)), 1.0],
+    )
+    runtime = SimpleNamespace(PHYSIO_EMBED_MODEL="embed-test")
+
+    first = physio_knowledge.embed_query_cached("Knie: startpijn?", runtime=runtime, output_dimensionality=2, index_signature="v1")
+    repeated = physio_knowledge.embed_query_cached("  knie  startpijn ", runtime=runtime, output_dimensionality=2, index_signature="v1")
+    other_dimension = physio_knowledge.embed_query_cached("knie startpijn", runtime=runtime, output_dimensionality=3, index_signature="v1")
+    after_rebuild = physio_knowledge.embed_query_cached("knie startpijn", runtime=runtime, output_dimensionality=2, index_signature="v2")
+
+    assert first == repeated == [1.0, 1.0]
+    assert other_dimension == [2.0, 1.0]
+    assert after_rebuild == [3.0, 1.0]
+    assert calls == ["Knie: startpijn?", "knie startpijn", "knie startpijn"]
+    assert physio_knowledge.query_embedding_cache_stats() == {
+        "hits": 1,
+        "shared_hits": 0,
+        "misses": 3,
+        "invalidations": 1,
+        "entries": 1,
+    }
+
+
+def test_embed_query_cached_reads_shared_tier_for_matching_index_version(monkeypatch):
+    shared = {}
+    monkeypatch.setattr(
+        physio_repo,
+        "get_physio_query_embedding_doc",
+        lambda _db, key: SimpleNamespace(exists=key in shared, to_dict=lambda: dict(shared.get(key, {}))),
+    )
+    monkeypatch.setattr(physio_repo, "set_physio_query_embedding", lambda _db, key, payload: shared.__setitem__(key, payload))
+    calls = []
+    monkeypatch.setattr(
+        physio_knowledge,
+        "embed_text",
+        lambda text, task_type="RETRIEVAL_QUERY", runtime=None, output_dimensionality=None: calls.append(text) or [0.5, 0.5],
+    )
+    runtime = SimpleNamespace(db=object(), PHYSIO_QUERY_EMBED_SHARED_CACHE=True)
+
+    first = physio_knowledge.embed_query_cached("schouder", runtime=runtime, output_dimensionality=2, index_signature="worker-a", index_version="100")
+    other_worker = physio_knowledge.embed_query_cached("schouder", runtime=runtime, output_dimensionality=2, index_signature="worker-b", index_version="100")
+    rebuilt_index = physio_knowledge.embed_query_cached("schouder", runtime=runtime, output_dimensionality=2, index_signature="worker-c", index_version="200")
+
+    assert first == other_worker == rebuilt_index == [0.5, 0.5]
+    assert len(calls) == 2
+    assert list(shared.values())[0]["index_version"] == "200"
+    assert physio_knowledge.query_embedding_cache_stats()["shared_hits"] == 1
+    assert physio_knowledge.query_embedding_cache_stats()["misses"] == 2
+
+
+def test_build_physio_library_incremental_rebuild_reuses_unchanged_sources(monkeypatch, tmp_path):
+    script_path = Path(__file__).resolve().parents[1] / "scripts" / "build_physio_library.py"
+    spec = importlib.util.spec_from_file_location("build_physio_library", script_path)
+    module = importlib.util.module_from_spec(spec)
+    assert spec.loader is not None
+    spec.loader.exec_module(module)
+    monkeypatch.setattr(module, "MAX_INDEX_SHARD_BYTES", 64)
+
+    source_root = tmp_path / "sources"
+    forms_dir = source_root / "forms"
+    forms_dir.mkdir(parents=True)
+    (forms_dir / "a.md").write_text("Knieartrose vraagt om oefentherapie.", encoding="utf-8")
+    (forms_dir / "b.md").write_text("Lage rugpijn vraagt om belastingopbouw.", encoding="utf-8")
+    (forms_dir / "c.md").write_text("Enkelletsel na inversietrauma.", encoding="utf-8")
+    index_path = tmp_path / "manifest.json"
+    embedded = []
+
+    def embed_texts(texts, task_type="RETRIEVAL_DOCUMENT"):
+        embedded.extend(texts)
+        return [[float(len(text)), 1.0] for text in texts]
+
+    def build():
+        return module.build_manifest(
+            source_root,
+            index_path=index_path,
+            embed_texts_fn=embed_texts,
+            incremental=True,
+            embed_dimension=2,
+        )
+
+    first = build()
+    first_meta = json.loads(index_path.read_text(encoding="utf-8"))["meta"]
+    a_shard = next(name for name, entries in first_meta["document_shard_sources"].items() if entries[0][0].endswith("a.md"))
+    a_shard_bytes = (tmp_path / a_shard).read_bytes()
+
+    (forms_dir / "b.md").write_text("Lage rugpijn: geleidelijke belastingopbouw.", encoding="utf-8")
+    (forms_dir / "c.md").unlink()
+    (forms_dir / "d.md").write_text("Schouderklachten bij werpsporters.", encoding="utf-8")
+    status = physio_knowledge.knowledge_index_status(index_path=index_path, source_root=source_root)
+    embedded.clear()
+    second = build()
+    second_meta = json.loads(index_path.read_text(encoding="utf-8"))["meta"]
+    loaded = physio_knowledge.load_knowledge_index(index_path=index_path)
+
+    assert first["build_stats"]["embedded_sources"] == 3
+    assert status["staleness_basis"] == "fingerprint"
+    assert status["stale"] is True
+    assert [Path(path).name for path in status["changed_source_paths"]] == ["b.md"]
+    assert [Path(path).name for path in status["new_source_paths"]] == ["d.md"]
+    assert [Path(path).name for path in status["deleted_source_paths"]] == ["c.md"]
+    assert embedded == ["Lage rugpijn: geleidelijke belastingopbouw.", "Schouderklachten bij werpsporters."]
+    assert {key: second["build_stats"][key] for key in ("reused_sources", "embedded_sources", "deleted_sources", "kept_shards", "written_shards")} == {
+        "reused_sources": 1,
+        "embedded_sources": 2,
+        "deleted_sources": 1,
+        "kept_shards": 1,
+        "written_shards": 2,
+    }
+    assert set(second["build_stats"]["timings"]) == {"fingerprint", "extract", "chunk", "embed", "write"}
+    assert second_meta["document_shards"][0] == a_shard
+    assert (tmp_path / a_shard).read_bytes() == a_shard_bytes
+    assert sorted(path.name for path in tmp_path.glob("manifest.documents-*.json.gz")) == sorted(second_meta["document_shards"])
+    assert [Path(item["source_path"]).name for item in loaded["documents"]] == ["a.md", "b.md", "d.md"]
+    assert physio_knowledge.knowledge_index_status(index_path=index_path, source_root=source_root)["stale"] is False
+
+
+def test_build_physio_library_embeds_batches_concurrently_and_drops_failed_sources(monkeypatch, tmp_path):
+    script_path = Path(__file__).resolve().parents[1] / "scripts" / "build_physio_library.py"
+    spec = importlib.util.spec_from_file_location("build_physio_library", script_path)
+    module = importlib.util.module_from_spec(spec)
+    assert spec.loader is not None
+    spec.loader.exec_module(module)
+    monkeypatch.setattr(module, "EMBED_BATCH_SIZE", 1)
+
+    source_root = tmp_path / "sources"
+    forms_dir = source_root / "forms"
+    forms_dir.mkdir(parents=True)
+    (forms_dir / "goed.md").write_text("Knieartrose.\n\n" + "Oefentherapie. " * 120, encoding="utf-8")
+    (forms_dir / "kapot.md").write_text("Deze bron faalt altijd.", encoding="utf-8")
+    lock = threading.Lock()
+    state = {"in_flight": 0, "peak": 0, "calls": 0}
+    barrier = threading.Barrier(2, timeout=5)
+
+    def embed_texts(texts, task_type="RETRIEVAL_DOCUMENT"):
+        with lock:
+            state["in_flight"] += 1
+            state["calls"] += 1
+            state["peak"] = max(state["peak"], state["in_flight"])
+        try:
+            if "faalt" in texts[0]:
+                raise RuntimeError("quota exceeded")
+            if state["calls"] <= 2:
+                barrier.wait()
+            return [[1.0, 0.0] for _ in texts]
+        finally:
+            with lock:
+                state["in_flight"] -= 1
+
+    retried = []
+
+    def retry_fn(operation_name, func):
+        for attempt in range(2):
+            try:
+                return func()
+            except Exception:
+                retried.append(operation_name)
+                if attempt:
+                    raise
+
+    manifest = module.build_manifest(
+        source_root,
+        embed_texts_fn=embed_texts,
+        embed_dimension=2,
+        chunk_size=400,
+        chunk_overlap=0,
+        embed_concurrency=2,
+        retry_fn=retry_fn,
+    )
+
+    assert state["peak"] == 2
+    assert retried == ["physio_library_embed", "physio_library_embed"]
+    assert {Path(record["source_path"]).name for record in manifest["documents"]} == {"goed.md"}
+    assert [Path(error["source_path"]).name for error in manifest["errors"]] == ["kapot.md"]
+    assert [Path(path).name for path in manifest["meta"]["source_fingerprints"]] == ["goed.md"]
+    assert manifest["build_stats"]["embed_failed_attempts"] == 2
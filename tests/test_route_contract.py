@@ -43,6 +43,11 @@ EXPECTED_ROUTES = [
     ('POST', '/api/physio/transcriptions', 'physio_api.create_physio_transcription'),
     ('GET', '/api/purchase-history', 'payments_api.purchase_history'),
     ('GET', '/api/runtime-jobs/active', 'upload_api.get_active_runtime_jobs'),
+    ('POST', '/api/uploads', 'upload_api.create_upload_session'),
+    ('DELETE', '/api/uploads/<upload_id>', 'upload_api.abort_upload_session'),
+    ('GET', '/api/uploads/<upload_id>', 'upload_api.get_upload_session'),
+    ('PATCH', '/api/uploads/<upload_id>', 'upload_api.append_upload_chunk'),
+    ('POST', '/api/uploads/<upload_id>/complete', 'upload_api.complete_upload_session'),
     ('DELETE', '/api/planner/sessions/<session_id>', 'study_api.delete_planner_session'),
     ('GET', '/api/planner/sessions', 'study_api.list_planner_sessions'),
     ('PUT', '/api/planner/sessions/<session_id>', 'study_api.upsert_planner_session'),
@@ -3,7 +3,7 @@ from threading import Event
 import pytest
 from flask import Flask, request
 
-from lecture_processor.runtime.job_dispatcher import BoundedJobDispatcher, JobQueueFullError
+from lecture_processor.runtime.job_dispatcher import BoundedJobDispatcher, FairJobScheduler, JobQueueFullError, ScheduledJob
 from lecture_processor.runtime.proxy import apply_proxy_fix, client_ip_from_request
 
 
@@ -31,6 +31,101 @@ def test_bounded_job_dispatcher_rejects_when_capacity_is_full_and_recovers():
     assert stats["running"] == 0
 
 
+def _run_queued_behind_gate(scheduler, submissions):
+    gate_started = Event()
+    gate = Event()
+    order = []
+    scheduler.submit(lambda: (gate_started.set(), gate.wait(2)))
+    assert gate_started.wait(1) is True
+    futures = [
+        scheduler.submit(ScheduledJob(order.append, job_class=job_class, owner=owner), label)
+        for label, job_class, owner in submissions
+    ]
+    stats = scheduler.stats()
+    gate.set()
+    for future in futures:
+        future.result(timeout=2)
+    return order, stats
+
+
+def test_fair_job_scheduler_interleaves_owners_and_prefers_short_job_classes():
+    scheduler = FairJobScheduler(max_workers=1, max_pending=8)
+
+    order, stats = _run_queued_behind_gate(scheduler, [
+        ("a1", "lecture-notes", "user-a"),
+        ("a2", "lecture-notes", "user-a"),
+        ("a3", "lecture-notes", "user-a"),
+        ("b1", "lecture-notes", "user-b"),
+        ("tools", "tools_extract", "user-c"),
+    ])
+
+    assert order == ["tools", "a1", "b1", "a2", "a3"]
+    assert stats["queued"] == 5
+    assert stats["running"] == 1
+    assert stats["classes"]["lecture-notes"]["queued"] == 4
+    assert stats["classes"]["tools_extract"]["queued"] == 1
+    final = scheduler.stats()
+    assert final["queued"] == 0
+    assert final["classes"]["lecture-notes"]["submitted"] == 4
+    assert final["classes"]["lecture-notes"]["wait_p95_ms"] >= final["classes"]["lecture-notes"]["wait_p50_ms"] >= 0
+
+
+def test_fair_job_scheduler_ages_low_priority_jobs_and_keeps_capacity_bound():
+    now = [100.0]
+    scheduler = FairJobScheduler(max_workers=1, max_pending=2, aging_seconds=10, clock=lambda: now[0])
+    gate_started = Event()
+    gate = Event()
+    order = []
+    scheduler.submit(lambda: (gate_started.set(), gate.wait(2)))
+    assert gate_started.wait(1) is True
+    old = scheduler.submit(ScheduledJob(order.append, job_class="lecture-notes", owner="u1"), "old-lecture")
+    now[0] += 35.0
+    fresh = scheduler.submit(ScheduledJob(order.append, job_class="tools_extract", owner="u2"), "fresh-tools")
+
+    with pytest.raises(JobQueueFullError):
+        scheduler.submit(ScheduledJob(order.append, job_class="tools_extract", owner="u3"), "rejected")
+
+    gate.set()
+    old.result(timeout=2)
+    fresh.result(timeout=2)
+    assert order == ["old-lecture", "fresh-tools"]
+
+
+def test_fair_job_scheduler_caps_an_owner_only_while_others_wait():
+    scheduler = FairJobScheduler(max_workers=2, max_pending=4)
+    started = {"a1": Event(), "a2": Event()}
+    releases = {"a1": Event(), "a2": Event()}
+    order = []
+
+    def _long_job(label):
+        started[label].set()
+        releases[label].wait(2)
+        return label
+
+    a1 = scheduler.submit(ScheduledJob(_long_job, job_class="lecture-notes", owner="user-a"), "a1")
+    a2 = scheduler.submit(ScheduledJob(_long_job, job_class="lecture-notes", owner="user-a"), "a2")
+    # A lone owner gets every idle worker.
+    assert started["a1"].wait(1) is True
+    assert started["a2"].wait(1) is True
+    assert scheduler.stats()["running"] == 2
+
+    a3 = scheduler.submit(ScheduledJob(order.append, job_class="tools_extract", owner="user-a"), "a3")
+    b1 = scheduler.submit(ScheduledJob(order.append, job_class="lecture-notes", owner="user-b"), "b1")
+    assert scheduler.stats()["max_running_per_owner"] == 1
+
+    releases["a1"].set()
+    assert b1.result(timeout=2) is None
+    # With nobody else waiting, user-a's next job takes the free worker despite the cap.
+    a3.result(timeout=2)
+    assert not a2.done()
+
+    releases["a2"].set()
+    assert a1.result(timeout=2) == "a1"
+    assert a2.result(timeout=2) == "a2"
+    # user-a's higher-priority job waited for b1 because user-a already held a worker.
+    assert order == ["b1", "a3"]
+
+
 def test_client_ip_helper_prefers_proxy_fixed_remote_addr_over_spoofable_access_route():
     app = Flask(__name__)
     apply_proxy_fix(app, trusted_proxy_hops=1)
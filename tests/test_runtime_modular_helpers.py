@@ -1,7 +1,12 @@
+import time
 from types import SimpleNamespace
 
+import pytest
+
+from lecture_processor.domains.ai import batch_orchestrator
 from lecture_processor.domains.study import progress as study_progress
 from lecture_processor.runtime import media_runtime
+from lecture_processor.runtime import provider_poller
 from lecture_processor.runtime import core
 
 
@@ -87,3 +92,149 @@ def test_media_runtime_wait_for_file_processing_retries_transient_errors():
 
     assert result is True
     assert messages
+
+
+class _SteppingClock:
+    """Monotonic clock that jumps past any backoff interval on every read."""
+
+    def __init__(self, step):
+        self.now = 1000.0
+        self.step = step
+
+    def __call__(self):
+        self.now += self.step
+        return self.now
+
+
+def test_provider_poller_resolves_file_watch_and_counts_polls(monkeypatch):
+    states = iter(["PROCESSING", "PROCESSING", "ACTIVE"])
+
+    class _FilesClient:
+        def __init__(self):
+            self.calls = 0
+
+        def get(self, name):
+            self.calls += 1
+            if self.calls == 2:
+                raise RuntimeError("temporary timeout")
+            return SimpleNamespace(state=SimpleNamespace(name=next(states)))
+
+    monkeypatch.setattr(media_runtime, "FILE_PROCESSING_POLL_INITIAL_SECONDS", 0.01)
+    monkeypatch.setattr(media_runtime, "FILE_PROCESSING_POLL_MAX_SECONDS", 0.02)
+    client = SimpleNamespace(files=_FilesClient())
+    warnings = []
+    poller = provider_poller.ProviderPoller(
+        logger=SimpleNamespace(warning=lambda *args: warnings.append(args)),
+        is_transient_error=lambda _error: True,
+    )
+    try:
+        assert media_runtime.wait_for_file_processing(
+            SimpleNamespace(name="files/abc123"),
+            client=client,
+            logger=None,
+            time_module=None,
+            is_transient_provider_error_fn=None,
+            classify_provider_error_code_fn=None,
+            poller=poller,
+        ) is True
+        stats = poller.stats()
+    finally:
+        poller.shutdown()
+
+    assert client.files.calls == 4
+    assert warnings
+    assert stats["in_flight"] == {"file": 0}
+    assert stats["poll_calls"] == 4
+    assert stats["poll_errors"] == 1
+
+
+def test_provider_poller_fails_file_watch_on_failed_state():
+    client = SimpleNamespace(files=SimpleNamespace(get=lambda name: SimpleNamespace(state=SimpleNamespace(name="FAILED"))))
+    poller = provider_poller.ProviderPoller()
+    try:
+        with pytest.raises(Exception, match="File processing failed: files/bad"):
+            media_runtime.wait_for_file_processing_with_poller(SimpleNamespace(name="files/bad"), client=client, poller=poller)
+    finally:
+        poller.shutdown()
+
+
+def test_poll_schedule_backs_off_per_state_and_caps():
+    schedule = provider_poller.PollSchedule(5, 20, factor=2)
+    intervals = [schedule.initial]
+    for _ in range(3):
+        intervals.append(schedule.next_interval(intervals[-1]))
+    assert intervals == [5.0, 10.0, 20.0, 20.0]
+
+
+def test_wait_for_batch_uses_shared_poller_and_heartbeats():
+    states = iter(["JOB_STATE_PENDING", "JOB_STATE_RUNNING", "JOB_STATE_RUNNING", "JOB_STATE_SUCCEEDED"])
+    poller = provider_poller.ProviderPoller(clock=_SteppingClock(100.0))
+    runtime = SimpleNamespace(
+        PROVIDER_POLLER=poller,
+        BATCH_MAX_WAIT_SECONDS=10_000_000,
+        client=SimpleNamespace(batches=SimpleNamespace(get=lambda name: SimpleNamespace(name=name, state=SimpleNamespace(name=next(states))))),
+    )
+    heartbeats = []
+    try:
+        final_job = batch_orchestrator._wait_for_batch("batches/b1", runtime=runtime, on_poll=heartbeats.append)
+    finally:
+        poller.shutdown()
+
+    assert final_job.state.name == "JOB_STATE_SUCCEEDED"
+    # Polls that land before the stage thread wakes collapse into one heartbeat.
+    assert heartbeats
+    assert set(heartbeats) <= {"JOB_STATE_PENDING", "JOB_STATE_RUNNING", "JOB_STATE_SUCCEEDED"}
+    assert poller.stats()["poll_calls"] == 4
+    assert poller.stats()["in_flight"] == {"batch": 0}
+
+
+def test_provider_poller_survives_unexpected_poll_failure_and_keeps_polling():
+    class _BrokenSchedules(dict):
+        def get(self, key, default=None):
+            if key == "EXPLODE":
+                raise KeyError("schedule lookup broke")
+            return super().get(key, default)
+
+    poller = provider_poller.ProviderPoller()
+    try:
+        broken = poller.watch(
+            "file",
+            "files/broken",
+            lambda: "EXPLODE",
+            lambda value: (value, False),
+            schedules=_BrokenSchedules({None: provider_poller.PollSchedule(0.01, 0.01)}),
+            timeout_seconds=5,
+        )
+        with pytest.raises(KeyError, match="schedule lookup broke"):
+            broken.result(timeout=2)
+
+        healthy = poller.watch(
+            "file",
+            "files/ok",
+            lambda: "ACTIVE",
+            lambda value: (value, True),
+            schedules={None: provider_poller.PollSchedule(0.01, 0.01)},
+            timeout_seconds=5,
+        )
+        assert healthy.result(timeout=2) == "ACTIVE"
+        stats = poller.stats()
+    finally:
+        poller.shutdown()
+
+    assert stats["in_flight"] == {"file": 0}
+    assert stats["poll_errors"] == 1
+
+
+def test_provider_watch_result_without_timeout_gives_up_after_deadline(monkeypatch):
+    monkeypatch.setattr(provider_poller, "RESULT_GRACE_SECONDS", 0.05)
+    watch = provider_poller.ProviderWatch(
+        "file",
+        "files/stuck",
+        fetch=lambda: None,
+        evaluate=lambda value: ("", False),
+        schedules={None: provider_poller.PollSchedule(1, 1)},
+        deadline=time.monotonic() + 0.05,
+    )
+
+    with pytest.raises(TimeoutError, match="files/stuck"):
+        watch.result()
@@ -0,0 +1,20 @@
+"""Bootstrap for the background job worker (`python worker.py`, needs JOB_QUEUE_MODE=durable).
+
+The durable queue is a local SQLite file (JOB_QUEUE_DB_PATH), so the worker must
+run on the same host as the web process and see the same file, e.g. in one
+container:
+
+    JOB_QUEUE_MODE=durable python worker.py &
+    JOB_QUEUE_MODE=durable gunicorn --workers 1 --threads 8 app:app
+
+It is not a separate Procfile process: a dyno or service on another host would
+never see the web process's queue rows.
+"""
+
+from lecture_processor import create_app
+from lecture_processor.runtime import job_worker
+
+app = create_app()
+
+if __name__ == '__main__':
+    raise SystemExit(job_worker.main(app))